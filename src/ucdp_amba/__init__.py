@@ -24,3 +24,29 @@
 """
 Unified Chip Design Platform - AMBA.
 """
+
+import importlib
+from typing import Any
+
+SUBMODULES = (
+    "addrdec",
+    "types",
+    "ucdp_ahb2ahb",
+    "ucdp_ahb2apb",
+    "ucdp_ahb_ml",
+    "ucdp_ahb_post",
+    "ucdp_ahb_slice",
+    "ucdp_amba_pkg",
+    "ucdp_apb2mem",
+)
+"""Submodules, which are imported on first Attribute Access."""
+
+
+def __getattr__(name: str) -> Any:
+    if name in SUBMODULES:
+        return importlib.import_module(f"{__name__}.{name}")
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__() -> list[str]:
+    return sorted({*globals(), *SUBMODULES})
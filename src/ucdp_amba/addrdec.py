@@ -0,0 +1,660 @@
+#
+# MIT License
+#
+# Copyright (c) 2024-2025 nbiotcloud
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+#
+"""
+Address Decoder Compiler.
+
+Address spaces are translated into `casez` wildcard masks on a decoding slice of the address.
+A mask is a string of `0`, `1` and `?` (don't care) with the most significant bit first.
+
+Masks are minimized per decoding target (i.e. slave):
+
+* masks which differ in just one bit are merged (Quine-McCluskey).
+* masks covered by other masks are dropped.
+* with `dontcare`, unmapped address space may be decoded arbitrarily:
+  every mask is expanded bit by bit as long as it does not hit any other target (Espresso-style expand).
+  Accesses to unmapped addresses are not reported as decode errors anymore.
+
+Instead of the full decoding slice, a minimal set of address bits can be decoded (`minbits`).
+These bits distinguish all targets, and without `dontcare` the unmapped address space as well.
+The bits are not necessarily contiguous.
+
+Large decoders can be split into two levels (`split`):
+the most significant decoded bits select a region (coarse decoder),
+the remaining bits select the target within the region (fine decoder).
+The number of coarse bits is chosen from the masks, such that
+the number of regions plus the largest number of fine masks within one region is minimal.
+"""
+
+import itertools
+from collections.abc import Iterable, Mapping, Sequence
+from typing import NamedTuple
+
+import aligntext
+import ucdp as u
+from icdutil import num
+from ucdp_addr.addrspace import Addrspace
+
+DONTCARE = "?"
+
+Masks = tuple[str, ...]
+
+
+class Region(NamedTuple):
+    """
+    Address Region of a Two-Level Decoder.
+
+    Attributes:
+        value: Coarse Address Bits, most significant first.
+        masks: Wildcard Masks per Target on the Fine Address Bits.
+    """
+
+    value: str
+    masks: dict[str, Masks]
+
+
+class Decoder(NamedTuple):
+    """
+    Compiled Address Decoder.
+
+    Attributes:
+        decslice: Decoding Slice.
+        masks: Wildcard Masks per Target.
+        plain_masks: Wildcard Masks per Target on `decslice` Before Minimization.
+        bits: Decoded Address Bits, most significant first. All bits of `decslice` by default.
+        regions: Regions of a Two-Level Decoder. Empty for a single-level decoder.
+    """
+
+    decslice: u.Slice
+    masks: dict[str, Masks]
+    plain_masks: dict[str, Masks]
+    bits: tuple[int, ...] = ()
+    regions: tuple[Region, ...] = ()
+
+    @property
+    def positions(self) -> tuple[int, ...]:
+        """Decoded Address Bits, most significant first."""
+        return self.bits or tuple(range(self.decslice.left, self.decslice.right - 1, -1))
+
+    @property
+    def coarse(self) -> int:
+        """Number of Coarse Decoded Bits. Zero for a single-level decoder."""
+        return len(self.regions[0].value) if self.regions else 0
+
+    @property
+    def comparators(self) -> int:
+        """Number of Compared Address Bits."""
+        return sum(count_comparators(masks) for masks in self.masks.values())
+
+    @property
+    def plain_comparators(self) -> int:
+        """Number of Compared Address Bits Before Minimization."""
+        return sum(count_comparators(masks) for masks in self.plain_masks.values())
+
+    @property
+    def slices(self) -> tuple[u.Slice, ...]:
+        """Decoded Address Bits as Contiguous Slices, most significant first."""
+        if not self.bits:
+            return (self.decslice,)
+        return _get_slices(self.bits)
+
+    @property
+    def slicestr(self) -> str:
+        """Decoded Address Bits as String."""
+        return ",".join(str(slice_) for slice_ in self.slices)
+
+    def get_addr(self, addr: str) -> str:
+        """
+        Decoded Bits of `addr`.
+
+            >>> decoder = Decoder(u.Slice(left=7, right=2), {}, {}, bits=(7, 4, 3))
+            >>> decoder.get_addr('haddr')
+            '{haddr[7], haddr[4:3]}'
+        """
+        return _get_addr(addr, self.slices)
+
+    def get_coarse_addr(self, addr: str) -> str:
+        """
+        Coarse Decoded Bits of `addr`.
+
+            >>> decoder = Decoder(u.Slice(left=7, right=2), {}, {}, regions=(Region('01', {}),))
+            >>> decoder.get_coarse_addr('haddr'), decoder.get_fine_addr('haddr')
+            ('haddr[7:6]', 'haddr[5:2]')
+        """
+        return _get_addr(addr, _get_slices(self.positions[: self.coarse]))
+
+    def get_fine_addr(self, addr: str) -> str:
+        """Fine Decoded Bits of `addr`."""
+        return _get_addr(addr, _get_slices(self.positions[self.coarse :]))
+
+    def get_casez(self, name: str) -> str:
+        """`casez` Item of Target `name`."""
+        width = len(self.bits) if self.bits else self.decslice.width
+        return ", ".join(f"{width}'b{mask}" for mask in self.masks[name])
+
+    def get_code(self, addr: str, stmts: Mapping[str, Sequence[str]], default: Sequence[str], indent: int = 4) -> str:
+        """
+        Two-Level Decoding of `addr`.
+
+        Args:
+            addr: Address Expression.
+            stmts: Statements per Target.
+            default: Statements on Unmapped Address.
+
+        Keyword Args:
+            indent: Indent.
+
+            >>> addrspaces = {'a': [Addrspace(baseaddr=0x0, size=0x10)], 'b': [Addrspace(baseaddr=0x30, size=0x10)]}
+            >>> decoder = compile_decoder(u.Slice(left=7, right=4), addrspaces, split=True)
+            >>> print(decoder.get_code('haddr', {'a': ['a = 1;'], 'b': ['b = 1;']}, ['err = 1;'], indent=0))
+            casez (haddr[7])
+              1'b0: begin // region 0
+                casez (haddr[6:4])
+                  3'b000: begin // a
+                    a = 1;
+                  end
+            <BLANKLINE>
+                  3'b011: begin // b
+                    b = 1;
+                  end
+            <BLANKLINE>
+                  default: begin
+                    err = 1;
+                  end
+                endcase
+              end
+            <BLANKLINE>
+              default: begin
+                err = 1;
+              end
+            endcase
+        """
+        items = [
+            (f"{self.coarse}'b{region.value}", f"region {idx}", self._get_fine_lines(addr, region, stmts, default))
+            for idx, region in enumerate(self.regions)
+        ]
+        return _indent(_get_casez_lines(self.get_coarse_addr(addr), items, default), indent)
+
+    def get_coarse_code(
+        self, addr: str, stmts: Sequence[Sequence[str]], default: Sequence[str], indent: int = 4
+    ) -> str:
+        """
+        Coarse Decoding of `addr` only.
+
+        Args:
+            addr: Address Expression.
+            stmts: Statements per Region.
+            default: Statements on Unmapped Address.
+
+        Keyword Args:
+            indent: Indent.
+        """
+        items = [
+            (f"{self.coarse}'b{region.value}", f"region {idx}", list(rstmts))
+            for idx, (region, rstmts) in enumerate(zip(self.regions, stmts, strict=True))
+        ]
+        return _indent(_get_casez_lines(self.get_coarse_addr(addr), items, default), indent)
+
+    def get_fine_code(
+        self,
+        addr: str,
+        conds: Sequence[str],
+        stmts: Mapping[str, Sequence[str]],
+        default: Sequence[str],
+        indent: int = 4,
+    ) -> str:
+        """
+        Fine Decoding of `addr` only.
+
+        Args:
+            addr: Address Expression.
+            conds: Condition per Region, i.e. the registered coarse decoding result.
+            stmts: Statements per Target.
+            default: Statements on Unmapped Address.
+
+        Keyword Args:
+            indent: Indent.
+        """
+        lines: list[str] = []
+        for idx, (region, cond) in enumerate(zip(self.regions, conds, strict=True)):
+            lines.append(f"{'end else if' if idx else 'if'} ({cond}) begin // region {idx}")
+            lines.extend(f"  {line}" if line else "" for line in self._get_fine_lines(addr, region, stmts, default))
+        lines.append("end")
+        return _indent(lines, indent)
+
+    def _get_fine_lines(
+        self, addr: str, region: Region, stmts: Mapping[str, Sequence[str]], default: Sequence[str]
+    ) -> list[str]:
+        width = len(self.positions) - self.coarse
+        if not width:
+            # the region is decoded completely by the coarse bits
+            (name,) = region.masks
+            return list(stmts[name])
+        items = [
+            (", ".join(f"{width}'b{mask}" for mask in masks), name, list(stmts[name]))
+            for name, masks in region.masks.items()
+        ]
+        return _get_casez_lines(self.get_fine_addr(addr), items, default)
+
+
+def _get_slices(bits: Sequence[int]) -> tuple[u.Slice, ...]:
+    slices = []
+    left = right = bits[0]
+    for bit in bits[1:]:
+        if bit != right - 1:
+            slices.append(u.Slice(left=left, right=right))
+            left = bit
+        right = bit
+    slices.append(u.Slice(left=left, right=right))
+    return tuple(slices)
+
+
+def _get_addr(addr: str, slices: Iterable[u.Slice]) -> str:
+    items = [f"{addr}[{slice_}]" for slice_ in slices]
+    if len(items) == 1:
+        return items[0]
+    return f"{{{', '.join(items)}}}"
+
+
+def _get_casez_lines(expr: str, items: Iterable[tuple[str, str, list[str]]], default: Sequence[str]) -> list[str]:
+    lines = [f"casez ({expr})"]
+    for label, comment, stmts in items:
+        lines.append(f"  {label}: begin // {comment}")
+        lines.extend(f"    {stmt}" if stmt else "" for stmt in stmts)
+        lines.extend(("  end", ""))
+    lines.append("  default: begin")
+    lines.extend(f"    {stmt}" for stmt in default)
+    lines.extend(("  end", "endcase"))
+    return lines
+
+
+def _indent(lines: Iterable[str], indent: int) -> str:
+    prefix = " " * indent
+    return "\n".join(f"{prefix}{line}" if line else "" for line in lines)
+
+
+def get_masks(decslice: u.Slice, addrspaces: Iterable[Addrspace]) -> Masks:
+    """
+    Wildcard Masks of `addrspaces` on `decslice`.
+
+        >>> get_masks(u.Slice(left=15, right=8), [Addrspace(baseaddr=0x1000, size=0x300)])
+        ('0001000?', '00010010')
+    """
+    masks: list[str] = []
+    for addrspace in addrspaces:
+        base = addrspace.baseaddr >> decslice.right
+        size = addrspace.size >> decslice.right
+        masks.extend(num.calc_addrwinmasks(base, size, decslice.width, DONTCARE))
+    return tuple(masks)
+
+
+def get_gap_masks(decslice: u.Slice, addrspaces: Iterable[Addrspace]) -> Masks:
+    """
+    Wildcard Masks of the Address Space on `decslice` not covered by `addrspaces`.
+
+        >>> addrspaces = [Addrspace(baseaddr=0x0, size=0x4), Addrspace(baseaddr=0xC, size=0x4)]
+        >>> get_gap_masks(u.Slice(left=3, right=0), addrspaces)
+        ('01??', '10??')
+    """
+    masks: list[str] = []
+    right = decslice.right
+    windows = sorted((addrspace.baseaddr >> right, addrspace.size >> right) for addrspace in addrspaces)
+    addr = 0
+    for base, size in (*windows, (1 << decslice.width, 0)):
+        if base > addr:
+            masks.extend(num.calc_addrwinmasks(addr, base - addr, decslice.width, DONTCARE))
+        addr = max(addr, base + size)
+    return tuple(masks)
+
+
+def select_bits(masks: Mapping[str, Masks]) -> tuple[int, ...]:
+    """
+    Positions of a Minimal Set of Mask Bits, which Distinguish all Targets.
+
+    The set is found by a greedy hitting set on the bits separating every pair of masks of different targets
+    and is irredundant: no position can be dropped. At least one position is returned.
+
+        >>> select_bits({'a': ('000?', '010?'), 'b': ('001?',), 'c': ('1???',)})
+        (0, 2)
+    """
+    width = len(next(mask for tmasks in masks.values() for mask in tmasks))
+    # every mask as (care, value) integers
+    cubes = [
+        (idx, int(mask.replace("0", "1").replace(DONTCARE, "0"), 2), int(mask.replace(DONTCARE, "0"), 2))
+        for idx, tmasks in enumerate(masks.values())
+        for mask in tmasks
+    ]
+    # bits separating two masks of different targets, one of them has to be decoded
+    separators = {
+        (value ^ ovalue) & care & ocare
+        for pos, (idx, care, value) in enumerate(cubes)
+        for oidx, ocare, ovalue in cubes[pos + 1 :]
+        if idx != oidx
+    }
+    selected = 0
+    while separators:
+        bit = max((1 << pos for pos in range(width)), key=lambda bit: sum(1 for sep in separators if sep & bit))
+        selected |= bit
+        separators = {sep for sep in separators if not sep & bit}
+    return tuple(pos for pos in range(width) if selected & (1 << (width - 1 - pos))) or (width - 1,)
+
+
+def project(masks: Iterable[str], positions: Iterable[int]) -> Masks:
+    """
+    Reduce `masks` to `positions`.
+
+        >>> project(('0101', '0111', '1???'), (0, 3))
+        ('01', '1?')
+    """
+    positions = tuple(positions)
+    return tuple(dict.fromkeys("".join(mask[pos] for pos in positions) for mask in masks))
+
+
+def count_comparators(masks: Iterable[str]) -> int:
+    """
+    Number of Compared Bits.
+
+        >>> count_comparators(('0001', '01??'))
+        6
+    """
+    return sum(len(mask) - mask.count(DONTCARE) for mask in masks)
+
+
+def is_covered(mask: str, cover: str) -> bool:
+    """
+    Every Address Matching `mask` Matches `cover`.
+
+        >>> is_covered('0101', '01??')
+        True
+        >>> is_covered('01??', '0101')
+        False
+    """
+    return all(cbit in (DONTCARE, bit) for bit, cbit in zip(mask, cover, strict=True))
+
+
+def is_intersecting(mask: str, other: str) -> bool:
+    """
+    `mask` and `other` Match At Least One Common Address.
+
+        >>> is_intersecting('01??', '0?1?')
+        True
+        >>> is_intersecting('01??', '00??')
+        False
+    """
+    return all(DONTCARE in (bit, obit) or bit == obit for bit, obit in zip(mask, other, strict=True))
+
+
+def merge(masks: Iterable[str]) -> Masks:
+    """
+    Merge Masks differing in one Bit and Drop Redundant Masks.
+
+        >>> merge(('0000', '0001', '0010', '0011', '0100'))
+        ('00??', '0?00')
+        >>> merge(('01??', '0101', '1000'))
+        ('01??', '1000')
+    """
+    current = set(masks)
+    while True:
+        merged = set()
+        used = set()
+        for mask in current:
+            for pos, bit in enumerate(mask):
+                if bit == DONTCARE:
+                    continue
+                if f"{mask[:pos]}{'1' if bit == '0' else '0'}{mask[pos + 1 :]}" in current:
+                    merged.add(f"{mask[:pos]}{DONTCARE}{mask[pos + 1 :]}")
+                    used.add(mask)
+        if not merged:
+            break
+        current = (current - used) | merged
+    return _drop_redundant(current)
+
+
+def expand(masks: Iterable[str], offmasks: Iterable[str]) -> Masks:
+    """
+    Expand `masks` into Don't Care Space, without hitting any of `offmasks`.
+
+    The most significant bits are expanded first.
+
+        >>> expand(('0100', '0101'), ('1???',))
+        ('0???',)
+    """
+    offmasks = tuple(offmasks)
+    expanded = []
+    for mask in masks:
+        cube = mask
+        for pos, bit in enumerate(mask):
+            if bit == DONTCARE:
+                continue
+            candidate = f"{cube[:pos]}{DONTCARE}{cube[pos + 1 :]}"
+            if not any(is_intersecting(candidate, offmask) for offmask in offmasks):
+                cube = candidate
+        expanded.append(cube)
+    return merge(expanded)
+
+
+def minimize(masks: dict[str, Masks], dontcare: bool = False) -> dict[str, Masks]:
+    """
+    Minimize Masks per Target.
+
+    Args:
+        masks: Wildcard Masks per Target.
+
+    Keyword Args:
+        dontcare: Unmapped Address Space is Don't Care.
+
+        >>> masks = {'a': ('0000', '0001', '0010', '0011'), 'b': ('1000',)}
+        >>> minimize(masks)
+        {'a': ('00??',), 'b': ('1000',)}
+        >>> minimize(masks, dontcare=True)
+        {'a': ('0???',), 'b': ('1???',)}
+    """
+    minimized = {name: merge(tmasks) for name, tmasks in masks.items()}
+    if dontcare:
+        for name, tmasks in minimized.items():
+            offmasks = [mask for oname, omasks in minimized.items() if oname != name for mask in omasks]
+            minimized[name] = expand(tmasks, offmasks)
+    return minimized
+
+
+def get_regions(masks: Mapping[str, Masks], coarse: int) -> tuple[Region, ...]:
+    """
+    Split `masks` into Regions on the `coarse` most significant Bits.
+
+    Masks with don't care coarse bits are part of multiple regions.
+
+        >>> for region in get_regions({'a': ('0???',), 'b': ('10??', '1100')}, 2):
+        ...     print(region.value, region.masks)
+        00 {'a': ('??',)}
+        01 {'a': ('??',)}
+        10 {'b': ('??',)}
+        11 {'b': ('00',)}
+    """
+    regions: dict[str, dict[str, list[str]]] = {}
+    for name, tmasks in masks.items():
+        for mask in tmasks:
+            for value in _get_values(mask[:coarse]):
+                regions.setdefault(value, {}).setdefault(name, []).append(mask[coarse:])
+    return tuple(
+        Region(value, {name: merge(fmasks) for name, fmasks in rmasks.items()})
+        for value, rmasks in sorted(regions.items())
+    )
+
+
+def split_decoder(decoder: Decoder) -> Decoder:
+    """
+    Split `decoder` into Coarse Region Decoder and Fine Decoders.
+
+    The number of coarse bits minimizes the number of regions plus the largest number of fine masks within one region.
+
+        >>> masks = {f't{idx}': (f'{idx:06b}',) for idx in range(64)}
+        >>> decoder = split_decoder(Decoder(u.Slice(left=5, right=0), masks, masks))
+        >>> decoder.coarse, len(decoder.regions)
+        (3, 8)
+    """
+    width = len(decoder.positions)
+    allmasks = [mask for tmasks in decoder.masks.values() for mask in tmasks]
+    if not allmasks:
+        return decoder
+    best: tuple[int, tuple[Region, ...]] | None = None
+    for coarse in range(1, max(width, 2)):
+        # every mask spans 2**(don't care coarse bits) regions at least
+        bound = max(1 << mask[:coarse].count(DONTCARE) for mask in allmasks)
+        if best and bound >= best[0]:
+            continue
+        regions = get_regions(decoder.masks, coarse)
+        cost = len(regions) + max(sum(len(fmasks) for fmasks in region.masks.values()) for region in regions)
+        if best is None or cost < best[0]:
+            best = (cost, regions)
+    assert best is not None
+    return decoder._replace(regions=best[1])
+
+
+def compile_decoder(
+    decslice: u.Slice,
+    addrspaces: Mapping[str, Iterable[Addrspace]],
+    optimize: bool = False,
+    dontcare: bool = False,
+    minbits: bool = False,
+    split: bool = False,
+) -> Decoder:
+    """
+    Compile Address Decoder.
+
+    Args:
+        decslice: Decoded Address Bits.
+        addrspaces: Address Spaces per Target.
+
+    Keyword Args:
+        optimize: Minimize Masks.
+        dontcare: Unmapped Address Space is Don't Care. Used with `optimize` and `minbits`.
+        minbits: Decode a Minimal Set of Address Bits only.
+        split: Two-Level Decoder.
+
+        >>> addrspaces = {
+        ...     'a': [Addrspace(baseaddr=0x0, size=0x100), Addrspace(baseaddr=0x100, size=0x100)],
+        ...     'b': [Addrspace(baseaddr=0x800, size=0x100)],
+        ... }
+        >>> decoder = compile_decoder(u.Slice(left=11, right=8), addrspaces, optimize=True)
+        >>> decoder.get_casez('a'), decoder.comparators, decoder.plain_comparators
+        ("4'b000?", 7, 12)
+
+    With `minbits`, the unmapped address space needs to be distinguished, unless it is don't care:
+
+        >>> decoder = compile_decoder(u.Slice(left=11, right=8), addrspaces, minbits=True)
+        >>> decoder.get_addr('haddr'), decoder.get_casez('a'), decoder.get_casez('b')
+        ('haddr[11:8]', "4'b000?", "4'b1000")
+        >>> decoder = compile_decoder(u.Slice(left=11, right=8), addrspaces, minbits=True, dontcare=True)
+        >>> decoder.get_addr('haddr'), decoder.get_casez('a'), decoder.get_casez('b')
+        ('haddr[11]', "1'b0", "1'b1")
+    """
+    addrspaces = {name: tuple(taspcs) for name, taspcs in addrspaces.items()}
+    plain_masks = {name: get_masks(decslice, taspcs) for name, taspcs in addrspaces.items()}
+    masks = plain_masks
+    bits: tuple[int, ...] = ()
+    if minbits:
+        sepmasks = dict(plain_masks)
+        if not dontcare:
+            unmapped = get_gap_masks(decslice, (aspc for taspcs in addrspaces.values() for aspc in taspcs))
+            # the unmapped address space is just another target, which needs to be distinguished
+            sepmasks[""] = unmapped
+        positions = select_bits(sepmasks)
+        bits = tuple(decslice.left - pos for pos in positions)
+        # projected masks overlap, so merge them in any case
+        masks = {name: merge(project(tmasks, positions)) for name, tmasks in plain_masks.items()}
+    if optimize:
+        masks = minimize(masks, dontcare=dontcare)
+    decoder = Decoder(decslice=decslice, masks=masks, plain_masks=plain_masks, bits=bits)
+    if split:
+        decoder = split_decoder(decoder)
+    return decoder
+
+
+def _get_values(mask: str) -> Iterable[str]:
+    choices = [("0", "1") if bit == DONTCARE else (bit,) for bit in mask]
+    return ("".join(value) for value in itertools.product(*choices))
+
+
+def _drop_redundant(masks: Iterable[str]) -> Masks:
+    # widest masks first, so that every mask just needs to be checked against the kept ones
+    kept: list[str] = []
+    for mask in sorted(masks, key=lambda mask: (-mask.count(DONTCARE), mask)):
+        if not _is_covered_by_union(mask, kept):
+            kept.append(mask)
+    # masks, which are covered by the union of the later ones
+    for mask in tuple(reversed(kept)):
+        others = [other for other in kept if other != mask]
+        if _is_covered_by_union(mask, others):
+            kept = others
+    return tuple(sorted(kept))
+
+
+def _is_covered_by_union(mask: str, covers: Iterable[str]) -> bool:
+    covers = [cover for cover in covers if is_intersecting(mask, cover)]
+    if not covers:
+        return False
+    if any(is_covered(mask, cover) for cover in covers):
+        return True
+    # split `mask` on a bit, which is decided by one of the covers
+    pos = next(
+        pos for pos, bit in enumerate(mask) if bit == DONTCARE and any(cover[pos] != DONTCARE for cover in covers)
+    )
+    return all(_is_covered_by_union(f"{mask[:pos]}{bit}{mask[pos + 1 :]}", covers) for bit in "01")
+
+
+def _format_table(lines: list[tuple[str, ...]]) -> str:
+    """Markdown Table with the header `lines[0]` and the rows `lines[1:]`."""
+    lens = [max(len(cell) for cell in column) for column in zip(*lines, strict=True)]
+    lines = [lines[0], tuple("-" * len_ for len_ in lens), *lines[1:]]
+    return aligntext.align(lines, seps=(" | ",), sepfirst="| ", seplast=" |") + "\n"
+
+
+def get_overview(decoders: dict[str, Decoder]) -> str:
+    """
+    Comparator Overview.
+
+        >>> addrspaces = {'a': [Addrspace(baseaddr=0x0, size=0x10), Addrspace(baseaddr=0x10, size=0x10)]}
+        >>> decoder = compile_decoder(u.Slice(left=7, right=4), addrspaces, optimize=True)
+        >>> print(get_overview({'mst': decoder}))
+        | Decoder | Slice | Masks | Comparators | Minimized Masks | Minimized Comparators | Regions |
+        | ------- | ----- | ----- | ----------- | --------------- | --------------------- | ------- |
+        | mst     | 7:4   | 2     | 8           | 1               | 3                     | -       |
+        <BLANKLINE>
+    """
+    header = ("Decoder", "Slice", "Masks", "Comparators", "Minimized Masks", "Minimized Comparators", "Regions")
+    lines: list[tuple[str, ...]] = [header]
+    for name, decoder in decoders.items():
+        plain_num = sum(len(masks) for masks in decoder.plain_masks.values())
+        num_ = sum(len(masks) for masks in decoder.masks.values())
+        lines.append(
+            (
+                name,
+                decoder.slicestr,
+                str(plain_num),
+                str(decoder.plain_comparators),
+                str(num_),
+                str(decoder.comparators),
+                str(len(decoder.regions)) if decoder.regions else "-",
+            )
+        )
+    return _format_table(lines)
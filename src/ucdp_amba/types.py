@@ -31,7 +31,11 @@ Mainly these types are needed:
 * :any:`ApbSlvType`
 """
 
-from logging import getLogger
+import json
+from collections.abc import Iterable, Mapping
+from functools import lru_cache
+from logging import ERROR, INFO, WARNING, getLogger
+from typing import Any, ClassVar, Literal, NamedTuple
 
 import ucdp as u
 
@@ -42,6 +46,13 @@ LEGAL_AHB_DATA_WIDTH = [8, 16, 32, 64, 128, 256, 512, 1024]
 LEGAL_AHB_PROT_WIDTH = [0, 4, 7]
 LEGAL_APB_ADDR_WIDTH = range(33)
 LEGAL_APB_DATA_WIDTH = [8, 16, 32]
+CAST_PLAN_CACHE_SIZE = 512
+"""Maximum Number of Compiled Cast Plans."""
+PROTO_PAIR_CACHE_SIZE = 1024
+"""Maximum Number of Cached Protocol Pair Verdicts."""
+
+CastPlan = tuple[tuple[str, Any], ...]
+"""Immutable Casting: Pairs of target item name and source expression."""
 
 
 class ASecIdType(u.AEnumType):
@@ -57,6 +68,108 @@ class ASecIdType(u.AEnumType):
         return self.new(filter_=lambda item: item.value not in excludes)
 
 
+FsmEncoding = Literal["binary", "onehot", "gray"]
+"""
+FSM State Encoding.
+
+* `binary`: state index - minimal number of flip-flops.
+* `onehot`: one flip-flop per state - every state decode is a single bit test.
+* `gray`: reflected gray code of the state index - minimal number of flip-flops, one bit flip per index step.
+"""
+
+
+class AFsmType(u.AEnumType):
+    """
+    Base of all FSM Types.
+
+    The states are defined by `states` in order of their index, the keys depend on the `encoding`:
+
+        >>> class FsmType(AFsmType):
+        ...     states: ClassVar[tuple[tuple[str, str], ...]] = (
+        ...         ("idle", "Idle"), ("busy", "Busy"), ("done", "Done"), ("error", "Error")
+        ...     )
+        >>> for encoding in ("binary", "onehot", "gray"):
+        ...     fsmtype = FsmType(encoding=encoding)
+        ...     print(f"{encoding:6s} {fsmtype.keytype.width} {[hex(key) for key in fsmtype.keys()]}")
+        binary 2 ['0x0', '0x1', '0x2', '0x3']
+        onehot 4 ['0x1', '0x2', '0x4', '0x8']
+        gray   2 ['0x0', '0x1', '0x3', '0x2']
+    """
+
+    states: ClassVar[tuple[tuple[str, str], ...]] = ()
+    encoding: FsmEncoding = "binary"
+
+    def __init__(self, encoding: FsmEncoding = "binary", **kwargs):
+        if "keytype" not in kwargs:
+            num = len(self.states)
+            width = num if encoding == "onehot" else max(num - 1, 1).bit_length()
+            kwargs["keytype"] = u.UintType(width, default=1 if encoding == "onehot" else 0)
+        super().__init__(encoding=encoding, **kwargs)
+
+    def _build(self):
+        for idx, (name, title) in enumerate(self.states):
+            self._add(self.get_statekey(idx), name, title)
+
+    def get_statekey(self, idx: int) -> int:
+        """Key of the State with Index `idx`."""
+        if self.encoding == "onehot":
+            return 1 << idx
+        if self.encoding == "gray":
+            return idx ^ (idx >> 1)
+        return idx
+
+
+class FsmRef(NamedTuple):
+    """
+    Reference to the State Constants `<prefix>_<state>_st` of `fsmtype` for State Decoding.
+
+    The string representation is the prefix.
+    One-hot states are decoded by a single bit test, `case` statements test all state bits in parallel:
+
+        >>> class FsmType(AFsmType):
+        ...     states: ClassVar[tuple[tuple[str, str], ...]] = (("idle", "Idle"), ("busy", "Busy"), ("done", "Done"))
+        >>> fsm = FsmRef("fsm", FsmType())
+        >>> f"{fsm}_idle_st"
+        'fsm_idle_st'
+        >>> fsm.is_state("fsm_r", "busy")
+        'fsm_r == fsm_busy_st'
+        >>> fsm.case("fsm_r"), fsm.label("fsm_r", "idle", "done")
+        ('case (fsm_r)', 'fsm_idle_st, fsm_done_st')
+        >>> fsm = FsmRef("fsm", FsmType(encoding="onehot"))
+        >>> fsm.is_state("fsm_r", "busy")
+        "fsm_r[1] == 1'b1"
+        >>> fsm.case("fsm_r"), fsm.label("fsm_r", "idle", "done")
+        ("unique0 case (1'b1)", 'fsm_r[0], fsm_r[2]')
+    """
+
+    prefix: str
+    fsmtype: AFsmType
+
+    def __str__(self) -> str:
+        return self.prefix
+
+    def _bit(self, state: str) -> int:
+        return self.fsmtype.encode(state).bit_length() - 1
+
+    def is_state(self, var: str, state: str) -> str:
+        """Condition that `var` is in `state`."""
+        if self.fsmtype.encoding == "onehot":
+            return f"{var}[{self._bit(state)}] == 1'b1"
+        return f"{var} == {self.prefix}_{state}_st"
+
+    def case(self, var: str) -> str:
+        """Head of a `case` Statement on `var`."""
+        if self.fsmtype.encoding == "onehot":
+            return "unique0 case (1'b1)"
+        return f"case ({var})"
+
+    def label(self, var: str, *states: str) -> str:
+        """Label of a `case` Item for `states`."""
+        if self.fsmtype.encoding == "onehot":
+            return ", ".join(f"{var}[{self._bit(state)}]" for state in states)
+        return ", ".join(f"{self.prefix}_{state}_st" for state in states)
+
+
 class AhbProtType(u.UintType):
     """
     AHB Protection.
@@ -95,6 +208,49 @@ class AhbHMastType(u.UintType):
         super().__init__(width=width, **kwargs)
 
 
+PROTO_FLAGS = (
+    "enh_hmaster",
+    "has_hburst",
+    "has_hmastlock",
+    "has_hnonsec",
+    "has_exclxfers",
+    "has_wstrb",
+    "has_pprot",
+    "has_pnse",
+)
+"""Boolean Protocol Features, in Order of their Bit Position in :any:`AmbaProtoSignature.flags`."""
+
+_USERTYPE_IDS: dict[u.BaseType, int] = {}
+
+
+def _get_usertype_id(usertype: u.BaseType | None) -> int:
+    """Return Identity of `usertype` - equal types share the same identity, `None` is 0."""
+    if usertype is None:
+        return 0
+    return _USERTYPE_IDS.setdefault(usertype, len(_USERTYPE_IDS) + 1)
+
+
+class AmbaProtoSignature(NamedTuple):
+    """
+    Hashable Feature Signature of :any:`AmbaProto`.
+
+    All protocols with identical features share the same signature - independent of their name.
+    User types are represented by their identity, equal types share the same identity.
+    """
+
+    flags: int
+    hprotwidth: int
+    hmaster_width: int
+    ausertype: int
+    wusertype: int
+    rusertype: int
+    busertype: int
+
+    def has(self, feature: str) -> bool:
+        """Return `True` if boolean `feature` is set."""
+        return bool(self.flags & (1 << PROTO_FLAGS.index(feature)))
+
+
 class AmbaProto(u.AConfig):
     """
     Amba Protocol Version.
@@ -133,6 +289,36 @@ class AmbaProto(u.AConfig):
     rusertype: u.AEnumType | u.UintType | None = None
     busertype: u.AEnumType | u.UintType | None = None
 
+    _signature: AmbaProtoSignature = u.PrivateField()
+
+    def model_post_init(self, context, /) -> None:
+        """Derive Feature Signature."""
+        flags = sum(1 << idx for idx, feature in enumerate(PROTO_FLAGS) if self.__dict__[feature])
+        signature = AmbaProtoSignature(
+            flags,
+            self.hprotwidth,
+            self.hmaster_width,
+            _get_usertype_id(self.ausertype),
+            _get_usertype_id(self.wusertype),
+            _get_usertype_id(self.rusertype),
+            _get_usertype_id(self.busertype),
+        )
+        self._signature = signature
+
+    @property
+    def signature(self) -> AmbaProtoSignature:
+        """
+        Feature Signature.
+
+        >>> AMBA3.signature
+        AmbaProtoSignature(flags=2, hprotwidth=4, hmaster_width=0, ausertype=0, wusertype=0, rusertype=0, busertype=0)
+        >>> AmbaProto("other").signature == AMBA3.signature
+        True
+        >>> AmbaProto("p0", has_wstrb=True, ausertype=u.UintType(3)).signature.has("has_wstrb")
+        True
+        """
+        return self._signature
+
     @property
     def hprottype(self) -> AhbProtType | None:
         """Protocol has HPROT signal."""
@@ -151,7 +337,111 @@ class AmbaProto(u.AConfig):
 AMBA3 = AmbaProto(name="amba3")
 
 
-class AhbMstType(u.AStructType):
+class ALazyStructType(u.AStructType):
+    """
+    Struct Type with Lazy Item Materialization.
+
+    The struct items are built on first access to them.
+    Plain attributes like `proto`, `addrwidth` and `datawidth` are available without building the items.
+
+    >>> mst = AhbMstType(addrwidth=24, datawidth=64)
+    >>> mst.addrwidth, mst.datawidth, mst.is_built
+    (24, 64, False)
+    >>> mst["haddr"]
+    StructItem('haddr', AhbAddrType(24), doc=Doc(title='AHB Bus Address', ...))
+    >>> mst.is_built
+    True
+
+    Widths are still checked on construction:
+
+    >>> AhbMstType(addrwidth=5)
+    Traceback (most recent call last):
+    ...
+    pydantic_core._pydantic_core.ValidationError: 1 validation error for AhbMstType
+    ...
+
+    The instance stays locked - items cannot be added after construction:
+
+    >>> mst._add("hfoo", u.BitType())
+    Traceback (most recent call last):
+    ...
+    ucdp.exceptions.LockError: AhbMstType(addrwidth=24, datawidth=64): Cannot add item 'hfoo'.
+
+    Equality and hashing just depend on the attributes:
+
+    >>> AhbSlvType(addrwidth=24) == AhbSlvType(addrwidth=24).new()
+    True
+    """
+
+    _built: bool = u.PrivateField(default=False)
+
+    def model_post_init(self, context, /) -> None:
+        """Check Attributes and Defer Build."""
+        self._check()
+        self._is_locked = True
+
+    def _check(self) -> None:
+        """Check Attributes - raise `ValueError` on anything `_build` would refuse."""
+
+    @property
+    def is_built(self) -> bool:
+        """Items are built."""
+        return self._built
+
+    def _get_items(self) -> dict[str, u.StructItem]:
+        # an unlocked instance is just building - `_add` accesses the items
+        if not self._built and self._is_locked:
+            # `_add` refuses locked instances - unlock just for the build
+            self._is_locked = False
+            try:
+                self._build()
+            except Exception:
+                self._items.clear()
+                raise
+            finally:
+                self._is_locked = True
+            self._built = True
+        return self._items
+
+    def __iter__(self):
+        yield from self._get_items().keys()
+
+    def keys(self):
+        """Return Keys."""
+        return self._get_items().keys()
+
+    def values(self):
+        """Return Values."""
+        return self._get_items().values()
+
+    def items(self):
+        """Return Items."""
+        return self._get_items().items()
+
+    def get(self, *args, **kwargs):
+        """Return Item."""
+        return self._get_items().get(*args, **kwargs)
+
+    def __getitem__(self, key):
+        return self._get_items()[key]
+
+    def __setitem__(self, key, value):
+        self._get_items()[key] = value
+
+    def __len__(self) -> int:
+        return len(self._get_items())
+
+    def __contains__(self, key) -> bool:
+        return key in self._get_items()
+
+    def __eq__(self, other) -> bool:
+        # items are fully determined by the attributes - built and unbuilt instances are equal
+        if isinstance(other, ALazyStructType):
+            return self.__class__ is other.__class__ and self.__dict__ == other.__dict__
+        return super().__eq__(other)
+
+
+class AhbMstType(ALazyStructType):
     """
     From AHB Master.
 
@@ -257,6 +547,11 @@ class AhbMstType(u.AStructType):
     addrwidth: int = 32
     datawidth: int = 32
 
+    def _check(self) -> None:
+        AhbAddrType(self.addrwidth)
+        AhbDataType(self.datawidth)
+        _ = self.proto.hprottype
+
     def _build(self):  # noqa: C901
         # FWD
         self._add("htrans", AhbTransType())
@@ -303,43 +598,50 @@ class AhbMstType(u.AStructType):
 
         `self = cast(other)`
         """
-        if isinstance(other, AhbMstType) and self.proto != other.proto:
+        return _get_cast_plan(self, other)
+
+    @staticmethod
+    def _compile_cast_plan(other: type[u.BaseType], same_proto: bool, same_ausertype: bool) -> CastPlan | None:
+        if issubclass(other, AhbMstType) and not same_proto:
             # Drive a Mst with Mst signals
-            yield "", ""
-            yield "htrans", "htrans"
-            yield "haddr", "haddr"
-            # never use hauser
-            yield "hwrite", "hwrite"
-            yield "hsize", "hsize"
-            yield "hburst", "hburst"
-            yield "hprot", "hprot"
-            yield "hwdata", "hwdata"
-            # BWD
-            yield "hready", "hready"
-            yield "hresp", "hresp"
-            yield "hrdata", "hrdata"
-        elif isinstance(other, AhbSlvType):
+            return (
+                ("", ""),
+                ("htrans", "htrans"),
+                ("haddr", "haddr"),
+                # never use hauser
+                ("hwrite", "hwrite"),
+                ("hsize", "hsize"),
+                ("hburst", "hburst"),
+                ("hprot", "hprot"),
+                ("hwdata", "hwdata"),
+                # BWD
+                ("hready", "hready"),
+                ("hresp", "hresp"),
+                ("hrdata", "hrdata"),
+            )
+        if issubclass(other, AhbSlvType):
             # Drive a Mst with Slv signals
-            yield "", ""
-            yield "htrans", "htrans"
-            yield "haddr", "haddr"
-            if self.proto.ausertype == other.proto.ausertype:
-                yield "hauser", "hauser"
-            yield "hwrite", "hwrite"
-            yield "hsize", "hsize"
-            yield "hburst", "hburst"
-            yield "hprot", "hprot"
-            yield "hwdata", "hwdata"
-            # BWD
-            yield "hready", "hreadyout"
-            # yield "hready", "hready" TODO: @djakschik, extend cast support
-            yield "hresp", "hresp"
-            yield "hrdata", "hrdata"
-        else:
-            return None
-
-
-class AhbSlvType(u.AStructType):
+            return (
+                ("", ""),
+                ("htrans", "htrans"),
+                ("haddr", "haddr"),
+                *((("hauser", "hauser"),) if same_ausertype else ()),
+                ("hwrite", "hwrite"),
+                ("hsize", "hsize"),
+                ("hburst", "hburst"),
+                ("hprot", "hprot"),
+                ("hwdata", "hwdata"),
+                # BWD
+                # The master samples the ready of the selected slave (`hreadyout`).
+                # The slave-side `hready` is an input of the slave only and has no master counterpart.
+                ("hready", "hreadyout"),
+                ("hresp", "hresp"),
+                ("hrdata", "hrdata"),
+            )
+        return None
+
+
+class AhbSlvType(ALazyStructType):
     """
     To AHB Slave.
 
@@ -448,6 +750,11 @@ class AhbSlvType(u.AStructType):
     addrwidth: int = 32
     datawidth: int = 32
 
+    def _check(self) -> None:
+        AhbAddrType(self.addrwidth)
+        AhbDataType(self.datawidth)
+        _ = self.proto.hprottype
+
     def _build(self):  # noqa: C901
         # FWD
         self._add("hsel", AhbSelType())
@@ -498,43 +805,49 @@ class AhbSlvType(u.AStructType):
 
         `self = cast(other)`
         """
-        if isinstance(other, AhbSlvType) and self.proto != other.proto:
+        return _get_cast_plan(self, other)
+
+    @staticmethod
+    def _compile_cast_plan(other: type[u.BaseType], same_proto: bool, same_ausertype: bool) -> CastPlan | None:
+        if issubclass(other, AhbSlvType) and not same_proto:
             # Drive a Slv with Slv signals
-            yield "", ""
-            yield "hsel", "hsel"
-            yield "haddr", "haddr"
-            # never use hauser
-            yield "hwrite", "hwrite"
-            yield "htrans", "htrans"
-            yield "hsize", "hsize"
-            yield "hburst", "hburst"
-            yield "hprot", "hprot"
-            yield "hwdata", "hwdata"
-            yield "hready", "hready"
-            # BWD
-            yield "hreadyout", "hreadyout"
-            yield "hresp", "hresp"
-            yield "hrdata", "hrdata"
-        elif isinstance(other, AhbMstType):
+            return (
+                ("", ""),
+                ("hsel", "hsel"),
+                ("haddr", "haddr"),
+                # never use hauser
+                ("hwrite", "hwrite"),
+                ("htrans", "htrans"),
+                ("hsize", "hsize"),
+                ("hburst", "hburst"),
+                ("hprot", "hprot"),
+                ("hwdata", "hwdata"),
+                ("hready", "hready"),
+                # BWD
+                ("hreadyout", "hreadyout"),
+                ("hresp", "hresp"),
+                ("hrdata", "hrdata"),
+            )
+        if issubclass(other, AhbMstType):
             # Drive a Slv with Mst signals
-            yield "", ""
-            yield "hsel", "ternary(htrans > '1b0', '1b1', '1b0')"
-            yield "haddr", "haddr"
-            if self.proto.ausertype == other.proto.ausertype:
-                yield "hauser", "hauser"
-            yield "hwrite", "hwrite"
-            yield "htrans", "htrans"
-            yield "hsize", "hsize"
-            yield "hburst", "hburst"
-            yield "hprot", "hprot"
-            yield "hwdata", "hwdata"
-            yield "hready", u.const("1'b1")
-            # BWD
-            yield "hreadyout", "hready"
-            yield "hresp", "hresp"
-            yield "hrdata", "hrdata"
-        else:
-            return None
+            return (
+                ("", ""),
+                ("hsel", "ternary(htrans > '1b0', '1b1', '1b0')"),
+                ("haddr", "haddr"),
+                *((("hauser", "hauser"),) if same_ausertype else ()),
+                ("hwrite", "hwrite"),
+                ("htrans", "htrans"),
+                ("hsize", "hsize"),
+                ("hburst", "hburst"),
+                ("hprot", "hprot"),
+                ("hwdata", "hwdata"),
+                ("hready", u.const("1'b1")),
+                # BWD
+                ("hreadyout", "hready"),
+                ("hresp", "hresp"),
+                ("hrdata", "hrdata"),
+            )
+        return None
 
 
 class AhbSelType(u.BitType):
@@ -814,7 +1127,7 @@ class AhbExclType(u.AEnumType):
 ################################################################################################
 
 
-class ApbSlvType(u.AStructType):
+class ApbSlvType(ALazyStructType):
     """
     To APB Slave.
 
@@ -878,6 +1191,10 @@ class ApbSlvType(u.AStructType):
     addrwidth: int = 12
     datawidth: int = 32
 
+    def _check(self) -> None:
+        ApbAddrType(self.addrwidth)
+        ApbDataType(self.datawidth)
+
     def _build(self):
         # FWD
         self._add("paddr", ApbAddrType(self.addrwidth))
@@ -910,21 +1227,26 @@ class ApbSlvType(u.AStructType):
 
         `self = cast(other)`
         """
-        if isinstance(other, ApbSlvType) and self.proto != other.proto:
+        return _get_cast_plan(self, other)
+
+    @staticmethod
+    def _compile_cast_plan(other: type[u.BaseType], same_proto: bool, same_ausertype: bool) -> CastPlan | None:
+        if issubclass(other, ApbSlvType) and not same_proto:
             # Drive a Slv with Slv signals
-            yield "", ""
-            yield "paddr", "paddr"
-            # never use pauser
-            yield "pwrite", "pwrite"
-            yield "pwdata", "pwdata"
-            yield "penable", "penable"
-            yield "psel", "psel"
-            # BWD
-            yield "prdata", "prdata"
-            yield "pslverr", "pslverr"
-            yield "pready", "pready"
-        else:
-            return None
+            return (
+                ("", ""),
+                ("paddr", "paddr"),
+                # never use pauser
+                ("pwrite", "pwrite"),
+                ("pwdata", "pwdata"),
+                ("penable", "penable"),
+                ("psel", "psel"),
+                # BWD
+                ("prdata", "prdata"),
+                ("pslverr", "pslverr"),
+                ("pready", "pready"),
+            )
+        return None
 
 
 class ApbSelType(u.BitType):
@@ -1091,6 +1413,45 @@ class ApbReadyType(u.AEnumType):
         self._add(1, "done", "Done")
 
 
+################################################################################################
+##   Cast Plans
+################################################################################################
+
+
+def _get_cast_plan(target: u.AStructType, source: u.BaseType) -> CastPlan | None:
+    """
+    Return Cast Plan to drive `target` from `source`.
+
+    The plan just depends on the type classes and the protocol relation. It is compiled once and replayed.
+
+    >>> ahb5 = AmbaProto("ahb5", hprotwidth=7)
+    >>> plan = AhbMstType().cast(AhbMstType(proto=ahb5, datawidth=64))
+    >>> plan is AhbMstType(addrwidth=16).cast(AhbMstType(proto=ahb5))
+    True
+    >>> AhbMstType().cast(AhbMstType()) is None
+    True
+    >>> AhbMstType().cast(u.BitType()) is None
+    True
+    """
+    source_proto = getattr(source, "proto", None)
+    if not isinstance(source_proto, AmbaProto):
+        return None
+    target_proto = target.proto  # type: ignore[attr-defined]
+    if target_proto is source_proto:
+        same_proto = same_ausertype = True
+    else:
+        same_proto = target_proto == source_proto
+        same_ausertype = same_proto or target_proto.ausertype == source_proto.ausertype
+    return _compile_cast_plan(type(target), type(source), same_proto, same_ausertype)  # type: ignore[arg-type]
+
+
+@lru_cache(maxsize=CAST_PLAN_CACHE_SIZE)
+def _compile_cast_plan(
+    target: type[u.AStructType], source: type[u.BaseType], same_proto: bool, same_ausertype: bool
+) -> CastPlan | None:
+    return target._compile_cast_plan(source, same_proto, same_ausertype)  # type: ignore[attr-defined]
+
+
 # class IdleType(u.AEnumType):
 #     """
 #     Bus Idle Type.
@@ -1109,7 +1470,7 @@ class ApbReadyType(u.AEnumType):
 #         self._add(1, "idle", "Idle")
 
 
-def check_ahb_proto_pair(src_name: str, src_proto: AmbaProto, tgt_name: str, tgt_proto: AmbaProto) -> int:  # noqa: C901, PLR0912
+def check_ahb_proto_pair(src_name: str, src_proto: AmbaProto, tgt_name: str, tgt_proto: AmbaProto) -> int:
     """
     Check AHB Protocol Compatibility.
 
@@ -1146,10 +1507,191 @@ def check_ahb_proto_pair(src_name: str, src_proto: AmbaProto, tgt_name: str, tgt
     1
     >>> check_ahb_proto_pair("src", p3, "tgt", p4)
     2
+
+    Protocols with identical features are compatible, independent of their name:
+
+    >>> check_ahb_proto_pair("src", p0, "tgt", AMBA3)
+    0
+
+    The verdict is derived once per pair of protocol signatures:
+
+    >>> clear_proto_pair_cache()
+    >>> for _ in range(100): chk = check_ahb_proto_pair("src", p1, "tgt", p2)
+    >>> get_proto_pair_cache_info()
+    CacheInfo(hits=99, misses=1, maxsize=1024, currsize=1)
     """
-    if src_proto == tgt_proto:  # no need to check
+    src_sig = src_proto.signature
+    tgt_sig = tgt_proto.signature
+    if src_sig == tgt_sig:  # no need to check
         return 0
 
+    compat = get_proto_pair_compat(src_sig, tgt_sig)
+    LOGGER.info(
+        "Checking Protocol Pair for Source %s with Protocol %s and Target %s with Protocol %s.",
+        src_name,
+        src_proto.name,
+        tgt_name,
+        tgt_proto.name,
+    )
+    for level, msg in compat.findings:
+        LOGGER.log(
+            level,
+            "Protocol Pair for Source %s with Protocol %s and Target %s with Protocol %s: %s",
+            src_name,
+            src_proto.name,
+            tgt_name,
+            tgt_proto.name,
+            msg,
+        )
+    return compat.verdict
+
+
+ProtoAction = Literal["ign", "tie", "red", "exp", "fwd"]
+"""
+Conversion of an Optional Protocol Signal from Source to Target.
+
+* `ign`: ignore source signal (target has no such signal)
+* `tie`: clamp target signal to its default (source has no such signal)
+* `red`: reduce wider source signal to target width
+* `exp`: expand narrower source signal to target width
+* `fwd`: forward signal unchanged
+"""
+
+
+def get_proto_action(src_opt: bool | int, tgt_opt: bool | int) -> ProtoAction:
+    """
+    Determine Conversion of Optional Signal from Source to Target.
+
+    Either the presence (`bool`) or the width (`int`) of the signal is given.
+
+    >>> get_proto_action(True, False), get_proto_action(False, True), get_proto_action(True, True)
+    ('ign', 'tie', 'fwd')
+    >>> get_proto_action(7, 4), get_proto_action(4, 7), get_proto_action(0, 4), get_proto_action(4, 0)
+    ('red', 'exp', 'tie', 'ign')
+    """
+    if isinstance(src_opt, bool):
+        return _OPTMAP[src_opt][bool(tgt_opt)]  # type: ignore[return-value]
+    if tgt_opt == 0:
+        return "ign"
+    if src_opt == 0:
+        return "tie"
+    if src_opt == tgt_opt:
+        return "fwd"
+    if src_opt > tgt_opt:
+        return "red"
+    return "exp"
+
+
+_OPTMAP = (("ign", "tie"), ("ign", "fwd"))
+
+
+class ProtoActions(NamedTuple):
+    """
+    Conversion of all Optional AHB Signals for a Source/Target Protocol Pair.
+
+    Request signals are converted from source to target,
+    response signals (`hexokay`, `hruser`, `hbuser`) from target to source.
+    """
+
+    hprot: ProtoAction
+    hmastlock: ProtoAction
+    hmaster: ProtoAction
+    hburst: ProtoAction
+    hnonsec: ProtoAction
+    hexcl: ProtoAction
+    hexokay: ProtoAction
+    hwstrb: ProtoAction
+    hauser: ProtoAction
+    hwuser: ProtoAction
+    hruser: ProtoAction
+    hbuser: ProtoAction
+
+
+class ProtoPairCompat(NamedTuple):
+    """
+    Compatibility of a Source/Target Protocol Pair.
+
+    Attributes:
+        verdict: 0 (identical), 1 (compatible with conversions) or 2 (incompatible).
+        actions: Conversion of optional signals.
+        findings: Log level and message for every conversion and incompatibility.
+    """
+
+    verdict: int
+    actions: ProtoActions
+    findings: tuple[tuple[int, str], ...]
+
+
+@lru_cache(maxsize=PROTO_PAIR_CACHE_SIZE)
+def get_proto_pair_compat(src_sig: AmbaProtoSignature, tgt_sig: AmbaProtoSignature) -> ProtoPairCompat:
+    """
+    Determine Compatibility of Source and Target Protocol, identified by their signatures.
+
+    >>> compat = get_proto_pair_compat(AMBA3.signature, AmbaProto(hprotwidth=7).signature)
+    >>> compat.verdict
+    1
+    >>> compat.actions.hprot, compat.actions.hburst, compat.actions.hexcl
+    ('exp', 'fwd', 'ign')
+    >>> compat.findings
+    ((30, "Different width for 'hprot' signals."),)
+    """
+    verdict, findings = _get_proto_pair_verdict(src_sig, tgt_sig)
+    return ProtoPairCompat(verdict, get_proto_actions(src_sig, tgt_sig), findings)
+
+
+def get_proto_actions(src_sig: AmbaProtoSignature, tgt_sig: AmbaProtoSignature) -> ProtoActions:
+    """
+    Determine Conversion of all Optional Signals from Source to Target Protocol.
+
+    >>> actions = get_proto_actions(AMBA3.signature, AmbaProto(hprotwidth=7, has_hmastlock=True).signature)
+    >>> actions.hprot, actions.hmastlock, actions.hburst
+    ('exp', 'tie', 'fwd')
+    """
+    return ProtoActions(
+        hprot=get_proto_action(src_sig.hprotwidth, tgt_sig.hprotwidth),
+        hmastlock=get_proto_action(src_sig.has("has_hmastlock"), tgt_sig.has("has_hmastlock")),
+        hmaster=get_proto_action(src_sig.hmaster_width, tgt_sig.hmaster_width),
+        hburst=get_proto_action(src_sig.has("has_hburst"), tgt_sig.has("has_hburst")),
+        hnonsec=get_proto_action(src_sig.has("has_hnonsec"), tgt_sig.has("has_hnonsec")),
+        hexcl=get_proto_action(src_sig.has("has_exclxfers"), tgt_sig.has("has_exclxfers")),
+        hexokay=get_proto_action(tgt_sig.has("has_exclxfers"), src_sig.has("has_exclxfers")),
+        hwstrb=get_proto_action(src_sig.has("has_wstrb"), tgt_sig.has("has_wstrb")),
+        hauser=get_proto_action(bool(src_sig.ausertype), bool(tgt_sig.ausertype)),
+        hwuser=get_proto_action(bool(src_sig.wusertype), bool(tgt_sig.wusertype)),
+        hruser=get_proto_action(bool(tgt_sig.rusertype), bool(src_sig.rusertype)),
+        hbuser=get_proto_action(bool(tgt_sig.busertype), bool(src_sig.busertype)),
+    )
+
+
+def merge_proto_signatures(signatures: Iterable[AmbaProtoSignature]) -> AmbaProtoSignature:
+    """
+    Merge Signatures to one Signature with the Union of all Features.
+
+    Boolean features and user types are present if present in any signature, widths are the maximum.
+    A merged user type carries the identity of the first signature having it.
+
+    >>> merged = merge_proto_signatures([AMBA3.signature, AmbaProto(has_hnonsec=True, hprotwidth=7).signature])
+    >>> merged.hprotwidth, merged.has("has_hburst"), merged.has("has_hnonsec"), merged.has("has_wstrb")
+    (7, True, True, False)
+    >>> merge_proto_signatures([])
+    AmbaProtoSignature(flags=0, hprotwidth=0, hmaster_width=0, ausertype=0, wusertype=0, rusertype=0, busertype=0)
+    """
+    flags = hprotwidth = hmaster_width = ausertype = wusertype = rusertype = busertype = 0
+    for sig in signatures:
+        flags |= sig.flags
+        hprotwidth = max(hprotwidth, sig.hprotwidth)
+        hmaster_width = max(hmaster_width, sig.hmaster_width)
+        ausertype = ausertype or sig.ausertype
+        wusertype = wusertype or sig.wusertype
+        rusertype = rusertype or sig.rusertype
+        busertype = busertype or sig.busertype
+    return AmbaProtoSignature(flags, hprotwidth, hmaster_width, ausertype, wusertype, rusertype, busertype)
+
+
+def _get_proto_pair_verdict(  # noqa: C901
+    src_sig: AmbaProtoSignature, tgt_sig: AmbaProtoSignature
+) -> tuple[int, tuple[tuple[int, str], ...]]:
+    """Derive Verdict and Findings (log level, message) for Protocol Pair."""
     opts = {
         "has_hburst": "hburst",
         "has_hmastlock": "hmastlock",
@@ -1157,52 +1699,171 @@ def check_ahb_proto_pair(src_name: str, src_proto: AmbaProto, tgt_name: str, tgt
         "has_exclxfers": "hexcl/hexokay",
         "has_wstrb": "hwstrb",
     }
-    src_dict = dict(src_proto)
-    tgt_dict = dict(tgt_proto)
     verdict = 0
-    pre1 = f"Protocol Pair for Source {src_name} with Protocol {src_proto.name} "
-    pre2 = f"and Target {tgt_name} with Protocol {tgt_proto.name}"
-    preamble = pre1 + pre2
-    LOGGER.info(f"Checking {preamble}.")
+    findings: list[tuple[int, str]] = []
 
     for usrtp in ["auser", "wuser", "ruser", "buser"]:
         tname = f"{usrtp}type"
-        src_usertp = src_proto.__dict__[tname]
-        tgt_usertp = tgt_proto.__dict__[tname]
-        if src_usertp is not None and tgt_usertp is not None and src_usertp != tgt_usertp:
-            LOGGER.error(f"{preamble}: Incompatible Definitions for 'h{usrtp}'!")
+        src_usertp = getattr(src_sig, tname)
+        tgt_usertp = getattr(tgt_sig, tname)
+        if src_usertp and tgt_usertp and src_usertp != tgt_usertp:
+            findings.append((ERROR, f"Incompatible Definitions for 'h{usrtp}'!"))
             verdict = 2
 
-    if src_proto.ausertype is not None and tgt_proto.ausertype is None:
-        LOGGER.warning(f"{preamble}: Ignoring source 'hauser'.")
+    if src_sig.ausertype and not tgt_sig.ausertype:
+        findings.append((WARNING, "Ignoring source 'hauser'."))
         verdict = max(verdict, 1)
-    elif src_proto.ausertype is None and tgt_proto.ausertype is not None:
-        LOGGER.warning(f"{preamble}: Clamping target 'hauser'.")
+    elif not src_sig.ausertype and tgt_sig.ausertype:
+        findings.append((WARNING, "Clamping target 'hauser'."))
         verdict = max(verdict, 1)
-    if src_proto.hprotwidth > 0 and tgt_proto.hprotwidth == 0:
-        LOGGER.warning(f"{preamble}: Ignoring source 'hprot'.")
+    if src_sig.hprotwidth > 0 and tgt_sig.hprotwidth == 0:
+        findings.append((WARNING, "Ignoring source 'hprot'."))
         verdict = max(verdict, 1)
-    elif src_proto.hprotwidth == 0 and tgt_proto.hprotwidth > 0:
-        LOGGER.warning(f"{preamble}: Clamping target 'hprot'.")
+    elif src_sig.hprotwidth == 0 and tgt_sig.hprotwidth > 0:
+        findings.append((WARNING, "Clamping target 'hprot'."))
         verdict = max(verdict, 1)
-    elif src_proto.hprotwidth != tgt_proto.hprotwidth:
-        LOGGER.warning(f"{preamble}: Different width for 'hprot' signals.")
+    elif src_sig.hprotwidth != tgt_sig.hprotwidth:
+        findings.append((WARNING, "Different width for 'hprot' signals."))
         verdict = max(verdict, 1)
-    if src_proto.hmaster_width > tgt_proto.hmaster_width:
-        slc = "MSBs of " if tgt_proto.hmaster_width else ""
-        LOGGER.warning(f"{preamble}: Ignoring {slc}source 'hmaster'.")
+    if src_sig.hmaster_width > tgt_sig.hmaster_width:
+        slc = "MSBs of " if tgt_sig.hmaster_width else ""
+        findings.append((WARNING, f"Ignoring {slc}source 'hmaster'."))
         verdict = max(verdict, 1)
-    elif src_proto.hmaster_width < tgt_proto.hmaster_width:
-        slc = "MSBs of " if src_proto.hmaster_width else ""
-        LOGGER.warning(f"{preamble}: Clamping {slc}target 'hmaster'.")
+    elif src_sig.hmaster_width < tgt_sig.hmaster_width:
+        slc = "MSBs of " if src_sig.hmaster_width else ""
+        findings.append((WARNING, f"Clamping {slc}target 'hmaster'."))
         verdict = max(verdict, 1)
 
     for opt, sig in opts.items():
-        if src_dict[opt] and not tgt_dict[opt]:
-            LOGGER.warning(f"{preamble}: Ignoring source '{sig}'.")
+        if src_sig.has(opt) and not tgt_sig.has(opt):
+            findings.append((WARNING, f"Ignoring source '{sig}'."))
             verdict = max(verdict, 1)
-        elif not src_dict[opt] and tgt_dict[opt]:
-            LOGGER.warning(f"{preamble}: Clamping target '{sig}'.")
+        elif not src_sig.has(opt) and tgt_sig.has(opt):
+            findings.append((WARNING, f"Clamping target '{sig}'."))
             verdict = max(verdict, 1)
 
-    return verdict
+    return verdict, tuple(findings)
+
+
+def get_proto_pair_cache_info():
+    """Return Statistics of the Protocol Pair Compatibility Cache."""
+    return get_proto_pair_compat.cache_info()
+
+
+def clear_proto_pair_cache() -> None:
+    """Clear Protocol Pair Compatibility Cache."""
+    get_proto_pair_compat.cache_clear()
+
+
+class ProtoCompatMatrix(u.Object):
+    """
+    Protocol Compatibility of all Master/Slave Pairs of an Interconnect.
+
+    Use :any:`check_ahb_proto_matrix` to create it.
+
+    Attributes:
+        pairs: Compatibility per (master name, slave name).
+        verdict: Worst verdict of all pairs.
+    """
+
+    pairs: dict[tuple[str, str], ProtoPairCompat]
+    verdict: int = 0
+
+    def __getitem__(self, key: tuple[str, str]) -> ProtoPairCompat:
+        return self.pairs[key]
+
+    def get_actions(self, mastername: str, slavename: str) -> ProtoActions:
+        """Return Conversion of Optional Signals from Master `mastername` to Slave `slavename`."""
+        return self.pairs[(mastername, slavename)].actions
+
+    def to_dict(self) -> dict[str, Any]:
+        """Return JSON-compatible Dictionary."""
+        return {
+            "verdict": self.verdict,
+            "pairs": [
+                {
+                    "master": mastername,
+                    "slave": slavename,
+                    "verdict": compat.verdict,
+                    "actions": compat.actions._asdict(),
+                    "findings": [msg for _, msg in compat.findings],
+                }
+                for (mastername, slavename), compat in self.pairs.items()
+            ],
+        }
+
+    def to_json(self, indent: int | None = 2) -> str:
+        """Return JSON Representation."""
+        return json.dumps(self.to_dict(), indent=indent)
+
+
+def check_ahb_proto_matrix(
+    masters: Mapping[str, AmbaProto],
+    slaves: Mapping[str, AmbaProto],
+    routes: Mapping[str, Iterable[str]],
+) -> ProtoCompatMatrix:
+    """
+    Check AHB Protocol Compatibility of all Master/Slave Pairs at once.
+
+    Every distinct pair of protocol signatures is analyzed once only.
+    Just one summary is logged.
+
+    Args:
+        masters: Protocol per master name.
+        slaves: Protocol per slave name.
+        routes: Names of accessed slaves per master name.
+
+    >>> p0 = AmbaProto("p0")
+    >>> p1 = AmbaProto("p1", hprotwidth=7, has_wstrb=True)
+    >>> p2 = AmbaProto("p2", ausertype=u.UintType(3))
+    >>> matrix = check_ahb_proto_matrix(
+    ...     {"cpu": p1, "dma": p0},
+    ...     {"ram": p0, "periph": p1},
+    ...     {"cpu": ["ram", "periph"], "dma": ["ram"]},
+    ... )
+    >>> matrix.verdict
+    1
+    >>> matrix["cpu", "ram"].verdict, matrix["cpu", "periph"].verdict, matrix["dma", "ram"].verdict
+    (1, 0, 0)
+    >>> matrix.get_actions("cpu", "ram").hprot
+    'red'
+    >>> print(matrix.to_json())
+    {
+      "verdict": 1,
+      "pairs": [
+        {
+          "master": "cpu",
+          "slave": "ram",
+          "verdict": 1,
+          "actions": {
+            "hprot": "red",
+    ...
+    >>> check_ahb_proto_matrix({"cpu": p2}, {"ram": AmbaProto(ausertype=u.UintType(4))}, {"cpu": ["ram"]}).verdict
+    2
+    """
+    slv_sigs = {slavename: proto.signature for slavename, proto in slaves.items()}
+    pairs: dict[tuple[str, str], ProtoPairCompat] = {}
+    counts = [0, 0, 0]
+    incompatible: list[str] = []
+    for mastername, slavenames in routes.items():
+        mst_sig = masters[mastername].signature
+        for slavename in slavenames:
+            compat = get_proto_pair_compat(mst_sig, slv_sigs[slavename])
+            pairs[(mastername, slavename)] = compat
+            counts[compat.verdict] += 1
+            if compat.verdict > 1:
+                incompatible.append(f"{mastername}->{slavename}")
+
+    verdict = max(idx for idx, count in enumerate(counts) if count or not idx)
+    # all pairs originate from get_proto_pair_compat() - no need to validate them again
+    matrix = ProtoCompatMatrix.model_construct(pairs=pairs, verdict=verdict)
+    level = (INFO, WARNING, ERROR)[verdict]
+    if LOGGER.isEnabledFor(level):
+        msg = (
+            f"Protocol Compatibility of {len(pairs)} Master/Slave Pairs: "
+            f"{counts[0]} compatible, {counts[1]} with conversions, {counts[2]} incompatible."
+        )
+        if incompatible:
+            msg = f"{msg} Incompatible: {', '.join(incompatible)}."
+        LOGGER.log(level, msg)
+    return matrix
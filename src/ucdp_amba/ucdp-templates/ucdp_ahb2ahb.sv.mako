@@ -33,6 +33,10 @@ from ucdp_amba import types as t
 <%inherit file="sv.mako"/>
 
 <%def name="logic(indent=0, skip=None)">\
+% if mod.use_pkg:
+
+  import ucdp_amba_pkg::*;
+% endif
 
 ${parent.logic(indent=indent, skip=skip)}
 
@@ -26,16 +26,8 @@
 import ucdp as u
 import ucdpsv as usv
 from aligntext import Align
-from ucdp_addr.addrslave import SlaveAddrspace
 from icdutil import num
-
-
-def decode_casez(decoding_slice: u.Slice, addrspace: SlaveAddrspace):
-  size = addrspace.size >> decoding_slice.right
-  base = addrspace.baseaddr >> decoding_slice.right
-  masks = [f"{decoding_slice.width}'b{mask}" for mask in num.calc_addrwinmasks(base, size, decoding_slice.width, '?')]
-  return ", ".join(masks)
-
+from ucdp_amba import types as t
 %>
 <%inherit file="sv.mako"/>
 
@@ -43,12 +35,12 @@ def decode_casez(decoding_slice: u.Slice, addrspace: SlaveAddrspace):
 <%
   rslvr = usv.get_resolver(mod)
   nr_slv = len(mod.slaves)
-  dec_bits = [num.calc_lowest_bit_set(aspc.size) for aspc in mod.addrmap]
-  dec_slice = u.Slice(left=mod.ahb_addrwidth-1, right=min(dec_bits))
+  decoder = mod.get_decoder()
   rng_bits = [num.calc_unsigned_width(aspc.size - 1) for aspc in mod.addrmap]
   paddr_slice = u.Slice(width=max(rng_bits))
 
   ff_dly = f"#{rslvr.ff_dly} " if rslvr.ff_dly else ""
+  fsm = t.FsmRef("ahb2apb_fsm" if mod.use_pkg and mod.fsm_encoding == "binary" else "fsm", mod.fsmtype)
 
   use_hstrb = mod.proto.has_wstrb
   use_pstrb = False
@@ -57,6 +49,10 @@ def decode_casez(decoding_slice: u.Slice, addrspace: SlaveAddrspace):
       use_pstrb = True
       break
 %>
+% if mod.use_pkg:
+
+  import ucdp_amba_pkg::*;
+% endif
 ${parent.logic(indent=indent, skip=skip)}\
 
   // ------------------------------------------------------
@@ -75,9 +71,12 @@ ${parent.logic(indent=indent, skip=skip)}\
     apb_${aspc.name}_sel_s = 1'b0;
 % endfor
 
-    casez(ahb_slv_haddr_i[${dec_slice}])
+% if decoder.regions:
+${decoder.get_code("ahb_slv_haddr_i", {aspc.name: ["valid_addr_s = 1'b1;", f"apb_{aspc.name}_sel_s = 1'b1;"] for aspc in mod.addrmap}, ["valid_addr_s = 1'b0;"])}
+% else:
+    casez(${decoder.get_addr("ahb_slv_haddr_i")})
 % for aspc in mod.addrmap:
-      ${decode_casez(dec_slice, aspc)}: begin // ${aspc.name}
+      ${decoder.get_casez(aspc.name)}: begin // ${aspc.name}
         valid_addr_s = 1'b1;
         apb_${aspc.name}_sel_s = 1'b1;
       end
@@ -87,6 +86,7 @@ ${parent.logic(indent=indent, skip=skip)}\
         valid_addr_s = 1'b0;
       end
     endcase
+% endif
 % if use_pstrb:
 
     if (ahb_slv_hwrite_i == ahb_write_write_e) begin
@@ -178,7 +178,7 @@ ${parent.logic(indent=indent, skip=skip)}\
   // ------------------------------------------------------
   always_ff @ (posedge main_clk_i or negedge main_rst_an_i) begin: proc_fsm
     if (main_rst_an_i == 1'b0) begin
-      fsm_r <= ${ff_dly}fsm_idle_st;
+      fsm_r <= ${ff_dly}${fsm}_idle_st;
       hready_r <= ${ff_dly}1'b1;
 % if not mod.errirq:
       hresp_r <= ${ff_dly}apb_resp_okay_e;
@@ -201,8 +201,8 @@ ${parent.logic(indent=indent, skip=skip)}\
       irq_r <= ${ff_dly}1'b0;
 % endif
     end else begin
-      case (fsm_r)
-        fsm_idle_st: begin
+      ${fsm.case("fsm_r")}
+        ${fsm.label("fsm_r", "idle")}: begin
 % if mod.errirq:
           irq_r <= ${ff_dly}new_xfer_s & ~valid_addr_s;
 % endif
@@ -223,13 +223,13 @@ ${parent.logic(indent=indent, skip=skip)}\
 % for aspc in mod.addrmap:
               apb_${aspc.name}_sel_r <= ${ff_dly}apb_${aspc.name}_sel_s;
 % endfor
-              fsm_r <= ${ff_dly}fsm_apb_ctrl_st;
+              fsm_r <= ${ff_dly}${fsm}_apb_ctrl_st;
 % if mod.errirq:
             end
 % else:
             end else begin
               hresp_r <= ${ff_dly}apb_resp_error_e;
-              fsm_r <= ${ff_dly}fsm_ahb_err_st;
+              fsm_r <= ${ff_dly}${fsm}_ahb_err_st;
             end
           end else begin
             hresp_r <= ${ff_dly}apb_resp_okay_e;
@@ -237,7 +237,7 @@ ${parent.logic(indent=indent, skip=skip)}\
           end
         end
 
-        fsm_apb_ctrl_st: begin
+        ${fsm.label("fsm_r", "apb_ctrl")}: begin
           if (pwrite_r == 1'b1) begin
 % if use_hstrb:
             hwstrb_r <= ${ff_dly}ahb_slv_hwstrb_i;
@@ -248,10 +248,10 @@ ${parent.logic(indent=indent, skip=skip)}\
 % if mod.optbw:
           hready_r <= ${ff_dly}1'b1;
 % endif
-          fsm_r <= ${ff_dly}fsm_apb_data_st;
+          fsm_r <= ${ff_dly}${fsm}_apb_data_st;
         end
 
-        fsm_apb_data_st: begin
+        ${fsm.label("fsm_r", "apb_data")}: begin
           if (pready_s == 1'b1) begin
             penable_r <= ${ff_dly}1'b0;
 % if mod.optbw:
@@ -265,7 +265,7 @@ ${parent.logic(indent=indent, skip=skip)}\
 %   for aspc in mod.addrmap:
               apb_${aspc.name}_sel_r <= ${ff_dly}1'b0;
 %   endfor
-              fsm_r <= ${ff_dly}fsm_ahb_err_st;
+              fsm_r <= ${ff_dly}${fsm}_ahb_err_st;
             end else if (new_xfer_s == 1'b1) begin
 %   endif
 %   if not mod.errirq:
@@ -286,12 +286,12 @@ ${parent.logic(indent=indent, skip=skip)}\
 %   for aspc in mod.addrmap:
                 apb_${aspc.name}_sel_r <= ${ff_dly}apb_${aspc.name}_sel_s;
 %   endfor
-                fsm_r <= ${ff_dly}fsm_apb_ctrl_st;
+                fsm_r <= ${ff_dly}${fsm}_apb_ctrl_st;
               end else begin
 %   if mod.errirq:
                 hready_r <= ${ff_dly}1'b1;
                 pwrite_r <= ${ff_dly}1'b0;
-                fsm_r <= ${ff_dly}fsm_idle_st;
+                fsm_r <= ${ff_dly}${fsm}_idle_st;
 %   else:
 %   if use_pstrb:
               pstrb_r <= ${ff_dly}${rslvr._get_uint_value(0, mod.datawidth//8)};
@@ -300,7 +300,7 @@ ${parent.logic(indent=indent, skip=skip)}\
                 apb_${aspc.name}_sel_r <= ${ff_dly}1'b0;
 %   endfor
                 hresp_r <= ${ff_dly}apb_resp_error_e;
-                fsm_r <= ${ff_dly}fsm_ahb_err_st;
+                fsm_r <= ${ff_dly}${fsm}_ahb_err_st;
 %   endif
               end
             end else begin // no new xfer and no pslverr
@@ -313,7 +313,7 @@ ${parent.logic(indent=indent, skip=skip)}\
 %   for aspc in mod.addrmap:
               apb_${aspc.name}_sel_r <= ${ff_dly}1'b0;
 %   endfor
-              fsm_r <= ${ff_dly}fsm_idle_st;
+              fsm_r <= ${ff_dly}${fsm}_idle_st;
             end
 % else:  # not optbw
             prdata_r <= ${ff_dly}prdata_s;
@@ -328,15 +328,15 @@ ${parent.logic(indent=indent, skip=skip)}\
             hready_r <= ${ff_dly}1'b1;
             pwrite_r <= ${ff_dly}1'b0;
             irq_r <= ${ff_dly}pslverr_s;
-            fsm_r <= ${ff_dly}fsm_idle_st;
+            fsm_r <= ${ff_dly}${fsm}_idle_st;
 %   else:
             if (pslverr_s == 1'b0) begin
               hready_r <= ${ff_dly}1'b1;
               hresp_r <= ${ff_dly}apb_resp_okay_e;
-              fsm_r <= ${ff_dly}fsm_idle_st;
+              fsm_r <= ${ff_dly}${fsm}_idle_st;
             end else begin
               hresp_r <= ${ff_dly}apb_resp_error_e;
-              fsm_r <= ${ff_dly}fsm_ahb_err_st;
+              fsm_r <= ${ff_dly}${fsm}_ahb_err_st;
             end
 %   endif
 % endif
@@ -344,9 +344,9 @@ ${parent.logic(indent=indent, skip=skip)}\
         end
 
 % if not mod.errirq:
-        fsm_ahb_err_st: begin
+        ${fsm.label("fsm_r", "ahb_err")}: begin
           hready_r <= ${ff_dly}1'b1;
-          fsm_r <= ${ff_dly}fsm_idle_st;
+          fsm_r <= ${ff_dly}${fsm}_idle_st;
         end
 % endif
 
@@ -365,7 +365,7 @@ ${parent.logic(indent=indent, skip=skip)}\
 % for aspc in mod.addrmap:
           apb_${aspc.name}_sel_r <= ${ff_dly}1'b0;
 % endfor
-          fsm_r <= ${ff_dly}fsm_idle_st;
+          fsm_r <= ${ff_dly}${fsm}_idle_st;
         end
       endcase
     end
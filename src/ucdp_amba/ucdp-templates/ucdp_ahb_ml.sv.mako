@@ -23,133 +23,183 @@
 ##
 
 <%!
+import re
 import ucdp as u
 import ucdpsv as usv
 import ucdp_amba.types as t
-from ucdp_addr.addrslave import SlaveAddrspace
-from ucdp_amba.ucdp_ahb_ml import Master, UcdpAhbMlMod
-from collections.abc import Iterator
+from typing import get_args
+from ucdp_amba.ucdp_ahb_ml import Arbitration, Master, UcdpAhbMlMod
 from aligntext import Align
-from icdutil import num
-from typing import Literal
-
-
-def get_master_addrspaces(mod: UcdpAhbMlMod, mastername: str) -> Iterator[SlaveAddrspace]:
-  for aspc in mod.addrmap:
-    if aspc.slave.name in mod._master_slaves[mastername]:
-      yield aspc
-
-def get_slave_addrspaces(mod: UcdpAhbMlMod, slavename: str) -> Iterator[SlaveAddrspace]:
-  for aspc in mod.addrmap:
-    if aspc.slave.name == slavename:
-      yield aspc
-
-def decode_casez(decoding_slice: u.Slice, addrspaces: list[SlaveAddrspace]):
-  allmasks = []
-  for addrspace in addrspaces:
-    size = addrspace.size >> decoding_slice.right
-    base = addrspace.baseaddr >> decoding_slice.right
-    masks = [f"{decoding_slice.width}'b{mask}" for mask in num.calc_addrwinmasks(base, size, decoding_slice.width, '?')]
-    allmasks.extend(masks)
-  return ", ".join(allmasks)
-
-def proto_opt(src_opt: bool, tgt_opt:bool) ->Literal["ign", "tie", "red", "exp", "fwd"]:
-  optmap = [["ign", "tie"], ["ign", "fwd"]]
-  if isinstance(src_opt, bool):
-    return optmap[src_opt][tgt_opt]
-  if tgt_opt == 0:
-    return "ign"
-  if src_opt == 0:
-    return "tie"
-  if src_opt == tgt_opt:
-    return "fwd"
-  if src_opt > tgt_opt:
-    return "red"
-  return "exp"
+
+ARBITRATIONS = get_args(Arbitration)
+
 
 def hprot_exp(mst_hprot: str) -> str:
   return f"{{{mst_hprot}[3], 1'b0, {mst_hprot}[3], {mst_hprot}}}"
+
+def fit(rslvr, expr: str, width: int, fitwidth: int) -> str:
+  """Truncate or zero-extend `expr` from `width` to `fitwidth` bits."""
+  if width == fitwidth:
+    return expr
+  if width > fitwidth:
+    return f"{expr}[{fitwidth-1}:0]"
+  return f"{{{rslvr._get_uint_value(0, fitwidth-width)}, {expr}}}"
+
+def pack(values: list[int], width: int) -> int:
+  """Concatenate `values` of `width` bits each - the first value is the least significant."""
+  return sum(value << (idx * width) for idx, value in enumerate(values))
+
+def slv_ready(mod, slavename: str) -> str:
+  """Arbitration enable of slave `slavename` - the parked master is re-granted during its own wait states."""
+  if mod.is_parked(slavename):
+    return f"(ahb_slv_{slavename}_hreadyout_i | slv_{slavename}_park_s)"
+  return f"ahb_slv_{slavename}_hreadyout_i"
+
+def regslice_remap(mod, text: str) -> str:
+  """Connect the multilayer logic of register-sliced ports to their register slice or posted-write buffer."""
+  for kind, items in (("mst", mod.masters), ("slv", mod.slaves)):
+    for item in items:
+      prefix = "pw" if kind == "slv" and item.posted else "rs" if item.regslice != "none" else None
+      if prefix:
+        text = re.sub(rf"\bahb_{kind}_{item.name}_(h[a-z]+)_[io]\b", rf"{prefix}_{kind}_{item.name}_\1_s", text)
+  return text
+
+def andor(rslvr, indent: int, target: str, width: int, terms: list[tuple[str, str | None]], idle: str | None = None) -> str:
+  """
+  Assign the parallel AND-OR multiplexer of the one-hot `terms` (select, value) to `target`.
+
+  `idle` is assigned if no select with a value is active - it is zero if `None`.
+  Selects with value `None` assign `idle` as well.
+  """
+  sels = [sel for sel, value in terms if value is not None]
+  ors = [f"({sel if width == 1 else f'{{{width}{{{sel}}}}}'} & {value})" for sel, value in terms if value is not None]
+  if idle is not None:
+    nosel = f"~{sels[0]}" if len(sels) == 1 else f"~(|{{{', '.join(sels)}}})"
+    if not sels:
+      ors.append(idle)
+    elif idle == "1'b1":
+      ors.append(nosel)
+    else:
+      ors.append(f"({nosel if width == 1 else f'{{{width}{{{nosel}}}}}'} & {idle})")
+  if not ors:
+    ors.append(rslvr._get_uint_value(0, width))
+  prefix = f"{' ' * indent}{target} = "
+  return prefix + f" |\n{' ' * len(prefix)}".join(ors) + ";"
+
+def prefix_or(indent: int, target: str, src: str, width: int, op: str = "<<") -> str:
+  """
+  Assign the exclusive parallel-prefix OR of `src` to `target` in `log2(width)` stages.
+
+  Bit `i` of `target` is set if any lower (`<<`) or higher (`>>`) bit of `src` is set.
+  """
+  lines = [f"{target} = {src} {op} 1;"]
+  shift = 1
+  while shift < width - 1:
+    lines.append(f"{target} = {target} | ({target} {op} {shift});")
+    shift *= 2
+  return "\n".join(f"{' ' * indent}{line}" for line in lines)
+
+def reindent(text: str, num: int) -> str:
+  """Indent all non-empty lines of `text` by `num` spaces."""
+  return "\n".join(f"{' ' * num}{line}" if line else line for line in text.rstrip("\n").split("\n"))
 %>
 <%inherit file="sv.mako"/>
 
 <%def name="logic(indent=0, skip=None)">\
 <%
   rslvr = usv.get_resolver(mod)
-  dec_slices: dict[str, u.Slice] = {}
-  num_masters = len(mod.masters)
-  for master in mod.masters:
-    dec_bits = [num.calc_lowest_bit_set(aspc.size) for aspc in get_master_addrspaces(mod, master.name)]
-    dec_slices[master.name] = u.Slice(left=mod.addrwidth-1, right=min(dec_bits))
-
-  mst_index = {master.name: idx for idx, master in enumerate(mod.masters)}
+  decoders = {master.name: mod.get_decoder(master.name) for master in mod.masters}
   ff_dly = f"#{rslvr.ff_dly} " if rslvr.ff_dly else ""
+  fsm = t.FsmRef("ahb_ml_fsm" if mod.use_pkg and mod.fsm_encoding == "binary" else "fsm", mod.fsmtype)
 %>\
+% if mod.use_pkg:
+
+  import ucdp_amba_pkg::*;
+% endif
 
 ${parent.logic(indent=indent, skip=skip)}
+${regslice_remap(mod, capture(core_logic, rslvr, decoders, ff_dly, fsm))}\
+</%def>
+
+<%def name="core_logic(rslvr, decoders, ff_dly, fsm)">\
+<%
+  routing = mod.routing
+%>\
+% if mod.rtl_style == "array":
+${array_logic(rslvr, decoders, ff_dly, fsm)}\
+% else:
 
   // ------------------------------------------------------
   // The Masters:
   // ------------------------------------------------------
 % for master in mod.masters:
 <%
-  master_slaves = mod._master_slaves[master.name]
+  mst_routing = routing.masters[master.name]
+  master_slaves = mst_routing.slavenames
   num_slaves = len(master_slaves)
   if num_slaves == 1:
     sole_slv = master_slaves[0]
+  brk_slaves = [slavename for slavename in master_slaves if mod.is_bounded(slavename)]
   xfers = Align(rtrim=True)
   xfers.set_separators(first=" "*4)
-  xfers.add_row(f"mst_{master.name}_new_xfer_s", "=", f"(ahb_mst_{master.name}_htrans_i == ahb_trans_nonseq_e) ? 1'b1 : 1'b0;")
-  xfers.add_row(f"mst_{master.name}_cont_xfer_s", "=", f"((ahb_mst_{master.name}_htrans_i == ahb_trans_busy_e) ||")
-  xfers.add_row("", "", f" (ahb_mst_{master.name}_htrans_i == ahb_trans_seq_e)) ? 1'b1 : 1'b0;")
-  xfers.add_row(f"mst_{master.name}_rqstate_s", "=", f"((fsm_{master.name}_r == fsm_idle_st) ||")
-  xfers.add_row("", "", f" (fsm_{master.name}_r == fsm_transfer_st) ||")
-  xfers.add_row("", "", f" (fsm_{master.name}_r == fsm_transfer_finish_st) ||")
-  xfers.add_row("", "", f" (fsm_{master.name}_r == fsm_error2_st)) ? 1'b1 : 1'b0;")
+  if brk_slaves:
+    # legal break point: SEQ beat of an unlocked undefined-length burst
+    brkpt = [f"(ahb_mst_{master.name}_htrans_i == ahb_trans_seq_e)"]
+    if master.proto.has_hburst:
+      brkpt.append(f"(ahb_mst_{master.name}_hburst_i == ahb_burst_incr_e)")
+    if master.proto.has_hmastlock:
+      brkpt.append(f"(ahb_mst_{master.name}_hmastlock_i == 1'b0)")
+    brks = " | ".join(f"(mst_{master.name}_{slavename}_gnt_r & slv_{slavename}_brk_s)" for slavename in brk_slaves)
+    if len(brk_slaves) > 1:
+      brks = f"({brks})"
+    if len(brkpt) == 1:
+      xfers.add_row(f"mst_{master.name}_brk_s", "=", f"{brkpt[0]} ? {brks} : 1'b0;")
+    else:
+      xfers.add_row(f"mst_{master.name}_brk_s", "=", f"({brkpt[0]} &&")
+      for cond in brkpt[1:-1]:
+        xfers.add_row("", "", f" {cond} &&")
+      xfers.add_row("", "", f" {brkpt[-1]}) ? {brks} : 1'b0;")
+    xfers.add_row(f"mst_{master.name}_new_xfer_s", "=", f"((ahb_mst_{master.name}_htrans_i == ahb_trans_nonseq_e) || (mst_{master.name}_brk_s == 1'b1)) ? 1'b1 : 1'b0;")
+    xfers.add_row(f"mst_{master.name}_cont_xfer_s", "=", f"(((ahb_mst_{master.name}_htrans_i == ahb_trans_busy_e) ||")
+    xfers.add_row("", "", f"  (ahb_mst_{master.name}_htrans_i == ahb_trans_seq_e)) &&")
+    xfers.add_row("", "", f" (mst_{master.name}_brk_s == 1'b0)) ? 1'b1 : 1'b0;")
+  else:
+    xfers.add_row(f"mst_{master.name}_new_xfer_s", "=", f"(ahb_mst_{master.name}_htrans_i == ahb_trans_nonseq_e) ? 1'b1 : 1'b0;")
+    xfers.add_row(f"mst_{master.name}_cont_xfer_s", "=", f"((ahb_mst_{master.name}_htrans_i == ahb_trans_busy_e) ||")
+    xfers.add_row("", "", f" (ahb_mst_{master.name}_htrans_i == ahb_trans_seq_e)) ? 1'b1 : 1'b0;")
+  fsm_r = f"fsm_{master.name}_r"
+  xfers.add_row(f"mst_{master.name}_rqstate_s", "=", f"(({fsm.is_state(fsm_r, 'idle')}) ||")
+  xfers.add_row("", "", f" ({fsm.is_state(fsm_r, 'transfer')}) ||")
+  xfers.add_row("", "", f" ({fsm.is_state(fsm_r, 'transfer_finish')}) ||")
+  xfers.add_row("", "", f" ({fsm.is_state(fsm_r, 'error2')})) ? 1'b1 : 1'b0;")
   reqkeep = Align(rtrim=True)
   reqkeep.set_separators(first=" "*4)
   for slavename in master_slaves:
-    reqkeep.add_row(f"mst_{master.name}_{slavename}_req_s", "=", f"(mst_{master.name}_{slavename}_sel_s & mst_{master.name}_new_xfer_s & mst_{master.name}_rqstate_s) | mst_{master.name}_{slavename}_req_r;")
-    if len(mod._slave_masters[slavename]) > 1:
+    if mod.regdec:
+      reqkeep.add_row(f"mst_{master.name}_{slavename}_req_s", "=", f"mst_{master.name}_{slavename}_sel_s;")
+    else:
+      # another slave is requested with the end of the current data phase only
+      reqkeep.add_row(f"mst_{master.name}_{slavename}_req_s", "=", f"(mst_{master.name}_{slavename}_sel_s & mst_{master.name}_new_xfer_s & mst_{master.name}_rqstate_s &")
+      reqkeep.add_row("", "", f" (mst_{master.name}_hready_s | mst_{master.name}_{slavename}_gnt_r)) | mst_{master.name}_{slavename}_req_r;")
+    if len(routing.slaves[slavename].masternames) > 1:
       reqkeep.add_row(f"mst_{master.name}_{slavename}_keep_s", "=", f"mst_{master.name}_{slavename}_gnt_r & mst_{master.name}_cont_xfer_s;")
-  mst_dec_slice = dec_slices[master.name]
+  decoder = decoders[master.name]
+  dec_stmts = {slavename: [f"mst_{master.name}_{slavename}_sel_s = 1'b1;"] for slavename in master_slaves}
   mst_proto = master.proto
 
-  # proto conditionals
-  slv_hprotwidth = 0
-  slv_hmasterwidth = False
-  slv_hburst = False
-  slv_hmastlock = False
-  slv_hnonsec = False
-  slv_hexclxfers = False
-  slv_hauser = False
-  slv_hwuser = False
-  slv_hruser = False
-  slv_hbuser = False
-  for slavename in master_slaves:
-    slvproto = mod.slaves[slavename].proto
-
-    slv_hprotwidth = max(slv_hprotwidth, slvproto.hprotwidth)
-    slv_hmasterwidth = max(slv_hmasterwidth, slvproto.hmaster_width)
-    slv_hburst = slv_hburst or slvproto.has_hburst
-    slv_hmastlock = slv_hmastlock or slvproto.has_hmastlock
-    slv_hnonsec = slv_hnonsec or slvproto.has_hnonsec
-    slv_hexclxfers = slv_hexclxfers or slvproto.has_exclxfers
-    slv_hauser = slv_hauser or (slvproto.ausertype is not None)
-    slv_hwuser = slv_hwuser or (slvproto.wusertype is not None)
-    slv_hruser = slv_hruser or (slvproto.rusertype is not None)
-    slv_hbuser = slv_hbuser or (slvproto.busertype is not None)
-
-  mst_hprot = proto_opt(mst_proto.hprotwidth, slv_hprotwidth)
-  mst_hmastlock = proto_opt(mst_proto.has_hmastlock, slv_hmastlock)
-  mst_hmaster = proto_opt(mst_proto.hmaster_width, slv_hmasterwidth)
-  mst_hburst = proto_opt(mst_proto.has_hburst, slv_hburst)
-  mst_hnonsec = proto_opt(mst_proto.has_hnonsec, slv_hnonsec)
-  mst_hexcl = proto_opt(mst_proto.has_exclxfers, slv_hexclxfers)
-  mst_hexok = proto_opt(slv_hexclxfers, mst_proto.has_exclxfers)  # deliberately swapped src/tgt
-  mst_hauser = proto_opt(mst_proto.ausertype is not None, slv_hauser)
-  mst_hwuser = proto_opt(mst_proto.wusertype is not None, slv_hwuser)
-  mst_hruser = proto_opt(slv_hruser, mst_proto.rusertype is not None)  # deliberately swapped src/tgt
-  mst_hbuser = proto_opt(slv_hbuser, mst_proto.busertype is not None)  # deliberately swapped src/tgt
+  slv_hmasterwidth = mst_routing.slaves_sig.hmaster_width
+  mst_actions = mst_routing.actions
+  mst_hprot = mst_actions.hprot
+  mst_hmastlock = mst_actions.hmastlock
+  mst_hmaster = mst_actions.hmaster
+  mst_hburst = mst_actions.hburst
+  mst_hnonsec = mst_actions.hnonsec
+  mst_hexcl = mst_actions.hexcl
+  mst_hexok = mst_actions.hexokay
+  mst_hauser = mst_actions.hauser
+  mst_hwuser = mst_actions.hwuser
+  mst_hruser = mst_actions.hruser
+  mst_hbuser = mst_actions.hbuser
 %>\
   // Master '${master.name}' Logic
   always_comb begin: proc_${master.name}_logic
@@ -157,13 +207,27 @@ ${xfers.get()}
 
     // Address Decoding
     mst_${master.name}_addr_err_s = 1'b0;
+%   if mod.regdec:
+    mst_${master.name}_fine_err_s = 1'b0;
+    mst_${master.name}_region_s = ${rslvr._get_uint_value(0, len(decoder.regions))};
+%   endif
 %   for slavename in master_slaves:
     mst_${master.name}_${slavename}_sel_s = 1'b0;
 %   endfor
 
-    casez (ahb_mst_${master.name}_haddr_i[${mst_dec_slice}])
+%   if mod.regdec:
+${decoder.get_coarse_code(f"ahb_mst_{master.name}_haddr_i", [[f"mst_{master.name}_region_s[{idx}] = 1'b1;"] for idx in range(len(decoder.regions))], [f"mst_{master.name}_addr_err_s = mst_{master.name}_new_xfer_s;"])}
+
+    // Fine Decoding of the Buffered Address within the Registered Region
+    if (${fsm.is_state(f"fsm_{master.name}_r", "transfer_wait")}) begin
+${decoder.get_fine_code(f"mst_{master.name}_haddr_r", [f"mst_{master.name}_region_r[{idx}] == 1'b1" for idx in range(len(decoder.regions))], dec_stmts, [f"mst_{master.name}_fine_err_s = 1'b1;"], indent=6)}
+    end
+%   elif decoder.regions:
+${decoder.get_code(f"ahb_mst_{master.name}_haddr_i", dec_stmts, [f"mst_{master.name}_addr_err_s = mst_{master.name}_new_xfer_s;"])}
+%   else:
+    casez (${decoder.get_addr(f"ahb_mst_{master.name}_haddr_i")})
 %   for slavename in master_slaves:
-      ${decode_casez(mst_dec_slice, get_slave_addrspaces(mod, slavename))}: begin // ${slavename}
+      ${decoder.get_casez(slavename)}: begin // ${slavename}
         mst_${master.name}_${slavename}_sel_s = 1'b1;
       end
 
@@ -172,6 +236,7 @@ ${xfers.get()}
         mst_${master.name}_addr_err_s = mst_${master.name}_new_xfer_s;
       end
     endcase
+%   endif
 
 ${reqkeep.get()}
 
@@ -187,26 +252,30 @@ ${reqkeep.get()}
   // FSM for Master '${master.name}'
   always_ff @(posedge main_clk_i or negedge main_rst_an_i) begin: proc_${master.name}_fsm
     if (main_rst_an_i == 1'b0) begin
-      fsm_${master.name}_r <= ${ff_dly}fsm_idle_st;
+      fsm_${master.name}_r <= ${ff_dly}${fsm}_idle_st;
 %   for slavename in master_slaves:
       mst_${master.name}_${slavename}_gnt_r <= ${ff_dly}1'b0;
 %   endfor
     end else begin
-      case (fsm_${master.name}_r)
-        fsm_idle_st: begin
+      ${fsm.case(f"fsm_{master.name}_r")}
+        ${fsm.label(f"fsm_{master.name}_r", "idle")}: begin
           if (mst_${master.name}_new_xfer_s == 1'b1) begin
             if (mst_${master.name}_addr_err_s == 1'b1) begin
-              fsm_${master.name}_r <= ${ff_dly}fsm_error1_st;
+              fsm_${master.name}_r <= ${ff_dly}${fsm}_error1_st;
+%   if mod.regdec:
+            end else begin
+%   else:
             end else if (mst_${master.name}_gnt_s == 1'b1) begin
 %   for slavename in master_slaves:
               mst_${master.name}_${slavename}_req_r <= ${ff_dly}1'b0;
 %   endfor
-              fsm_${master.name}_r <= ${ff_dly}fsm_transfer_st;
+              fsm_${master.name}_r <= ${ff_dly}${fsm}_transfer_st;
             end else begin
 %   for slavename in master_slaves:
               mst_${master.name}_${slavename}_req_r <= ${ff_dly}mst_${master.name}_${slavename}_sel_s;
 %   endfor
-              fsm_${master.name}_r <= ${ff_dly}fsm_transfer_wait_st;
+%   endif
+              fsm_${master.name}_r <= ${ff_dly}${fsm}_transfer_wait_st;
             end
 %   for slavename in master_slaves:
             mst_${master.name}_${slavename}_gnt_r <= ${ff_dly}slv_${slavename}_${master.name}_gnt_s;
@@ -214,105 +283,143 @@ ${reqkeep.get()}
           end
         end
 
-        fsm_error0_st: begin
+        ${fsm.label(f"fsm_{master.name}_r", "error0")}: begin
           if (mst_${master.name}_hready_s == 1'b1) begin
-            fsm_${master.name}_r <= ${ff_dly}fsm_error1_st;
+%   for slavename in master_slaves:
+            mst_${master.name}_${slavename}_gnt_r <= ${ff_dly}1'b0;
+%   endfor
+            fsm_${master.name}_r <= ${ff_dly}${fsm}_error1_st;
           end
         end
 
-        fsm_error1_st: begin
-          fsm_${master.name}_r <= ${ff_dly}fsm_error2_st;
+        ${fsm.label(f"fsm_{master.name}_r", "error1")}: begin
+          fsm_${master.name}_r <= ${ff_dly}${fsm}_error2_st;
         end
 
-        fsm_error2_st: begin
+        ${fsm.label(f"fsm_{master.name}_r", "error2")}: begin
           if (mst_${master.name}_new_xfer_s == 1'b1) begin
             if (mst_${master.name}_addr_err_s == 1'b1) begin
-              fsm_${master.name}_r <= ${ff_dly}fsm_error1_st;
+              fsm_${master.name}_r <= ${ff_dly}${fsm}_error1_st;
+%   if mod.regdec:
+            end else begin
+%   else:
             end else if (mst_${master.name}_gnt_s == 1'b1) begin
 %   for slavename in master_slaves:
               mst_${master.name}_${slavename}_req_r <= ${ff_dly}1'b0;
 %   endfor
-              fsm_${master.name}_r <= ${ff_dly}fsm_transfer_st;
+              fsm_${master.name}_r <= ${ff_dly}${fsm}_transfer_st;
             end else begin
 %   for slavename in master_slaves:
               mst_${master.name}_${slavename}_req_r <= ${ff_dly}mst_${master.name}_${slavename}_sel_s;
 %   endfor
-              fsm_${master.name}_r <= ${ff_dly}fsm_transfer_wait_st;
+%   endif
+              fsm_${master.name}_r <= ${ff_dly}${fsm}_transfer_wait_st;
             end
 %   for slavename in master_slaves:
             mst_${master.name}_${slavename}_gnt_r <= ${ff_dly}slv_${slavename}_${master.name}_gnt_s;
 %   endfor
           end else begin
-            fsm_${master.name}_r <= ${ff_dly}fsm_idle_st;
+            fsm_${master.name}_r <= ${ff_dly}${fsm}_idle_st;
           end
         end
 
-        fsm_transfer_st: begin
+        ${fsm.label(f"fsm_{master.name}_r", "transfer")}: begin
+%   if brk_slaves:
+          if (mst_${master.name}_cont_xfer_s == 1'b1) begin
+%   else:
           if ((ahb_mst_${master.name}_htrans_i == ahb_trans_seq_e) ||
               (ahb_mst_${master.name}_htrans_i == ahb_trans_busy_e)) begin
-            fsm_${master.name}_r <= ${ff_dly}fsm_transfer_st;
+%   endif
+            fsm_${master.name}_r <= ${ff_dly}${fsm}_transfer_st;
           end else begin
             if (ahb_mst_${master.name}_htrans_i == ahb_trans_idle_e) begin
               if (mst_${master.name}_hready_s == 1'b0) begin
-                fsm_${master.name}_r <= ${ff_dly}fsm_transfer_finish_st;
+                fsm_${master.name}_r <= ${ff_dly}${fsm}_transfer_finish_st;
               end else begin
 %   for slavename in master_slaves:
                 mst_${master.name}_${slavename}_gnt_r <= ${ff_dly}1'b0;
 %   endfor
-                fsm_${master.name}_r <= ${ff_dly}fsm_idle_st;
+                fsm_${master.name}_r <= ${ff_dly}${fsm}_idle_st;
               end
+%   if brk_slaves:
+            end else begin // ((ahb_mst_${master.name}_htrans_i == ahb_trans_nonseq_e) || (mst_${master.name}_brk_s == 1'b1))
+%   else:
             end else begin // ((ahb_mst_${master.name}_htrans_i == ahb_trans_nonseq_e)
-              if (mst_${master.name}_addr_err_s == 1'b1) begin
-                if (mst_${master.name}_hready_s == 1'b0) begin
-                  fsm_${master.name}_r <= ${ff_dly}fsm_error0_st;
+%   endif
+%   if mod.regdec:
+              if (mst_${master.name}_hready_s == 1'b1) begin // address phase ends with the current data phase
+                if (mst_${master.name}_addr_err_s == 1'b1) begin
+                  fsm_${master.name}_r <= ${ff_dly}${fsm}_error1_st;
                 end else begin
-                  fsm_${master.name}_r <= ${ff_dly}fsm_error1_st;
+                  fsm_${master.name}_r <= ${ff_dly}${fsm}_transfer_wait_st;
                 end
-              end else if (mst_${master.name}_gnt_s == 1'b1) begin
 %   for slavename in master_slaves:
-                mst_${master.name}_${slavename}_req_r <= ${ff_dly}1'b0;
+                mst_${master.name}_${slavename}_gnt_r <= ${ff_dly}1'b0;
 %   endfor
-                fsm_${master.name}_r <= ${ff_dly}fsm_transfer_st;
-              end else begin
+              end
+%   else:
+              if (mst_${master.name}_hready_s == 1'b1) begin // address phase ends with the current data phase
+                if (mst_${master.name}_addr_err_s == 1'b1) begin
+                  fsm_${master.name}_r <= ${ff_dly}${fsm}_error1_st;
+                end else if (mst_${master.name}_gnt_s == 1'b1) begin
 %   for slavename in master_slaves:
-                mst_${master.name}_${slavename}_req_r <= ${ff_dly}mst_${master.name}_${slavename}_sel_s;
+                  mst_${master.name}_${slavename}_req_r <= ${ff_dly}1'b0;
 %   endfor
-                fsm_${master.name}_r <= ${ff_dly}fsm_transfer_wait_st;
-              end
+                  fsm_${master.name}_r <= ${ff_dly}${fsm}_transfer_st;
+                end else begin
 %   for slavename in master_slaves:
-              mst_${master.name}_${slavename}_gnt_r <= ${ff_dly}slv_${slavename}_${master.name}_gnt_s;
+                  mst_${master.name}_${slavename}_req_r <= ${ff_dly}mst_${master.name}_${slavename}_sel_s;
+%   endfor
+                  fsm_${master.name}_r <= ${ff_dly}${fsm}_transfer_wait_st;
+                end
+%   for slavename in master_slaves:
+                mst_${master.name}_${slavename}_gnt_r <= ${ff_dly}slv_${slavename}_${master.name}_gnt_s;
 %   endfor
+              end else if (mst_${master.name}_addr_err_s == 1'b1) begin // the data phase continues
+                fsm_${master.name}_r <= ${ff_dly}${fsm}_error0_st;
+              end
+%   endif
             end
           end
         end
 
-        fsm_transfer_wait_st: begin
+        ${fsm.label(f"fsm_{master.name}_r", "transfer_wait")}: begin
+%   if mod.regdec:
+          if (mst_${master.name}_fine_err_s == 1'b1) begin
+            fsm_${master.name}_r <= ${ff_dly}${fsm}_error1_st;
+          end else if (mst_${master.name}_gnt_s == 1'b1) begin
+%   else:
           if (mst_${master.name}_gnt_s == 1'b1) begin
 %   for slavename in master_slaves:
             mst_${master.name}_${slavename}_req_r <= ${ff_dly}1'b0;
 %   endfor
+%   endif
 %   for slavename in master_slaves:
             mst_${master.name}_${slavename}_gnt_r <= ${ff_dly}slv_${slavename}_${master.name}_gnt_s;
 %   endfor
-            fsm_${master.name}_r <= ${ff_dly}fsm_transfer_st;
+            fsm_${master.name}_r <= ${ff_dly}${fsm}_transfer_st;
           end
         end
 
-        fsm_transfer_finish_st: begin
+        ${fsm.label(f"fsm_{master.name}_r", "transfer_finish")}: begin
           if (mst_${master.name}_hready_s == 1'b1) begin
             if (mst_${master.name}_new_xfer_s == 1'b1) begin
               if (mst_${master.name}_addr_err_s == 1'b1) begin
-                fsm_${master.name}_r <= ${ff_dly}fsm_error1_st;
+                fsm_${master.name}_r <= ${ff_dly}${fsm}_error1_st;
+%   if mod.regdec:
+              end else begin
+%   else:
               end else if (mst_${master.name}_gnt_s == 1'b1) begin
 %   for slavename in master_slaves:
                 mst_${master.name}_${slavename}_req_r <= ${ff_dly}1'b0;
 %   endfor
-                fsm_${master.name}_r <= ${ff_dly}fsm_transfer_st;
+                fsm_${master.name}_r <= ${ff_dly}${fsm}_transfer_st;
               end else begin
 %   for slavename in master_slaves:
                 mst_${master.name}_${slavename}_req_r <= ${ff_dly}mst_${master.name}_${slavename}_sel_s;
 %   endfor
-                fsm_${master.name}_r <= ${ff_dly}fsm_transfer_wait_st;
+%   endif
+                fsm_${master.name}_r <= ${ff_dly}${fsm}_transfer_wait_st;
               end
 %   for slavename in master_slaves:
               mst_${master.name}_${slavename}_gnt_r <= ${ff_dly}slv_${slavename}_${master.name}_gnt_s;
@@ -321,7 +428,7 @@ ${reqkeep.get()}
 %   for slavename in master_slaves:
               mst_${master.name}_${slavename}_gnt_r <= ${ff_dly}1'b0;
 %   endfor
-              fsm_${master.name}_r <= ${ff_dly}fsm_idle_st;
+              fsm_${master.name}_r <= ${ff_dly}${fsm}_idle_st;
             end
           end
         end
@@ -329,16 +436,22 @@ ${reqkeep.get()}
         default: begin
 %   for slavename in master_slaves:
           mst_${master.name}_${slavename}_gnt_r <= ${ff_dly}1'b0;
+%     if not mod.regdec:
           mst_${master.name}_${slavename}_req_r <= ${ff_dly}1'b0;
+%     endif
 %   endfor
-          fsm_${master.name}_r <= ${ff_dly}fsm_idle_st;
+          fsm_${master.name}_r <= ${ff_dly}${fsm}_idle_st;
         end
       endcase
     end
 
     if ((mst_${master.name}_new_xfer_s == 1'b1) && (mst_${master.name}_gnt_s == 1'b0) && (mst_${master.name}_rqstate_s == 1'b1)) begin
       mst_${master.name}_haddr_r  <= ${ff_dly}ahb_mst_${master.name}_haddr_i;
+%   if brk_slaves:
+      mst_${master.name}_htrans_r <= ${ff_dly}ahb_trans_nonseq_e;  // a broken burst restarts with NONSEQ
+%   else:
       mst_${master.name}_htrans_r <= ${ff_dly}ahb_mst_${master.name}_htrans_i;
+%   endif
 %   if mst_hburst == "fwd":
       mst_${master.name}_hburst_r <= ${ff_dly}ahb_mst_${master.name}_hburst_i;
 %   endif
@@ -368,9 +481,22 @@ ${reqkeep.get()}
 %   endif
     end
 
-    mst_${master.name}_hwrite_dph_r <= ${ff_dly}mst_${master.name}_hwrite_s;
+    if (mst_${master.name}_hready_s == 1'b1) begin  // the address phase ends with the current data phase
+      mst_${master.name}_hwrite_dph_r <= ${ff_dly}mst_${master.name}_hwrite_s;
+    end
+  end
+
+%   if mod.regdec:
+  // Registered Coarse Address Decoding for Master '${master.name}'
+  always_ff @(posedge main_clk_i or negedge main_rst_an_i) begin: proc_${master.name}_region
+    if (main_rst_an_i == 1'b0) begin
+      mst_${master.name}_region_r <= ${ff_dly}${rslvr._get_uint_value(0, len(decoder.regions))};
+    end else if ((mst_${master.name}_new_xfer_s == 1'b1) && (mst_${master.name}_rqstate_s == 1'b1)) begin
+      mst_${master.name}_region_r <= ${ff_dly}mst_${master.name}_region_s;
+    end
   end
 
+%   endif
 <%
   mux_cond = [f"mst_{master.name}_{slave}_gnt_r" for slave in master_slaves]
   mux_cond = ', '.join(mux_cond)
@@ -385,7 +511,7 @@ ${reqkeep.get()}
 %>\
   // Master '${master.name}' Mux
   always_comb begin: proc_${master.name}_mux
-    if (fsm_${master.name}_r == fsm_transfer_wait_st) begin
+    if (${fsm.is_state(f"fsm_{master.name}_r", "transfer_wait")}) begin
       mst_${master.name}_haddr_s  = mst_${master.name}_haddr_r;
 %   if mst_hauser == "fwd":
       mst_${master.name}_hauser_s = mst_${master.name}_hauser_r;
@@ -445,8 +571,8 @@ ${reqkeep.get()}
 
     mst_${master.name}_hready_s = ${hrdy};
 
-    case (fsm_${master.name}_r)
-      fsm_transfer_wait_st: begin
+    ${fsm.case(f"fsm_{master.name}_r")}
+      ${fsm.label(f"fsm_{master.name}_r", "transfer_wait")}: begin
         ahb_mst_${master.name}_hrdata_o = ${rslvr._get_uint_value(0, mod.datawidth)};
         ahb_mst_${master.name}_hready_o = 1'b0;
         ahb_mst_${master.name}_hresp_o  = ahb_resp_okay_e;
@@ -461,7 +587,7 @@ ${reqkeep.get()}
 %   endif
       end
 
-      fsm_error1_st: begin
+      ${fsm.label(f"fsm_{master.name}_r", "error1")}: begin
         ahb_mst_${master.name}_hrdata_o = ${rslvr._get_uint_value(0, mod.datawidth)};
         ahb_mst_${master.name}_hready_o = 1'b0;
         ahb_mst_${master.name}_hresp_o  = ahb_resp_error_e;
@@ -476,7 +602,7 @@ ${reqkeep.get()}
 %   endif
       end
 
-      fsm_error2_st: begin
+      ${fsm.label(f"fsm_{master.name}_r", "error2")}: begin
         ahb_mst_${master.name}_hrdata_o = ${rslvr._get_uint_value(0, mod.datawidth)};
         ahb_mst_${master.name}_hready_o = 1'b1;
         ahb_mst_${master.name}_hresp_o  = ahb_resp_error_e;
@@ -491,7 +617,7 @@ ${reqkeep.get()}
 %   endif
       end
 
-      fsm_error0_st, fsm_transfer_st: begin
+      ${fsm.label(f"fsm_{master.name}_r", "error0", "transfer")}: begin
 %   if num_slaves == 1:
         ahb_mst_${master.name}_hrdata_o = (mst_${master.name}_hwrite_dph_r == 1'b0) ? ahb_slv_${sole_slv}_hrdata_i : ${rslvr._get_uint_value(0, mod.datawidth)};
         ahb_mst_${master.name}_hready_o = ahb_slv_${sole_slv}_hreadyout_i;
@@ -505,14 +631,16 @@ ${reqkeep.get()}
 %     if mst_hbuser == "fwd":
         ahb_mst_${master.name}_hbuser_o = (mst_${master.name}_hwrite_dph_r == 1'b0) ? ahb_slv_${sole_slv}_hbuser_i : ${rslvr.get_default(mst_proto.busertype)};
 %     endif
+%   elif mod.onehot_mux:
+${mst_rsp_andor(master, master_slaves, rslvr, True)}\
 %   else:
         case ({${mux_cond}})
 %     for idx, slave in enumerate(reversed(master_slaves)):
 <%
-        slv_proto = mod.slaves[slave].proto
-        slv_hexok = proto_opt(slv_proto.has_exclxfers, mst_proto.has_exclxfers)  # deliberately swapped src/tgt
-        slv_hruser = proto_opt(slv_proto.rusertype is not None, mst_proto.rusertype is not None)  # deliberately swapped src/tgt
-        slv_hbuser = proto_opt(slv_proto.busertype is not None, mst_proto.busertype is not None)  # deliberately swapped src/tgt
+        pair_actions = mod.proto_compat.get_actions(master.name, slave)
+        slv_hexok = pair_actions.hexokay
+        slv_hruser = pair_actions.hruser
+        slv_hbuser = pair_actions.hbuser
 %>\
           ${num_slaves}'b${f"{1<<idx:0{num_slaves}b}"}: begin
             ahb_mst_${master.name}_hrdata_o = (mst_${master.name}_hwrite_dph_r == 1'b0) ? ahb_slv_${slave}_hrdata_i : ${rslvr._get_uint_value(0, mod.datawidth)};
@@ -548,7 +676,7 @@ ${reqkeep.get()}
 %   endif
       end
 
-      fsm_transfer_finish_st: begin
+      ${fsm.label(f"fsm_{master.name}_r", "transfer_finish")}: begin
 %   if num_slaves == 1:
         ahb_mst_${master.name}_hrdata_o = ahb_slv_${sole_slv}_hrdata_i;
         ahb_mst_${master.name}_hready_o = ahb_slv_${sole_slv}_hreadyout_i;
@@ -562,14 +690,16 @@ ${reqkeep.get()}
 %     if mst_hbuser == "fwd":
         ahb_mst_${master.name}_hbuser_o = ahb_slv_${sole_slv}_hbuser_i;
 %     endif
+%   elif mod.onehot_mux:
+${mst_rsp_andor(master, master_slaves, rslvr, False)}\
 %   else:
         case ({${mux_cond}})
 %     for idx, slave in enumerate(reversed(master_slaves)):
 <%
-        slv_proto = mod.slaves[slave].proto
-        slv_hexok = proto_opt(slv_proto.has_exclxfers, mst_proto.has_exclxfers)  # deliberately swapped src/tgt
-        slv_hruser = proto_opt(slv_proto.rusertype is not None, mst_proto.rusertype is not None)  # deliberately swapped src/tgt
-        slv_hbuser = proto_opt(slv_proto.busertype is not None, mst_proto.busertype is not None)  # deliberately swapped src/tgt
+        pair_actions = mod.proto_compat.get_actions(master.name, slave)
+        slv_hexok = pair_actions.hexokay
+        slv_hruser = pair_actions.hruser
+        slv_hbuser = pair_actions.hbuser
 %>\
           ${num_slaves}'b${f"{1<<idx:0{num_slaves}b}"}: begin
             ahb_mst_${master.name}_hrdata_o = ahb_slv_${slave}_hrdata_i;
@@ -631,6 +761,14 @@ ${reqkeep.get()}
     ahb_mst_${master.name}_hbuser_o = ${rslvr.get_default(mst_proto.busertype)};
 %   endif
   end
+%   if mod.onehot_mux and num_slaves > 1:
+
+${onehot_assert([(f"mst_{master.name}_gnt", f"{{{mux_cond}}}")])}\
+%   endif
+%   if mod.has_qos:
+
+${mst_qos(master, master_slaves, rslvr, ff_dly, fsm)}\
+%   endif
 
 % endfor
 
@@ -640,8 +778,8 @@ ${reqkeep.get()}
   // ------------------------------------------------------
 % for slave in mod.slaves:
 <%
-  slave_masters = mod._slave_masters[slave.name]
-  slave_port = mod.ports[f"ahb_slv_{slave.name}_o"]
+  slv_routing = routing.slaves[slave.name]
+  slave_masters = slv_routing.masternames
   num_masters = len(slave_masters)
   if num_masters == 1:
     sole_mst = slave_masters[0]
@@ -652,58 +790,66 @@ ${reqkeep.get()}
 %   if num_masters == 1:
 <%
   mst_proto = mod.masters[sole_mst].proto
-  slv_hprot = proto_opt(mst_proto.hprotwidth, slv_proto.hprotwidth)
-  slv_hmastlock = proto_opt(mst_proto.has_hmastlock, slv_proto.has_hmastlock)
-  slv_hmaster = proto_opt(mst_proto.hmaster_width, slv_proto.hmaster_width)
-  slv_hburst = proto_opt(mst_proto.has_hburst, slv_proto.has_hburst)
-  slv_hnonsec = proto_opt(mst_proto.has_hnonsec, slv_proto.has_hnonsec)
-  slv_hexcl = proto_opt(mst_proto.has_exclxfers, slv_proto.has_exclxfers)
-  slv_hwstrb = proto_opt(mst_proto.has_wstrb, slv_proto.has_wstrb)
-  slv_hauser = proto_opt(mst_proto.ausertype is not None, slv_proto.ausertype is not None)
-  slv_hwuser = proto_opt(mst_proto.wusertype is not None, slv_proto.wusertype is not None)
+  pair_actions = mod.proto_compat.get_actions(sole_mst, slave.name)
+  slv_hprot = pair_actions.hprot
+  slv_hmastlock = pair_actions.hmastlock
+  slv_hmaster = pair_actions.hmaster
+  slv_hburst = pair_actions.hburst
+  slv_hnonsec = pair_actions.hnonsec
+  slv_hexcl = pair_actions.hexcl
+  slv_hwstrb = pair_actions.hwstrb
+  slv_hauser = pair_actions.hauser
+  slv_hwuser = pair_actions.hwuser
+  if mod.regdec:
+    # every transfer passes the address buffer
+    aph_cond = f"(mst_{sole_mst}_{slave.name}_sel_s | (mst_{sole_mst}_{slave.name}_gnt_r & mst_{sole_mst}_cont_xfer_s))"
+    aph_src = f"mst_{sole_mst}_{{}}_s"
+  else:
+    aph_cond = f"mst_{sole_mst}_{slave.name}_sel_s"
+    aph_src = f"ahb_mst_{sole_mst}_{{}}_i"
 %>\
   // Slave '${slave.name}': no arbitration necessary
   always_comb begin: proc_${slave.name}_asgn
     slv_${slave.name}_${sole_mst}_gnt_s = mst_${sole_mst}_${slave.name}_req_s;
 
-    ahb_slv_${slave.name}_hsel_o        = ${slv_req};  // address phase signals
-    if (mst_${sole_mst}_${slave.name}_sel_s == 1'b1) begin
-      ahb_slv_${slave.name}_haddr_o     = ahb_mst_${sole_mst}_haddr_i;
+    ahb_slv_${slave.name}_hsel_o        = ${slv_req} | (mst_${sole_mst}_${slave.name}_gnt_r & mst_${sole_mst}_cont_xfer_s);  // address phase signals
+    if (${aph_cond} == 1'b1) begin
+      ahb_slv_${slave.name}_haddr_o     = ${aph_src.format("haddr")};
 %     if slv_hauser == "fwd":
-      ahb_slv_${slave.name}_hauser_o    = ahb_mst_${sole_mst}_hauser_i;
+      ahb_slv_${slave.name}_hauser_o    = ${aph_src.format("hauser")};
 %     endif
-      ahb_slv_${slave.name}_hwrite_o    = ahb_mst_${sole_mst}_hwrite_i;
+      ahb_slv_${slave.name}_hwrite_o    = ${aph_src.format("hwrite")};
 %     if slv_hburst == "fwd":
-      ahb_slv_${slave.name}_hburst_o    = ahb_mst_${sole_mst}_hburst_i;
+      ahb_slv_${slave.name}_hburst_o    = ${aph_src.format("hburst")};
 %     endif
-      ahb_slv_${slave.name}_hsize_o     = ahb_mst_${sole_mst}_hsize_i;
-      ahb_slv_${slave.name}_htrans_o    = ahb_mst_${sole_mst}_htrans_i;
+      ahb_slv_${slave.name}_hsize_o     = ${aph_src.format("hsize")};
+      ahb_slv_${slave.name}_htrans_o    = ${aph_src.format("htrans")};
 %     if slv_hprot == "fwd":
-      ahb_slv_${slave.name}_hprot_o     = ahb_mst_${sole_mst}_hprot_i;
+      ahb_slv_${slave.name}_hprot_o     = ${aph_src.format("hprot")};
 %     elif slv_hprot == "red":
-      ahb_slv_${slave.name}_hprot_o     = ahb_mst_${sole_mst}_hprot_i[3:0];
+      ahb_slv_${slave.name}_hprot_o     = ${aph_src.format("hprot")}[3:0];
 %     elif slv_hprot == "exp":
-      ahb_slv_${slave.name}_hprot_o     = ${hprot_exp(f"ahb_mst_{sole_mst}_hprot_i")};
+      ahb_slv_${slave.name}_hprot_o     = ${hprot_exp(aph_src.format("hprot"))};
 %     endif
 %     if slv_hmastlock == "fwd":
-      ahb_slv_${slave.name}_hmastlock_o = ahb_mst_${sole_mst}_hmastlock_i;
+      ahb_slv_${slave.name}_hmastlock_o = ${aph_src.format("hmastlock")};
 %     endif
 %     if slv_hmaster == "fwd":
-      ahb_slv_${slave.name}_hmaster_o   = ahb_mst_${sole_mst}_hmaster_i;
+      ahb_slv_${slave.name}_hmaster_o   = ${aph_src.format("hmaster")};
 %     elif slv_hmaster == "red":
-      ahb_slv_${slave.name}_hmaster_o   = ahb_mst_${sole_mst}_hmaster_i[${slv_proto.hmaster_width-1}:0];
+      ahb_slv_${slave.name}_hmaster_o   = ${aph_src.format("hmaster")}[${slv_proto.hmaster_width-1}:0];
 %     elif slv_hmaster == "exp":
 <%
-        enh_val = mst_index[sole_mst] if slv_proto.enh_hmaster else 0
+        enh_val = routing.masters[sole_mst].idx if slv_proto.enh_hmaster else 0
         ehn_slc = rslvr._get_uint_value(enh_val, slv_proto.hmaster_width-mst_proto.hmaster_width)
 %>\
-      ahb_slv_${slave.name}_hmaster_o   = {${ehn_slc}, ahb_mst_${sole_mst}_hmaster_i};
+      ahb_slv_${slave.name}_hmaster_o   = {${ehn_slc}, ${aph_src.format("hmaster")}};
 %     endif
 %     if slv_hnonsec == "fwd":
-      ahb_slv_${slave.name}_hnonsec_o   = ahb_mst_${sole_mst}_hnonsec_i;
+      ahb_slv_${slave.name}_hnonsec_o   = ${aph_src.format("hnonsec")};
 %     endif
 %     if slv_hexcl == "fwd":
-      ahb_slv_${slave.name}_hexcl_o     = ahb_mst_${sole_mst}_hexcl_i;
+      ahb_slv_${slave.name}_hexcl_o     = ${aph_src.format("hexcl")};
 %     endif
       ahb_slv_${slave.name}_hready_o    = mst_${sole_mst}_hready_s;
     end else begin
@@ -785,95 +931,52 @@ ${reqkeep.get()}
 
 %   else:  ## multiple masters
 <%
-  slv_gnt = [f"slv_{slave.name}_{master}_gnt_s" for master in slave_masters]
-  slv_gnt = ", ".join(slv_gnt)
-  prev_gnt = [f"slv_{slave.name}_{master}_gnt_r" for master in slave_masters]
-  prev_gnt = ", ".join(prev_gnt)
+  arbiter = mod.get_arbiter(slave.name)
+  if mod.has_qos:
+    reqs = [f"slv_{slave.name}_{master}_qreq_s" for master in slave_masters]
+  else:
+    reqs = [f"mst_{master}_{slave.name}_req_s" for master in slave_masters]
   mst_sel = [f"mst_{master}_{slave.name}_gnt_r" for master in slave_masters]
   mst_sel = ", ".join(mst_sel)
-  slv_keep = [f"mst_{master}_{slave.name}_keep_s" for master in slave_masters]
-  slv_keep = " | ".join(slv_keep)
   slv_sel = Align(rtrim=True)
   slv_sel.set_separators(first=" "*6)
 
-  mst_hprotwidth = 0
-  mst_hmasterwidth = 0
-  mst_hburst = False
-  mst_hmastlock = False
-  mst_hnonsec = False
-  mst_hexcl = False
-  mst_hwstrb = False
-  mst_hauser = False
-  mst_hwuser = False
   for master in slave_masters:
-    mst_proto = mod.masters[master].proto
-    mst_hprotwidth = max(mst_hprotwidth, mst_proto.hprotwidth)
-    mst_hmasterwidth = max(mst_hmasterwidth, mst_proto.hmaster_width)
-    mst_hburst = mst_hburst or mst_proto.has_hburst
-    mst_hmastlock = mst_hmastlock or mst_proto.has_hmastlock
-    mst_hnonsec = mst_hnonsec or mst_proto.has_hnonsec
-    mst_hexcl = mst_hexcl or mst_proto.has_exclxfers
-    mst_hwstrb = mst_hwstrb or mst_proto.has_wstrb
-    mst_hauser = mst_hauser or mst_proto.ausertype is not None
-    mst_hwuser = mst_hwuser or mst_proto.wusertype is not None
-
     slv_sel.add_row(f"slv_{slave.name}_{master}_sel_s", "=", f"slv_{slave.name}_{master}_gnt_s |")
     slv_sel.add_row("", "", f"(mst_{master}_{slave.name}_keep_s & mst_{master}_{slave.name}_gnt_r);")
   slv_mux = [f"slv_{slave.name}_{master}_sel_s" for master in slave_masters]
   slv_mux = ", ".join(slv_mux)
 
-  slv_hprot = proto_opt(mst_hprotwidth, slv_proto.hprotwidth)
-  slv_hmaster = proto_opt(mst_hmasterwidth, slv_proto.hmaster_width)
-  slv_hburst = proto_opt(mst_hburst, slv_proto.has_hburst)
-  slv_hmastlock = proto_opt(mst_hmastlock, slv_proto.has_hmastlock)
-  slv_hnonsec = proto_opt(mst_hnonsec, slv_proto.has_hnonsec)
-  slv_hexcl = proto_opt(mst_hexcl, slv_proto.has_exclxfers)
-  slv_hwstrb = proto_opt(mst_hwstrb, slv_proto.has_wstrb)
-  slv_hauser = proto_opt(mst_hauser, slv_proto.ausertype is not None)
-  slv_hwuser = proto_opt(mst_hwuser, slv_proto.wusertype is not None)
+  slv_actions = slv_routing.actions
+  slv_hprot = slv_actions.hprot
+  slv_hmaster = slv_actions.hmaster
+  slv_hburst = slv_actions.hburst
+  slv_hmastlock = slv_actions.hmastlock
+  slv_hnonsec = slv_actions.hnonsec
+  slv_hexcl = slv_actions.hexcl
+  slv_hwstrb = slv_actions.hwstrb
+  slv_hauser = slv_actions.hauser
+  slv_hwuser = slv_actions.hwuser
 %>\
-  // // Slave '${slave.name}' round-robin arbiter
-  always_comb begin: proc_${slave.name}_rr_arb
-    integer i;
-    logic found_s;
-    logic [${num_masters-1}:0] slv_req_s;
-    logic [${num_masters-1}:0] prev_grant_s;
-    logic [${num_masters-1}:0] next_grant_s;
-    logic arb_en_s;
-
-    slv_req_s = {${slv_req}};
-    prev_grant_s = {${prev_gnt}};
-    arb_en_s = ~(${slv_keep});
-
-    next_grant_s = {prev_grant_s[${num_masters-2}:0], prev_grant_s[${num_masters-1}]}; // 1st candidate is old grant rotated 1 left
-    found_s = 1'b0;
-    for (i=0; i<${num_masters}; i=i+1) begin
-      if (found_s == 1'b0) begin
-        if ((slv_req_s & next_grant_s) != ${num_masters}'d0) begin
-          found_s = 1'b1;
-        end else begin
-          next_grant_s = {next_grant_s[${num_masters-2}:0], next_grant_s[${num_masters-1}]}; // rotate 1 left
-        end
-      end
-    end
-
-    {${slv_gnt}} = slv_req_s & next_grant_s & {${num_masters}{(ahb_slv_${slave.name}_hreadyout_i & arb_en_s)}};
-  end
-
+%     if mod.has_qos:
+${slv_qos(slave.name, slave_masters)}
+%     endif
+%     if mod.is_parked(slave.name):
+${slv_park(slave.name, slave_masters, reqs)}
+%     endif
+%     if arbiter.policy == "fixed":
+${arb_fixed(slave.name, slave_masters, reqs, arbiter)}\
+%     elif arbiter.policy == "wrr":
+${arb_wrr(slave.name, slave_masters, reqs, arbiter, rslvr, ff_dly)}\
+%     elif arbiter.policy == "lrg":
+${arb_lrg(slave.name, slave_masters, reqs, arbiter, rslvr, ff_dly)}\
+%     else:
+${arb_rr(slave.name, slave_masters, reqs, ff_dly)}\
+%     endif
+%     if mod.is_bounded(slave.name):
 
-  always_ff @(posedge main_clk_i or negedge main_rst_an_i) begin: proc_${slave.name}_gnt
-    if (main_rst_an_i == 1'b0) begin
-%     for idx, master in enumerate(slave_masters):
-      slv_${slave.name}_${master}_gnt_r <= ${ff_dly}1'b${'1' if not idx else '0'};${'  // initial pseudo-grant' if not idx else ''}
-%     endfor
-    end else begin
-      if ({${slv_gnt}} != ${num_masters}'d0) begin
-%     for master in slave_masters:
-        slv_${slave.name}_${master}_gnt_r <= ${ff_dly}slv_${slave.name}_${master}_gnt_s;
-%     endfor
-      end
-    end
-  end
+${slv_hold(slave, slave_masters, rslvr, ff_dly)}\
+%     endif
 
 
   // Slave '${slave.name}' multiplexer
@@ -882,17 +985,21 @@ ${slv_sel.get()}
 
     ahb_slv_${slave.name}_hsel_o = |{${slv_mux}};
 
+%     if mod.onehot_mux:
+${slv_aph_andor(slave, slave_masters, rslvr)}\
+%     else:
     case ({${slv_mux}})  // address phase signals
 %     for idx, master in enumerate(reversed(slave_masters)):
 <%
          mst_proto = mod.masters[master].proto
-         mst_hprot = proto_opt(mst_proto.hprotwidth, slv_proto.hprotwidth)
-         mst_hmaster = proto_opt(mst_proto.hmaster_width, slv_proto.hmaster_width)
-         mst_hburst = proto_opt(mst_proto.has_hburst, slv_proto.has_hburst)
-         mst_hmastlock = proto_opt(mst_proto.has_hmastlock, slv_proto.has_hmastlock)
-         mst_hnonsec = proto_opt(mst_proto.has_hnonsec, slv_proto.has_hnonsec)
-         mst_hexcl = proto_opt(mst_proto.has_exclxfers, slv_proto.has_exclxfers)
-         mst_hauser = proto_opt(mst_proto.ausertype is not None, slv_proto.ausertype is not None)
+         pair_actions = mod.proto_compat.get_actions(master, slave.name)
+         mst_hprot = pair_actions.hprot
+         mst_hmaster = pair_actions.hmaster
+         mst_hburst = pair_actions.hburst
+         mst_hmastlock = pair_actions.hmastlock
+         mst_hnonsec = pair_actions.hnonsec
+         mst_hexcl = pair_actions.hexcl
+         mst_hauser = pair_actions.hauser
 %>\
       ${num_masters}'b${f"{1<<idx:0{num_masters}b}"}: begin
         ahb_slv_${slave.name}_haddr_o     = mst_${master}_haddr_s;
@@ -931,7 +1038,7 @@ ${slv_sel.get()}
         ahb_slv_${slave.name}_hmaster_o   = mst_${master}_hmaster_s[${slv_proto.hmaster_width-1}:0];
 %         elif mst_hmaster == "exp":
 <%
-            enh_val = mst_index[master] if slv_proto.enh_hmaster else 0
+            enh_val = routing.masters[master].idx if slv_proto.enh_hmaster else 0
             ehn_slc = rslvr._get_uint_value(enh_val, slv_proto.hmaster_width-mst_proto.hmaster_width)
 %>\
         ahb_slv_${slave.name}_hmaster_o   = {${ehn_slc}, mst_${master}_hmaster_s};
@@ -985,12 +1092,13 @@ ${slv_sel.get()}
 %     if slv_hexcl == "fwd":
         ahb_slv_${slave.name}_hexcl_o     = ${rslvr.get_default(t.AhbExclType())};
 %     endif
-%     if mst_hauser == "fwd":
+%     if slv_hauser == "fwd":
         ahb_slv_${slave.name}_hauser_o    = ${rslvr.get_default(slv_proto.ausertype)};
 %     endif
         ahb_slv_${slave.name}_hready_o    = ahb_slv_${slave.name}_hreadyout_i;
       end
     endcase
+%     endif
 
 %     if slv_hburst == "tie":
     ahb_slv_${slave.name}_hburst_o     = ahb_burst_single_e;
@@ -1014,12 +1122,15 @@ ${slv_sel.get()}
     ahb_slv_${slave.name}_hauser_o     = ${rslvr.get_default(slv_proto.ausertype)};
 %     endif
 
+%     if mod.onehot_mux:
+${slv_dph_andor(slave, slave_masters, rslvr)}\
+%     else:
     case ({${mst_sel}})  // data phase signals
 %     for idx, master in enumerate(reversed(slave_masters)):
 <%
-         mst_proto = mod.masters[master].proto
-         mst_hwstrb = proto_opt(mst_proto.has_wstrb, slv_proto.has_wstrb)
-         mst_hwuser = proto_opt(mst_proto.wusertype is not None, slv_proto.wusertype is not None)
+         pair_actions = mod.proto_compat.get_actions(master, slave.name)
+         mst_hwstrb = pair_actions.hwstrb
+         mst_hwuser = pair_actions.hwuser
 %>\
       ${num_masters}'b${f"{1<<idx:0{num_masters}b}"}: begin
         ahb_slv_${slave.name}_hwdata_o = ahb_mst_${master}_hwdata_i;
@@ -1045,11 +1156,12 @@ ${slv_sel.get()}
 %     if slv_hwstrb == "fwd":
         ahb_slv_${slave.name}_hwstrb_o = ${rslvr._get_uint_value(0, mod.datawidth // 8)};
 %     endif
-%     if mst_hwuser == "fwd":
+%     if slv_hwuser == "fwd":
         ahb_slv_${slave.name}_hwuser_o = ${rslvr.get_default(slv_proto.wusertype)};
 %     endif
       end
     endcase
+%     endif
 %    if slv_hwstrb == "tie":
 
     ahb_slv_${slave.name}_hwstrb_o = ${rslvr._get_uint_value(0, mod.datawidth // 8)};
@@ -1058,7 +1170,1686 @@ ${slv_sel.get()}
     ahb_slv_${slave.name}_hwuser_o = ${rslvr.get_default(slv_proto.wusertype)};
 %     endif
   end
+%     if mod.onehot_mux:
+
+${onehot_assert([(f"slv_{slave.name}_sel", f"{{{slv_mux}}}"), (f"slv_{slave.name}_dph", f"{{{mst_sel}}}")])}\
+%     endif
 
 %   endif
 % endfor
+% endif
+</%def>
+
+<%def name="onehot_assert(selects, indent=2)">\
+<%
+  pfx = " " * indent
+%>\
+`ifndef SYNTHESIS
+% for label, sels in selects:
+${pfx}a_${label}_onehot: assert property (@(posedge main_clk_i) disable iff (main_rst_an_i == 1'b0) $onehot0(${sels}))
+${pfx}  else $error("${label} is not one-hot");
+% endfor
+`endif
+</%def>
+
+<%def name="mst_rsp_andor(master, master_slaves, rslvr, rd)">\
+<%
+  mst_proto = master.proto
+  mst_actions = mod.routing.masters[master.name].actions
+  gnts = {slave: f"mst_{master.name}_{slave}_gnt_r" for slave in master_slaves}
+  if rd:
+    # no read data during write data phases
+    rdsels = {slave: f"({gnt} & ~mst_{master.name}_hwrite_dph_r)" for slave, gnt in gnts.items()}
+  else:
+    rdsels = gnts
+  actions = {slave: mod.proto_compat.get_actions(master.name, slave) for slave in master_slaves}
+  def terms(name, sels, action=None):
+    return [(sels[slave], f"ahb_slv_{slave}_{name}_i" if action is None or getattr(actions[slave], action) == "fwd" else None) for slave in master_slaves]
+  def dflt(type_):
+    return rslvr.get_default(type_) if type_.default else None
+%>\
+${andor(rslvr, 8, f"ahb_mst_{master.name}_hrdata_o", mod.datawidth, terms("hrdata", rdsels))}
+        ahb_mst_${master.name}_hready_o = mst_${master.name}_hready_s;
+${andor(rslvr, 8, f"ahb_mst_{master.name}_hresp_o", 1, terms("hresp", gnts))}
+% if mst_actions.hexokay not in ("ign", "tie"):
+${andor(rslvr, 8, f"ahb_mst_{master.name}_hexokay_o", 1, terms("hexokay", gnts, "hexokay"))}
+% endif
+% if mst_actions.hruser not in ("ign", "tie"):
+${andor(rslvr, 8, f"ahb_mst_{master.name}_hruser_o", mst_proto.rusertype.width, terms("hruser", rdsels, "hruser"), dflt(mst_proto.rusertype))}
+% endif
+% if mst_actions.hbuser not in ("ign", "tie"):
+${andor(rslvr, 8, f"ahb_mst_{master.name}_hbuser_o", mst_proto.busertype.width, terms("hbuser", rdsels, "hbuser"), dflt(mst_proto.busertype))}
+% endif
+</%def>
+
+<%def name="slv_aph_andor(slave, slave_masters, rslvr)">\
+<%
+  slv_proto = slave.proto
+  slv_actions = mod.routing.slaves[slave.name].actions
+  pairs = {master: mod.proto_compat.get_actions(master, slave.name) for master in slave_masters}
+  asgns = []
+  def add(name, values, idle=None):
+    width = mod.ports[f"ahb_slv_{slave.name}_{name}_o"].type_.width
+    terms = [(f"slv_{slave.name}_{master}_sel_s", value) for master, value in zip(slave_masters, values)]
+    asgns.append(andor(rslvr, 4, f"ahb_slv_{slave.name}_{name}_o", width, terms, idle))
+  def fwd(name):
+    return [f"mst_{master}_{name}_s" if getattr(pairs[master], name) == "fwd" else None for master in slave_masters]
+  def dflt(type_):
+    return rslvr.get_default(type_) if type_.default else None
+
+  add("haddr", [f"mst_{master}_haddr_s" for master in slave_masters])
+  add("hwrite", [f"mst_{master}_hwrite_s" for master in slave_masters])
+  if slv_actions.hburst == "fwd":
+    add("hburst", fwd("hburst"))
+  add("hsize", [f"mst_{master}_hsize_s" for master in slave_masters], "ahb_size_word_e")
+  add("htrans", [f"mst_{master}_htrans_s" for master in slave_masters])
+  if slv_actions.hprot not in ("ign", "tie"):
+    values = []
+    for master in slave_masters:
+      mst_hprot = pairs[master].hprot
+      if mst_hprot == "fwd":
+        values.append(f"mst_{master}_hprot_s")
+      elif mst_hprot == "red":
+        values.append(f"mst_{master}_hprot_s[3:0]")
+      elif mst_hprot == "exp":
+        values.append(hprot_exp(f"mst_{master}_hprot_s"))
+      else:
+        values.append(None)
+    add("hprot", values, dflt(slv_proto.hprottype))
+  if slv_actions.hmastlock == "fwd":
+    add("hmastlock", fwd("hmastlock"), dflt(t.AhbMastlockType()))
+  if slv_actions.hmaster not in ("ign", "tie"):
+    values = []
+    for master in slave_masters:
+      mst_hmaster = pairs[master].hmaster
+      if mst_hmaster == "fwd":
+        values.append(f"mst_{master}_hmaster_s")
+      elif mst_hmaster == "red":
+        values.append(f"mst_{master}_hmaster_s[{slv_proto.hmaster_width-1}:0]")
+      elif mst_hmaster == "exp":
+        enh_val = mod.routing.masters[master].idx if slv_proto.enh_hmaster else 0
+        ehn_slc = rslvr._get_uint_value(enh_val, slv_proto.hmaster_width-mod.masters[master].proto.hmaster_width)
+        values.append(f"{{{ehn_slc}, mst_{master}_hmaster_s}}")
+      else:
+        values.append(None)
+    add("hmaster", values, dflt(slv_proto.hmaster_type))
+  if slv_actions.hnonsec == "fwd":
+    add("hnonsec", fwd("hnonsec"), dflt(t.AhbNonsecType()))
+  if slv_actions.hexcl == "fwd":
+    add("hexcl", fwd("hexcl"), dflt(t.AhbExclType()))
+  if slv_actions.hauser == "fwd":
+    add("hauser", fwd("hauser"), dflt(slv_proto.ausertype))
+  add("hready", [f"mst_{master}_hready_s" for master in slave_masters], f"ahb_slv_{slave.name}_hreadyout_i")
+%>\
+    // address phase signals
+% for asgn in asgns:
+${asgn}
+% endfor
+</%def>
+
+<%def name="slv_dph_andor(slave, slave_masters, rslvr)">\
+<%
+  slv_proto = slave.proto
+  slv_actions = mod.routing.slaves[slave.name].actions
+  pairs = {master: mod.proto_compat.get_actions(master, slave.name) for master in slave_masters}
+  gnts = [f"mst_{master}_{slave.name}_gnt_r" for master in slave_masters]
+  def terms(name):
+    return [(gnt, f"ahb_mst_{master}_{name}_i" if getattr(pairs[master], name) == "fwd" else None) for master, gnt in zip(slave_masters, gnts)]
+%>\
+    // data phase signals
+${andor(rslvr, 4, f"ahb_slv_{slave.name}_hwdata_o", mod.datawidth, [(gnt, f"ahb_mst_{master}_hwdata_i") for master, gnt in zip(slave_masters, gnts)])}
+% if slv_actions.hwstrb == "fwd":
+${andor(rslvr, 4, f"ahb_slv_{slave.name}_hwstrb_o", mod.datawidth // 8, terms("hwstrb"))}
+% endif
+% if slv_actions.hwuser == "fwd":
+${andor(rslvr, 4, f"ahb_slv_{slave.name}_hwuser_o", slv_proto.wusertype.width, terms("hwuser"), rslvr.get_default(slv_proto.wusertype) if slv_proto.wusertype.default else None)}
+% endif
+</%def>
+
+<%def name="mst_qos(master, slavenames, rslvr, ff_dly, fsm)">\
+<%
+  name = master.name
+  aging = mod.aging
+  lw = mod.qoswidth - bool(aging)
+  level = rslvr._get_uint_value(master.qos, lw) if lw else ""
+  qos_slice = master.qos_slice
+  if qos_slice:
+    src = f"ahb_mst_{name}_{master.qos_signal}_i[{qos_slice}]"
+    rtqos = fit(rslvr, "rtqos_s", qos_slice.width, lw)
+    level = f"({rtqos} > {level}) ? {rtqos} : {level}" if master.qos else rtqos
+  if aging:
+    aged = f"(mst_{name}_wait_r == {rslvr._get_uint_value(aging, aging.bit_length())})"
+    level = f"{{{aged}, {level}}}" if lw else aged
+  reqs = " | ".join(f"mst_{name}_{slavename}_req_s" for slavename in slavenames)
+%>\
+  // Master '${name}' QoS Level${", promoted after waiting " + str(aging) + " cycles" if aging else ""}
+% if not qos_slice and not aging:
+  assign mst_${name}_qos_s = ${level};
+% else:
+  always_comb begin: proc_${name}_qos
+%   if qos_slice:
+    logic [${qos_slice.width-1}:0] rtqos_s;
+
+    rtqos_s = (${fsm.is_state(f"fsm_{name}_r", "transfer_wait")}) ? mst_${name}_rtqos_r : ${src};
+%   endif
+    mst_${name}_qos_s = ${level};
+  end
+
+  always_ff @(posedge main_clk_i or negedge main_rst_an_i) begin: proc_${name}_qos_reg
+    if (main_rst_an_i == 1'b0) begin
+%   if qos_slice:
+      mst_${name}_rtqos_r <= ${ff_dly}${rslvr._get_uint_value(0, qos_slice.width)};
+%   endif
+%   if aging:
+      mst_${name}_wait_r <= ${ff_dly}${rslvr._get_uint_value(0, aging.bit_length())};
+%   endif
+    end else begin
+%   if qos_slice:
+      if ((mst_${name}_new_xfer_s == 1'b1) && (mst_${name}_gnt_s == 1'b0) && (mst_${name}_rqstate_s == 1'b1)) begin
+        mst_${name}_rtqos_r <= ${ff_dly}${src};
+      end
+%   endif
+%   if aging:
+      if (((${reqs}) & ~mst_${name}_gnt_s) == 1'b1) begin
+        if (mst_${name}_wait_r != ${rslvr._get_uint_value(aging, aging.bit_length())}) begin
+          mst_${name}_wait_r <= ${ff_dly}mst_${name}_wait_r + 1'b1;
+        end
+      end else begin
+        mst_${name}_wait_r <= ${ff_dly}${rslvr._get_uint_value(0, aging.bit_length())};
+      end
+%   endif
+    end
+  end
+% endif
+</%def>\
+<%def name="slv_qos(slavename, masters)">\
+<%
+  qreqs = Align(rtrim=True)
+  qreqs.set_separators(first=" "*4)
+  for master in masters:
+    terms = [f"mst_{master}_{slavename}_req_s"]
+    for other in masters:
+      if other != master:
+        terms.append(f"(~mst_{other}_{slavename}_req_s | (mst_{master}_qos_s >= mst_{other}_qos_s))")
+    qreqs.add_row(f"slv_{slavename}_{master}_qreq_s", "=", " & ".join(terms) + ";")
+%>\
+  // Slave '${slavename}' QoS filter: requests below the highest requesting QoS level are masked
+  always_comb begin: proc_${slavename}_qos
+${qreqs.get()}
+  end
+
+</%def>\
+<%def name="slv_park(slavename, masters, reqs)">\
+<%
+  n = len(masters)
+  parked = mod.get_park_masters(slavename)
+  dphs = [f"mst_{master}_{slavename}_gnt_r" for master in masters]
+  pos = [masters.index(master) for master in parked]
+  if len(pos) == 1:
+    own = f"({reqs[pos[0]]} & {dphs[pos[0]]})"
+    title = f"Slave '{slavename}' parking on '{parked[0]}'"
+  else:
+    own = f"(|({{{', '.join(reqs[p] for p in pos)}}} & {{{', '.join(dphs[p] for p in pos)}}}))"
+    title = f"Slave '{slavename}' parking"
+  others = f"(|({{{', '.join(reqs)}}} & ~{{{', '.join(dphs)}}}))"
+%>\
+  // ${title}: re-grant the master of the current data phase without waiting for HREADYOUT, if it is the only requesting master
+  assign slv_${slavename}_park_s = ${own} & ~${others};
+
+</%def>\
+<%def name="slv_hold(slave, masters, rslvr, ff_dly)">\
+<%
+  name = slave.name
+  n = len(masters)
+  limit = slave.hold_limit
+  hw = limit.bit_length()
+  conds = []
+  if limit:
+    conds.append(f"(slv_{name}_hold_r == {rslvr._get_uint_value(limit, hw)})")
+  yields = [f"(mst_{master}_{name}_gnt_r & mst_{master}_yield_i)" for master in masters if mod.masters[master].burst_yield]
+  conds.extend(yields)
+  cond = " | ".join(conds)
+  if len(conds) > 1:
+    cond = f"({cond})"
+  reqs = ", ".join(f"mst_{master}_{name}_req_s" for master in masters)
+  gnts = ", ".join(f"slv_{name}_{master}_gnt_s" for master in masters)
+  keeps = " | ".join(f"mst_{master}_{name}_keep_s" for master in masters)
+  if slave.max_beats:
+    title = f"after {limit} beats"
+  elif limit:
+    title = f"after {limit} cycles"
+  else:
+    title = ""
+  if yields:
+    title = f"{title} or on yield" if title else "on yield"
+%>\
+  // Slave '${name}' grant hold: break undefined-length bursts ${title}, if other masters wait
+  assign slv_${name}_brk_s = ahb_slv_${name}_hreadyout_i & slv_${name}_contend_r & ${cond};
+
+  always_ff @(posedge main_clk_i or negedge main_rst_an_i) begin: proc_${name}_hold
+    if (main_rst_an_i == 1'b0) begin
+% if limit:
+      slv_${name}_hold_r <= ${ff_dly}${rslvr._get_uint_value(0, hw)};
+% endif
+      slv_${name}_contend_r <= ${ff_dly}1'b0;
+    end else begin
+      slv_${name}_contend_r <= ${ff_dly}|({${reqs}} & ~{${gnts}});
+% if limit:
+      if ({${gnts}} != ${n}'d0) begin
+        slv_${name}_hold_r <= ${ff_dly}${rslvr._get_uint_value(1, hw)};
+%   if slave.max_beats:
+      end else if (((${keeps}) == 1'b1) && (ahb_slv_${name}_hreadyout_i == 1'b1) &&
+                   (ahb_slv_${name}_htrans_o == ahb_trans_seq_e) && (slv_${name}_hold_r != ${rslvr._get_uint_value(limit, hw)})) begin
+%   else:
+      end else if (((${keeps}) == 1'b1) && (slv_${name}_hold_r != ${rslvr._get_uint_value(limit, hw)})) begin
+%   endif
+        slv_${name}_hold_r <= ${ff_dly}slv_${name}_hold_r + 1'b1;
+      end
+% endif
+    end
+  end
+</%def>\
+<%def name="arb_fixed(slavename, masters, reqs, arbiter)">\
+<%
+  order = sorted(range(len(masters)), key=lambda pos: -arbiter.weights[pos])
+  slv_keep = " | ".join(f"mst_{master}_{slavename}_keep_s" for master in masters)
+%>\
+  // Slave '${slavename}' fixed-priority arbiter
+  always_comb begin: proc_${slavename}_fixed_arb
+    logic arb_en_s;
+
+    arb_en_s = ${slv_ready(mod, slavename)} & ~(${slv_keep});
+
+%     for master in masters:
+    slv_${slavename}_${master}_gnt_s = 1'b0;
+%     endfor
+    if (arb_en_s == 1'b1) begin
+%     for idx, pos in enumerate(order):
+      ${"end else if" if idx else "if"} (${reqs[pos]} == 1'b1) begin  // weight ${arbiter.weights[pos]}
+        slv_${slavename}_${masters[pos]}_gnt_s = 1'b1;
+%     endfor
+      end
+    end
+  end
+</%def>\
+<%def name="arb_rr(slavename, masters, reqs, ff_dly)">\
+<%
+  n = len(masters)
+  slv_req = ", ".join(reqs)
+  slv_gnt = ", ".join(f"slv_{slavename}_{master}_gnt_s" for master in masters)
+  prev_gnt = ", ".join(f"slv_{slavename}_{master}_gnt_r" for master in masters)
+  slv_keep = " | ".join(f"mst_{master}_{slavename}_keep_s" for master in masters)
+%>\
+% if mod.rr_style == "prefix":
+  // // Slave '${slavename}' round-robin arbiter: parallel-prefix priority encoder
+  always_comb begin: proc_${slavename}_rr_arb
+    logic [${n-1}:0] slv_req_s;
+    logic [${n-1}:0] prev_grant_s;
+    logic [${n-1}:0] prev_above_s;
+    logic [${n-1}:0] mask_req_s;
+    logic [${n-1}:0] mask_pre_s;
+    logic [${n-1}:0] req_pre_s;
+    logic [${n-1}:0] next_grant_s;
+    logic arb_en_s;
+
+    slv_req_s = {${slv_req}};
+    prev_grant_s = {${prev_gnt}};
+    arb_en_s = ~(${slv_keep});
+
+    // thermometer mask: candidates above the old grant come first
+${prefix_or(4, "prev_above_s", "prev_grant_s", n)}
+    mask_req_s = slv_req_s & prev_above_s;
+
+    // lowest requesting candidate above the old grant, otherwise lowest requesting candidate
+${prefix_or(4, "mask_pre_s", "mask_req_s", n)}
+${prefix_or(4, "req_pre_s", "slv_req_s", n)}
+    next_grant_s = (mask_req_s != ${n}'d0) ? (mask_req_s & ~mask_pre_s) : (slv_req_s & ~req_pre_s);
+
+    {${slv_gnt}} = slv_req_s & next_grant_s & {${n}{(${slv_ready(mod, slavename)} & arb_en_s)}};
+  end
+% else:
+  // // Slave '${slavename}' round-robin arbiter
+  always_comb begin: proc_${slavename}_rr_arb
+    integer i;
+    logic found_s;
+    logic [${n-1}:0] slv_req_s;
+    logic [${n-1}:0] prev_grant_s;
+    logic [${n-1}:0] next_grant_s;
+    logic arb_en_s;
+
+    slv_req_s = {${slv_req}};
+    prev_grant_s = {${prev_gnt}};
+    arb_en_s = ~(${slv_keep});
+
+    next_grant_s = {prev_grant_s[${n-2}:0], prev_grant_s[${n-1}]}; // 1st candidate is old grant rotated 1 left
+    found_s = 1'b0;
+    for (i=0; i<${n}; i=i+1) begin
+      if (found_s == 1'b0) begin
+        if ((slv_req_s & next_grant_s) != ${n}'d0) begin
+          found_s = 1'b1;
+        end else begin
+          next_grant_s = {next_grant_s[${n-2}:0], next_grant_s[${n-1}]}; // rotate 1 left
+        end
+      end
+    end
+
+    {${slv_gnt}} = slv_req_s & next_grant_s & {${n}{(${slv_ready(mod, slavename)} & arb_en_s)}};
+  end
+% endif
+
+
+  always_ff @(posedge main_clk_i or negedge main_rst_an_i) begin: proc_${slavename}_gnt
+    if (main_rst_an_i == 1'b0) begin
+%     for idx, master in enumerate(masters):
+      slv_${slavename}_${master}_gnt_r <= ${ff_dly}1'b${'1' if not idx else '0'};${'  // initial pseudo-grant' if not idx else ''}
+%     endfor
+    end else begin
+      if ({${slv_gnt}} != ${n}'d0) begin
+%     for master in masters:
+        slv_${slavename}_${master}_gnt_r <= ${ff_dly}slv_${slavename}_${master}_gnt_s;
+%     endfor
+      end
+    end
+  end
+</%def>\
+<%def name="arb_wrr(slavename, masters, reqs, arbiter, rslvr, ff_dly)">\
+<%
+  n = len(masters)
+  cw = arbiter.creditwidth
+  slv_req = ", ".join(reqs)
+  slv_gnt = ", ".join(f"slv_{slavename}_{master}_gnt_s" for master in masters)
+  prev_gnt = ", ".join(f"slv_{slavename}_{master}_gnt_r" for master in masters)
+  slv_keep = " | ".join(f"mst_{master}_{slavename}_keep_s" for master in masters)
+%>\
+  // Slave '${slavename}' weighted round-robin arbiter
+  always_comb begin: proc_${slavename}_wrr_arb
+    integer i;
+    logic found_s;
+    logic [${n-1}:0] slv_req_s;
+    logic [${n-1}:0] prev_grant_s;
+    logic [${n-1}:0] next_grant_s;
+    logic arb_en_s;
+
+    slv_req_s = {${slv_req}};
+    prev_grant_s = {${prev_gnt}};
+    arb_en_s = ~(${slv_keep});
+
+    next_grant_s = {prev_grant_s[${n-2}:0], prev_grant_s[${n-1}]}; // 1st candidate is old grant rotated 1 left
+    found_s = 1'b0;
+    for (i=0; i<${n}; i=i+1) begin
+      if (found_s == 1'b0) begin
+        if ((slv_req_s & next_grant_s) != ${n}'d0) begin
+          found_s = 1'b1;
+        end else begin
+          next_grant_s = {next_grant_s[${n-2}:0], next_grant_s[${n-1}]}; // rotate 1 left
+        end
+      end
+    end
+    if (((slv_req_s & prev_grant_s) != ${n}'d0) && (slv_${slavename}_credit_r != ${rslvr._get_uint_value(0, cw)})) begin
+      next_grant_s = prev_grant_s; // old grant has consecutive grants left
+    end
+
+    {${slv_gnt}} = slv_req_s & next_grant_s & {${n}{(${slv_ready(mod, slavename)} & arb_en_s)}};
+  end
+
+
+  always_ff @(posedge main_clk_i or negedge main_rst_an_i) begin: proc_${slavename}_gnt
+    if (main_rst_an_i == 1'b0) begin
+%     for idx, master in enumerate(masters):
+      slv_${slavename}_${master}_gnt_r <= ${ff_dly}1'b${'1' if not idx else '0'};${'  // initial pseudo-grant' if not idx else ''}
+%     endfor
+      slv_${slavename}_credit_r <= ${ff_dly}${rslvr._get_uint_value(0, cw)};
+    end else begin
+%     if mod.is_parked(slavename):
+      if (({${slv_gnt}} != ${n}'d0) && (ahb_slv_${slavename}_hreadyout_i == 1'b1)) begin  // parked re-grants repeat during wait states
+%     else:
+      if ({${slv_gnt}} != ${n}'d0) begin
+%     endif
+%     for master in masters:
+        slv_${slavename}_${master}_gnt_r <= ${ff_dly}slv_${slavename}_${master}_gnt_s;
+%     endfor
+        if ((({${slv_gnt}} & {${prev_gnt}}) != ${n}'d0) && (slv_${slavename}_credit_r != ${rslvr._get_uint_value(0, cw)})) begin
+          slv_${slavename}_credit_r <= ${ff_dly}slv_${slavename}_credit_r - 1'b1;
+        end else begin
+          case ({${slv_gnt}})
+%     for idx, master in enumerate(reversed(masters)):
+            ${n}'b${f"{1<<idx:0{n}b}"}: begin
+              slv_${slavename}_credit_r <= ${ff_dly}${rslvr._get_uint_value(arbiter.weights[n-1-idx]-1, cw)}; // ${master}
+            end
+%     endfor
+            default: begin
+              slv_${slavename}_credit_r <= ${ff_dly}${rslvr._get_uint_value(0, cw)};
+            end
+          endcase
+        end
+      end
+    end
+  end
+</%def>\
+<%def name="arb_lrg(slavename, masters, reqs, arbiter, rslvr, ff_dly)">\
+<%
+  n = len(masters)
+  slv_keep = " | ".join(f"mst_{master}_{slavename}_keep_s" for master in masters)
+  lrg = f"slv_{slavename}_lrg_r"
+  gnts = Align(rtrim=True)
+  gnts.set_separators(first=" "*4)
+  for pos, master in enumerate(masters):
+    terms = ["arb_en_s", reqs[pos]]
+    for other in range(n):
+      if other != pos:
+        older = f"{lrg}[{pos*n+other}]" if pos < other else f"~{lrg}[{other*n+pos}]"
+        terms.append(f"(~{reqs[other]} | {older})")
+    gnts.add_row(f"slv_{slavename}_{master}_gnt_s", "=", " & ".join(terms) + ";")
+  updates = Align(rtrim=True)
+  updates.set_separators(first=" "*6)
+  for pos, master in enumerate(masters):
+    for other, othermaster in enumerate(masters[pos+1:], pos+1):
+      idx = pos*n+other
+      updates.add_row(f"{lrg}[{idx}]", "<=", f"{ff_dly}({lrg}[{idx}] & ~slv_{slavename}_{master}_gnt_s) | slv_{slavename}_{othermaster}_gnt_s;", f"// {master} before {othermaster}")
+  init = sum(1 << (pos*n+other) for pos in range(n) for other in range(pos+1, n))
+%>\
+  // Slave '${slavename}' least-recently-granted arbiter
+  always_comb begin: proc_${slavename}_lrg_arb
+    logic arb_en_s;
+
+    arb_en_s = ${slv_ready(mod, slavename)} & ~(${slv_keep});
+
+${gnts.get()}
+  end
+
+
+  always_ff @(posedge main_clk_i or negedge main_rst_an_i) begin: proc_${slavename}_lrg
+    if (main_rst_an_i == 1'b0) begin
+      ${lrg} <= ${ff_dly}${rslvr._get_uint_value(init, n*n)};  // initial order of masters
+    end else begin
+${updates.get()}
+    end
+  end
+</%def>\
+
+<%def name="array_logic(rslvr, decoders, ff_dly, fsm)">\
+<%
+  routing = mod.routing
+  layout = mod.array_layout
+  masters = list(mod.masters)
+  slaves = list(mod.slaves)
+  nm = len(masters)
+  ns = len(slaves)
+  iw = layout.idxwidth
+  sw = max(1, (ns - 1).bit_length())
+  aph = layout.mst_aph
+  dph = layout.mst_dph
+  rsp = layout.slv_rsp
+  hmw = aph["hmaster"].width if "hmaster" in aph else 0
+  has_arb = any(len(slv_routing.masternames) > 1 for slv_routing in routing.slaves.values())
+  has_enh = bool(hmw) and any(slave.proto.enh_hmaster for slave in slaves)
+
+  # connectivity
+  params = Align(rtrim=True)
+  params.set_separators(first="  ")
+  def add_param(name, width, value, comment):
+    params.add_row("localparam", f"logic [{width-1}:0]", name, f"= {rslvr._get_uint_value(value, width)};", f"// {comment}")
+  mst_slvmask = [routing.masters[master.name].slavemask for master in masters]
+  add_param("mst_slvmask", nm*ns, pack(mst_slvmask, ns), f"bit `m*{ns}+s`: master `m` accesses slave `s`")
+  add_param("mst_sole", nm, pack([slvmask.bit_count() == 1 for slvmask in mst_slvmask], 1), "bit `m`: master `m` accesses one slave only")
+  slv_multi = [len(routing.slaves[slave.name].masternames) > 1 for slave in slaves]
+  add_param("slv_multi", ns, pack(slv_multi, 1), "bit `s`: slave `s` is accessed by multiple masters")
+  mst_idxs = [[routing.masters[name].idx for name in routing.slaves[slave.name].masternames] for slave in slaves]
+  add_param("slv_posmask", ns*nm, pack([(1 << len(idxs)) - 1 for idxs in mst_idxs], nm), f"bit `s*{nm}+p`: slave `s` has a `p`-th master")
+  add_param("slv_mstidx", ns*nm*iw, pack([idx for idxs in mst_idxs for idx in idxs + [0] * (nm - len(idxs))], iw), f"bits `(s*{nm}+p)*{iw}`: index of the `p`-th master of slave `s`")
+  arbiters = {slave.name: mod.get_arbiter(slave.name) for slave, multi in zip(slaves, slv_multi) if multi}
+  policies = [policy for policy in ARBITRATIONS if any(arbiter.policy == policy for arbiter in arbiters.values())]
+  if len(policies) > 1:
+    codes = [ARBITRATIONS.index(arbiters[slave.name].policy) if slave.name in arbiters else 0 for slave in slaves]
+    add_param("slv_arb", ns*2, pack(codes, 2), "bits `s*2`: arbitration policy of slave `s` - " + ", ".join(f"{idx}: {policy}" for idx, policy in enumerate(ARBITRATIONS)))
+  ww = layout.weightwidth
+  if ww:
+    weights = []
+    for slave in slaves:
+      slv_weights = list(arbiters[slave.name].weights) if slave.name in arbiters else []
+      weights.extend(slv_weights + [0] * (nm - len(slv_weights)))
+    add_param("slv_weight", ns*nm*ww, pack(weights, ww), f"bits `(s*{nm}+p)*{ww}`: arbitration weight of the `p`-th master of slave `s`")
+  aging = mod.aging
+  aw = aging.bit_length()
+  lw = mod.qoswidth - bool(aging)
+  rtw = layout.rtqoswidth
+  if lw:
+    add_param("mst_qos", nm*lw, pack([master.qos for master in masters], lw), f"bits `m*{lw}`: static QoS level of master `m`")
+  bounded = [mod.is_bounded(slave.name) for slave in slaves]
+  has_hold = any(bounded)
+  hw = layout.holdwidth
+  has_cycles = any(slave.max_cycles for slave, bnd in zip(slaves, bounded) if bnd)
+  has_beats = any(slave.max_beats for slave, bnd in zip(slaves, bounded) if bnd)
+  if has_hold:
+    add_param("slv_bounded", ns, pack(bounded, 1), "bit `s`: slave `s` breaks undefined-length bursts if other masters wait")
+  if hw:
+    add_param("slv_hold_max", ns*hw, pack([slave.hold_limit if bnd else 0 for slave, bnd in zip(slaves, bounded)], hw), f"bits `s*{hw}`: grant hold limit of slave `s`, `0` without limit")
+  if has_cycles and has_beats:
+    add_param("slv_hold_cycles", ns, pack([bool(slave.max_cycles) for slave in slaves], 1), "bit `s`: grant hold limit of slave `s` in clock cycles instead of beats")
+  has_park = mod.has_parking
+  if has_park:
+    parkmask = []
+    for slave in slaves:
+      masternames = routing.slaves[slave.name].masternames
+      parked = mod.get_park_masters(slave.name)
+      parkmask.append(pack([name in parked for name in masternames], 1))
+    add_param("slv_parkmask", ns*nm, pack(parkmask, nm), f"bit `s*{nm}+p`: the `p`-th master of slave `s` is parked")
+  ready = "(ahb_slv_hreadyout_s[s] | slv_park_s[s])" if has_park else "ahb_slv_hreadyout_s[s]"
+  mst_slvpos = [[0] * ns for _ in masters]
+  for slvidx, idxs in enumerate(mst_idxs):
+    for pos, mstidx in enumerate(idxs):
+      mst_slvpos[mstidx][slvidx] = pos
+  add_param("mst_slvpos", nm*ns*iw, pack([pos for poss in mst_slvpos for pos in poss], iw), f"bits `(m*{ns}+s)*{iw}`: position of master `m` at slave `s`")
+  def add_user_params(name, attr, src, tgt):
+    if name not in (aph | dph | rsp):
+      return
+    width = (aph | dph | rsp)[name].width
+    srcs = {"mst": ("m", "master", masters), "slv": ("s", "slave", slaves)}
+    idx, title, items = srcs[src]
+    add_param(f"{src}_{name}_has", len(items), pack([bool(getattr(item.proto, attr)) for item in items], 1), f"bit `{idx}`: {title} `{idx}` has {name}")
+    idx, title, items = srcs[tgt]
+    types = [getattr(item.proto, attr) for item in items]
+    add_param(f"{tgt}_{name}_dflt", len(items) * width, pack([type_.default if type_ else 0 for type_ in types], width), f"bits `{idx}*{width}`: {name} default of {title} `{idx}`")
+  add_user_params("hauser", "ausertype", "mst", "slv")
+  add_user_params("hwuser", "wusertype", "mst", "slv")
+  add_user_params("hruser", "rusertype", "slv", "mst")
+  add_user_params("hbuser", "busertype", "slv", "mst")
+  if has_enh:
+    enh = []
+    for slave, idxs in zip(slaves, mst_idxs):
+      for idx in idxs + [None] * (nm - len(idxs)):
+        width = masters[idx].proto.hmaster_width if idx is not None else 0
+        enh.append((idx << width) & ((1 << hmw) - 1) if slave.proto.enh_hmaster and 0 < width < hmw else 0)
+    add_param("slv_hmaster_enh", ns*nm*hmw, pack(enh, hmw), f"bits `(s*{nm}+p)*{hmw}`: hmaster expansion by the index of the `p`-th master of slave `s`")
+
+  # port packing
+  packing = Align(rtrim=True)
+  packing.set_separators(first="    ")
+  def add_mst_field(mstidx, master, name, type_):
+    proto = master.proto
+    port = f"ahb_mst_{master.name}_{name}_i"
+    if name in ("htrans", "haddr", "hwrite", "hsize", "hwdata"):
+      value = port
+    elif name in ("hburst", "hnonsec", "hmastlock", "hexcl", "hwstrb"):
+      flag = {"hburst": "has_hburst", "hexcl": "has_exclxfers", "hwstrb": "has_wstrb"}.get(name, f"has_{name}")
+      value = port if getattr(proto, flag) else rslvr.get_default(type_)
+    elif name == "hprot":
+      if not proto.hprotwidth:
+        value = rslvr.get_default(type_)
+      elif proto.hprotwidth < type_.width:
+        value = hprot_exp(port)
+      else:
+        value = fit(rslvr, port, proto.hprotwidth, type_.width)
+    elif name == "hmaster":
+      value = fit(rslvr, port, proto.hmaster_width, type_.width) if proto.hmaster_width else rslvr.get_default(type_)
+    else:
+      usertype = getattr(proto, name.replace("h", "", 1).replace("user", "usertype"))
+      value = fit(rslvr, port, usertype.width, type_.width) if usertype else rslvr._get_uint_value(0, type_.width)
+    packing.add_row(f"ahb_mst_{name}_s[{mstidx}]", "=", f"{value};")
+  for mstidx, master in enumerate(masters):
+    for name, type_ in (aph | dph).items():
+      add_mst_field(mstidx, master, name, type_)
+  if rtw:
+    for mstidx, master in enumerate(masters):
+      if master.qos_slice:
+        value = fit(rslvr, f"ahb_mst_{master.name}_{master.qos_signal}_i[{master.qos_slice}]", master.qos_slice.width, rtw)
+      else:
+        value = rslvr._get_uint_value(0, rtw)
+      packing.add_row(f"mst_rtqos_s[{mstidx}]", "=", f"{value};")
+  if has_hold:
+    for mstidx, master in enumerate(masters):
+      if any(mod.is_bounded(slavename) for slavename in routing.masters[master.name].slavenames):
+        # legal break point: SEQ beat of an unlocked undefined-length burst
+        brkpt = [f"(ahb_mst_{master.name}_htrans_i == ahb_trans_seq_e)"]
+        if master.proto.has_hburst:
+          brkpt.append(f"(ahb_mst_{master.name}_hburst_i == ahb_burst_incr_e)")
+        if master.proto.has_hmastlock:
+          brkpt.append(f"(ahb_mst_{master.name}_hmastlock_i == 1'b0)")
+        value = f"({' && '.join(brkpt)}) ? 1'b1 : 1'b0" if len(brkpt) > 1 else f"{brkpt[0]} ? 1'b1 : 1'b0"
+      else:
+        value = "1'b0"
+      packing.add_row(f"mst_brkpt_s[{mstidx}]", "=", f"{value};")
+    for mstidx, master in enumerate(masters):
+      value = f"mst_{master.name}_yield_i" if master.burst_yield else "1'b0"
+      packing.add_row(f"mst_yield_s[{mstidx}]", "=", f"{value};")
+  for slvidx, slave in enumerate(slaves):
+    proto = slave.proto
+    packing.add_row(f"ahb_slv_hreadyout_s[{slvidx}]", "=", f"ahb_slv_{slave.name}_hreadyout_i;")
+    for name, type_ in rsp.items():
+      port = f"ahb_slv_{slave.name}_{name}_i"
+      if name in ("hresp", "hrdata"):
+        value = port
+      elif name == "hexokay":
+        value = port if proto.has_exclxfers else "ahb_hexok_error_e"
+      else:
+        usertype = getattr(proto, name.replace("h", "", 1).replace("user", "usertype"))
+        value = fit(rslvr, port, usertype.width, type_.width) if usertype else rslvr._get_uint_value(0, type_.width)
+      packing.add_row(f"ahb_slv_{name}_s[{slvidx}]", "=", f"{value};")
+
+  # port unpacking
+  unpacking = Align(rtrim=True)
+  unpacking.set_separators(first="    ")
+  for mstidx, master in enumerate(masters):
+    for subt in t.AhbMstType(proto=master.proto, addrwidth=mod.addrwidth, datawidth=mod.datawidth).values():
+      if subt.orientation == u.BWD:
+        unpacking.add_row(f"ahb_mst_{master.name}_{subt.name}_o", "=", f"{fit(rslvr, f'ahb_mst_{subt.name}_s[{mstidx}]', (rsp | {'hready': subt.type_})[subt.name].width, subt.type_.width)};")
+  for slvidx, slave in enumerate(slaves):
+    for subt in t.AhbSlvType(proto=slave.proto, addrwidth=mod.addrwidth, datawidth=mod.datawidth).values():
+      if subt.orientation == u.FWD:
+        width = (aph | dph).get(subt.name, subt.type_).width
+        unpacking.add_row(f"ahb_slv_{slave.name}_{subt.name}_o", "=", f"{fit(rslvr, f'ahb_slv_{subt.name}_s[{slvidx}]', width, subt.type_.width)};")
+%>\
+
+  // ------------------------------------------------------
+  // Connectivity:
+  //   masters `m` and slaves `s` are indexed in order of creation,
+  //   position `p` is the index of a master within the masters of a slave.
+  // ------------------------------------------------------
+${params.get()}
+
+
+  // ------------------------------------------------------
+  // Ports:
+  // ------------------------------------------------------
+  always_comb begin: proc_pack
+${packing.get()}
+  end
+
+  always_comb begin: proc_unpack
+${unpacking.get()}
+  end
+
+
+  // ------------------------------------------------------
+  // The Masters:
+  // ------------------------------------------------------
+% for mstidx, master in enumerate(masters):
+<%
+  mst_routing = routing.masters[master.name]
+  decoder = decoders[master.name]
+  slvidxs = {slave.name: slvidx for slvidx, slave in enumerate(slaves)}
+  dec_stmts = {slavename: [f"mst_sel_s[{mstidx}][{slvidxs[slavename]}] = 1'b1;"] for slavename in mst_routing.slavenames}
+  nr = len(decoder.regions)
+%>\
+  // Master '${master.name}' Address Decoding
+  always_comb begin: proc_${master.name}_dec
+    mst_addr_err_s[${mstidx}] = 1'b0;
+% if mod.regdec:
+    mst_fine_err_s[${mstidx}] = 1'b0;
+    mst_${master.name}_region_s = ${rslvr._get_uint_value(0, nr)};
+% endif
+    mst_sel_s[${mstidx}] = ${rslvr._get_uint_value(0, ns)};
+
+% if mod.regdec:
+${decoder.get_coarse_code(f"ahb_mst_{master.name}_haddr_i", [[f"mst_{master.name}_region_s[{idx}] = 1'b1;"] for idx in range(nr)], [f"mst_addr_err_s[{mstidx}] = mst_new_xfer_s[{mstidx}];"])}
+
+    // Fine Decoding of the Buffered Address within the Registered Region
+    if (${fsm.is_state(f"fsm_r[{mstidx}]", "transfer_wait")}) begin
+${decoder.get_fine_code(f"mst_haddr_r[{mstidx}]", [f"mst_{master.name}_region_r[{idx}] == 1'b1" for idx in range(nr)], dec_stmts, [f"mst_fine_err_s[{mstidx}] = 1'b1;"], indent=6)}
+    end
+  end
+
+  // Registered Coarse Address Decoding for Master '${master.name}'
+  always_ff @(posedge main_clk_i or negedge main_rst_an_i) begin: proc_${master.name}_region
+    if (main_rst_an_i == 1'b0) begin
+      mst_${master.name}_region_r <= ${ff_dly}${rslvr._get_uint_value(0, nr)};
+    end else if ((mst_new_xfer_s[${mstidx}] == 1'b1) && (mst_rqstate_s[${mstidx}] == 1'b1)) begin
+      mst_${master.name}_region_r <= ${ff_dly}mst_${master.name}_region_s;
+    end
+  end
+% elif decoder.regions:
+${decoder.get_code(f"ahb_mst_{master.name}_haddr_i", dec_stmts, [f"mst_addr_err_s[{mstidx}] = mst_new_xfer_s[{mstidx}];"])}
+  end
+% else:
+    casez (${decoder.get_addr(f"ahb_mst_{master.name}_haddr_i")})
+%   for slavename in mst_routing.slavenames:
+      ${decoder.get_casez(slavename)}: begin // ${slavename}
+        mst_sel_s[${mstidx}][${slvidxs[slavename]}] = 1'b1;
+      end
+
+%   endfor
+      default: begin
+        mst_addr_err_s[${mstidx}] = mst_new_xfer_s[${mstidx}];
+      end
+    endcase
+  end
+% endif
+
+% endfor
+  for (genvar m = 0; m < ${nm}; m++) begin: g_mst
+
+    always_comb begin: proc_logic
+% if has_hold:
+      integer s;
+      logic brk_s;
+
+      brk_s = 1'b0;
+      for (s = 0; s < ${ns}; s = s + 1) begin
+        brk_s = brk_s | (mst_gnt_r[m][s] & slv_brk_s[s]);
+      end
+      mst_brk_s[m]       = mst_brkpt_s[m] & brk_s;
+      mst_new_xfer_s[m]  = ((ahb_mst_htrans_s[m] == ahb_trans_nonseq_e) || (mst_brk_s[m] == 1'b1)) ? 1'b1 : 1'b0;
+      mst_cont_xfer_s[m] = (((ahb_mst_htrans_s[m] == ahb_trans_busy_e) ||
+                             (ahb_mst_htrans_s[m] == ahb_trans_seq_e)) &&
+                            (mst_brk_s[m] == 1'b0)) ? 1'b1 : 1'b0;
+% else:
+      mst_new_xfer_s[m]  = (ahb_mst_htrans_s[m] == ahb_trans_nonseq_e) ? 1'b1 : 1'b0;
+      mst_cont_xfer_s[m] = ((ahb_mst_htrans_s[m] == ahb_trans_busy_e) ||
+                            (ahb_mst_htrans_s[m] == ahb_trans_seq_e)) ? 1'b1 : 1'b0;
+% endif
+      mst_rqstate_s[m]   = ((${fsm.is_state("fsm_r[m]", "idle")}) ||
+                            (${fsm.is_state("fsm_r[m]", "transfer")}) ||
+                            (${fsm.is_state("fsm_r[m]", "transfer_finish")}) ||
+                            (${fsm.is_state("fsm_r[m]", "error2")})) ? 1'b1 : 1'b0;
+
+% if mod.regdec:
+      mst_req_s[m]  = mst_sel_s[m];
+% else:
+      // another slave is requested with the end of the current data phase only
+      mst_req_s[m]  = (mst_sel_s[m] & {${ns}{mst_new_xfer_s[m] & mst_rqstate_s[m]}} & ({${ns}{mst_hready_s[m]}} | mst_gnt_r[m])) |
+                      mst_req_r[m];
+% endif
+      mst_keep_s[m] = mst_gnt_r[m] & {${ns}{mst_cont_xfer_s[m]}} & slv_multi;
+    end
+
+    // Grant Combination
+    always_comb begin: proc_gnt
+      integer s;
+      for (s = 0; s < ${ns}; s = s + 1) begin
+        mst_slvgnt_s[m][s] = mst_slvmask[m*${ns}+s] & slv_gnt_s[s][mst_slvpos[(m*${ns}+s)*${iw} +: ${iw}]];
+      end
+      mst_gnt_s[m] = |mst_slvgnt_s[m];
+    end
+
+    // FSM
+    always_ff @(posedge main_clk_i or negedge main_rst_an_i) begin: proc_fsm
+      if (main_rst_an_i == 1'b0) begin
+        fsm_r[m] <= ${ff_dly}${fsm}_idle_st;
+        mst_gnt_r[m] <= ${ff_dly}${rslvr._get_uint_value(0, ns)};
+      end else begin
+        ${fsm.case("fsm_r[m]")}
+          ${fsm.label("fsm_r[m]", "idle")}: begin
+            if (mst_new_xfer_s[m] == 1'b1) begin
+              if (mst_addr_err_s[m] == 1'b1) begin
+                fsm_r[m] <= ${ff_dly}${fsm}_error1_st;
+% if mod.regdec:
+              end else begin
+% else:
+              end else if (mst_gnt_s[m] == 1'b1) begin
+                mst_req_r[m] <= ${ff_dly}${rslvr._get_uint_value(0, ns)};
+                fsm_r[m] <= ${ff_dly}${fsm}_transfer_st;
+              end else begin
+                mst_req_r[m] <= ${ff_dly}mst_sel_s[m];
+% endif
+                fsm_r[m] <= ${ff_dly}${fsm}_transfer_wait_st;
+              end
+              mst_gnt_r[m] <= ${ff_dly}mst_slvgnt_s[m];
+            end
+          end
+
+          ${fsm.label("fsm_r[m]", "error0")}: begin
+            if (mst_hready_s[m] == 1'b1) begin
+              mst_gnt_r[m] <= ${ff_dly}${rslvr._get_uint_value(0, ns)};
+              fsm_r[m] <= ${ff_dly}${fsm}_error1_st;
+            end
+          end
+
+          ${fsm.label("fsm_r[m]", "error1")}: begin
+            fsm_r[m] <= ${ff_dly}${fsm}_error2_st;
+          end
+
+          ${fsm.label("fsm_r[m]", "error2")}: begin
+            if (mst_new_xfer_s[m] == 1'b1) begin
+              if (mst_addr_err_s[m] == 1'b1) begin
+                fsm_r[m] <= ${ff_dly}${fsm}_error1_st;
+% if mod.regdec:
+              end else begin
+% else:
+              end else if (mst_gnt_s[m] == 1'b1) begin
+                mst_req_r[m] <= ${ff_dly}${rslvr._get_uint_value(0, ns)};
+                fsm_r[m] <= ${ff_dly}${fsm}_transfer_st;
+              end else begin
+                mst_req_r[m] <= ${ff_dly}mst_sel_s[m];
+% endif
+                fsm_r[m] <= ${ff_dly}${fsm}_transfer_wait_st;
+              end
+              mst_gnt_r[m] <= ${ff_dly}mst_slvgnt_s[m];
+            end else begin
+              fsm_r[m] <= ${ff_dly}${fsm}_idle_st;
+            end
+          end
+
+          ${fsm.label("fsm_r[m]", "transfer")}: begin
+% if has_hold:
+            if (mst_cont_xfer_s[m] == 1'b1) begin
+% else:
+            if ((ahb_mst_htrans_s[m] == ahb_trans_seq_e) ||
+                (ahb_mst_htrans_s[m] == ahb_trans_busy_e)) begin
+% endif
+              fsm_r[m] <= ${ff_dly}${fsm}_transfer_st;
+            end else begin
+              if (ahb_mst_htrans_s[m] == ahb_trans_idle_e) begin
+                if (mst_hready_s[m] == 1'b0) begin
+                  fsm_r[m] <= ${ff_dly}${fsm}_transfer_finish_st;
+                end else begin
+                  mst_gnt_r[m] <= ${ff_dly}${rslvr._get_uint_value(0, ns)};
+                  fsm_r[m] <= ${ff_dly}${fsm}_idle_st;
+                end
+% if has_hold:
+              end else begin // ((ahb_mst_htrans_s[m] == ahb_trans_nonseq_e) || (mst_brk_s[m] == 1'b1))
+% else:
+              end else begin // (ahb_mst_htrans_s[m] == ahb_trans_nonseq_e)
+% endif
+% if mod.regdec:
+                if (mst_hready_s[m] == 1'b1) begin // address phase ends with the current data phase
+                  if (mst_addr_err_s[m] == 1'b1) begin
+                    fsm_r[m] <= ${ff_dly}${fsm}_error1_st;
+                  end else begin
+                    fsm_r[m] <= ${ff_dly}${fsm}_transfer_wait_st;
+                  end
+                  mst_gnt_r[m] <= ${ff_dly}${rslvr._get_uint_value(0, ns)};
+                end
+% else:
+                if (mst_hready_s[m] == 1'b1) begin // address phase ends with the current data phase
+                  if (mst_addr_err_s[m] == 1'b1) begin
+                    fsm_r[m] <= ${ff_dly}${fsm}_error1_st;
+                  end else if (mst_gnt_s[m] == 1'b1) begin
+                    mst_req_r[m] <= ${ff_dly}${rslvr._get_uint_value(0, ns)};
+                    fsm_r[m] <= ${ff_dly}${fsm}_transfer_st;
+                  end else begin
+                    mst_req_r[m] <= ${ff_dly}mst_sel_s[m];
+                    fsm_r[m] <= ${ff_dly}${fsm}_transfer_wait_st;
+                  end
+                  mst_gnt_r[m] <= ${ff_dly}mst_slvgnt_s[m];
+                end else if (mst_addr_err_s[m] == 1'b1) begin // the data phase continues
+                  fsm_r[m] <= ${ff_dly}${fsm}_error0_st;
+                end
+% endif
+              end
+            end
+          end
+
+          ${fsm.label("fsm_r[m]", "transfer_wait")}: begin
+% if mod.regdec:
+            if (mst_fine_err_s[m] == 1'b1) begin
+              fsm_r[m] <= ${ff_dly}${fsm}_error1_st;
+            end else if (mst_gnt_s[m] == 1'b1) begin
+% else:
+            if (mst_gnt_s[m] == 1'b1) begin
+              mst_req_r[m] <= ${ff_dly}${rslvr._get_uint_value(0, ns)};
+% endif
+              mst_gnt_r[m] <= ${ff_dly}mst_slvgnt_s[m];
+              fsm_r[m] <= ${ff_dly}${fsm}_transfer_st;
+            end
+          end
+
+          ${fsm.label("fsm_r[m]", "transfer_finish")}: begin
+            if (mst_hready_s[m] == 1'b1) begin
+              if (mst_new_xfer_s[m] == 1'b1) begin
+                if (mst_addr_err_s[m] == 1'b1) begin
+                  fsm_r[m] <= ${ff_dly}${fsm}_error1_st;
+% if mod.regdec:
+                end else begin
+% else:
+                end else if (mst_gnt_s[m] == 1'b1) begin
+                  mst_req_r[m] <= ${ff_dly}${rslvr._get_uint_value(0, ns)};
+                  fsm_r[m] <= ${ff_dly}${fsm}_transfer_st;
+                end else begin
+                  mst_req_r[m] <= ${ff_dly}mst_sel_s[m];
+% endif
+                  fsm_r[m] <= ${ff_dly}${fsm}_transfer_wait_st;
+                end
+                mst_gnt_r[m] <= ${ff_dly}mst_slvgnt_s[m];
+              end else begin
+                mst_gnt_r[m] <= ${ff_dly}${rslvr._get_uint_value(0, ns)};
+                fsm_r[m] <= ${ff_dly}${fsm}_idle_st;
+              end
+            end
+          end
+
+          default: begin
+            mst_gnt_r[m] <= ${ff_dly}${rslvr._get_uint_value(0, ns)};
+% if not mod.regdec:
+            mst_req_r[m] <= ${ff_dly}${rslvr._get_uint_value(0, ns)};
+% endif
+            fsm_r[m] <= ${ff_dly}${fsm}_idle_st;
+          end
+        endcase
+      end
+
+      if ((mst_new_xfer_s[m] == 1'b1) && (mst_gnt_s[m] == 1'b0) && (mst_rqstate_s[m] == 1'b1)) begin
+% for name in aph:
+%   if name == "htrans" and has_hold:
+        mst_htrans_r[m] <= ${ff_dly}ahb_trans_nonseq_e;  // a broken burst restarts with NONSEQ
+%   else:
+        mst_${name}_r[m] <= ${ff_dly}ahb_mst_${name}_s[m];
+%   endif
+% endfor
+      end
+
+      if (mst_hready_s[m] == 1'b1) begin  // the address phase ends with the current data phase
+        mst_hwrite_dph_r[m] <= ${ff_dly}mst_hwrite_s[m];
+      end
+    end
+
+    // Mux
+    always_comb begin: proc_mux
+      if (${fsm.is_state("fsm_r[m]", "transfer_wait")}) begin
+% for name in aph:
+        mst_${name}_s[m] = mst_${name}_r[m];
+% endfor
+      end else begin
+% for name in aph:
+        mst_${name}_s[m] = ahb_mst_${name}_s[m];
+% endfor
+      end
+
+      mst_hready_s[m] = (|(ahb_slv_hreadyout_s & mst_gnt_r[m])) | ~(|mst_gnt_r[m]);
+    end
+
+    // Response
+% if mod.onehot_mux:
+    always_comb begin: proc_rsp
+      integer s;
+      logic [${ns-1}:0] rsp_sel_s;
+      logic [${ns-1}:0] rsp_rd_s;
+%   for name in ("hruser", "hbuser"):
+%     if name in rsp:
+      logic [${ns-1}:0] rsp_${name}_sel_s;
+%     endif
+%   endfor
+
+      ${fsm.case("fsm_r[m]")}
+        ${fsm.label("fsm_r[m]", "error0", "transfer", "transfer_finish")}: begin
+          rsp_sel_s = (mst_sole[m] == 1'b1) ? mst_slvmask[m*${ns} +: ${ns}] : mst_gnt_r[m];
+        end
+
+        default: begin
+          rsp_sel_s = ${rslvr._get_uint_value(0, ns)};
+        end
+      endcase
+      // no read data during write data phases
+      rsp_rd_s = ((mst_hwrite_dph_r[m] == 1'b0) || (${fsm.is_state("fsm_r[m]", "transfer_finish")})) ? rsp_sel_s : ${rslvr._get_uint_value(0, ns)};
+%   for name in ("hruser", "hbuser"):
+%     if name in rsp:
+      rsp_${name}_sel_s = rsp_rd_s & slv_${name}_has;
+%     endif
+%   endfor
+
+      ahb_mst_hrdata_s[m] = ${rslvr._get_uint_value(0, mod.datawidth)};
+      ahb_mst_hready_s[m] = ~(|rsp_sel_s);
+      ahb_mst_hresp_s[m]  = ahb_resp_okay_e;
+%   if "hexokay" in rsp:
+      ahb_mst_hexokay_s[m] = ahb_hexok_error_e;
+%   endif
+%   for name in ("hruser", "hbuser"):
+%     if name in rsp:
+      ahb_mst_${name}_s[m] = {${rsp[name].width}{~(|rsp_${name}_sel_s)}} & mst_${name}_dflt[m*${rsp[name].width} +: ${rsp[name].width}];
+%     endif
+%   endfor
+      for (s = 0; s < ${ns}; s = s + 1) begin
+        ahb_mst_hrdata_s[m] = ahb_mst_hrdata_s[m] | ({${mod.datawidth}{rsp_rd_s[s]}} & ahb_slv_hrdata_s[s]);
+        ahb_mst_hready_s[m] = ahb_mst_hready_s[m] | (rsp_sel_s[s] & ahb_slv_hreadyout_s[s]);
+        ahb_mst_hresp_s[m]  = ahb_mst_hresp_s[m] | (rsp_sel_s[s] & ahb_slv_hresp_s[s]);
+%   if "hexokay" in rsp:
+        ahb_mst_hexokay_s[m] = ahb_mst_hexokay_s[m] | (rsp_sel_s[s] & ahb_slv_hexokay_s[s]);
+%   endif
+%   for name in ("hruser", "hbuser"):
+%     if name in rsp:
+        ahb_mst_${name}_s[m] = ahb_mst_${name}_s[m] | ({${rsp[name].width}{rsp_${name}_sel_s[s]}} & ahb_slv_${name}_s[s]);
+%     endif
+%   endfor
+      end
+
+      ${fsm.case("fsm_r[m]")}
+        ${fsm.label("fsm_r[m]", "transfer_wait")}: begin
+          ahb_mst_hready_s[m] = 1'b0;
+        end
+
+        ${fsm.label("fsm_r[m]", "error1")}: begin
+          ahb_mst_hready_s[m] = 1'b0;
+          ahb_mst_hresp_s[m]  = ahb_resp_error_e;
+        end
+
+        ${fsm.label("fsm_r[m]", "error2")}: begin
+          ahb_mst_hresp_s[m]  = ahb_resp_error_e;
+        end
+
+        default: begin
+        end
+      endcase
+    end
+%   if ns > 1:
+
+${onehot_assert([("mst_gnt", "mst_gnt_r[m]")], 4)}\
+%   endif
+% else:
+    always_comb begin: proc_rsp
+      integer s;
+      logic [${ns-1}:0] rsp_sel_s;
+      logic rsp_vld_s;
+      logic [${sw-1}:0] rsp_idx_s;
+
+      rsp_sel_s = (mst_sole[m] == 1'b1) ? mst_slvmask[m*${ns} +: ${ns}] : mst_gnt_r[m];
+      rsp_vld_s = (rsp_sel_s != ${rslvr._get_uint_value(0, ns)}) && ((rsp_sel_s & (rsp_sel_s - 1'b1)) == ${rslvr._get_uint_value(0, ns)});
+      rsp_idx_s = ${rslvr._get_uint_value(0, sw)};
+      for (s = 0; s < ${ns}; s = s + 1) begin
+        if (rsp_sel_s[s] == 1'b1) begin
+          rsp_idx_s = s[${sw-1}:0];
+        end
+      end
+
+      ahb_mst_hrdata_s[m] = ${rslvr._get_uint_value(0, mod.datawidth)};
+      ahb_mst_hready_s[m] = 1'b1;
+      ahb_mst_hresp_s[m]  = ahb_resp_okay_e;
+% if "hexokay" in rsp:
+      ahb_mst_hexokay_s[m] = ahb_hexok_error_e;
+% endif
+% for name in ("hruser", "hbuser"):
+%   if name in rsp:
+      ahb_mst_${name}_s[m] = mst_${name}_dflt[m*${rsp[name].width} +: ${rsp[name].width}];
+%   endif
+% endfor
+      ${fsm.case("fsm_r[m]")}
+        ${fsm.label("fsm_r[m]", "transfer_wait")}: begin
+          ahb_mst_hready_s[m] = 1'b0;
+        end
+
+        ${fsm.label("fsm_r[m]", "error1")}: begin
+          ahb_mst_hready_s[m] = 1'b0;
+          ahb_mst_hresp_s[m]  = ahb_resp_error_e;
+        end
+
+        ${fsm.label("fsm_r[m]", "error2")}: begin
+          ahb_mst_hresp_s[m]  = ahb_resp_error_e;
+        end
+
+        ${fsm.label("fsm_r[m]", "error0", "transfer", "transfer_finish")}: begin
+          if (rsp_vld_s == 1'b1) begin
+            if ((mst_hwrite_dph_r[m] == 1'b0) || (${fsm.is_state("fsm_r[m]", "transfer_finish")})) begin
+              ahb_mst_hrdata_s[m] = ahb_slv_hrdata_s[rsp_idx_s];
+% for name in ("hruser", "hbuser"):
+%   if name in rsp:
+              if (slv_${name}_has[rsp_idx_s] == 1'b1) begin
+                ahb_mst_${name}_s[m] = ahb_slv_${name}_s[rsp_idx_s];
+              end
+%   endif
+% endfor
+            end
+            ahb_mst_hready_s[m] = ahb_slv_hreadyout_s[rsp_idx_s];
+            ahb_mst_hresp_s[m]  = ahb_slv_hresp_s[rsp_idx_s];
+% if "hexokay" in rsp:
+            ahb_mst_hexokay_s[m] = ahb_slv_hexokay_s[rsp_idx_s];
+% endif
+          end
+        end
+
+        default: begin
+        end
+      endcase
+    end
+% endif
+% if mod.has_qos:
+<%
+  level = f"mst_qos[m*{lw} +: {lw}]" if lw else ""
+  if rtw:
+    rtqos = fit(rslvr, "rtqos_s", rtw, lw)
+    level = f"({rtqos} > {level}) ? {rtqos} : {level}"
+  if aging:
+    aged = f"(mst_wait_r[m] == {rslvr._get_uint_value(aging, aw)})"
+    level = f"{{{aged}, {level}}}" if lw else aged
+%>
+    // QoS Level${", promoted after waiting " + str(aging) + " cycles" if aging else ""}
+%   if not rtw and not aging:
+    assign mst_qos_s[m] = ${level};
+%   else:
+    always_comb begin: proc_qos
+%     if rtw:
+      logic [${rtw-1}:0] rtqos_s;
+
+      rtqos_s = (${fsm.is_state("fsm_r[m]", "transfer_wait")}) ? mst_rtqos_r[m] : mst_rtqos_s[m];
+%     endif
+      mst_qos_s[m] = ${level};
+    end
+
+    always_ff @(posedge main_clk_i or negedge main_rst_an_i) begin: proc_qos_reg
+      if (main_rst_an_i == 1'b0) begin
+%     if rtw:
+        mst_rtqos_r[m] <= ${ff_dly}${rslvr._get_uint_value(0, rtw)};
+%     endif
+%     if aging:
+        mst_wait_r[m] <= ${ff_dly}${rslvr._get_uint_value(0, aw)};
+%     endif
+      end else begin
+%     if rtw:
+        if ((mst_new_xfer_s[m] == 1'b1) && (mst_gnt_s[m] == 1'b0) && (mst_rqstate_s[m] == 1'b1)) begin
+          mst_rtqos_r[m] <= ${ff_dly}mst_rtqos_s[m];
+        end
+%     endif
+%     if aging:
+        if (((|mst_req_s[m]) & ~mst_gnt_s[m]) == 1'b1) begin
+          if (mst_wait_r[m] != ${rslvr._get_uint_value(aging, aw)}) begin
+            mst_wait_r[m] <= ${ff_dly}mst_wait_r[m] + 1'b1;
+          end
+        end else begin
+          mst_wait_r[m] <= ${ff_dly}${rslvr._get_uint_value(0, aw)};
+        end
+%     endif
+      end
+    end
+%   endif
+% endif
+
+  end
+
+
+  // ------------------------------------------------------
+  // The Slaves:
+  // ------------------------------------------------------
+<%def name="slv_aph_mux(src)">\
+    // Address Phase Mux
+% if mod.onehot_mux:
+<%
+  idles = {"hsize": "ahb_size_word_e"}
+  for name, type_ in aph.items():
+    if name == "hauser":
+      idles[name] = None  # depends on the master
+    elif name not in ("haddr", "hwrite", "htrans", "hburst", "hsize") and type_.default:
+      idles[name] = rslvr.get_default(type_)
+  def mask(width, sel):
+    return sel if width == 1 else f"{{{width}{{{sel}}}}}"
+%>\
+    always_comb begin: proc_aph_mux
+      integer p;
+      logic aph_none_s;
+      logic [${iw-1}:0] aph_idx_s;
+%   if "hauser" in aph:
+      logic [${nm-1}:0] aph_hauser_sel_s;
+%   endif
+
+      aph_none_s = ~(|slv_asel_s[s]);
+%   for name, type_ in aph.items():
+%     if idles.get(name):
+      ahb_slv_${name}_s[s] = ${mask(type_.width, "aph_none_s")} & ${idles[name]};
+%     else:
+      ahb_slv_${name}_s[s] = ${rslvr._get_uint_value(0, type_.width)};
+%     endif
+%   endfor
+      ahb_slv_hready_s[s] = aph_none_s & ahb_slv_hreadyout_s[s];
+      for (p = 0; p < ${nm}; p = p + 1) begin
+        aph_idx_s = slv_mstidx[(s*${nm}+p)*${iw} +: ${iw}];
+%   for name, type_ in aph.items():
+%     if name == "hauser":
+        aph_hauser_sel_s[p] = slv_asel_s[s][p] & mst_hauser_has[aph_idx_s];
+        ahb_slv_hauser_s[s] = ahb_slv_hauser_s[s] | (${mask(type_.width, "aph_hauser_sel_s[p]")} & ${src}_hauser_s[aph_idx_s]);
+%     elif name == "hmaster" and has_enh:
+        ahb_slv_hmaster_s[s] = ahb_slv_hmaster_s[s] | (${mask(type_.width, "slv_asel_s[s][p]")} & (${src}_hmaster_s[aph_idx_s] | slv_hmaster_enh[(s*${nm}+p)*${hmw} +: ${hmw}]));
+%     else:
+        ahb_slv_${name}_s[s] = ahb_slv_${name}_s[s] | (${mask(type_.width, "slv_asel_s[s][p]")} & ${src}_${name}_s[aph_idx_s]);
+%     endif
+%   endfor
+        ahb_slv_hready_s[s] = ahb_slv_hready_s[s] | (slv_asel_s[s][p] & mst_hready_s[aph_idx_s]);
+      end
+%   if "hauser" in aph:
+      ahb_slv_hauser_s[s] = ahb_slv_hauser_s[s] | (${mask(aph["hauser"].width, "~(|aph_hauser_sel_s)")} & slv_hauser_dflt[s*${aph["hauser"].width} +: ${aph["hauser"].width}]);
+%   endif
+    end
+% else:
+    always_comb begin: proc_aph_mux
+      integer p;
+      logic aph_vld_s;
+      logic [${iw-1}:0] aph_idx_s;
+% if has_enh:
+      logic [${hmw-1}:0] aph_enh_s;
+% endif
+
+      aph_vld_s = (slv_asel_s[s] != ${rslvr._get_uint_value(0, nm)}) && ((slv_asel_s[s] & (slv_asel_s[s] - 1'b1)) == ${rslvr._get_uint_value(0, nm)});
+      aph_idx_s = ${rslvr._get_uint_value(0, iw)};
+% if has_enh:
+      aph_enh_s = ${rslvr._get_uint_value(0, hmw)};
+% endif
+      for (p = 0; p < ${nm}; p = p + 1) begin
+        if (slv_asel_s[s][p] == 1'b1) begin
+          aph_idx_s = slv_mstidx[(s*${nm}+p)*${iw} +: ${iw}];
+% if has_enh:
+          aph_enh_s = slv_hmaster_enh[(s*${nm}+p)*${hmw} +: ${hmw}];
+% endif
+        end
+      end
+
+      if (aph_vld_s == 1'b1) begin
+% for name, type_ in aph.items():
+%   if name == "hauser":
+        ahb_slv_hauser_s[s] = (mst_hauser_has[aph_idx_s] == 1'b1) ? ${src}_hauser_s[aph_idx_s] : slv_hauser_dflt[s*${type_.width} +: ${type_.width}];
+%   elif name == "hmaster" and has_enh:
+        ahb_slv_hmaster_s[s] = ${src}_hmaster_s[aph_idx_s] | aph_enh_s;
+%   else:
+        ahb_slv_${name}_s[s] = ${src}_${name}_s[aph_idx_s];
+%   endif
+% endfor
+        ahb_slv_hready_s[s] = mst_hready_s[aph_idx_s];
+      end else begin
+% for name, type_ in aph.items():
+%   if name == "haddr":
+        ahb_slv_haddr_s[s] = ${rslvr._get_uint_value(0, mod.addrwidth)};
+%   elif name == "hwrite":
+        ahb_slv_hwrite_s[s] = ahb_write_read_e;
+%   elif name == "hsize":
+        ahb_slv_hsize_s[s] = ahb_size_word_e;
+%   elif name == "htrans":
+        ahb_slv_htrans_s[s] = ahb_trans_idle_e;
+%   elif name == "hburst":
+        ahb_slv_hburst_s[s] = ahb_burst_single_e;
+%   elif name == "hauser":
+        ahb_slv_hauser_s[s] = slv_hauser_dflt[s*${type_.width} +: ${type_.width}];
+%   else:
+        ahb_slv_${name}_s[s] = ${rslvr.get_default(type_)};
+%   endif
+% endfor
+        ahb_slv_hready_s[s] = ahb_slv_hreadyout_s[s];
+      end
+    end
+% endif
+</%def>\
+<%def name="slv_arb(policy)">\
+% if policy == "fixed":
+${slv_arb_fixed()}\
+% elif policy == "wrr":
+${slv_arb_wrr()}\
+% elif policy == "lrg":
+${slv_arb_lrg()}\
+% else:
+${slv_arb_rr()}\
+% endif
+</%def>\
+<%def name="slv_arb_fixed()">\
+      // Fixed-Priority Arbiter
+      always_comb begin: proc_fixed_arb
+        integer p;
+        logic found_s;
+        logic [${nm-1}:0] next_grant_s;
+        logic [${ww-1}:0] weight_s;
+        logic arb_en_s;
+
+        arb_en_s = ~(|slv_keep_s[s]);
+
+        next_grant_s = ${rslvr._get_uint_value(0, nm)};
+        weight_s = ${rslvr._get_uint_value(0, ww)};
+        found_s = 1'b0;
+        for (p = 0; p < ${nm}; p = p + 1) begin
+          if ((slv_req_s[s][p] == 1'b1) && ((found_s == 1'b0) || (slv_weight[(s*${nm}+p)*${ww} +: ${ww}] > weight_s))) begin
+            found_s = 1'b1;
+            weight_s = slv_weight[(s*${nm}+p)*${ww} +: ${ww}];
+            next_grant_s = ${rslvr._get_uint_value(0, nm)};
+            next_grant_s[p] = 1'b1;
+          end
+        end
+
+        slv_gnt_s[s] = next_grant_s & {${nm}{(${ready} & arb_en_s)}};
+        slv_asel_s[s] = slv_gnt_s[s] | (slv_keep_s[s] & slv_dph_s[s]);
+        ahb_slv_hsel_s[s] = |slv_asel_s[s];
+      end
+</%def>\
+<%def name="slv_arb_rr()">\
+% if mod.rr_style == "prefix":
+      // Round-Robin Arbiter: parallel-prefix priority encoder
+      always_comb begin: proc_rr_arb
+        logic [${nm-1}:0] prev_below_s;
+        logic [${nm-1}:0] mask_req_s;
+        logic [${nm-1}:0] mask_pre_s;
+        logic [${nm-1}:0] req_pre_s;
+        logic [${nm-1}:0] next_grant_s;
+        logic arb_en_s;
+
+        arb_en_s = ~(|slv_keep_s[s]);
+
+        // thermometer mask: candidates below the old grant come first
+${prefix_or(8, "prev_below_s", "slv_gnt_r[s]", nm, ">>")}
+        mask_req_s = slv_req_s[s] & prev_below_s;
+
+        // highest requesting candidate below the old grant, otherwise highest requesting candidate
+${prefix_or(8, "mask_pre_s", "mask_req_s", nm, ">>")}
+${prefix_or(8, "req_pre_s", "slv_req_s[s]", nm, ">>")}
+        next_grant_s = (mask_req_s != ${rslvr._get_uint_value(0, nm)}) ? (mask_req_s & ~mask_pre_s) : (slv_req_s[s] & ~req_pre_s);
+
+        slv_gnt_s[s] = slv_req_s[s] & next_grant_s & {${nm}{(${ready} & arb_en_s)}};
+        slv_asel_s[s] = slv_gnt_s[s] | (slv_keep_s[s] & slv_dph_s[s]);
+        ahb_slv_hsel_s[s] = |slv_asel_s[s];
+      end
+% else:
+      // Round-Robin Arbiter
+      always_comb begin: proc_rr_arb
+        integer i;
+        logic found_s;
+        logic [${nm-1}:0] next_grant_s;
+        logic arb_en_s;
+
+        arb_en_s = ~(|slv_keep_s[s]);
+
+        next_grant_s = {slv_gnt_r[s][0], slv_gnt_r[s][${nm-1}:1]}; // 1st candidate is old grant rotated 1 right
+        found_s = 1'b0;
+        for (i=0; i<${nm}; i=i+1) begin
+          if (found_s == 1'b0) begin
+            if ((slv_req_s[s] & next_grant_s) != ${rslvr._get_uint_value(0, nm)}) begin
+              found_s = 1'b1;
+            end else begin
+              next_grant_s = {next_grant_s[0], next_grant_s[${nm-1}:1]}; // rotate 1 right
+            end
+          end
+        end
+
+        slv_gnt_s[s] = slv_req_s[s] & next_grant_s & {${nm}{(${ready} & arb_en_s)}};
+        slv_asel_s[s] = slv_gnt_s[s] | (slv_keep_s[s] & slv_dph_s[s]);
+        ahb_slv_hsel_s[s] = |slv_asel_s[s];
+      end
+% endif
+
+      always_ff @(posedge main_clk_i or negedge main_rst_an_i) begin: proc_gnt
+        if (main_rst_an_i == 1'b0) begin
+          slv_gnt_r[s] <= ${ff_dly}${rslvr._get_uint_value(1, nm)};  // initial pseudo-grant
+        end else begin
+          if (slv_gnt_s[s] != ${rslvr._get_uint_value(0, nm)}) begin
+            slv_gnt_r[s] <= ${ff_dly}slv_gnt_s[s];
+          end
+        end
+      end
+</%def>\
+<%def name="slv_arb_wrr()">\
+      // Weighted Round-Robin Arbiter
+      always_comb begin: proc_wrr_arb
+        integer i;
+        logic found_s;
+        logic [${nm-1}:0] next_grant_s;
+        logic arb_en_s;
+
+        arb_en_s = ~(|slv_keep_s[s]);
+
+        next_grant_s = {slv_gnt_r[s][0], slv_gnt_r[s][${nm-1}:1]}; // 1st candidate is old grant rotated 1 right
+        found_s = 1'b0;
+        for (i=0; i<${nm}; i=i+1) begin
+          if (found_s == 1'b0) begin
+            if ((slv_req_s[s] & next_grant_s) != ${rslvr._get_uint_value(0, nm)}) begin
+              found_s = 1'b1;
+            end else begin
+              next_grant_s = {next_grant_s[0], next_grant_s[${nm-1}:1]}; // rotate 1 right
+            end
+          end
+        end
+        if (((slv_req_s[s] & slv_gnt_r[s]) != ${rslvr._get_uint_value(0, nm)}) && (slv_credit_r[s] != ${rslvr._get_uint_value(0, ww)})) begin
+          next_grant_s = slv_gnt_r[s]; // old grant has consecutive grants left
+        end
+
+        slv_gnt_s[s] = slv_req_s[s] & next_grant_s & {${nm}{(${ready} & arb_en_s)}};
+        slv_asel_s[s] = slv_gnt_s[s] | (slv_keep_s[s] & slv_dph_s[s]);
+        ahb_slv_hsel_s[s] = |slv_asel_s[s];
+      end
+
+      always_ff @(posedge main_clk_i or negedge main_rst_an_i) begin: proc_gnt
+        integer p;
+        if (main_rst_an_i == 1'b0) begin
+          slv_gnt_r[s] <= ${ff_dly}${rslvr._get_uint_value(1, nm)};  // initial pseudo-grant
+          slv_credit_r[s] <= ${ff_dly}${rslvr._get_uint_value(0, ww)};
+        end else begin
+% if has_park:
+          if ((slv_gnt_s[s] != ${rslvr._get_uint_value(0, nm)}) && (ahb_slv_hreadyout_s[s] == 1'b1)) begin  // parked re-grants repeat during wait states
+% else:
+          if (slv_gnt_s[s] != ${rslvr._get_uint_value(0, nm)}) begin
+% endif
+            slv_gnt_r[s] <= ${ff_dly}slv_gnt_s[s];
+            if (((slv_gnt_s[s] & slv_gnt_r[s]) != ${rslvr._get_uint_value(0, nm)}) && (slv_credit_r[s] != ${rslvr._get_uint_value(0, ww)})) begin
+              slv_credit_r[s] <= ${ff_dly}slv_credit_r[s] - 1'b1;
+            end else begin
+              for (p = 0; p < ${nm}; p = p + 1) begin
+                if (slv_gnt_s[s][p] == 1'b1) begin
+                  slv_credit_r[s] <= ${ff_dly}slv_weight[(s*${nm}+p)*${ww} +: ${ww}] - 1'b1;
+                end
+              end
+            end
+          end
+        end
+      end
+</%def>\
+<%def name="slv_arb_lrg()">\
+<%
+  lrg_init = sum(1 << (pos*nm+other) for pos in range(nm) for other in range(pos+1, nm))
+%>\
+      // Least-Recently-Granted Arbiter
+      always_comb begin: proc_lrg_arb
+        integer p;
+        integer q;
+        logic arb_en_s;
+
+        arb_en_s = ~(|slv_keep_s[s]);
+
+        for (p = 0; p < ${nm}; p = p + 1) begin
+          slv_gnt_s[s][p] = slv_req_s[s][p] & ${ready} & arb_en_s;
+          for (q = 0; q < ${nm}; q = q + 1) begin
+            if ((q < p) && (slv_req_s[s][q] == 1'b1) && (slv_lrg_r[s][q*${nm}+p] == 1'b1)) begin
+              slv_gnt_s[s][p] = 1'b0; // q-th master granted less recently
+            end
+            if ((q > p) && (slv_req_s[s][q] == 1'b1) && (slv_lrg_r[s][p*${nm}+q] == 1'b0)) begin
+              slv_gnt_s[s][p] = 1'b0; // q-th master granted less recently
+            end
+          end
+        end
+        slv_asel_s[s] = slv_gnt_s[s] | (slv_keep_s[s] & slv_dph_s[s]);
+        ahb_slv_hsel_s[s] = |slv_asel_s[s];
+      end
+
+      always_ff @(posedge main_clk_i or negedge main_rst_an_i) begin: proc_lrg
+        integer p;
+        integer q;
+        if (main_rst_an_i == 1'b0) begin
+          slv_lrg_r[s] <= ${ff_dly}${rslvr._get_uint_value(lrg_init, nm*nm)};  // initial order of masters
+        end else begin
+          for (p = 0; p < ${nm}; p = p + 1) begin
+            for (q = p + 1; q < ${nm}; q = q + 1) begin
+              slv_lrg_r[s][p*${nm}+q] <= ${ff_dly}(slv_lrg_r[s][p*${nm}+q] & ~slv_gnt_s[s][p]) | slv_gnt_s[s][q];
+            end
+          end
+        end
+      end
+</%def>\
+<%def name="slv_hold()">\
+<%
+  hold_max = f"slv_hold_max[s*{hw} +: {hw}]"
+  if hw:
+    limit = f"(({hold_max} != {rslvr._get_uint_value(0, hw)}) && (slv_hold_r[s] == {hold_max})) | yield_s"
+  else:
+    limit = "yield_s"
+  beat = "(ahb_slv_hreadyout_s[s] == 1'b1) && (ahb_slv_htrans_s[s] == ahb_trans_seq_e)"
+  if has_cycles and has_beats:
+    count = f"((slv_hold_cycles[s] == 1'b1) || ({beat}))"
+  elif has_beats:
+    count = beat
+  else:
+    count = ""
+%>\
+    // Grant Hold: break undefined-length bursts after the hold limit or on yield, if other masters wait
+    always_comb begin: proc_brk
+      integer p;
+      logic yield_s;
+
+      yield_s = 1'b0;
+      for (p = 0; p < ${nm}; p = p + 1) begin
+        yield_s = yield_s | (slv_dph_s[s][p] & mst_yield_s[slv_mstidx[(s*${nm}+p)*${iw} +: ${iw}]]);
+      end
+      slv_brk_s[s] = slv_bounded[s] & ahb_slv_hreadyout_s[s] & slv_contend_r[s] & (${limit});
+    end
+
+    always_ff @(posedge main_clk_i or negedge main_rst_an_i) begin: proc_hold
+      if (main_rst_an_i == 1'b0) begin
+% if hw:
+        slv_hold_r[s] <= ${ff_dly}${rslvr._get_uint_value(0, hw)};
+% endif
+        slv_contend_r[s] <= ${ff_dly}1'b0;
+      end else begin
+        slv_contend_r[s] <= ${ff_dly}|(slv_req_s[s] & ~slv_gnt_s[s]);
+% if hw:
+        if (slv_gnt_s[s] != ${rslvr._get_uint_value(0, nm)}) begin
+          slv_hold_r[s] <= ${ff_dly}${rslvr._get_uint_value(1, hw)};
+%   if count:
+        end else if ((slv_keep_s[s] != ${rslvr._get_uint_value(0, nm)}) && ${count} &&
+                     (slv_hold_r[s] != ${hold_max})) begin
+%   else:
+        end else if ((slv_keep_s[s] != ${rslvr._get_uint_value(0, nm)}) && (slv_hold_r[s] != ${hold_max})) begin
+%   endif
+          slv_hold_r[s] <= ${ff_dly}slv_hold_r[s] + 1'b1;
+        end
+% endif
+      end
+    end
+</%def>\
+<%def name="slv_sole()">\
+      // No Arbitration Necessary
+      always_comb begin: proc_asgn
+% if mod.regdec:
+        logic [${iw-1}:0] mst_idx_s;
+
+        mst_idx_s = slv_mstidx[s*${nm}*${iw} +: ${iw}];
+% endif
+        slv_gnt_s[s] = slv_req_s[s];
+        slv_asel_s[s] = ${rslvr._get_uint_value(0, nm)};
+% if mod.regdec:
+        // every transfer passes the address buffer
+        slv_asel_s[s][0] = mst_sel_s[mst_idx_s][s] | (mst_gnt_r[mst_idx_s][s] & mst_cont_xfer_s[mst_idx_s]);
+% else:
+        slv_asel_s[s][0] = mst_sel_s[slv_mstidx[s*${nm}*${iw} +: ${iw}]][s];
+% endif
+        ahb_slv_hsel_s[s] = slv_req_s[s][0] | (slv_dph_s[s][0] & mst_cont_xfer_s[slv_mstidx[s*${nm}*${iw} +: ${iw}]]);
+      end
+
+${slv_aph_mux("mst" if mod.regdec else "ahb_mst")}\
+</%def>\
+  for (genvar s = 0; s < ${ns}; s++) begin: g_slv
+
+    // Masters in Order of Position
+    always_comb begin: proc_pos
+      integer p;
+% if mod.has_qos:
+      integer q;
+      logic [${nm-1}:0] req_s;
+% endif
+      logic [${iw-1}:0] mst_idx_s;
+      for (p = 0; p < ${nm}; p = p + 1) begin
+        mst_idx_s = slv_mstidx[(s*${nm}+p)*${iw} +: ${iw}];
+% if mod.has_qos:
+        req_s[p]         = slv_posmask[s*${nm}+p] & mst_req_s[mst_idx_s][s];
+% else:
+        slv_req_s[s][p]  = slv_posmask[s*${nm}+p] & mst_req_s[mst_idx_s][s];
+% endif
+        slv_keep_s[s][p] = slv_posmask[s*${nm}+p] & mst_keep_s[mst_idx_s][s];
+        slv_dph_s[s][p]  = slv_posmask[s*${nm}+p] & mst_gnt_r[mst_idx_s][s];
+      end
+% if mod.has_qos:
+
+      // QoS filter: requests below the highest requesting QoS level are masked
+      for (p = 0; p < ${nm}; p = p + 1) begin
+        slv_req_s[s][p] = req_s[p];
+        for (q = 0; q < ${nm}; q = q + 1) begin
+          if ((req_s[q] == 1'b1) &&
+              (mst_qos_s[slv_mstidx[(s*${nm}+q)*${iw} +: ${iw}]] > mst_qos_s[slv_mstidx[(s*${nm}+p)*${iw} +: ${iw}]])) begin
+            slv_req_s[s][p] = 1'b0;
+          end
+        end
+      end
+% endif
+    end
+
+% if has_park:
+    // Parking: re-grant the master of the current data phase without waiting for HREADYOUT, if it is the only requesting master
+    assign slv_park_s[s] = (|(slv_req_s[s] & slv_dph_s[s] & slv_parkmask[s*${nm} +: ${nm}])) & ~(|(slv_req_s[s] & ~slv_dph_s[s]));
+
+% endif
+% if has_arb:
+    if (slv_multi[s] == 1'b1) begin: g_arb
+
+% if len(policies) == 1:
+${slv_arb(policies[0])}
+% else:
+%   for idx, policy in enumerate(policies):
+      ${"end else if" if idx else "if"} (slv_arb[s*2 +: 2] == 2'd${ARBITRATIONS.index(policy)}) begin: g_${policy}
+${reindent(capture(slv_arb, policy), 2)}
+%   endfor
+      end
+
+% endif
+${slv_aph_mux("mst")}
+    end else begin: g_sole
+${slv_sole()}
+    end
+% else:
+${slv_sole()}
+% endif
+% if has_hold:
+
+${slv_hold()}\
+% endif
+
+    // Data Phase Mux
+% if mod.onehot_mux:
+    always_comb begin: proc_dph_mux
+      integer p;
+      logic [${iw-1}:0] dph_idx_s;
+%   if "hwuser" in dph:
+      logic [${nm-1}:0] dph_hwuser_sel_s;
+%   endif
+
+%   for name, type_ in dph.items():
+      ahb_slv_${name}_s[s] = ${rslvr._get_uint_value(0, type_.width)};
+%   endfor
+      for (p = 0; p < ${nm}; p = p + 1) begin
+        dph_idx_s = slv_mstidx[(s*${nm}+p)*${iw} +: ${iw}];
+%   for name, type_ in dph.items():
+%     if name == "hwuser":
+        dph_hwuser_sel_s[p] = slv_dph_s[s][p] & mst_hwuser_has[dph_idx_s];
+        ahb_slv_hwuser_s[s] = ahb_slv_hwuser_s[s] | ({${type_.width}{dph_hwuser_sel_s[p]}} & ahb_mst_hwuser_s[dph_idx_s]);
+%     else:
+        ahb_slv_${name}_s[s] = ahb_slv_${name}_s[s] | ({${type_.width}{slv_dph_s[s][p]}} & ahb_mst_${name}_s[dph_idx_s]);
+%     endif
+%   endfor
+      end
+%   if "hwuser" in dph:
+      ahb_slv_hwuser_s[s] = ahb_slv_hwuser_s[s] | ({${dph["hwuser"].width}{~(|dph_hwuser_sel_s)}} & slv_hwuser_dflt[s*${dph["hwuser"].width} +: ${dph["hwuser"].width}]);
+%   endif
+    end
+%   if nm > 1:
+
+${onehot_assert([("slv_sel", "slv_asel_s[s]"), ("slv_dph", "slv_dph_s[s]")], 4)}\
+%   endif
+% else:
+    always_comb begin: proc_dph_mux
+      integer p;
+      logic dph_vld_s;
+      logic [${iw-1}:0] dph_idx_s;
+
+      dph_vld_s = (slv_dph_s[s] != ${rslvr._get_uint_value(0, nm)}) && ((slv_dph_s[s] & (slv_dph_s[s] - 1'b1)) == ${rslvr._get_uint_value(0, nm)});
+      dph_idx_s = ${rslvr._get_uint_value(0, iw)};
+      for (p = 0; p < ${nm}; p = p + 1) begin
+        if (slv_dph_s[s][p] == 1'b1) begin
+          dph_idx_s = slv_mstidx[(s*${nm}+p)*${iw} +: ${iw}];
+        end
+      end
+
+      if (dph_vld_s == 1'b1) begin
+% for name, type_ in dph.items():
+%   if name == "hwuser":
+        ahb_slv_hwuser_s[s] = (mst_hwuser_has[dph_idx_s] == 1'b1) ? ahb_mst_hwuser_s[dph_idx_s] : slv_hwuser_dflt[s*${type_.width} +: ${type_.width}];
+%   else:
+        ahb_slv_${name}_s[s] = ahb_mst_${name}_s[dph_idx_s];
+%   endif
+% endfor
+      end else begin
+% for name, type_ in dph.items():
+%   if name == "hwuser":
+        ahb_slv_hwuser_s[s] = slv_hwuser_dflt[s*${type_.width} +: ${type_.width}];
+%   else:
+        ahb_slv_${name}_s[s] = ${rslvr._get_uint_value(0, type_.width)};
+%   endif
+% endfor
+      end
+    end
+% endif
+
+  end
 </%def>
@@ -0,0 +1,227 @@
+##
+## MIT License
+##
+## Copyright (c) 2024 nbiotcloud
+##
+## Permission is hereby granted, free of charge, to any person obtaining a copy
+## of this software and associated documentation files (the "Software"), to deal
+## in the Software without restriction, including without limitation the rights
+## to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+## copies of the Software, and to permit persons to whom the Software is
+## furnished to do so, subject to the following conditions:
+##
+## The above copyright notice and this permission notice shall be included in all
+## copies or substantial portions of the Software.
+##
+## THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+## IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+## FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+## AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+## LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+## OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+## SOFTWARE.
+##
+
+<%!
+import ucdp as u
+import ucdpsv as usv
+from ucdp_amba import types as t
+from ucdp_amba.ucdp_ahb_slice import APH_REGS
+from ucdp_amba.ucdp_ahb_post import BUF_APH_REGS, BUF_DPH_REGS
+%>
+
+<%inherit file="sv.mako"/>
+
+<%def name="logic(indent=0, skip=None)">\
+<%
+  rslvr = usv.get_resolver(mod)
+  ff_dly = f"#{rslvr.ff_dly} " if rslvr.ff_dly else ""
+  items = {item.name: item for item in mod.ahbtype.values()}
+  aph_regs = [name for name in APH_REGS if name in items]
+  buf_aph = [name for name in BUF_APH_REGS if name in items]
+  buf_dph = [name for name in BUF_DPH_REGS if name in items]
+  cntwidth = mod.depth.bit_length()
+  ptrwidth = mod.ptrwidth
+  last = rslvr._get_uint_value(mod.depth - 1, ptrwidth)
+  ptr0 = rslvr._get_uint_value(0, ptrwidth)
+  ptr1 = rslvr._get_uint_value(1, ptrwidth)
+  cnt0 = rslvr._get_uint_value(0, cntwidth)
+  cnt1 = rslvr._get_uint_value(1, cntwidth)
+  nopost = []
+  if "hexcl" in items:
+    nopost.append("(ahb_src_hexcl_i == 1'b0)")
+  if "hmastlock" in items:
+    nopost.append("(ahb_src_hmastlock_i == 1'b0)")
+  if "hprot" in items:
+    nopost.append("(ahb_src_hprot_i[2] == 1'b1)")
+%>\
+% if mod.use_pkg:
+
+  import ucdp_amba_pkg::*;
+% endif
+
+${parent.logic(indent=indent, skip=skip)}
+  // === source =========================
+  // bufferable writes are posted, all other transfers wait for the drained buffer - transfers to an idle target are forwarded
+  assign src_valid_s = ((ahb_src_hsel_i == 1'b1) && (ahb_src_hready_i == 1'b1) &&
+                        ((ahb_src_htrans_i == ahb_trans_nonseq_e) || (ahb_src_htrans_i == ahb_trans_seq_e))) ? 1'b1 : 1'b0;
+  assign src_post_s = ((src_valid_s == 1'b1) && (ahb_src_hwrite_i == ahb_write_write_e)${"".join(f" &&\n                       {cond}" for cond in nopost)}) ? 1'b1 : 1'b0;
+  assign src_pass_s = src_valid_s & ~src_pst_r & buf_empty_s;
+
+  always_ff @(posedge main_clk_i or negedge main_rst_an_i) begin: proc_src
+    if (main_rst_an_i == 1'b0) begin
+      src_pst_r <= ${ff_dly}1'b0;
+      src_npst_r <= ${ff_dly}1'b0;
+      src_hld_r <= ${ff_dly}1'b0;
+% for name in aph_regs:
+      src_${name}_r <= ${ff_dly}${rslvr.get_default(items[name].type_)};
+% endfor
+    end else begin
+      if (ahb_src_hreadyout_o == 1'b1) begin  // the data phase ends
+        src_pst_r <= ${ff_dly}src_post_s & ~(src_pass_s & ahb_tgt_hready_o);
+        src_npst_r <= ${ff_dly}src_valid_s & ~src_post_s;
+        src_hld_r <= ${ff_dly}src_valid_s & ~src_post_s & ~(src_pass_s & ahb_tgt_hready_o);
+      end else if ((src_hld_r == 1'b1) && (buf_empty_s == 1'b1) && (ahb_tgt_hready_o == 1'b1)) begin
+        src_hld_r <= ${ff_dly}1'b0;
+      end
+      if (src_valid_s == 1'b1) begin
+% for name in aph_regs:
+        src_${name}_r <= ${ff_dly}ahb_src_${name}_i;
+% endfor
+      end
+    end
+  end
+
+  always_comb begin: proc_src_rsp
+    if (src_pst_r == 1'b1) begin
+      ahb_src_hreadyout_o = ~buf_full_s;
+    end else if (src_npst_r == 1'b1) begin
+      ahb_src_hreadyout_o = tgt_dph_r & tgt_npst_r & ahb_tgt_hreadyout_i;
+    end else begin
+      ahb_src_hreadyout_o = 1'b1;
+    end
+  end
+
+  assign ahb_src_hresp_o = ((tgt_dph_r == 1'b1) && (tgt_npst_r == 1'b1)) ? ahb_tgt_hresp_i : ahb_resp_okay_e;
+% if "hexokay" in items:
+  assign ahb_src_hexokay_o = ((tgt_dph_r == 1'b1) && (tgt_npst_r == 1'b1)) ? ahb_tgt_hexokay_i : ahb_hexok_error_e;
+% endif
+% for name in ("hrdata", "hruser", "hbuser"):
+%   if name in items:
+  assign ahb_src_${name}_o = ahb_tgt_${name}_i;
+%   endif
+% endfor
+
+  // === buffer =========================
+  assign buf_empty_s = (buf_cnt_r == ${cnt0}) ? 1'b1 : 1'b0;
+  assign buf_full_s = (buf_cnt_r == ${rslvr._get_uint_value(mod.depth, cntwidth)}) ? 1'b1 : 1'b0;
+  assign buf_push_s = src_pst_r & ~buf_full_s;
+  assign buf_pop_s = ~buf_empty_s & ahb_tgt_hready_o;
+
+  always_ff @(posedge main_clk_i or negedge main_rst_an_i) begin: proc_buf
+    if (main_rst_an_i == 1'b0) begin
+      buf_cnt_r <= ${ff_dly}${cnt0};
+      buf_wrptr_r <= ${ff_dly}${ptr0};
+      buf_rdptr_r <= ${ff_dly}${ptr0};
+      for (int i = 0; i < ${mod.depth}; i++) begin
+% for name in (*buf_aph, *buf_dph):
+        buf_${name}_r[i] <= ${ff_dly}${rslvr.get_default(items[name].type_)};
+% endfor
+      end
+    end else begin
+      if (buf_push_s == 1'b1) begin
+% for name in buf_aph:
+        buf_${name}_r[buf_wrptr_r] <= ${ff_dly}src_${name}_r;
+% endfor
+% for name in buf_dph:
+        buf_${name}_r[buf_wrptr_r] <= ${ff_dly}ahb_src_${name}_i;
+% endfor
+% if mod.depth > 1:
+        buf_wrptr_r <= ${ff_dly}(buf_wrptr_r == ${last}) ? ${ptr0} : buf_wrptr_r + ${ptr1};
+% endif
+      end
+% if mod.depth > 1:
+      if (buf_pop_s == 1'b1) begin
+        buf_rdptr_r <= ${ff_dly}(buf_rdptr_r == ${last}) ? ${ptr0} : buf_rdptr_r + ${ptr1};
+      end
+% endif
+      if ((buf_push_s == 1'b1) && (buf_pop_s == 1'b0)) begin
+        buf_cnt_r <= ${ff_dly}buf_cnt_r + ${cnt1};
+      end else if ((buf_push_s == 1'b0) && (buf_pop_s == 1'b1)) begin
+        buf_cnt_r <= ${ff_dly}buf_cnt_r - ${cnt1};
+      end
+    end
+  end
+
+  // === target =========================
+  // posted writes first, then the held transfer, forwarded transfers otherwise
+  assign tgt_valid_s = ~buf_empty_s | src_hld_r | src_pass_s;
+
+  always_comb begin: proc_tgt_aph
+    if (buf_empty_s == 1'b0) begin
+      ahb_tgt_hsel_o = 1'b1;
+      ahb_tgt_htrans_o = ahb_trans_nonseq_e;
+      ahb_tgt_hwrite_o = ahb_write_write_e;
+% for name in buf_aph:
+      ahb_tgt_${name}_o = buf_${name}_r[buf_rdptr_r];
+% endfor
+% for name in ("hmastlock", "hexcl"):
+%   if name in items:
+      ahb_tgt_${name}_o = 1'b0;
+%   endif
+% endfor
+    end else if (src_hld_r == 1'b1) begin
+      ahb_tgt_hsel_o = 1'b1;
+      ahb_tgt_htrans_o = ahb_trans_nonseq_e;
+% for name in aph_regs:
+      ahb_tgt_${name}_o = src_${name}_r;
+% endfor
+    end else begin
+      ahb_tgt_hsel_o = src_pass_s;
+      ahb_tgt_htrans_o = (src_pass_s == 1'b1) ? ahb_trans_nonseq_e : ahb_trans_idle_e;
+% for name in aph_regs:
+      ahb_tgt_${name}_o = ahb_src_${name}_i;
+% endfor
+    end
+  end
+
+% if "hburst" in items:
+  assign ahb_tgt_hburst_o = ahb_burst_single_e;
+% endif
+  assign ahb_tgt_hready_o = (tgt_dph_r == 1'b1) ? ahb_tgt_hreadyout_i : 1'b1;
+% for name in buf_dph:
+  assign ahb_tgt_${name}_o = ((tgt_npst_r == 1'b1) || (tgt_fwd_r == 1'b1)) ? ahb_src_${name}_i : tgt_${name}_r;
+% endfor
+
+  always_ff @(posedge main_clk_i or negedge main_rst_an_i) begin: proc_tgt
+    if (main_rst_an_i == 1'b0) begin
+      tgt_dph_r <= ${ff_dly}1'b0;
+      tgt_npst_r <= ${ff_dly}1'b0;
+      tgt_fwd_r <= ${ff_dly}1'b0;
+% for name in buf_dph:
+      tgt_${name}_r <= ${ff_dly}${rslvr.get_default(items[name].type_)};
+% endfor
+      irq_r <= ${ff_dly}1'b0;
+    end else begin
+      if (ahb_tgt_hready_o == 1'b1) begin
+        tgt_dph_r <= ${ff_dly}tgt_valid_s;
+        tgt_npst_r <= ${ff_dly}buf_empty_s & ~src_post_s;
+      end
+      tgt_fwd_r <= ${ff_dly}src_pass_s & src_post_s & ahb_tgt_hready_o;
+      if (tgt_fwd_r == 1'b1) begin  // the source data phase of the forwarded posted write ends
+% for name in buf_dph:
+        tgt_${name}_r <= ${ff_dly}ahb_src_${name}_i;
+% endfor
+      end else if (buf_pop_s == 1'b1) begin
+% for name in buf_dph:
+        tgt_${name}_r <= ${ff_dly}buf_${name}_r[buf_rdptr_r];
+% endfor
+      end
+      // the posted write failed
+      irq_r <= ${ff_dly}tgt_dph_r & ~tgt_npst_r & ahb_tgt_hreadyout_i & (ahb_tgt_hresp_i == ahb_resp_error_e);
+    end
+  end
+
+  assign irq_o = irq_r;
+
+</%def>
@@ -0,0 +1,232 @@
+##
+## MIT License
+##
+## Copyright (c) 2024 nbiotcloud
+##
+## Permission is hereby granted, free of charge, to any person obtaining a copy
+## of this software and associated documentation files (the "Software"), to deal
+## in the Software without restriction, including without limitation the rights
+## to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+## copies of the Software, and to permit persons to whom the Software is
+## furnished to do so, subject to the following conditions:
+##
+## The above copyright notice and this permission notice shall be included in all
+## copies or substantial portions of the Software.
+##
+## THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+## IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+## FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+## AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+## LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+## OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+## SOFTWARE.
+##
+
+<%!
+import ucdp as u
+import ucdpsv as usv
+from ucdp_amba import types as t
+from ucdp_amba.ucdp_ahb_slice import APH_REGS, RSP_REGS
+
+SUFFIXES = {"src": ("_i", "_o"), "mid": ("_s", "_s"), "tgt": ("_o", "_i")}
+
+
+def ref(mod, side: str, name: str) -> str:
+  """Identifier of member `name` of the AHB type at `side` (`src`, `mid` or `tgt`)."""
+  fwd, bwd = SUFFIXES[side]
+  suffix = bwd if mod.ahbtype[name].orientation == u.BWD else fwd
+  return f"ahb_{side}_{name}{suffix}"
+%>
+
+<%inherit file="sv.mako"/>
+
+<%def name="logic(indent=0, skip=None)">\
+<%
+  rslvr = usv.get_resolver(mod)
+  ff_dly = f"#{rslvr.ff_dly} " if rslvr.ff_dly else ""
+%>\
+% if mod.use_pkg:
+
+  import ucdp_amba_pkg::*;
+% endif
+
+${parent.logic(indent=indent, skip=skip)}
+% if mod.regslice == "none":
+${feedthrough("src", "tgt")}\
+% elif mod.regslice == "forward":
+${fwd_slice(rslvr, ff_dly, "src", "tgt")}\
+% elif mod.regslice == "backward":
+${bwd_slice(rslvr, ff_dly, "src", "tgt")}\
+% else:
+${fwd_slice(rslvr, ff_dly, "src", "mid")}\
+${bwd_slice(rslvr, ff_dly, "mid", "tgt")}\
+% endif
+</%def>
+
+<%def name="feedthrough(up, dn)">\
+<%
+  items = mod.ahbtype.values()
+%>\
+  // === feed-through ===================
+% for item in items:
+%   if item.orientation == u.BWD:
+  assign ${ref(mod, up, item.name)} = ${ref(mod, dn, item.name)};
+%   else:
+  assign ${ref(mod, dn, item.name)} = ${ref(mod, up, item.name)};
+%   endif
+% endfor
+
+</%def>
+
+<%def name="fwd_slice(rslvr, ff_dly, up, dn)">\
+<%
+  items = {item.name: item for item in mod.ahbtype.values()}
+  is_slv = "hsel" in items
+  if is_slv:
+    up_rdy = ref(mod, up, "hready")
+    up_rdyout = ref(mod, up, "hreadyout")
+    dn_rdy = ref(mod, dn, "hready")
+    dn_rdyout = ref(mod, dn, "hreadyout")
+  else:
+    up_rdy = up_rdyout = ref(mod, up, "hready")
+    dn_rdy = dn_rdyout = ref(mod, dn, "hready")
+  up_htrans = ref(mod, up, "htrans")
+  aph_regs = [name for name in APH_REGS if name in items]
+  bwd = [name for name in items if items[name].orientation == u.BWD and name not in ("hready", "hreadyout")]
+  dph = [name for name in ("hwdata", "hwstrb", "hwuser") if name in items]
+%>\
+  // === forward register slice =========
+  // the address phase is registered and forwarded as NONSEQ SINGLE transfer one clock cycle later
+% if is_slv:
+  assign fwd_valid_s = ((${ref(mod, up, "hsel")} == 1'b1) &&
+                        ((${up_htrans} == ahb_trans_nonseq_e) || (${up_htrans} == ahb_trans_seq_e))) ? 1'b1 : 1'b0;
+% else:
+  assign fwd_valid_s = ((${up_htrans} == ahb_trans_nonseq_e) || (${up_htrans} == ahb_trans_seq_e)) ? 1'b1 : 1'b0;
+% endif
+
+  always_ff @(posedge main_clk_i or negedge main_rst_an_i) begin: proc_fwd
+    if (main_rst_an_i == 1'b0) begin
+      fwd_pend_r <= ${ff_dly}1'b0;
+      fwd_dph_r <= ${ff_dly}1'b0;
+% for name in aph_regs:
+      fwd_${name}_r <= ${ff_dly}${rslvr.get_default(items[name].type_)};
+% endfor
+    end else begin
+      if (${up_rdy} == 1'b1) begin  // the address phase ends with the current data phase
+        fwd_pend_r <= ${ff_dly}fwd_valid_s;
+% for name in aph_regs:
+        fwd_${name}_r <= ${ff_dly}${ref(mod, up, name)};
+% endfor
+      end else if (${dn_rdy} == 1'b1) begin
+        fwd_pend_r <= ${ff_dly}1'b0;
+      end
+      if (${dn_rdy} == 1'b1) begin
+        fwd_dph_r <= ${ff_dly}fwd_pend_r;
+      end
+    end
+  end
+
+% if is_slv:
+  assign ${ref(mod, dn, "hsel")} = fwd_pend_r;
+% endif
+  assign ${ref(mod, dn, "htrans")} = (fwd_pend_r == 1'b1) ? ahb_trans_nonseq_e : ahb_trans_idle_e;
+% if "hburst" in items:
+  assign ${ref(mod, dn, "hburst")} = ahb_burst_single_e;
+% endif
+% for name in aph_regs:
+  assign ${ref(mod, dn, name)} = fwd_${name}_r;
+% endfor
+% for name in dph:
+  assign ${ref(mod, dn, name)} = ${ref(mod, up, name)};
+% endfor
+% if is_slv:
+  assign ${dn_rdy} = (fwd_dph_r == 1'b1) ? ${dn_rdyout} : 1'b1;
+% endif
+
+  assign ${up_rdyout} = (fwd_dph_r == 1'b1) ? ${dn_rdy} : ~fwd_pend_r;
+% for name in bwd:
+%   if name == "hresp":
+  assign ${ref(mod, up, name)} = (fwd_dph_r == 1'b1) ? ${ref(mod, dn, name)} : ahb_resp_okay_e;
+%   elif name == "hexokay":
+  assign ${ref(mod, up, name)} = (fwd_dph_r == 1'b1) ? ${ref(mod, dn, name)} : ahb_hexok_error_e;
+%   else:
+  assign ${ref(mod, up, name)} = ${ref(mod, dn, name)};
+%   endif
+% endfor
+
+</%def>
+
+<%def name="bwd_slice(rslvr, ff_dly, up, dn)">\
+<%
+  items = {item.name: item for item in mod.ahbtype.values()}
+  is_slv = "hsel" in items
+  if is_slv:
+    up_rdyout = ref(mod, up, "hreadyout")
+    dn_rdyout = ref(mod, dn, "hreadyout")
+  else:
+    up_rdyout = ref(mod, up, "hready")
+    dn_rdyout = ref(mod, dn, "hready")
+  up_htrans = ref(mod, up, "htrans")
+  dn_htrans = ref(mod, dn, "htrans")
+  rsp_regs = [name for name in RSP_REGS if name in items]
+  fwd = [name for name in items if items[name].orientation == u.FWD and name not in ("htrans", "hready")]
+%>\
+  // === backward register slice ========
+  // the response is registered, the next transfer is held back until the response is forwarded
+% if is_slv:
+  assign bwd_valid_s = ((bwd_dph_r == 1'b0) && (${ref(mod, up, "hsel")} == 1'b1) && (${ref(mod, up, "hready")} == 1'b1) &&
+                        ((${up_htrans} == ahb_trans_nonseq_e) || (${up_htrans} == ahb_trans_seq_e))) ? 1'b1 : 1'b0;
+% else:
+  assign bwd_valid_s = ((bwd_dph_r == 1'b0) &&
+                        ((${up_htrans} == ahb_trans_nonseq_e) || (${up_htrans} == ahb_trans_seq_e))) ? 1'b1 : 1'b0;
+% endif
+
+  always_ff @(posedge main_clk_i or negedge main_rst_an_i) begin: proc_bwd
+    if (main_rst_an_i == 1'b0) begin
+      bwd_dph_r <= ${ff_dly}1'b0;
+% for name in rsp_regs:
+      bwd_${name}_r <= ${ff_dly}${rslvr.get_default(items[name].type_)};
+% endfor
+    end else begin
+      if (bwd_dph_r == 1'b0) begin
+        bwd_dph_r <= ${ff_dly}bwd_valid_s;
+        bwd_hresp_r <= ${ff_dly}ahb_resp_okay_e;
+      end else begin
+        bwd_dph_r <= ${ff_dly}~${dn_rdyout};
+        bwd_hresp_r <= ${ff_dly}${ref(mod, dn, "hresp")};  // the two-cycle ERROR response is delayed as a whole
+      end
+% if len(rsp_regs) > 1:
+      if ((bwd_dph_r == 1'b1) && (${dn_rdyout} == 1'b1)) begin
+%   for name in rsp_regs:
+%     if name != "hresp":
+        bwd_${name}_r <= ${ff_dly}${ref(mod, dn, name)};
+%     endif
+%   endfor
+      end
+% endif
+    end
+  end
+
+  always_comb begin: proc_bwd_htrans
+    if (bwd_dph_r == 1'b0) begin
+      ${dn_htrans} = ${up_htrans};
+    end else if ((${up_htrans} == ahb_trans_seq_e) || (${up_htrans} == ahb_trans_busy_e)) begin
+      ${dn_htrans} = ahb_trans_busy_e;  // the burst continues after the data phase
+    end else begin
+      ${dn_htrans} = ahb_trans_idle_e;
+    end
+  end
+
+% for name in fwd:
+  assign ${ref(mod, dn, name)} = ${ref(mod, up, name)};
+% endfor
+% if is_slv:
+  assign ${ref(mod, dn, "hready")} = (bwd_dph_r == 1'b1) ? ${dn_rdyout} : ${ref(mod, up, "hready")};
+% endif
+
+  assign ${up_rdyout} = ~bwd_dph_r;
+% for name in rsp_regs:
+  assign ${ref(mod, up, name)} = bwd_${name}_r;
+% endfor
+
+</%def>
@@ -31,10 +31,10 @@ from logging import getLogger
 from typing import Any, ClassVar, NamedTuple
 
 import ucdp as u
-from aligntext import Align, center, left
 from icdutil import num
 
 from . import types as t
+from .ucdp_amba_pkg import UcdpAmbaPkgMod
 
 LOGGER = getLogger(__name__)
 
@@ -88,6 +88,8 @@ class UcdpAhb2ahbMod(u.ATailoredMod):
     source_type: t.AhbMstType | t.AhbSlvType
     target_type: t.AhbMstType | t.AhbSlvType
     async_conv: bool = False
+    use_pkg: bool = False
+    """Import AMBA Constants from Shared `ucdp_amba_pkg` instead of Local Definition."""
     _conv_spec: dict[str, Any] = u.PrivateField(default_factory=dict)
     __ext_param: dict[str, Any] = u.PrivateField(default_factory=dict)
 
@@ -340,7 +342,9 @@ class UcdpAhb2ahbMod(u.ATailoredMod):
 
     def _build_dep(self):
         # TODO: async
-        if self.source_type != self.target_type:
+        if self.use_pkg:
+            UcdpAmbaPkgMod(self, "u_amba_pkg", virtual=True)
+        elif self.source_type != self.target_type:
             self.add_type_consts(t.AhbTransType())
             self.add_type_consts(t.AhbBurstType())
         self._determine_conv()
@@ -547,6 +551,9 @@ class UcdpAhb2ahbMod(u.ATailoredMod):
         """Converter Overview."""
         if self.source_type == self.target_type:
             return "No conversion, just feed-through."
+        # late import, `aligntext` is only needed for the overview
+        from aligntext import Align, center, left
+
         self._determine_conv()
         cdir = self._conv_spec["dir"].replace("s", "Slave")
         cdir = cdir.replace("m", "Master")
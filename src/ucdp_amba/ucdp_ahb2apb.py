@@ -33,9 +33,10 @@ import ucdp as u
 from humannum import bytes_
 from icdutil import num
 from ucdp_addr import AddrDecoder, AddrRef, AddrSlave
-from ucdp_glbl.irq import LevelIrqType
 
+from . import addrdec
 from . import types as t
+from .ucdp_amba_pkg import UcdpAmbaPkgMod
 
 LOGGER = getLogger(__name__)
 
@@ -49,20 +50,19 @@ class Slave(AddrSlave):
     """Protocol Version."""
 
 
-class Ahb2ApbFsmType(u.AEnumType):
+class Ahb2ApbFsmType(t.AFsmType):
     """
     FSM Type for AHB to APB Bridge.
     """
 
-    keytype: u.UintType = u.UintType(2)
     title: str = "AHB to APB FSM Type"
     comment: str = "AHB to APB FSM Type"
-
-    def _build(self):
-        self._add(0, "idle", "No transfer")
-        self._add(1, "apb_ctrl", "Control Phase")
-        self._add(2, "apb_data", "Data Phase")
-        self._add(3, "ahb_err", "Error Phase")
+    states: ClassVar[tuple[tuple[str, str], ...]] = (
+        ("idle", "No transfer"),
+        ("apb_ctrl", "Control Phase"),
+        ("apb_data", "Data Phase"),
+        ("ahb_err", "Error Phase"),
+    )
 
 
 class UcdpAhb2apbMod(u.ATailoredMod, AddrDecoder):
@@ -73,6 +73,10 @@ class UcdpAhb2apbMod(u.ATailoredMod, AddrDecoder):
         proto (AmbaProto): Defines Protocol
         errirq (bool): Use Error Interrupt instead of standard AHB Response Signalling
         optbw (bool): Optimized Bandwidth, faster response but increased logic depth
+        optdec (bool): Logic-Minimized Address Decoding
+        mindecbits (bool): Decode Minimal Set of Address Bits only
+        splitdec (bool): Two-Level Address Decoding
+        fsm_encoding (FsmEncoding): FSM State Encoding
 
     Example:
 
@@ -93,6 +97,23 @@ class UcdpAhb2apbMod(u.ATailoredMod, AddrDecoder):
         | uart      | Slave | `+0x0`    | `1024x32 (4 KB)` | Sub   |            |
         | spi       | Slave | `+0x1000` | `1024x32 (4 KB)` | Sub   |            |
         <BLANKLINE>
+
+    The Logic-Minimized Address Decoding of the sub-decoder ignores unmapped address space:
+
+        >>> class OptDecMod(u.AMod):
+        ...     def _build(self):
+        ...         ahb2apb = UcdpAhb2apbMod(self, "u_ahb2apb", optdec=True)
+        ...         ahb2apb.add_slave("uart")
+        ...         ahb2apb.add_slave("spi")
+
+        >>> ahb2apb = OptDecMod().get_inst("u_ahb2apb")
+        >>> print(addrdec.get_overview({"u_ahb2apb": ahb2apb.get_decoder()}))
+        | Decoder   | Slice | Masks | Comparators | Minimized Masks | Minimized Comparators | Regions |
+        | --------- | ----- | ----- | ----------- | --------------- | --------------------- | ------- |
+        | u_ahb2apb | 31:12 | 2     | 40          | 2               | 2                     | -       |
+        <BLANKLINE>
+        >>> ahb2apb.get_decoder().get_casez("spi")
+        "20'b???????????????????1"
     """
 
     filelists: ClassVar[u.ModFileLists] = (
@@ -111,6 +132,16 @@ class UcdpAhb2apbMod(u.ATailoredMod, AddrDecoder):
     default_size: u.Bytes | None = 4096
     ahb_addrwidth: int = 32
     datawidth: int = 32
+    use_pkg: bool = False
+    """Import AMBA Constants from Shared `ucdp_amba_pkg` instead of Local Definition."""
+    optdec: bool = False
+    """Logic-Minimized Address Decoding. Unmapped address space is don't care for sub-decoders (`is_sub`)."""
+    mindecbits: bool = False
+    """Decode Minimal Set of Address Bits distinguishing all slaves, and unmapped address space without `is_sub`."""
+    splitdec: bool = False
+    """Two-Level Address Decoding. Coarse region pre-decoding and fine decoding per region."""
+    fsm_encoding: t.FsmEncoding = "binary"
+    """FSM State Encoding. Shared `ucdp_amba_pkg` constants are used for `binary` only."""
 
     def add_slave(
         self,
@@ -196,6 +227,9 @@ class UcdpAhb2apbMod(u.ATailoredMod, AddrDecoder):
     def _build(self):
         self.add_port(u.ClkRstAnType(), "main_i")
         if self.errirq:
+            # late import, `ucdp_glbl.irq` is only needed with `errirq`
+            from ucdp_glbl.irq import LevelIrqType
+
             title = "APB Error Interrupt"
             self.add_port(LevelIrqType(), "irq_o", title=title, comment=title)
         self.add_port(
@@ -205,16 +239,21 @@ class UcdpAhb2apbMod(u.ATailoredMod, AddrDecoder):
     def _build_dep(self):
         self._check_slaves()
         use_hauser = self._check_hauser()
-        self.add_type_consts(t.AhbTransType())
-        self.add_type_consts(t.AhbSizeType())
-        self.add_type_consts(t.AhbWriteType())
-        self.add_type_consts(t.ApbReadyType())
-        self.add_type_consts(t.ApbRespType())
-        self.add_type_consts(Ahb2ApbFsmType(), name="fsm", item_suffix="st")
+        if self.use_pkg:
+            UcdpAmbaPkgMod(self, "u_amba_pkg", virtual=True)
+            if self.fsm_encoding != "binary":
+                self.add_type_consts(self.fsmtype, name="fsm", item_suffix="st")
+        else:
+            self.add_type_consts(t.AhbTransType())
+            self.add_type_consts(t.AhbSizeType())
+            self.add_type_consts(t.AhbWriteType())
+            self.add_type_consts(t.ApbReadyType())
+            self.add_type_consts(t.ApbRespType())
+            self.add_type_consts(self.fsmtype, name="fsm", item_suffix="st")
         self.add_signal(u.BitType(), "new_xfer_s")
         self.add_signal(u.BitType(), "valid_addr_s")
         self.add_signal(u.BitType(), "ahb_slv_sel_s")
-        self.add_signal(Ahb2ApbFsmType(), "fsm_r")
+        self.add_signal(self.fsmtype, "fsm_r")
         self.add_signal(t.AhbReadyType(), "hready_r")
         use_hstrb, use_pstrb = self._check_wstrb()
         if use_hstrb:
@@ -243,11 +282,33 @@ class UcdpAhb2apbMod(u.ATailoredMod, AddrDecoder):
             self.add_signal(t.ApbSelType(), f"apb_{aspc.name}_sel_s")
             self.add_signal(t.ApbSelType(), f"apb_{aspc.name}_sel_r")
         if self.errirq:
-            self.add_signal(LevelIrqType(), "irq_r")
+            self.add_signal(self.ports["irq_o"].type_, "irq_r")
+
+    @property
+    def fsmtype(self) -> Ahb2ApbFsmType:
+        """FSM Type with `fsm_encoding`."""
+        return Ahb2ApbFsmType(encoding=self.fsm_encoding)
+
+    def get_decoder(self) -> addrdec.Decoder:
+        """Address Decoder."""
+        dec_bits = [num.calc_lowest_bit_set(aspc.size) for aspc in self.addrmap]
+        decslice = u.Slice(left=self.ahb_addrwidth - 1, right=min(dec_bits))
+        addrspaces = {aspc.name: [aspc] for aspc in self.addrmap}
+        return addrdec.compile_decoder(
+            decslice,
+            addrspaces,
+            optimize=self.optdec,
+            dontcare=self.is_sub,
+            minbits=self.mindecbits,
+            split=self.splitdec,
+        )
 
     def get_overview(self):
         """Overview."""
-        return self.addrmap.get_overview(minimal=True)
+        overview = self.addrmap.get_overview(minimal=True)
+        if self.optdec or self.mindecbits or self.splitdec:
+            overview = f"{overview}\n\n\n{addrdec.get_overview({self.name: self.get_decoder()})}"
+        return overview
 
     @staticmethod
     def build_top(**kwargs):
@@ -291,4 +352,23 @@ class UcdpAhb2apbExampleMod(u.AMod):
         ahb2apb.add_slave("foo", proto=apb3)
         ahb2apb.add_slave("bar", size="1KB", proto=apb5)
         ahb2apb.add_slave("baz", size="13kB", proto=apb3)
+
+        ahb2apb = UcdpAhb2apbMod(self, "u_optdec", proto=amba5, optdec=True)
+        ahb2apb.add_slave("foo", proto=apb3)
+        ahb2apb.add_slave("bar", size="1KB", proto=apb5)
+        ahb2apb.add_slave("baz", size="13kB", proto=apb3)
+
+        ahb2apb = UcdpAhb2apbMod(self, "u_mindec", proto=amba5, mindecbits=True)
+        ahb2apb.add_slave("foo", proto=apb3)
+        ahb2apb.add_slave("bar", size="1KB", proto=apb5)
+        ahb2apb.add_slave("baz", size="13kB", proto=apb3)
+
+        ahb2apb = UcdpAhb2apbMod(self, "u_splitdec", proto=amba5, splitdec=True)
+        for idx in range(12):
+            ahb2apb.add_slave(f"slv{idx}", proto=apb5 if idx % 2 else apb3)
         # slv.add_addrrange(size="3kB")
+
+        for fsm_encoding in ("onehot", "gray"):
+            ahb2apb = UcdpAhb2apbMod(self, f"u_fsm_{fsm_encoding}", proto=amba5, fsm_encoding=fsm_encoding)
+            ahb2apb.add_slave("foo", proto=apb3)
+            ahb2apb.add_slave("bar", size="1KB", proto=apb5)
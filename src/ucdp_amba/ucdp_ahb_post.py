@@ -0,0 +1,161 @@
+#
+# MIT License
+#
+# Copyright (c) 2024-2025 nbiotcloud
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+#
+"""
+Unified Chip Design Platform - AMBA - AHB Posted-Write Buffer.
+"""
+
+from typing import ClassVar
+
+import ucdp as u
+
+from . import types as t
+from .ucdp_ahb_slice import APH_REGS
+from .ucdp_amba_pkg import UcdpAmbaPkgMod
+
+BUF_APH_REGS = ("haddr", "hsize", "hprot", "hnonsec", "hmaster", "hauser")
+"""Address Phase Signals stored per Posted Write."""
+
+BUF_DPH_REGS = ("hwdata", "hwstrb", "hwuser")
+"""Data Phase Signals stored per Posted Write."""
+
+
+class UcdpAhbPostMod(u.ATailoredMod):
+    """
+    AHB Posted-Write Buffer.
+
+    Buffer between the AHB slave source `ahb_src_i` and the AHB slave target `ahb_tgt_o` (both `AhbSlvType`).
+
+    Bufferable writes (`hprot[2]` set) are answered with `OKAY` without wait states, stored and drained to the target
+    in order as `NONSEQ` `SINGLE` transfers. Non-bufferable, exclusive and locked writes are not posted.
+    The source waits only for a free entry on a posted write, and for the drained buffer on any other transfer.
+    With an empty buffer, transfers to an idle target are forwarded without delay.
+
+    An `ERROR` response of the target to a posted write is not forwarded, as its transfer already ended.
+    The posted write is dropped instead and the error interrupt `irq_o` is set for one clock cycle.
+
+        >>> mod = UcdpAhbPostMod(ahbtype=t.AhbSlvType(), depth=4)
+        >>> mod.ports["irq_o"]
+        Port(LevelIrqType(), 'irq_o', direction=OUT, doc=Doc(title='Posted Write Error Interrupt', ...))
+        >>> [ident.name for ident in mod.portssignals if ident.name.startswith("buf_") and ident.name.endswith("_r")]
+        ['buf_cnt_r', 'buf_wrptr_r', 'buf_rdptr_r', 'buf_haddr_r', 'buf_hsize_r', 'buf_hprot_r', 'buf_hwdata_r']
+    """
+
+    filelists: ClassVar[u.ModFileLists] = (
+        u.ModFileList(
+            name="hdl",
+            gen="full",
+            filepaths=("$PRJROOT/{mod.topmodname}/{mod.modname}.sv"),
+            template_filepaths=("ucdp_ahb_post.sv.mako", "sv.mako"),
+        ),
+    )
+
+    ahbtype: t.AhbSlvType
+    """AHB Type of Source and Target."""
+    depth: int = 2
+    """Number of Posted Writes."""
+    use_pkg: bool = False
+    """Import AMBA Constants from Shared `ucdp_amba_pkg` instead of Local Definition."""
+
+    def _build(self):
+        # late import, `ucdp_glbl.irq` is only needed with a posted-write buffer
+        from ucdp_glbl.irq import LevelIrqType
+
+        if self.depth < 1:
+            raise ValueError(f"depth must be at least 1, got {self.depth}")
+        self.add_port(u.ClkRstAnType(), "main_i")
+        title = "Posted Write Error Interrupt"
+        self.add_port(LevelIrqType(), "irq_o", title=title, comment=title)
+        self.add_port(self.ahbtype, "ahb_src_i", title="AHB Source Input", comment="AHB Source")
+        self.add_port(self.ahbtype, "ahb_tgt_o", title="AHB Target Output", comment="AHB Target")
+
+    def _build_dep(self):
+        proto = self.ahbtype.proto
+        if self.use_pkg:
+            UcdpAmbaPkgMod(self, "u_amba_pkg", virtual=True)
+        else:
+            self.add_type_consts(t.AhbTransType())
+            self.add_type_consts(t.AhbRespType())
+            self.add_type_consts(t.AhbWriteType())
+            if proto.has_hburst:
+                self.add_type_consts(t.AhbBurstType())
+            if proto.has_exclxfers:
+                self.add_type_consts(t.AhbHexokType())
+        items = {item.name: item for item in self.ahbtype.values()}
+        self.add_signal(u.BitType(), "src_valid_s", comment="transfer requested")
+        self.add_signal(u.BitType(), "src_post_s", comment="posted write requested")
+        self.add_signal(u.BitType(), "src_pass_s", comment="transfer forwarded to the idle target")
+        self.add_signal(u.BitType(), "src_pst_r", comment="data phase of a posted write")
+        self.add_signal(u.BitType(), "src_npst_r", comment="data phase of a non-posted transfer")
+        self.add_signal(u.BitType(), "src_hld_r", comment="non-posted transfer held back until the buffer is drained")
+        for name in APH_REGS:
+            if name in items:
+                self.add_signal(items[name].type_, f"src_{name}_r")
+        self.add_signal(u.BitType(), "buf_empty_s")
+        self.add_signal(u.BitType(), "buf_full_s")
+        self.add_signal(u.BitType(), "buf_push_s", comment="posted write stored")
+        self.add_signal(u.BitType(), "buf_pop_s", comment="posted write drained")
+        self.add_signal(u.UintType(self.depth.bit_length()), "buf_cnt_r", comment="number of posted writes")
+        self.add_signal(u.UintType(self.ptrwidth), "buf_wrptr_r")
+        self.add_signal(u.UintType(self.ptrwidth), "buf_rdptr_r")
+        for name in (*BUF_APH_REGS, *BUF_DPH_REGS):
+            if name in items:
+                self.add_signal(u.ArrayType(items[name].type_, self.depth), f"buf_{name}_r")
+        self.add_signal(u.BitType(), "tgt_valid_s", comment="transfer to target")
+        self.add_signal(u.BitType(), "tgt_dph_r", comment="data phase at target")
+        self.add_signal(u.BitType(), "tgt_npst_r", comment="data phase of a non-posted transfer at target")
+        self.add_signal(u.BitType(), "tgt_fwd_r", comment="first data phase cycle of a forwarded posted write")
+        for name in BUF_DPH_REGS:
+            if name in items:
+                self.add_signal(items[name].type_, f"tgt_{name}_r")
+        self.add_signal(self.ports["irq_o"].type_, "irq_r")
+
+    @property
+    def ptrwidth(self) -> int:
+        """Width of the Buffer Pointers."""
+        return max(1, (self.depth - 1).bit_length())
+
+    @staticmethod
+    def build_top(**kwargs):
+        """Build example top module and return it."""
+        return UcdpAhbPostExampleMod()
+
+
+class UcdpAhbPostExampleMod(u.AMod):
+    """
+    Just an Example Posted-Write Buffer.
+    """
+
+    def _build(self):
+        proto = t.AmbaProto(
+            name="smlp",
+            has_wstrb=True,
+            hmaster_width=4,
+            has_hmastlock=True,
+            has_hnonsec=True,
+            has_exclxfers=True,
+            ausertype=u.UintType(4),
+        )
+        UcdpAhbPostMod(self, "u_depth1", ahbtype=t.AhbSlvType(), depth=1)
+        UcdpAhbPostMod(self, "u_depth3", ahbtype=t.AhbSlvType(proto=proto), depth=3)
+        UcdpAhbPostMod(self, "u_depth4", ahbtype=t.AhbSlvType(), depth=4, use_pkg=True)
@@ -0,0 +1,149 @@
+#
+# MIT License
+#
+# Copyright (c) 2024-2025 nbiotcloud
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+#
+"""
+Unified Chip Design Platform - AMBA - AHB Register Slice.
+"""
+
+from typing import ClassVar, Literal
+
+import ucdp as u
+
+from . import types as t
+from .ucdp_amba_pkg import UcdpAmbaPkgMod
+
+RegSlice = Literal["none", "forward", "backward", "full"]
+"""
+AHB Register Slice.
+
+* `none`: no register slice.
+* `forward`: register the address phase. Every transfer is forwarded as `NONSEQ` `SINGLE` transfer.
+* `backward`: register `HREADY` and the response. Transfers are held back until the response is forwarded.
+* `full`: `forward` followed by `backward`. All paths between source and target are registered, except the write data.
+"""
+
+REGSLICE_WAITS: dict[str, int] = {"none": 0, "forward": 1, "backward": 1, "full": 2}
+"""Additional Wait States per Transfer of a Register Slice."""
+
+APH_REGS = ("haddr", "hwrite", "hsize", "hprot", "hnonsec", "hmastlock", "hexcl", "hmaster", "hauser")
+"""Address Phase Signals registered by the Forward Register Slice."""
+
+RSP_REGS = ("hresp", "hrdata", "hexokay", "hruser", "hbuser")
+"""Response Signals registered by the Backward Register Slice."""
+
+
+class UcdpAhbSliceMod(u.ATailoredMod):
+    """
+    AHB Register Slice.
+
+    Pipeline stage between the AHB source `ahb_src_i` and the AHB target `ahb_tgt_o` of the same type,
+    either master (`AhbMstType`) or slave (`AhbSlvType`) side.
+    Both sides obey the AHB protocol. Every transfer costs `REGSLICE_WAITS[regslice]` additional wait states.
+
+        >>> mod = UcdpAhbSliceMod(ahbtype=t.AhbMstType(), regslice="full")
+        >>> mod.waits
+        2
+        >>> [ident.name for ident in mod.portssignals if ident.name.startswith("fwd_")]
+        ['fwd_valid_s', 'fwd_pend_r', 'fwd_dph_r', 'fwd_haddr_r', 'fwd_hwrite_r', 'fwd_hsize_r', 'fwd_hprot_r']
+        >>> [ident.name for ident in mod.portssignals if ident.name.startswith("bwd_")]
+        ['bwd_valid_s', 'bwd_dph_r', 'bwd_hresp_r', 'bwd_hrdata_r']
+    """
+
+    filelists: ClassVar[u.ModFileLists] = (
+        u.ModFileList(
+            name="hdl",
+            gen="full",
+            filepaths=("$PRJROOT/{mod.topmodname}/{mod.modname}.sv"),
+            template_filepaths=("ucdp_ahb_slice.sv.mako", "sv.mako"),
+        ),
+    )
+
+    ahbtype: t.AhbMstType | t.AhbSlvType
+    """AHB Type of Source and Target."""
+    regslice: RegSlice = "full"
+    """Register Slice."""
+    use_pkg: bool = False
+    """Import AMBA Constants from Shared `ucdp_amba_pkg` instead of Local Definition."""
+
+    def _build(self):
+        self.add_port(u.ClkRstAnType(), "main_i")
+        self.add_port(self.ahbtype, "ahb_src_i", title="AHB Source Input", comment="AHB Source")
+        self.add_port(self.ahbtype, "ahb_tgt_o", title="AHB Target Output", comment="AHB Target")
+
+    def _build_dep(self):  # noqa: C901
+        proto = self.ahbtype.proto
+        if self.use_pkg:
+            UcdpAmbaPkgMod(self, "u_amba_pkg", virtual=True)
+        else:
+            self.add_type_consts(t.AhbTransType())
+            self.add_type_consts(t.AhbRespType())
+            if proto.has_hburst:
+                self.add_type_consts(t.AhbBurstType())
+            if proto.has_exclxfers:
+                self.add_type_consts(t.AhbHexokType())
+        items = {item.name: item for item in self.ahbtype.values()}
+        if self.regslice == "full":
+            self.add_signal(self.ahbtype, "ahb_mid_s", comment="Between Forward and Backward Register Slice")
+        if self.regslice in ("forward", "full"):
+            self.add_signal(u.BitType(), "fwd_valid_s", comment="transfer requested")
+            self.add_signal(u.BitType(), "fwd_pend_r", comment="registered address phase pending")
+            self.add_signal(u.BitType(), "fwd_dph_r", comment="data phase of the forwarded transfer")
+            for name in APH_REGS:
+                if name in items:
+                    self.add_signal(items[name].type_, f"fwd_{name}_r")
+        if self.regslice in ("backward", "full"):
+            self.add_signal(u.BitType(), "bwd_valid_s", comment="transfer accepted")
+            self.add_signal(u.BitType(), "bwd_dph_r", comment="data phase of the forwarded transfer")
+            for name in RSP_REGS:
+                if name in items:
+                    self.add_signal(items[name].type_, f"bwd_{name}_r")
+
+    @property
+    def waits(self) -> int:
+        """Additional Wait States per Transfer."""
+        return REGSLICE_WAITS[self.regslice]
+
+    @staticmethod
+    def build_top(**kwargs):
+        """Build example top module and return it."""
+        return UcdpAhbSliceExampleMod()
+
+
+class UcdpAhbSliceExampleMod(u.AMod):
+    """
+    Just an Example Register Slice.
+    """
+
+    def _build(self):
+        proto = t.AmbaProto(
+            name="smlp",
+            has_wstrb=True,
+            hmaster_width=4,
+            has_hmastlock=True,
+            has_hnonsec=True,
+            has_exclxfers=True,
+            ausertype=u.UintType(4),
+        )
+        for regslice in ("none", "forward", "backward", "full"):
+            UcdpAhbSliceMod(self, f"u_mst_{regslice}", ahbtype=t.AhbMstType(), regslice=regslice)
+            UcdpAhbSliceMod(self, f"u_slv_{regslice}", ahbtype=t.AhbSlvType(proto=proto), regslice=regslice)
@@ -0,0 +1,121 @@
+#
+# MIT License
+#
+# Copyright (c) 2025 nbiotcloud
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+#
+
+"""
+Unified Chip Design Platform - AMBA - Shared SystemVerilog Package.
+
+All AMBA enumerations and FSM encodings are defined once in `ucdp_amba_pkg`.
+AMBA modules with `use_pkg=True` import this package instead of defining them locally.
+
+Generated lines of a multilayer (2 masters, 2 slaves), an AHB to APB bridge (2 slaves) and an AHB to AHB converter:
+
+| Module        | `use_pkg=False` | `use_pkg=True` |
+|---------------|-----------------|----------------|
+| ahb_ml        | 906             | 842            |
+| ahb2apb       | 333             | 278            |
+| ahb2ahb       | 175             | 150            |
+| ucdp_amba_pkg | -               | 146            |
+| total         | 1414            | 1416           |
+
+The package is generated once, so with a single instance of each module the output size is unchanged.
+Every further module saves its 25-64 lines of local constants.
+"""
+
+from typing import ClassVar
+
+import ucdp as u
+
+from . import types as t
+
+
+class UcdpAmbaPkgMod(u.AMod):
+    """
+    Shared AMBA SystemVerilog Package.
+
+    It is not instantiated in RTL, but added as virtual instance by all AMBA modules with `use_pkg=True`.
+
+    >>> pkg = UcdpAmbaPkgMod()
+    >>> pkg.modname
+    'ucdp_amba_pkg'
+    >>> pkg.namespace['ahb_trans_idle_e']
+    Const(UintType(2), 'ahb_trans_idle_e', doc=Doc(title='No transfer'))
+    >>> pkg.namespace['ahb_ml_fsm_idle_st']
+    Const(UintType(3), 'ahb_ml_fsm_idle_st', doc=Doc(title='No transfer'))
+    """
+
+    filelists: ClassVar[u.ModFileLists] = (
+        u.ModFileList(
+            name="hdl",
+            gen="full",
+            filepaths=("$PRJROOT/{mod.topmodname}/{mod.modname}.sv"),
+            template_filepaths=("ucdp_amba_pkg.sv.mako", "sv.mako"),
+        ),
+    )
+
+    def _build(self):
+        # late import, as these modules depend on this package
+        from .ucdp_ahb2apb import Ahb2ApbFsmType
+        from .ucdp_ahb_ml import AhbFsmMlType
+
+        self.add_type_consts(t.AhbTransType())
+        self.add_type_consts(t.AhbRespType())
+        self.add_type_consts(t.AhbSizeType())
+        self.add_type_consts(t.AhbBurstType())
+        self.add_type_consts(t.AhbWriteType())
+        self.add_type_consts(t.AhbHexokType())
+        self.add_type_consts(t.ApbReadyType())
+        self.add_type_consts(t.ApbRespType())
+        self.add_type_consts(AhbFsmMlType(), name="ahb_ml_fsm", item_suffix="st")
+        self.add_type_consts(Ahb2ApbFsmType(), name="ahb2apb_fsm", item_suffix="st")
+
+
+class UcdpAmbaPkgExampleMod(u.AMod):
+    """
+    Just an Example with Shared AMBA Package.
+
+        >>> mod = UcdpAmbaPkgExampleMod()
+        >>> [inst.modname for inst in mod.insts]
+        ['ucdp_amba_pkg_example_ml', 'ucdp_amba_pkg_example_ahb2apb']
+        >>> mod.get_inst('u_ml').get_inst('u_amba_pkg').virtual
+        True
+    """
+
+    def _build(self):
+        # late import, as these modules depend on this package
+        from .ucdp_ahb2apb import UcdpAhb2apbMod
+        from .ucdp_ahb_ml import UcdpAhbMlMod
+
+        ml = UcdpAhbMlMod(self, "u_ml", use_pkg=True)
+        ml.add_master("cpu")
+        ml.add_master("dma")
+
+        slv = ml.add_slave("ram", masternames=["cpu", "dma"])
+        slv.add_addrrange(0xF0000000, size="64kb")
+
+        slv = ml.add_slave("periph", masternames=["cpu"])
+        slv.add_addrrange(0xF0010000, size="64kb")
+
+        ahb2apb = UcdpAhb2apbMod(self, "u_ahb2apb", use_pkg=True)
+        ahb2apb.add_slave("uart")
+        ahb2apb.add_slave("spi")
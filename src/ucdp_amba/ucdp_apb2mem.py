@@ -31,7 +31,6 @@ from typing import ClassVar
 
 import ucdp as u
 from icdutil.num import is_power_of2
-from ucdp_addr.addrspace import Addrspace
 from ucdp_glbl.mem import Addressing, MemIoType
 
 from . import types as t
@@ -109,6 +108,9 @@ class UcdpApb2memMod(u.ATailoredMod):
 
     def get_overview(self) -> str:
         """Overview."""
+        # late import, `ucdp_addr` is only needed for the overview
+        from ucdp_addr.addrspace import Addrspace
+
         mem_addrwidth = self.mem_addrwidth or self.addrwidth
         addressing = f"Addressing-Width: {self.addressing}"
         if self.addressing == "data":
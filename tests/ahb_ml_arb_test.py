@@ -0,0 +1,138 @@
+#
+# MIT License
+#
+# Copyright (c) 2024-2025 nbiotcloud
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+#
+
+
+"""
+Unified Chip Design Platform - AMBA - AHB Multilayer Arbitration Tests.
+
+All masters of :any:`UcdpAhbMlArbExampleMod` saturate one slave after the other
+with back-to-back single transfers, while the slave never inserts wait states.
+The slave must be busy in every clock cycle and
+the bandwidth share of every master must match the arbitration policy of the slave.
+"""
+
+import logging
+
+import cocotb
+from cocotb.clock import Clock
+from cocotb.triggers import RisingEdge
+
+from tests.ahb_driver import BurstType, SizeType, TransType
+
+MASTERS = ("cpu", "dsp", "dma")
+"""Masters in Order of Position, with the Weights 3, 2 and 1."""
+
+SLAVES = {
+    "mem_fixed": (0x0000, (1.0, 0.0, 0.0)),
+    "mem_rr": (0x1000, (1 / 3, 1 / 3, 1 / 3)),
+    "mem_wrr": (0x2000, (3 / 6, 2 / 6, 1 / 6)),
+    "mem_lrg": (0x3000, (1 / 3, 1 / 3, 1 / 3)),
+}
+"""Base Address and Expected Bandwidth Share per Master."""
+
+CYCLES = 600
+TOLERANCE = 0.02
+
+
+async def wait_clocks(clock, cycles):
+    """Helper Function."""
+    for _ in range(cycles):
+        await RisingEdge(clock)
+
+
+async def saturate(dut, mastername: str, addr: int, cycles: int) -> int:
+    """
+    Issue back-to-back single write transfers for `cycles` and return the number of accepted ones.
+
+    A transfer is accepted when its data phase ends, i.e. with `HREADY` high during the data phase of the master.
+    """
+    hclk = dut.main_clk_i
+    htrans = getattr(dut, f"ahb_mst_{mastername}_htrans_i")
+    hready = getattr(dut, f"ahb_mst_{mastername}_hready_o")
+    getattr(dut, f"ahb_mst_{mastername}_haddr_i").value = addr
+    getattr(dut, f"ahb_mst_{mastername}_hwrite_i").value = 1
+    getattr(dut, f"ahb_mst_{mastername}_hsize_i").value = SizeType.WORD
+    getattr(dut, f"ahb_mst_{mastername}_hburst_i").value = BurstType.SINGLE
+    htrans.value = TransType.NONSEQ
+    accepted = 0
+    dph = False
+    for _ in range(cycles):
+        await RisingEdge(hclk)
+        if hready.value:
+            if dph:
+                accepted += 1
+            # the address phase ends with HREADY and the data phase starts
+            dph = True
+    htrans.value = TransType.IDLE
+    # let the last data phase end, outside of the measurement
+    await RisingEdge(hclk)
+    while hready.value == 0:
+        await RisingEdge(hclk)
+    return accepted
+
+
+@cocotb.test()
+async def ahb_ml_arb_test(dut):
+    """Bandwidth Share per Arbitration Policy."""
+    log = logging.getLogger(__name__)
+    log.setLevel(logging.INFO)
+
+    hclk = dut.main_clk_i
+    rst_an = dut.main_rst_an_i
+
+    for mastername in MASTERS:
+        getattr(dut, f"ahb_mst_{mastername}_htrans_i").value = TransType.IDLE
+        getattr(dut, f"ahb_mst_{mastername}_haddr_i").value = 0
+        getattr(dut, f"ahb_mst_{mastername}_hwrite_i").value = 0
+        getattr(dut, f"ahb_mst_{mastername}_hwdata_i").value = 0
+        getattr(dut, f"ahb_mst_{mastername}_hsize_i").value = SizeType.WORD
+        getattr(dut, f"ahb_mst_{mastername}_hburst_i").value = BurstType.SINGLE
+        getattr(dut, f"ahb_mst_{mastername}_hprot_i").value = 0
+    for slavename in (*SLAVES, "periph"):
+        getattr(dut, f"ahb_slv_{slavename}_hreadyout_i").value = 1
+        getattr(dut, f"ahb_slv_{slavename}_hresp_i").value = 0
+        getattr(dut, f"ahb_slv_{slavename}_hrdata_i").value = 0
+
+    cocotb.start_soon(Clock(hclk, period=10).start())
+
+    # initial reset
+    rst_an.value = 0
+    await wait_clocks(hclk, 10)
+    rst_an.value = 1
+    await wait_clocks(hclk, 10)
+
+    for slavename, (baseaddr, expected) in SLAVES.items():
+        tasks = [
+            cocotb.start_soon(saturate(dut, mastername, baseaddr + 4 * idx, CYCLES))
+            for idx, mastername in enumerate(MASTERS)
+        ]
+        accepted = [await task for task in tasks]
+        shares = [count / sum(accepted) for count in accepted]
+        summary = ", ".join(f"{name}={share:.3f}" for name, share in zip(MASTERS, shares, strict=True))
+        log.info(f"{slavename}: {sum(accepted)} transfers in {CYCLES} cycles: {summary}")
+        # the slave is busy in every cycle, except the first address phase
+        assert sum(accepted) == CYCLES - 1, f"{slavename}: idle cycles"
+        for mastername, share, exp in zip(MASTERS, shares, expected, strict=True):
+            assert abs(share - exp) <= TOLERANCE, f"{slavename}: {mastername} got {share:.3f}, expected {exp:.3f}"
+        await wait_clocks(hclk, 5)
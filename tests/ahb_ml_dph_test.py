@@ -0,0 +1,222 @@
+#
+# MIT License
+#
+# Copyright (c) 2024-2025 nbiotcloud
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+#
+"""
+Unified Chip Design Platform - AMBA - AHB Multilayer Data Phase Tests.
+
+The masters of :any:`UcdpAhbMlExampleMod` issue back-to-back `NONSEQ` transfers to slaves with wait states.
+The address phase of the next transfer is issued while the current data phase is still in wait states.
+The data phase must keep its direction and its slave until it ends and no read data must be lost.
+This covers single-master and arbitrated slaves, slave switches, `INCR` bursts and unmapped addresses,
+which are answered with a two-cycle `ERROR` response after the current data phase.
+"""
+
+import logging
+import random
+
+import cocotb
+from cocotb.clock import Clock
+from cocotb.triggers import RisingEdge
+
+from tests.ahb_driver import BurstType, SizeType, TransType
+
+SLAVES = {"ram": 0xF0000000, "periph": 0xF0010000, "misc": 0xF0020000}
+"""Base Address per Slave."""
+
+UNMAPPED = 0x0
+"""Unmapped Address."""
+
+MASTERS = ("ext", "dsp")
+"""Masters in Order of Creation."""
+
+SEQUENCES = (
+    ("dsp", ("periph",)),
+    ("ext", ("misc",)),
+    ("dsp", ("ram",)),
+    ("ext", ("ram",)),
+    ("dsp", ("ram", "periph")),
+    ("ext", ("ram", "misc")),
+)
+"""Master and accessed Slaves per Sequence - `ram` is arbitrated, `periph` and `misc` have one master."""
+
+NUM = 32
+"""Transfers per Sequence."""
+
+
+async def wait_clocks(clock, cycles):
+    """Helper Function."""
+    for _ in range(cycles):
+        await RisingEdge(clock)
+
+
+async def slave(dut, slavename: str, waits: list[int], mem: dict[int, int]):
+    """Memory Slave with `waits[0]` wait states per transfer."""
+    hclk = dut.main_clk_i
+    hsel = getattr(dut, f"ahb_slv_{slavename}_hsel_o")
+    htrans = getattr(dut, f"ahb_slv_{slavename}_htrans_o")
+    haddr = getattr(dut, f"ahb_slv_{slavename}_haddr_o")
+    hwrite = getattr(dut, f"ahb_slv_{slavename}_hwrite_o")
+    hwdata = getattr(dut, f"ahb_slv_{slavename}_hwdata_o")
+    hready = getattr(dut, f"ahb_slv_{slavename}_hready_o")
+    hreadyout = getattr(dut, f"ahb_slv_{slavename}_hreadyout_i")
+    hrdata = getattr(dut, f"ahb_slv_{slavename}_hrdata_i")
+    dph = None
+    busy = 0
+    while True:
+        await RisingEdge(hclk)
+        if dph is not None:
+            if busy:
+                busy -= 1
+            else:
+                assert hready.value, f"{slavename}: data phase at {dph[0]:#x} is extended beyond HREADYOUT"
+                addr, write = dph
+                if write:
+                    mem[addr] = int(hwdata.value)
+                dph = None
+        if hsel.value and hready.value and htrans.value in (TransType.NONSEQ, TransType.SEQ):
+            addr = int(haddr.value)
+            dph = (addr, bool(hwrite.value))
+            busy = waits[0]
+            hrdata.value = mem.get(addr, 0)
+        hreadyout.value = 0 if busy else 1
+
+
+async def master(dut, mastername: str, xfers: list[tuple[int, bool, int, bool]]) -> list[int]:
+    """
+    Issue `xfers` (address, write, data, sequential) back-to-back and return the read data.
+
+    Transfers to the unmapped address must end with a two-cycle `ERROR` response.
+    """
+    hclk = dut.main_clk_i
+    htrans = getattr(dut, f"ahb_mst_{mastername}_htrans_i")
+    haddr = getattr(dut, f"ahb_mst_{mastername}_haddr_i")
+    hwrite = getattr(dut, f"ahb_mst_{mastername}_hwrite_i")
+    hwdata = getattr(dut, f"ahb_mst_{mastername}_hwdata_i")
+    hready = getattr(dut, f"ahb_mst_{mastername}_hready_o")
+    hresp = getattr(dut, f"ahb_mst_{mastername}_hresp_o")
+    hrdata = getattr(dut, f"ahb_mst_{mastername}_hrdata_o")
+    rdata = []
+    aph = 0
+    dph = None
+    first_err = False
+    haddr.value, hwrite.value, _, _ = xfers[0]
+    htrans.value = TransType.NONSEQ
+    while (dph is not None) or (aph < len(xfers)):
+        await RisingEdge(hclk)
+        if dph is not None and not hready.value:
+            first_err = bool(hresp.value)
+        if hready.value:
+            if dph is not None:
+                if dph[0] == UNMAPPED:
+                    assert hresp.value, f"{mastername}: missing error response"
+                    assert first_err, f"{mastername}: error response is not two-cycle"
+                else:
+                    assert not hresp.value, f"{mastername}: error response at {dph[0]:#x}"
+                    if not dph[1]:
+                        rdata.append(int(hrdata.value))
+            first_err = False
+            dph = xfers[aph] if aph < len(xfers) else None
+            aph += 1
+            if dph is not None and dph[1]:
+                hwdata.value = dph[2]
+            if aph < len(xfers):
+                haddr.value, hwrite.value, _, seq = xfers[aph]
+                htrans.value = TransType.SEQ if seq else TransType.NONSEQ
+            else:
+                htrans.value = TransType.IDLE
+    return rdata
+
+
+def sequence(
+    mastername: str, slavenames: tuple[str, ...], num: int
+) -> tuple[list[tuple[int, bool, int, bool]], list[int]]:
+    """
+    Alternating Writes and Reads of `mastername` to random slaves of `slavenames` and the expected read data.
+
+    Every 4th access is an `INCR` burst of 4 beats, every 8th one goes to the unmapped address.
+    """
+    offs = 0x100 * MASTERS.index(mastername)
+    mem: dict[int, int] = {}
+    xfers = []
+    expected = []
+    for idx in range(num):
+        write = idx % 2 == 0
+        if (idx + 1) % 8 == 0:
+            xfers.append((UNMAPPED, write, 0, False))
+            continue
+        base = SLAVES[random.choice(slavenames)] + offs
+        beats = 4 if idx % 4 == 1 else 1
+        start = 4 * random.randrange(4) if beats == 1 else 0
+        for beat in range(beats):
+            addr = base + start + 4 * beat
+            data = random.getrandbits(32)
+            xfers.append((addr, write, data, beat > 0))
+            if write:
+                mem[addr] = data
+            else:
+                expected.append(mem.get(addr, 0))
+    return xfers, expected
+
+
+@cocotb.test()
+async def ahb_ml_dph_test(dut):
+    """Back-to-Back Transfers during Wait States."""
+    log = logging.getLogger(__name__)
+    log.setLevel(logging.INFO)
+
+    hclk = dut.main_clk_i
+    rst_an = dut.main_rst_an_i
+
+    for mastername in MASTERS:
+        getattr(dut, f"ahb_mst_{mastername}_htrans_i").value = TransType.IDLE
+        getattr(dut, f"ahb_mst_{mastername}_haddr_i").value = 0
+        getattr(dut, f"ahb_mst_{mastername}_hwrite_i").value = 0
+        getattr(dut, f"ahb_mst_{mastername}_hwdata_i").value = 0
+        getattr(dut, f"ahb_mst_{mastername}_hsize_i").value = SizeType.WORD
+        getattr(dut, f"ahb_mst_{mastername}_hburst_i").value = BurstType.INCR
+    waits = [0]
+    mems: dict[str, dict[int, int]] = {slavename: {} for slavename in SLAVES}
+    for slavename in SLAVES:
+        getattr(dut, f"ahb_slv_{slavename}_hreadyout_i").value = 1
+        getattr(dut, f"ahb_slv_{slavename}_hresp_i").value = 0
+        getattr(dut, f"ahb_slv_{slavename}_hrdata_i").value = 0
+        cocotb.start_soon(slave(dut, slavename, waits, mems[slavename]))
+
+    cocotb.start_soon(Clock(hclk, period=10).start())
+
+    # initial reset
+    rst_an.value = 0
+    await wait_clocks(hclk, 10)
+    rst_an.value = 1
+    await wait_clocks(hclk, 10)
+
+    for num_waits in (0, 1, 2):
+        waits[0] = num_waits
+        for mastername, slavenames in SEQUENCES:
+            for mem in mems.values():
+                mem.clear()
+            xfers, expected = sequence(mastername, slavenames, NUM)
+            rdata = await master(dut, mastername, xfers)
+            log.info(f"{mastername} -> {', '.join(slavenames)} with {num_waits} wait states: {len(rdata)} reads")
+            assert rdata == expected, f"{mastername} -> {', '.join(slavenames)}: read data mismatch"
+            await wait_clocks(hclk, 3)
@@ -0,0 +1,168 @@
+#
+# MIT License
+#
+# Copyright (c) 2024-2025 nbiotcloud
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+#
+
+
+"""
+Unified Chip Design Platform - AMBA - AHB Multilayer Grant Hold Tests.
+
+The masters of :any:`UcdpAhbMlHoldExampleMod` saturate one slave with undefined-length incrementing bursts,
+while the slave never inserts wait states.
+No master may hold the slave for more beats than the hold limit of the slave,
+and the yield hint of `dma` ends its bursts at the first beat.
+"""
+
+import logging
+
+import cocotb
+from cocotb.clock import Clock
+from cocotb.triggers import RisingEdge
+
+from tests.ahb_driver import BurstType, SizeType, TransType
+
+MASTERS = ("cpu", "dsp", "dma")
+"""Masters in Order of Creation."""
+
+SLAVES = {
+    "mem": (0x0000, ("cpu", "dsp", "dma"), 4),
+    "buf": (0x1000, ("cpu", "dma"), 8),
+}
+"""Base Address, Masters and Hold Limit in Beats per Slave - cycles equal beats without wait states."""
+
+BURST_LEN = 64
+"""Beats per Burst - restarted with `NONSEQ` at 256 byte boundaries."""
+
+CYCLES = 400
+
+
+async def wait_clocks(clock, cycles):
+    """Helper Function."""
+    for _ in range(cycles):
+        await RisingEdge(clock)
+
+
+async def burst(dut, mastername: str, addr: int, cycles: int) -> int:
+    """Issue undefined-length incrementing write bursts for `cycles` and return the accepted beats."""
+    hclk = dut.main_clk_i
+    htrans = getattr(dut, f"ahb_mst_{mastername}_htrans_i")
+    haddr = getattr(dut, f"ahb_mst_{mastername}_haddr_i")
+    hready = getattr(dut, f"ahb_mst_{mastername}_hready_o")
+    getattr(dut, f"ahb_mst_{mastername}_hwrite_i").value = 1
+    getattr(dut, f"ahb_mst_{mastername}_hsize_i").value = SizeType.WORD
+    if mastername != "dsp":  # `dsp` lacks `hburst` and issues undefined-length bursts only
+        getattr(dut, f"ahb_mst_{mastername}_hburst_i").value = BurstType.INCR
+    haddr.value = addr
+    htrans.value = TransType.NONSEQ
+    beats = 0
+    for _ in range(cycles):
+        await RisingEdge(hclk)
+        if hready.value:
+            beats += 1
+            haddr.value = addr + 4 * (beats % BURST_LEN)
+            htrans.value = TransType.SEQ if beats % BURST_LEN else TransType.NONSEQ
+    htrans.value = TransType.IDLE
+    await RisingEdge(hclk)
+    while hready.value == 0:
+        await RisingEdge(hclk)
+    return beats
+
+
+async def monitor(dut, slavename: str, base: int, masternames: tuple[str, ...], runs: dict[str, int]):
+    """Record the longest run of consecutive beats per master at slave `slavename`."""
+    hclk = dut.main_clk_i
+    hsel = getattr(dut, f"ahb_slv_{slavename}_hsel_o")
+    htrans = getattr(dut, f"ahb_slv_{slavename}_htrans_o")
+    haddr = getattr(dut, f"ahb_slv_{slavename}_haddr_o")
+    hready = getattr(dut, f"ahb_slv_{slavename}_hready_o")
+    last = None
+    run = 0
+    while True:
+        await RisingEdge(hclk)
+        if hsel.value and hready.value and htrans.value in (TransType.NONSEQ, TransType.SEQ):
+            mastername = masternames[(int(haddr.value) - base) // 0x100]
+            run = run + 1 if mastername == last else 1
+            last = mastername
+            runs[mastername] = max(runs.get(mastername, 0), run)
+
+
+async def run(dut, log, slavename: str) -> tuple[dict[str, int], dict[str, int]]:
+    """Saturate `slavename` by all its masters and return the accepted beats and longest runs per master."""
+    base, masternames, _ = SLAVES[slavename]
+    runs: dict[str, int] = {}
+    mon = cocotb.start_soon(monitor(dut, slavename, base, masternames, runs))
+    tasks = {
+        mastername: cocotb.start_soon(burst(dut, mastername, base + 0x100 * idx, CYCLES))
+        for idx, mastername in enumerate(masternames)
+    }
+    beats = {mastername: await task for mastername, task in tasks.items()}
+    mon.kill()
+    log.info(", ".join(f"{name}: {beats[name]} beats, longest run {runs.get(name, 0)}" for name in masternames))
+    await wait_clocks(dut.main_clk_i, 5)
+    return beats, runs
+
+
+@cocotb.test()
+async def ahb_ml_hold_test(dut):
+    """Grant Hold Limits and Yield Hint."""
+    log = logging.getLogger(__name__)
+    log.setLevel(logging.INFO)
+
+    hclk = dut.main_clk_i
+    rst_an = dut.main_rst_an_i
+
+    for mastername in MASTERS:
+        getattr(dut, f"ahb_mst_{mastername}_htrans_i").value = TransType.IDLE
+        getattr(dut, f"ahb_mst_{mastername}_haddr_i").value = 0
+        getattr(dut, f"ahb_mst_{mastername}_hwrite_i").value = 0
+        getattr(dut, f"ahb_mst_{mastername}_hwdata_i").value = 0
+        getattr(dut, f"ahb_mst_{mastername}_hsize_i").value = SizeType.WORD
+        if mastername != "dsp":
+            getattr(dut, f"ahb_mst_{mastername}_hburst_i").value = BurstType.SINGLE
+    dut.ahb_mst_dsp_hmastlock_i.value = 0
+    dut.mst_dma_yield_i.value = 0
+    for slavename in ("mem", "buf", "io", "rom"):
+        getattr(dut, f"ahb_slv_{slavename}_hreadyout_i").value = 1
+        getattr(dut, f"ahb_slv_{slavename}_hresp_i").value = 0
+        getattr(dut, f"ahb_slv_{slavename}_hrdata_i").value = 0
+
+    cocotb.start_soon(Clock(hclk, period=10).start())
+
+    # initial reset
+    rst_an.value = 0
+    await wait_clocks(hclk, 10)
+    rst_an.value = 1
+    await wait_clocks(hclk, 10)
+
+    # bursts are broken at the hold limit
+    for slavename, (_, masternames, limit) in SLAVES.items():
+        beats, runs = await run(dut, log, slavename)
+        for mastername in masternames:
+            assert beats[mastername] > 0, f"{mastername} starved at {slavename}"
+            assert runs[mastername] <= limit, f"{mastername} held {slavename} for {runs[mastername]} beats"
+
+    # the yield hint of `dma` ends its bursts at the first beat
+    dut.mst_dma_yield_i.value = 1
+    beats, runs = await run(dut, log, "mem")
+    assert beats["dma"] > 0, "dma starved at mem"
+    assert runs["dma"] == 1, f"dma held mem for {runs['dma']} beats despite yielding"
+    dut.mst_dma_yield_i.value = 0
@@ -0,0 +1,161 @@
+#
+# MIT License
+#
+# Copyright (c) 2024-2025 nbiotcloud
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+#
+"""
+Unified Chip Design Platform - AMBA - AHB Multilayer Bus Parking Tests.
+
+One master of :any:`UcdpAhbMlParkExampleMod` at a time issues back-to-back `NONSEQ` reads to one slave,
+which inserts wait states into every data phase.
+The next `NONSEQ` is issued during the wait states of the current data phase.
+A parked master keeps the slave granted during these wait states, an unparked master is granted
+with the last cycle of its data phase.
+Both sequences take one clock cycle per wait state and transfer only, plus the leading address phase.
+"""
+
+import logging
+
+import cocotb
+from cocotb.clock import Clock
+from cocotb.triggers import RisingEdge
+
+from tests.ahb_driver import BurstType, SizeType, TransType
+
+MASTERS = ("cpu", "dsp", "dma")
+"""Masters in Order of Creation."""
+
+SLAVES = {"mem": 0x0000, "rom": 0x1000, "io": 0x2000, "sram": 0x3000}
+"""Base Address per Slave."""
+
+SEQUENCES = (
+    ("cpu", "mem"),
+    ("dsp", "mem"),
+    ("dma", "mem"),
+    ("cpu", "rom"),
+    ("dma", "sram"),
+    ("dsp", "rom"),
+    ("dsp", "io"),
+    ("dma", "io"),
+)
+"""
+Uncontended Master/Slave Sequences.
+
+`mem` is parked on its last master, `rom` on `cpu` only, `io` is not parked and `sram` has one master.
+"""
+
+NUM = 16
+"""Transfers per Sequence."""
+
+
+async def wait_clocks(clock, cycles):
+    """Helper Function."""
+    for _ in range(cycles):
+        await RisingEdge(clock)
+
+
+async def slave(dut, slavename: str, waits: list[int]):
+    """Respond with `waits[0]` wait states to every transfer and return the address as read data."""
+    hclk = dut.main_clk_i
+    hsel = getattr(dut, f"ahb_slv_{slavename}_hsel_o")
+    htrans = getattr(dut, f"ahb_slv_{slavename}_htrans_o")
+    haddr = getattr(dut, f"ahb_slv_{slavename}_haddr_o")
+    hready = getattr(dut, f"ahb_slv_{slavename}_hready_o")
+    hreadyout = getattr(dut, f"ahb_slv_{slavename}_hreadyout_i")
+    hrdata = getattr(dut, f"ahb_slv_{slavename}_hrdata_i")
+    busy = 0
+    while True:
+        await RisingEdge(hclk)
+        if hsel.value and hready.value and htrans.value in (TransType.NONSEQ, TransType.SEQ):
+            busy = waits[0]
+            hrdata.value = int(haddr.value)
+        elif busy:
+            busy -= 1
+        hreadyout.value = 0 if busy else 1
+
+
+async def reads(dut, mastername: str, addr: int, num: int) -> int:
+    """Issue `num` back-to-back single reads and return the clock cycles until the last data phase ends."""
+    hclk = dut.main_clk_i
+    htrans = getattr(dut, f"ahb_mst_{mastername}_htrans_i")
+    haddr = getattr(dut, f"ahb_mst_{mastername}_haddr_i")
+    hready = getattr(dut, f"ahb_mst_{mastername}_hready_o")
+    hrdata = getattr(dut, f"ahb_mst_{mastername}_hrdata_o")
+    haddr.value = addr
+    htrans.value = TransType.NONSEQ
+    cycles = 0
+    done = 0
+    while done <= num:
+        await RisingEdge(hclk)
+        cycles += 1
+        if hready.value:
+            if done:
+                exp = addr + 4 * (done - 1)
+                assert int(hrdata.value) == exp, f"{mastername}: read {int(hrdata.value):#x} instead of {exp:#x}"
+            done += 1
+            haddr.value = addr + 4 * done
+            if done == num:
+                htrans.value = TransType.IDLE
+    return cycles
+
+
+@cocotb.test()
+async def ahb_ml_park_test(dut):
+    """Latency of Back-to-Back Transfers at parked and unparked Slaves."""
+    log = logging.getLogger(__name__)
+    log.setLevel(logging.INFO)
+
+    hclk = dut.main_clk_i
+    rst_an = dut.main_rst_an_i
+
+    for mastername in MASTERS:
+        getattr(dut, f"ahb_mst_{mastername}_htrans_i").value = TransType.IDLE
+        getattr(dut, f"ahb_mst_{mastername}_haddr_i").value = 0
+        getattr(dut, f"ahb_mst_{mastername}_hwrite_i").value = 0
+        getattr(dut, f"ahb_mst_{mastername}_hwdata_i").value = 0
+        getattr(dut, f"ahb_mst_{mastername}_hsize_i").value = SizeType.WORD
+        getattr(dut, f"ahb_mst_{mastername}_hburst_i").value = BurstType.SINGLE
+    waits = [0]
+    for slavename in SLAVES:
+        getattr(dut, f"ahb_slv_{slavename}_hreadyout_i").value = 1
+        getattr(dut, f"ahb_slv_{slavename}_hresp_i").value = 0
+        getattr(dut, f"ahb_slv_{slavename}_hrdata_i").value = 0
+        cocotb.start_soon(slave(dut, slavename, waits))
+
+    cocotb.start_soon(Clock(hclk, period=10).start())
+
+    # initial reset
+    rst_an.value = 0
+    await wait_clocks(hclk, 10)
+    rst_an.value = 1
+    await wait_clocks(hclk, 10)
+
+    for num_waits in (0, 1, 2):
+        waits[0] = num_waits
+        ideal = 1 + NUM * (1 + num_waits)
+        for mastername, slavename in SEQUENCES:
+            cycles = await reads(dut, mastername, SLAVES[slavename], NUM)
+            log.info(
+                f"{mastername} -> {slavename} with {num_waits} wait states: "
+                f"{cycles} cycles for {NUM} transfers ({ideal} ideal)"
+            )
+            assert cycles == ideal, f"{mastername} -> {slavename}: {cycles - ideal} cycles lost in arbitration"
+            await wait_clocks(hclk, 3)
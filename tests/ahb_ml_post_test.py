@@ -0,0 +1,301 @@
+#
+# MIT License
+#
+# Copyright (c) 2024-2025 nbiotcloud
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+#
+"""
+Unified Chip Design Platform - AMBA - AHB Multilayer Posted-Write Buffer Tests.
+
+Bufferable writes of the masters of :any:`UcdpAhbMlPostExampleMod` to the posted slaves `flash` and `apb`
+end without wait states, until the posted-write buffer is full - regardless of the slave wait states.
+Non-bufferable writes are not posted and wait for the slave.
+Reads return the data of all preceding writes.
+Every slave answers transfers to its last word with a two-cycle `ERROR` response.
+Posted writes there end with `OKAY` and raise the error interrupt of the slave instead.
+"""
+
+import logging
+import random
+
+import cocotb
+from cocotb.clock import Clock
+from cocotb.triggers import RisingEdge
+
+from tests.ahb_driver import BurstType, SizeType, TransType
+
+SLAVES = {"mem": 0x0000, "flash": 0x1000, "apb": 0x2000}
+"""Base Address per Slave."""
+
+MASTERS = {"cpu": ("mem", "flash", "apb"), "dma": ("mem", "flash")}
+"""Accessible Slaves per Master."""
+
+POSTED = {"flash": 4, "apb": 1}
+"""Posted-Write Buffer Depth per Slave."""
+
+ERR_OFFS = 0xFFC
+"""Offset answered with an `ERROR` response by every slave."""
+
+HPROT_BUFFERABLE = 0b0111
+"""Protection of Bufferable Data Accesses."""
+
+HPROT_NONBUFFERABLE = 0b0011
+"""Protection of Non-Bufferable Data Accesses."""
+
+NUM = 64
+"""Transfers per Sequence."""
+
+
+async def wait_clocks(clock, cycles):
+    """Helper Function."""
+    for _ in range(cycles):
+        await RisingEdge(clock)
+
+
+async def slave(dut, slavename: str, waits: dict[str, int | None], mem: dict[int, int]):
+    """Memory Slave with `waits[slavename]` wait states per transfer - random ones if `None`."""
+    hclk = dut.main_clk_i
+    hsel = getattr(dut, f"ahb_slv_{slavename}_hsel_o")
+    htrans = getattr(dut, f"ahb_slv_{slavename}_htrans_o")
+    haddr = getattr(dut, f"ahb_slv_{slavename}_haddr_o")
+    hwrite = getattr(dut, f"ahb_slv_{slavename}_hwrite_o")
+    hwdata = getattr(dut, f"ahb_slv_{slavename}_hwdata_o")
+    hready = getattr(dut, f"ahb_slv_{slavename}_hready_o")
+    hreadyout = getattr(dut, f"ahb_slv_{slavename}_hreadyout_i")
+    hresp = getattr(dut, f"ahb_slv_{slavename}_hresp_i")
+    hrdata = getattr(dut, f"ahb_slv_{slavename}_hrdata_i")
+    dph = None
+    busy = 0
+    while True:
+        await RisingEdge(hclk)
+        if dph is not None:
+            if busy:
+                busy -= 1
+            else:
+                assert hready.value, f"{slavename}: data phase at {dph[0]:#x} is extended beyond HREADYOUT"
+                addr, write, err = dph
+                if write and not err:
+                    mem[addr] = int(hwdata.value)
+                dph = None
+        if hsel.value and hready.value and htrans.value in (TransType.NONSEQ, TransType.SEQ):
+            addr = int(haddr.value)
+            err = addr - SLAVES[slavename] == ERR_OFFS
+            dph = (addr, bool(hwrite.value), err)
+            num_waits = waits[slavename]
+            busy = random.randint(0, 3) if num_waits is None else num_waits
+            if err:
+                busy = max(busy, 1)
+            hrdata.value = mem.get(addr, 0)
+        hreadyout.value = 0 if busy else 1
+        hresp.value = 1 if dph is not None and dph[2] and busy <= 1 else 0
+
+
+async def irq_counter(dut, slavename: str, counts: dict[str, int]):
+    """Count the clock cycles with active error interrupt of slave `slavename`."""
+    hclk = dut.main_clk_i
+    irq = getattr(dut, f"slv_{slavename}_irq_o")
+    while True:
+        await RisingEdge(hclk)
+        if irq.value:
+            counts[slavename] += 1
+
+
+def is_error(addr: int, write: bool, bufferable: bool = True) -> bool:
+    """Transfer ends with an `ERROR` response at the master."""
+    for slavename, baseaddr in SLAVES.items():
+        if addr == baseaddr + ERR_OFFS:
+            return not (write and bufferable and slavename in POSTED)
+    return False
+
+
+async def master(
+    dut, mastername: str, xfers: list[tuple[int, bool, int]], bufferable: bool = True
+) -> tuple[int, list[int]]:
+    """
+    Issue `xfers` (address, write, data) back-to-back - all bufferable or all non-bufferable.
+
+    Return the clock cycles until the last data phase ends and the read data.
+    """
+    hclk = dut.main_clk_i
+    htrans = getattr(dut, f"ahb_mst_{mastername}_htrans_i")
+    haddr = getattr(dut, f"ahb_mst_{mastername}_haddr_i")
+    hwrite = getattr(dut, f"ahb_mst_{mastername}_hwrite_i")
+    hwdata = getattr(dut, f"ahb_mst_{mastername}_hwdata_i")
+    hready = getattr(dut, f"ahb_mst_{mastername}_hready_o")
+    hresp = getattr(dut, f"ahb_mst_{mastername}_hresp_o")
+    hrdata = getattr(dut, f"ahb_mst_{mastername}_hrdata_o")
+    hprot = getattr(dut, f"ahb_mst_{mastername}_hprot_i")
+    rdata = []
+    cycles = 0
+    aph = 0
+    dph = None
+    first_err = False
+    hprot.value = HPROT_BUFFERABLE if bufferable else HPROT_NONBUFFERABLE
+    haddr.value, hwrite.value, _ = xfers[0]
+    htrans.value = TransType.NONSEQ
+    while (dph is not None) or (aph < len(xfers)):
+        await RisingEdge(hclk)
+        cycles += 1
+        if dph is not None and not hready.value:
+            first_err = bool(hresp.value)
+        if hready.value:
+            if dph is not None:
+                addr, write, _ = dph
+                if is_error(addr, write, bufferable):
+                    assert hresp.value, f"{mastername}: missing error response at {addr:#x}"
+                    assert first_err, f"{mastername}: error response at {addr:#x} is not two-cycle"
+                else:
+                    assert not hresp.value, f"{mastername}: error response at {addr:#x}"
+                    if not write:
+                        rdata.append(int(hrdata.value))
+            first_err = False
+            dph = xfers[aph] if aph < len(xfers) else None
+            aph += 1
+            if dph is not None and dph[1]:
+                hwdata.value = dph[2]
+            if aph < len(xfers):
+                haddr.value, hwrite.value, _ = xfers[aph]
+            else:
+                htrans.value = TransType.IDLE
+    return cycles, rdata
+
+
+def sequence(
+    mastername: str, slavenames: tuple[str, ...], num: int, errors: bool = False
+) -> tuple[list[tuple[int, bool, int]], list[int], dict[str, int]]:
+    """
+    Writes and Reads of `mastername` to random slaves of `slavenames`.
+
+    Return the transfers, the expected read data and the expected error interrupts per slave.
+    """
+    offs = 0x100 * tuple(MASTERS).index(mastername)
+    mem: dict[int, int] = {}
+    xfers = []
+    expected = []
+    irqs = dict.fromkeys(POSTED, 0)
+    for _ in range(num):
+        slavename = random.choice(slavenames)
+        write = random.choice((False, True))
+        if errors and random.randrange(8) == 0:
+            xfers.append((SLAVES[slavename] + ERR_OFFS, write, 0))
+            if write and slavename in POSTED:
+                irqs[slavename] += 1
+            continue
+        addr = SLAVES[slavename] + offs + 4 * random.randrange(8)
+        data = random.getrandbits(32)
+        xfers.append((addr, write, data))
+        if write:
+            mem[addr] = data
+        else:
+            expected.append(mem.get(addr, 0))
+    return xfers, expected, irqs
+
+
+@cocotb.test()
+async def ahb_ml_post_test(dut):
+    """Latency, Ordering and Error Handling of Posted Writes."""
+    log = logging.getLogger(__name__)
+    log.setLevel(logging.INFO)
+
+    hclk = dut.main_clk_i
+    rst_an = dut.main_rst_an_i
+
+    for mastername in MASTERS:
+        getattr(dut, f"ahb_mst_{mastername}_htrans_i").value = TransType.IDLE
+        getattr(dut, f"ahb_mst_{mastername}_haddr_i").value = 0
+        getattr(dut, f"ahb_mst_{mastername}_hwrite_i").value = 0
+        getattr(dut, f"ahb_mst_{mastername}_hwdata_i").value = 0
+        getattr(dut, f"ahb_mst_{mastername}_hsize_i").value = SizeType.WORD
+        getattr(dut, f"ahb_mst_{mastername}_hburst_i").value = BurstType.SINGLE
+        getattr(dut, f"ahb_mst_{mastername}_hprot_i").value = HPROT_BUFFERABLE
+    waits: dict[str, int | None] = dict.fromkeys(SLAVES, 0)
+    mems: dict[str, dict[int, int]] = {slavename: {} for slavename in SLAVES}
+    for slavename in SLAVES:
+        getattr(dut, f"ahb_slv_{slavename}_hreadyout_i").value = 1
+        getattr(dut, f"ahb_slv_{slavename}_hresp_i").value = 0
+        getattr(dut, f"ahb_slv_{slavename}_hrdata_i").value = 0
+        cocotb.start_soon(slave(dut, slavename, waits, mems[slavename]))
+    irqs = dict.fromkeys(POSTED, 0)
+    for slavename in POSTED:
+        cocotb.start_soon(irq_counter(dut, slavename, irqs))
+
+    cocotb.start_soon(Clock(hclk, period=10).start())
+
+    # initial reset
+    rst_an.value = 0
+    await wait_clocks(hclk, 10)
+    rst_an.value = 1
+    await wait_clocks(hclk, 10)
+
+    # slow slaves: the first write is forwarded, the next ones fill the buffer
+    for slavename, depth in POSTED.items():
+        waits[slavename] = 4
+        num = depth + 1
+        writes = [(SLAVES[slavename] + 4 * idx, True, random.getrandbits(32)) for idx in range(num)]
+        cycles, _ = await master(dut, "cpu", writes)
+        log.info(f"cpu -> {slavename}: {cycles} cycles for {num} posted writes")
+        assert cycles == 1 + num, f"cpu -> {slavename}: {cycles - 1 - num} wait states on posted writes"
+        reads = [(addr, False, 0) for addr, _, _ in writes]
+        _, rdata = await master(dut, "cpu", reads)
+        assert rdata == [data for _, _, data in writes], f"cpu -> {slavename}: read data mismatch"
+        waits[slavename] = 0
+        await wait_clocks(hclk, 3)
+
+    # non-bufferable writes are not posted and wait for the slow slaves
+    for slavename, depth in POSTED.items():
+        waits[slavename] = 4
+        num = depth + 1
+        writes = [(SLAVES[slavename] + 4 * idx, True, random.getrandbits(32)) for idx in range(num)]
+        cycles, _ = await master(dut, "cpu", writes, bufferable=False)
+        log.info(f"cpu -> {slavename}: {cycles} cycles for {num} non-bufferable writes")
+        assert cycles >= 1 + 5 * num, f"cpu -> {slavename}: non-bufferable writes are posted"
+        reads = [(addr, False, 0) for addr, _, _ in writes]
+        _, rdata = await master(dut, "cpu", reads)
+        assert rdata == [data for _, _, data in writes], f"cpu -> {slavename}: read data mismatch"
+        waits[slavename] = 0
+        await wait_clocks(hclk, 3)
+
+    # posted writes with error response raise the interrupt, non-bufferable ones get the error response
+    for slavename in POSTED:
+        await master(dut, "cpu", [(SLAVES[slavename] + ERR_OFFS, True, 0)], bufferable=False)
+        xfers = [(SLAVES[slavename] + ERR_OFFS, True, 0), (SLAVES[slavename] + ERR_OFFS, False, 0)]
+        await master(dut, "cpu", xfers)
+        await wait_clocks(hclk, 3)
+        assert irqs[slavename] == 1, f"{slavename}: {irqs[slavename]} error interrupts"
+        irqs[slavename] = 0
+
+    # all masters together with random wait states and error responses
+    for slavename in SLAVES:
+        waits[slavename] = None
+        mems[slavename].clear()
+    seqs = {
+        mastername: sequence(mastername, slavenames, 4 * NUM, errors=True) for mastername, slavenames in MASTERS.items()
+    }
+    tasks = {
+        mastername: cocotb.start_soon(master(dut, mastername, xfers)) for mastername, (xfers, _, _) in seqs.items()
+    }
+    for mastername, task in tasks.items():
+        cycles, rdata = await task
+        log.info(f"{mastername}: {cycles} cycles for {4 * NUM} transfers")
+        assert rdata == seqs[mastername][1], f"{mastername}: read data mismatch"
+    await wait_clocks(hclk, 20)
+    for slavename in POSTED:
+        expected = sum(irqs_[slavename] for _, _, irqs_ in seqs.values())
+        assert irqs[slavename] == expected, f"{slavename}: {irqs[slavename]} error interrupts, expected {expected}"
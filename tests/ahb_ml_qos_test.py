@@ -0,0 +1,142 @@
+#
+# MIT License
+#
+# Copyright (c) 2024-2025 nbiotcloud
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+#
+
+
+"""
+Unified Chip Design Platform - AMBA - AHB Multilayer QoS Tests.
+
+All masters of :any:`UcdpAhbMlQosExampleMod` saturate the slave `mem` with back-to-back single transfers,
+while the slave never inserts wait states.
+The static QoS level of `cpu` wins, unless `audio` raises its runtime QoS level via `hauser`.
+Aging limits the wait of all other masters.
+"""
+
+import logging
+
+import cocotb
+from cocotb.clock import Clock
+from cocotb.triggers import RisingEdge
+
+from tests.ahb_driver import BurstType, SizeType, TransType
+
+MASTERS = ("cpu", "audio", "dma")
+"""Masters in Order of Position."""
+
+AGING = 16
+"""Aging of the Multilayer."""
+
+MAX_WAIT = AGING + len(MASTERS)
+"""Worst-Case Wait: aging plus one grant to every other master plus the address phase."""
+
+CYCLES = 600
+
+
+async def wait_clocks(clock, cycles):
+    """Helper Function."""
+    for _ in range(cycles):
+        await RisingEdge(clock)
+
+
+async def saturate(dut, mastername: str, addr: int, cycles: int) -> tuple[int, int]:
+    """Issue back-to-back single write transfers for `cycles` and return accepted ones and the longest wait."""
+    hclk = dut.main_clk_i
+    htrans = getattr(dut, f"ahb_mst_{mastername}_htrans_i")
+    hready = getattr(dut, f"ahb_mst_{mastername}_hready_o")
+    getattr(dut, f"ahb_mst_{mastername}_haddr_i").value = addr
+    getattr(dut, f"ahb_mst_{mastername}_hwrite_i").value = 1
+    getattr(dut, f"ahb_mst_{mastername}_hsize_i").value = SizeType.WORD
+    getattr(dut, f"ahb_mst_{mastername}_hburst_i").value = BurstType.SINGLE
+    htrans.value = TransType.NONSEQ
+    accepted = 0
+    wait = max_wait = 0
+    for _ in range(cycles):
+        await RisingEdge(hclk)
+        if hready.value:
+            accepted += 1
+            wait = 0
+        else:
+            wait += 1
+            max_wait = max(max_wait, wait)
+    htrans.value = TransType.IDLE
+    await RisingEdge(hclk)
+    while hready.value == 0:
+        await RisingEdge(hclk)
+    return accepted, max_wait
+
+
+async def run(dut, log) -> dict[str, tuple[int, int]]:
+    """Saturate `mem` by all masters."""
+    tasks = {
+        mastername: cocotb.start_soon(saturate(dut, mastername, 4 * idx, CYCLES))
+        for idx, mastername in enumerate(MASTERS)
+    }
+    results = {mastername: await task for mastername, task in tasks.items()}
+    log.info(", ".join(f"{name}: {accepted} xfers, max wait {wait}" for name, (accepted, wait) in results.items()))
+    await wait_clocks(dut.main_clk_i, 5)
+    return results
+
+
+@cocotb.test()
+async def ahb_ml_qos_test(dut):
+    """QoS Levels and Aging."""
+    log = logging.getLogger(__name__)
+    log.setLevel(logging.INFO)
+
+    hclk = dut.main_clk_i
+    rst_an = dut.main_rst_an_i
+
+    for mastername in MASTERS:
+        getattr(dut, f"ahb_mst_{mastername}_htrans_i").value = TransType.IDLE
+        getattr(dut, f"ahb_mst_{mastername}_haddr_i").value = 0
+        getattr(dut, f"ahb_mst_{mastername}_hwrite_i").value = 0
+        getattr(dut, f"ahb_mst_{mastername}_hwdata_i").value = 0
+        getattr(dut, f"ahb_mst_{mastername}_hsize_i").value = SizeType.WORD
+        getattr(dut, f"ahb_mst_{mastername}_hburst_i").value = BurstType.SINGLE
+        getattr(dut, f"ahb_mst_{mastername}_hprot_i").value = 0
+    dut.ahb_mst_audio_hauser_i.value = 0
+    for slavename in ("mem", "periph"):
+        getattr(dut, f"ahb_slv_{slavename}_hreadyout_i").value = 1
+        getattr(dut, f"ahb_slv_{slavename}_hresp_i").value = 0
+        getattr(dut, f"ahb_slv_{slavename}_hrdata_i").value = 0
+
+    cocotb.start_soon(Clock(hclk, period=10).start())
+
+    # initial reset
+    rst_an.value = 0
+    await wait_clocks(hclk, 10)
+    rst_an.value = 1
+    await wait_clocks(hclk, 10)
+
+    # static QoS level of `cpu` wins, aging serves the others
+    results = await run(dut, log)
+    assert results["cpu"][0] > results["audio"][0] + results["dma"][0]
+    for mastername in ("audio", "dma"):
+        assert 0 < results[mastername][1] <= MAX_WAIT, f"{mastername} waited {results[mastername][1]} cycles"
+
+    # runtime QoS level of `audio` wins
+    dut.ahb_mst_audio_hauser_i.value = 3
+    results = await run(dut, log)
+    assert results["audio"][0] > results["cpu"][0] + results["dma"][0]
+    for mastername in ("cpu", "dma"):
+        assert 0 < results[mastername][1] <= MAX_WAIT, f"{mastername} waited {results[mastername][1]} cycles"
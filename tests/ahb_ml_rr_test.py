@@ -0,0 +1,179 @@
+#
+# MIT License
+#
+# Copyright (c) 2024-2025 nbiotcloud
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+#
+"""
+Unified Chip Design Platform - AMBA - AHB Multilayer Round-Robin Arbiter Tests.
+
+Random groups of masters of :any:`UcdpAhbMlRrExampleMod` issue a single `NONSEQ` read to the same slave
+in the same clock cycle. Every slave records the order of the granted masters, which has to match
+the reference model of the `loop` round-robin arbiter - for both arbiter implementations.
+"""
+
+import logging
+import random
+
+import cocotb
+from cocotb.clock import Clock
+from cocotb.triggers import RisingEdge
+
+from tests.ahb_driver import BurstType, SizeType, TransType
+
+MASTERS = ("cpu", "dsp", "dma", "eth", "usb", "gpu")
+"""Masters in Order of Creation."""
+
+SLAVES = {
+    "mem": (0x0000, ("cpu", "dsp", "dma", "eth", "usb", "gpu")),
+    "io": (0x1000, ("cpu", "dsp", "dma")),
+    "rom": (0x2000, ("cpu", "gpu")),
+}
+"""Base Address and Masters per Slave."""
+
+ROUNDS = 200
+"""Number of Request Rounds."""
+
+
+async def wait_clocks(clock, cycles):
+    """Helper Function."""
+    for _ in range(cycles):
+        await RisingEdge(clock)
+
+
+class RrModel:
+    """
+    Reference Model of the Round-Robin Arbiter.
+
+    The first candidate is the master in front of the last granted one, in order of the slave masters.
+    The reset value of the last granted master is the first one.
+    """
+
+    def __init__(self, masternames: tuple[str, ...]):
+        self.masternames = masternames
+        self.last = 0
+
+    def order(self, requests: set[str]) -> list[str]:
+        """Grant Order of the simultaneous `requests`, which are all held until granted."""
+        num = len(self.masternames)
+        granted = []
+        pending = set(requests)
+        while pending:
+            for step in range(1, num + 1):
+                idx = (self.last - step) % num
+                if self.masternames[idx] in pending:
+                    break
+            self.last = idx
+            granted.append(self.masternames[idx])
+            pending.remove(self.masternames[idx])
+        return granted
+
+
+async def slave(dut, slavename: str, granted: list[str]):
+    """Zero Wait State Slave, which records the granted masters and returns the address as read data."""
+    hclk = dut.main_clk_i
+    hsel = getattr(dut, f"ahb_slv_{slavename}_hsel_o")
+    htrans = getattr(dut, f"ahb_slv_{slavename}_htrans_o")
+    haddr = getattr(dut, f"ahb_slv_{slavename}_haddr_o")
+    hready = getattr(dut, f"ahb_slv_{slavename}_hready_o")
+    hrdata = getattr(dut, f"ahb_slv_{slavename}_hrdata_i")
+    while True:
+        await RisingEdge(hclk)
+        if hsel.value and hready.value and htrans.value in (TransType.NONSEQ, TransType.SEQ):
+            addr = int(haddr.value)
+            granted.append(MASTERS[(addr >> 8) & 0xF])
+            hrdata.value = addr
+
+
+async def read(dut, mastername: str, addr: int):
+    """Single Read."""
+    hclk = dut.main_clk_i
+    htrans = getattr(dut, f"ahb_mst_{mastername}_htrans_i")
+    haddr = getattr(dut, f"ahb_mst_{mastername}_haddr_i")
+    hready = getattr(dut, f"ahb_mst_{mastername}_hready_o")
+    hrdata = getattr(dut, f"ahb_mst_{mastername}_hrdata_o")
+    haddr.value = addr
+    htrans.value = TransType.NONSEQ
+    # address phase
+    await RisingEdge(hclk)
+    while not hready.value:
+        await RisingEdge(hclk)
+    htrans.value = TransType.IDLE
+    # data phase
+    await RisingEdge(hclk)
+    while not hready.value:
+        await RisingEdge(hclk)
+    assert int(hrdata.value) == addr, f"{mastername}: read {int(hrdata.value):#x} instead of {addr:#x}"
+
+
+@cocotb.test()
+async def ahb_ml_rr_test(dut):
+    """Round-Robin Grant Order of simultaneous Requests."""
+    log = logging.getLogger(__name__)
+    log.setLevel(logging.INFO)
+
+    hclk = dut.main_clk_i
+    rst_an = dut.main_rst_an_i
+
+    for mastername in MASTERS:
+        getattr(dut, f"ahb_mst_{mastername}_htrans_i").value = TransType.IDLE
+        getattr(dut, f"ahb_mst_{mastername}_haddr_i").value = 0
+        getattr(dut, f"ahb_mst_{mastername}_hwrite_i").value = 0
+        getattr(dut, f"ahb_mst_{mastername}_hwdata_i").value = 0
+        getattr(dut, f"ahb_mst_{mastername}_hsize_i").value = SizeType.WORD
+        getattr(dut, f"ahb_mst_{mastername}_hburst_i").value = BurstType.SINGLE
+    models = {slavename: RrModel(masternames) for slavename, (_, masternames) in SLAVES.items()}
+    granted: dict[str, list[str]] = {slavename: [] for slavename in SLAVES}
+    for slavename in SLAVES:
+        getattr(dut, f"ahb_slv_{slavename}_hreadyout_i").value = 1
+        getattr(dut, f"ahb_slv_{slavename}_hresp_i").value = 0
+        getattr(dut, f"ahb_slv_{slavename}_hrdata_i").value = 0
+        cocotb.start_soon(slave(dut, slavename, granted[slavename]))
+
+    cocotb.start_soon(Clock(hclk, period=10).start())
+
+    # initial reset
+    rst_an.value = 0
+    await wait_clocks(hclk, 10)
+    rst_an.value = 1
+    await wait_clocks(hclk, 10)
+
+    for _ in range(ROUNDS):
+        # every master requests at most one slave per round
+        requests: dict[str, set[str]] = {slavename: set() for slavename in SLAVES}
+        for mastername in MASTERS:
+            slavenames = [slavename for slavename, (_, masternames) in SLAVES.items() if mastername in masternames]
+            slavename = random.choice([*slavenames, None])
+            if slavename is not None:
+                requests[slavename].add(mastername)
+        tasks = []
+        for slavename, masternames in requests.items():
+            base = SLAVES[slavename][0]
+            for mastername in masternames:
+                addr = base + (MASTERS.index(mastername) << 8)
+                tasks.append(cocotb.start_soon(read(dut, mastername, addr)))
+        for task in tasks:
+            await task
+        await wait_clocks(hclk, 2)
+        for slavename, masternames in requests.items():
+            expected = models[slavename].order(masternames)
+            assert granted[slavename] == expected, f"{slavename}: granted {granted[slavename]} instead of {expected}"
+            granted[slavename].clear()
+    log.info(f"{ROUNDS} rounds granted in round-robin order")
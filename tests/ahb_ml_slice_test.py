@@ -0,0 +1,230 @@
+#
+# MIT License
+#
+# Copyright (c) 2024-2025 nbiotcloud
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+#
+"""
+Unified Chip Design Platform - AMBA - AHB Multilayer Register Slice Tests.
+
+The masters of :any:`UcdpAhbMlSliceExampleMod` issue back-to-back `NONSEQ` transfers to one slave at a time.
+Every transfer takes the clock cycles of the latency overview, plus the wait states of the slave.
+Unmapped addresses are answered with a two-cycle `ERROR` response through all register slices.
+All masters together must not lose or corrupt any transfer.
+"""
+
+import logging
+import random
+
+import cocotb
+from cocotb.clock import Clock
+from cocotb.triggers import RisingEdge
+
+from tests.ahb_driver import BurstType, SizeType, TransType
+
+SLAVES = {"mem": 0x0000, "rom": 0x1000, "io": 0x2000, "sram": 0x3000}
+"""Base Address per Slave."""
+
+UNMAPPED = 0x4000
+"""Unmapped Address."""
+
+LATENCY = {
+    "cpu": {"mem": 1, "rom": 2},
+    "dsp": {"mem": 2, "rom": 3, "io": 3},
+    "dma": {"mem": 2, "io": 3, "sram": 4},
+    "ext": {"mem": 3, "io": 4, "sram": 5},
+}
+"""Clock Cycles per Transfer without Wait States per Master and Slave."""
+
+NUM = 16
+"""Transfers per Sequence."""
+
+
+async def wait_clocks(clock, cycles):
+    """Helper Function."""
+    for _ in range(cycles):
+        await RisingEdge(clock)
+
+
+async def slave(dut, slavename: str, waits: dict[str, int | None], mem: dict[int, int]):
+    """Memory Slave with `waits[slavename]` wait states per transfer - random ones if `None`."""
+    hclk = dut.main_clk_i
+    hsel = getattr(dut, f"ahb_slv_{slavename}_hsel_o")
+    htrans = getattr(dut, f"ahb_slv_{slavename}_htrans_o")
+    haddr = getattr(dut, f"ahb_slv_{slavename}_haddr_o")
+    hwrite = getattr(dut, f"ahb_slv_{slavename}_hwrite_o")
+    hwdata = getattr(dut, f"ahb_slv_{slavename}_hwdata_o")
+    hready = getattr(dut, f"ahb_slv_{slavename}_hready_o")
+    hreadyout = getattr(dut, f"ahb_slv_{slavename}_hreadyout_i")
+    hrdata = getattr(dut, f"ahb_slv_{slavename}_hrdata_i")
+    dph = None
+    busy = 0
+    while True:
+        await RisingEdge(hclk)
+        if dph is not None:
+            if busy:
+                busy -= 1
+            else:
+                assert hready.value, f"{slavename}: data phase at {dph[0]:#x} is extended beyond HREADYOUT"
+                addr, write = dph
+                if write:
+                    mem[addr] = int(hwdata.value)
+                dph = None
+        if hsel.value and hready.value and htrans.value in (TransType.NONSEQ, TransType.SEQ):
+            addr = int(haddr.value)
+            dph = (addr, bool(hwrite.value))
+            num_waits = waits[slavename]
+            busy = random.randint(0, 2) if num_waits is None else num_waits
+            hrdata.value = mem.get(addr, 0)
+        hreadyout.value = 0 if busy else 1
+
+
+async def master(dut, mastername: str, xfers: list[tuple[int, bool, int]]) -> tuple[int, list[int]]:
+    """
+    Issue `xfers` (address, write, data) back-to-back.
+
+    Return the clock cycles until the last data phase ends and the read data.
+    Transfers to the unmapped address must end with a two-cycle `ERROR` response.
+    """
+    hclk = dut.main_clk_i
+    htrans = getattr(dut, f"ahb_mst_{mastername}_htrans_i")
+    haddr = getattr(dut, f"ahb_mst_{mastername}_haddr_i")
+    hwrite = getattr(dut, f"ahb_mst_{mastername}_hwrite_i")
+    hwdata = getattr(dut, f"ahb_mst_{mastername}_hwdata_i")
+    hready = getattr(dut, f"ahb_mst_{mastername}_hready_o")
+    hresp = getattr(dut, f"ahb_mst_{mastername}_hresp_o")
+    hrdata = getattr(dut, f"ahb_mst_{mastername}_hrdata_o")
+    rdata = []
+    cycles = 0
+    aph = 0
+    dph = None
+    first_err = False
+    haddr.value, hwrite.value, _ = xfers[0]
+    htrans.value = TransType.NONSEQ
+    while (dph is not None) or (aph < len(xfers)):
+        await RisingEdge(hclk)
+        cycles += 1
+        if dph is not None and not hready.value:
+            first_err = bool(hresp.value)
+        if hready.value:
+            if dph is not None:
+                if dph[0] == UNMAPPED:
+                    assert hresp.value, f"{mastername}: missing error response"
+                    assert first_err, f"{mastername}: error response is not two-cycle"
+                else:
+                    assert not hresp.value, f"{mastername}: error response at {dph[0]:#x}"
+                    if not dph[1]:
+                        rdata.append(int(hrdata.value))
+            first_err = False
+            dph = xfers[aph] if aph < len(xfers) else None
+            aph += 1
+            if dph is not None and dph[1]:
+                hwdata.value = dph[2]
+            if aph < len(xfers):
+                haddr.value, hwrite.value, _ = xfers[aph]
+            else:
+                htrans.value = TransType.IDLE
+    return cycles, rdata
+
+
+def sequence(
+    mastername: str, slavenames: tuple[str, ...], num: int, errors: bool = False
+) -> tuple[list[tuple[int, bool, int]], list[int]]:
+    """Writes and Reads of `mastername` to random slaves of `slavenames` and the expected read data."""
+    offs = 0x100 * tuple(LATENCY).index(mastername)
+    mem: dict[int, int] = {}
+    xfers = []
+    expected = []
+    for _ in range(num):
+        if errors and random.randrange(8) == 0:
+            xfers.append((UNMAPPED, False, 0))
+            continue
+        addr = SLAVES[random.choice(slavenames)] + offs + 4 * random.randrange(8)
+        write = random.choice((False, True))
+        data = random.getrandbits(32)
+        xfers.append((addr, write, data))
+        if write:
+            mem[addr] = data
+        else:
+            expected.append(mem.get(addr, 0))
+    return xfers, expected
+
+
+@cocotb.test()
+async def ahb_ml_slice_test(dut):
+    """Latency and Integrity of Transfers through Register Slices."""
+    log = logging.getLogger(__name__)
+    log.setLevel(logging.INFO)
+
+    hclk = dut.main_clk_i
+    rst_an = dut.main_rst_an_i
+
+    for mastername in LATENCY:
+        getattr(dut, f"ahb_mst_{mastername}_htrans_i").value = TransType.IDLE
+        getattr(dut, f"ahb_mst_{mastername}_haddr_i").value = 0
+        getattr(dut, f"ahb_mst_{mastername}_hwrite_i").value = 0
+        getattr(dut, f"ahb_mst_{mastername}_hwdata_i").value = 0
+        getattr(dut, f"ahb_mst_{mastername}_hsize_i").value = SizeType.WORD
+        getattr(dut, f"ahb_mst_{mastername}_hburst_i").value = BurstType.SINGLE
+    waits: dict[str, int | None] = dict.fromkeys(SLAVES, 0)
+    mems: dict[str, dict[int, int]] = {slavename: {} for slavename in SLAVES}
+    for slavename in SLAVES:
+        getattr(dut, f"ahb_slv_{slavename}_hreadyout_i").value = 1
+        getattr(dut, f"ahb_slv_{slavename}_hresp_i").value = 0
+        getattr(dut, f"ahb_slv_{slavename}_hrdata_i").value = 0
+        cocotb.start_soon(slave(dut, slavename, waits, mems[slavename]))
+
+    cocotb.start_soon(Clock(hclk, period=10).start())
+
+    # initial reset
+    rst_an.value = 0
+    await wait_clocks(hclk, 10)
+    rst_an.value = 1
+    await wait_clocks(hclk, 10)
+
+    # one master and one slave at a time
+    for num_waits in (0, 1):
+        for slavename in SLAVES:
+            waits[slavename] = num_waits
+        for mastername, latencies in LATENCY.items():
+            for slavename, latency in latencies.items():
+                # the expected read data assumes an empty memory
+                mems[slavename].clear()
+                xfers, expected = sequence(mastername, (slavename,), NUM)
+                ideal = 1 + NUM * (latency + num_waits)
+                cycles, rdata = await master(dut, mastername, xfers)
+                log.info(f"{mastername} -> {slavename}: {cycles} cycles for {NUM} transfers ({ideal} ideal)")
+                assert rdata == expected, f"{mastername} -> {slavename}: read data mismatch"
+                assert cycles == ideal, f"{mastername} -> {slavename}: {cycles - ideal} cycles off"
+                await wait_clocks(hclk, 3)
+
+    # all masters together with random wait states and error responses
+    for slavename in SLAVES:
+        waits[slavename] = None
+        mems[slavename].clear()
+    seqs = {
+        mastername: sequence(mastername, tuple(latencies), 4 * NUM, errors=True)
+        for mastername, latencies in LATENCY.items()
+    }
+    tasks = {mastername: cocotb.start_soon(master(dut, mastername, xfers)) for mastername, (xfers, _) in seqs.items()}
+    for mastername, task in tasks.items():
+        cycles, rdata = await task
+        log.info(f"{mastername}: {cycles} cycles for {4 * NUM} transfers")
+        assert rdata == seqs[mastername][1], f"{mastername}: read data mismatch"
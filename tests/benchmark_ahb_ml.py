@@ -0,0 +1,306 @@
+#
+# MIT License
+#
+# Copyright (c) 2024-2025 nbiotcloud
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+#
+"""
+AHB Multilayer Scaling Benchmark.
+
+Builds synthetic multilayers from 2x2 up to 64x256 masters x slaves with sparse and dense connectivity
+and measures every phase separately:
+
+* `build`: `UcdpAhbMlMod._build` plus all `add_master`/`add_slave` calls
+* `build_dep`: `UcdpAhbMlMod._build_dep`
+* `overview`: `UcdpAhbMlMod.get_overview`
+* `generate`: `u.generate(..., "hdl")`
+
+`--rtl-style` selects the RTL emission style of the multilayer.
+The size of the generated HDL is reported as `hdl_bytes`.
+
+The peak memory of every phase is recorded via `tracemalloc`, which slows down all phases.
+Use `--no-tracemalloc` for plain timing.
+
+`--reference` compares the peak memory and HDL size against a previous result file
+and fails if any of them grew by more than `--tolerance`.
+Timing is not compared, as it depends on the machine.
+The peak memory depends on the Python, pydantic and ucdp versions, so the comparison is left to this script
+and not part of the unit tests.
+
+Run from the project root:
+
+    python -m tests.benchmark_ahb_ml --output bench-ahb-ml.json
+    python -m tests.benchmark_ahb_ml --max-pairs 512 --connectivity sparse
+    python -m tests.benchmark_ahb_ml --rtl-style array --output bench-ahb-ml-array.json
+    python -m tests.benchmark_ahb_ml --max-pairs 128 --reference tests/testdata/benchmark_ahb_ml.json
+"""
+
+import argparse
+import json
+import os
+import platform
+import sys
+import tempfile
+import tracemalloc
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
+from importlib.metadata import version
+from pathlib import Path
+from time import perf_counter
+from typing import Any, Literal, NamedTuple
+from unittest import mock
+
+import ucdp as u
+
+from ucdp_amba.ucdp_ahb_ml import RtlStyle, UcdpAhbMlMod
+
+Connectivity = Literal["sparse", "dense"]
+
+SIZES: tuple[tuple[int, int], ...] = ((2, 2), (4, 8), (8, 16), (16, 32), (32, 64), (48, 200), (64, 256))
+"""Number of Masters and Slaves."""
+
+SPARSE_MASTERS_PER_SLAVE = 2
+"""Number of Masters accessing one Slave in a Sparse Multilayer."""
+
+PHASES = ("build", "build_dep", "overview", "generate")
+
+METRICS = (*(f"{phase}_peak_kib" for phase in PHASES), "hdl_bytes")
+"""Measurements compared against the Reference."""
+
+TOLERANCE = 0.25
+"""Allowed Relative Growth of a Metric over the Reference."""
+
+SLACK_KIB = 64
+"""Allowed Absolute Growth of a Peak Memory over the Reference, for small Phases."""
+
+_ELABORATE: dict[str, Any] = {}
+
+
+class Scenario(NamedTuple):
+    """Benchmark Scenario."""
+
+    num_masters: int
+    num_slaves: int
+    connectivity: Connectivity
+
+    @property
+    def name(self) -> str:
+        """Scenario Name."""
+        return f"{self.num_masters}x{self.num_slaves}-{self.connectivity}"
+
+    @property
+    def pairs(self) -> int:
+        """Number of Master/Slave Pairs."""
+        return self.num_masters * self.num_slaves
+
+    def get_masternames(self, slaveidx: int) -> list[str]:
+        """Names of the Masters accessing Slave with index `slaveidx`."""
+        if self.connectivity == "dense":
+            return [f"m{idx}" for idx in range(self.num_masters)]
+        num = min(self.num_masters, SPARSE_MASTERS_PER_SLAVE)
+        return [f"m{(slaveidx + offs) % self.num_masters}" for offs in range(num)]
+
+
+def get_scenarios(
+    max_pairs: int | None = None, connectivities: tuple[Connectivity, ...] = ("sparse", "dense")
+) -> tuple[Scenario, ...]:
+    """
+    All Scenarios with at most `max_pairs` Master/Slave Pairs.
+
+    >>> [scenario.name for scenario in get_scenarios(max_pairs=32)]
+    ['2x2-sparse', '2x2-dense', '4x8-sparse', '4x8-dense']
+    """
+    return tuple(
+        Scenario(num_masters, num_slaves, connectivity)
+        for num_masters, num_slaves in SIZES
+        if max_pairs is None or num_masters * num_slaves <= max_pairs
+        for connectivity in connectivities
+    )
+
+
+class BenchAhbMlMod(UcdpAhbMlMod):
+    """AHB Multilayer Measuring its `_build_dep`."""
+
+    def _build_dep(self):
+        with _measure(_ELABORATE, "build_dep"):
+            super()._build_dep()
+
+
+class AhbMlBenchMod(u.AMod):
+    """Synthetic Multilayer."""
+
+    scenario: Scenario = Scenario(2, 2, "dense")
+    rtl_style: RtlStyle = "unrolled"
+
+    def _build(self):
+        scenario = self.scenario
+        with _measure(_ELABORATE, "build"):
+            ml = BenchAhbMlMod(self, "u_ml", rtl_style=self.rtl_style)
+            for idx in range(scenario.num_masters):
+                ml.add_master(f"m{idx}")
+            for idx in range(scenario.num_slaves):
+                ml.add_slave(f"s{idx}", size="4kb", masternames=scenario.get_masternames(idx))
+
+
+@contextmanager
+def _measure(result: dict[str, Any], phase: str) -> Iterator[None]:
+    """Record duration and - if `tracemalloc` is running - peak memory of `phase` in `result`."""
+    use_tracemalloc = tracemalloc.is_tracing()
+    if use_tracemalloc:
+        tracemalloc.reset_peak()
+        base, _ = tracemalloc.get_traced_memory()
+    start = perf_counter()
+    yield
+    result[f"{phase}_s"] = perf_counter() - start
+    if use_tracemalloc:
+        _, peak = tracemalloc.get_traced_memory()
+        result[f"{phase}_peak_kib"] = (peak - base) // 1024
+
+
+def run_scenario(scenario: Scenario, use_tracemalloc: bool = True, rtl_style: RtlStyle = "unrolled") -> dict[str, Any]:
+    """
+    Run one Scenario and return its Measurements.
+
+    `build` and `build_dep` are measured within the module construction, which runs both.
+    `elaborate_s` is the duration of the whole construction.
+    """
+    result: dict[str, Any] = {
+        "name": scenario.name,
+        "masters": scenario.num_masters,
+        "slaves": scenario.num_slaves,
+        "connectivity": scenario.connectivity,
+        "rtl_style": rtl_style,
+    }
+    _ELABORATE.clear()
+    if use_tracemalloc:
+        tracemalloc.start()
+    try:
+        start = perf_counter()
+        top = AhbMlBenchMod(scenario=scenario, rtl_style=rtl_style)
+        result["elaborate_s"] = perf_counter() - start
+        result.update(_ELABORATE)
+        ml = top.get_inst("u_ml")
+        result["routes"] = sum(len(slavenames) for slavenames in ml._master_slaves.values())
+        result["signals"] = len(ml.portssignals) - len(ml.ports)
+
+        with _measure(result, "overview"):
+            ml.get_overview()
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            with _measure(result, "generate"), mock.patch.dict(os.environ, {"PRJROOT": tmpdir}):
+                u.generate(top, "hdl")
+            result["hdl_bytes"] = sum(path.stat().st_size for path in Path(tmpdir).rglob("*.sv"))
+    finally:
+        if use_tracemalloc:
+            tracemalloc.stop()
+    return result
+
+
+def run(
+    scenarios: tuple[Scenario, ...],
+    use_tracemalloc: bool = True,
+    log: Callable[[str], None] | None = None,
+    rtl_style: RtlStyle = "unrolled",
+) -> dict[str, Any]:
+    """
+    Run all `scenarios` and return machine-readable Results.
+
+    The first scenario is run once upfront, so its measurements do not include filling the type caches.
+    """
+    results = []
+    if scenarios:
+        run_scenario(scenarios[0], use_tracemalloc=False, rtl_style=rtl_style)
+    for scenario in scenarios:
+        result = run_scenario(scenario, use_tracemalloc=use_tracemalloc, rtl_style=rtl_style)
+        if log:
+            times = " ".join(f"{phase}={result[f'{phase}_s']:.3f}s" for phase in PHASES)
+            sizes = f"routes={result['routes']} signals={result['signals']} hdl={result['hdl_bytes']}B"
+            log(f"{scenario.name:>16}: {sizes} {times}")
+        results.append(result)
+    return {
+        "python": platform.python_version(),
+        "ucdp": version("ucdp"),
+        "tracemalloc": use_tracemalloc,
+        "results": results,
+    }
+
+
+def compare(results: dict[str, Any], reference: dict[str, Any], tolerance: float = TOLERANCE) -> list[str]:
+    """
+    Compare `results` against `reference` and return all Metrics exceeding it by more than `tolerance`.
+
+    Peak memories may additionally exceed the reference by `SLACK_KIB`.
+    Scenarios and Metrics missing in either of them are skipped.
+
+    >>> reference = {"results": [{"name": "2x2-dense", "generate_peak_kib": 1000, "hdl_bytes": 1000}]}
+    >>> results = {"results": [{"name": "2x2-dense", "generate_peak_kib": 1400, "hdl_bytes": 1300}]}
+    >>> for violation in compare(results, reference): violation
+    '2x2-dense: generate_peak_kib=1400 exceeds reference 1000 by more than 25%'
+    '2x2-dense: hdl_bytes=1300 exceeds reference 1000 by more than 25%'
+    >>> compare(results, reference, tolerance=0.5)
+    []
+    """
+    refs = {(ref["name"], ref.get("rtl_style", "unrolled")): ref for ref in reference["results"]}
+    violations = []
+    for result in results["results"]:
+        ref = refs.get((result["name"], result.get("rtl_style", "unrolled")))
+        if ref is None:
+            continue
+        for metric in METRICS:
+            if metric not in result or metric not in ref:
+                continue
+            slack = SLACK_KIB if metric.endswith("_kib") else 0
+            if result[metric] > ref[metric] * (1 + tolerance) + slack:
+                violations.append(
+                    f"{result['name']}: {metric}={result[metric]} exceeds reference {ref[metric]} "
+                    f"by more than {tolerance:.0%}"
+                )
+    return violations
+
+
+def main(args: list[str] | None = None) -> None:
+    """Command Line Interface."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--output", "-o", type=Path, default=Path("bench-ahb-ml.json"), help="JSON Result File")
+    parser.add_argument("--max-pairs", type=int, help="Skip Scenarios with more Master/Slave Pairs")
+    parser.add_argument("--connectivity", choices=("sparse", "dense"), action="append", help="Connectivity")
+    parser.add_argument("--rtl-style", choices=("unrolled", "array"), default="unrolled", help="RTL Emission Style")
+    parser.add_argument("--no-tracemalloc", action="store_true", help="Skip Memory Measurement")
+    parser.add_argument("--reference", type=Path, help="Compare against this JSON Result File")
+    parser.add_argument("--tolerance", type=float, default=TOLERANCE, help="Allowed Relative Growth over Reference")
+    ns = parser.parse_args(args)
+    connectivities = tuple(ns.connectivity or ("sparse", "dense"))
+    scenarios = get_scenarios(max_pairs=ns.max_pairs, connectivities=connectivities)
+    results = run(scenarios, use_tracemalloc=not ns.no_tracemalloc, log=print, rtl_style=ns.rtl_style)
+    ns.output.write_text(json.dumps(results, indent=2) + "\n")
+    print(f"Results written to {ns.output}")
+    if ns.reference:
+        violations = compare(results, json.loads(ns.reference.read_text()), tolerance=ns.tolerance)
+        for violation in violations:
+            print(violation)
+        if violations:
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    # modules defined in `__main__` cannot be referenced by the generator, so use the importable module
+    from tests.benchmark_ahb_ml import main as main_
+
+    main_(sys.argv[1:])
@@ -0,0 +1,235 @@
+#
+# MIT License
+#
+# Copyright (c) 2024-2025 nbiotcloud
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+#
+"""
+FSM Encoding Logic Depth Comparison.
+
+Generates the AHB multilayer and the AHB to APB bridge of :any:`FsmDepthMod` for every FSM encoding,
+maps them via `yosys` to generic two-input gates and multiplexers, without any technology library,
+and reports per module:
+
+* `ffs`: number of flip-flops
+* `gates`: number of gates
+* `depth`: longest gate path between flip-flops and ports
+* `fsm_next`: longest gate path into the FSM flip-flops - the next-state logic
+* `fsm_decode`: longest gate path starting at the FSM flip-flops - the state decode and everything behind it
+
+Every gate counts as one level. The numbers are meant for comparing the encodings, not for timing closure.
+
+Measured with `yowasp-yosys` (Yosys 0.70), unrolled / array RTL style:
+
+| Module    | Encoding | FFs       | Gates       | Depth   | FSM Next | FSM Decode |
+| --------- | -------- | --------- | ----------- | ------- | -------- | ---------- |
+| u_ml      | binary   | 112 / 113 | 1657 / 1561 | 23 / 22 | 21 / 20  | 23 / 22    |
+| u_ml      | onehot   | 120 / 121 | 1954 / 1549 | 20 / 19 | 18 / 19  | 18 / 17    |
+| u_ml      | gray     | 112 / 113 | 1655 / 1562 | 22 / 22 | 20 / 20  | 22 / 22    |
+| u_ahb2apb | binary   | 86        | 534         | 10      | 8        | 8          |
+| u_ahb2apb | onehot   | 88        | 583         | 11      | 10       | 5          |
+| u_ahb2apb | gray     | 86        | 534         | 9       | 8        | 7          |
+
+One-hot shortens the state decode at the cost of a few flip-flops, the bridge next-state logic gets deeper.
+`yosys` is not part of the development dependencies, `yowasp-yosys` works as well.
+
+Run from the project root:
+
+    python -m tests.logicdepth_fsm
+    python -m tests.logicdepth_fsm --yosys yowasp-yosys --rtl-style array --output depth-fsm.json
+"""
+
+import argparse
+import json
+import os
+import subprocess
+import sys
+import tempfile
+from pathlib import Path
+from typing import Any
+from unittest import mock
+
+import ucdp as u
+
+from ucdp_amba.types import FsmEncoding
+from ucdp_amba.ucdp_ahb2apb import UcdpAhb2apbMod
+from ucdp_amba.ucdp_ahb_ml import RtlStyle, UcdpAhbMlMod
+
+ENCODINGS: tuple[FsmEncoding, ...] = ("binary", "onehot", "gray")
+"""Compared FSM Encodings."""
+
+INSTS = ("u_ml", "u_ahb2apb")
+"""Compared Instances of :any:`FsmDepthMod`."""
+
+GATES = "AND,NAND,OR,NOR,XOR,XNOR,ANDNOT,ORNOT,MUX"
+"""Generic Gate Library for `abc`."""
+
+
+class FsmDepthMod(u.AMod):
+    """Multilayer and AHB to APB Bridge with `fsm_encoding`."""
+
+    fsm_encoding: FsmEncoding = "binary"
+    rtl_style: RtlStyle = "unrolled"
+
+    def _build(self):
+        ml = UcdpAhbMlMod(self, "u_ml", fsm_encoding=self.fsm_encoding, rtl_style=self.rtl_style)
+        ml.add_master("cpu")
+        ml.add_master("dma")
+        ml.add_slave("ram", size="64kb", masternames=("cpu", "dma"))
+        ml.add_slave("periph", size="64kb", masternames=("cpu", "dma"))
+        ml.add_slave("rom", size="64kb", masternames="cpu")
+
+        ahb2apb = UcdpAhb2apbMod(self, "u_ahb2apb", fsm_encoding=self.fsm_encoding)
+        for name in ("uart", "spi", "i2c", "gpio"):
+            ahb2apb.add_slave(name)
+
+
+def _get_graph(module: dict[str, Any], fsmbits: set[Any]) -> tuple[dict[Any, list[Any]], list[tuple[Any, bool]], int]:
+    """Gate Inputs per Gate Output, Endpoints with FSM Flag and Number of Flip-Flops."""
+    drivers: dict[Any, list[Any]] = {}
+    endpoints: list[tuple[Any, bool]] = []
+    ffs = 0
+    for cell in module["cells"].values():
+        conns = cell["connections"]
+        if "DFF" in cell["type"]:
+            ffs += 1
+            is_fsm = any(bit in fsmbits for bit in conns["Q"])
+            endpoints.extend((bit, is_fsm) for port, bits in conns.items() if port not in ("C", "Q") for bit in bits)
+        else:
+            drivers[conns["Y"][0]] = [bit for port, bits in conns.items() if port != "Y" for bit in bits]
+    for port in module["ports"].values():
+        if port["direction"] == "output":
+            endpoints.extend((bit, False) for bit in port["bits"])
+    return drivers, endpoints, ffs
+
+
+def get_depths(netlist: dict[str, Any], modname: str, fsmprefix: str = "fsm") -> dict[str, int]:
+    """
+    Gate Count and Logic Depths of module `modname` in the `yosys` JSON `netlist`.
+
+    Flip-flops, whose output drives a net starting with `fsmprefix`, are FSM flip-flops.
+
+        >>> netlist = {"modules": {"top": {
+        ...     "ports": {"a": {"direction": "input", "bits": [2]}, "y": {"direction": "output", "bits": [5]}},
+        ...     "netnames": {"fsm_r": {"bits": [3]}},
+        ...     "cells": {
+        ...         "ff": {"type": "$_DFF_P_", "connections": {"C": [9], "D": [4], "Q": [3]}},
+        ...         "inv": {"type": "$_NOT_", "connections": {"A": [3], "Y": [4]}},
+        ...         "and": {"type": "$_AND_", "connections": {"A": [2], "B": [4], "Y": [5]}},
+        ...     },
+        ... }}}
+        >>> get_depths(netlist, "top")
+        {'ffs': 1, 'gates': 2, 'depth': 2, 'fsm_next': 1, 'fsm_decode': 2}
+    """
+    module = netlist["modules"][modname]
+    fsmbits = {bit for name, net in module["netnames"].items() if name.startswith(fsmprefix) for bit in net["bits"]}
+    drivers, endpoints, ffs = _get_graph(module, fsmbits)
+
+    # arrival: gate levels from any start point, decode: gate levels from FSM flip-flops only (-1: unreachable)
+    arrival: dict[Any, int] = {}
+    decode: dict[Any, int] = {}
+    for endpoint, _ in endpoints:
+        stack = [endpoint]
+        while stack:
+            bit = stack[-1]
+            inputs = drivers.get(bit, [])
+            pending = [inp for inp in inputs if inp not in arrival]
+            if bit in arrival:
+                pass
+            elif pending:
+                stack.extend(pending)
+                continue
+            elif bit not in drivers:
+                arrival[bit] = 0
+                decode[bit] = 0 if bit in fsmbits else -1
+            else:
+                arrival[bit] = 1 + max(arrival[inp] for inp in inputs)
+                fsmdecode = max(decode[inp] for inp in inputs)
+                decode[bit] = fsmdecode + 1 if fsmdecode >= 0 else -1
+            stack.pop()
+
+    return {
+        "ffs": ffs,
+        "gates": len(drivers),
+        "depth": max((arrival[bit] for bit, _ in endpoints), default=0),
+        "fsm_next": max((arrival[bit] for bit, is_fsm in endpoints if is_fsm), default=0),
+        "fsm_decode": max((decode[bit] for bit, _ in endpoints), default=0),
+    }
+
+
+def synth(yosys: str, workdir: Path, filepaths: list[Path], modname: str) -> dict[str, Any]:
+    """Map `modname` from `filepaths` to generic gates and return the `yosys` JSON netlist."""
+    # `yosys` neither knows the `begin_keywords` directive nor flip-flops without reset in processes
+    # with asynchronous reset: drop the directive and turn the reset synchronous
+    names = []
+    for idx, filepath in enumerate(filepaths):
+        lines = filepath.read_text().replace(" or negedge main_rst_an_i", "").splitlines()
+        name = f"{idx}_{filepath.name}"
+        (workdir / name).write_text("\n".join(line for line in lines if "_keywords" not in line) + "\n")
+        names.append(name)
+    script = (
+        f"read_verilog -sv {' '.join(names)}; "
+        f"synth -flatten -nofsm -top {modname}; "
+        f"abc -g {GATES}; opt_clean; "
+        f"write_json {modname}.json"
+    )
+    # relative paths only: `yowasp-yosys` just sees the working directory
+    subprocess.run([yosys, "-q", "-p", script], cwd=workdir, check=True)
+    return json.loads((workdir / f"{modname}.json").read_text())
+
+
+def run(yosys: str = "yosys", rtl_style: RtlStyle = "unrolled", log=None) -> list[dict[str, Any]]:
+    """Logic Depths for all Encodings and Instances."""
+    results = []
+    for fsm_encoding in ENCODINGS:
+        top = FsmDepthMod(fsm_encoding=fsm_encoding, rtl_style=rtl_style)
+        with tempfile.TemporaryDirectory() as tmpdir:
+            workdir = Path(tmpdir)
+            with mock.patch.dict(os.environ, {"PRJROOT": str(workdir / "gen")}):
+                u.generate(top, "hdl")
+            filepaths = sorted((workdir / "gen").rglob("*.sv"))
+            for instname in INSTS:
+                modname = top.get_inst(instname).modname
+                result: dict[str, Any] = {"inst": instname, "fsm_encoding": fsm_encoding, "rtl_style": rtl_style}
+                result.update(get_depths(synth(yosys, workdir, filepaths, modname), modname))
+                if log:
+                    log(" ".join(f"{key}={value}" for key, value in result.items()))
+                results.append(result)
+    return results
+
+
+def main(args: list[str] | None = None) -> None:
+    """Command Line Interface."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--yosys", default="yosys", help="Yosys Executable")
+    parser.add_argument("--rtl-style", choices=("unrolled", "array"), default="unrolled", help="RTL Emission Style")
+    parser.add_argument("--output", "-o", type=Path, help="JSON Result File")
+    ns = parser.parse_args(args)
+    results = run(yosys=ns.yosys, rtl_style=ns.rtl_style, log=print)
+    if ns.output:
+        ns.output.write_text(json.dumps(results, indent=2) + "\n")
+        print(f"Results written to {ns.output}")
+
+
+if __name__ == "__main__":
+    # modules defined in `__main__` cannot be referenced by the generator, so use the importable module
+    from tests.logicdepth_fsm import main as main_
+
+    main_(sys.argv[1:])
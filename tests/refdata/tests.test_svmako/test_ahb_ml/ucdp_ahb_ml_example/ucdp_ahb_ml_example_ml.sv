@@ -260,10 +260,10 @@ module ucdp_ahb_ml_example_ml ( // ucdp_amba.ucdp_ahb_ml.UcdpAhbMlMod
   logic        mst_ext_addr_err_s;
   logic        mst_ext_ram_sel_s;
   logic        mst_ext_ram_req_r;
-  logic        mst_ext_ram_gnt_r;
+  logic        mst_ext_ram_gnt_r;    // data phase, switches with HREADY only
   logic        mst_ext_misc_sel_s;
   logic        mst_ext_misc_req_r;
-  logic        mst_ext_misc_gnt_r;
+  logic        mst_ext_misc_gnt_r;   // data phase, switches with HREADY only
   logic        mst_ext_gnt_s;
   logic [1:0]  mst_ext_htrans_s;     // AHB Transfer Type
   logic [1:0]  mst_ext_htrans_r;     // AHB Transfer Type
@@ -294,10 +294,10 @@ module ucdp_ahb_ml_example_ml ( // ucdp_amba.ucdp_ahb_ml.UcdpAhbMlMod
   logic        mst_dsp_addr_err_s;
   logic        mst_dsp_ram_sel_s;
   logic        mst_dsp_ram_req_r;
-  logic        mst_dsp_ram_gnt_r;
+  logic        mst_dsp_ram_gnt_r;    // data phase, switches with HREADY only
   logic        mst_dsp_periph_sel_s;
   logic        mst_dsp_periph_req_r;
-  logic        mst_dsp_periph_gnt_r;
+  logic        mst_dsp_periph_gnt_r; // data phase, switches with HREADY only
   logic        mst_dsp_gnt_s;
   logic [1:0]  mst_dsp_htrans_s;     // AHB Transfer Type
   logic [1:0]  mst_dsp_htrans_r;     // AHB Transfer Type
@@ -368,9 +368,11 @@ module ucdp_ahb_ml_example_ml ( // ucdp_amba.ucdp_ahb_ml.UcdpAhbMlMod
       end
     endcase
 
-    mst_ext_ram_req_s  = (mst_ext_ram_sel_s & mst_ext_new_xfer_s & mst_ext_rqstate_s) | mst_ext_ram_req_r;
+    mst_ext_ram_req_s  = (mst_ext_ram_sel_s & mst_ext_new_xfer_s & mst_ext_rqstate_s &
+                          (mst_ext_hready_s | mst_ext_ram_gnt_r)) | mst_ext_ram_req_r;
     mst_ext_ram_keep_s = mst_ext_ram_gnt_r & mst_ext_cont_xfer_s;
-    mst_ext_misc_req_s = (mst_ext_misc_sel_s & mst_ext_new_xfer_s & mst_ext_rqstate_s) | mst_ext_misc_req_r;
+    mst_ext_misc_req_s = (mst_ext_misc_sel_s & mst_ext_new_xfer_s & mst_ext_rqstate_s &
+                          (mst_ext_hready_s | mst_ext_misc_gnt_r)) | mst_ext_misc_req_r;
 
     // Grant Combination
     mst_ext_gnt_s = slv_ram_ext_gnt_s |
@@ -405,6 +407,8 @@ module ucdp_ahb_ml_example_ml ( // ucdp_amba.ucdp_ahb_ml.UcdpAhbMlMod
 
         fsm_error0_st: begin
           if (mst_ext_hready_s == 1'b1) begin
+            mst_ext_ram_gnt_r <= 1'b0;
+            mst_ext_misc_gnt_r <= 1'b0;
             fsm_ext_r <= fsm_error1_st;
           end
         end
@@ -447,23 +451,23 @@ module ucdp_ahb_ml_example_ml ( // ucdp_amba.ucdp_ahb_ml.UcdpAhbMlMod
                 fsm_ext_r <= fsm_idle_st;
               end
             end else begin // ((ahb_mst_ext_htrans_i == ahb_trans_nonseq_e)
-              if (mst_ext_addr_err_s == 1'b1) begin
-                if (mst_ext_hready_s == 1'b0) begin
-                  fsm_ext_r <= fsm_error0_st;
-                end else begin
+              if (mst_ext_hready_s == 1'b1) begin // address phase ends with the current data phase
+                if (mst_ext_addr_err_s == 1'b1) begin
                   fsm_ext_r <= fsm_error1_st;
+                end else if (mst_ext_gnt_s == 1'b1) begin
+                  mst_ext_ram_req_r <= 1'b0;
+                  mst_ext_misc_req_r <= 1'b0;
+                  fsm_ext_r <= fsm_transfer_st;
+                end else begin
+                  mst_ext_ram_req_r <= mst_ext_ram_sel_s;
+                  mst_ext_misc_req_r <= mst_ext_misc_sel_s;
+                  fsm_ext_r <= fsm_transfer_wait_st;
                 end
-              end else if (mst_ext_gnt_s == 1'b1) begin
-                mst_ext_ram_req_r <= 1'b0;
-                mst_ext_misc_req_r <= 1'b0;
-                fsm_ext_r <= fsm_transfer_st;
-              end else begin
-                mst_ext_ram_req_r <= mst_ext_ram_sel_s;
-                mst_ext_misc_req_r <= mst_ext_misc_sel_s;
-                fsm_ext_r <= fsm_transfer_wait_st;
+                mst_ext_ram_gnt_r <= slv_ram_ext_gnt_s;
+                mst_ext_misc_gnt_r <= slv_misc_ext_gnt_s;
+              end else if (mst_ext_addr_err_s == 1'b1) begin // the data phase continues
+                fsm_ext_r <= fsm_error0_st;
               end
-              mst_ext_ram_gnt_r <= slv_ram_ext_gnt_s;
-              mst_ext_misc_gnt_r <= slv_misc_ext_gnt_s;
             end
           end
         end
@@ -525,7 +529,9 @@ module ucdp_ahb_ml_example_ml ( // ucdp_amba.ucdp_ahb_ml.UcdpAhbMlMod
       mst_ext_hauser_r <= ahb_mst_ext_hauser_i;
     end
 
-    mst_ext_hwrite_dph_r <= mst_ext_hwrite_s;
+    if (mst_ext_hready_s == 1'b1) begin  // the address phase ends with the current data phase
+      mst_ext_hwrite_dph_r <= mst_ext_hwrite_s;
+    end
   end
 
   // Master 'ext' Mux
@@ -678,9 +684,11 @@ module ucdp_ahb_ml_example_ml ( // ucdp_amba.ucdp_ahb_ml.UcdpAhbMlMod
       end
     endcase
 
-    mst_dsp_ram_req_s    = (mst_dsp_ram_sel_s & mst_dsp_new_xfer_s & mst_dsp_rqstate_s) | mst_dsp_ram_req_r;
+    mst_dsp_ram_req_s    = (mst_dsp_ram_sel_s & mst_dsp_new_xfer_s & mst_dsp_rqstate_s &
+                            (mst_dsp_hready_s | mst_dsp_ram_gnt_r)) | mst_dsp_ram_req_r;
     mst_dsp_ram_keep_s   = mst_dsp_ram_gnt_r & mst_dsp_cont_xfer_s;
-    mst_dsp_periph_req_s = (mst_dsp_periph_sel_s & mst_dsp_new_xfer_s & mst_dsp_rqstate_s) | mst_dsp_periph_req_r;
+    mst_dsp_periph_req_s = (mst_dsp_periph_sel_s & mst_dsp_new_xfer_s & mst_dsp_rqstate_s &
+                            (mst_dsp_hready_s | mst_dsp_periph_gnt_r)) | mst_dsp_periph_req_r;
 
     // Grant Combination
     mst_dsp_gnt_s = slv_ram_dsp_gnt_s |
@@ -715,6 +723,8 @@ module ucdp_ahb_ml_example_ml ( // ucdp_amba.ucdp_ahb_ml.UcdpAhbMlMod
 
         fsm_error0_st: begin
           if (mst_dsp_hready_s == 1'b1) begin
+            mst_dsp_ram_gnt_r <= 1'b0;
+            mst_dsp_periph_gnt_r <= 1'b0;
             fsm_dsp_r <= fsm_error1_st;
           end
         end
@@ -757,23 +767,23 @@ module ucdp_ahb_ml_example_ml ( // ucdp_amba.ucdp_ahb_ml.UcdpAhbMlMod
                 fsm_dsp_r <= fsm_idle_st;
               end
             end else begin // ((ahb_mst_dsp_htrans_i == ahb_trans_nonseq_e)
-              if (mst_dsp_addr_err_s == 1'b1) begin
-                if (mst_dsp_hready_s == 1'b0) begin
-                  fsm_dsp_r <= fsm_error0_st;
-                end else begin
+              if (mst_dsp_hready_s == 1'b1) begin // address phase ends with the current data phase
+                if (mst_dsp_addr_err_s == 1'b1) begin
                   fsm_dsp_r <= fsm_error1_st;
+                end else if (mst_dsp_gnt_s == 1'b1) begin
+                  mst_dsp_ram_req_r <= 1'b0;
+                  mst_dsp_periph_req_r <= 1'b0;
+                  fsm_dsp_r <= fsm_transfer_st;
+                end else begin
+                  mst_dsp_ram_req_r <= mst_dsp_ram_sel_s;
+                  mst_dsp_periph_req_r <= mst_dsp_periph_sel_s;
+                  fsm_dsp_r <= fsm_transfer_wait_st;
                 end
-              end else if (mst_dsp_gnt_s == 1'b1) begin
-                mst_dsp_ram_req_r <= 1'b0;
-                mst_dsp_periph_req_r <= 1'b0;
-                fsm_dsp_r <= fsm_transfer_st;
-              end else begin
-                mst_dsp_ram_req_r <= mst_dsp_ram_sel_s;
-                mst_dsp_periph_req_r <= mst_dsp_periph_sel_s;
-                fsm_dsp_r <= fsm_transfer_wait_st;
+                mst_dsp_ram_gnt_r <= slv_ram_dsp_gnt_s;
+                mst_dsp_periph_gnt_r <= slv_periph_dsp_gnt_s;
+              end else if (mst_dsp_addr_err_s == 1'b1) begin // the data phase continues
+                fsm_dsp_r <= fsm_error0_st;
               end
-              mst_dsp_ram_gnt_r <= slv_ram_dsp_gnt_s;
-              mst_dsp_periph_gnt_r <= slv_periph_dsp_gnt_s;
             end
           end
         end
@@ -835,7 +845,9 @@ module ucdp_ahb_ml_example_ml ( // ucdp_amba.ucdp_ahb_ml.UcdpAhbMlMod
       mst_dsp_hauser_r <= ahb_mst_dsp_hauser_i;
     end
 
-    mst_dsp_hwrite_dph_r <= mst_dsp_hwrite_s;
+    if (mst_dsp_hready_s == 1'b1) begin  // the address phase ends with the current data phase
+      mst_dsp_hwrite_dph_r <= mst_dsp_hwrite_s;
+    end
   end
 
   // Master 'dsp' Mux
@@ -1086,7 +1098,7 @@ module ucdp_ahb_ml_example_ml ( // ucdp_amba.ucdp_ahb_ml.UcdpAhbMlMod
   always_comb begin: proc_periph_asgn
     slv_periph_dsp_gnt_s = mst_dsp_periph_req_s;
 
-    ahb_slv_periph_hsel_o        = mst_dsp_periph_req_s;  // address phase signals
+    ahb_slv_periph_hsel_o        = mst_dsp_periph_req_s | (mst_dsp_periph_gnt_r & mst_dsp_cont_xfer_s);  // address phase signals
     if (mst_dsp_periph_sel_s == 1'b1) begin
       ahb_slv_periph_haddr_o     = ahb_mst_dsp_haddr_i;
       ahb_slv_periph_hauser_o    = ahb_mst_dsp_hauser_i;
@@ -1130,7 +1142,7 @@ module ucdp_ahb_ml_example_ml ( // ucdp_amba.ucdp_ahb_ml.UcdpAhbMlMod
   always_comb begin: proc_misc_asgn
     slv_misc_ext_gnt_s = mst_ext_misc_req_s;
 
-    ahb_slv_misc_hsel_o        = mst_ext_misc_req_s;  // address phase signals
+    ahb_slv_misc_hsel_o        = mst_ext_misc_req_s | (mst_ext_misc_gnt_r & mst_ext_cont_xfer_s);  // address phase signals
     if (mst_ext_misc_sel_s == 1'b1) begin
       ahb_slv_misc_haddr_o     = ahb_mst_ext_haddr_i;
       ahb_slv_misc_hauser_o    = ahb_mst_ext_hauser_i;
@@ -0,0 +1,2043 @@
+// =============================================================================
+//
+//   @generated @fully-generated
+//
+//   THIS FILE IS GENERATED!!! DO NOT EDIT MANUALLY. CHANGES ARE LOST.
+//
+// =============================================================================
+//
+//  MIT License
+//
+//  Copyright (c) 2024-2025 nbiotcloud
+//
+//  Permission is hereby granted, free of charge, to any person obtaining a copy
+//  of this software and associated documentation files (the "Software"), to deal
+//  in the Software without restriction, including without limitation the rights
+//  to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+//  copies of the Software, and to permit persons to whom the Software is
+//  furnished to do so, subject to the following conditions:
+//
+//  The above copyright notice and this permission notice shall be included in all
+//  copies or substantial portions of the Software.
+//
+//  THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+//  IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+//  FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+//  AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+//  LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+//  OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+//  SOFTWARE.
+//
+// =============================================================================
+//
+// Module:     ucdp_amba.ucdp_ahb_ml_arb_example_ml
+// Data Model: ucdp_amba.ucdp_ahb_ml.UcdpAhbMlMod
+//
+//
+// | Master > Slave | mem_fixed | mem_rr | mem_wrr | mem_lrg | periph |
+// | -------------- | --------- | ------ | ------- | ------- | ------ |
+// | cpu            | X         | X      | X       | X       | X      |
+// | dsp            | X         | X      | X       | X       |        |
+// | dma            | X         | X      | X       | X       |        |
+//
+//
+//
+// * Top:     `None`
+// * Defines: `None`
+// * Size:    `20 KB`
+//
+// | Addrspace | Type     | Base     | Size              | Infos | Attributes |
+// | --------- | -------- | -------- | ----------------- | ----- | ---------- |
+// | mem_fixed | Slave    | `0x0`    | `1024x32 (4 KB)`  |       |            |
+// | mem_rr    | Slave    | `0x1000` | `1024x32 (4 KB)`  |       |            |
+// | mem_wrr   | Slave    | `0x2000` | `1024x32 (4 KB)`  |       |            |
+// | mem_lrg   | Slave    | `0x3000` | `1024x32 (4 KB)`  |       |            |
+// | periph    | Slave    | `0x4000` | `1024x32 (4 KB)`  |       |            |
+// | reserved0 | Reserved | `0x5000` | `3072x32 (12 KB)` |       |            |
+//
+// =============================================================================
+
+`begin_keywords "1800-2009"
+`default_nettype none  // implicit wires are forbidden
+
+module ucdp_ahb_ml_arb_example_ml ( // ucdp_amba.ucdp_ahb_ml.UcdpAhbMlMod
+  // main_i: Clock and Reset
+  input  wire         main_clk_i,                    // Clock
+  input  wire         main_rst_an_i,                 // Async Reset (Low-Active)
+  // ahb_mst_cpu_i: AHB Input 'cpu'
+  input  wire  [1:0]  ahb_mst_cpu_htrans_i,          // AHB Transfer Type
+  input  wire  [31:0] ahb_mst_cpu_haddr_i,           // AHB Bus Address
+  input  wire         ahb_mst_cpu_hwrite_i,          // AHB Write Enable
+  input  wire  [2:0]  ahb_mst_cpu_hsize_i,           // AHB Size
+  input  wire  [2:0]  ahb_mst_cpu_hburst_i,          // AHB Burst Type
+  input  wire  [3:0]  ahb_mst_cpu_hprot_i,           // AHB Transfer Protection
+  input  wire  [31:0] ahb_mst_cpu_hwdata_i,          // AHB Data
+  output logic        ahb_mst_cpu_hready_o,          // AHB Transfer Done
+  output logic        ahb_mst_cpu_hresp_o,           // AHB Response Error
+  output logic [31:0] ahb_mst_cpu_hrdata_o,          // AHB Data
+  // ahb_mst_dsp_i: AHB Input 'dsp'
+  input  wire  [1:0]  ahb_mst_dsp_htrans_i,          // AHB Transfer Type
+  input  wire  [31:0] ahb_mst_dsp_haddr_i,           // AHB Bus Address
+  input  wire         ahb_mst_dsp_hwrite_i,          // AHB Write Enable
+  input  wire  [2:0]  ahb_mst_dsp_hsize_i,           // AHB Size
+  input  wire  [2:0]  ahb_mst_dsp_hburst_i,          // AHB Burst Type
+  input  wire  [3:0]  ahb_mst_dsp_hprot_i,           // AHB Transfer Protection
+  input  wire  [31:0] ahb_mst_dsp_hwdata_i,          // AHB Data
+  output logic        ahb_mst_dsp_hready_o,          // AHB Transfer Done
+  output logic        ahb_mst_dsp_hresp_o,           // AHB Response Error
+  output logic [31:0] ahb_mst_dsp_hrdata_o,          // AHB Data
+  // ahb_mst_dma_i: AHB Input 'dma'
+  input  wire  [1:0]  ahb_mst_dma_htrans_i,          // AHB Transfer Type
+  input  wire  [31:0] ahb_mst_dma_haddr_i,           // AHB Bus Address
+  input  wire         ahb_mst_dma_hwrite_i,          // AHB Write Enable
+  input  wire  [2:0]  ahb_mst_dma_hsize_i,           // AHB Size
+  input  wire  [2:0]  ahb_mst_dma_hburst_i,          // AHB Burst Type
+  input  wire  [3:0]  ahb_mst_dma_hprot_i,           // AHB Transfer Protection
+  input  wire  [31:0] ahb_mst_dma_hwdata_i,          // AHB Data
+  output logic        ahb_mst_dma_hready_o,          // AHB Transfer Done
+  output logic        ahb_mst_dma_hresp_o,           // AHB Response Error
+  output logic [31:0] ahb_mst_dma_hrdata_o,          // AHB Data
+  // ahb_slv_mem_fixed_o: AHB Output 'mem_fixed'
+  output logic        ahb_slv_mem_fixed_hsel_o,      // AHB Slave Select
+  output logic [31:0] ahb_slv_mem_fixed_haddr_o,     // AHB Bus Address
+  output logic        ahb_slv_mem_fixed_hwrite_o,    // AHB Write Enable
+  output logic [1:0]  ahb_slv_mem_fixed_htrans_o,    // AHB Transfer Type
+  output logic [2:0]  ahb_slv_mem_fixed_hsize_o,     // AHB Size
+  output logic [2:0]  ahb_slv_mem_fixed_hburst_o,    // AHB Burst Type
+  output logic [3:0]  ahb_slv_mem_fixed_hprot_o,     // AHB Transfer Protection
+  output logic [31:0] ahb_slv_mem_fixed_hwdata_o,    // AHB Data
+  output logic        ahb_slv_mem_fixed_hready_o,    // AHB Transfer Done to Slave
+  input  wire         ahb_slv_mem_fixed_hreadyout_i, // AHB Transfer Done from Slave
+  input  wire         ahb_slv_mem_fixed_hresp_i,     // AHB Response Error
+  input  wire  [31:0] ahb_slv_mem_fixed_hrdata_i,    // AHB Data
+  // ahb_slv_mem_rr_o: AHB Output 'mem_rr'
+  output logic        ahb_slv_mem_rr_hsel_o,         // AHB Slave Select
+  output logic [31:0] ahb_slv_mem_rr_haddr_o,        // AHB Bus Address
+  output logic        ahb_slv_mem_rr_hwrite_o,       // AHB Write Enable
+  output logic [1:0]  ahb_slv_mem_rr_htrans_o,       // AHB Transfer Type
+  output logic [2:0]  ahb_slv_mem_rr_hsize_o,        // AHB Size
+  output logic [2:0]  ahb_slv_mem_rr_hburst_o,       // AHB Burst Type
+  output logic [3:0]  ahb_slv_mem_rr_hprot_o,        // AHB Transfer Protection
+  output logic [31:0] ahb_slv_mem_rr_hwdata_o,       // AHB Data
+  output logic        ahb_slv_mem_rr_hready_o,       // AHB Transfer Done to Slave
+  input  wire         ahb_slv_mem_rr_hreadyout_i,    // AHB Transfer Done from Slave
+  input  wire         ahb_slv_mem_rr_hresp_i,        // AHB Response Error
+  input  wire  [31:0] ahb_slv_mem_rr_hrdata_i,       // AHB Data
+  // ahb_slv_mem_wrr_o: AHB Output 'mem_wrr'
+  output logic        ahb_slv_mem_wrr_hsel_o,        // AHB Slave Select
+  output logic [31:0] ahb_slv_mem_wrr_haddr_o,       // AHB Bus Address
+  output logic        ahb_slv_mem_wrr_hwrite_o,      // AHB Write Enable
+  output logic [1:0]  ahb_slv_mem_wrr_htrans_o,      // AHB Transfer Type
+  output logic [2:0]  ahb_slv_mem_wrr_hsize_o,       // AHB Size
+  output logic [2:0]  ahb_slv_mem_wrr_hburst_o,      // AHB Burst Type
+  output logic [3:0]  ahb_slv_mem_wrr_hprot_o,       // AHB Transfer Protection
+  output logic [31:0] ahb_slv_mem_wrr_hwdata_o,      // AHB Data
+  output logic        ahb_slv_mem_wrr_hready_o,      // AHB Transfer Done to Slave
+  input  wire         ahb_slv_mem_wrr_hreadyout_i,   // AHB Transfer Done from Slave
+  input  wire         ahb_slv_mem_wrr_hresp_i,       // AHB Response Error
+  input  wire  [31:0] ahb_slv_mem_wrr_hrdata_i,      // AHB Data
+  // ahb_slv_mem_lrg_o: AHB Output 'mem_lrg'
+  output logic        ahb_slv_mem_lrg_hsel_o,        // AHB Slave Select
+  output logic [31:0] ahb_slv_mem_lrg_haddr_o,       // AHB Bus Address
+  output logic        ahb_slv_mem_lrg_hwrite_o,      // AHB Write Enable
+  output logic [1:0]  ahb_slv_mem_lrg_htrans_o,      // AHB Transfer Type
+  output logic [2:0]  ahb_slv_mem_lrg_hsize_o,       // AHB Size
+  output logic [2:0]  ahb_slv_mem_lrg_hburst_o,      // AHB Burst Type
+  output logic [3:0]  ahb_slv_mem_lrg_hprot_o,       // AHB Transfer Protection
+  output logic [31:0] ahb_slv_mem_lrg_hwdata_o,      // AHB Data
+  output logic        ahb_slv_mem_lrg_hready_o,      // AHB Transfer Done to Slave
+  input  wire         ahb_slv_mem_lrg_hreadyout_i,   // AHB Transfer Done from Slave
+  input  wire         ahb_slv_mem_lrg_hresp_i,       // AHB Response Error
+  input  wire  [31:0] ahb_slv_mem_lrg_hrdata_i,      // AHB Data
+  // ahb_slv_periph_o: AHB Output 'periph'
+  output logic        ahb_slv_periph_hsel_o,         // AHB Slave Select
+  output logic [31:0] ahb_slv_periph_haddr_o,        // AHB Bus Address
+  output logic        ahb_slv_periph_hwrite_o,       // AHB Write Enable
+  output logic [1:0]  ahb_slv_periph_htrans_o,       // AHB Transfer Type
+  output logic [2:0]  ahb_slv_periph_hsize_o,        // AHB Size
+  output logic [2:0]  ahb_slv_periph_hburst_o,       // AHB Burst Type
+  output logic [3:0]  ahb_slv_periph_hprot_o,        // AHB Transfer Protection
+  output logic [31:0] ahb_slv_periph_hwdata_o,       // AHB Data
+  output logic        ahb_slv_periph_hready_o,       // AHB Transfer Done to Slave
+  input  wire         ahb_slv_periph_hreadyout_i,    // AHB Transfer Done from Slave
+  input  wire         ahb_slv_periph_hresp_i,        // AHB Response Error
+  input  wire  [31:0] ahb_slv_periph_hrdata_i        // AHB Data
+);
+
+
+
+
+  // ------------------------------------------------------
+  //  Local Parameter
+  // ------------------------------------------------------
+  // ahb_trans
+  localparam integer       ahb_trans_width_p      = 2;    // Width in Bits
+  localparam logic   [1:0] ahb_trans_min_p        = 2'h0; // AHB Transfer Type
+  localparam logic   [1:0] ahb_trans_max_p        = 2'h3; // AHB Transfer Type
+  localparam logic   [1:0] ahb_trans_idle_e       = 2'h0; // No transfer
+  localparam logic   [1:0] ahb_trans_busy_e       = 2'h1; // Idle cycle within transfer
+  localparam logic   [1:0] ahb_trans_nonseq_e     = 2'h2; // Single transfer or first transfer of a burst
+  localparam logic   [1:0] ahb_trans_seq_e        = 2'h3; // Consecutive transfers of a burst
+  localparam logic   [1:0] ahb_trans_default_p    = 2'h0; // AHB Transfer Type
+  // ahb_resp
+  localparam integer       ahb_resp_width_p       = 1;    // Width in Bits
+  localparam logic         ahb_resp_min_p         = 1'b0; // AHB Response Error
+  localparam logic         ahb_resp_max_p         = 1'b1; // AHB Response Error
+  localparam logic         ahb_resp_okay_e        = 1'b0; // OK
+  localparam logic         ahb_resp_error_e       = 1'b1; // Error
+  localparam logic         ahb_resp_default_p     = 1'b0; // AHB Response Error
+  // ahb_size
+  localparam integer       ahb_size_width_p       = 3;    // Width in Bits
+  localparam logic   [2:0] ahb_size_min_p         = 3'h0; // AHB Size
+  localparam logic   [2:0] ahb_size_max_p         = 3'h7; // AHB Size
+  localparam logic   [2:0] ahb_size_byte_e        = 3'h0; // Byte
+  localparam logic   [2:0] ahb_size_halfword_e    = 3'h1; // Halfword
+  localparam logic   [2:0] ahb_size_word_e        = 3'h2; // Word
+  localparam logic   [2:0] ahb_size_doubleword_e  = 3'h3; // Doubleword
+  localparam logic   [2:0] ahb_size_fourword_e    = 3'h4; // 4-word
+  localparam logic   [2:0] ahb_size_eightword_e   = 3'h5; // 8-word
+  localparam logic   [2:0] ahb_size_sixteenword_e = 3'h6; // 16-word
+  localparam logic   [2:0] ahb_size_kilobit_e     = 3'h7; // 32-word
+  localparam logic   [2:0] ahb_size_default_p     = 3'h0; // AHB Size
+  // ahb_burst
+  localparam integer       ahb_burst_width_p      = 3;    // Width in Bits
+  localparam logic   [2:0] ahb_burst_min_p        = 3'h0; // AHB Burst Type
+  localparam logic   [2:0] ahb_burst_max_p        = 3'h7; // AHB Burst Type
+  localparam logic   [2:0] ahb_burst_single_e     = 3'h0; // Single transfer
+  localparam logic   [2:0] ahb_burst_incr_e       = 3'h1; // Incrementing burst of unspecified length
+  localparam logic   [2:0] ahb_burst_wrap4_e      = 3'h2; // 4-beat wrapping burst
+  localparam logic   [2:0] ahb_burst_incr4_e      = 3'h3; // 4-beat incrementing burst
+  localparam logic   [2:0] ahb_burst_wrap8_e      = 3'h4; // 8-beat wrapping burst
+  localparam logic   [2:0] ahb_burst_incr8_e      = 3'h5; // 8-beat incrementing burst
+  localparam logic   [2:0] ahb_burst_wrap16_e     = 3'h6; // 16-beat wrapping burst
+  localparam logic   [2:0] ahb_burst_incr16_e     = 3'h7; // 16-beat incrementing burst
+  localparam logic   [2:0] ahb_burst_default_p    = 3'h0; // AHB Burst Type
+  // ahb_write
+  localparam integer       ahb_write_width_p      = 1;    // Width in Bits
+  localparam logic         ahb_write_min_p        = 1'b0; // AHB Write Enable
+  localparam logic         ahb_write_max_p        = 1'b1; // AHB Write Enable
+  localparam logic         ahb_write_read_e       = 1'b0; // Read operation
+  localparam logic         ahb_write_write_e      = 1'b1; // Write operation
+  localparam logic         ahb_write_default_p    = 1'b0; // AHB Write Enable
+  // fsm
+  localparam integer       fsm_width_p            = 3;    // Width in Bits
+  localparam logic   [2:0] fsm_min_p              = 3'h0; // AHB ML FSM Type
+  localparam logic   [2:0] fsm_max_p              = 3'h7; // AHB ML FSM Type
+  localparam logic   [2:0] fsm_idle_st            = 3'h0; // No transfer
+  localparam logic   [2:0] fsm_transfer_st        = 3'h1; // Transfer
+  localparam logic   [2:0] fsm_transfer_finish_st = 3'h2; // Transfer Finish (wait for HREADY)
+  localparam logic   [2:0] fsm_transfer_wait_st   = 3'h3; // Transfer Wait for Grant
+  localparam logic   [2:0] fsm_error0_st          = 3'h4; // Pre-Error (wait for HREADY)
+  localparam logic   [2:0] fsm_error1_st          = 3'h5; // 1st Error Cycle
+  localparam logic   [2:0] fsm_error2_st          = 3'h6; // 2nd Error Cycle
+  localparam logic   [2:0] fsm_default_p          = 3'h0; // AHB ML FSM Type
+
+
+  // ------------------------------------------------------
+  //  Signals
+  // ------------------------------------------------------
+  logic [2:0]  fsm_cpu_r;                // Master 'cpu' FSM
+  logic        mst_cpu_new_xfer_s;
+  logic        mst_cpu_cont_xfer_s;
+  logic        mst_cpu_hready_s;
+  logic        mst_cpu_rqstate_s;
+  logic        mst_cpu_addr_err_s;
+  logic        mst_cpu_mem_fixed_sel_s;
+  logic        mst_cpu_mem_fixed_req_r;
+  logic        mst_cpu_mem_fixed_gnt_r;  // data phase, switches with HREADY only
+  logic        mst_cpu_mem_rr_sel_s;
+  logic        mst_cpu_mem_rr_req_r;
+  logic        mst_cpu_mem_rr_gnt_r;     // data phase, switches with HREADY only
+  logic        mst_cpu_mem_wrr_sel_s;
+  logic        mst_cpu_mem_wrr_req_r;
+  logic        mst_cpu_mem_wrr_gnt_r;    // data phase, switches with HREADY only
+  logic        mst_cpu_mem_lrg_sel_s;
+  logic        mst_cpu_mem_lrg_req_r;
+  logic        mst_cpu_mem_lrg_gnt_r;    // data phase, switches with HREADY only
+  logic        mst_cpu_periph_sel_s;
+  logic        mst_cpu_periph_req_r;
+  logic        mst_cpu_periph_gnt_r;     // data phase, switches with HREADY only
+  logic        mst_cpu_gnt_s;
+  logic [1:0]  mst_cpu_htrans_s;         // AHB Transfer Type
+  logic [1:0]  mst_cpu_htrans_r;         // AHB Transfer Type
+  logic [31:0] mst_cpu_haddr_s;          // AHB Bus Address
+  logic [31:0] mst_cpu_haddr_r;          // AHB Bus Address
+  logic        mst_cpu_hwrite_s;         // AHB Write Enable
+  logic        mst_cpu_hwrite_r;         // AHB Write Enable
+  logic [2:0]  mst_cpu_hsize_s;          // AHB Size
+  logic [2:0]  mst_cpu_hsize_r;          // AHB Size
+  logic [2:0]  mst_cpu_hburst_s;         // AHB Burst Type
+  logic [2:0]  mst_cpu_hburst_r;         // AHB Burst Type
+  logic [3:0]  mst_cpu_hprot_s;          // AHB Transfer Protection
+  logic [3:0]  mst_cpu_hprot_r;          // AHB Transfer Protection
+  logic        mst_cpu_hwrite_dph_r;     // data-phase write indicator
+  logic [2:0]  fsm_dsp_r;                // Master 'dsp' FSM
+  logic        mst_dsp_new_xfer_s;
+  logic        mst_dsp_cont_xfer_s;
+  logic        mst_dsp_hready_s;
+  logic        mst_dsp_rqstate_s;
+  logic        mst_dsp_addr_err_s;
+  logic        mst_dsp_mem_fixed_sel_s;
+  logic        mst_dsp_mem_fixed_req_r;
+  logic        mst_dsp_mem_fixed_gnt_r;  // data phase, switches with HREADY only
+  logic        mst_dsp_mem_rr_sel_s;
+  logic        mst_dsp_mem_rr_req_r;
+  logic        mst_dsp_mem_rr_gnt_r;     // data phase, switches with HREADY only
+  logic        mst_dsp_mem_wrr_sel_s;
+  logic        mst_dsp_mem_wrr_req_r;
+  logic        mst_dsp_mem_wrr_gnt_r;    // data phase, switches with HREADY only
+  logic        mst_dsp_mem_lrg_sel_s;
+  logic        mst_dsp_mem_lrg_req_r;
+  logic        mst_dsp_mem_lrg_gnt_r;    // data phase, switches with HREADY only
+  logic        mst_dsp_gnt_s;
+  logic [1:0]  mst_dsp_htrans_s;         // AHB Transfer Type
+  logic [1:0]  mst_dsp_htrans_r;         // AHB Transfer Type
+  logic [31:0] mst_dsp_haddr_s;          // AHB Bus Address
+  logic [31:0] mst_dsp_haddr_r;          // AHB Bus Address
+  logic        mst_dsp_hwrite_s;         // AHB Write Enable
+  logic        mst_dsp_hwrite_r;         // AHB Write Enable
+  logic [2:0]  mst_dsp_hsize_s;          // AHB Size
+  logic [2:0]  mst_dsp_hsize_r;          // AHB Size
+  logic [2:0]  mst_dsp_hburst_s;         // AHB Burst Type
+  logic [2:0]  mst_dsp_hburst_r;         // AHB Burst Type
+  logic [3:0]  mst_dsp_hprot_s;          // AHB Transfer Protection
+  logic [3:0]  mst_dsp_hprot_r;          // AHB Transfer Protection
+  logic        mst_dsp_hwrite_dph_r;     // data-phase write indicator
+  logic [2:0]  fsm_dma_r;                // Master 'dma' FSM
+  logic        mst_dma_new_xfer_s;
+  logic        mst_dma_cont_xfer_s;
+  logic        mst_dma_hready_s;
+  logic        mst_dma_rqstate_s;
+  logic        mst_dma_addr_err_s;
+  logic        mst_dma_mem_fixed_sel_s;
+  logic        mst_dma_mem_fixed_req_r;
+  logic        mst_dma_mem_fixed_gnt_r;  // data phase, switches with HREADY only
+  logic        mst_dma_mem_rr_sel_s;
+  logic        mst_dma_mem_rr_req_r;
+  logic        mst_dma_mem_rr_gnt_r;     // data phase, switches with HREADY only
+  logic        mst_dma_mem_wrr_sel_s;
+  logic        mst_dma_mem_wrr_req_r;
+  logic        mst_dma_mem_wrr_gnt_r;    // data phase, switches with HREADY only
+  logic        mst_dma_mem_lrg_sel_s;
+  logic        mst_dma_mem_lrg_req_r;
+  logic        mst_dma_mem_lrg_gnt_r;    // data phase, switches with HREADY only
+  logic        mst_dma_gnt_s;
+  logic [1:0]  mst_dma_htrans_s;         // AHB Transfer Type
+  logic [1:0]  mst_dma_htrans_r;         // AHB Transfer Type
+  logic [31:0] mst_dma_haddr_s;          // AHB Bus Address
+  logic [31:0] mst_dma_haddr_r;          // AHB Bus Address
+  logic        mst_dma_hwrite_s;         // AHB Write Enable
+  logic        mst_dma_hwrite_r;         // AHB Write Enable
+  logic [2:0]  mst_dma_hsize_s;          // AHB Size
+  logic [2:0]  mst_dma_hsize_r;          // AHB Size
+  logic [2:0]  mst_dma_hburst_s;         // AHB Burst Type
+  logic [2:0]  mst_dma_hburst_r;         // AHB Burst Type
+  logic [3:0]  mst_dma_hprot_s;          // AHB Transfer Protection
+  logic [3:0]  mst_dma_hprot_r;          // AHB Transfer Protection
+  logic        mst_dma_hwrite_dph_r;     // data-phase write indicator
+  logic        mst_cpu_mem_fixed_req_s;
+  logic        mst_cpu_mem_fixed_keep_s;
+  logic        slv_mem_fixed_cpu_sel_s;
+  logic        slv_mem_fixed_cpu_gnt_s;
+  logic        mst_dsp_mem_fixed_req_s;
+  logic        mst_dsp_mem_fixed_keep_s;
+  logic        slv_mem_fixed_dsp_sel_s;
+  logic        slv_mem_fixed_dsp_gnt_s;
+  logic        mst_dma_mem_fixed_req_s;
+  logic        mst_dma_mem_fixed_keep_s;
+  logic        slv_mem_fixed_dma_sel_s;
+  logic        slv_mem_fixed_dma_gnt_s;
+  logic        mst_cpu_mem_rr_req_s;
+  logic        mst_cpu_mem_rr_keep_s;
+  logic        slv_mem_rr_cpu_gnt_r;
+  logic        slv_mem_rr_cpu_sel_s;
+  logic        slv_mem_rr_cpu_gnt_s;
+  logic        mst_dsp_mem_rr_req_s;
+  logic        mst_dsp_mem_rr_keep_s;
+  logic        slv_mem_rr_dsp_gnt_r;
+  logic        slv_mem_rr_dsp_sel_s;
+  logic        slv_mem_rr_dsp_gnt_s;
+  logic        mst_dma_mem_rr_req_s;
+  logic        mst_dma_mem_rr_keep_s;
+  logic        slv_mem_rr_dma_gnt_r;
+  logic        slv_mem_rr_dma_sel_s;
+  logic        slv_mem_rr_dma_gnt_s;
+  logic        mst_cpu_mem_wrr_req_s;
+  logic        mst_cpu_mem_wrr_keep_s;
+  logic        slv_mem_wrr_cpu_gnt_r;
+  logic        slv_mem_wrr_cpu_sel_s;
+  logic        slv_mem_wrr_cpu_gnt_s;
+  logic        mst_dsp_mem_wrr_req_s;
+  logic        mst_dsp_mem_wrr_keep_s;
+  logic        slv_mem_wrr_dsp_gnt_r;
+  logic        slv_mem_wrr_dsp_sel_s;
+  logic        slv_mem_wrr_dsp_gnt_s;
+  logic        mst_dma_mem_wrr_req_s;
+  logic        mst_dma_mem_wrr_keep_s;
+  logic        slv_mem_wrr_dma_gnt_r;
+  logic        slv_mem_wrr_dma_sel_s;
+  logic        slv_mem_wrr_dma_gnt_s;
+  logic [1:0]  slv_mem_wrr_credit_r;     // remaining consecutive grants of the granted master
+  logic        mst_cpu_mem_lrg_req_s;
+  logic        mst_cpu_mem_lrg_keep_s;
+  logic        slv_mem_lrg_cpu_sel_s;
+  logic        slv_mem_lrg_cpu_gnt_s;
+  logic        mst_dsp_mem_lrg_req_s;
+  logic        mst_dsp_mem_lrg_keep_s;
+  logic        slv_mem_lrg_dsp_sel_s;
+  logic        slv_mem_lrg_dsp_gnt_s;
+  logic        mst_dma_mem_lrg_req_s;
+  logic        mst_dma_mem_lrg_keep_s;
+  logic        slv_mem_lrg_dma_sel_s;
+  logic        slv_mem_lrg_dma_gnt_s;
+  logic [8:0]  slv_mem_lrg_lrg_r;        // bit `p*3+q` with `p < q`: `p`-th master granted less recently than `q`-th master
+  logic        mst_cpu_periph_req_s;
+  logic        slv_periph_cpu_gnt_s;
+
+
+  // ------------------------------------------------------
+  // The Masters:
+  // ------------------------------------------------------
+  // Master 'cpu' Logic
+  always_comb begin: proc_cpu_logic
+    mst_cpu_new_xfer_s  = (ahb_mst_cpu_htrans_i == ahb_trans_nonseq_e) ? 1'b1 : 1'b0;
+    mst_cpu_cont_xfer_s = ((ahb_mst_cpu_htrans_i == ahb_trans_busy_e) ||
+                           (ahb_mst_cpu_htrans_i == ahb_trans_seq_e)) ? 1'b1 : 1'b0;
+    mst_cpu_rqstate_s   = ((fsm_cpu_r == fsm_idle_st) ||
+                           (fsm_cpu_r == fsm_transfer_st) ||
+                           (fsm_cpu_r == fsm_transfer_finish_st) ||
+                           (fsm_cpu_r == fsm_error2_st)) ? 1'b1 : 1'b0;
+
+    // Address Decoding
+    mst_cpu_addr_err_s = 1'b0;
+    mst_cpu_mem_fixed_sel_s = 1'b0;
+    mst_cpu_mem_rr_sel_s = 1'b0;
+    mst_cpu_mem_wrr_sel_s = 1'b0;
+    mst_cpu_mem_lrg_sel_s = 1'b0;
+    mst_cpu_periph_sel_s = 1'b0;
+
+    casez (ahb_mst_cpu_haddr_i[31:12])
+      20'b00000000000000000000: begin // mem_fixed
+        mst_cpu_mem_fixed_sel_s = 1'b1;
+      end
+
+      20'b00000000000000000001: begin // mem_rr
+        mst_cpu_mem_rr_sel_s = 1'b1;
+      end
+
+      20'b00000000000000000010: begin // mem_wrr
+        mst_cpu_mem_wrr_sel_s = 1'b1;
+      end
+
+      20'b00000000000000000011: begin // mem_lrg
+        mst_cpu_mem_lrg_sel_s = 1'b1;
+      end
+
+      20'b00000000000000000100: begin // periph
+        mst_cpu_periph_sel_s = 1'b1;
+      end
+
+      default: begin
+        mst_cpu_addr_err_s = mst_cpu_new_xfer_s;
+      end
+    endcase
+
+    mst_cpu_mem_fixed_req_s  = (mst_cpu_mem_fixed_sel_s & mst_cpu_new_xfer_s & mst_cpu_rqstate_s &
+                                (mst_cpu_hready_s | mst_cpu_mem_fixed_gnt_r)) | mst_cpu_mem_fixed_req_r;
+    mst_cpu_mem_fixed_keep_s = mst_cpu_mem_fixed_gnt_r & mst_cpu_cont_xfer_s;
+    mst_cpu_mem_rr_req_s     = (mst_cpu_mem_rr_sel_s & mst_cpu_new_xfer_s & mst_cpu_rqstate_s &
+                                (mst_cpu_hready_s | mst_cpu_mem_rr_gnt_r)) | mst_cpu_mem_rr_req_r;
+    mst_cpu_mem_rr_keep_s    = mst_cpu_mem_rr_gnt_r & mst_cpu_cont_xfer_s;
+    mst_cpu_mem_wrr_req_s    = (mst_cpu_mem_wrr_sel_s & mst_cpu_new_xfer_s & mst_cpu_rqstate_s &
+                                (mst_cpu_hready_s | mst_cpu_mem_wrr_gnt_r)) | mst_cpu_mem_wrr_req_r;
+    mst_cpu_mem_wrr_keep_s   = mst_cpu_mem_wrr_gnt_r & mst_cpu_cont_xfer_s;
+    mst_cpu_mem_lrg_req_s    = (mst_cpu_mem_lrg_sel_s & mst_cpu_new_xfer_s & mst_cpu_rqstate_s &
+                                (mst_cpu_hready_s | mst_cpu_mem_lrg_gnt_r)) | mst_cpu_mem_lrg_req_r;
+    mst_cpu_mem_lrg_keep_s   = mst_cpu_mem_lrg_gnt_r & mst_cpu_cont_xfer_s;
+    mst_cpu_periph_req_s     = (mst_cpu_periph_sel_s & mst_cpu_new_xfer_s & mst_cpu_rqstate_s &
+                                (mst_cpu_hready_s | mst_cpu_periph_gnt_r)) | mst_cpu_periph_req_r;
+
+    // Grant Combination
+    mst_cpu_gnt_s = slv_mem_fixed_cpu_gnt_s |
+                    slv_mem_rr_cpu_gnt_s |
+                    slv_mem_wrr_cpu_gnt_s |
+                    slv_mem_lrg_cpu_gnt_s |
+                    slv_periph_cpu_gnt_s;
+  end
+
+  // FSM for Master 'cpu'
+  always_ff @(posedge main_clk_i or negedge main_rst_an_i) begin: proc_cpu_fsm
+    if (main_rst_an_i == 1'b0) begin
+      fsm_cpu_r <= fsm_idle_st;
+      mst_cpu_mem_fixed_gnt_r <= 1'b0;
+      mst_cpu_mem_rr_gnt_r <= 1'b0;
+      mst_cpu_mem_wrr_gnt_r <= 1'b0;
+      mst_cpu_mem_lrg_gnt_r <= 1'b0;
+      mst_cpu_periph_gnt_r <= 1'b0;
+    end else begin
+      case (fsm_cpu_r)
+        fsm_idle_st: begin
+          if (mst_cpu_new_xfer_s == 1'b1) begin
+            if (mst_cpu_addr_err_s == 1'b1) begin
+              fsm_cpu_r <= fsm_error1_st;
+            end else if (mst_cpu_gnt_s == 1'b1) begin
+              mst_cpu_mem_fixed_req_r <= 1'b0;
+              mst_cpu_mem_rr_req_r <= 1'b0;
+              mst_cpu_mem_wrr_req_r <= 1'b0;
+              mst_cpu_mem_lrg_req_r <= 1'b0;
+              mst_cpu_periph_req_r <= 1'b0;
+              fsm_cpu_r <= fsm_transfer_st;
+            end else begin
+              mst_cpu_mem_fixed_req_r <= mst_cpu_mem_fixed_sel_s;
+              mst_cpu_mem_rr_req_r <= mst_cpu_mem_rr_sel_s;
+              mst_cpu_mem_wrr_req_r <= mst_cpu_mem_wrr_sel_s;
+              mst_cpu_mem_lrg_req_r <= mst_cpu_mem_lrg_sel_s;
+              mst_cpu_periph_req_r <= mst_cpu_periph_sel_s;
+              fsm_cpu_r <= fsm_transfer_wait_st;
+            end
+            mst_cpu_mem_fixed_gnt_r <= slv_mem_fixed_cpu_gnt_s;
+            mst_cpu_mem_rr_gnt_r <= slv_mem_rr_cpu_gnt_s;
+            mst_cpu_mem_wrr_gnt_r <= slv_mem_wrr_cpu_gnt_s;
+            mst_cpu_mem_lrg_gnt_r <= slv_mem_lrg_cpu_gnt_s;
+            mst_cpu_periph_gnt_r <= slv_periph_cpu_gnt_s;
+          end
+        end
+
+        fsm_error0_st: begin
+          if (mst_cpu_hready_s == 1'b1) begin
+            mst_cpu_mem_fixed_gnt_r <= 1'b0;
+            mst_cpu_mem_rr_gnt_r <= 1'b0;
+            mst_cpu_mem_wrr_gnt_r <= 1'b0;
+            mst_cpu_mem_lrg_gnt_r <= 1'b0;
+            mst_cpu_periph_gnt_r <= 1'b0;
+            fsm_cpu_r <= fsm_error1_st;
+          end
+        end
+
+        fsm_error1_st: begin
+          fsm_cpu_r <= fsm_error2_st;
+        end
+
+        fsm_error2_st: begin
+          if (mst_cpu_new_xfer_s == 1'b1) begin
+            if (mst_cpu_addr_err_s == 1'b1) begin
+              fsm_cpu_r <= fsm_error1_st;
+            end else if (mst_cpu_gnt_s == 1'b1) begin
+              mst_cpu_mem_fixed_req_r <= 1'b0;
+              mst_cpu_mem_rr_req_r <= 1'b0;
+              mst_cpu_mem_wrr_req_r <= 1'b0;
+              mst_cpu_mem_lrg_req_r <= 1'b0;
+              mst_cpu_periph_req_r <= 1'b0;
+              fsm_cpu_r <= fsm_transfer_st;
+            end else begin
+              mst_cpu_mem_fixed_req_r <= mst_cpu_mem_fixed_sel_s;
+              mst_cpu_mem_rr_req_r <= mst_cpu_mem_rr_sel_s;
+              mst_cpu_mem_wrr_req_r <= mst_cpu_mem_wrr_sel_s;
+              mst_cpu_mem_lrg_req_r <= mst_cpu_mem_lrg_sel_s;
+              mst_cpu_periph_req_r <= mst_cpu_periph_sel_s;
+              fsm_cpu_r <= fsm_transfer_wait_st;
+            end
+            mst_cpu_mem_fixed_gnt_r <= slv_mem_fixed_cpu_gnt_s;
+            mst_cpu_mem_rr_gnt_r <= slv_mem_rr_cpu_gnt_s;
+            mst_cpu_mem_wrr_gnt_r <= slv_mem_wrr_cpu_gnt_s;
+            mst_cpu_mem_lrg_gnt_r <= slv_mem_lrg_cpu_gnt_s;
+            mst_cpu_periph_gnt_r <= slv_periph_cpu_gnt_s;
+          end else begin
+            fsm_cpu_r <= fsm_idle_st;
+          end
+        end
+
+        fsm_transfer_st: begin
+          if ((ahb_mst_cpu_htrans_i == ahb_trans_seq_e) ||
+              (ahb_mst_cpu_htrans_i == ahb_trans_busy_e)) begin
+            fsm_cpu_r <= fsm_transfer_st;
+          end else begin
+            if (ahb_mst_cpu_htrans_i == ahb_trans_idle_e) begin
+              if (mst_cpu_hready_s == 1'b0) begin
+                fsm_cpu_r <= fsm_transfer_finish_st;
+              end else begin
+                mst_cpu_mem_fixed_gnt_r <= 1'b0;
+                mst_cpu_mem_rr_gnt_r <= 1'b0;
+                mst_cpu_mem_wrr_gnt_r <= 1'b0;
+                mst_cpu_mem_lrg_gnt_r <= 1'b0;
+                mst_cpu_periph_gnt_r <= 1'b0;
+                fsm_cpu_r <= fsm_idle_st;
+              end
+            end else begin // ((ahb_mst_cpu_htrans_i == ahb_trans_nonseq_e)
+              if (mst_cpu_hready_s == 1'b1) begin // address phase ends with the current data phase
+                if (mst_cpu_addr_err_s == 1'b1) begin
+                  fsm_cpu_r <= fsm_error1_st;
+                end else if (mst_cpu_gnt_s == 1'b1) begin
+                  mst_cpu_mem_fixed_req_r <= 1'b0;
+                  mst_cpu_mem_rr_req_r <= 1'b0;
+                  mst_cpu_mem_wrr_req_r <= 1'b0;
+                  mst_cpu_mem_lrg_req_r <= 1'b0;
+                  mst_cpu_periph_req_r <= 1'b0;
+                  fsm_cpu_r <= fsm_transfer_st;
+                end else begin
+                  mst_cpu_mem_fixed_req_r <= mst_cpu_mem_fixed_sel_s;
+                  mst_cpu_mem_rr_req_r <= mst_cpu_mem_rr_sel_s;
+                  mst_cpu_mem_wrr_req_r <= mst_cpu_mem_wrr_sel_s;
+                  mst_cpu_mem_lrg_req_r <= mst_cpu_mem_lrg_sel_s;
+                  mst_cpu_periph_req_r <= mst_cpu_periph_sel_s;
+                  fsm_cpu_r <= fsm_transfer_wait_st;
+                end
+                mst_cpu_mem_fixed_gnt_r <= slv_mem_fixed_cpu_gnt_s;
+                mst_cpu_mem_rr_gnt_r <= slv_mem_rr_cpu_gnt_s;
+                mst_cpu_mem_wrr_gnt_r <= slv_mem_wrr_cpu_gnt_s;
+                mst_cpu_mem_lrg_gnt_r <= slv_mem_lrg_cpu_gnt_s;
+                mst_cpu_periph_gnt_r <= slv_periph_cpu_gnt_s;
+              end else if (mst_cpu_addr_err_s == 1'b1) begin // the data phase continues
+                fsm_cpu_r <= fsm_error0_st;
+              end
+            end
+          end
+        end
+
+        fsm_transfer_wait_st: begin
+          if (mst_cpu_gnt_s == 1'b1) begin
+            mst_cpu_mem_fixed_req_r <= 1'b0;
+            mst_cpu_mem_rr_req_r <= 1'b0;
+            mst_cpu_mem_wrr_req_r <= 1'b0;
+            mst_cpu_mem_lrg_req_r <= 1'b0;
+            mst_cpu_periph_req_r <= 1'b0;
+            mst_cpu_mem_fixed_gnt_r <= slv_mem_fixed_cpu_gnt_s;
+            mst_cpu_mem_rr_gnt_r <= slv_mem_rr_cpu_gnt_s;
+            mst_cpu_mem_wrr_gnt_r <= slv_mem_wrr_cpu_gnt_s;
+            mst_cpu_mem_lrg_gnt_r <= slv_mem_lrg_cpu_gnt_s;
+            mst_cpu_periph_gnt_r <= slv_periph_cpu_gnt_s;
+            fsm_cpu_r <= fsm_transfer_st;
+          end
+        end
+
+        fsm_transfer_finish_st: begin
+          if (mst_cpu_hready_s == 1'b1) begin
+            if (mst_cpu_new_xfer_s == 1'b1) begin
+              if (mst_cpu_addr_err_s == 1'b1) begin
+                fsm_cpu_r <= fsm_error1_st;
+              end else if (mst_cpu_gnt_s == 1'b1) begin
+                mst_cpu_mem_fixed_req_r <= 1'b0;
+                mst_cpu_mem_rr_req_r <= 1'b0;
+                mst_cpu_mem_wrr_req_r <= 1'b0;
+                mst_cpu_mem_lrg_req_r <= 1'b0;
+                mst_cpu_periph_req_r <= 1'b0;
+                fsm_cpu_r <= fsm_transfer_st;
+              end else begin
+                mst_cpu_mem_fixed_req_r <= mst_cpu_mem_fixed_sel_s;
+                mst_cpu_mem_rr_req_r <= mst_cpu_mem_rr_sel_s;
+                mst_cpu_mem_wrr_req_r <= mst_cpu_mem_wrr_sel_s;
+                mst_cpu_mem_lrg_req_r <= mst_cpu_mem_lrg_sel_s;
+                mst_cpu_periph_req_r <= mst_cpu_periph_sel_s;
+                fsm_cpu_r <= fsm_transfer_wait_st;
+              end
+              mst_cpu_mem_fixed_gnt_r <= slv_mem_fixed_cpu_gnt_s;
+              mst_cpu_mem_rr_gnt_r <= slv_mem_rr_cpu_gnt_s;
+              mst_cpu_mem_wrr_gnt_r <= slv_mem_wrr_cpu_gnt_s;
+              mst_cpu_mem_lrg_gnt_r <= slv_mem_lrg_cpu_gnt_s;
+              mst_cpu_periph_gnt_r <= slv_periph_cpu_gnt_s;
+            end else begin
+              mst_cpu_mem_fixed_gnt_r <= 1'b0;
+              mst_cpu_mem_rr_gnt_r <= 1'b0;
+              mst_cpu_mem_wrr_gnt_r <= 1'b0;
+              mst_cpu_mem_lrg_gnt_r <= 1'b0;
+              mst_cpu_periph_gnt_r <= 1'b0;
+              fsm_cpu_r <= fsm_idle_st;
+            end
+          end
+        end
+
+        default: begin
+          mst_cpu_mem_fixed_gnt_r <= 1'b0;
+          mst_cpu_mem_fixed_req_r <= 1'b0;
+          mst_cpu_mem_rr_gnt_r <= 1'b0;
+          mst_cpu_mem_rr_req_r <= 1'b0;
+          mst_cpu_mem_wrr_gnt_r <= 1'b0;
+          mst_cpu_mem_wrr_req_r <= 1'b0;
+          mst_cpu_mem_lrg_gnt_r <= 1'b0;
+          mst_cpu_mem_lrg_req_r <= 1'b0;
+          mst_cpu_periph_gnt_r <= 1'b0;
+          mst_cpu_periph_req_r <= 1'b0;
+          fsm_cpu_r <= fsm_idle_st;
+        end
+      endcase
+    end
+
+    if ((mst_cpu_new_xfer_s == 1'b1) && (mst_cpu_gnt_s == 1'b0) && (mst_cpu_rqstate_s == 1'b1)) begin
+      mst_cpu_haddr_r  <= ahb_mst_cpu_haddr_i;
+      mst_cpu_htrans_r <= ahb_mst_cpu_htrans_i;
+      mst_cpu_hburst_r <= ahb_mst_cpu_hburst_i;
+      mst_cpu_hsize_r  <= ahb_mst_cpu_hsize_i;
+      mst_cpu_hwrite_r <= ahb_mst_cpu_hwrite_i;
+      mst_cpu_hprot_r  <= ahb_mst_cpu_hprot_i;
+    end
+
+    if (mst_cpu_hready_s == 1'b1) begin  // the address phase ends with the current data phase
+      mst_cpu_hwrite_dph_r <= mst_cpu_hwrite_s;
+    end
+  end
+
+  // Master 'cpu' Mux
+  always_comb begin: proc_cpu_mux
+    if (fsm_cpu_r == fsm_transfer_wait_st) begin
+      mst_cpu_haddr_s  = mst_cpu_haddr_r;
+      mst_cpu_hwrite_s = mst_cpu_hwrite_r;
+      mst_cpu_hburst_s = mst_cpu_hburst_r;
+      mst_cpu_hsize_s  = mst_cpu_hsize_r;
+      mst_cpu_htrans_s = mst_cpu_htrans_r;
+      mst_cpu_hprot_s  = mst_cpu_hprot_r;
+    end else begin
+      mst_cpu_haddr_s  = ahb_mst_cpu_haddr_i;
+      mst_cpu_hwrite_s = ahb_mst_cpu_hwrite_i;
+      mst_cpu_hburst_s = ahb_mst_cpu_hburst_i;
+      mst_cpu_hsize_s  = ahb_mst_cpu_hsize_i;
+      mst_cpu_htrans_s = ahb_mst_cpu_htrans_i;
+      mst_cpu_hprot_s  = ahb_mst_cpu_hprot_i;
+    end
+
+    mst_cpu_hready_s = (ahb_slv_mem_fixed_hreadyout_i & mst_cpu_mem_fixed_gnt_r) |
+                       (ahb_slv_mem_rr_hreadyout_i & mst_cpu_mem_rr_gnt_r) |
+                       (ahb_slv_mem_wrr_hreadyout_i & mst_cpu_mem_wrr_gnt_r) |
+                       (ahb_slv_mem_lrg_hreadyout_i & mst_cpu_mem_lrg_gnt_r) |
+                       (ahb_slv_periph_hreadyout_i & mst_cpu_periph_gnt_r) |
+                       ~(|{mst_cpu_mem_fixed_gnt_r, mst_cpu_mem_rr_gnt_r, mst_cpu_mem_wrr_gnt_r, mst_cpu_mem_lrg_gnt_r, mst_cpu_periph_gnt_r});
+
+    case (fsm_cpu_r)
+      fsm_transfer_wait_st: begin
+        ahb_mst_cpu_hrdata_o = 32'h00000000;
+        ahb_mst_cpu_hready_o = 1'b0;
+        ahb_mst_cpu_hresp_o  = ahb_resp_okay_e;
+      end
+
+      fsm_error1_st: begin
+        ahb_mst_cpu_hrdata_o = 32'h00000000;
+        ahb_mst_cpu_hready_o = 1'b0;
+        ahb_mst_cpu_hresp_o  = ahb_resp_error_e;
+      end
+
+      fsm_error2_st: begin
+        ahb_mst_cpu_hrdata_o = 32'h00000000;
+        ahb_mst_cpu_hready_o = 1'b1;
+        ahb_mst_cpu_hresp_o  = ahb_resp_error_e;
+      end
+
+      fsm_error0_st, fsm_transfer_st: begin
+        case ({mst_cpu_mem_fixed_gnt_r, mst_cpu_mem_rr_gnt_r, mst_cpu_mem_wrr_gnt_r, mst_cpu_mem_lrg_gnt_r, mst_cpu_periph_gnt_r})
+          5'b00001: begin
+            ahb_mst_cpu_hrdata_o = (mst_cpu_hwrite_dph_r == 1'b0) ? ahb_slv_periph_hrdata_i : 32'h00000000;
+            ahb_mst_cpu_hready_o = ahb_slv_periph_hreadyout_i;
+            ahb_mst_cpu_hresp_o = ahb_slv_periph_hresp_i;
+          end
+
+          5'b00010: begin
+            ahb_mst_cpu_hrdata_o = (mst_cpu_hwrite_dph_r == 1'b0) ? ahb_slv_mem_lrg_hrdata_i : 32'h00000000;
+            ahb_mst_cpu_hready_o = ahb_slv_mem_lrg_hreadyout_i;
+            ahb_mst_cpu_hresp_o = ahb_slv_mem_lrg_hresp_i;
+          end
+
+          5'b00100: begin
+            ahb_mst_cpu_hrdata_o = (mst_cpu_hwrite_dph_r == 1'b0) ? ahb_slv_mem_wrr_hrdata_i : 32'h00000000;
+            ahb_mst_cpu_hready_o = ahb_slv_mem_wrr_hreadyout_i;
+            ahb_mst_cpu_hresp_o = ahb_slv_mem_wrr_hresp_i;
+          end
+
+          5'b01000: begin
+            ahb_mst_cpu_hrdata_o = (mst_cpu_hwrite_dph_r == 1'b0) ? ahb_slv_mem_rr_hrdata_i : 32'h00000000;
+            ahb_mst_cpu_hready_o = ahb_slv_mem_rr_hreadyout_i;
+            ahb_mst_cpu_hresp_o = ahb_slv_mem_rr_hresp_i;
+          end
+
+          5'b10000: begin
+            ahb_mst_cpu_hrdata_o = (mst_cpu_hwrite_dph_r == 1'b0) ? ahb_slv_mem_fixed_hrdata_i : 32'h00000000;
+            ahb_mst_cpu_hready_o = ahb_slv_mem_fixed_hreadyout_i;
+            ahb_mst_cpu_hresp_o = ahb_slv_mem_fixed_hresp_i;
+          end
+
+          default: begin
+            ahb_mst_cpu_hrdata_o = 32'h00000000;
+            ahb_mst_cpu_hready_o = 1'b1;
+            ahb_mst_cpu_hresp_o  = ahb_resp_okay_e;
+          end
+        endcase
+      end
+
+      fsm_transfer_finish_st: begin
+        case ({mst_cpu_mem_fixed_gnt_r, mst_cpu_mem_rr_gnt_r, mst_cpu_mem_wrr_gnt_r, mst_cpu_mem_lrg_gnt_r, mst_cpu_periph_gnt_r})
+          5'b00001: begin
+            ahb_mst_cpu_hrdata_o = ahb_slv_periph_hrdata_i;
+            ahb_mst_cpu_hready_o = ahb_slv_periph_hreadyout_i;
+            ahb_mst_cpu_hresp_o = ahb_slv_periph_hresp_i;
+          end
+
+          5'b00010: begin
+            ahb_mst_cpu_hrdata_o = ahb_slv_mem_lrg_hrdata_i;
+            ahb_mst_cpu_hready_o = ahb_slv_mem_lrg_hreadyout_i;
+            ahb_mst_cpu_hresp_o = ahb_slv_mem_lrg_hresp_i;
+          end
+
+          5'b00100: begin
+            ahb_mst_cpu_hrdata_o = ahb_slv_mem_wrr_hrdata_i;
+            ahb_mst_cpu_hready_o = ahb_slv_mem_wrr_hreadyout_i;
+            ahb_mst_cpu_hresp_o = ahb_slv_mem_wrr_hresp_i;
+          end
+
+          5'b01000: begin
+            ahb_mst_cpu_hrdata_o = ahb_slv_mem_rr_hrdata_i;
+            ahb_mst_cpu_hready_o = ahb_slv_mem_rr_hreadyout_i;
+            ahb_mst_cpu_hresp_o = ahb_slv_mem_rr_hresp_i;
+          end
+
+          5'b10000: begin
+            ahb_mst_cpu_hrdata_o = ahb_slv_mem_fixed_hrdata_i;
+            ahb_mst_cpu_hready_o = ahb_slv_mem_fixed_hreadyout_i;
+            ahb_mst_cpu_hresp_o = ahb_slv_mem_fixed_hresp_i;
+          end
+
+          default: begin
+            ahb_mst_cpu_hrdata_o = 32'h00000000;
+            ahb_mst_cpu_hready_o = 1'b1;
+            ahb_mst_cpu_hresp_o  = ahb_resp_okay_e;
+          end
+        endcase
+      end
+
+      default: begin
+        ahb_mst_cpu_hrdata_o = 32'h00000000;
+        ahb_mst_cpu_hready_o = 1'b1;
+        ahb_mst_cpu_hresp_o  = ahb_resp_okay_e;
+      end
+    endcase
+  end
+
+  // Master 'dsp' Logic
+  always_comb begin: proc_dsp_logic
+    mst_dsp_new_xfer_s  = (ahb_mst_dsp_htrans_i == ahb_trans_nonseq_e) ? 1'b1 : 1'b0;
+    mst_dsp_cont_xfer_s = ((ahb_mst_dsp_htrans_i == ahb_trans_busy_e) ||
+                           (ahb_mst_dsp_htrans_i == ahb_trans_seq_e)) ? 1'b1 : 1'b0;
+    mst_dsp_rqstate_s   = ((fsm_dsp_r == fsm_idle_st) ||
+                           (fsm_dsp_r == fsm_transfer_st) ||
+                           (fsm_dsp_r == fsm_transfer_finish_st) ||
+                           (fsm_dsp_r == fsm_error2_st)) ? 1'b1 : 1'b0;
+
+    // Address Decoding
+    mst_dsp_addr_err_s = 1'b0;
+    mst_dsp_mem_fixed_sel_s = 1'b0;
+    mst_dsp_mem_rr_sel_s = 1'b0;
+    mst_dsp_mem_wrr_sel_s = 1'b0;
+    mst_dsp_mem_lrg_sel_s = 1'b0;
+
+    casez (ahb_mst_dsp_haddr_i[31:12])
+      20'b00000000000000000000: begin // mem_fixed
+        mst_dsp_mem_fixed_sel_s = 1'b1;
+      end
+
+      20'b00000000000000000001: begin // mem_rr
+        mst_dsp_mem_rr_sel_s = 1'b1;
+      end
+
+      20'b00000000000000000010: begin // mem_wrr
+        mst_dsp_mem_wrr_sel_s = 1'b1;
+      end
+
+      20'b00000000000000000011: begin // mem_lrg
+        mst_dsp_mem_lrg_sel_s = 1'b1;
+      end
+
+      default: begin
+        mst_dsp_addr_err_s = mst_dsp_new_xfer_s;
+      end
+    endcase
+
+    mst_dsp_mem_fixed_req_s  = (mst_dsp_mem_fixed_sel_s & mst_dsp_new_xfer_s & mst_dsp_rqstate_s &
+                                (mst_dsp_hready_s | mst_dsp_mem_fixed_gnt_r)) | mst_dsp_mem_fixed_req_r;
+    mst_dsp_mem_fixed_keep_s = mst_dsp_mem_fixed_gnt_r & mst_dsp_cont_xfer_s;
+    mst_dsp_mem_rr_req_s     = (mst_dsp_mem_rr_sel_s & mst_dsp_new_xfer_s & mst_dsp_rqstate_s &
+                                (mst_dsp_hready_s | mst_dsp_mem_rr_gnt_r)) | mst_dsp_mem_rr_req_r;
+    mst_dsp_mem_rr_keep_s    = mst_dsp_mem_rr_gnt_r & mst_dsp_cont_xfer_s;
+    mst_dsp_mem_wrr_req_s    = (mst_dsp_mem_wrr_sel_s & mst_dsp_new_xfer_s & mst_dsp_rqstate_s &
+                                (mst_dsp_hready_s | mst_dsp_mem_wrr_gnt_r)) | mst_dsp_mem_wrr_req_r;
+    mst_dsp_mem_wrr_keep_s   = mst_dsp_mem_wrr_gnt_r & mst_dsp_cont_xfer_s;
+    mst_dsp_mem_lrg_req_s    = (mst_dsp_mem_lrg_sel_s & mst_dsp_new_xfer_s & mst_dsp_rqstate_s &
+                                (mst_dsp_hready_s | mst_dsp_mem_lrg_gnt_r)) | mst_dsp_mem_lrg_req_r;
+    mst_dsp_mem_lrg_keep_s   = mst_dsp_mem_lrg_gnt_r & mst_dsp_cont_xfer_s;
+
+    // Grant Combination
+    mst_dsp_gnt_s = slv_mem_fixed_dsp_gnt_s |
+                    slv_mem_rr_dsp_gnt_s |
+                    slv_mem_wrr_dsp_gnt_s |
+                    slv_mem_lrg_dsp_gnt_s;
+  end
+
+  // FSM for Master 'dsp'
+  always_ff @(posedge main_clk_i or negedge main_rst_an_i) begin: proc_dsp_fsm
+    if (main_rst_an_i == 1'b0) begin
+      fsm_dsp_r <= fsm_idle_st;
+      mst_dsp_mem_fixed_gnt_r <= 1'b0;
+      mst_dsp_mem_rr_gnt_r <= 1'b0;
+      mst_dsp_mem_wrr_gnt_r <= 1'b0;
+      mst_dsp_mem_lrg_gnt_r <= 1'b0;
+    end else begin
+      case (fsm_dsp_r)
+        fsm_idle_st: begin
+          if (mst_dsp_new_xfer_s == 1'b1) begin
+            if (mst_dsp_addr_err_s == 1'b1) begin
+              fsm_dsp_r <= fsm_error1_st;
+            end else if (mst_dsp_gnt_s == 1'b1) begin
+              mst_dsp_mem_fixed_req_r <= 1'b0;
+              mst_dsp_mem_rr_req_r <= 1'b0;
+              mst_dsp_mem_wrr_req_r <= 1'b0;
+              mst_dsp_mem_lrg_req_r <= 1'b0;
+              fsm_dsp_r <= fsm_transfer_st;
+            end else begin
+              mst_dsp_mem_fixed_req_r <= mst_dsp_mem_fixed_sel_s;
+              mst_dsp_mem_rr_req_r <= mst_dsp_mem_rr_sel_s;
+              mst_dsp_mem_wrr_req_r <= mst_dsp_mem_wrr_sel_s;
+              mst_dsp_mem_lrg_req_r <= mst_dsp_mem_lrg_sel_s;
+              fsm_dsp_r <= fsm_transfer_wait_st;
+            end
+            mst_dsp_mem_fixed_gnt_r <= slv_mem_fixed_dsp_gnt_s;
+            mst_dsp_mem_rr_gnt_r <= slv_mem_rr_dsp_gnt_s;
+            mst_dsp_mem_wrr_gnt_r <= slv_mem_wrr_dsp_gnt_s;
+            mst_dsp_mem_lrg_gnt_r <= slv_mem_lrg_dsp_gnt_s;
+          end
+        end
+
+        fsm_error0_st: begin
+          if (mst_dsp_hready_s == 1'b1) begin
+            mst_dsp_mem_fixed_gnt_r <= 1'b0;
+            mst_dsp_mem_rr_gnt_r <= 1'b0;
+            mst_dsp_mem_wrr_gnt_r <= 1'b0;
+            mst_dsp_mem_lrg_gnt_r <= 1'b0;
+            fsm_dsp_r <= fsm_error1_st;
+          end
+        end
+
+        fsm_error1_st: begin
+          fsm_dsp_r <= fsm_error2_st;
+        end
+
+        fsm_error2_st: begin
+          if (mst_dsp_new_xfer_s == 1'b1) begin
+            if (mst_dsp_addr_err_s == 1'b1) begin
+              fsm_dsp_r <= fsm_error1_st;
+            end else if (mst_dsp_gnt_s == 1'b1) begin
+              mst_dsp_mem_fixed_req_r <= 1'b0;
+              mst_dsp_mem_rr_req_r <= 1'b0;
+              mst_dsp_mem_wrr_req_r <= 1'b0;
+              mst_dsp_mem_lrg_req_r <= 1'b0;
+              fsm_dsp_r <= fsm_transfer_st;
+            end else begin
+              mst_dsp_mem_fixed_req_r <= mst_dsp_mem_fixed_sel_s;
+              mst_dsp_mem_rr_req_r <= mst_dsp_mem_rr_sel_s;
+              mst_dsp_mem_wrr_req_r <= mst_dsp_mem_wrr_sel_s;
+              mst_dsp_mem_lrg_req_r <= mst_dsp_mem_lrg_sel_s;
+              fsm_dsp_r <= fsm_transfer_wait_st;
+            end
+            mst_dsp_mem_fixed_gnt_r <= slv_mem_fixed_dsp_gnt_s;
+            mst_dsp_mem_rr_gnt_r <= slv_mem_rr_dsp_gnt_s;
+            mst_dsp_mem_wrr_gnt_r <= slv_mem_wrr_dsp_gnt_s;
+            mst_dsp_mem_lrg_gnt_r <= slv_mem_lrg_dsp_gnt_s;
+          end else begin
+            fsm_dsp_r <= fsm_idle_st;
+          end
+        end
+
+        fsm_transfer_st: begin
+          if ((ahb_mst_dsp_htrans_i == ahb_trans_seq_e) ||
+              (ahb_mst_dsp_htrans_i == ahb_trans_busy_e)) begin
+            fsm_dsp_r <= fsm_transfer_st;
+          end else begin
+            if (ahb_mst_dsp_htrans_i == ahb_trans_idle_e) begin
+              if (mst_dsp_hready_s == 1'b0) begin
+                fsm_dsp_r <= fsm_transfer_finish_st;
+              end else begin
+                mst_dsp_mem_fixed_gnt_r <= 1'b0;
+                mst_dsp_mem_rr_gnt_r <= 1'b0;
+                mst_dsp_mem_wrr_gnt_r <= 1'b0;
+                mst_dsp_mem_lrg_gnt_r <= 1'b0;
+                fsm_dsp_r <= fsm_idle_st;
+              end
+            end else begin // ((ahb_mst_dsp_htrans_i == ahb_trans_nonseq_e)
+              if (mst_dsp_hready_s == 1'b1) begin // address phase ends with the current data phase
+                if (mst_dsp_addr_err_s == 1'b1) begin
+                  fsm_dsp_r <= fsm_error1_st;
+                end else if (mst_dsp_gnt_s == 1'b1) begin
+                  mst_dsp_mem_fixed_req_r <= 1'b0;
+                  mst_dsp_mem_rr_req_r <= 1'b0;
+                  mst_dsp_mem_wrr_req_r <= 1'b0;
+                  mst_dsp_mem_lrg_req_r <= 1'b0;
+                  fsm_dsp_r <= fsm_transfer_st;
+                end else begin
+                  mst_dsp_mem_fixed_req_r <= mst_dsp_mem_fixed_sel_s;
+                  mst_dsp_mem_rr_req_r <= mst_dsp_mem_rr_sel_s;
+                  mst_dsp_mem_wrr_req_r <= mst_dsp_mem_wrr_sel_s;
+                  mst_dsp_mem_lrg_req_r <= mst_dsp_mem_lrg_sel_s;
+                  fsm_dsp_r <= fsm_transfer_wait_st;
+                end
+                mst_dsp_mem_fixed_gnt_r <= slv_mem_fixed_dsp_gnt_s;
+                mst_dsp_mem_rr_gnt_r <= slv_mem_rr_dsp_gnt_s;
+                mst_dsp_mem_wrr_gnt_r <= slv_mem_wrr_dsp_gnt_s;
+                mst_dsp_mem_lrg_gnt_r <= slv_mem_lrg_dsp_gnt_s;
+              end else if (mst_dsp_addr_err_s == 1'b1) begin // the data phase continues
+                fsm_dsp_r <= fsm_error0_st;
+              end
+            end
+          end
+        end
+
+        fsm_transfer_wait_st: begin
+          if (mst_dsp_gnt_s == 1'b1) begin
+            mst_dsp_mem_fixed_req_r <= 1'b0;
+            mst_dsp_mem_rr_req_r <= 1'b0;
+            mst_dsp_mem_wrr_req_r <= 1'b0;
+            mst_dsp_mem_lrg_req_r <= 1'b0;
+            mst_dsp_mem_fixed_gnt_r <= slv_mem_fixed_dsp_gnt_s;
+            mst_dsp_mem_rr_gnt_r <= slv_mem_rr_dsp_gnt_s;
+            mst_dsp_mem_wrr_gnt_r <= slv_mem_wrr_dsp_gnt_s;
+            mst_dsp_mem_lrg_gnt_r <= slv_mem_lrg_dsp_gnt_s;
+            fsm_dsp_r <= fsm_transfer_st;
+          end
+        end
+
+        fsm_transfer_finish_st: begin
+          if (mst_dsp_hready_s == 1'b1) begin
+            if (mst_dsp_new_xfer_s == 1'b1) begin
+              if (mst_dsp_addr_err_s == 1'b1) begin
+                fsm_dsp_r <= fsm_error1_st;
+              end else if (mst_dsp_gnt_s == 1'b1) begin
+                mst_dsp_mem_fixed_req_r <= 1'b0;
+                mst_dsp_mem_rr_req_r <= 1'b0;
+                mst_dsp_mem_wrr_req_r <= 1'b0;
+                mst_dsp_mem_lrg_req_r <= 1'b0;
+                fsm_dsp_r <= fsm_transfer_st;
+              end else begin
+                mst_dsp_mem_fixed_req_r <= mst_dsp_mem_fixed_sel_s;
+                mst_dsp_mem_rr_req_r <= mst_dsp_mem_rr_sel_s;
+                mst_dsp_mem_wrr_req_r <= mst_dsp_mem_wrr_sel_s;
+                mst_dsp_mem_lrg_req_r <= mst_dsp_mem_lrg_sel_s;
+                fsm_dsp_r <= fsm_transfer_wait_st;
+              end
+              mst_dsp_mem_fixed_gnt_r <= slv_mem_fixed_dsp_gnt_s;
+              mst_dsp_mem_rr_gnt_r <= slv_mem_rr_dsp_gnt_s;
+              mst_dsp_mem_wrr_gnt_r <= slv_mem_wrr_dsp_gnt_s;
+              mst_dsp_mem_lrg_gnt_r <= slv_mem_lrg_dsp_gnt_s;
+            end else begin
+              mst_dsp_mem_fixed_gnt_r <= 1'b0;
+              mst_dsp_mem_rr_gnt_r <= 1'b0;
+              mst_dsp_mem_wrr_gnt_r <= 1'b0;
+              mst_dsp_mem_lrg_gnt_r <= 1'b0;
+              fsm_dsp_r <= fsm_idle_st;
+            end
+          end
+        end
+
+        default: begin
+          mst_dsp_mem_fixed_gnt_r <= 1'b0;
+          mst_dsp_mem_fixed_req_r <= 1'b0;
+          mst_dsp_mem_rr_gnt_r <= 1'b0;
+          mst_dsp_mem_rr_req_r <= 1'b0;
+          mst_dsp_mem_wrr_gnt_r <= 1'b0;
+          mst_dsp_mem_wrr_req_r <= 1'b0;
+          mst_dsp_mem_lrg_gnt_r <= 1'b0;
+          mst_dsp_mem_lrg_req_r <= 1'b0;
+          fsm_dsp_r <= fsm_idle_st;
+        end
+      endcase
+    end
+
+    if ((mst_dsp_new_xfer_s == 1'b1) && (mst_dsp_gnt_s == 1'b0) && (mst_dsp_rqstate_s == 1'b1)) begin
+      mst_dsp_haddr_r  <= ahb_mst_dsp_haddr_i;
+      mst_dsp_htrans_r <= ahb_mst_dsp_htrans_i;
+      mst_dsp_hburst_r <= ahb_mst_dsp_hburst_i;
+      mst_dsp_hsize_r  <= ahb_mst_dsp_hsize_i;
+      mst_dsp_hwrite_r <= ahb_mst_dsp_hwrite_i;
+      mst_dsp_hprot_r  <= ahb_mst_dsp_hprot_i;
+    end
+
+    if (mst_dsp_hready_s == 1'b1) begin  // the address phase ends with the current data phase
+      mst_dsp_hwrite_dph_r <= mst_dsp_hwrite_s;
+    end
+  end
+
+  // Master 'dsp' Mux
+  always_comb begin: proc_dsp_mux
+    if (fsm_dsp_r == fsm_transfer_wait_st) begin
+      mst_dsp_haddr_s  = mst_dsp_haddr_r;
+      mst_dsp_hwrite_s = mst_dsp_hwrite_r;
+      mst_dsp_hburst_s = mst_dsp_hburst_r;
+      mst_dsp_hsize_s  = mst_dsp_hsize_r;
+      mst_dsp_htrans_s = mst_dsp_htrans_r;
+      mst_dsp_hprot_s  = mst_dsp_hprot_r;
+    end else begin
+      mst_dsp_haddr_s  = ahb_mst_dsp_haddr_i;
+      mst_dsp_hwrite_s = ahb_mst_dsp_hwrite_i;
+      mst_dsp_hburst_s = ahb_mst_dsp_hburst_i;
+      mst_dsp_hsize_s  = ahb_mst_dsp_hsize_i;
+      mst_dsp_htrans_s = ahb_mst_dsp_htrans_i;
+      mst_dsp_hprot_s  = ahb_mst_dsp_hprot_i;
+    end
+
+    mst_dsp_hready_s = (ahb_slv_mem_fixed_hreadyout_i & mst_dsp_mem_fixed_gnt_r) |
+                       (ahb_slv_mem_rr_hreadyout_i & mst_dsp_mem_rr_gnt_r) |
+                       (ahb_slv_mem_wrr_hreadyout_i & mst_dsp_mem_wrr_gnt_r) |
+                       (ahb_slv_mem_lrg_hreadyout_i & mst_dsp_mem_lrg_gnt_r) |
+                       ~(|{mst_dsp_mem_fixed_gnt_r, mst_dsp_mem_rr_gnt_r, mst_dsp_mem_wrr_gnt_r, mst_dsp_mem_lrg_gnt_r});
+
+    case (fsm_dsp_r)
+      fsm_transfer_wait_st: begin
+        ahb_mst_dsp_hrdata_o = 32'h00000000;
+        ahb_mst_dsp_hready_o = 1'b0;
+        ahb_mst_dsp_hresp_o  = ahb_resp_okay_e;
+      end
+
+      fsm_error1_st: begin
+        ahb_mst_dsp_hrdata_o = 32'h00000000;
+        ahb_mst_dsp_hready_o = 1'b0;
+        ahb_mst_dsp_hresp_o  = ahb_resp_error_e;
+      end
+
+      fsm_error2_st: begin
+        ahb_mst_dsp_hrdata_o = 32'h00000000;
+        ahb_mst_dsp_hready_o = 1'b1;
+        ahb_mst_dsp_hresp_o  = ahb_resp_error_e;
+      end
+
+      fsm_error0_st, fsm_transfer_st: begin
+        case ({mst_dsp_mem_fixed_gnt_r, mst_dsp_mem_rr_gnt_r, mst_dsp_mem_wrr_gnt_r, mst_dsp_mem_lrg_gnt_r})
+          4'b0001: begin
+            ahb_mst_dsp_hrdata_o = (mst_dsp_hwrite_dph_r == 1'b0) ? ahb_slv_mem_lrg_hrdata_i : 32'h00000000;
+            ahb_mst_dsp_hready_o = ahb_slv_mem_lrg_hreadyout_i;
+            ahb_mst_dsp_hresp_o = ahb_slv_mem_lrg_hresp_i;
+          end
+
+          4'b0010: begin
+            ahb_mst_dsp_hrdata_o = (mst_dsp_hwrite_dph_r == 1'b0) ? ahb_slv_mem_wrr_hrdata_i : 32'h00000000;
+            ahb_mst_dsp_hready_o = ahb_slv_mem_wrr_hreadyout_i;
+            ahb_mst_dsp_hresp_o = ahb_slv_mem_wrr_hresp_i;
+          end
+
+          4'b0100: begin
+            ahb_mst_dsp_hrdata_o = (mst_dsp_hwrite_dph_r == 1'b0) ? ahb_slv_mem_rr_hrdata_i : 32'h00000000;
+            ahb_mst_dsp_hready_o = ahb_slv_mem_rr_hreadyout_i;
+            ahb_mst_dsp_hresp_o = ahb_slv_mem_rr_hresp_i;
+          end
+
+          4'b1000: begin
+            ahb_mst_dsp_hrdata_o = (mst_dsp_hwrite_dph_r == 1'b0) ? ahb_slv_mem_fixed_hrdata_i : 32'h00000000;
+            ahb_mst_dsp_hready_o = ahb_slv_mem_fixed_hreadyout_i;
+            ahb_mst_dsp_hresp_o = ahb_slv_mem_fixed_hresp_i;
+          end
+
+          default: begin
+            ahb_mst_dsp_hrdata_o = 32'h00000000;
+            ahb_mst_dsp_hready_o = 1'b1;
+            ahb_mst_dsp_hresp_o  = ahb_resp_okay_e;
+          end
+        endcase
+      end
+
+      fsm_transfer_finish_st: begin
+        case ({mst_dsp_mem_fixed_gnt_r, mst_dsp_mem_rr_gnt_r, mst_dsp_mem_wrr_gnt_r, mst_dsp_mem_lrg_gnt_r})
+          4'b0001: begin
+            ahb_mst_dsp_hrdata_o = ahb_slv_mem_lrg_hrdata_i;
+            ahb_mst_dsp_hready_o = ahb_slv_mem_lrg_hreadyout_i;
+            ahb_mst_dsp_hresp_o = ahb_slv_mem_lrg_hresp_i;
+          end
+
+          4'b0010: begin
+            ahb_mst_dsp_hrdata_o = ahb_slv_mem_wrr_hrdata_i;
+            ahb_mst_dsp_hready_o = ahb_slv_mem_wrr_hreadyout_i;
+            ahb_mst_dsp_hresp_o = ahb_slv_mem_wrr_hresp_i;
+          end
+
+          4'b0100: begin
+            ahb_mst_dsp_hrdata_o = ahb_slv_mem_rr_hrdata_i;
+            ahb_mst_dsp_hready_o = ahb_slv_mem_rr_hreadyout_i;
+            ahb_mst_dsp_hresp_o = ahb_slv_mem_rr_hresp_i;
+          end
+
+          4'b1000: begin
+            ahb_mst_dsp_hrdata_o = ahb_slv_mem_fixed_hrdata_i;
+            ahb_mst_dsp_hready_o = ahb_slv_mem_fixed_hreadyout_i;
+            ahb_mst_dsp_hresp_o = ahb_slv_mem_fixed_hresp_i;
+          end
+
+          default: begin
+            ahb_mst_dsp_hrdata_o = 32'h00000000;
+            ahb_mst_dsp_hready_o = 1'b1;
+            ahb_mst_dsp_hresp_o  = ahb_resp_okay_e;
+          end
+        endcase
+      end
+
+      default: begin
+        ahb_mst_dsp_hrdata_o = 32'h00000000;
+        ahb_mst_dsp_hready_o = 1'b1;
+        ahb_mst_dsp_hresp_o  = ahb_resp_okay_e;
+      end
+    endcase
+  end
+
+  // Master 'dma' Logic
+  always_comb begin: proc_dma_logic
+    mst_dma_new_xfer_s  = (ahb_mst_dma_htrans_i == ahb_trans_nonseq_e) ? 1'b1 : 1'b0;
+    mst_dma_cont_xfer_s = ((ahb_mst_dma_htrans_i == ahb_trans_busy_e) ||
+                           (ahb_mst_dma_htrans_i == ahb_trans_seq_e)) ? 1'b1 : 1'b0;
+    mst_dma_rqstate_s   = ((fsm_dma_r == fsm_idle_st) ||
+                           (fsm_dma_r == fsm_transfer_st) ||
+                           (fsm_dma_r == fsm_transfer_finish_st) ||
+                           (fsm_dma_r == fsm_error2_st)) ? 1'b1 : 1'b0;
+
+    // Address Decoding
+    mst_dma_addr_err_s = 1'b0;
+    mst_dma_mem_fixed_sel_s = 1'b0;
+    mst_dma_mem_rr_sel_s = 1'b0;
+    mst_dma_mem_wrr_sel_s = 1'b0;
+    mst_dma_mem_lrg_sel_s = 1'b0;
+
+    casez (ahb_mst_dma_haddr_i[31:12])
+      20'b00000000000000000000: begin // mem_fixed
+        mst_dma_mem_fixed_sel_s = 1'b1;
+      end
+
+      20'b00000000000000000001: begin // mem_rr
+        mst_dma_mem_rr_sel_s = 1'b1;
+      end
+
+      20'b00000000000000000010: begin // mem_wrr
+        mst_dma_mem_wrr_sel_s = 1'b1;
+      end
+
+      20'b00000000000000000011: begin // mem_lrg
+        mst_dma_mem_lrg_sel_s = 1'b1;
+      end
+
+      default: begin
+        mst_dma_addr_err_s = mst_dma_new_xfer_s;
+      end
+    endcase
+
+    mst_dma_mem_fixed_req_s  = (mst_dma_mem_fixed_sel_s & mst_dma_new_xfer_s & mst_dma_rqstate_s &
+                                (mst_dma_hready_s | mst_dma_mem_fixed_gnt_r)) | mst_dma_mem_fixed_req_r;
+    mst_dma_mem_fixed_keep_s = mst_dma_mem_fixed_gnt_r & mst_dma_cont_xfer_s;
+    mst_dma_mem_rr_req_s     = (mst_dma_mem_rr_sel_s & mst_dma_new_xfer_s & mst_dma_rqstate_s &
+                                (mst_dma_hready_s | mst_dma_mem_rr_gnt_r)) | mst_dma_mem_rr_req_r;
+    mst_dma_mem_rr_keep_s    = mst_dma_mem_rr_gnt_r & mst_dma_cont_xfer_s;
+    mst_dma_mem_wrr_req_s    = (mst_dma_mem_wrr_sel_s & mst_dma_new_xfer_s & mst_dma_rqstate_s &
+                                (mst_dma_hready_s | mst_dma_mem_wrr_gnt_r)) | mst_dma_mem_wrr_req_r;
+    mst_dma_mem_wrr_keep_s   = mst_dma_mem_wrr_gnt_r & mst_dma_cont_xfer_s;
+    mst_dma_mem_lrg_req_s    = (mst_dma_mem_lrg_sel_s & mst_dma_new_xfer_s & mst_dma_rqstate_s &
+                                (mst_dma_hready_s | mst_dma_mem_lrg_gnt_r)) | mst_dma_mem_lrg_req_r;
+    mst_dma_mem_lrg_keep_s   = mst_dma_mem_lrg_gnt_r & mst_dma_cont_xfer_s;
+
+    // Grant Combination
+    mst_dma_gnt_s = slv_mem_fixed_dma_gnt_s |
+                    slv_mem_rr_dma_gnt_s |
+                    slv_mem_wrr_dma_gnt_s |
+                    slv_mem_lrg_dma_gnt_s;
+  end
+
+  // FSM for Master 'dma'
+  always_ff @(posedge main_clk_i or negedge main_rst_an_i) begin: proc_dma_fsm
+    if (main_rst_an_i == 1'b0) begin
+      fsm_dma_r <= fsm_idle_st;
+      mst_dma_mem_fixed_gnt_r <= 1'b0;
+      mst_dma_mem_rr_gnt_r <= 1'b0;
+      mst_dma_mem_wrr_gnt_r <= 1'b0;
+      mst_dma_mem_lrg_gnt_r <= 1'b0;
+    end else begin
+      case (fsm_dma_r)
+        fsm_idle_st: begin
+          if (mst_dma_new_xfer_s == 1'b1) begin
+            if (mst_dma_addr_err_s == 1'b1) begin
+              fsm_dma_r <= fsm_error1_st;
+            end else if (mst_dma_gnt_s == 1'b1) begin
+              mst_dma_mem_fixed_req_r <= 1'b0;
+              mst_dma_mem_rr_req_r <= 1'b0;
+              mst_dma_mem_wrr_req_r <= 1'b0;
+              mst_dma_mem_lrg_req_r <= 1'b0;
+              fsm_dma_r <= fsm_transfer_st;
+            end else begin
+              mst_dma_mem_fixed_req_r <= mst_dma_mem_fixed_sel_s;
+              mst_dma_mem_rr_req_r <= mst_dma_mem_rr_sel_s;
+              mst_dma_mem_wrr_req_r <= mst_dma_mem_wrr_sel_s;
+              mst_dma_mem_lrg_req_r <= mst_dma_mem_lrg_sel_s;
+              fsm_dma_r <= fsm_transfer_wait_st;
+            end
+            mst_dma_mem_fixed_gnt_r <= slv_mem_fixed_dma_gnt_s;
+            mst_dma_mem_rr_gnt_r <= slv_mem_rr_dma_gnt_s;
+            mst_dma_mem_wrr_gnt_r <= slv_mem_wrr_dma_gnt_s;
+            mst_dma_mem_lrg_gnt_r <= slv_mem_lrg_dma_gnt_s;
+          end
+        end
+
+        fsm_error0_st: begin
+          if (mst_dma_hready_s == 1'b1) begin
+            mst_dma_mem_fixed_gnt_r <= 1'b0;
+            mst_dma_mem_rr_gnt_r <= 1'b0;
+            mst_dma_mem_wrr_gnt_r <= 1'b0;
+            mst_dma_mem_lrg_gnt_r <= 1'b0;
+            fsm_dma_r <= fsm_error1_st;
+          end
+        end
+
+        fsm_error1_st: begin
+          fsm_dma_r <= fsm_error2_st;
+        end
+
+        fsm_error2_st: begin
+          if (mst_dma_new_xfer_s == 1'b1) begin
+            if (mst_dma_addr_err_s == 1'b1) begin
+              fsm_dma_r <= fsm_error1_st;
+            end else if (mst_dma_gnt_s == 1'b1) begin
+              mst_dma_mem_fixed_req_r <= 1'b0;
+              mst_dma_mem_rr_req_r <= 1'b0;
+              mst_dma_mem_wrr_req_r <= 1'b0;
+              mst_dma_mem_lrg_req_r <= 1'b0;
+              fsm_dma_r <= fsm_transfer_st;
+            end else begin
+              mst_dma_mem_fixed_req_r <= mst_dma_mem_fixed_sel_s;
+              mst_dma_mem_rr_req_r <= mst_dma_mem_rr_sel_s;
+              mst_dma_mem_wrr_req_r <= mst_dma_mem_wrr_sel_s;
+              mst_dma_mem_lrg_req_r <= mst_dma_mem_lrg_sel_s;
+              fsm_dma_r <= fsm_transfer_wait_st;
+            end
+            mst_dma_mem_fixed_gnt_r <= slv_mem_fixed_dma_gnt_s;
+            mst_dma_mem_rr_gnt_r <= slv_mem_rr_dma_gnt_s;
+            mst_dma_mem_wrr_gnt_r <= slv_mem_wrr_dma_gnt_s;
+            mst_dma_mem_lrg_gnt_r <= slv_mem_lrg_dma_gnt_s;
+          end else begin
+            fsm_dma_r <= fsm_idle_st;
+          end
+        end
+
+        fsm_transfer_st: begin
+          if ((ahb_mst_dma_htrans_i == ahb_trans_seq_e) ||
+              (ahb_mst_dma_htrans_i == ahb_trans_busy_e)) begin
+            fsm_dma_r <= fsm_transfer_st;
+          end else begin
+            if (ahb_mst_dma_htrans_i == ahb_trans_idle_e) begin
+              if (mst_dma_hready_s == 1'b0) begin
+                fsm_dma_r <= fsm_transfer_finish_st;
+              end else begin
+                mst_dma_mem_fixed_gnt_r <= 1'b0;
+                mst_dma_mem_rr_gnt_r <= 1'b0;
+                mst_dma_mem_wrr_gnt_r <= 1'b0;
+                mst_dma_mem_lrg_gnt_r <= 1'b0;
+                fsm_dma_r <= fsm_idle_st;
+              end
+            end else begin // ((ahb_mst_dma_htrans_i == ahb_trans_nonseq_e)
+              if (mst_dma_hready_s == 1'b1) begin // address phase ends with the current data phase
+                if (mst_dma_addr_err_s == 1'b1) begin
+                  fsm_dma_r <= fsm_error1_st;
+                end else if (mst_dma_gnt_s == 1'b1) begin
+                  mst_dma_mem_fixed_req_r <= 1'b0;
+                  mst_dma_mem_rr_req_r <= 1'b0;
+                  mst_dma_mem_wrr_req_r <= 1'b0;
+                  mst_dma_mem_lrg_req_r <= 1'b0;
+                  fsm_dma_r <= fsm_transfer_st;
+                end else begin
+                  mst_dma_mem_fixed_req_r <= mst_dma_mem_fixed_sel_s;
+                  mst_dma_mem_rr_req_r <= mst_dma_mem_rr_sel_s;
+                  mst_dma_mem_wrr_req_r <= mst_dma_mem_wrr_sel_s;
+                  mst_dma_mem_lrg_req_r <= mst_dma_mem_lrg_sel_s;
+                  fsm_dma_r <= fsm_transfer_wait_st;
+                end
+                mst_dma_mem_fixed_gnt_r <= slv_mem_fixed_dma_gnt_s;
+                mst_dma_mem_rr_gnt_r <= slv_mem_rr_dma_gnt_s;
+                mst_dma_mem_wrr_gnt_r <= slv_mem_wrr_dma_gnt_s;
+                mst_dma_mem_lrg_gnt_r <= slv_mem_lrg_dma_gnt_s;
+              end else if (mst_dma_addr_err_s == 1'b1) begin // the data phase continues
+                fsm_dma_r <= fsm_error0_st;
+              end
+            end
+          end
+        end
+
+        fsm_transfer_wait_st: begin
+          if (mst_dma_gnt_s == 1'b1) begin
+            mst_dma_mem_fixed_req_r <= 1'b0;
+            mst_dma_mem_rr_req_r <= 1'b0;
+            mst_dma_mem_wrr_req_r <= 1'b0;
+            mst_dma_mem_lrg_req_r <= 1'b0;
+            mst_dma_mem_fixed_gnt_r <= slv_mem_fixed_dma_gnt_s;
+            mst_dma_mem_rr_gnt_r <= slv_mem_rr_dma_gnt_s;
+            mst_dma_mem_wrr_gnt_r <= slv_mem_wrr_dma_gnt_s;
+            mst_dma_mem_lrg_gnt_r <= slv_mem_lrg_dma_gnt_s;
+            fsm_dma_r <= fsm_transfer_st;
+          end
+        end
+
+        fsm_transfer_finish_st: begin
+          if (mst_dma_hready_s == 1'b1) begin
+            if (mst_dma_new_xfer_s == 1'b1) begin
+              if (mst_dma_addr_err_s == 1'b1) begin
+                fsm_dma_r <= fsm_error1_st;
+              end else if (mst_dma_gnt_s == 1'b1) begin
+                mst_dma_mem_fixed_req_r <= 1'b0;
+                mst_dma_mem_rr_req_r <= 1'b0;
+                mst_dma_mem_wrr_req_r <= 1'b0;
+                mst_dma_mem_lrg_req_r <= 1'b0;
+                fsm_dma_r <= fsm_transfer_st;
+              end else begin
+                mst_dma_mem_fixed_req_r <= mst_dma_mem_fixed_sel_s;
+                mst_dma_mem_rr_req_r <= mst_dma_mem_rr_sel_s;
+                mst_dma_mem_wrr_req_r <= mst_dma_mem_wrr_sel_s;
+                mst_dma_mem_lrg_req_r <= mst_dma_mem_lrg_sel_s;
+                fsm_dma_r <= fsm_transfer_wait_st;
+              end
+              mst_dma_mem_fixed_gnt_r <= slv_mem_fixed_dma_gnt_s;
+              mst_dma_mem_rr_gnt_r <= slv_mem_rr_dma_gnt_s;
+              mst_dma_mem_wrr_gnt_r <= slv_mem_wrr_dma_gnt_s;
+              mst_dma_mem_lrg_gnt_r <= slv_mem_lrg_dma_gnt_s;
+            end else begin
+              mst_dma_mem_fixed_gnt_r <= 1'b0;
+              mst_dma_mem_rr_gnt_r <= 1'b0;
+              mst_dma_mem_wrr_gnt_r <= 1'b0;
+              mst_dma_mem_lrg_gnt_r <= 1'b0;
+              fsm_dma_r <= fsm_idle_st;
+            end
+          end
+        end
+
+        default: begin
+          mst_dma_mem_fixed_gnt_r <= 1'b0;
+          mst_dma_mem_fixed_req_r <= 1'b0;
+          mst_dma_mem_rr_gnt_r <= 1'b0;
+          mst_dma_mem_rr_req_r <= 1'b0;
+          mst_dma_mem_wrr_gnt_r <= 1'b0;
+          mst_dma_mem_wrr_req_r <= 1'b0;
+          mst_dma_mem_lrg_gnt_r <= 1'b0;
+          mst_dma_mem_lrg_req_r <= 1'b0;
+          fsm_dma_r <= fsm_idle_st;
+        end
+      endcase
+    end
+
+    if ((mst_dma_new_xfer_s == 1'b1) && (mst_dma_gnt_s == 1'b0) && (mst_dma_rqstate_s == 1'b1)) begin
+      mst_dma_haddr_r  <= ahb_mst_dma_haddr_i;
+      mst_dma_htrans_r <= ahb_mst_dma_htrans_i;
+      mst_dma_hburst_r <= ahb_mst_dma_hburst_i;
+      mst_dma_hsize_r  <= ahb_mst_dma_hsize_i;
+      mst_dma_hwrite_r <= ahb_mst_dma_hwrite_i;
+      mst_dma_hprot_r  <= ahb_mst_dma_hprot_i;
+    end
+
+    if (mst_dma_hready_s == 1'b1) begin  // the address phase ends with the current data phase
+      mst_dma_hwrite_dph_r <= mst_dma_hwrite_s;
+    end
+  end
+
+  // Master 'dma' Mux
+  always_comb begin: proc_dma_mux
+    if (fsm_dma_r == fsm_transfer_wait_st) begin
+      mst_dma_haddr_s  = mst_dma_haddr_r;
+      mst_dma_hwrite_s = mst_dma_hwrite_r;
+      mst_dma_hburst_s = mst_dma_hburst_r;
+      mst_dma_hsize_s  = mst_dma_hsize_r;
+      mst_dma_htrans_s = mst_dma_htrans_r;
+      mst_dma_hprot_s  = mst_dma_hprot_r;
+    end else begin
+      mst_dma_haddr_s  = ahb_mst_dma_haddr_i;
+      mst_dma_hwrite_s = ahb_mst_dma_hwrite_i;
+      mst_dma_hburst_s = ahb_mst_dma_hburst_i;
+      mst_dma_hsize_s  = ahb_mst_dma_hsize_i;
+      mst_dma_htrans_s = ahb_mst_dma_htrans_i;
+      mst_dma_hprot_s  = ahb_mst_dma_hprot_i;
+    end
+
+    mst_dma_hready_s = (ahb_slv_mem_fixed_hreadyout_i & mst_dma_mem_fixed_gnt_r) |
+                       (ahb_slv_mem_rr_hreadyout_i & mst_dma_mem_rr_gnt_r) |
+                       (ahb_slv_mem_wrr_hreadyout_i & mst_dma_mem_wrr_gnt_r) |
+                       (ahb_slv_mem_lrg_hreadyout_i & mst_dma_mem_lrg_gnt_r) |
+                       ~(|{mst_dma_mem_fixed_gnt_r, mst_dma_mem_rr_gnt_r, mst_dma_mem_wrr_gnt_r, mst_dma_mem_lrg_gnt_r});
+
+    case (fsm_dma_r)
+      fsm_transfer_wait_st: begin
+        ahb_mst_dma_hrdata_o = 32'h00000000;
+        ahb_mst_dma_hready_o = 1'b0;
+        ahb_mst_dma_hresp_o  = ahb_resp_okay_e;
+      end
+
+      fsm_error1_st: begin
+        ahb_mst_dma_hrdata_o = 32'h00000000;
+        ahb_mst_dma_hready_o = 1'b0;
+        ahb_mst_dma_hresp_o  = ahb_resp_error_e;
+      end
+
+      fsm_error2_st: begin
+        ahb_mst_dma_hrdata_o = 32'h00000000;
+        ahb_mst_dma_hready_o = 1'b1;
+        ahb_mst_dma_hresp_o  = ahb_resp_error_e;
+      end
+
+      fsm_error0_st, fsm_transfer_st: begin
+        case ({mst_dma_mem_fixed_gnt_r, mst_dma_mem_rr_gnt_r, mst_dma_mem_wrr_gnt_r, mst_dma_mem_lrg_gnt_r})
+          4'b0001: begin
+            ahb_mst_dma_hrdata_o = (mst_dma_hwrite_dph_r == 1'b0) ? ahb_slv_mem_lrg_hrdata_i : 32'h00000000;
+            ahb_mst_dma_hready_o = ahb_slv_mem_lrg_hreadyout_i;
+            ahb_mst_dma_hresp_o = ahb_slv_mem_lrg_hresp_i;
+          end
+
+          4'b0010: begin
+            ahb_mst_dma_hrdata_o = (mst_dma_hwrite_dph_r == 1'b0) ? ahb_slv_mem_wrr_hrdata_i : 32'h00000000;
+            ahb_mst_dma_hready_o = ahb_slv_mem_wrr_hreadyout_i;
+            ahb_mst_dma_hresp_o = ahb_slv_mem_wrr_hresp_i;
+          end
+
+          4'b0100: begin
+            ahb_mst_dma_hrdata_o = (mst_dma_hwrite_dph_r == 1'b0) ? ahb_slv_mem_rr_hrdata_i : 32'h00000000;
+            ahb_mst_dma_hready_o = ahb_slv_mem_rr_hreadyout_i;
+            ahb_mst_dma_hresp_o = ahb_slv_mem_rr_hresp_i;
+          end
+
+          4'b1000: begin
+            ahb_mst_dma_hrdata_o = (mst_dma_hwrite_dph_r == 1'b0) ? ahb_slv_mem_fixed_hrdata_i : 32'h00000000;
+            ahb_mst_dma_hready_o = ahb_slv_mem_fixed_hreadyout_i;
+            ahb_mst_dma_hresp_o = ahb_slv_mem_fixed_hresp_i;
+          end
+
+          default: begin
+            ahb_mst_dma_hrdata_o = 32'h00000000;
+            ahb_mst_dma_hready_o = 1'b1;
+            ahb_mst_dma_hresp_o  = ahb_resp_okay_e;
+          end
+        endcase
+      end
+
+      fsm_transfer_finish_st: begin
+        case ({mst_dma_mem_fixed_gnt_r, mst_dma_mem_rr_gnt_r, mst_dma_mem_wrr_gnt_r, mst_dma_mem_lrg_gnt_r})
+          4'b0001: begin
+            ahb_mst_dma_hrdata_o = ahb_slv_mem_lrg_hrdata_i;
+            ahb_mst_dma_hready_o = ahb_slv_mem_lrg_hreadyout_i;
+            ahb_mst_dma_hresp_o = ahb_slv_mem_lrg_hresp_i;
+          end
+
+          4'b0010: begin
+            ahb_mst_dma_hrdata_o = ahb_slv_mem_wrr_hrdata_i;
+            ahb_mst_dma_hready_o = ahb_slv_mem_wrr_hreadyout_i;
+            ahb_mst_dma_hresp_o = ahb_slv_mem_wrr_hresp_i;
+          end
+
+          4'b0100: begin
+            ahb_mst_dma_hrdata_o = ahb_slv_mem_rr_hrdata_i;
+            ahb_mst_dma_hready_o = ahb_slv_mem_rr_hreadyout_i;
+            ahb_mst_dma_hresp_o = ahb_slv_mem_rr_hresp_i;
+          end
+
+          4'b1000: begin
+            ahb_mst_dma_hrdata_o = ahb_slv_mem_fixed_hrdata_i;
+            ahb_mst_dma_hready_o = ahb_slv_mem_fixed_hreadyout_i;
+            ahb_mst_dma_hresp_o = ahb_slv_mem_fixed_hresp_i;
+          end
+
+          default: begin
+            ahb_mst_dma_hrdata_o = 32'h00000000;
+            ahb_mst_dma_hready_o = 1'b1;
+            ahb_mst_dma_hresp_o  = ahb_resp_okay_e;
+          end
+        endcase
+      end
+
+      default: begin
+        ahb_mst_dma_hrdata_o = 32'h00000000;
+        ahb_mst_dma_hready_o = 1'b1;
+        ahb_mst_dma_hresp_o  = ahb_resp_okay_e;
+      end
+    endcase
+  end
+
+
+
+  // ------------------------------------------------------
+  // The Slaves:
+  // ------------------------------------------------------
+  // Slave 'mem_fixed' fixed-priority arbiter
+  always_comb begin: proc_mem_fixed_fixed_arb
+    logic arb_en_s;
+
+    arb_en_s = ahb_slv_mem_fixed_hreadyout_i & ~(mst_cpu_mem_fixed_keep_s | mst_dsp_mem_fixed_keep_s | mst_dma_mem_fixed_keep_s);
+
+    slv_mem_fixed_cpu_gnt_s = 1'b0;
+    slv_mem_fixed_dsp_gnt_s = 1'b0;
+    slv_mem_fixed_dma_gnt_s = 1'b0;
+    if (arb_en_s == 1'b1) begin
+      if (mst_cpu_mem_fixed_req_s == 1'b1) begin  // weight 3
+        slv_mem_fixed_cpu_gnt_s = 1'b1;
+      end else if (mst_dsp_mem_fixed_req_s == 1'b1) begin  // weight 2
+        slv_mem_fixed_dsp_gnt_s = 1'b1;
+      end else if (mst_dma_mem_fixed_req_s == 1'b1) begin  // weight 1
+        slv_mem_fixed_dma_gnt_s = 1'b1;
+      end
+    end
+  end
+
+
+  // Slave 'mem_fixed' multiplexer
+  always_comb begin: proc_mem_fixed_mux
+      slv_mem_fixed_cpu_sel_s = slv_mem_fixed_cpu_gnt_s |
+                                (mst_cpu_mem_fixed_keep_s & mst_cpu_mem_fixed_gnt_r);
+      slv_mem_fixed_dsp_sel_s = slv_mem_fixed_dsp_gnt_s |
+                                (mst_dsp_mem_fixed_keep_s & mst_dsp_mem_fixed_gnt_r);
+      slv_mem_fixed_dma_sel_s = slv_mem_fixed_dma_gnt_s |
+                                (mst_dma_mem_fixed_keep_s & mst_dma_mem_fixed_gnt_r);
+
+    ahb_slv_mem_fixed_hsel_o = |{slv_mem_fixed_cpu_sel_s, slv_mem_fixed_dsp_sel_s, slv_mem_fixed_dma_sel_s};
+
+    case ({slv_mem_fixed_cpu_sel_s, slv_mem_fixed_dsp_sel_s, slv_mem_fixed_dma_sel_s})  // address phase signals
+      3'b001: begin
+        ahb_slv_mem_fixed_haddr_o     = mst_dma_haddr_s;
+        ahb_slv_mem_fixed_hwrite_o    = mst_dma_hwrite_s;
+        ahb_slv_mem_fixed_hburst_o    = mst_dma_hburst_s;
+        ahb_slv_mem_fixed_hsize_o     = mst_dma_hsize_s;
+        ahb_slv_mem_fixed_htrans_o    = mst_dma_htrans_s;
+        ahb_slv_mem_fixed_hprot_o     = mst_dma_hprot_s;
+        ahb_slv_mem_fixed_hready_o    = mst_dma_hready_s;
+      end
+
+      3'b010: begin
+        ahb_slv_mem_fixed_haddr_o     = mst_dsp_haddr_s;
+        ahb_slv_mem_fixed_hwrite_o    = mst_dsp_hwrite_s;
+        ahb_slv_mem_fixed_hburst_o    = mst_dsp_hburst_s;
+        ahb_slv_mem_fixed_hsize_o     = mst_dsp_hsize_s;
+        ahb_slv_mem_fixed_htrans_o    = mst_dsp_htrans_s;
+        ahb_slv_mem_fixed_hprot_o     = mst_dsp_hprot_s;
+        ahb_slv_mem_fixed_hready_o    = mst_dsp_hready_s;
+      end
+
+      3'b100: begin
+        ahb_slv_mem_fixed_haddr_o     = mst_cpu_haddr_s;
+        ahb_slv_mem_fixed_hwrite_o    = mst_cpu_hwrite_s;
+        ahb_slv_mem_fixed_hburst_o    = mst_cpu_hburst_s;
+        ahb_slv_mem_fixed_hsize_o     = mst_cpu_hsize_s;
+        ahb_slv_mem_fixed_htrans_o    = mst_cpu_htrans_s;
+        ahb_slv_mem_fixed_hprot_o     = mst_cpu_hprot_s;
+        ahb_slv_mem_fixed_hready_o    = mst_cpu_hready_s;
+      end
+
+      default: begin
+        ahb_slv_mem_fixed_haddr_o     = 32'h00000000;
+        ahb_slv_mem_fixed_hwrite_o    = ahb_write_read_e;
+        ahb_slv_mem_fixed_hburst_o    = ahb_burst_single_e;
+        ahb_slv_mem_fixed_hsize_o     = ahb_size_word_e;
+        ahb_slv_mem_fixed_htrans_o    = ahb_trans_idle_e;
+        ahb_slv_mem_fixed_hprot_o     = 4'h3;
+        ahb_slv_mem_fixed_hready_o    = ahb_slv_mem_fixed_hreadyout_i;
+      end
+    endcase
+
+
+    case ({mst_cpu_mem_fixed_gnt_r, mst_dsp_mem_fixed_gnt_r, mst_dma_mem_fixed_gnt_r})  // data phase signals
+      3'b001: begin
+        ahb_slv_mem_fixed_hwdata_o = ahb_mst_dma_hwdata_i;
+      end
+
+      3'b010: begin
+        ahb_slv_mem_fixed_hwdata_o = ahb_mst_dsp_hwdata_i;
+      end
+
+      3'b100: begin
+        ahb_slv_mem_fixed_hwdata_o = ahb_mst_cpu_hwdata_i;
+      end
+
+      default: begin
+        ahb_slv_mem_fixed_hwdata_o = 32'h00000000;
+      end
+    endcase
+  end
+
+  // // Slave 'mem_rr' round-robin arbiter
+  always_comb begin: proc_mem_rr_rr_arb
+    integer i;
+    logic found_s;
+    logic [2:0] slv_req_s;
+    logic [2:0] prev_grant_s;
+    logic [2:0] next_grant_s;
+    logic arb_en_s;
+
+    slv_req_s = {mst_cpu_mem_rr_req_s, mst_dsp_mem_rr_req_s, mst_dma_mem_rr_req_s};
+    prev_grant_s = {slv_mem_rr_cpu_gnt_r, slv_mem_rr_dsp_gnt_r, slv_mem_rr_dma_gnt_r};
+    arb_en_s = ~(mst_cpu_mem_rr_keep_s | mst_dsp_mem_rr_keep_s | mst_dma_mem_rr_keep_s);
+
+    next_grant_s = {prev_grant_s[1:0], prev_grant_s[2]}; // 1st candidate is old grant rotated 1 left
+    found_s = 1'b0;
+    for (i=0; i<3; i=i+1) begin
+      if (found_s == 1'b0) begin
+        if ((slv_req_s & next_grant_s) != 3'd0) begin
+          found_s = 1'b1;
+        end else begin
+          next_grant_s = {next_grant_s[1:0], next_grant_s[2]}; // rotate 1 left
+        end
+      end
+    end
+
+    {slv_mem_rr_cpu_gnt_s, slv_mem_rr_dsp_gnt_s, slv_mem_rr_dma_gnt_s} = slv_req_s & next_grant_s & {3{(ahb_slv_mem_rr_hreadyout_i & arb_en_s)}};
+  end
+
+
+  always_ff @(posedge main_clk_i or negedge main_rst_an_i) begin: proc_mem_rr_gnt
+    if (main_rst_an_i == 1'b0) begin
+      slv_mem_rr_cpu_gnt_r <= 1'b1;  // initial pseudo-grant
+      slv_mem_rr_dsp_gnt_r <= 1'b0;
+      slv_mem_rr_dma_gnt_r <= 1'b0;
+    end else begin
+      if ({slv_mem_rr_cpu_gnt_s, slv_mem_rr_dsp_gnt_s, slv_mem_rr_dma_gnt_s} != 3'd0) begin
+        slv_mem_rr_cpu_gnt_r <= slv_mem_rr_cpu_gnt_s;
+        slv_mem_rr_dsp_gnt_r <= slv_mem_rr_dsp_gnt_s;
+        slv_mem_rr_dma_gnt_r <= slv_mem_rr_dma_gnt_s;
+      end
+    end
+  end
+
+
+  // Slave 'mem_rr' multiplexer
+  always_comb begin: proc_mem_rr_mux
+      slv_mem_rr_cpu_sel_s = slv_mem_rr_cpu_gnt_s |
+                             (mst_cpu_mem_rr_keep_s & mst_cpu_mem_rr_gnt_r);
+      slv_mem_rr_dsp_sel_s = slv_mem_rr_dsp_gnt_s |
+                             (mst_dsp_mem_rr_keep_s & mst_dsp_mem_rr_gnt_r);
+      slv_mem_rr_dma_sel_s = slv_mem_rr_dma_gnt_s |
+                             (mst_dma_mem_rr_keep_s & mst_dma_mem_rr_gnt_r);
+
+    ahb_slv_mem_rr_hsel_o = |{slv_mem_rr_cpu_sel_s, slv_mem_rr_dsp_sel_s, slv_mem_rr_dma_sel_s};
+
+    case ({slv_mem_rr_cpu_sel_s, slv_mem_rr_dsp_sel_s, slv_mem_rr_dma_sel_s})  // address phase signals
+      3'b001: begin
+        ahb_slv_mem_rr_haddr_o     = mst_dma_haddr_s;
+        ahb_slv_mem_rr_hwrite_o    = mst_dma_hwrite_s;
+        ahb_slv_mem_rr_hburst_o    = mst_dma_hburst_s;
+        ahb_slv_mem_rr_hsize_o     = mst_dma_hsize_s;
+        ahb_slv_mem_rr_htrans_o    = mst_dma_htrans_s;
+        ahb_slv_mem_rr_hprot_o     = mst_dma_hprot_s;
+        ahb_slv_mem_rr_hready_o    = mst_dma_hready_s;
+      end
+
+      3'b010: begin
+        ahb_slv_mem_rr_haddr_o     = mst_dsp_haddr_s;
+        ahb_slv_mem_rr_hwrite_o    = mst_dsp_hwrite_s;
+        ahb_slv_mem_rr_hburst_o    = mst_dsp_hburst_s;
+        ahb_slv_mem_rr_hsize_o     = mst_dsp_hsize_s;
+        ahb_slv_mem_rr_htrans_o    = mst_dsp_htrans_s;
+        ahb_slv_mem_rr_hprot_o     = mst_dsp_hprot_s;
+        ahb_slv_mem_rr_hready_o    = mst_dsp_hready_s;
+      end
+
+      3'b100: begin
+        ahb_slv_mem_rr_haddr_o     = mst_cpu_haddr_s;
+        ahb_slv_mem_rr_hwrite_o    = mst_cpu_hwrite_s;
+        ahb_slv_mem_rr_hburst_o    = mst_cpu_hburst_s;
+        ahb_slv_mem_rr_hsize_o     = mst_cpu_hsize_s;
+        ahb_slv_mem_rr_htrans_o    = mst_cpu_htrans_s;
+        ahb_slv_mem_rr_hprot_o     = mst_cpu_hprot_s;
+        ahb_slv_mem_rr_hready_o    = mst_cpu_hready_s;
+      end
+
+      default: begin
+        ahb_slv_mem_rr_haddr_o     = 32'h00000000;
+        ahb_slv_mem_rr_hwrite_o    = ahb_write_read_e;
+        ahb_slv_mem_rr_hburst_o    = ahb_burst_single_e;
+        ahb_slv_mem_rr_hsize_o     = ahb_size_word_e;
+        ahb_slv_mem_rr_htrans_o    = ahb_trans_idle_e;
+        ahb_slv_mem_rr_hprot_o     = 4'h3;
+        ahb_slv_mem_rr_hready_o    = ahb_slv_mem_rr_hreadyout_i;
+      end
+    endcase
+
+
+    case ({mst_cpu_mem_rr_gnt_r, mst_dsp_mem_rr_gnt_r, mst_dma_mem_rr_gnt_r})  // data phase signals
+      3'b001: begin
+        ahb_slv_mem_rr_hwdata_o = ahb_mst_dma_hwdata_i;
+      end
+
+      3'b010: begin
+        ahb_slv_mem_rr_hwdata_o = ahb_mst_dsp_hwdata_i;
+      end
+
+      3'b100: begin
+        ahb_slv_mem_rr_hwdata_o = ahb_mst_cpu_hwdata_i;
+      end
+
+      default: begin
+        ahb_slv_mem_rr_hwdata_o = 32'h00000000;
+      end
+    endcase
+  end
+
+  // Slave 'mem_wrr' weighted round-robin arbiter
+  always_comb begin: proc_mem_wrr_wrr_arb
+    integer i;
+    logic found_s;
+    logic [2:0] slv_req_s;
+    logic [2:0] prev_grant_s;
+    logic [2:0] next_grant_s;
+    logic arb_en_s;
+
+    slv_req_s = {mst_cpu_mem_wrr_req_s, mst_dsp_mem_wrr_req_s, mst_dma_mem_wrr_req_s};
+    prev_grant_s = {slv_mem_wrr_cpu_gnt_r, slv_mem_wrr_dsp_gnt_r, slv_mem_wrr_dma_gnt_r};
+    arb_en_s = ~(mst_cpu_mem_wrr_keep_s | mst_dsp_mem_wrr_keep_s | mst_dma_mem_wrr_keep_s);
+
+    next_grant_s = {prev_grant_s[1:0], prev_grant_s[2]}; // 1st candidate is old grant rotated 1 left
+    found_s = 1'b0;
+    for (i=0; i<3; i=i+1) begin
+      if (found_s == 1'b0) begin
+        if ((slv_req_s & next_grant_s) != 3'd0) begin
+          found_s = 1'b1;
+        end else begin
+          next_grant_s = {next_grant_s[1:0], next_grant_s[2]}; // rotate 1 left
+        end
+      end
+    end
+    if (((slv_req_s & prev_grant_s) != 3'd0) && (slv_mem_wrr_credit_r != 2'h0)) begin
+      next_grant_s = prev_grant_s; // old grant has consecutive grants left
+    end
+
+    {slv_mem_wrr_cpu_gnt_s, slv_mem_wrr_dsp_gnt_s, slv_mem_wrr_dma_gnt_s} = slv_req_s & next_grant_s & {3{(ahb_slv_mem_wrr_hreadyout_i & arb_en_s)}};
+  end
+
+
+  always_ff @(posedge main_clk_i or negedge main_rst_an_i) begin: proc_mem_wrr_gnt
+    if (main_rst_an_i == 1'b0) begin
+      slv_mem_wrr_cpu_gnt_r <= 1'b1;  // initial pseudo-grant
+      slv_mem_wrr_dsp_gnt_r <= 1'b0;
+      slv_mem_wrr_dma_gnt_r <= 1'b0;
+      slv_mem_wrr_credit_r <= 2'h0;
+    end else begin
+      if ({slv_mem_wrr_cpu_gnt_s, slv_mem_wrr_dsp_gnt_s, slv_mem_wrr_dma_gnt_s} != 3'd0) begin
+        slv_mem_wrr_cpu_gnt_r <= slv_mem_wrr_cpu_gnt_s;
+        slv_mem_wrr_dsp_gnt_r <= slv_mem_wrr_dsp_gnt_s;
+        slv_mem_wrr_dma_gnt_r <= slv_mem_wrr_dma_gnt_s;
+        if ((({slv_mem_wrr_cpu_gnt_s, slv_mem_wrr_dsp_gnt_s, slv_mem_wrr_dma_gnt_s} & {slv_mem_wrr_cpu_gnt_r, slv_mem_wrr_dsp_gnt_r, slv_mem_wrr_dma_gnt_r}) != 3'd0) && (slv_mem_wrr_credit_r != 2'h0)) begin
+          slv_mem_wrr_credit_r <= slv_mem_wrr_credit_r - 1'b1;
+        end else begin
+          case ({slv_mem_wrr_cpu_gnt_s, slv_mem_wrr_dsp_gnt_s, slv_mem_wrr_dma_gnt_s})
+            3'b001: begin
+              slv_mem_wrr_credit_r <= 2'h0; // dma
+            end
+            3'b010: begin
+              slv_mem_wrr_credit_r <= 2'h1; // dsp
+            end
+            3'b100: begin
+              slv_mem_wrr_credit_r <= 2'h2; // cpu
+            end
+            default: begin
+              slv_mem_wrr_credit_r <= 2'h0;
+            end
+          endcase
+        end
+      end
+    end
+  end
+
+
+  // Slave 'mem_wrr' multiplexer
+  always_comb begin: proc_mem_wrr_mux
+      slv_mem_wrr_cpu_sel_s = slv_mem_wrr_cpu_gnt_s |
+                              (mst_cpu_mem_wrr_keep_s & mst_cpu_mem_wrr_gnt_r);
+      slv_mem_wrr_dsp_sel_s = slv_mem_wrr_dsp_gnt_s |
+                              (mst_dsp_mem_wrr_keep_s & mst_dsp_mem_wrr_gnt_r);
+      slv_mem_wrr_dma_sel_s = slv_mem_wrr_dma_gnt_s |
+                              (mst_dma_mem_wrr_keep_s & mst_dma_mem_wrr_gnt_r);
+
+    ahb_slv_mem_wrr_hsel_o = |{slv_mem_wrr_cpu_sel_s, slv_mem_wrr_dsp_sel_s, slv_mem_wrr_dma_sel_s};
+
+    case ({slv_mem_wrr_cpu_sel_s, slv_mem_wrr_dsp_sel_s, slv_mem_wrr_dma_sel_s})  // address phase signals
+      3'b001: begin
+        ahb_slv_mem_wrr_haddr_o     = mst_dma_haddr_s;
+        ahb_slv_mem_wrr_hwrite_o    = mst_dma_hwrite_s;
+        ahb_slv_mem_wrr_hburst_o    = mst_dma_hburst_s;
+        ahb_slv_mem_wrr_hsize_o     = mst_dma_hsize_s;
+        ahb_slv_mem_wrr_htrans_o    = mst_dma_htrans_s;
+        ahb_slv_mem_wrr_hprot_o     = mst_dma_hprot_s;
+        ahb_slv_mem_wrr_hready_o    = mst_dma_hready_s;
+      end
+
+      3'b010: begin
+        ahb_slv_mem_wrr_haddr_o     = mst_dsp_haddr_s;
+        ahb_slv_mem_wrr_hwrite_o    = mst_dsp_hwrite_s;
+        ahb_slv_mem_wrr_hburst_o    = mst_dsp_hburst_s;
+        ahb_slv_mem_wrr_hsize_o     = mst_dsp_hsize_s;
+        ahb_slv_mem_wrr_htrans_o    = mst_dsp_htrans_s;
+        ahb_slv_mem_wrr_hprot_o     = mst_dsp_hprot_s;
+        ahb_slv_mem_wrr_hready_o    = mst_dsp_hready_s;
+      end
+
+      3'b100: begin
+        ahb_slv_mem_wrr_haddr_o     = mst_cpu_haddr_s;
+        ahb_slv_mem_wrr_hwrite_o    = mst_cpu_hwrite_s;
+        ahb_slv_mem_wrr_hburst_o    = mst_cpu_hburst_s;
+        ahb_slv_mem_wrr_hsize_o     = mst_cpu_hsize_s;
+        ahb_slv_mem_wrr_htrans_o    = mst_cpu_htrans_s;
+        ahb_slv_mem_wrr_hprot_o     = mst_cpu_hprot_s;
+        ahb_slv_mem_wrr_hready_o    = mst_cpu_hready_s;
+      end
+
+      default: begin
+        ahb_slv_mem_wrr_haddr_o     = 32'h00000000;
+        ahb_slv_mem_wrr_hwrite_o    = ahb_write_read_e;
+        ahb_slv_mem_wrr_hburst_o    = ahb_burst_single_e;
+        ahb_slv_mem_wrr_hsize_o     = ahb_size_word_e;
+        ahb_slv_mem_wrr_htrans_o    = ahb_trans_idle_e;
+        ahb_slv_mem_wrr_hprot_o     = 4'h3;
+        ahb_slv_mem_wrr_hready_o    = ahb_slv_mem_wrr_hreadyout_i;
+      end
+    endcase
+
+
+    case ({mst_cpu_mem_wrr_gnt_r, mst_dsp_mem_wrr_gnt_r, mst_dma_mem_wrr_gnt_r})  // data phase signals
+      3'b001: begin
+        ahb_slv_mem_wrr_hwdata_o = ahb_mst_dma_hwdata_i;
+      end
+
+      3'b010: begin
+        ahb_slv_mem_wrr_hwdata_o = ahb_mst_dsp_hwdata_i;
+      end
+
+      3'b100: begin
+        ahb_slv_mem_wrr_hwdata_o = ahb_mst_cpu_hwdata_i;
+      end
+
+      default: begin
+        ahb_slv_mem_wrr_hwdata_o = 32'h00000000;
+      end
+    endcase
+  end
+
+  // Slave 'mem_lrg' least-recently-granted arbiter
+  always_comb begin: proc_mem_lrg_lrg_arb
+    logic arb_en_s;
+
+    arb_en_s = ahb_slv_mem_lrg_hreadyout_i & ~(mst_cpu_mem_lrg_keep_s | mst_dsp_mem_lrg_keep_s | mst_dma_mem_lrg_keep_s);
+
+    slv_mem_lrg_cpu_gnt_s = arb_en_s & mst_cpu_mem_lrg_req_s & (~mst_dsp_mem_lrg_req_s | slv_mem_lrg_lrg_r[1]) & (~mst_dma_mem_lrg_req_s | slv_mem_lrg_lrg_r[2]);
+    slv_mem_lrg_dsp_gnt_s = arb_en_s & mst_dsp_mem_lrg_req_s & (~mst_cpu_mem_lrg_req_s | ~slv_mem_lrg_lrg_r[1]) & (~mst_dma_mem_lrg_req_s | slv_mem_lrg_lrg_r[5]);
+    slv_mem_lrg_dma_gnt_s = arb_en_s & mst_dma_mem_lrg_req_s & (~mst_cpu_mem_lrg_req_s | ~slv_mem_lrg_lrg_r[2]) & (~mst_dsp_mem_lrg_req_s | ~slv_mem_lrg_lrg_r[5]);
+  end
+
+
+  always_ff @(posedge main_clk_i or negedge main_rst_an_i) begin: proc_mem_lrg_lrg
+    if (main_rst_an_i == 1'b0) begin
+      slv_mem_lrg_lrg_r <= 9'h026;  // initial order of masters
+    end else begin
+      slv_mem_lrg_lrg_r[1] <= (slv_mem_lrg_lrg_r[1] & ~slv_mem_lrg_cpu_gnt_s) | slv_mem_lrg_dsp_gnt_s; // cpu before dsp
+      slv_mem_lrg_lrg_r[2] <= (slv_mem_lrg_lrg_r[2] & ~slv_mem_lrg_cpu_gnt_s) | slv_mem_lrg_dma_gnt_s; // cpu before dma
+      slv_mem_lrg_lrg_r[5] <= (slv_mem_lrg_lrg_r[5] & ~slv_mem_lrg_dsp_gnt_s) | slv_mem_lrg_dma_gnt_s; // dsp before dma
+    end
+  end
+
+
+  // Slave 'mem_lrg' multiplexer
+  always_comb begin: proc_mem_lrg_mux
+      slv_mem_lrg_cpu_sel_s = slv_mem_lrg_cpu_gnt_s |
+                              (mst_cpu_mem_lrg_keep_s & mst_cpu_mem_lrg_gnt_r);
+      slv_mem_lrg_dsp_sel_s = slv_mem_lrg_dsp_gnt_s |
+                              (mst_dsp_mem_lrg_keep_s & mst_dsp_mem_lrg_gnt_r);
+      slv_mem_lrg_dma_sel_s = slv_mem_lrg_dma_gnt_s |
+                              (mst_dma_mem_lrg_keep_s & mst_dma_mem_lrg_gnt_r);
+
+    ahb_slv_mem_lrg_hsel_o = |{slv_mem_lrg_cpu_sel_s, slv_mem_lrg_dsp_sel_s, slv_mem_lrg_dma_sel_s};
+
+    case ({slv_mem_lrg_cpu_sel_s, slv_mem_lrg_dsp_sel_s, slv_mem_lrg_dma_sel_s})  // address phase signals
+      3'b001: begin
+        ahb_slv_mem_lrg_haddr_o     = mst_dma_haddr_s;
+        ahb_slv_mem_lrg_hwrite_o    = mst_dma_hwrite_s;
+        ahb_slv_mem_lrg_hburst_o    = mst_dma_hburst_s;
+        ahb_slv_mem_lrg_hsize_o     = mst_dma_hsize_s;
+        ahb_slv_mem_lrg_htrans_o    = mst_dma_htrans_s;
+        ahb_slv_mem_lrg_hprot_o     = mst_dma_hprot_s;
+        ahb_slv_mem_lrg_hready_o    = mst_dma_hready_s;
+      end
+
+      3'b010: begin
+        ahb_slv_mem_lrg_haddr_o     = mst_dsp_haddr_s;
+        ahb_slv_mem_lrg_hwrite_o    = mst_dsp_hwrite_s;
+        ahb_slv_mem_lrg_hburst_o    = mst_dsp_hburst_s;
+        ahb_slv_mem_lrg_hsize_o     = mst_dsp_hsize_s;
+        ahb_slv_mem_lrg_htrans_o    = mst_dsp_htrans_s;
+        ahb_slv_mem_lrg_hprot_o     = mst_dsp_hprot_s;
+        ahb_slv_mem_lrg_hready_o    = mst_dsp_hready_s;
+      end
+
+      3'b100: begin
+        ahb_slv_mem_lrg_haddr_o     = mst_cpu_haddr_s;
+        ahb_slv_mem_lrg_hwrite_o    = mst_cpu_hwrite_s;
+        ahb_slv_mem_lrg_hburst_o    = mst_cpu_hburst_s;
+        ahb_slv_mem_lrg_hsize_o     = mst_cpu_hsize_s;
+        ahb_slv_mem_lrg_htrans_o    = mst_cpu_htrans_s;
+        ahb_slv_mem_lrg_hprot_o     = mst_cpu_hprot_s;
+        ahb_slv_mem_lrg_hready_o    = mst_cpu_hready_s;
+      end
+
+      default: begin
+        ahb_slv_mem_lrg_haddr_o     = 32'h00000000;
+        ahb_slv_mem_lrg_hwrite_o    = ahb_write_read_e;
+        ahb_slv_mem_lrg_hburst_o    = ahb_burst_single_e;
+        ahb_slv_mem_lrg_hsize_o     = ahb_size_word_e;
+        ahb_slv_mem_lrg_htrans_o    = ahb_trans_idle_e;
+        ahb_slv_mem_lrg_hprot_o     = 4'h3;
+        ahb_slv_mem_lrg_hready_o    = ahb_slv_mem_lrg_hreadyout_i;
+      end
+    endcase
+
+
+    case ({mst_cpu_mem_lrg_gnt_r, mst_dsp_mem_lrg_gnt_r, mst_dma_mem_lrg_gnt_r})  // data phase signals
+      3'b001: begin
+        ahb_slv_mem_lrg_hwdata_o = ahb_mst_dma_hwdata_i;
+      end
+
+      3'b010: begin
+        ahb_slv_mem_lrg_hwdata_o = ahb_mst_dsp_hwdata_i;
+      end
+
+      3'b100: begin
+        ahb_slv_mem_lrg_hwdata_o = ahb_mst_cpu_hwdata_i;
+      end
+
+      default: begin
+        ahb_slv_mem_lrg_hwdata_o = 32'h00000000;
+      end
+    endcase
+  end
+
+  // Slave 'periph': no arbitration necessary
+  always_comb begin: proc_periph_asgn
+    slv_periph_cpu_gnt_s = mst_cpu_periph_req_s;
+
+    ahb_slv_periph_hsel_o        = mst_cpu_periph_req_s | (mst_cpu_periph_gnt_r & mst_cpu_cont_xfer_s);  // address phase signals
+    if (mst_cpu_periph_sel_s == 1'b1) begin
+      ahb_slv_periph_haddr_o     = ahb_mst_cpu_haddr_i;
+      ahb_slv_periph_hwrite_o    = ahb_mst_cpu_hwrite_i;
+      ahb_slv_periph_hburst_o    = ahb_mst_cpu_hburst_i;
+      ahb_slv_periph_hsize_o     = ahb_mst_cpu_hsize_i;
+      ahb_slv_periph_htrans_o    = ahb_mst_cpu_htrans_i;
+      ahb_slv_periph_hprot_o     = ahb_mst_cpu_hprot_i;
+      ahb_slv_periph_hready_o    = mst_cpu_hready_s;
+    end else begin
+      ahb_slv_periph_haddr_o     = 32'h00000000;
+      ahb_slv_periph_hwrite_o    = ahb_write_read_e;
+      ahb_slv_periph_hburst_o    = ahb_burst_single_e;
+      ahb_slv_periph_hsize_o     = ahb_size_word_e;
+      ahb_slv_periph_htrans_o    = ahb_trans_idle_e;
+      ahb_slv_periph_hprot_o     = 4'h3;
+      ahb_slv_periph_hready_o    = ahb_slv_periph_hreadyout_i;
+    end
+
+
+    if (mst_cpu_periph_gnt_r == 1'b1) begin  // data phase signals
+      ahb_slv_periph_hwdata_o = ahb_mst_cpu_hwdata_i;
+    end else begin
+      ahb_slv_periph_hwdata_o = 32'h00000000;
+    end
+  end
+
+
+endmodule // ucdp_ahb_ml_arb_example_ml
+
+`default_nettype wire
+`end_keywords
+
+// =============================================================================
+//
+//   @generated @fully-generated
+//
+//   THIS FILE IS GENERATED!!! DO NOT EDIT MANUALLY. CHANGES ARE LOST.
+//
+// =============================================================================
@@ -0,0 +1,1014 @@
+// =============================================================================
+//
+//   @generated @fully-generated
+//
+//   THIS FILE IS GENERATED!!! DO NOT EDIT MANUALLY. CHANGES ARE LOST.
+//
+// =============================================================================
+//
+//  MIT License
+//
+//  Copyright (c) 2024-2025 nbiotcloud
+//
+//  Permission is hereby granted, free of charge, to any person obtaining a copy
+//  of this software and associated documentation files (the "Software"), to deal
+//  in the Software without restriction, including without limitation the rights
+//  to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+//  copies of the Software, and to permit persons to whom the Software is
+//  furnished to do so, subject to the following conditions:
+//
+//  The above copyright notice and this permission notice shall be included in all
+//  copies or substantial portions of the Software.
+//
+//  THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+//  IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+//  FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+//  AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+//  LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+//  OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+//  SOFTWARE.
+//
+// =============================================================================
+//
+// Module:     ucdp_amba.ucdp_ahb_ml_arb_example_ml
+// Data Model: ucdp_amba.ucdp_ahb_ml.UcdpAhbMlMod
+//
+//
+// | Master > Slave | mem_fixed | mem_rr | mem_wrr | mem_lrg | periph |
+// | -------------- | --------- | ------ | ------- | ------- | ------ |
+// | cpu            | X         | X      | X       | X       | X      |
+// | dsp            | X         | X      | X       | X       |        |
+// | dma            | X         | X      | X       | X       |        |
+//
+//
+//
+// * Top:     `None`
+// * Defines: `None`
+// * Size:    `20 KB`
+//
+// | Addrspace | Type     | Base     | Size              | Infos | Attributes |
+// | --------- | -------- | -------- | ----------------- | ----- | ---------- |
+// | mem_fixed | Slave    | `0x0`    | `1024x32 (4 KB)`  |       |            |
+// | mem_rr    | Slave    | `0x1000` | `1024x32 (4 KB)`  |       |            |
+// | mem_wrr   | Slave    | `0x2000` | `1024x32 (4 KB)`  |       |            |
+// | mem_lrg   | Slave    | `0x3000` | `1024x32 (4 KB)`  |       |            |
+// | periph    | Slave    | `0x4000` | `1024x32 (4 KB)`  |       |            |
+// | reserved0 | Reserved | `0x5000` | `3072x32 (12 KB)` |       |            |
+//
+// =============================================================================
+
+`begin_keywords "1800-2009"
+`default_nettype none  // implicit wires are forbidden
+
+module ucdp_ahb_ml_arb_example_ml ( // ucdp_amba.ucdp_ahb_ml.UcdpAhbMlMod
+  // main_i: Clock and Reset
+  input  wire         main_clk_i,                    // Clock
+  input  wire         main_rst_an_i,                 // Async Reset (Low-Active)
+  // ahb_mst_cpu_i: AHB Input 'cpu'
+  input  wire  [1:0]  ahb_mst_cpu_htrans_i,          // AHB Transfer Type
+  input  wire  [31:0] ahb_mst_cpu_haddr_i,           // AHB Bus Address
+  input  wire         ahb_mst_cpu_hwrite_i,          // AHB Write Enable
+  input  wire  [2:0]  ahb_mst_cpu_hsize_i,           // AHB Size
+  input  wire  [2:0]  ahb_mst_cpu_hburst_i,          // AHB Burst Type
+  input  wire  [3:0]  ahb_mst_cpu_hprot_i,           // AHB Transfer Protection
+  input  wire  [31:0] ahb_mst_cpu_hwdata_i,          // AHB Data
+  output logic        ahb_mst_cpu_hready_o,          // AHB Transfer Done
+  output logic        ahb_mst_cpu_hresp_o,           // AHB Response Error
+  output logic [31:0] ahb_mst_cpu_hrdata_o,          // AHB Data
+  // ahb_mst_dsp_i: AHB Input 'dsp'
+  input  wire  [1:0]  ahb_mst_dsp_htrans_i,          // AHB Transfer Type
+  input  wire  [31:0] ahb_mst_dsp_haddr_i,           // AHB Bus Address
+  input  wire         ahb_mst_dsp_hwrite_i,          // AHB Write Enable
+  input  wire  [2:0]  ahb_mst_dsp_hsize_i,           // AHB Size
+  input  wire  [2:0]  ahb_mst_dsp_hburst_i,          // AHB Burst Type
+  input  wire  [3:0]  ahb_mst_dsp_hprot_i,           // AHB Transfer Protection
+  input  wire  [31:0] ahb_mst_dsp_hwdata_i,          // AHB Data
+  output logic        ahb_mst_dsp_hready_o,          // AHB Transfer Done
+  output logic        ahb_mst_dsp_hresp_o,           // AHB Response Error
+  output logic [31:0] ahb_mst_dsp_hrdata_o,          // AHB Data
+  // ahb_mst_dma_i: AHB Input 'dma'
+  input  wire  [1:0]  ahb_mst_dma_htrans_i,          // AHB Transfer Type
+  input  wire  [31:0] ahb_mst_dma_haddr_i,           // AHB Bus Address
+  input  wire         ahb_mst_dma_hwrite_i,          // AHB Write Enable
+  input  wire  [2:0]  ahb_mst_dma_hsize_i,           // AHB Size
+  input  wire  [2:0]  ahb_mst_dma_hburst_i,          // AHB Burst Type
+  input  wire  [3:0]  ahb_mst_dma_hprot_i,           // AHB Transfer Protection
+  input  wire  [31:0] ahb_mst_dma_hwdata_i,          // AHB Data
+  output logic        ahb_mst_dma_hready_o,          // AHB Transfer Done
+  output logic        ahb_mst_dma_hresp_o,           // AHB Response Error
+  output logic [31:0] ahb_mst_dma_hrdata_o,          // AHB Data
+  // ahb_slv_mem_fixed_o: AHB Output 'mem_fixed'
+  output logic        ahb_slv_mem_fixed_hsel_o,      // AHB Slave Select
+  output logic [31:0] ahb_slv_mem_fixed_haddr_o,     // AHB Bus Address
+  output logic        ahb_slv_mem_fixed_hwrite_o,    // AHB Write Enable
+  output logic [1:0]  ahb_slv_mem_fixed_htrans_o,    // AHB Transfer Type
+  output logic [2:0]  ahb_slv_mem_fixed_hsize_o,     // AHB Size
+  output logic [2:0]  ahb_slv_mem_fixed_hburst_o,    // AHB Burst Type
+  output logic [3:0]  ahb_slv_mem_fixed_hprot_o,     // AHB Transfer Protection
+  output logic [31:0] ahb_slv_mem_fixed_hwdata_o,    // AHB Data
+  output logic        ahb_slv_mem_fixed_hready_o,    // AHB Transfer Done to Slave
+  input  wire         ahb_slv_mem_fixed_hreadyout_i, // AHB Transfer Done from Slave
+  input  wire         ahb_slv_mem_fixed_hresp_i,     // AHB Response Error
+  input  wire  [31:0] ahb_slv_mem_fixed_hrdata_i,    // AHB Data
+  // ahb_slv_mem_rr_o: AHB Output 'mem_rr'
+  output logic        ahb_slv_mem_rr_hsel_o,         // AHB Slave Select
+  output logic [31:0] ahb_slv_mem_rr_haddr_o,        // AHB Bus Address
+  output logic        ahb_slv_mem_rr_hwrite_o,       // AHB Write Enable
+  output logic [1:0]  ahb_slv_mem_rr_htrans_o,       // AHB Transfer Type
+  output logic [2:0]  ahb_slv_mem_rr_hsize_o,        // AHB Size
+  output logic [2:0]  ahb_slv_mem_rr_hburst_o,       // AHB Burst Type
+  output logic [3:0]  ahb_slv_mem_rr_hprot_o,        // AHB Transfer Protection
+  output logic [31:0] ahb_slv_mem_rr_hwdata_o,       // AHB Data
+  output logic        ahb_slv_mem_rr_hready_o,       // AHB Transfer Done to Slave
+  input  wire         ahb_slv_mem_rr_hreadyout_i,    // AHB Transfer Done from Slave
+  input  wire         ahb_slv_mem_rr_hresp_i,        // AHB Response Error
+  input  wire  [31:0] ahb_slv_mem_rr_hrdata_i,       // AHB Data
+  // ahb_slv_mem_wrr_o: AHB Output 'mem_wrr'
+  output logic        ahb_slv_mem_wrr_hsel_o,        // AHB Slave Select
+  output logic [31:0] ahb_slv_mem_wrr_haddr_o,       // AHB Bus Address
+  output logic        ahb_slv_mem_wrr_hwrite_o,      // AHB Write Enable
+  output logic [1:0]  ahb_slv_mem_wrr_htrans_o,      // AHB Transfer Type
+  output logic [2:0]  ahb_slv_mem_wrr_hsize_o,       // AHB Size
+  output logic [2:0]  ahb_slv_mem_wrr_hburst_o,      // AHB Burst Type
+  output logic [3:0]  ahb_slv_mem_wrr_hprot_o,       // AHB Transfer Protection
+  output logic [31:0] ahb_slv_mem_wrr_hwdata_o,      // AHB Data
+  output logic        ahb_slv_mem_wrr_hready_o,      // AHB Transfer Done to Slave
+  input  wire         ahb_slv_mem_wrr_hreadyout_i,   // AHB Transfer Done from Slave
+  input  wire         ahb_slv_mem_wrr_hresp_i,       // AHB Response Error
+  input  wire  [31:0] ahb_slv_mem_wrr_hrdata_i,      // AHB Data
+  // ahb_slv_mem_lrg_o: AHB Output 'mem_lrg'
+  output logic        ahb_slv_mem_lrg_hsel_o,        // AHB Slave Select
+  output logic [31:0] ahb_slv_mem_lrg_haddr_o,       // AHB Bus Address
+  output logic        ahb_slv_mem_lrg_hwrite_o,      // AHB Write Enable
+  output logic [1:0]  ahb_slv_mem_lrg_htrans_o,      // AHB Transfer Type
+  output logic [2:0]  ahb_slv_mem_lrg_hsize_o,       // AHB Size
+  output logic [2:0]  ahb_slv_mem_lrg_hburst_o,      // AHB Burst Type
+  output logic [3:0]  ahb_slv_mem_lrg_hprot_o,       // AHB Transfer Protection
+  output logic [31:0] ahb_slv_mem_lrg_hwdata_o,      // AHB Data
+  output logic        ahb_slv_mem_lrg_hready_o,      // AHB Transfer Done to Slave
+  input  wire         ahb_slv_mem_lrg_hreadyout_i,   // AHB Transfer Done from Slave
+  input  wire         ahb_slv_mem_lrg_hresp_i,       // AHB Response Error
+  input  wire  [31:0] ahb_slv_mem_lrg_hrdata_i,      // AHB Data
+  // ahb_slv_periph_o: AHB Output 'periph'
+  output logic        ahb_slv_periph_hsel_o,         // AHB Slave Select
+  output logic [31:0] ahb_slv_periph_haddr_o,        // AHB Bus Address
+  output logic        ahb_slv_periph_hwrite_o,       // AHB Write Enable
+  output logic [1:0]  ahb_slv_periph_htrans_o,       // AHB Transfer Type
+  output logic [2:0]  ahb_slv_periph_hsize_o,        // AHB Size
+  output logic [2:0]  ahb_slv_periph_hburst_o,       // AHB Burst Type
+  output logic [3:0]  ahb_slv_periph_hprot_o,        // AHB Transfer Protection
+  output logic [31:0] ahb_slv_periph_hwdata_o,       // AHB Data
+  output logic        ahb_slv_periph_hready_o,       // AHB Transfer Done to Slave
+  input  wire         ahb_slv_periph_hreadyout_i,    // AHB Transfer Done from Slave
+  input  wire         ahb_slv_periph_hresp_i,        // AHB Response Error
+  input  wire  [31:0] ahb_slv_periph_hrdata_i        // AHB Data
+);
+
+
+
+
+  // ------------------------------------------------------
+  //  Local Parameter
+  // ------------------------------------------------------
+  // ahb_trans
+  localparam integer       ahb_trans_width_p      = 2;    // Width in Bits
+  localparam logic   [1:0] ahb_trans_min_p        = 2'h0; // AHB Transfer Type
+  localparam logic   [1:0] ahb_trans_max_p        = 2'h3; // AHB Transfer Type
+  localparam logic   [1:0] ahb_trans_idle_e       = 2'h0; // No transfer
+  localparam logic   [1:0] ahb_trans_busy_e       = 2'h1; // Idle cycle within transfer
+  localparam logic   [1:0] ahb_trans_nonseq_e     = 2'h2; // Single transfer or first transfer of a burst
+  localparam logic   [1:0] ahb_trans_seq_e        = 2'h3; // Consecutive transfers of a burst
+  localparam logic   [1:0] ahb_trans_default_p    = 2'h0; // AHB Transfer Type
+  // ahb_resp
+  localparam integer       ahb_resp_width_p       = 1;    // Width in Bits
+  localparam logic         ahb_resp_min_p         = 1'b0; // AHB Response Error
+  localparam logic         ahb_resp_max_p         = 1'b1; // AHB Response Error
+  localparam logic         ahb_resp_okay_e        = 1'b0; // OK
+  localparam logic         ahb_resp_error_e       = 1'b1; // Error
+  localparam logic         ahb_resp_default_p     = 1'b0; // AHB Response Error
+  // ahb_size
+  localparam integer       ahb_size_width_p       = 3;    // Width in Bits
+  localparam logic   [2:0] ahb_size_min_p         = 3'h0; // AHB Size
+  localparam logic   [2:0] ahb_size_max_p         = 3'h7; // AHB Size
+  localparam logic   [2:0] ahb_size_byte_e        = 3'h0; // Byte
+  localparam logic   [2:0] ahb_size_halfword_e    = 3'h1; // Halfword
+  localparam logic   [2:0] ahb_size_word_e        = 3'h2; // Word
+  localparam logic   [2:0] ahb_size_doubleword_e  = 3'h3; // Doubleword
+  localparam logic   [2:0] ahb_size_fourword_e    = 3'h4; // 4-word
+  localparam logic   [2:0] ahb_size_eightword_e   = 3'h5; // 8-word
+  localparam logic   [2:0] ahb_size_sixteenword_e = 3'h6; // 16-word
+  localparam logic   [2:0] ahb_size_kilobit_e     = 3'h7; // 32-word
+  localparam logic   [2:0] ahb_size_default_p     = 3'h0; // AHB Size
+  // ahb_burst
+  localparam integer       ahb_burst_width_p      = 3;    // Width in Bits
+  localparam logic   [2:0] ahb_burst_min_p        = 3'h0; // AHB Burst Type
+  localparam logic   [2:0] ahb_burst_max_p        = 3'h7; // AHB Burst Type
+  localparam logic   [2:0] ahb_burst_single_e     = 3'h0; // Single transfer
+  localparam logic   [2:0] ahb_burst_incr_e       = 3'h1; // Incrementing burst of unspecified length
+  localparam logic   [2:0] ahb_burst_wrap4_e      = 3'h2; // 4-beat wrapping burst
+  localparam logic   [2:0] ahb_burst_incr4_e      = 3'h3; // 4-beat incrementing burst
+  localparam logic   [2:0] ahb_burst_wrap8_e      = 3'h4; // 8-beat wrapping burst
+  localparam logic   [2:0] ahb_burst_incr8_e      = 3'h5; // 8-beat incrementing burst
+  localparam logic   [2:0] ahb_burst_wrap16_e     = 3'h6; // 16-beat wrapping burst
+  localparam logic   [2:0] ahb_burst_incr16_e     = 3'h7; // 16-beat incrementing burst
+  localparam logic   [2:0] ahb_burst_default_p    = 3'h0; // AHB Burst Type
+  // ahb_write
+  localparam integer       ahb_write_width_p      = 1;    // Width in Bits
+  localparam logic         ahb_write_min_p        = 1'b0; // AHB Write Enable
+  localparam logic         ahb_write_max_p        = 1'b1; // AHB Write Enable
+  localparam logic         ahb_write_read_e       = 1'b0; // Read operation
+  localparam logic         ahb_write_write_e      = 1'b1; // Write operation
+  localparam logic         ahb_write_default_p    = 1'b0; // AHB Write Enable
+  // fsm
+  localparam integer       fsm_width_p            = 3;    // Width in Bits
+  localparam logic   [2:0] fsm_min_p              = 3'h0; // AHB ML FSM Type
+  localparam logic   [2:0] fsm_max_p              = 3'h7; // AHB ML FSM Type
+  localparam logic   [2:0] fsm_idle_st            = 3'h0; // No transfer
+  localparam logic   [2:0] fsm_transfer_st        = 3'h1; // Transfer
+  localparam logic   [2:0] fsm_transfer_finish_st = 3'h2; // Transfer Finish (wait for HREADY)
+  localparam logic   [2:0] fsm_transfer_wait_st   = 3'h3; // Transfer Wait for Grant
+  localparam logic   [2:0] fsm_error0_st          = 3'h4; // Pre-Error (wait for HREADY)
+  localparam logic   [2:0] fsm_error1_st          = 3'h5; // 1st Error Cycle
+  localparam logic   [2:0] fsm_error2_st          = 3'h6; // 2nd Error Cycle
+  localparam logic   [2:0] fsm_default_p          = 3'h0; // AHB ML FSM Type
+
+
+  // ------------------------------------------------------
+  //  Signals
+  // ------------------------------------------------------
+  logic [1:0]  ahb_mst_htrans_s     [0:2];
+  logic [31:0] ahb_mst_haddr_s      [0:2];
+  logic        ahb_mst_hwrite_s     [0:2];
+  logic [2:0]  ahb_mst_hsize_s      [0:2];
+  logic [2:0]  ahb_mst_hburst_s     [0:2];
+  logic [3:0]  ahb_mst_hprot_s      [0:2];
+  logic [31:0] ahb_mst_hwdata_s     [0:2];
+  logic        ahb_mst_hready_s     [0:2];
+  logic        ahb_mst_hresp_s      [0:2];
+  logic [31:0] ahb_mst_hrdata_s     [0:2];
+  logic        ahb_slv_hsel_s       [0:4];
+  logic [1:0]  ahb_slv_htrans_s     [0:4];
+  logic [31:0] ahb_slv_haddr_s      [0:4];
+  logic        ahb_slv_hwrite_s     [0:4];
+  logic [2:0]  ahb_slv_hsize_s      [0:4];
+  logic [2:0]  ahb_slv_hburst_s     [0:4];
+  logic [3:0]  ahb_slv_hprot_s      [0:4];
+  logic        ahb_slv_hready_s     [0:4];
+  logic [31:0] ahb_slv_hwdata_s     [0:4];
+  logic [4:0]  ahb_slv_hreadyout_s;        // bit `n` is slave index `n`
+  logic        ahb_slv_hresp_s      [0:4];
+  logic [31:0] ahb_slv_hrdata_s     [0:4];
+  logic [2:0]  fsm_r                [0:2]; // Master FSMs
+  logic        mst_new_xfer_s       [0:2];
+  logic        mst_cont_xfer_s      [0:2];
+  logic        mst_hready_s         [0:2];
+  logic        mst_rqstate_s        [0:2];
+  logic        mst_addr_err_s       [0:2];
+  logic        mst_gnt_s            [0:2];
+  logic [4:0]  mst_sel_s            [0:2]; // bit `n` is slave index `n`
+  logic [4:0]  mst_req_s            [0:2]; // bit `n` is slave index `n`
+  logic [4:0]  mst_req_r            [0:2]; // bit `n` is slave index `n`
+  logic [4:0]  mst_keep_s           [0:2]; // bit `n` is slave index `n`
+  logic [4:0]  mst_gnt_r            [0:2]; // bit `n` is slave index `n` in data phase, switches with HREADY only
+  logic [4:0]  mst_slvgnt_s         [0:2]; // bit `n` is slave index `n`
+  logic [1:0]  mst_htrans_s         [0:2];
+  logic [1:0]  mst_htrans_r         [0:2];
+  logic [31:0] mst_haddr_s          [0:2];
+  logic [31:0] mst_haddr_r          [0:2];
+  logic        mst_hwrite_s         [0:2];
+  logic        mst_hwrite_r         [0:2];
+  logic [2:0]  mst_hsize_s          [0:2];
+  logic [2:0]  mst_hsize_r          [0:2];
+  logic [2:0]  mst_hburst_s         [0:2];
+  logic [2:0]  mst_hburst_r         [0:2];
+  logic [3:0]  mst_hprot_s          [0:2];
+  logic [3:0]  mst_hprot_r          [0:2];
+  logic        mst_hwrite_dph_r     [0:2]; // data-phase write indicator
+  logic [2:0]  slv_req_s            [0:4]; // bit `n` is the `n`-th master of the slave
+  logic [2:0]  slv_keep_s           [0:4]; // bit `n` is the `n`-th master of the slave
+  logic [2:0]  slv_dph_s            [0:4]; // bit `n` is the `n`-th master of the slave
+  logic [2:0]  slv_asel_s           [0:4]; // bit `n` is the `n`-th master of the slave
+  logic [2:0]  slv_gnt_s            [0:4]; // bit `n` is the `n`-th master of the slave
+  logic [2:0]  slv_gnt_r            [0:4]; // bit `n` is the `n`-th master of the slave
+  logic [1:0]  slv_credit_r         [0:4]; // remaining consecutive grants of the granted master
+  logic [8:0]  slv_lrg_r            [0:4]; // bit `p*3+q` with `p < q`: `p`-th master granted less recently than `q`-th master
+
+
+  // ------------------------------------------------------
+  // Connectivity:
+  //   masters `m` and slaves `s` are indexed in order of creation,
+  //   position `p` is the index of a master within the masters of a slave.
+  // ------------------------------------------------------
+  localparam logic [14:0] mst_slvmask = 15'h3DFF;     // bit `m*5+s`: master `m` accesses slave `s`
+  localparam logic [2:0]  mst_sole    = 3'h0;         // bit `m`: master `m` accesses one slave only
+  localparam logic [4:0]  slv_multi   = 5'h0F;        // bit `s`: slave `s` is accessed by multiple masters
+  localparam logic [14:0] slv_posmask = 15'h1FFF;     // bit `s*3+p`: slave `s` has a `p`-th master
+  localparam logic [29:0] slv_mstidx  = 30'h00924924; // bits `(s*3+p)*2`: index of the `p`-th master of slave `s`
+  localparam logic [9:0]  slv_arb     = 10'h0E4;      // bits `s*2`: arbitration policy of slave `s` - 0: fixed, 1: rr, 2: wrr, 3: lrg
+  localparam logic [29:0] slv_weight  = 30'h006DB6DB; // bits `(s*3+p)*2`: arbitration weight of the `p`-th master of slave `s`
+  localparam logic [29:0] mst_slvpos  = 30'h0AA15400; // bits `(m*5+s)*2`: position of master `m` at slave `s`
+
+
+  // ------------------------------------------------------
+  // Ports:
+  // ------------------------------------------------------
+  always_comb begin: proc_pack
+    ahb_mst_htrans_s[0]    = ahb_mst_cpu_htrans_i;
+    ahb_mst_haddr_s[0]     = ahb_mst_cpu_haddr_i;
+    ahb_mst_hwrite_s[0]    = ahb_mst_cpu_hwrite_i;
+    ahb_mst_hsize_s[0]     = ahb_mst_cpu_hsize_i;
+    ahb_mst_hburst_s[0]    = ahb_mst_cpu_hburst_i;
+    ahb_mst_hprot_s[0]     = ahb_mst_cpu_hprot_i;
+    ahb_mst_hwdata_s[0]    = ahb_mst_cpu_hwdata_i;
+    ahb_mst_htrans_s[1]    = ahb_mst_dsp_htrans_i;
+    ahb_mst_haddr_s[1]     = ahb_mst_dsp_haddr_i;
+    ahb_mst_hwrite_s[1]    = ahb_mst_dsp_hwrite_i;
+    ahb_mst_hsize_s[1]     = ahb_mst_dsp_hsize_i;
+    ahb_mst_hburst_s[1]    = ahb_mst_dsp_hburst_i;
+    ahb_mst_hprot_s[1]     = ahb_mst_dsp_hprot_i;
+    ahb_mst_hwdata_s[1]    = ahb_mst_dsp_hwdata_i;
+    ahb_mst_htrans_s[2]    = ahb_mst_dma_htrans_i;
+    ahb_mst_haddr_s[2]     = ahb_mst_dma_haddr_i;
+    ahb_mst_hwrite_s[2]    = ahb_mst_dma_hwrite_i;
+    ahb_mst_hsize_s[2]     = ahb_mst_dma_hsize_i;
+    ahb_mst_hburst_s[2]    = ahb_mst_dma_hburst_i;
+    ahb_mst_hprot_s[2]     = ahb_mst_dma_hprot_i;
+    ahb_mst_hwdata_s[2]    = ahb_mst_dma_hwdata_i;
+    ahb_slv_hreadyout_s[0] = ahb_slv_mem_fixed_hreadyout_i;
+    ahb_slv_hresp_s[0]     = ahb_slv_mem_fixed_hresp_i;
+    ahb_slv_hrdata_s[0]    = ahb_slv_mem_fixed_hrdata_i;
+    ahb_slv_hreadyout_s[1] = ahb_slv_mem_rr_hreadyout_i;
+    ahb_slv_hresp_s[1]     = ahb_slv_mem_rr_hresp_i;
+    ahb_slv_hrdata_s[1]    = ahb_slv_mem_rr_hrdata_i;
+    ahb_slv_hreadyout_s[2] = ahb_slv_mem_wrr_hreadyout_i;
+    ahb_slv_hresp_s[2]     = ahb_slv_mem_wrr_hresp_i;
+    ahb_slv_hrdata_s[2]    = ahb_slv_mem_wrr_hrdata_i;
+    ahb_slv_hreadyout_s[3] = ahb_slv_mem_lrg_hreadyout_i;
+    ahb_slv_hresp_s[3]     = ahb_slv_mem_lrg_hresp_i;
+    ahb_slv_hrdata_s[3]    = ahb_slv_mem_lrg_hrdata_i;
+    ahb_slv_hreadyout_s[4] = ahb_slv_periph_hreadyout_i;
+    ahb_slv_hresp_s[4]     = ahb_slv_periph_hresp_i;
+    ahb_slv_hrdata_s[4]    = ahb_slv_periph_hrdata_i;
+  end
+
+  always_comb begin: proc_unpack
+    ahb_mst_cpu_hready_o       = ahb_mst_hready_s[0];
+    ahb_mst_cpu_hresp_o        = ahb_mst_hresp_s[0];
+    ahb_mst_cpu_hrdata_o       = ahb_mst_hrdata_s[0];
+    ahb_mst_dsp_hready_o       = ahb_mst_hready_s[1];
+    ahb_mst_dsp_hresp_o        = ahb_mst_hresp_s[1];
+    ahb_mst_dsp_hrdata_o       = ahb_mst_hrdata_s[1];
+    ahb_mst_dma_hready_o       = ahb_mst_hready_s[2];
+    ahb_mst_dma_hresp_o        = ahb_mst_hresp_s[2];
+    ahb_mst_dma_hrdata_o       = ahb_mst_hrdata_s[2];
+    ahb_slv_mem_fixed_hsel_o   = ahb_slv_hsel_s[0];
+    ahb_slv_mem_fixed_haddr_o  = ahb_slv_haddr_s[0];
+    ahb_slv_mem_fixed_hwrite_o = ahb_slv_hwrite_s[0];
+    ahb_slv_mem_fixed_htrans_o = ahb_slv_htrans_s[0];
+    ahb_slv_mem_fixed_hsize_o  = ahb_slv_hsize_s[0];
+    ahb_slv_mem_fixed_hburst_o = ahb_slv_hburst_s[0];
+    ahb_slv_mem_fixed_hprot_o  = ahb_slv_hprot_s[0];
+    ahb_slv_mem_fixed_hwdata_o = ahb_slv_hwdata_s[0];
+    ahb_slv_mem_fixed_hready_o = ahb_slv_hready_s[0];
+    ahb_slv_mem_rr_hsel_o      = ahb_slv_hsel_s[1];
+    ahb_slv_mem_rr_haddr_o     = ahb_slv_haddr_s[1];
+    ahb_slv_mem_rr_hwrite_o    = ahb_slv_hwrite_s[1];
+    ahb_slv_mem_rr_htrans_o    = ahb_slv_htrans_s[1];
+    ahb_slv_mem_rr_hsize_o     = ahb_slv_hsize_s[1];
+    ahb_slv_mem_rr_hburst_o    = ahb_slv_hburst_s[1];
+    ahb_slv_mem_rr_hprot_o     = ahb_slv_hprot_s[1];
+    ahb_slv_mem_rr_hwdata_o    = ahb_slv_hwdata_s[1];
+    ahb_slv_mem_rr_hready_o    = ahb_slv_hready_s[1];
+    ahb_slv_mem_wrr_hsel_o     = ahb_slv_hsel_s[2];
+    ahb_slv_mem_wrr_haddr_o    = ahb_slv_haddr_s[2];
+    ahb_slv_mem_wrr_hwrite_o   = ahb_slv_hwrite_s[2];
+    ahb_slv_mem_wrr_htrans_o   = ahb_slv_htrans_s[2];
+    ahb_slv_mem_wrr_hsize_o    = ahb_slv_hsize_s[2];
+    ahb_slv_mem_wrr_hburst_o   = ahb_slv_hburst_s[2];
+    ahb_slv_mem_wrr_hprot_o    = ahb_slv_hprot_s[2];
+    ahb_slv_mem_wrr_hwdata_o   = ahb_slv_hwdata_s[2];
+    ahb_slv_mem_wrr_hready_o   = ahb_slv_hready_s[2];
+    ahb_slv_mem_lrg_hsel_o     = ahb_slv_hsel_s[3];
+    ahb_slv_mem_lrg_haddr_o    = ahb_slv_haddr_s[3];
+    ahb_slv_mem_lrg_hwrite_o   = ahb_slv_hwrite_s[3];
+    ahb_slv_mem_lrg_htrans_o   = ahb_slv_htrans_s[3];
+    ahb_slv_mem_lrg_hsize_o    = ahb_slv_hsize_s[3];
+    ahb_slv_mem_lrg_hburst_o   = ahb_slv_hburst_s[3];
+    ahb_slv_mem_lrg_hprot_o    = ahb_slv_hprot_s[3];
+    ahb_slv_mem_lrg_hwdata_o   = ahb_slv_hwdata_s[3];
+    ahb_slv_mem_lrg_hready_o   = ahb_slv_hready_s[3];
+    ahb_slv_periph_hsel_o      = ahb_slv_hsel_s[4];
+    ahb_slv_periph_haddr_o     = ahb_slv_haddr_s[4];
+    ahb_slv_periph_hwrite_o    = ahb_slv_hwrite_s[4];
+    ahb_slv_periph_htrans_o    = ahb_slv_htrans_s[4];
+    ahb_slv_periph_hsize_o     = ahb_slv_hsize_s[4];
+    ahb_slv_periph_hburst_o    = ahb_slv_hburst_s[4];
+    ahb_slv_periph_hprot_o     = ahb_slv_hprot_s[4];
+    ahb_slv_periph_hwdata_o    = ahb_slv_hwdata_s[4];
+    ahb_slv_periph_hready_o    = ahb_slv_hready_s[4];
+  end
+
+
+  // ------------------------------------------------------
+  // The Masters:
+  // ------------------------------------------------------
+  // Master 'cpu' Address Decoding
+  always_comb begin: proc_cpu_dec
+    mst_addr_err_s[0] = 1'b0;
+    mst_sel_s[0] = 5'h00;
+
+    casez (ahb_mst_cpu_haddr_i[31:12])
+      20'b00000000000000000000: begin // mem_fixed
+        mst_sel_s[0][0] = 1'b1;
+      end
+
+      20'b00000000000000000001: begin // mem_rr
+        mst_sel_s[0][1] = 1'b1;
+      end
+
+      20'b00000000000000000010: begin // mem_wrr
+        mst_sel_s[0][2] = 1'b1;
+      end
+
+      20'b00000000000000000011: begin // mem_lrg
+        mst_sel_s[0][3] = 1'b1;
+      end
+
+      20'b00000000000000000100: begin // periph
+        mst_sel_s[0][4] = 1'b1;
+      end
+
+      default: begin
+        mst_addr_err_s[0] = mst_new_xfer_s[0];
+      end
+    endcase
+  end
+
+  // Master 'dsp' Address Decoding
+  always_comb begin: proc_dsp_dec
+    mst_addr_err_s[1] = 1'b0;
+    mst_sel_s[1] = 5'h00;
+
+    casez (ahb_mst_dsp_haddr_i[31:12])
+      20'b00000000000000000000: begin // mem_fixed
+        mst_sel_s[1][0] = 1'b1;
+      end
+
+      20'b00000000000000000001: begin // mem_rr
+        mst_sel_s[1][1] = 1'b1;
+      end
+
+      20'b00000000000000000010: begin // mem_wrr
+        mst_sel_s[1][2] = 1'b1;
+      end
+
+      20'b00000000000000000011: begin // mem_lrg
+        mst_sel_s[1][3] = 1'b1;
+      end
+
+      default: begin
+        mst_addr_err_s[1] = mst_new_xfer_s[1];
+      end
+    endcase
+  end
+
+  // Master 'dma' Address Decoding
+  always_comb begin: proc_dma_dec
+    mst_addr_err_s[2] = 1'b0;
+    mst_sel_s[2] = 5'h00;
+
+    casez (ahb_mst_dma_haddr_i[31:12])
+      20'b00000000000000000000: begin // mem_fixed
+        mst_sel_s[2][0] = 1'b1;
+      end
+
+      20'b00000000000000000001: begin // mem_rr
+        mst_sel_s[2][1] = 1'b1;
+      end
+
+      20'b00000000000000000010: begin // mem_wrr
+        mst_sel_s[2][2] = 1'b1;
+      end
+
+      20'b00000000000000000011: begin // mem_lrg
+        mst_sel_s[2][3] = 1'b1;
+      end
+
+      default: begin
+        mst_addr_err_s[2] = mst_new_xfer_s[2];
+      end
+    endcase
+  end
+
+  for (genvar m = 0; m < 3; m++) begin: g_mst
+
+    always_comb begin: proc_logic
+      mst_new_xfer_s[m]  = (ahb_mst_htrans_s[m] == ahb_trans_nonseq_e) ? 1'b1 : 1'b0;
+      mst_cont_xfer_s[m] = ((ahb_mst_htrans_s[m] == ahb_trans_busy_e) ||
+                            (ahb_mst_htrans_s[m] == ahb_trans_seq_e)) ? 1'b1 : 1'b0;
+      mst_rqstate_s[m]   = ((fsm_r[m] == fsm_idle_st) ||
+                            (fsm_r[m] == fsm_transfer_st) ||
+                            (fsm_r[m] == fsm_transfer_finish_st) ||
+                            (fsm_r[m] == fsm_error2_st)) ? 1'b1 : 1'b0;
+
+      // another slave is requested with the end of the current data phase only
+      mst_req_s[m]  = (mst_sel_s[m] & {5{mst_new_xfer_s[m] & mst_rqstate_s[m]}} & ({5{mst_hready_s[m]}} | mst_gnt_r[m])) |
+                      mst_req_r[m];
+      mst_keep_s[m] = mst_gnt_r[m] & {5{mst_cont_xfer_s[m]}} & slv_multi;
+    end
+
+    // Grant Combination
+    always_comb begin: proc_gnt
+      integer s;
+      for (s = 0; s < 5; s = s + 1) begin
+        mst_slvgnt_s[m][s] = mst_slvmask[m*5+s] & slv_gnt_s[s][mst_slvpos[(m*5+s)*2 +: 2]];
+      end
+      mst_gnt_s[m] = |mst_slvgnt_s[m];
+    end
+
+    // FSM
+    always_ff @(posedge main_clk_i or negedge main_rst_an_i) begin: proc_fsm
+      if (main_rst_an_i == 1'b0) begin
+        fsm_r[m] <= fsm_idle_st;
+        mst_gnt_r[m] <= 5'h00;
+      end else begin
+        case (fsm_r[m])
+          fsm_idle_st: begin
+            if (mst_new_xfer_s[m] == 1'b1) begin
+              if (mst_addr_err_s[m] == 1'b1) begin
+                fsm_r[m] <= fsm_error1_st;
+              end else if (mst_gnt_s[m] == 1'b1) begin
+                mst_req_r[m] <= 5'h00;
+                fsm_r[m] <= fsm_transfer_st;
+              end else begin
+                mst_req_r[m] <= mst_sel_s[m];
+                fsm_r[m] <= fsm_transfer_wait_st;
+              end
+              mst_gnt_r[m] <= mst_slvgnt_s[m];
+            end
+          end
+
+          fsm_error0_st: begin
+            if (mst_hready_s[m] == 1'b1) begin
+              mst_gnt_r[m] <= 5'h00;
+              fsm_r[m] <= fsm_error1_st;
+            end
+          end
+
+          fsm_error1_st: begin
+            fsm_r[m] <= fsm_error2_st;
+          end
+
+          fsm_error2_st: begin
+            if (mst_new_xfer_s[m] == 1'b1) begin
+              if (mst_addr_err_s[m] == 1'b1) begin
+                fsm_r[m] <= fsm_error1_st;
+              end else if (mst_gnt_s[m] == 1'b1) begin
+                mst_req_r[m] <= 5'h00;
+                fsm_r[m] <= fsm_transfer_st;
+              end else begin
+                mst_req_r[m] <= mst_sel_s[m];
+                fsm_r[m] <= fsm_transfer_wait_st;
+              end
+              mst_gnt_r[m] <= mst_slvgnt_s[m];
+            end else begin
+              fsm_r[m] <= fsm_idle_st;
+            end
+          end
+
+          fsm_transfer_st: begin
+            if ((ahb_mst_htrans_s[m] == ahb_trans_seq_e) ||
+                (ahb_mst_htrans_s[m] == ahb_trans_busy_e)) begin
+              fsm_r[m] <= fsm_transfer_st;
+            end else begin
+              if (ahb_mst_htrans_s[m] == ahb_trans_idle_e) begin
+                if (mst_hready_s[m] == 1'b0) begin
+                  fsm_r[m] <= fsm_transfer_finish_st;
+                end else begin
+                  mst_gnt_r[m] <= 5'h00;
+                  fsm_r[m] <= fsm_idle_st;
+                end
+              end else begin // (ahb_mst_htrans_s[m] == ahb_trans_nonseq_e)
+                if (mst_hready_s[m] == 1'b1) begin // address phase ends with the current data phase
+                  if (mst_addr_err_s[m] == 1'b1) begin
+                    fsm_r[m] <= fsm_error1_st;
+                  end else if (mst_gnt_s[m] == 1'b1) begin
+                    mst_req_r[m] <= 5'h00;
+                    fsm_r[m] <= fsm_transfer_st;
+                  end else begin
+                    mst_req_r[m] <= mst_sel_s[m];
+                    fsm_r[m] <= fsm_transfer_wait_st;
+                  end
+                  mst_gnt_r[m] <= mst_slvgnt_s[m];
+                end else if (mst_addr_err_s[m] == 1'b1) begin // the data phase continues
+                  fsm_r[m] <= fsm_error0_st;
+                end
+              end
+            end
+          end
+
+          fsm_transfer_wait_st: begin
+            if (mst_gnt_s[m] == 1'b1) begin
+              mst_req_r[m] <= 5'h00;
+              mst_gnt_r[m] <= mst_slvgnt_s[m];
+              fsm_r[m] <= fsm_transfer_st;
+            end
+          end
+
+          fsm_transfer_finish_st: begin
+            if (mst_hready_s[m] == 1'b1) begin
+              if (mst_new_xfer_s[m] == 1'b1) begin
+                if (mst_addr_err_s[m] == 1'b1) begin
+                  fsm_r[m] <= fsm_error1_st;
+                end else if (mst_gnt_s[m] == 1'b1) begin
+                  mst_req_r[m] <= 5'h00;
+                  fsm_r[m] <= fsm_transfer_st;
+                end else begin
+                  mst_req_r[m] <= mst_sel_s[m];
+                  fsm_r[m] <= fsm_transfer_wait_st;
+                end
+                mst_gnt_r[m] <= mst_slvgnt_s[m];
+              end else begin
+                mst_gnt_r[m] <= 5'h00;
+                fsm_r[m] <= fsm_idle_st;
+              end
+            end
+          end
+
+          default: begin
+            mst_gnt_r[m] <= 5'h00;
+            mst_req_r[m] <= 5'h00;
+            fsm_r[m] <= fsm_idle_st;
+          end
+        endcase
+      end
+
+      if ((mst_new_xfer_s[m] == 1'b1) && (mst_gnt_s[m] == 1'b0) && (mst_rqstate_s[m] == 1'b1)) begin
+        mst_htrans_r[m] <= ahb_mst_htrans_s[m];
+        mst_haddr_r[m] <= ahb_mst_haddr_s[m];
+        mst_hwrite_r[m] <= ahb_mst_hwrite_s[m];
+        mst_hsize_r[m] <= ahb_mst_hsize_s[m];
+        mst_hburst_r[m] <= ahb_mst_hburst_s[m];
+        mst_hprot_r[m] <= ahb_mst_hprot_s[m];
+      end
+
+      if (mst_hready_s[m] == 1'b1) begin  // the address phase ends with the current data phase
+        mst_hwrite_dph_r[m] <= mst_hwrite_s[m];
+      end
+    end
+
+    // Mux
+    always_comb begin: proc_mux
+      if (fsm_r[m] == fsm_transfer_wait_st) begin
+        mst_htrans_s[m] = mst_htrans_r[m];
+        mst_haddr_s[m] = mst_haddr_r[m];
+        mst_hwrite_s[m] = mst_hwrite_r[m];
+        mst_hsize_s[m] = mst_hsize_r[m];
+        mst_hburst_s[m] = mst_hburst_r[m];
+        mst_hprot_s[m] = mst_hprot_r[m];
+      end else begin
+        mst_htrans_s[m] = ahb_mst_htrans_s[m];
+        mst_haddr_s[m] = ahb_mst_haddr_s[m];
+        mst_hwrite_s[m] = ahb_mst_hwrite_s[m];
+        mst_hsize_s[m] = ahb_mst_hsize_s[m];
+        mst_hburst_s[m] = ahb_mst_hburst_s[m];
+        mst_hprot_s[m] = ahb_mst_hprot_s[m];
+      end
+
+      mst_hready_s[m] = (|(ahb_slv_hreadyout_s & mst_gnt_r[m])) | ~(|mst_gnt_r[m]);
+    end
+
+    // Response
+    always_comb begin: proc_rsp
+      integer s;
+      logic [4:0] rsp_sel_s;
+      logic rsp_vld_s;
+      logic [2:0] rsp_idx_s;
+
+      rsp_sel_s = (mst_sole[m] == 1'b1) ? mst_slvmask[m*5 +: 5] : mst_gnt_r[m];
+      rsp_vld_s = (rsp_sel_s != 5'h00) && ((rsp_sel_s & (rsp_sel_s - 1'b1)) == 5'h00);
+      rsp_idx_s = 3'h0;
+      for (s = 0; s < 5; s = s + 1) begin
+        if (rsp_sel_s[s] == 1'b1) begin
+          rsp_idx_s = s[2:0];
+        end
+      end
+
+      ahb_mst_hrdata_s[m] = 32'h00000000;
+      ahb_mst_hready_s[m] = 1'b1;
+      ahb_mst_hresp_s[m]  = ahb_resp_okay_e;
+      case (fsm_r[m])
+        fsm_transfer_wait_st: begin
+          ahb_mst_hready_s[m] = 1'b0;
+        end
+
+        fsm_error1_st: begin
+          ahb_mst_hready_s[m] = 1'b0;
+          ahb_mst_hresp_s[m]  = ahb_resp_error_e;
+        end
+
+        fsm_error2_st: begin
+          ahb_mst_hresp_s[m]  = ahb_resp_error_e;
+        end
+
+        fsm_error0_st, fsm_transfer_st, fsm_transfer_finish_st: begin
+          if (rsp_vld_s == 1'b1) begin
+            if ((mst_hwrite_dph_r[m] == 1'b0) || (fsm_r[m] == fsm_transfer_finish_st)) begin
+              ahb_mst_hrdata_s[m] = ahb_slv_hrdata_s[rsp_idx_s];
+            end
+            ahb_mst_hready_s[m] = ahb_slv_hreadyout_s[rsp_idx_s];
+            ahb_mst_hresp_s[m]  = ahb_slv_hresp_s[rsp_idx_s];
+          end
+        end
+
+        default: begin
+        end
+      endcase
+    end
+
+  end
+
+
+  // ------------------------------------------------------
+  // The Slaves:
+  // ------------------------------------------------------
+  for (genvar s = 0; s < 5; s++) begin: g_slv
+
+    // Masters in Order of Position
+    always_comb begin: proc_pos
+      integer p;
+      logic [1:0] mst_idx_s;
+      for (p = 0; p < 3; p = p + 1) begin
+        mst_idx_s = slv_mstidx[(s*3+p)*2 +: 2];
+        slv_req_s[s][p]  = slv_posmask[s*3+p] & mst_req_s[mst_idx_s][s];
+        slv_keep_s[s][p] = slv_posmask[s*3+p] & mst_keep_s[mst_idx_s][s];
+        slv_dph_s[s][p]  = slv_posmask[s*3+p] & mst_gnt_r[mst_idx_s][s];
+      end
+    end
+
+    if (slv_multi[s] == 1'b1) begin: g_arb
+
+      if (slv_arb[s*2 +: 2] == 2'd0) begin: g_fixed
+        // Fixed-Priority Arbiter
+        always_comb begin: proc_fixed_arb
+          integer p;
+          logic found_s;
+          logic [2:0] next_grant_s;
+          logic [1:0] weight_s;
+          logic arb_en_s;
+
+          arb_en_s = ~(|slv_keep_s[s]);
+
+          next_grant_s = 3'h0;
+          weight_s = 2'h0;
+          found_s = 1'b0;
+          for (p = 0; p < 3; p = p + 1) begin
+            if ((slv_req_s[s][p] == 1'b1) && ((found_s == 1'b0) || (slv_weight[(s*3+p)*2 +: 2] > weight_s))) begin
+              found_s = 1'b1;
+              weight_s = slv_weight[(s*3+p)*2 +: 2];
+              next_grant_s = 3'h0;
+              next_grant_s[p] = 1'b1;
+            end
+          end
+
+          slv_gnt_s[s] = next_grant_s & {3{(ahb_slv_hreadyout_s[s] & arb_en_s)}};
+          slv_asel_s[s] = slv_gnt_s[s] | (slv_keep_s[s] & slv_dph_s[s]);
+          ahb_slv_hsel_s[s] = |slv_asel_s[s];
+        end
+      end else if (slv_arb[s*2 +: 2] == 2'd1) begin: g_rr
+        // Round-Robin Arbiter
+        always_comb begin: proc_rr_arb
+          integer i;
+          logic found_s;
+          logic [2:0] next_grant_s;
+          logic arb_en_s;
+
+          arb_en_s = ~(|slv_keep_s[s]);
+
+          next_grant_s = {slv_gnt_r[s][0], slv_gnt_r[s][2:1]}; // 1st candidate is old grant rotated 1 right
+          found_s = 1'b0;
+          for (i=0; i<3; i=i+1) begin
+            if (found_s == 1'b0) begin
+              if ((slv_req_s[s] & next_grant_s) != 3'h0) begin
+                found_s = 1'b1;
+              end else begin
+                next_grant_s = {next_grant_s[0], next_grant_s[2:1]}; // rotate 1 right
+              end
+            end
+          end
+
+          slv_gnt_s[s] = slv_req_s[s] & next_grant_s & {3{(ahb_slv_hreadyout_s[s] & arb_en_s)}};
+          slv_asel_s[s] = slv_gnt_s[s] | (slv_keep_s[s] & slv_dph_s[s]);
+          ahb_slv_hsel_s[s] = |slv_asel_s[s];
+        end
+
+        always_ff @(posedge main_clk_i or negedge main_rst_an_i) begin: proc_gnt
+          if (main_rst_an_i == 1'b0) begin
+            slv_gnt_r[s] <= 3'h1;  // initial pseudo-grant
+          end else begin
+            if (slv_gnt_s[s] != 3'h0) begin
+              slv_gnt_r[s] <= slv_gnt_s[s];
+            end
+          end
+        end
+      end else if (slv_arb[s*2 +: 2] == 2'd2) begin: g_wrr
+        // Weighted Round-Robin Arbiter
+        always_comb begin: proc_wrr_arb
+          integer i;
+          logic found_s;
+          logic [2:0] next_grant_s;
+          logic arb_en_s;
+
+          arb_en_s = ~(|slv_keep_s[s]);
+
+          next_grant_s = {slv_gnt_r[s][0], slv_gnt_r[s][2:1]}; // 1st candidate is old grant rotated 1 right
+          found_s = 1'b0;
+          for (i=0; i<3; i=i+1) begin
+            if (found_s == 1'b0) begin
+              if ((slv_req_s[s] & next_grant_s) != 3'h0) begin
+                found_s = 1'b1;
+              end else begin
+                next_grant_s = {next_grant_s[0], next_grant_s[2:1]}; // rotate 1 right
+              end
+            end
+          end
+          if (((slv_req_s[s] & slv_gnt_r[s]) != 3'h0) && (slv_credit_r[s] != 2'h0)) begin
+            next_grant_s = slv_gnt_r[s]; // old grant has consecutive grants left
+          end
+
+          slv_gnt_s[s] = slv_req_s[s] & next_grant_s & {3{(ahb_slv_hreadyout_s[s] & arb_en_s)}};
+          slv_asel_s[s] = slv_gnt_s[s] | (slv_keep_s[s] & slv_dph_s[s]);
+          ahb_slv_hsel_s[s] = |slv_asel_s[s];
+        end
+
+        always_ff @(posedge main_clk_i or negedge main_rst_an_i) begin: proc_gnt
+          integer p;
+          if (main_rst_an_i == 1'b0) begin
+            slv_gnt_r[s] <= 3'h1;  // initial pseudo-grant
+            slv_credit_r[s] <= 2'h0;
+          end else begin
+            if (slv_gnt_s[s] != 3'h0) begin
+              slv_gnt_r[s] <= slv_gnt_s[s];
+              if (((slv_gnt_s[s] & slv_gnt_r[s]) != 3'h0) && (slv_credit_r[s] != 2'h0)) begin
+                slv_credit_r[s] <= slv_credit_r[s] - 1'b1;
+              end else begin
+                for (p = 0; p < 3; p = p + 1) begin
+                  if (slv_gnt_s[s][p] == 1'b1) begin
+                    slv_credit_r[s] <= slv_weight[(s*3+p)*2 +: 2] - 1'b1;
+                  end
+                end
+              end
+            end
+          end
+        end
+      end else if (slv_arb[s*2 +: 2] == 2'd3) begin: g_lrg
+        // Least-Recently-Granted Arbiter
+        always_comb begin: proc_lrg_arb
+          integer p;
+          integer q;
+          logic arb_en_s;
+
+          arb_en_s = ~(|slv_keep_s[s]);
+
+          for (p = 0; p < 3; p = p + 1) begin
+            slv_gnt_s[s][p] = slv_req_s[s][p] & ahb_slv_hreadyout_s[s] & arb_en_s;
+            for (q = 0; q < 3; q = q + 1) begin
+              if ((q < p) && (slv_req_s[s][q] == 1'b1) && (slv_lrg_r[s][q*3+p] == 1'b1)) begin
+                slv_gnt_s[s][p] = 1'b0; // q-th master granted less recently
+              end
+              if ((q > p) && (slv_req_s[s][q] == 1'b1) && (slv_lrg_r[s][p*3+q] == 1'b0)) begin
+                slv_gnt_s[s][p] = 1'b0; // q-th master granted less recently
+              end
+            end
+          end
+          slv_asel_s[s] = slv_gnt_s[s] | (slv_keep_s[s] & slv_dph_s[s]);
+          ahb_slv_hsel_s[s] = |slv_asel_s[s];
+        end
+
+        always_ff @(posedge main_clk_i or negedge main_rst_an_i) begin: proc_lrg
+          integer p;
+          integer q;
+          if (main_rst_an_i == 1'b0) begin
+            slv_lrg_r[s] <= 9'h026;  // initial order of masters
+          end else begin
+            for (p = 0; p < 3; p = p + 1) begin
+              for (q = p + 1; q < 3; q = q + 1) begin
+                slv_lrg_r[s][p*3+q] <= (slv_lrg_r[s][p*3+q] & ~slv_gnt_s[s][p]) | slv_gnt_s[s][q];
+              end
+            end
+          end
+        end
+      end
+
+    // Address Phase Mux
+    always_comb begin: proc_aph_mux
+      integer p;
+      logic aph_vld_s;
+      logic [1:0] aph_idx_s;
+
+      aph_vld_s = (slv_asel_s[s] != 3'h0) && ((slv_asel_s[s] & (slv_asel_s[s] - 1'b1)) == 3'h0);
+      aph_idx_s = 2'h0;
+      for (p = 0; p < 3; p = p + 1) begin
+        if (slv_asel_s[s][p] == 1'b1) begin
+          aph_idx_s = slv_mstidx[(s*3+p)*2 +: 2];
+        end
+      end
+
+      if (aph_vld_s == 1'b1) begin
+        ahb_slv_htrans_s[s] = mst_htrans_s[aph_idx_s];
+        ahb_slv_haddr_s[s] = mst_haddr_s[aph_idx_s];
+        ahb_slv_hwrite_s[s] = mst_hwrite_s[aph_idx_s];
+        ahb_slv_hsize_s[s] = mst_hsize_s[aph_idx_s];
+        ahb_slv_hburst_s[s] = mst_hburst_s[aph_idx_s];
+        ahb_slv_hprot_s[s] = mst_hprot_s[aph_idx_s];
+        ahb_slv_hready_s[s] = mst_hready_s[aph_idx_s];
+      end else begin
+        ahb_slv_htrans_s[s] = ahb_trans_idle_e;
+        ahb_slv_haddr_s[s] = 32'h00000000;
+        ahb_slv_hwrite_s[s] = ahb_write_read_e;
+        ahb_slv_hsize_s[s] = ahb_size_word_e;
+        ahb_slv_hburst_s[s] = ahb_burst_single_e;
+        ahb_slv_hprot_s[s] = 4'h3;
+        ahb_slv_hready_s[s] = ahb_slv_hreadyout_s[s];
+      end
+    end
+
+    end else begin: g_sole
+      // No Arbitration Necessary
+      always_comb begin: proc_asgn
+        slv_gnt_s[s] = slv_req_s[s];
+        slv_asel_s[s] = 3'h0;
+        slv_asel_s[s][0] = mst_sel_s[slv_mstidx[s*3*2 +: 2]][s];
+        ahb_slv_hsel_s[s] = slv_req_s[s][0] | (slv_dph_s[s][0] & mst_cont_xfer_s[slv_mstidx[s*3*2 +: 2]]);
+      end
+
+    // Address Phase Mux
+    always_comb begin: proc_aph_mux
+      integer p;
+      logic aph_vld_s;
+      logic [1:0] aph_idx_s;
+
+      aph_vld_s = (slv_asel_s[s] != 3'h0) && ((slv_asel_s[s] & (slv_asel_s[s] - 1'b1)) == 3'h0);
+      aph_idx_s = 2'h0;
+      for (p = 0; p < 3; p = p + 1) begin
+        if (slv_asel_s[s][p] == 1'b1) begin
+          aph_idx_s = slv_mstidx[(s*3+p)*2 +: 2];
+        end
+      end
+
+      if (aph_vld_s == 1'b1) begin
+        ahb_slv_htrans_s[s] = ahb_mst_htrans_s[aph_idx_s];
+        ahb_slv_haddr_s[s] = ahb_mst_haddr_s[aph_idx_s];
+        ahb_slv_hwrite_s[s] = ahb_mst_hwrite_s[aph_idx_s];
+        ahb_slv_hsize_s[s] = ahb_mst_hsize_s[aph_idx_s];
+        ahb_slv_hburst_s[s] = ahb_mst_hburst_s[aph_idx_s];
+        ahb_slv_hprot_s[s] = ahb_mst_hprot_s[aph_idx_s];
+        ahb_slv_hready_s[s] = mst_hready_s[aph_idx_s];
+      end else begin
+        ahb_slv_htrans_s[s] = ahb_trans_idle_e;
+        ahb_slv_haddr_s[s] = 32'h00000000;
+        ahb_slv_hwrite_s[s] = ahb_write_read_e;
+        ahb_slv_hsize_s[s] = ahb_size_word_e;
+        ahb_slv_hburst_s[s] = ahb_burst_single_e;
+        ahb_slv_hprot_s[s] = 4'h3;
+        ahb_slv_hready_s[s] = ahb_slv_hreadyout_s[s];
+      end
+    end
+
+    end
+
+    // Data Phase Mux
+    always_comb begin: proc_dph_mux
+      integer p;
+      logic dph_vld_s;
+      logic [1:0] dph_idx_s;
+
+      dph_vld_s = (slv_dph_s[s] != 3'h0) && ((slv_dph_s[s] & (slv_dph_s[s] - 1'b1)) == 3'h0);
+      dph_idx_s = 2'h0;
+      for (p = 0; p < 3; p = p + 1) begin
+        if (slv_dph_s[s][p] == 1'b1) begin
+          dph_idx_s = slv_mstidx[(s*3+p)*2 +: 2];
+        end
+      end
+
+      if (dph_vld_s == 1'b1) begin
+        ahb_slv_hwdata_s[s] = ahb_mst_hwdata_s[dph_idx_s];
+      end else begin
+        ahb_slv_hwdata_s[s] = 32'h00000000;
+      end
+    end
+
+  end
+
+endmodule // ucdp_ahb_ml_arb_example_ml
+
+`default_nettype wire
+`end_keywords
+
+// =============================================================================
+//
+//   @generated @fully-generated
+//
+//   THIS FILE IS GENERATED!!! DO NOT EDIT MANUALLY. CHANGES ARE LOST.
+//
+// =============================================================================
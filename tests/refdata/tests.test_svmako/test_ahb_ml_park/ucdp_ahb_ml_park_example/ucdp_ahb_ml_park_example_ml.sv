@@ -0,0 +1,1632 @@
+// =============================================================================
+//
+//   @generated @fully-generated
+//
+//   THIS FILE IS GENERATED!!! DO NOT EDIT MANUALLY. CHANGES ARE LOST.
+//
+// =============================================================================
+//
+//  MIT License
+//
+//  Copyright (c) 2024-2025 nbiotcloud
+//
+//  Permission is hereby granted, free of charge, to any person obtaining a copy
+//  of this software and associated documentation files (the "Software"), to deal
+//  in the Software without restriction, including without limitation the rights
+//  to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+//  copies of the Software, and to permit persons to whom the Software is
+//  furnished to do so, subject to the following conditions:
+//
+//  The above copyright notice and this permission notice shall be included in all
+//  copies or substantial portions of the Software.
+//
+//  THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+//  IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+//  FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+//  AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+//  LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+//  OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+//  SOFTWARE.
+//
+// =============================================================================
+//
+// Module:     ucdp_amba.ucdp_ahb_ml_park_example_ml
+// Data Model: ucdp_amba.ucdp_ahb_ml.UcdpAhbMlMod
+//
+//
+// | Master > Slave | mem | rom | io | sram |
+// | -------------- | --- | --- | -- | ---- |
+// | cpu            | X   | X   |    |      |
+// | dsp            | X   | X   | X  |      |
+// | dma            | X   |     | X  | X    |
+//
+//
+//
+// * Top:     `None`
+// * Defines: `None`
+// * Size:    `16 KB`
+//
+// | Addrspace | Type  | Base     | Size             | Infos | Attributes |
+// | --------- | ----- | -------- | ---------------- | ----- | ---------- |
+// | mem       | Slave | `0x0`    | `1024x32 (4 KB)` |       |            |
+// | rom       | Slave | `0x1000` | `1024x32 (4 KB)` |       |            |
+// | io        | Slave | `0x2000` | `1024x32 (4 KB)` |       |            |
+// | sram      | Slave | `0x3000` | `1024x32 (4 KB)` |       |            |
+//
+// =============================================================================
+
+`begin_keywords "1800-2009"
+`default_nettype none  // implicit wires are forbidden
+
+module ucdp_ahb_ml_park_example_ml ( // ucdp_amba.ucdp_ahb_ml.UcdpAhbMlMod
+  // main_i: Clock and Reset
+  input  wire         main_clk_i,               // Clock
+  input  wire         main_rst_an_i,            // Async Reset (Low-Active)
+  // ahb_mst_cpu_i: AHB Input 'cpu'
+  input  wire  [1:0]  ahb_mst_cpu_htrans_i,     // AHB Transfer Type
+  input  wire  [31:0] ahb_mst_cpu_haddr_i,      // AHB Bus Address
+  input  wire         ahb_mst_cpu_hwrite_i,     // AHB Write Enable
+  input  wire  [2:0]  ahb_mst_cpu_hsize_i,      // AHB Size
+  input  wire  [2:0]  ahb_mst_cpu_hburst_i,     // AHB Burst Type
+  input  wire  [3:0]  ahb_mst_cpu_hprot_i,      // AHB Transfer Protection
+  input  wire  [31:0] ahb_mst_cpu_hwdata_i,     // AHB Data
+  output logic        ahb_mst_cpu_hready_o,     // AHB Transfer Done
+  output logic        ahb_mst_cpu_hresp_o,      // AHB Response Error
+  output logic [31:0] ahb_mst_cpu_hrdata_o,     // AHB Data
+  // ahb_mst_dsp_i: AHB Input 'dsp'
+  input  wire  [1:0]  ahb_mst_dsp_htrans_i,     // AHB Transfer Type
+  input  wire  [31:0] ahb_mst_dsp_haddr_i,      // AHB Bus Address
+  input  wire         ahb_mst_dsp_hwrite_i,     // AHB Write Enable
+  input  wire  [2:0]  ahb_mst_dsp_hsize_i,      // AHB Size
+  input  wire  [2:0]  ahb_mst_dsp_hburst_i,     // AHB Burst Type
+  input  wire  [3:0]  ahb_mst_dsp_hprot_i,      // AHB Transfer Protection
+  input  wire  [31:0] ahb_mst_dsp_hwdata_i,     // AHB Data
+  output logic        ahb_mst_dsp_hready_o,     // AHB Transfer Done
+  output logic        ahb_mst_dsp_hresp_o,      // AHB Response Error
+  output logic [31:0] ahb_mst_dsp_hrdata_o,     // AHB Data
+  // ahb_mst_dma_i: AHB Input 'dma'
+  input  wire  [1:0]  ahb_mst_dma_htrans_i,     // AHB Transfer Type
+  input  wire  [31:0] ahb_mst_dma_haddr_i,      // AHB Bus Address
+  input  wire         ahb_mst_dma_hwrite_i,     // AHB Write Enable
+  input  wire  [2:0]  ahb_mst_dma_hsize_i,      // AHB Size
+  input  wire  [2:0]  ahb_mst_dma_hburst_i,     // AHB Burst Type
+  input  wire  [3:0]  ahb_mst_dma_hprot_i,      // AHB Transfer Protection
+  input  wire  [31:0] ahb_mst_dma_hwdata_i,     // AHB Data
+  output logic        ahb_mst_dma_hready_o,     // AHB Transfer Done
+  output logic        ahb_mst_dma_hresp_o,      // AHB Response Error
+  output logic [31:0] ahb_mst_dma_hrdata_o,     // AHB Data
+  // ahb_slv_mem_o: AHB Output 'mem'
+  output logic        ahb_slv_mem_hsel_o,       // AHB Slave Select
+  output logic [31:0] ahb_slv_mem_haddr_o,      // AHB Bus Address
+  output logic        ahb_slv_mem_hwrite_o,     // AHB Write Enable
+  output logic [1:0]  ahb_slv_mem_htrans_o,     // AHB Transfer Type
+  output logic [2:0]  ahb_slv_mem_hsize_o,      // AHB Size
+  output logic [2:0]  ahb_slv_mem_hburst_o,     // AHB Burst Type
+  output logic [3:0]  ahb_slv_mem_hprot_o,      // AHB Transfer Protection
+  output logic [31:0] ahb_slv_mem_hwdata_o,     // AHB Data
+  output logic        ahb_slv_mem_hready_o,     // AHB Transfer Done to Slave
+  input  wire         ahb_slv_mem_hreadyout_i,  // AHB Transfer Done from Slave
+  input  wire         ahb_slv_mem_hresp_i,      // AHB Response Error
+  input  wire  [31:0] ahb_slv_mem_hrdata_i,     // AHB Data
+  // ahb_slv_rom_o: AHB Output 'rom'
+  output logic        ahb_slv_rom_hsel_o,       // AHB Slave Select
+  output logic [31:0] ahb_slv_rom_haddr_o,      // AHB Bus Address
+  output logic        ahb_slv_rom_hwrite_o,     // AHB Write Enable
+  output logic [1:0]  ahb_slv_rom_htrans_o,     // AHB Transfer Type
+  output logic [2:0]  ahb_slv_rom_hsize_o,      // AHB Size
+  output logic [2:0]  ahb_slv_rom_hburst_o,     // AHB Burst Type
+  output logic [3:0]  ahb_slv_rom_hprot_o,      // AHB Transfer Protection
+  output logic [31:0] ahb_slv_rom_hwdata_o,     // AHB Data
+  output logic        ahb_slv_rom_hready_o,     // AHB Transfer Done to Slave
+  input  wire         ahb_slv_rom_hreadyout_i,  // AHB Transfer Done from Slave
+  input  wire         ahb_slv_rom_hresp_i,      // AHB Response Error
+  input  wire  [31:0] ahb_slv_rom_hrdata_i,     // AHB Data
+  // ahb_slv_io_o: AHB Output 'io'
+  output logic        ahb_slv_io_hsel_o,        // AHB Slave Select
+  output logic [31:0] ahb_slv_io_haddr_o,       // AHB Bus Address
+  output logic        ahb_slv_io_hwrite_o,      // AHB Write Enable
+  output logic [1:0]  ahb_slv_io_htrans_o,      // AHB Transfer Type
+  output logic [2:0]  ahb_slv_io_hsize_o,       // AHB Size
+  output logic [2:0]  ahb_slv_io_hburst_o,      // AHB Burst Type
+  output logic [3:0]  ahb_slv_io_hprot_o,       // AHB Transfer Protection
+  output logic [31:0] ahb_slv_io_hwdata_o,      // AHB Data
+  output logic        ahb_slv_io_hready_o,      // AHB Transfer Done to Slave
+  input  wire         ahb_slv_io_hreadyout_i,   // AHB Transfer Done from Slave
+  input  wire         ahb_slv_io_hresp_i,       // AHB Response Error
+  input  wire  [31:0] ahb_slv_io_hrdata_i,      // AHB Data
+  // ahb_slv_sram_o: AHB Output 'sram'
+  output logic        ahb_slv_sram_hsel_o,      // AHB Slave Select
+  output logic [31:0] ahb_slv_sram_haddr_o,     // AHB Bus Address
+  output logic        ahb_slv_sram_hwrite_o,    // AHB Write Enable
+  output logic [1:0]  ahb_slv_sram_htrans_o,    // AHB Transfer Type
+  output logic [2:0]  ahb_slv_sram_hsize_o,     // AHB Size
+  output logic [2:0]  ahb_slv_sram_hburst_o,    // AHB Burst Type
+  output logic [3:0]  ahb_slv_sram_hprot_o,     // AHB Transfer Protection
+  output logic [31:0] ahb_slv_sram_hwdata_o,    // AHB Data
+  output logic        ahb_slv_sram_hready_o,    // AHB Transfer Done to Slave
+  input  wire         ahb_slv_sram_hreadyout_i, // AHB Transfer Done from Slave
+  input  wire         ahb_slv_sram_hresp_i,     // AHB Response Error
+  input  wire  [31:0] ahb_slv_sram_hrdata_i     // AHB Data
+);
+
+
+
+
+  // ------------------------------------------------------
+  //  Local Parameter
+  // ------------------------------------------------------
+  // ahb_trans
+  localparam integer       ahb_trans_width_p      = 2;    // Width in Bits
+  localparam logic   [1:0] ahb_trans_min_p        = 2'h0; // AHB Transfer Type
+  localparam logic   [1:0] ahb_trans_max_p        = 2'h3; // AHB Transfer Type
+  localparam logic   [1:0] ahb_trans_idle_e       = 2'h0; // No transfer
+  localparam logic   [1:0] ahb_trans_busy_e       = 2'h1; // Idle cycle within transfer
+  localparam logic   [1:0] ahb_trans_nonseq_e     = 2'h2; // Single transfer or first transfer of a burst
+  localparam logic   [1:0] ahb_trans_seq_e        = 2'h3; // Consecutive transfers of a burst
+  localparam logic   [1:0] ahb_trans_default_p    = 2'h0; // AHB Transfer Type
+  // ahb_resp
+  localparam integer       ahb_resp_width_p       = 1;    // Width in Bits
+  localparam logic         ahb_resp_min_p         = 1'b0; // AHB Response Error
+  localparam logic         ahb_resp_max_p         = 1'b1; // AHB Response Error
+  localparam logic         ahb_resp_okay_e        = 1'b0; // OK
+  localparam logic         ahb_resp_error_e       = 1'b1; // Error
+  localparam logic         ahb_resp_default_p     = 1'b0; // AHB Response Error
+  // ahb_size
+  localparam integer       ahb_size_width_p       = 3;    // Width in Bits
+  localparam logic   [2:0] ahb_size_min_p         = 3'h0; // AHB Size
+  localparam logic   [2:0] ahb_size_max_p         = 3'h7; // AHB Size
+  localparam logic   [2:0] ahb_size_byte_e        = 3'h0; // Byte
+  localparam logic   [2:0] ahb_size_halfword_e    = 3'h1; // Halfword
+  localparam logic   [2:0] ahb_size_word_e        = 3'h2; // Word
+  localparam logic   [2:0] ahb_size_doubleword_e  = 3'h3; // Doubleword
+  localparam logic   [2:0] ahb_size_fourword_e    = 3'h4; // 4-word
+  localparam logic   [2:0] ahb_size_eightword_e   = 3'h5; // 8-word
+  localparam logic   [2:0] ahb_size_sixteenword_e = 3'h6; // 16-word
+  localparam logic   [2:0] ahb_size_kilobit_e     = 3'h7; // 32-word
+  localparam logic   [2:0] ahb_size_default_p     = 3'h0; // AHB Size
+  // ahb_burst
+  localparam integer       ahb_burst_width_p      = 3;    // Width in Bits
+  localparam logic   [2:0] ahb_burst_min_p        = 3'h0; // AHB Burst Type
+  localparam logic   [2:0] ahb_burst_max_p        = 3'h7; // AHB Burst Type
+  localparam logic   [2:0] ahb_burst_single_e     = 3'h0; // Single transfer
+  localparam logic   [2:0] ahb_burst_incr_e       = 3'h1; // Incrementing burst of unspecified length
+  localparam logic   [2:0] ahb_burst_wrap4_e      = 3'h2; // 4-beat wrapping burst
+  localparam logic   [2:0] ahb_burst_incr4_e      = 3'h3; // 4-beat incrementing burst
+  localparam logic   [2:0] ahb_burst_wrap8_e      = 3'h4; // 8-beat wrapping burst
+  localparam logic   [2:0] ahb_burst_incr8_e      = 3'h5; // 8-beat incrementing burst
+  localparam logic   [2:0] ahb_burst_wrap16_e     = 3'h6; // 16-beat wrapping burst
+  localparam logic   [2:0] ahb_burst_incr16_e     = 3'h7; // 16-beat incrementing burst
+  localparam logic   [2:0] ahb_burst_default_p    = 3'h0; // AHB Burst Type
+  // ahb_write
+  localparam integer       ahb_write_width_p      = 1;    // Width in Bits
+  localparam logic         ahb_write_min_p        = 1'b0; // AHB Write Enable
+  localparam logic         ahb_write_max_p        = 1'b1; // AHB Write Enable
+  localparam logic         ahb_write_read_e       = 1'b0; // Read operation
+  localparam logic         ahb_write_write_e      = 1'b1; // Write operation
+  localparam logic         ahb_write_default_p    = 1'b0; // AHB Write Enable
+  // fsm
+  localparam integer       fsm_width_p            = 3;    // Width in Bits
+  localparam logic   [2:0] fsm_min_p              = 3'h0; // AHB ML FSM Type
+  localparam logic   [2:0] fsm_max_p              = 3'h7; // AHB ML FSM Type
+  localparam logic   [2:0] fsm_idle_st            = 3'h0; // No transfer
+  localparam logic   [2:0] fsm_transfer_st        = 3'h1; // Transfer
+  localparam logic   [2:0] fsm_transfer_finish_st = 3'h2; // Transfer Finish (wait for HREADY)
+  localparam logic   [2:0] fsm_transfer_wait_st   = 3'h3; // Transfer Wait for Grant
+  localparam logic   [2:0] fsm_error0_st          = 3'h4; // Pre-Error (wait for HREADY)
+  localparam logic   [2:0] fsm_error1_st          = 3'h5; // 1st Error Cycle
+  localparam logic   [2:0] fsm_error2_st          = 3'h6; // 2nd Error Cycle
+  localparam logic   [2:0] fsm_default_p          = 3'h0; // AHB ML FSM Type
+
+
+  // ------------------------------------------------------
+  //  Signals
+  // ------------------------------------------------------
+  logic [2:0]  fsm_cpu_r;            // Master 'cpu' FSM
+  logic        mst_cpu_new_xfer_s;
+  logic        mst_cpu_cont_xfer_s;
+  logic        mst_cpu_hready_s;
+  logic        mst_cpu_rqstate_s;
+  logic        mst_cpu_addr_err_s;
+  logic        mst_cpu_mem_sel_s;
+  logic        mst_cpu_mem_req_r;
+  logic        mst_cpu_mem_gnt_r;    // data phase, switches with HREADY only
+  logic        mst_cpu_rom_sel_s;
+  logic        mst_cpu_rom_req_r;
+  logic        mst_cpu_rom_gnt_r;    // data phase, switches with HREADY only
+  logic        mst_cpu_gnt_s;
+  logic [1:0]  mst_cpu_htrans_s;     // AHB Transfer Type
+  logic [1:0]  mst_cpu_htrans_r;     // AHB Transfer Type
+  logic [31:0] mst_cpu_haddr_s;      // AHB Bus Address
+  logic [31:0] mst_cpu_haddr_r;      // AHB Bus Address
+  logic        mst_cpu_hwrite_s;     // AHB Write Enable
+  logic        mst_cpu_hwrite_r;     // AHB Write Enable
+  logic [2:0]  mst_cpu_hsize_s;      // AHB Size
+  logic [2:0]  mst_cpu_hsize_r;      // AHB Size
+  logic [2:0]  mst_cpu_hburst_s;     // AHB Burst Type
+  logic [2:0]  mst_cpu_hburst_r;     // AHB Burst Type
+  logic [3:0]  mst_cpu_hprot_s;      // AHB Transfer Protection
+  logic [3:0]  mst_cpu_hprot_r;      // AHB Transfer Protection
+  logic        mst_cpu_hwrite_dph_r; // data-phase write indicator
+  logic [2:0]  fsm_dsp_r;            // Master 'dsp' FSM
+  logic        mst_dsp_new_xfer_s;
+  logic        mst_dsp_cont_xfer_s;
+  logic        mst_dsp_hready_s;
+  logic        mst_dsp_rqstate_s;
+  logic        mst_dsp_addr_err_s;
+  logic        mst_dsp_mem_sel_s;
+  logic        mst_dsp_mem_req_r;
+  logic        mst_dsp_mem_gnt_r;    // data phase, switches with HREADY only
+  logic        mst_dsp_rom_sel_s;
+  logic        mst_dsp_rom_req_r;
+  logic        mst_dsp_rom_gnt_r;    // data phase, switches with HREADY only
+  logic        mst_dsp_io_sel_s;
+  logic        mst_dsp_io_req_r;
+  logic        mst_dsp_io_gnt_r;     // data phase, switches with HREADY only
+  logic        mst_dsp_gnt_s;
+  logic [1:0]  mst_dsp_htrans_s;     // AHB Transfer Type
+  logic [1:0]  mst_dsp_htrans_r;     // AHB Transfer Type
+  logic [31:0] mst_dsp_haddr_s;      // AHB Bus Address
+  logic [31:0] mst_dsp_haddr_r;      // AHB Bus Address
+  logic        mst_dsp_hwrite_s;     // AHB Write Enable
+  logic        mst_dsp_hwrite_r;     // AHB Write Enable
+  logic [2:0]  mst_dsp_hsize_s;      // AHB Size
+  logic [2:0]  mst_dsp_hsize_r;      // AHB Size
+  logic [2:0]  mst_dsp_hburst_s;     // AHB Burst Type
+  logic [2:0]  mst_dsp_hburst_r;     // AHB Burst Type
+  logic [3:0]  mst_dsp_hprot_s;      // AHB Transfer Protection
+  logic [3:0]  mst_dsp_hprot_r;      // AHB Transfer Protection
+  logic        mst_dsp_hwrite_dph_r; // data-phase write indicator
+  logic [2:0]  fsm_dma_r;            // Master 'dma' FSM
+  logic        mst_dma_new_xfer_s;
+  logic        mst_dma_cont_xfer_s;
+  logic        mst_dma_hready_s;
+  logic        mst_dma_rqstate_s;
+  logic        mst_dma_addr_err_s;
+  logic        mst_dma_mem_sel_s;
+  logic        mst_dma_mem_req_r;
+  logic        mst_dma_mem_gnt_r;    // data phase, switches with HREADY only
+  logic        mst_dma_io_sel_s;
+  logic        mst_dma_io_req_r;
+  logic        mst_dma_io_gnt_r;     // data phase, switches with HREADY only
+  logic        mst_dma_sram_sel_s;
+  logic        mst_dma_sram_req_r;
+  logic        mst_dma_sram_gnt_r;   // data phase, switches with HREADY only
+  logic        mst_dma_gnt_s;
+  logic [1:0]  mst_dma_htrans_s;     // AHB Transfer Type
+  logic [1:0]  mst_dma_htrans_r;     // AHB Transfer Type
+  logic [31:0] mst_dma_haddr_s;      // AHB Bus Address
+  logic [31:0] mst_dma_haddr_r;      // AHB Bus Address
+  logic        mst_dma_hwrite_s;     // AHB Write Enable
+  logic        mst_dma_hwrite_r;     // AHB Write Enable
+  logic [2:0]  mst_dma_hsize_s;      // AHB Size
+  logic [2:0]  mst_dma_hsize_r;      // AHB Size
+  logic [2:0]  mst_dma_hburst_s;     // AHB Burst Type
+  logic [2:0]  mst_dma_hburst_r;     // AHB Burst Type
+  logic [3:0]  mst_dma_hprot_s;      // AHB Transfer Protection
+  logic [3:0]  mst_dma_hprot_r;      // AHB Transfer Protection
+  logic        mst_dma_hwrite_dph_r; // data-phase write indicator
+  logic        mst_cpu_mem_req_s;
+  logic        mst_cpu_mem_keep_s;
+  logic        slv_mem_cpu_sel_s;
+  logic        slv_mem_cpu_gnt_s;
+  logic        mst_dsp_mem_req_s;
+  logic        mst_dsp_mem_keep_s;
+  logic        slv_mem_dsp_sel_s;
+  logic        slv_mem_dsp_gnt_s;
+  logic        mst_dma_mem_req_s;
+  logic        mst_dma_mem_keep_s;
+  logic        slv_mem_dma_sel_s;
+  logic        slv_mem_dma_gnt_s;
+  logic [8:0]  slv_mem_lrg_r;        // bit `p*3+q` with `p < q`: `p`-th master granted less recently than `q`-th master
+  logic        slv_mem_park_s;       // re-grant the parked master of the current data phase
+  logic        mst_cpu_rom_req_s;
+  logic        mst_cpu_rom_keep_s;
+  logic        slv_rom_cpu_gnt_r;
+  logic        slv_rom_cpu_sel_s;
+  logic        slv_rom_cpu_gnt_s;
+  logic        mst_dsp_rom_req_s;
+  logic        mst_dsp_rom_keep_s;
+  logic        slv_rom_dsp_gnt_r;
+  logic        slv_rom_dsp_sel_s;
+  logic        slv_rom_dsp_gnt_s;
+  logic [0:0]  slv_rom_credit_r;     // remaining consecutive grants of the granted master
+  logic        slv_rom_park_s;       // re-grant the parked master of the current data phase
+  logic        mst_dsp_io_req_s;
+  logic        mst_dsp_io_keep_s;
+  logic        slv_io_dsp_sel_s;
+  logic        slv_io_dsp_gnt_s;
+  logic        mst_dma_io_req_s;
+  logic        mst_dma_io_keep_s;
+  logic        slv_io_dma_sel_s;
+  logic        slv_io_dma_gnt_s;
+  logic        mst_dma_sram_req_s;
+  logic        slv_sram_dma_gnt_s;
+
+
+  // ------------------------------------------------------
+  // The Masters:
+  // ------------------------------------------------------
+  // Master 'cpu' Logic
+  always_comb begin: proc_cpu_logic
+    mst_cpu_new_xfer_s  = (ahb_mst_cpu_htrans_i == ahb_trans_nonseq_e) ? 1'b1 : 1'b0;
+    mst_cpu_cont_xfer_s = ((ahb_mst_cpu_htrans_i == ahb_trans_busy_e) ||
+                           (ahb_mst_cpu_htrans_i == ahb_trans_seq_e)) ? 1'b1 : 1'b0;
+    mst_cpu_rqstate_s   = ((fsm_cpu_r == fsm_idle_st) ||
+                           (fsm_cpu_r == fsm_transfer_st) ||
+                           (fsm_cpu_r == fsm_transfer_finish_st) ||
+                           (fsm_cpu_r == fsm_error2_st)) ? 1'b1 : 1'b0;
+
+    // Address Decoding
+    mst_cpu_addr_err_s = 1'b0;
+    mst_cpu_mem_sel_s = 1'b0;
+    mst_cpu_rom_sel_s = 1'b0;
+
+    casez (ahb_mst_cpu_haddr_i[31:12])
+      20'b00000000000000000000: begin // mem
+        mst_cpu_mem_sel_s = 1'b1;
+      end
+
+      20'b00000000000000000001: begin // rom
+        mst_cpu_rom_sel_s = 1'b1;
+      end
+
+      default: begin
+        mst_cpu_addr_err_s = mst_cpu_new_xfer_s;
+      end
+    endcase
+
+    mst_cpu_mem_req_s  = (mst_cpu_mem_sel_s & mst_cpu_new_xfer_s & mst_cpu_rqstate_s &
+                          (mst_cpu_hready_s | mst_cpu_mem_gnt_r)) | mst_cpu_mem_req_r;
+    mst_cpu_mem_keep_s = mst_cpu_mem_gnt_r & mst_cpu_cont_xfer_s;
+    mst_cpu_rom_req_s  = (mst_cpu_rom_sel_s & mst_cpu_new_xfer_s & mst_cpu_rqstate_s &
+                          (mst_cpu_hready_s | mst_cpu_rom_gnt_r)) | mst_cpu_rom_req_r;
+    mst_cpu_rom_keep_s = mst_cpu_rom_gnt_r & mst_cpu_cont_xfer_s;
+
+    // Grant Combination
+    mst_cpu_gnt_s = slv_mem_cpu_gnt_s |
+                    slv_rom_cpu_gnt_s;
+  end
+
+  // FSM for Master 'cpu'
+  always_ff @(posedge main_clk_i or negedge main_rst_an_i) begin: proc_cpu_fsm
+    if (main_rst_an_i == 1'b0) begin
+      fsm_cpu_r <= fsm_idle_st;
+      mst_cpu_mem_gnt_r <= 1'b0;
+      mst_cpu_rom_gnt_r <= 1'b0;
+    end else begin
+      case (fsm_cpu_r)
+        fsm_idle_st: begin
+          if (mst_cpu_new_xfer_s == 1'b1) begin
+            if (mst_cpu_addr_err_s == 1'b1) begin
+              fsm_cpu_r <= fsm_error1_st;
+            end else if (mst_cpu_gnt_s == 1'b1) begin
+              mst_cpu_mem_req_r <= 1'b0;
+              mst_cpu_rom_req_r <= 1'b0;
+              fsm_cpu_r <= fsm_transfer_st;
+            end else begin
+              mst_cpu_mem_req_r <= mst_cpu_mem_sel_s;
+              mst_cpu_rom_req_r <= mst_cpu_rom_sel_s;
+              fsm_cpu_r <= fsm_transfer_wait_st;
+            end
+            mst_cpu_mem_gnt_r <= slv_mem_cpu_gnt_s;
+            mst_cpu_rom_gnt_r <= slv_rom_cpu_gnt_s;
+          end
+        end
+
+        fsm_error0_st: begin
+          if (mst_cpu_hready_s == 1'b1) begin
+            mst_cpu_mem_gnt_r <= 1'b0;
+            mst_cpu_rom_gnt_r <= 1'b0;
+            fsm_cpu_r <= fsm_error1_st;
+          end
+        end
+
+        fsm_error1_st: begin
+          fsm_cpu_r <= fsm_error2_st;
+        end
+
+        fsm_error2_st: begin
+          if (mst_cpu_new_xfer_s == 1'b1) begin
+            if (mst_cpu_addr_err_s == 1'b1) begin
+              fsm_cpu_r <= fsm_error1_st;
+            end else if (mst_cpu_gnt_s == 1'b1) begin
+              mst_cpu_mem_req_r <= 1'b0;
+              mst_cpu_rom_req_r <= 1'b0;
+              fsm_cpu_r <= fsm_transfer_st;
+            end else begin
+              mst_cpu_mem_req_r <= mst_cpu_mem_sel_s;
+              mst_cpu_rom_req_r <= mst_cpu_rom_sel_s;
+              fsm_cpu_r <= fsm_transfer_wait_st;
+            end
+            mst_cpu_mem_gnt_r <= slv_mem_cpu_gnt_s;
+            mst_cpu_rom_gnt_r <= slv_rom_cpu_gnt_s;
+          end else begin
+            fsm_cpu_r <= fsm_idle_st;
+          end
+        end
+
+        fsm_transfer_st: begin
+          if ((ahb_mst_cpu_htrans_i == ahb_trans_seq_e) ||
+              (ahb_mst_cpu_htrans_i == ahb_trans_busy_e)) begin
+            fsm_cpu_r <= fsm_transfer_st;
+          end else begin
+            if (ahb_mst_cpu_htrans_i == ahb_trans_idle_e) begin
+              if (mst_cpu_hready_s == 1'b0) begin
+                fsm_cpu_r <= fsm_transfer_finish_st;
+              end else begin
+                mst_cpu_mem_gnt_r <= 1'b0;
+                mst_cpu_rom_gnt_r <= 1'b0;
+                fsm_cpu_r <= fsm_idle_st;
+              end
+            end else begin // ((ahb_mst_cpu_htrans_i == ahb_trans_nonseq_e)
+              if (mst_cpu_hready_s == 1'b1) begin // address phase ends with the current data phase
+                if (mst_cpu_addr_err_s == 1'b1) begin
+                  fsm_cpu_r <= fsm_error1_st;
+                end else if (mst_cpu_gnt_s == 1'b1) begin
+                  mst_cpu_mem_req_r <= 1'b0;
+                  mst_cpu_rom_req_r <= 1'b0;
+                  fsm_cpu_r <= fsm_transfer_st;
+                end else begin
+                  mst_cpu_mem_req_r <= mst_cpu_mem_sel_s;
+                  mst_cpu_rom_req_r <= mst_cpu_rom_sel_s;
+                  fsm_cpu_r <= fsm_transfer_wait_st;
+                end
+                mst_cpu_mem_gnt_r <= slv_mem_cpu_gnt_s;
+                mst_cpu_rom_gnt_r <= slv_rom_cpu_gnt_s;
+              end else if (mst_cpu_addr_err_s == 1'b1) begin // the data phase continues
+                fsm_cpu_r <= fsm_error0_st;
+              end
+            end
+          end
+        end
+
+        fsm_transfer_wait_st: begin
+          if (mst_cpu_gnt_s == 1'b1) begin
+            mst_cpu_mem_req_r <= 1'b0;
+            mst_cpu_rom_req_r <= 1'b0;
+            mst_cpu_mem_gnt_r <= slv_mem_cpu_gnt_s;
+            mst_cpu_rom_gnt_r <= slv_rom_cpu_gnt_s;
+            fsm_cpu_r <= fsm_transfer_st;
+          end
+        end
+
+        fsm_transfer_finish_st: begin
+          if (mst_cpu_hready_s == 1'b1) begin
+            if (mst_cpu_new_xfer_s == 1'b1) begin
+              if (mst_cpu_addr_err_s == 1'b1) begin
+                fsm_cpu_r <= fsm_error1_st;
+              end else if (mst_cpu_gnt_s == 1'b1) begin
+                mst_cpu_mem_req_r <= 1'b0;
+                mst_cpu_rom_req_r <= 1'b0;
+                fsm_cpu_r <= fsm_transfer_st;
+              end else begin
+                mst_cpu_mem_req_r <= mst_cpu_mem_sel_s;
+                mst_cpu_rom_req_r <= mst_cpu_rom_sel_s;
+                fsm_cpu_r <= fsm_transfer_wait_st;
+              end
+              mst_cpu_mem_gnt_r <= slv_mem_cpu_gnt_s;
+              mst_cpu_rom_gnt_r <= slv_rom_cpu_gnt_s;
+            end else begin
+              mst_cpu_mem_gnt_r <= 1'b0;
+              mst_cpu_rom_gnt_r <= 1'b0;
+              fsm_cpu_r <= fsm_idle_st;
+            end
+          end
+        end
+
+        default: begin
+          mst_cpu_mem_gnt_r <= 1'b0;
+          mst_cpu_mem_req_r <= 1'b0;
+          mst_cpu_rom_gnt_r <= 1'b0;
+          mst_cpu_rom_req_r <= 1'b0;
+          fsm_cpu_r <= fsm_idle_st;
+        end
+      endcase
+    end
+
+    if ((mst_cpu_new_xfer_s == 1'b1) && (mst_cpu_gnt_s == 1'b0) && (mst_cpu_rqstate_s == 1'b1)) begin
+      mst_cpu_haddr_r  <= ahb_mst_cpu_haddr_i;
+      mst_cpu_htrans_r <= ahb_mst_cpu_htrans_i;
+      mst_cpu_hburst_r <= ahb_mst_cpu_hburst_i;
+      mst_cpu_hsize_r  <= ahb_mst_cpu_hsize_i;
+      mst_cpu_hwrite_r <= ahb_mst_cpu_hwrite_i;
+      mst_cpu_hprot_r  <= ahb_mst_cpu_hprot_i;
+    end
+
+    if (mst_cpu_hready_s == 1'b1) begin  // the address phase ends with the current data phase
+      mst_cpu_hwrite_dph_r <= mst_cpu_hwrite_s;
+    end
+  end
+
+  // Master 'cpu' Mux
+  always_comb begin: proc_cpu_mux
+    if (fsm_cpu_r == fsm_transfer_wait_st) begin
+      mst_cpu_haddr_s  = mst_cpu_haddr_r;
+      mst_cpu_hwrite_s = mst_cpu_hwrite_r;
+      mst_cpu_hburst_s = mst_cpu_hburst_r;
+      mst_cpu_hsize_s  = mst_cpu_hsize_r;
+      mst_cpu_htrans_s = mst_cpu_htrans_r;
+      mst_cpu_hprot_s  = mst_cpu_hprot_r;
+    end else begin
+      mst_cpu_haddr_s  = ahb_mst_cpu_haddr_i;
+      mst_cpu_hwrite_s = ahb_mst_cpu_hwrite_i;
+      mst_cpu_hburst_s = ahb_mst_cpu_hburst_i;
+      mst_cpu_hsize_s  = ahb_mst_cpu_hsize_i;
+      mst_cpu_htrans_s = ahb_mst_cpu_htrans_i;
+      mst_cpu_hprot_s  = ahb_mst_cpu_hprot_i;
+    end
+
+    mst_cpu_hready_s = (ahb_slv_mem_hreadyout_i & mst_cpu_mem_gnt_r) |
+                       (ahb_slv_rom_hreadyout_i & mst_cpu_rom_gnt_r) |
+                       ~(|{mst_cpu_mem_gnt_r, mst_cpu_rom_gnt_r});
+
+    case (fsm_cpu_r)
+      fsm_transfer_wait_st: begin
+        ahb_mst_cpu_hrdata_o = 32'h00000000;
+        ahb_mst_cpu_hready_o = 1'b0;
+        ahb_mst_cpu_hresp_o  = ahb_resp_okay_e;
+      end
+
+      fsm_error1_st: begin
+        ahb_mst_cpu_hrdata_o = 32'h00000000;
+        ahb_mst_cpu_hready_o = 1'b0;
+        ahb_mst_cpu_hresp_o  = ahb_resp_error_e;
+      end
+
+      fsm_error2_st: begin
+        ahb_mst_cpu_hrdata_o = 32'h00000000;
+        ahb_mst_cpu_hready_o = 1'b1;
+        ahb_mst_cpu_hresp_o  = ahb_resp_error_e;
+      end
+
+      fsm_error0_st, fsm_transfer_st: begin
+        case ({mst_cpu_mem_gnt_r, mst_cpu_rom_gnt_r})
+          2'b01: begin
+            ahb_mst_cpu_hrdata_o = (mst_cpu_hwrite_dph_r == 1'b0) ? ahb_slv_rom_hrdata_i : 32'h00000000;
+            ahb_mst_cpu_hready_o = ahb_slv_rom_hreadyout_i;
+            ahb_mst_cpu_hresp_o = ahb_slv_rom_hresp_i;
+          end
+
+          2'b10: begin
+            ahb_mst_cpu_hrdata_o = (mst_cpu_hwrite_dph_r == 1'b0) ? ahb_slv_mem_hrdata_i : 32'h00000000;
+            ahb_mst_cpu_hready_o = ahb_slv_mem_hreadyout_i;
+            ahb_mst_cpu_hresp_o = ahb_slv_mem_hresp_i;
+          end
+
+          default: begin
+            ahb_mst_cpu_hrdata_o = 32'h00000000;
+            ahb_mst_cpu_hready_o = 1'b1;
+            ahb_mst_cpu_hresp_o  = ahb_resp_okay_e;
+          end
+        endcase
+      end
+
+      fsm_transfer_finish_st: begin
+        case ({mst_cpu_mem_gnt_r, mst_cpu_rom_gnt_r})
+          2'b01: begin
+            ahb_mst_cpu_hrdata_o = ahb_slv_rom_hrdata_i;
+            ahb_mst_cpu_hready_o = ahb_slv_rom_hreadyout_i;
+            ahb_mst_cpu_hresp_o = ahb_slv_rom_hresp_i;
+          end
+
+          2'b10: begin
+            ahb_mst_cpu_hrdata_o = ahb_slv_mem_hrdata_i;
+            ahb_mst_cpu_hready_o = ahb_slv_mem_hreadyout_i;
+            ahb_mst_cpu_hresp_o = ahb_slv_mem_hresp_i;
+          end
+
+          default: begin
+            ahb_mst_cpu_hrdata_o = 32'h00000000;
+            ahb_mst_cpu_hready_o = 1'b1;
+            ahb_mst_cpu_hresp_o  = ahb_resp_okay_e;
+          end
+        endcase
+      end
+
+      default: begin
+        ahb_mst_cpu_hrdata_o = 32'h00000000;
+        ahb_mst_cpu_hready_o = 1'b1;
+        ahb_mst_cpu_hresp_o  = ahb_resp_okay_e;
+      end
+    endcase
+  end
+
+  // Master 'dsp' Logic
+  always_comb begin: proc_dsp_logic
+    mst_dsp_new_xfer_s  = (ahb_mst_dsp_htrans_i == ahb_trans_nonseq_e) ? 1'b1 : 1'b0;
+    mst_dsp_cont_xfer_s = ((ahb_mst_dsp_htrans_i == ahb_trans_busy_e) ||
+                           (ahb_mst_dsp_htrans_i == ahb_trans_seq_e)) ? 1'b1 : 1'b0;
+    mst_dsp_rqstate_s   = ((fsm_dsp_r == fsm_idle_st) ||
+                           (fsm_dsp_r == fsm_transfer_st) ||
+                           (fsm_dsp_r == fsm_transfer_finish_st) ||
+                           (fsm_dsp_r == fsm_error2_st)) ? 1'b1 : 1'b0;
+
+    // Address Decoding
+    mst_dsp_addr_err_s = 1'b0;
+    mst_dsp_mem_sel_s = 1'b0;
+    mst_dsp_rom_sel_s = 1'b0;
+    mst_dsp_io_sel_s = 1'b0;
+
+    casez (ahb_mst_dsp_haddr_i[31:12])
+      20'b00000000000000000000: begin // mem
+        mst_dsp_mem_sel_s = 1'b1;
+      end
+
+      20'b00000000000000000001: begin // rom
+        mst_dsp_rom_sel_s = 1'b1;
+      end
+
+      20'b00000000000000000010: begin // io
+        mst_dsp_io_sel_s = 1'b1;
+      end
+
+      default: begin
+        mst_dsp_addr_err_s = mst_dsp_new_xfer_s;
+      end
+    endcase
+
+    mst_dsp_mem_req_s  = (mst_dsp_mem_sel_s & mst_dsp_new_xfer_s & mst_dsp_rqstate_s &
+                          (mst_dsp_hready_s | mst_dsp_mem_gnt_r)) | mst_dsp_mem_req_r;
+    mst_dsp_mem_keep_s = mst_dsp_mem_gnt_r & mst_dsp_cont_xfer_s;
+    mst_dsp_rom_req_s  = (mst_dsp_rom_sel_s & mst_dsp_new_xfer_s & mst_dsp_rqstate_s &
+                          (mst_dsp_hready_s | mst_dsp_rom_gnt_r)) | mst_dsp_rom_req_r;
+    mst_dsp_rom_keep_s = mst_dsp_rom_gnt_r & mst_dsp_cont_xfer_s;
+    mst_dsp_io_req_s   = (mst_dsp_io_sel_s & mst_dsp_new_xfer_s & mst_dsp_rqstate_s &
+                          (mst_dsp_hready_s | mst_dsp_io_gnt_r)) | mst_dsp_io_req_r;
+    mst_dsp_io_keep_s  = mst_dsp_io_gnt_r & mst_dsp_cont_xfer_s;
+
+    // Grant Combination
+    mst_dsp_gnt_s = slv_mem_dsp_gnt_s |
+                    slv_rom_dsp_gnt_s |
+                    slv_io_dsp_gnt_s;
+  end
+
+  // FSM for Master 'dsp'
+  always_ff @(posedge main_clk_i or negedge main_rst_an_i) begin: proc_dsp_fsm
+    if (main_rst_an_i == 1'b0) begin
+      fsm_dsp_r <= fsm_idle_st;
+      mst_dsp_mem_gnt_r <= 1'b0;
+      mst_dsp_rom_gnt_r <= 1'b0;
+      mst_dsp_io_gnt_r <= 1'b0;
+    end else begin
+      case (fsm_dsp_r)
+        fsm_idle_st: begin
+          if (mst_dsp_new_xfer_s == 1'b1) begin
+            if (mst_dsp_addr_err_s == 1'b1) begin
+              fsm_dsp_r <= fsm_error1_st;
+            end else if (mst_dsp_gnt_s == 1'b1) begin
+              mst_dsp_mem_req_r <= 1'b0;
+              mst_dsp_rom_req_r <= 1'b0;
+              mst_dsp_io_req_r <= 1'b0;
+              fsm_dsp_r <= fsm_transfer_st;
+            end else begin
+              mst_dsp_mem_req_r <= mst_dsp_mem_sel_s;
+              mst_dsp_rom_req_r <= mst_dsp_rom_sel_s;
+              mst_dsp_io_req_r <= mst_dsp_io_sel_s;
+              fsm_dsp_r <= fsm_transfer_wait_st;
+            end
+            mst_dsp_mem_gnt_r <= slv_mem_dsp_gnt_s;
+            mst_dsp_rom_gnt_r <= slv_rom_dsp_gnt_s;
+            mst_dsp_io_gnt_r <= slv_io_dsp_gnt_s;
+          end
+        end
+
+        fsm_error0_st: begin
+          if (mst_dsp_hready_s == 1'b1) begin
+            mst_dsp_mem_gnt_r <= 1'b0;
+            mst_dsp_rom_gnt_r <= 1'b0;
+            mst_dsp_io_gnt_r <= 1'b0;
+            fsm_dsp_r <= fsm_error1_st;
+          end
+        end
+
+        fsm_error1_st: begin
+          fsm_dsp_r <= fsm_error2_st;
+        end
+
+        fsm_error2_st: begin
+          if (mst_dsp_new_xfer_s == 1'b1) begin
+            if (mst_dsp_addr_err_s == 1'b1) begin
+              fsm_dsp_r <= fsm_error1_st;
+            end else if (mst_dsp_gnt_s == 1'b1) begin
+              mst_dsp_mem_req_r <= 1'b0;
+              mst_dsp_rom_req_r <= 1'b0;
+              mst_dsp_io_req_r <= 1'b0;
+              fsm_dsp_r <= fsm_transfer_st;
+            end else begin
+              mst_dsp_mem_req_r <= mst_dsp_mem_sel_s;
+              mst_dsp_rom_req_r <= mst_dsp_rom_sel_s;
+              mst_dsp_io_req_r <= mst_dsp_io_sel_s;
+              fsm_dsp_r <= fsm_transfer_wait_st;
+            end
+            mst_dsp_mem_gnt_r <= slv_mem_dsp_gnt_s;
+            mst_dsp_rom_gnt_r <= slv_rom_dsp_gnt_s;
+            mst_dsp_io_gnt_r <= slv_io_dsp_gnt_s;
+          end else begin
+            fsm_dsp_r <= fsm_idle_st;
+          end
+        end
+
+        fsm_transfer_st: begin
+          if ((ahb_mst_dsp_htrans_i == ahb_trans_seq_e) ||
+              (ahb_mst_dsp_htrans_i == ahb_trans_busy_e)) begin
+            fsm_dsp_r <= fsm_transfer_st;
+          end else begin
+            if (ahb_mst_dsp_htrans_i == ahb_trans_idle_e) begin
+              if (mst_dsp_hready_s == 1'b0) begin
+                fsm_dsp_r <= fsm_transfer_finish_st;
+              end else begin
+                mst_dsp_mem_gnt_r <= 1'b0;
+                mst_dsp_rom_gnt_r <= 1'b0;
+                mst_dsp_io_gnt_r <= 1'b0;
+                fsm_dsp_r <= fsm_idle_st;
+              end
+            end else begin // ((ahb_mst_dsp_htrans_i == ahb_trans_nonseq_e)
+              if (mst_dsp_hready_s == 1'b1) begin // address phase ends with the current data phase
+                if (mst_dsp_addr_err_s == 1'b1) begin
+                  fsm_dsp_r <= fsm_error1_st;
+                end else if (mst_dsp_gnt_s == 1'b1) begin
+                  mst_dsp_mem_req_r <= 1'b0;
+                  mst_dsp_rom_req_r <= 1'b0;
+                  mst_dsp_io_req_r <= 1'b0;
+                  fsm_dsp_r <= fsm_transfer_st;
+                end else begin
+                  mst_dsp_mem_req_r <= mst_dsp_mem_sel_s;
+                  mst_dsp_rom_req_r <= mst_dsp_rom_sel_s;
+                  mst_dsp_io_req_r <= mst_dsp_io_sel_s;
+                  fsm_dsp_r <= fsm_transfer_wait_st;
+                end
+                mst_dsp_mem_gnt_r <= slv_mem_dsp_gnt_s;
+                mst_dsp_rom_gnt_r <= slv_rom_dsp_gnt_s;
+                mst_dsp_io_gnt_r <= slv_io_dsp_gnt_s;
+              end else if (mst_dsp_addr_err_s == 1'b1) begin // the data phase continues
+                fsm_dsp_r <= fsm_error0_st;
+              end
+            end
+          end
+        end
+
+        fsm_transfer_wait_st: begin
+          if (mst_dsp_gnt_s == 1'b1) begin
+            mst_dsp_mem_req_r <= 1'b0;
+            mst_dsp_rom_req_r <= 1'b0;
+            mst_dsp_io_req_r <= 1'b0;
+            mst_dsp_mem_gnt_r <= slv_mem_dsp_gnt_s;
+            mst_dsp_rom_gnt_r <= slv_rom_dsp_gnt_s;
+            mst_dsp_io_gnt_r <= slv_io_dsp_gnt_s;
+            fsm_dsp_r <= fsm_transfer_st;
+          end
+        end
+
+        fsm_transfer_finish_st: begin
+          if (mst_dsp_hready_s == 1'b1) begin
+            if (mst_dsp_new_xfer_s == 1'b1) begin
+              if (mst_dsp_addr_err_s == 1'b1) begin
+                fsm_dsp_r <= fsm_error1_st;
+              end else if (mst_dsp_gnt_s == 1'b1) begin
+                mst_dsp_mem_req_r <= 1'b0;
+                mst_dsp_rom_req_r <= 1'b0;
+                mst_dsp_io_req_r <= 1'b0;
+                fsm_dsp_r <= fsm_transfer_st;
+              end else begin
+                mst_dsp_mem_req_r <= mst_dsp_mem_sel_s;
+                mst_dsp_rom_req_r <= mst_dsp_rom_sel_s;
+                mst_dsp_io_req_r <= mst_dsp_io_sel_s;
+                fsm_dsp_r <= fsm_transfer_wait_st;
+              end
+              mst_dsp_mem_gnt_r <= slv_mem_dsp_gnt_s;
+              mst_dsp_rom_gnt_r <= slv_rom_dsp_gnt_s;
+              mst_dsp_io_gnt_r <= slv_io_dsp_gnt_s;
+            end else begin
+              mst_dsp_mem_gnt_r <= 1'b0;
+              mst_dsp_rom_gnt_r <= 1'b0;
+              mst_dsp_io_gnt_r <= 1'b0;
+              fsm_dsp_r <= fsm_idle_st;
+            end
+          end
+        end
+
+        default: begin
+          mst_dsp_mem_gnt_r <= 1'b0;
+          mst_dsp_mem_req_r <= 1'b0;
+          mst_dsp_rom_gnt_r <= 1'b0;
+          mst_dsp_rom_req_r <= 1'b0;
+          mst_dsp_io_gnt_r <= 1'b0;
+          mst_dsp_io_req_r <= 1'b0;
+          fsm_dsp_r <= fsm_idle_st;
+        end
+      endcase
+    end
+
+    if ((mst_dsp_new_xfer_s == 1'b1) && (mst_dsp_gnt_s == 1'b0) && (mst_dsp_rqstate_s == 1'b1)) begin
+      mst_dsp_haddr_r  <= ahb_mst_dsp_haddr_i;
+      mst_dsp_htrans_r <= ahb_mst_dsp_htrans_i;
+      mst_dsp_hburst_r <= ahb_mst_dsp_hburst_i;
+      mst_dsp_hsize_r  <= ahb_mst_dsp_hsize_i;
+      mst_dsp_hwrite_r <= ahb_mst_dsp_hwrite_i;
+      mst_dsp_hprot_r  <= ahb_mst_dsp_hprot_i;
+    end
+
+    if (mst_dsp_hready_s == 1'b1) begin  // the address phase ends with the current data phase
+      mst_dsp_hwrite_dph_r <= mst_dsp_hwrite_s;
+    end
+  end
+
+  // Master 'dsp' Mux
+  always_comb begin: proc_dsp_mux
+    if (fsm_dsp_r == fsm_transfer_wait_st) begin
+      mst_dsp_haddr_s  = mst_dsp_haddr_r;
+      mst_dsp_hwrite_s = mst_dsp_hwrite_r;
+      mst_dsp_hburst_s = mst_dsp_hburst_r;
+      mst_dsp_hsize_s  = mst_dsp_hsize_r;
+      mst_dsp_htrans_s = mst_dsp_htrans_r;
+      mst_dsp_hprot_s  = mst_dsp_hprot_r;
+    end else begin
+      mst_dsp_haddr_s  = ahb_mst_dsp_haddr_i;
+      mst_dsp_hwrite_s = ahb_mst_dsp_hwrite_i;
+      mst_dsp_hburst_s = ahb_mst_dsp_hburst_i;
+      mst_dsp_hsize_s  = ahb_mst_dsp_hsize_i;
+      mst_dsp_htrans_s = ahb_mst_dsp_htrans_i;
+      mst_dsp_hprot_s  = ahb_mst_dsp_hprot_i;
+    end
+
+    mst_dsp_hready_s = (ahb_slv_mem_hreadyout_i & mst_dsp_mem_gnt_r) |
+                       (ahb_slv_rom_hreadyout_i & mst_dsp_rom_gnt_r) |
+                       (ahb_slv_io_hreadyout_i & mst_dsp_io_gnt_r) |
+                       ~(|{mst_dsp_mem_gnt_r, mst_dsp_rom_gnt_r, mst_dsp_io_gnt_r});
+
+    case (fsm_dsp_r)
+      fsm_transfer_wait_st: begin
+        ahb_mst_dsp_hrdata_o = 32'h00000000;
+        ahb_mst_dsp_hready_o = 1'b0;
+        ahb_mst_dsp_hresp_o  = ahb_resp_okay_e;
+      end
+
+      fsm_error1_st: begin
+        ahb_mst_dsp_hrdata_o = 32'h00000000;
+        ahb_mst_dsp_hready_o = 1'b0;
+        ahb_mst_dsp_hresp_o  = ahb_resp_error_e;
+      end
+
+      fsm_error2_st: begin
+        ahb_mst_dsp_hrdata_o = 32'h00000000;
+        ahb_mst_dsp_hready_o = 1'b1;
+        ahb_mst_dsp_hresp_o  = ahb_resp_error_e;
+      end
+
+      fsm_error0_st, fsm_transfer_st: begin
+        case ({mst_dsp_mem_gnt_r, mst_dsp_rom_gnt_r, mst_dsp_io_gnt_r})
+          3'b001: begin
+            ahb_mst_dsp_hrdata_o = (mst_dsp_hwrite_dph_r == 1'b0) ? ahb_slv_io_hrdata_i : 32'h00000000;
+            ahb_mst_dsp_hready_o = ahb_slv_io_hreadyout_i;
+            ahb_mst_dsp_hresp_o = ahb_slv_io_hresp_i;
+          end
+
+          3'b010: begin
+            ahb_mst_dsp_hrdata_o = (mst_dsp_hwrite_dph_r == 1'b0) ? ahb_slv_rom_hrdata_i : 32'h00000000;
+            ahb_mst_dsp_hready_o = ahb_slv_rom_hreadyout_i;
+            ahb_mst_dsp_hresp_o = ahb_slv_rom_hresp_i;
+          end
+
+          3'b100: begin
+            ahb_mst_dsp_hrdata_o = (mst_dsp_hwrite_dph_r == 1'b0) ? ahb_slv_mem_hrdata_i : 32'h00000000;
+            ahb_mst_dsp_hready_o = ahb_slv_mem_hreadyout_i;
+            ahb_mst_dsp_hresp_o = ahb_slv_mem_hresp_i;
+          end
+
+          default: begin
+            ahb_mst_dsp_hrdata_o = 32'h00000000;
+            ahb_mst_dsp_hready_o = 1'b1;
+            ahb_mst_dsp_hresp_o  = ahb_resp_okay_e;
+          end
+        endcase
+      end
+
+      fsm_transfer_finish_st: begin
+        case ({mst_dsp_mem_gnt_r, mst_dsp_rom_gnt_r, mst_dsp_io_gnt_r})
+          3'b001: begin
+            ahb_mst_dsp_hrdata_o = ahb_slv_io_hrdata_i;
+            ahb_mst_dsp_hready_o = ahb_slv_io_hreadyout_i;
+            ahb_mst_dsp_hresp_o = ahb_slv_io_hresp_i;
+          end
+
+          3'b010: begin
+            ahb_mst_dsp_hrdata_o = ahb_slv_rom_hrdata_i;
+            ahb_mst_dsp_hready_o = ahb_slv_rom_hreadyout_i;
+            ahb_mst_dsp_hresp_o = ahb_slv_rom_hresp_i;
+          end
+
+          3'b100: begin
+            ahb_mst_dsp_hrdata_o = ahb_slv_mem_hrdata_i;
+            ahb_mst_dsp_hready_o = ahb_slv_mem_hreadyout_i;
+            ahb_mst_dsp_hresp_o = ahb_slv_mem_hresp_i;
+          end
+
+          default: begin
+            ahb_mst_dsp_hrdata_o = 32'h00000000;
+            ahb_mst_dsp_hready_o = 1'b1;
+            ahb_mst_dsp_hresp_o  = ahb_resp_okay_e;
+          end
+        endcase
+      end
+
+      default: begin
+        ahb_mst_dsp_hrdata_o = 32'h00000000;
+        ahb_mst_dsp_hready_o = 1'b1;
+        ahb_mst_dsp_hresp_o  = ahb_resp_okay_e;
+      end
+    endcase
+  end
+
+  // Master 'dma' Logic
+  always_comb begin: proc_dma_logic
+    mst_dma_new_xfer_s  = (ahb_mst_dma_htrans_i == ahb_trans_nonseq_e) ? 1'b1 : 1'b0;
+    mst_dma_cont_xfer_s = ((ahb_mst_dma_htrans_i == ahb_trans_busy_e) ||
+                           (ahb_mst_dma_htrans_i == ahb_trans_seq_e)) ? 1'b1 : 1'b0;
+    mst_dma_rqstate_s   = ((fsm_dma_r == fsm_idle_st) ||
+                           (fsm_dma_r == fsm_transfer_st) ||
+                           (fsm_dma_r == fsm_transfer_finish_st) ||
+                           (fsm_dma_r == fsm_error2_st)) ? 1'b1 : 1'b0;
+
+    // Address Decoding
+    mst_dma_addr_err_s = 1'b0;
+    mst_dma_mem_sel_s = 1'b0;
+    mst_dma_io_sel_s = 1'b0;
+    mst_dma_sram_sel_s = 1'b0;
+
+    casez (ahb_mst_dma_haddr_i[31:12])
+      20'b00000000000000000000: begin // mem
+        mst_dma_mem_sel_s = 1'b1;
+      end
+
+      20'b00000000000000000010: begin // io
+        mst_dma_io_sel_s = 1'b1;
+      end
+
+      20'b00000000000000000011: begin // sram
+        mst_dma_sram_sel_s = 1'b1;
+      end
+
+      default: begin
+        mst_dma_addr_err_s = mst_dma_new_xfer_s;
+      end
+    endcase
+
+    mst_dma_mem_req_s  = (mst_dma_mem_sel_s & mst_dma_new_xfer_s & mst_dma_rqstate_s &
+                          (mst_dma_hready_s | mst_dma_mem_gnt_r)) | mst_dma_mem_req_r;
+    mst_dma_mem_keep_s = mst_dma_mem_gnt_r & mst_dma_cont_xfer_s;
+    mst_dma_io_req_s   = (mst_dma_io_sel_s & mst_dma_new_xfer_s & mst_dma_rqstate_s &
+                          (mst_dma_hready_s | mst_dma_io_gnt_r)) | mst_dma_io_req_r;
+    mst_dma_io_keep_s  = mst_dma_io_gnt_r & mst_dma_cont_xfer_s;
+    mst_dma_sram_req_s = (mst_dma_sram_sel_s & mst_dma_new_xfer_s & mst_dma_rqstate_s &
+                          (mst_dma_hready_s | mst_dma_sram_gnt_r)) | mst_dma_sram_req_r;
+
+    // Grant Combination
+    mst_dma_gnt_s = slv_mem_dma_gnt_s |
+                    slv_io_dma_gnt_s |
+                    slv_sram_dma_gnt_s;
+  end
+
+  // FSM for Master 'dma'
+  always_ff @(posedge main_clk_i or negedge main_rst_an_i) begin: proc_dma_fsm
+    if (main_rst_an_i == 1'b0) begin
+      fsm_dma_r <= fsm_idle_st;
+      mst_dma_mem_gnt_r <= 1'b0;
+      mst_dma_io_gnt_r <= 1'b0;
+      mst_dma_sram_gnt_r <= 1'b0;
+    end else begin
+      case (fsm_dma_r)
+        fsm_idle_st: begin
+          if (mst_dma_new_xfer_s == 1'b1) begin
+            if (mst_dma_addr_err_s == 1'b1) begin
+              fsm_dma_r <= fsm_error1_st;
+            end else if (mst_dma_gnt_s == 1'b1) begin
+              mst_dma_mem_req_r <= 1'b0;
+              mst_dma_io_req_r <= 1'b0;
+              mst_dma_sram_req_r <= 1'b0;
+              fsm_dma_r <= fsm_transfer_st;
+            end else begin
+              mst_dma_mem_req_r <= mst_dma_mem_sel_s;
+              mst_dma_io_req_r <= mst_dma_io_sel_s;
+              mst_dma_sram_req_r <= mst_dma_sram_sel_s;
+              fsm_dma_r <= fsm_transfer_wait_st;
+            end
+            mst_dma_mem_gnt_r <= slv_mem_dma_gnt_s;
+            mst_dma_io_gnt_r <= slv_io_dma_gnt_s;
+            mst_dma_sram_gnt_r <= slv_sram_dma_gnt_s;
+          end
+        end
+
+        fsm_error0_st: begin
+          if (mst_dma_hready_s == 1'b1) begin
+            mst_dma_mem_gnt_r <= 1'b0;
+            mst_dma_io_gnt_r <= 1'b0;
+            mst_dma_sram_gnt_r <= 1'b0;
+            fsm_dma_r <= fsm_error1_st;
+          end
+        end
+
+        fsm_error1_st: begin
+          fsm_dma_r <= fsm_error2_st;
+        end
+
+        fsm_error2_st: begin
+          if (mst_dma_new_xfer_s == 1'b1) begin
+            if (mst_dma_addr_err_s == 1'b1) begin
+              fsm_dma_r <= fsm_error1_st;
+            end else if (mst_dma_gnt_s == 1'b1) begin
+              mst_dma_mem_req_r <= 1'b0;
+              mst_dma_io_req_r <= 1'b0;
+              mst_dma_sram_req_r <= 1'b0;
+              fsm_dma_r <= fsm_transfer_st;
+            end else begin
+              mst_dma_mem_req_r <= mst_dma_mem_sel_s;
+              mst_dma_io_req_r <= mst_dma_io_sel_s;
+              mst_dma_sram_req_r <= mst_dma_sram_sel_s;
+              fsm_dma_r <= fsm_transfer_wait_st;
+            end
+            mst_dma_mem_gnt_r <= slv_mem_dma_gnt_s;
+            mst_dma_io_gnt_r <= slv_io_dma_gnt_s;
+            mst_dma_sram_gnt_r <= slv_sram_dma_gnt_s;
+          end else begin
+            fsm_dma_r <= fsm_idle_st;
+          end
+        end
+
+        fsm_transfer_st: begin
+          if ((ahb_mst_dma_htrans_i == ahb_trans_seq_e) ||
+              (ahb_mst_dma_htrans_i == ahb_trans_busy_e)) begin
+            fsm_dma_r <= fsm_transfer_st;
+          end else begin
+            if (ahb_mst_dma_htrans_i == ahb_trans_idle_e) begin
+              if (mst_dma_hready_s == 1'b0) begin
+                fsm_dma_r <= fsm_transfer_finish_st;
+              end else begin
+                mst_dma_mem_gnt_r <= 1'b0;
+                mst_dma_io_gnt_r <= 1'b0;
+                mst_dma_sram_gnt_r <= 1'b0;
+                fsm_dma_r <= fsm_idle_st;
+              end
+            end else begin // ((ahb_mst_dma_htrans_i == ahb_trans_nonseq_e)
+              if (mst_dma_hready_s == 1'b1) begin // address phase ends with the current data phase
+                if (mst_dma_addr_err_s == 1'b1) begin
+                  fsm_dma_r <= fsm_error1_st;
+                end else if (mst_dma_gnt_s == 1'b1) begin
+                  mst_dma_mem_req_r <= 1'b0;
+                  mst_dma_io_req_r <= 1'b0;
+                  mst_dma_sram_req_r <= 1'b0;
+                  fsm_dma_r <= fsm_transfer_st;
+                end else begin
+                  mst_dma_mem_req_r <= mst_dma_mem_sel_s;
+                  mst_dma_io_req_r <= mst_dma_io_sel_s;
+                  mst_dma_sram_req_r <= mst_dma_sram_sel_s;
+                  fsm_dma_r <= fsm_transfer_wait_st;
+                end
+                mst_dma_mem_gnt_r <= slv_mem_dma_gnt_s;
+                mst_dma_io_gnt_r <= slv_io_dma_gnt_s;
+                mst_dma_sram_gnt_r <= slv_sram_dma_gnt_s;
+              end else if (mst_dma_addr_err_s == 1'b1) begin // the data phase continues
+                fsm_dma_r <= fsm_error0_st;
+              end
+            end
+          end
+        end
+
+        fsm_transfer_wait_st: begin
+          if (mst_dma_gnt_s == 1'b1) begin
+            mst_dma_mem_req_r <= 1'b0;
+            mst_dma_io_req_r <= 1'b0;
+            mst_dma_sram_req_r <= 1'b0;
+            mst_dma_mem_gnt_r <= slv_mem_dma_gnt_s;
+            mst_dma_io_gnt_r <= slv_io_dma_gnt_s;
+            mst_dma_sram_gnt_r <= slv_sram_dma_gnt_s;
+            fsm_dma_r <= fsm_transfer_st;
+          end
+        end
+
+        fsm_transfer_finish_st: begin
+          if (mst_dma_hready_s == 1'b1) begin
+            if (mst_dma_new_xfer_s == 1'b1) begin
+              if (mst_dma_addr_err_s == 1'b1) begin
+                fsm_dma_r <= fsm_error1_st;
+              end else if (mst_dma_gnt_s == 1'b1) begin
+                mst_dma_mem_req_r <= 1'b0;
+                mst_dma_io_req_r <= 1'b0;
+                mst_dma_sram_req_r <= 1'b0;
+                fsm_dma_r <= fsm_transfer_st;
+              end else begin
+                mst_dma_mem_req_r <= mst_dma_mem_sel_s;
+                mst_dma_io_req_r <= mst_dma_io_sel_s;
+                mst_dma_sram_req_r <= mst_dma_sram_sel_s;
+                fsm_dma_r <= fsm_transfer_wait_st;
+              end
+              mst_dma_mem_gnt_r <= slv_mem_dma_gnt_s;
+              mst_dma_io_gnt_r <= slv_io_dma_gnt_s;
+              mst_dma_sram_gnt_r <= slv_sram_dma_gnt_s;
+            end else begin
+              mst_dma_mem_gnt_r <= 1'b0;
+              mst_dma_io_gnt_r <= 1'b0;
+              mst_dma_sram_gnt_r <= 1'b0;
+              fsm_dma_r <= fsm_idle_st;
+            end
+          end
+        end
+
+        default: begin
+          mst_dma_mem_gnt_r <= 1'b0;
+          mst_dma_mem_req_r <= 1'b0;
+          mst_dma_io_gnt_r <= 1'b0;
+          mst_dma_io_req_r <= 1'b0;
+          mst_dma_sram_gnt_r <= 1'b0;
+          mst_dma_sram_req_r <= 1'b0;
+          fsm_dma_r <= fsm_idle_st;
+        end
+      endcase
+    end
+
+    if ((mst_dma_new_xfer_s == 1'b1) && (mst_dma_gnt_s == 1'b0) && (mst_dma_rqstate_s == 1'b1)) begin
+      mst_dma_haddr_r  <= ahb_mst_dma_haddr_i;
+      mst_dma_htrans_r <= ahb_mst_dma_htrans_i;
+      mst_dma_hburst_r <= ahb_mst_dma_hburst_i;
+      mst_dma_hsize_r  <= ahb_mst_dma_hsize_i;
+      mst_dma_hwrite_r <= ahb_mst_dma_hwrite_i;
+      mst_dma_hprot_r  <= ahb_mst_dma_hprot_i;
+    end
+
+    if (mst_dma_hready_s == 1'b1) begin  // the address phase ends with the current data phase
+      mst_dma_hwrite_dph_r <= mst_dma_hwrite_s;
+    end
+  end
+
+  // Master 'dma' Mux
+  always_comb begin: proc_dma_mux
+    if (fsm_dma_r == fsm_transfer_wait_st) begin
+      mst_dma_haddr_s  = mst_dma_haddr_r;
+      mst_dma_hwrite_s = mst_dma_hwrite_r;
+      mst_dma_hburst_s = mst_dma_hburst_r;
+      mst_dma_hsize_s  = mst_dma_hsize_r;
+      mst_dma_htrans_s = mst_dma_htrans_r;
+      mst_dma_hprot_s  = mst_dma_hprot_r;
+    end else begin
+      mst_dma_haddr_s  = ahb_mst_dma_haddr_i;
+      mst_dma_hwrite_s = ahb_mst_dma_hwrite_i;
+      mst_dma_hburst_s = ahb_mst_dma_hburst_i;
+      mst_dma_hsize_s  = ahb_mst_dma_hsize_i;
+      mst_dma_htrans_s = ahb_mst_dma_htrans_i;
+      mst_dma_hprot_s  = ahb_mst_dma_hprot_i;
+    end
+
+    mst_dma_hready_s = (ahb_slv_mem_hreadyout_i & mst_dma_mem_gnt_r) |
+                       (ahb_slv_io_hreadyout_i & mst_dma_io_gnt_r) |
+                       (ahb_slv_sram_hreadyout_i & mst_dma_sram_gnt_r) |
+                       ~(|{mst_dma_mem_gnt_r, mst_dma_io_gnt_r, mst_dma_sram_gnt_r});
+
+    case (fsm_dma_r)
+      fsm_transfer_wait_st: begin
+        ahb_mst_dma_hrdata_o = 32'h00000000;
+        ahb_mst_dma_hready_o = 1'b0;
+        ahb_mst_dma_hresp_o  = ahb_resp_okay_e;
+      end
+
+      fsm_error1_st: begin
+        ahb_mst_dma_hrdata_o = 32'h00000000;
+        ahb_mst_dma_hready_o = 1'b0;
+        ahb_mst_dma_hresp_o  = ahb_resp_error_e;
+      end
+
+      fsm_error2_st: begin
+        ahb_mst_dma_hrdata_o = 32'h00000000;
+        ahb_mst_dma_hready_o = 1'b1;
+        ahb_mst_dma_hresp_o  = ahb_resp_error_e;
+      end
+
+      fsm_error0_st, fsm_transfer_st: begin
+        case ({mst_dma_mem_gnt_r, mst_dma_io_gnt_r, mst_dma_sram_gnt_r})
+          3'b001: begin
+            ahb_mst_dma_hrdata_o = (mst_dma_hwrite_dph_r == 1'b0) ? ahb_slv_sram_hrdata_i : 32'h00000000;
+            ahb_mst_dma_hready_o = ahb_slv_sram_hreadyout_i;
+            ahb_mst_dma_hresp_o = ahb_slv_sram_hresp_i;
+          end
+
+          3'b010: begin
+            ahb_mst_dma_hrdata_o = (mst_dma_hwrite_dph_r == 1'b0) ? ahb_slv_io_hrdata_i : 32'h00000000;
+            ahb_mst_dma_hready_o = ahb_slv_io_hreadyout_i;
+            ahb_mst_dma_hresp_o = ahb_slv_io_hresp_i;
+          end
+
+          3'b100: begin
+            ahb_mst_dma_hrdata_o = (mst_dma_hwrite_dph_r == 1'b0) ? ahb_slv_mem_hrdata_i : 32'h00000000;
+            ahb_mst_dma_hready_o = ahb_slv_mem_hreadyout_i;
+            ahb_mst_dma_hresp_o = ahb_slv_mem_hresp_i;
+          end
+
+          default: begin
+            ahb_mst_dma_hrdata_o = 32'h00000000;
+            ahb_mst_dma_hready_o = 1'b1;
+            ahb_mst_dma_hresp_o  = ahb_resp_okay_e;
+          end
+        endcase
+      end
+
+      fsm_transfer_finish_st: begin
+        case ({mst_dma_mem_gnt_r, mst_dma_io_gnt_r, mst_dma_sram_gnt_r})
+          3'b001: begin
+            ahb_mst_dma_hrdata_o = ahb_slv_sram_hrdata_i;
+            ahb_mst_dma_hready_o = ahb_slv_sram_hreadyout_i;
+            ahb_mst_dma_hresp_o = ahb_slv_sram_hresp_i;
+          end
+
+          3'b010: begin
+            ahb_mst_dma_hrdata_o = ahb_slv_io_hrdata_i;
+            ahb_mst_dma_hready_o = ahb_slv_io_hreadyout_i;
+            ahb_mst_dma_hresp_o = ahb_slv_io_hresp_i;
+          end
+
+          3'b100: begin
+            ahb_mst_dma_hrdata_o = ahb_slv_mem_hrdata_i;
+            ahb_mst_dma_hready_o = ahb_slv_mem_hreadyout_i;
+            ahb_mst_dma_hresp_o = ahb_slv_mem_hresp_i;
+          end
+
+          default: begin
+            ahb_mst_dma_hrdata_o = 32'h00000000;
+            ahb_mst_dma_hready_o = 1'b1;
+            ahb_mst_dma_hresp_o  = ahb_resp_okay_e;
+          end
+        endcase
+      end
+
+      default: begin
+        ahb_mst_dma_hrdata_o = 32'h00000000;
+        ahb_mst_dma_hready_o = 1'b1;
+        ahb_mst_dma_hresp_o  = ahb_resp_okay_e;
+      end
+    endcase
+  end
+
+
+
+  // ------------------------------------------------------
+  // The Slaves:
+  // ------------------------------------------------------
+  // Slave 'mem' parking: re-grant the master of the current data phase without waiting for HREADYOUT, if it is the only requesting master
+  assign slv_mem_park_s = (|({mst_cpu_mem_req_s, mst_dsp_mem_req_s, mst_dma_mem_req_s} & {mst_cpu_mem_gnt_r, mst_dsp_mem_gnt_r, mst_dma_mem_gnt_r})) & ~(|({mst_cpu_mem_req_s, mst_dsp_mem_req_s, mst_dma_mem_req_s} & ~{mst_cpu_mem_gnt_r, mst_dsp_mem_gnt_r, mst_dma_mem_gnt_r}));
+
+
+  // Slave 'mem' least-recently-granted arbiter
+  always_comb begin: proc_mem_lrg_arb
+    logic arb_en_s;
+
+    arb_en_s = (ahb_slv_mem_hreadyout_i | slv_mem_park_s) & ~(mst_cpu_mem_keep_s | mst_dsp_mem_keep_s | mst_dma_mem_keep_s);
+
+    slv_mem_cpu_gnt_s = arb_en_s & mst_cpu_mem_req_s & (~mst_dsp_mem_req_s | slv_mem_lrg_r[1]) & (~mst_dma_mem_req_s | slv_mem_lrg_r[2]);
+    slv_mem_dsp_gnt_s = arb_en_s & mst_dsp_mem_req_s & (~mst_cpu_mem_req_s | ~slv_mem_lrg_r[1]) & (~mst_dma_mem_req_s | slv_mem_lrg_r[5]);
+    slv_mem_dma_gnt_s = arb_en_s & mst_dma_mem_req_s & (~mst_cpu_mem_req_s | ~slv_mem_lrg_r[2]) & (~mst_dsp_mem_req_s | ~slv_mem_lrg_r[5]);
+  end
+
+
+  always_ff @(posedge main_clk_i or negedge main_rst_an_i) begin: proc_mem_lrg
+    if (main_rst_an_i == 1'b0) begin
+      slv_mem_lrg_r <= 9'h026;  // initial order of masters
+    end else begin
+      slv_mem_lrg_r[1] <= (slv_mem_lrg_r[1] & ~slv_mem_cpu_gnt_s) | slv_mem_dsp_gnt_s; // cpu before dsp
+      slv_mem_lrg_r[2] <= (slv_mem_lrg_r[2] & ~slv_mem_cpu_gnt_s) | slv_mem_dma_gnt_s; // cpu before dma
+      slv_mem_lrg_r[5] <= (slv_mem_lrg_r[5] & ~slv_mem_dsp_gnt_s) | slv_mem_dma_gnt_s; // dsp before dma
+    end
+  end
+
+
+  // Slave 'mem' multiplexer
+  always_comb begin: proc_mem_mux
+      slv_mem_cpu_sel_s = slv_mem_cpu_gnt_s |
+                          (mst_cpu_mem_keep_s & mst_cpu_mem_gnt_r);
+      slv_mem_dsp_sel_s = slv_mem_dsp_gnt_s |
+                          (mst_dsp_mem_keep_s & mst_dsp_mem_gnt_r);
+      slv_mem_dma_sel_s = slv_mem_dma_gnt_s |
+                          (mst_dma_mem_keep_s & mst_dma_mem_gnt_r);
+
+    ahb_slv_mem_hsel_o = |{slv_mem_cpu_sel_s, slv_mem_dsp_sel_s, slv_mem_dma_sel_s};
+
+    case ({slv_mem_cpu_sel_s, slv_mem_dsp_sel_s, slv_mem_dma_sel_s})  // address phase signals
+      3'b001: begin
+        ahb_slv_mem_haddr_o     = mst_dma_haddr_s;
+        ahb_slv_mem_hwrite_o    = mst_dma_hwrite_s;
+        ahb_slv_mem_hburst_o    = mst_dma_hburst_s;
+        ahb_slv_mem_hsize_o     = mst_dma_hsize_s;
+        ahb_slv_mem_htrans_o    = mst_dma_htrans_s;
+        ahb_slv_mem_hprot_o     = mst_dma_hprot_s;
+        ahb_slv_mem_hready_o    = mst_dma_hready_s;
+      end
+
+      3'b010: begin
+        ahb_slv_mem_haddr_o     = mst_dsp_haddr_s;
+        ahb_slv_mem_hwrite_o    = mst_dsp_hwrite_s;
+        ahb_slv_mem_hburst_o    = mst_dsp_hburst_s;
+        ahb_slv_mem_hsize_o     = mst_dsp_hsize_s;
+        ahb_slv_mem_htrans_o    = mst_dsp_htrans_s;
+        ahb_slv_mem_hprot_o     = mst_dsp_hprot_s;
+        ahb_slv_mem_hready_o    = mst_dsp_hready_s;
+      end
+
+      3'b100: begin
+        ahb_slv_mem_haddr_o     = mst_cpu_haddr_s;
+        ahb_slv_mem_hwrite_o    = mst_cpu_hwrite_s;
+        ahb_slv_mem_hburst_o    = mst_cpu_hburst_s;
+        ahb_slv_mem_hsize_o     = mst_cpu_hsize_s;
+        ahb_slv_mem_htrans_o    = mst_cpu_htrans_s;
+        ahb_slv_mem_hprot_o     = mst_cpu_hprot_s;
+        ahb_slv_mem_hready_o    = mst_cpu_hready_s;
+      end
+
+      default: begin
+        ahb_slv_mem_haddr_o     = 32'h00000000;
+        ahb_slv_mem_hwrite_o    = ahb_write_read_e;
+        ahb_slv_mem_hburst_o    = ahb_burst_single_e;
+        ahb_slv_mem_hsize_o     = ahb_size_word_e;
+        ahb_slv_mem_htrans_o    = ahb_trans_idle_e;
+        ahb_slv_mem_hprot_o     = 4'h3;
+        ahb_slv_mem_hready_o    = ahb_slv_mem_hreadyout_i;
+      end
+    endcase
+
+
+    case ({mst_cpu_mem_gnt_r, mst_dsp_mem_gnt_r, mst_dma_mem_gnt_r})  // data phase signals
+      3'b001: begin
+        ahb_slv_mem_hwdata_o = ahb_mst_dma_hwdata_i;
+      end
+
+      3'b010: begin
+        ahb_slv_mem_hwdata_o = ahb_mst_dsp_hwdata_i;
+      end
+
+      3'b100: begin
+        ahb_slv_mem_hwdata_o = ahb_mst_cpu_hwdata_i;
+      end
+
+      default: begin
+        ahb_slv_mem_hwdata_o = 32'h00000000;
+      end
+    endcase
+  end
+
+  // Slave 'rom' parking on 'cpu': re-grant the master of the current data phase without waiting for HREADYOUT, if it is the only requesting master
+  assign slv_rom_park_s = (mst_cpu_rom_req_s & mst_cpu_rom_gnt_r) & ~(|({mst_cpu_rom_req_s, mst_dsp_rom_req_s} & ~{mst_cpu_rom_gnt_r, mst_dsp_rom_gnt_r}));
+
+
+  // Slave 'rom' weighted round-robin arbiter
+  always_comb begin: proc_rom_wrr_arb
+    integer i;
+    logic found_s;
+    logic [1:0] slv_req_s;
+    logic [1:0] prev_grant_s;
+    logic [1:0] next_grant_s;
+    logic arb_en_s;
+
+    slv_req_s = {mst_cpu_rom_req_s, mst_dsp_rom_req_s};
+    prev_grant_s = {slv_rom_cpu_gnt_r, slv_rom_dsp_gnt_r};
+    arb_en_s = ~(mst_cpu_rom_keep_s | mst_dsp_rom_keep_s);
+
+    next_grant_s = {prev_grant_s[0:0], prev_grant_s[1]}; // 1st candidate is old grant rotated 1 left
+    found_s = 1'b0;
+    for (i=0; i<2; i=i+1) begin
+      if (found_s == 1'b0) begin
+        if ((slv_req_s & next_grant_s) != 2'd0) begin
+          found_s = 1'b1;
+        end else begin
+          next_grant_s = {next_grant_s[0:0], next_grant_s[1]}; // rotate 1 left
+        end
+      end
+    end
+    if (((slv_req_s & prev_grant_s) != 2'd0) && (slv_rom_credit_r != 1'h0)) begin
+      next_grant_s = prev_grant_s; // old grant has consecutive grants left
+    end
+
+    {slv_rom_cpu_gnt_s, slv_rom_dsp_gnt_s} = slv_req_s & next_grant_s & {2{((ahb_slv_rom_hreadyout_i | slv_rom_park_s) & arb_en_s)}};
+  end
+
+
+  always_ff @(posedge main_clk_i or negedge main_rst_an_i) begin: proc_rom_gnt
+    if (main_rst_an_i == 1'b0) begin
+      slv_rom_cpu_gnt_r <= 1'b1;  // initial pseudo-grant
+      slv_rom_dsp_gnt_r <= 1'b0;
+      slv_rom_credit_r <= 1'h0;
+    end else begin
+      if (({slv_rom_cpu_gnt_s, slv_rom_dsp_gnt_s} != 2'd0) && (ahb_slv_rom_hreadyout_i == 1'b1)) begin  // parked re-grants repeat during wait states
+        slv_rom_cpu_gnt_r <= slv_rom_cpu_gnt_s;
+        slv_rom_dsp_gnt_r <= slv_rom_dsp_gnt_s;
+        if ((({slv_rom_cpu_gnt_s, slv_rom_dsp_gnt_s} & {slv_rom_cpu_gnt_r, slv_rom_dsp_gnt_r}) != 2'd0) && (slv_rom_credit_r != 1'h0)) begin
+          slv_rom_credit_r <= slv_rom_credit_r - 1'b1;
+        end else begin
+          case ({slv_rom_cpu_gnt_s, slv_rom_dsp_gnt_s})
+            2'b01: begin
+              slv_rom_credit_r <= 1'h0; // dsp
+            end
+            2'b10: begin
+              slv_rom_credit_r <= 1'h1; // cpu
+            end
+            default: begin
+              slv_rom_credit_r <= 1'h0;
+            end
+          endcase
+        end
+      end
+    end
+  end
+
+
+  // Slave 'rom' multiplexer
+  always_comb begin: proc_rom_mux
+      slv_rom_cpu_sel_s = slv_rom_cpu_gnt_s |
+                          (mst_cpu_rom_keep_s & mst_cpu_rom_gnt_r);
+      slv_rom_dsp_sel_s = slv_rom_dsp_gnt_s |
+                          (mst_dsp_rom_keep_s & mst_dsp_rom_gnt_r);
+
+    ahb_slv_rom_hsel_o = |{slv_rom_cpu_sel_s, slv_rom_dsp_sel_s};
+
+    case ({slv_rom_cpu_sel_s, slv_rom_dsp_sel_s})  // address phase signals
+      2'b01: begin
+        ahb_slv_rom_haddr_o     = mst_dsp_haddr_s;
+        ahb_slv_rom_hwrite_o    = mst_dsp_hwrite_s;
+        ahb_slv_rom_hburst_o    = mst_dsp_hburst_s;
+        ahb_slv_rom_hsize_o     = mst_dsp_hsize_s;
+        ahb_slv_rom_htrans_o    = mst_dsp_htrans_s;
+        ahb_slv_rom_hprot_o     = mst_dsp_hprot_s;
+        ahb_slv_rom_hready_o    = mst_dsp_hready_s;
+      end
+
+      2'b10: begin
+        ahb_slv_rom_haddr_o     = mst_cpu_haddr_s;
+        ahb_slv_rom_hwrite_o    = mst_cpu_hwrite_s;
+        ahb_slv_rom_hburst_o    = mst_cpu_hburst_s;
+        ahb_slv_rom_hsize_o     = mst_cpu_hsize_s;
+        ahb_slv_rom_htrans_o    = mst_cpu_htrans_s;
+        ahb_slv_rom_hprot_o     = mst_cpu_hprot_s;
+        ahb_slv_rom_hready_o    = mst_cpu_hready_s;
+      end
+
+      default: begin
+        ahb_slv_rom_haddr_o     = 32'h00000000;
+        ahb_slv_rom_hwrite_o    = ahb_write_read_e;
+        ahb_slv_rom_hburst_o    = ahb_burst_single_e;
+        ahb_slv_rom_hsize_o     = ahb_size_word_e;
+        ahb_slv_rom_htrans_o    = ahb_trans_idle_e;
+        ahb_slv_rom_hprot_o     = 4'h3;
+        ahb_slv_rom_hready_o    = ahb_slv_rom_hreadyout_i;
+      end
+    endcase
+
+
+    case ({mst_cpu_rom_gnt_r, mst_dsp_rom_gnt_r})  // data phase signals
+      2'b01: begin
+        ahb_slv_rom_hwdata_o = ahb_mst_dsp_hwdata_i;
+      end
+
+      2'b10: begin
+        ahb_slv_rom_hwdata_o = ahb_mst_cpu_hwdata_i;
+      end
+
+      default: begin
+        ahb_slv_rom_hwdata_o = 32'h00000000;
+      end
+    endcase
+  end
+
+  // Slave 'io' fixed-priority arbiter
+  always_comb begin: proc_io_fixed_arb
+    logic arb_en_s;
+
+    arb_en_s = ahb_slv_io_hreadyout_i & ~(mst_dsp_io_keep_s | mst_dma_io_keep_s);
+
+    slv_io_dsp_gnt_s = 1'b0;
+    slv_io_dma_gnt_s = 1'b0;
+    if (arb_en_s == 1'b1) begin
+      if (mst_dsp_io_req_s == 1'b1) begin  // weight 1
+        slv_io_dsp_gnt_s = 1'b1;
+      end else if (mst_dma_io_req_s == 1'b1) begin  // weight 1
+        slv_io_dma_gnt_s = 1'b1;
+      end
+    end
+  end
+
+
+  // Slave 'io' multiplexer
+  always_comb begin: proc_io_mux
+      slv_io_dsp_sel_s = slv_io_dsp_gnt_s |
+                         (mst_dsp_io_keep_s & mst_dsp_io_gnt_r);
+      slv_io_dma_sel_s = slv_io_dma_gnt_s |
+                         (mst_dma_io_keep_s & mst_dma_io_gnt_r);
+
+    ahb_slv_io_hsel_o = |{slv_io_dsp_sel_s, slv_io_dma_sel_s};
+
+    case ({slv_io_dsp_sel_s, slv_io_dma_sel_s})  // address phase signals
+      2'b01: begin
+        ahb_slv_io_haddr_o     = mst_dma_haddr_s;
+        ahb_slv_io_hwrite_o    = mst_dma_hwrite_s;
+        ahb_slv_io_hburst_o    = mst_dma_hburst_s;
+        ahb_slv_io_hsize_o     = mst_dma_hsize_s;
+        ahb_slv_io_htrans_o    = mst_dma_htrans_s;
+        ahb_slv_io_hprot_o     = mst_dma_hprot_s;
+        ahb_slv_io_hready_o    = mst_dma_hready_s;
+      end
+
+      2'b10: begin
+        ahb_slv_io_haddr_o     = mst_dsp_haddr_s;
+        ahb_slv_io_hwrite_o    = mst_dsp_hwrite_s;
+        ahb_slv_io_hburst_o    = mst_dsp_hburst_s;
+        ahb_slv_io_hsize_o     = mst_dsp_hsize_s;
+        ahb_slv_io_htrans_o    = mst_dsp_htrans_s;
+        ahb_slv_io_hprot_o     = mst_dsp_hprot_s;
+        ahb_slv_io_hready_o    = mst_dsp_hready_s;
+      end
+
+      default: begin
+        ahb_slv_io_haddr_o     = 32'h00000000;
+        ahb_slv_io_hwrite_o    = ahb_write_read_e;
+        ahb_slv_io_hburst_o    = ahb_burst_single_e;
+        ahb_slv_io_hsize_o     = ahb_size_word_e;
+        ahb_slv_io_htrans_o    = ahb_trans_idle_e;
+        ahb_slv_io_hprot_o     = 4'h3;
+        ahb_slv_io_hready_o    = ahb_slv_io_hreadyout_i;
+      end
+    endcase
+
+
+    case ({mst_dsp_io_gnt_r, mst_dma_io_gnt_r})  // data phase signals
+      2'b01: begin
+        ahb_slv_io_hwdata_o = ahb_mst_dma_hwdata_i;
+      end
+
+      2'b10: begin
+        ahb_slv_io_hwdata_o = ahb_mst_dsp_hwdata_i;
+      end
+
+      default: begin
+        ahb_slv_io_hwdata_o = 32'h00000000;
+      end
+    endcase
+  end
+
+  // Slave 'sram': no arbitration necessary
+  always_comb begin: proc_sram_asgn
+    slv_sram_dma_gnt_s = mst_dma_sram_req_s;
+
+    ahb_slv_sram_hsel_o        = mst_dma_sram_req_s | (mst_dma_sram_gnt_r & mst_dma_cont_xfer_s);  // address phase signals
+    if (mst_dma_sram_sel_s == 1'b1) begin
+      ahb_slv_sram_haddr_o     = ahb_mst_dma_haddr_i;
+      ahb_slv_sram_hwrite_o    = ahb_mst_dma_hwrite_i;
+      ahb_slv_sram_hburst_o    = ahb_mst_dma_hburst_i;
+      ahb_slv_sram_hsize_o     = ahb_mst_dma_hsize_i;
+      ahb_slv_sram_htrans_o    = ahb_mst_dma_htrans_i;
+      ahb_slv_sram_hprot_o     = ahb_mst_dma_hprot_i;
+      ahb_slv_sram_hready_o    = mst_dma_hready_s;
+    end else begin
+      ahb_slv_sram_haddr_o     = 32'h00000000;
+      ahb_slv_sram_hwrite_o    = ahb_write_read_e;
+      ahb_slv_sram_hburst_o    = ahb_burst_single_e;
+      ahb_slv_sram_hsize_o     = ahb_size_word_e;
+      ahb_slv_sram_htrans_o    = ahb_trans_idle_e;
+      ahb_slv_sram_hprot_o     = 4'h3;
+      ahb_slv_sram_hready_o    = ahb_slv_sram_hreadyout_i;
+    end
+
+
+    if (mst_dma_sram_gnt_r == 1'b1) begin  // data phase signals
+      ahb_slv_sram_hwdata_o = ahb_mst_dma_hwdata_i;
+    end else begin
+      ahb_slv_sram_hwdata_o = 32'h00000000;
+    end
+  end
+
+
+endmodule // ucdp_ahb_ml_park_example_ml
+
+`default_nettype wire
+`end_keywords
+
+// =============================================================================
+//
+//   @generated @fully-generated
+//
+//   THIS FILE IS GENERATED!!! DO NOT EDIT MANUALLY. CHANGES ARE LOST.
+//
+// =============================================================================
@@ -0,0 +1,936 @@
+// =============================================================================
+//
+//   @generated @fully-generated
+//
+//   THIS FILE IS GENERATED!!! DO NOT EDIT MANUALLY. CHANGES ARE LOST.
+//
+// =============================================================================
+//
+//  MIT License
+//
+//  Copyright (c) 2024-2025 nbiotcloud
+//
+//  Permission is hereby granted, free of charge, to any person obtaining a copy
+//  of this software and associated documentation files (the "Software"), to deal
+//  in the Software without restriction, including without limitation the rights
+//  to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+//  copies of the Software, and to permit persons to whom the Software is
+//  furnished to do so, subject to the following conditions:
+//
+//  The above copyright notice and this permission notice shall be included in all
+//  copies or substantial portions of the Software.
+//
+//  THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+//  IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+//  FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+//  AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+//  LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+//  OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+//  SOFTWARE.
+//
+// =============================================================================
+//
+// Module:     ucdp_amba.ucdp_ahb_ml_rr_example_loop
+// Data Model: ucdp_amba.ucdp_ahb_ml.UcdpAhbMlMod
+//
+//
+// | Master > Slave | mem | io | rom |
+// | -------------- | --- | -- | --- |
+// | cpu            | X   | X  | X   |
+// | dsp            | X   | X  |     |
+// | dma            | X   | X  |     |
+// | eth            | X   |    |     |
+// | usb            | X   |    |     |
+// | gpu            | X   |    | X   |
+//
+//
+//
+// * Top:     `None`
+// * Defines: `None`
+// * Size:    `12 KB`
+//
+// | Addrspace | Type     | Base     | Size             | Infos | Attributes |
+// | --------- | -------- | -------- | ---------------- | ----- | ---------- |
+// | mem       | Slave    | `0x0`    | `1024x32 (4 KB)` |       |            |
+// | io        | Slave    | `0x1000` | `1024x32 (4 KB)` |       |            |
+// | rom       | Slave    | `0x2000` | `1024x32 (4 KB)` |       |            |
+// | reserved0 | Reserved | `0x3000` | `1024x32 (4 KB)` |       |            |
+//
+// =============================================================================
+
+`begin_keywords "1800-2009"
+`default_nettype none  // implicit wires are forbidden
+
+module ucdp_ahb_ml_rr_example_loop ( // ucdp_amba.ucdp_ahb_ml.UcdpAhbMlMod
+  // main_i: Clock and Reset
+  input  wire         main_clk_i,              // Clock
+  input  wire         main_rst_an_i,           // Async Reset (Low-Active)
+  // ahb_mst_cpu_i: AHB Input 'cpu'
+  input  wire  [1:0]  ahb_mst_cpu_htrans_i,    // AHB Transfer Type
+  input  wire  [31:0] ahb_mst_cpu_haddr_i,     // AHB Bus Address
+  input  wire         ahb_mst_cpu_hwrite_i,    // AHB Write Enable
+  input  wire  [2:0]  ahb_mst_cpu_hsize_i,     // AHB Size
+  input  wire  [2:0]  ahb_mst_cpu_hburst_i,    // AHB Burst Type
+  input  wire  [3:0]  ahb_mst_cpu_hprot_i,     // AHB Transfer Protection
+  input  wire  [31:0] ahb_mst_cpu_hwdata_i,    // AHB Data
+  output logic        ahb_mst_cpu_hready_o,    // AHB Transfer Done
+  output logic        ahb_mst_cpu_hresp_o,     // AHB Response Error
+  output logic [31:0] ahb_mst_cpu_hrdata_o,    // AHB Data
+  // ahb_mst_dsp_i: AHB Input 'dsp'
+  input  wire  [1:0]  ahb_mst_dsp_htrans_i,    // AHB Transfer Type
+  input  wire  [31:0] ahb_mst_dsp_haddr_i,     // AHB Bus Address
+  input  wire         ahb_mst_dsp_hwrite_i,    // AHB Write Enable
+  input  wire  [2:0]  ahb_mst_dsp_hsize_i,     // AHB Size
+  input  wire  [2:0]  ahb_mst_dsp_hburst_i,    // AHB Burst Type
+  input  wire  [3:0]  ahb_mst_dsp_hprot_i,     // AHB Transfer Protection
+  input  wire  [31:0] ahb_mst_dsp_hwdata_i,    // AHB Data
+  output logic        ahb_mst_dsp_hready_o,    // AHB Transfer Done
+  output logic        ahb_mst_dsp_hresp_o,     // AHB Response Error
+  output logic [31:0] ahb_mst_dsp_hrdata_o,    // AHB Data
+  // ahb_mst_dma_i: AHB Input 'dma'
+  input  wire  [1:0]  ahb_mst_dma_htrans_i,    // AHB Transfer Type
+  input  wire  [31:0] ahb_mst_dma_haddr_i,     // AHB Bus Address
+  input  wire         ahb_mst_dma_hwrite_i,    // AHB Write Enable
+  input  wire  [2:0]  ahb_mst_dma_hsize_i,     // AHB Size
+  input  wire  [2:0]  ahb_mst_dma_hburst_i,    // AHB Burst Type
+  input  wire  [3:0]  ahb_mst_dma_hprot_i,     // AHB Transfer Protection
+  input  wire  [31:0] ahb_mst_dma_hwdata_i,    // AHB Data
+  output logic        ahb_mst_dma_hready_o,    // AHB Transfer Done
+  output logic        ahb_mst_dma_hresp_o,     // AHB Response Error
+  output logic [31:0] ahb_mst_dma_hrdata_o,    // AHB Data
+  // ahb_mst_eth_i: AHB Input 'eth'
+  input  wire  [1:0]  ahb_mst_eth_htrans_i,    // AHB Transfer Type
+  input  wire  [31:0] ahb_mst_eth_haddr_i,     // AHB Bus Address
+  input  wire         ahb_mst_eth_hwrite_i,    // AHB Write Enable
+  input  wire  [2:0]  ahb_mst_eth_hsize_i,     // AHB Size
+  input  wire  [2:0]  ahb_mst_eth_hburst_i,    // AHB Burst Type
+  input  wire  [3:0]  ahb_mst_eth_hprot_i,     // AHB Transfer Protection
+  input  wire  [31:0] ahb_mst_eth_hwdata_i,    // AHB Data
+  output logic        ahb_mst_eth_hready_o,    // AHB Transfer Done
+  output logic        ahb_mst_eth_hresp_o,     // AHB Response Error
+  output logic [31:0] ahb_mst_eth_hrdata_o,    // AHB Data
+  // ahb_mst_usb_i: AHB Input 'usb'
+  input  wire  [1:0]  ahb_mst_usb_htrans_i,    // AHB Transfer Type
+  input  wire  [31:0] ahb_mst_usb_haddr_i,     // AHB Bus Address
+  input  wire         ahb_mst_usb_hwrite_i,    // AHB Write Enable
+  input  wire  [2:0]  ahb_mst_usb_hsize_i,     // AHB Size
+  input  wire  [2:0]  ahb_mst_usb_hburst_i,    // AHB Burst Type
+  input  wire  [3:0]  ahb_mst_usb_hprot_i,     // AHB Transfer Protection
+  input  wire  [31:0] ahb_mst_usb_hwdata_i,    // AHB Data
+  output logic        ahb_mst_usb_hready_o,    // AHB Transfer Done
+  output logic        ahb_mst_usb_hresp_o,     // AHB Response Error
+  output logic [31:0] ahb_mst_usb_hrdata_o,    // AHB Data
+  // ahb_mst_gpu_i: AHB Input 'gpu'
+  input  wire  [1:0]  ahb_mst_gpu_htrans_i,    // AHB Transfer Type
+  input  wire  [31:0] ahb_mst_gpu_haddr_i,     // AHB Bus Address
+  input  wire         ahb_mst_gpu_hwrite_i,    // AHB Write Enable
+  input  wire  [2:0]  ahb_mst_gpu_hsize_i,     // AHB Size
+  input  wire  [2:0]  ahb_mst_gpu_hburst_i,    // AHB Burst Type
+  input  wire  [3:0]  ahb_mst_gpu_hprot_i,     // AHB Transfer Protection
+  input  wire  [31:0] ahb_mst_gpu_hwdata_i,    // AHB Data
+  output logic        ahb_mst_gpu_hready_o,    // AHB Transfer Done
+  output logic        ahb_mst_gpu_hresp_o,     // AHB Response Error
+  output logic [31:0] ahb_mst_gpu_hrdata_o,    // AHB Data
+  // ahb_slv_mem_o: AHB Output 'mem'
+  output logic        ahb_slv_mem_hsel_o,      // AHB Slave Select
+  output logic [31:0] ahb_slv_mem_haddr_o,     // AHB Bus Address
+  output logic        ahb_slv_mem_hwrite_o,    // AHB Write Enable
+  output logic [1:0]  ahb_slv_mem_htrans_o,    // AHB Transfer Type
+  output logic [2:0]  ahb_slv_mem_hsize_o,     // AHB Size
+  output logic [2:0]  ahb_slv_mem_hburst_o,    // AHB Burst Type
+  output logic [3:0]  ahb_slv_mem_hprot_o,     // AHB Transfer Protection
+  output logic [31:0] ahb_slv_mem_hwdata_o,    // AHB Data
+  output logic        ahb_slv_mem_hready_o,    // AHB Transfer Done to Slave
+  input  wire         ahb_slv_mem_hreadyout_i, // AHB Transfer Done from Slave
+  input  wire         ahb_slv_mem_hresp_i,     // AHB Response Error
+  input  wire  [31:0] ahb_slv_mem_hrdata_i,    // AHB Data
+  // ahb_slv_io_o: AHB Output 'io'
+  output logic        ahb_slv_io_hsel_o,       // AHB Slave Select
+  output logic [31:0] ahb_slv_io_haddr_o,      // AHB Bus Address
+  output logic        ahb_slv_io_hwrite_o,     // AHB Write Enable
+  output logic [1:0]  ahb_slv_io_htrans_o,     // AHB Transfer Type
+  output logic [2:0]  ahb_slv_io_hsize_o,      // AHB Size
+  output logic [2:0]  ahb_slv_io_hburst_o,     // AHB Burst Type
+  output logic [3:0]  ahb_slv_io_hprot_o,      // AHB Transfer Protection
+  output logic [31:0] ahb_slv_io_hwdata_o,     // AHB Data
+  output logic        ahb_slv_io_hready_o,     // AHB Transfer Done to Slave
+  input  wire         ahb_slv_io_hreadyout_i,  // AHB Transfer Done from Slave
+  input  wire         ahb_slv_io_hresp_i,      // AHB Response Error
+  input  wire  [31:0] ahb_slv_io_hrdata_i,     // AHB Data
+  // ahb_slv_rom_o: AHB Output 'rom'
+  output logic        ahb_slv_rom_hsel_o,      // AHB Slave Select
+  output logic [31:0] ahb_slv_rom_haddr_o,     // AHB Bus Address
+  output logic        ahb_slv_rom_hwrite_o,    // AHB Write Enable
+  output logic [1:0]  ahb_slv_rom_htrans_o,    // AHB Transfer Type
+  output logic [2:0]  ahb_slv_rom_hsize_o,     // AHB Size
+  output logic [2:0]  ahb_slv_rom_hburst_o,    // AHB Burst Type
+  output logic [3:0]  ahb_slv_rom_hprot_o,     // AHB Transfer Protection
+  output logic [31:0] ahb_slv_rom_hwdata_o,    // AHB Data
+  output logic        ahb_slv_rom_hready_o,    // AHB Transfer Done to Slave
+  input  wire         ahb_slv_rom_hreadyout_i, // AHB Transfer Done from Slave
+  input  wire         ahb_slv_rom_hresp_i,     // AHB Response Error
+  input  wire  [31:0] ahb_slv_rom_hrdata_i     // AHB Data
+);
+
+
+
+
+  // ------------------------------------------------------
+  //  Local Parameter
+  // ------------------------------------------------------
+  // ahb_trans
+  localparam integer       ahb_trans_width_p      = 2;    // Width in Bits
+  localparam logic   [1:0] ahb_trans_min_p        = 2'h0; // AHB Transfer Type
+  localparam logic   [1:0] ahb_trans_max_p        = 2'h3; // AHB Transfer Type
+  localparam logic   [1:0] ahb_trans_idle_e       = 2'h0; // No transfer
+  localparam logic   [1:0] ahb_trans_busy_e       = 2'h1; // Idle cycle within transfer
+  localparam logic   [1:0] ahb_trans_nonseq_e     = 2'h2; // Single transfer or first transfer of a burst
+  localparam logic   [1:0] ahb_trans_seq_e        = 2'h3; // Consecutive transfers of a burst
+  localparam logic   [1:0] ahb_trans_default_p    = 2'h0; // AHB Transfer Type
+  // ahb_resp
+  localparam integer       ahb_resp_width_p       = 1;    // Width in Bits
+  localparam logic         ahb_resp_min_p         = 1'b0; // AHB Response Error
+  localparam logic         ahb_resp_max_p         = 1'b1; // AHB Response Error
+  localparam logic         ahb_resp_okay_e        = 1'b0; // OK
+  localparam logic         ahb_resp_error_e       = 1'b1; // Error
+  localparam logic         ahb_resp_default_p     = 1'b0; // AHB Response Error
+  // ahb_size
+  localparam integer       ahb_size_width_p       = 3;    // Width in Bits
+  localparam logic   [2:0] ahb_size_min_p         = 3'h0; // AHB Size
+  localparam logic   [2:0] ahb_size_max_p         = 3'h7; // AHB Size
+  localparam logic   [2:0] ahb_size_byte_e        = 3'h0; // Byte
+  localparam logic   [2:0] ahb_size_halfword_e    = 3'h1; // Halfword
+  localparam logic   [2:0] ahb_size_word_e        = 3'h2; // Word
+  localparam logic   [2:0] ahb_size_doubleword_e  = 3'h3; // Doubleword
+  localparam logic   [2:0] ahb_size_fourword_e    = 3'h4; // 4-word
+  localparam logic   [2:0] ahb_size_eightword_e   = 3'h5; // 8-word
+  localparam logic   [2:0] ahb_size_sixteenword_e = 3'h6; // 16-word
+  localparam logic   [2:0] ahb_size_kilobit_e     = 3'h7; // 32-word
+  localparam logic   [2:0] ahb_size_default_p     = 3'h0; // AHB Size
+  // ahb_burst
+  localparam integer       ahb_burst_width_p      = 3;    // Width in Bits
+  localparam logic   [2:0] ahb_burst_min_p        = 3'h0; // AHB Burst Type
+  localparam logic   [2:0] ahb_burst_max_p        = 3'h7; // AHB Burst Type
+  localparam logic   [2:0] ahb_burst_single_e     = 3'h0; // Single transfer
+  localparam logic   [2:0] ahb_burst_incr_e       = 3'h1; // Incrementing burst of unspecified length
+  localparam logic   [2:0] ahb_burst_wrap4_e      = 3'h2; // 4-beat wrapping burst
+  localparam logic   [2:0] ahb_burst_incr4_e      = 3'h3; // 4-beat incrementing burst
+  localparam logic   [2:0] ahb_burst_wrap8_e      = 3'h4; // 8-beat wrapping burst
+  localparam logic   [2:0] ahb_burst_incr8_e      = 3'h5; // 8-beat incrementing burst
+  localparam logic   [2:0] ahb_burst_wrap16_e     = 3'h6; // 16-beat wrapping burst
+  localparam logic   [2:0] ahb_burst_incr16_e     = 3'h7; // 16-beat incrementing burst
+  localparam logic   [2:0] ahb_burst_default_p    = 3'h0; // AHB Burst Type
+  // ahb_write
+  localparam integer       ahb_write_width_p      = 1;    // Width in Bits
+  localparam logic         ahb_write_min_p        = 1'b0; // AHB Write Enable
+  localparam logic         ahb_write_max_p        = 1'b1; // AHB Write Enable
+  localparam logic         ahb_write_read_e       = 1'b0; // Read operation
+  localparam logic         ahb_write_write_e      = 1'b1; // Write operation
+  localparam logic         ahb_write_default_p    = 1'b0; // AHB Write Enable
+  // fsm
+  localparam integer       fsm_width_p            = 3;    // Width in Bits
+  localparam logic   [2:0] fsm_min_p              = 3'h0; // AHB ML FSM Type
+  localparam logic   [2:0] fsm_max_p              = 3'h7; // AHB ML FSM Type
+  localparam logic   [2:0] fsm_idle_st            = 3'h0; // No transfer
+  localparam logic   [2:0] fsm_transfer_st        = 3'h1; // Transfer
+  localparam logic   [2:0] fsm_transfer_finish_st = 3'h2; // Transfer Finish (wait for HREADY)
+  localparam logic   [2:0] fsm_transfer_wait_st   = 3'h3; // Transfer Wait for Grant
+  localparam logic   [2:0] fsm_error0_st          = 3'h4; // Pre-Error (wait for HREADY)
+  localparam logic   [2:0] fsm_error1_st          = 3'h5; // 1st Error Cycle
+  localparam logic   [2:0] fsm_error2_st          = 3'h6; // 2nd Error Cycle
+  localparam logic   [2:0] fsm_default_p          = 3'h0; // AHB ML FSM Type
+
+
+  // ------------------------------------------------------
+  //  Signals
+  // ------------------------------------------------------
+  logic [1:0]  ahb_mst_htrans_s     [0:5];
+  logic [31:0] ahb_mst_haddr_s      [0:5];
+  logic        ahb_mst_hwrite_s     [0:5];
+  logic [2:0]  ahb_mst_hsize_s      [0:5];
+  logic [2:0]  ahb_mst_hburst_s     [0:5];
+  logic [3:0]  ahb_mst_hprot_s      [0:5];
+  logic [31:0] ahb_mst_hwdata_s     [0:5];
+  logic        ahb_mst_hready_s     [0:5];
+  logic        ahb_mst_hresp_s      [0:5];
+  logic [31:0] ahb_mst_hrdata_s     [0:5];
+  logic        ahb_slv_hsel_s       [0:2];
+  logic [1:0]  ahb_slv_htrans_s     [0:2];
+  logic [31:0] ahb_slv_haddr_s      [0:2];
+  logic        ahb_slv_hwrite_s     [0:2];
+  logic [2:0]  ahb_slv_hsize_s      [0:2];
+  logic [2:0]  ahb_slv_hburst_s     [0:2];
+  logic [3:0]  ahb_slv_hprot_s      [0:2];
+  logic        ahb_slv_hready_s     [0:2];
+  logic [31:0] ahb_slv_hwdata_s     [0:2];
+  logic [2:0]  ahb_slv_hreadyout_s;        // bit `n` is slave index `n`
+  logic        ahb_slv_hresp_s      [0:2];
+  logic [31:0] ahb_slv_hrdata_s     [0:2];
+  logic [2:0]  fsm_r                [0:5]; // Master FSMs
+  logic        mst_new_xfer_s       [0:5];
+  logic        mst_cont_xfer_s      [0:5];
+  logic        mst_hready_s         [0:5];
+  logic        mst_rqstate_s        [0:5];
+  logic        mst_addr_err_s       [0:5];
+  logic        mst_gnt_s            [0:5];
+  logic [2:0]  mst_sel_s            [0:5]; // bit `n` is slave index `n`
+  logic [2:0]  mst_req_s            [0:5]; // bit `n` is slave index `n`
+  logic [2:0]  mst_req_r            [0:5]; // bit `n` is slave index `n`
+  logic [2:0]  mst_keep_s           [0:5]; // bit `n` is slave index `n`
+  logic [2:0]  mst_gnt_r            [0:5]; // bit `n` is slave index `n` in data phase, switches with HREADY only
+  logic [2:0]  mst_slvgnt_s         [0:5]; // bit `n` is slave index `n`
+  logic [1:0]  mst_htrans_s         [0:5];
+  logic [1:0]  mst_htrans_r         [0:5];
+  logic [31:0] mst_haddr_s          [0:5];
+  logic [31:0] mst_haddr_r          [0:5];
+  logic        mst_hwrite_s         [0:5];
+  logic        mst_hwrite_r         [0:5];
+  logic [2:0]  mst_hsize_s          [0:5];
+  logic [2:0]  mst_hsize_r          [0:5];
+  logic [2:0]  mst_hburst_s         [0:5];
+  logic [2:0]  mst_hburst_r         [0:5];
+  logic [3:0]  mst_hprot_s          [0:5];
+  logic [3:0]  mst_hprot_r          [0:5];
+  logic        mst_hwrite_dph_r     [0:5]; // data-phase write indicator
+  logic [5:0]  slv_req_s            [0:2]; // bit `n` is the `n`-th master of the slave
+  logic [5:0]  slv_keep_s           [0:2]; // bit `n` is the `n`-th master of the slave
+  logic [5:0]  slv_dph_s            [0:2]; // bit `n` is the `n`-th master of the slave
+  logic [5:0]  slv_asel_s           [0:2]; // bit `n` is the `n`-th master of the slave
+  logic [5:0]  slv_gnt_s            [0:2]; // bit `n` is the `n`-th master of the slave
+  logic [5:0]  slv_gnt_r            [0:2]; // bit `n` is the `n`-th master of the slave
+
+
+  // ------------------------------------------------------
+  // Connectivity:
+  //   masters `m` and slaves `s` are indexed in order of creation,
+  //   position `p` is the index of a master within the masters of a slave.
+  // ------------------------------------------------------
+  localparam logic [17:0] mst_slvmask = 18'h292DF;          // bit `m*3+s`: master `m` accesses slave `s`
+  localparam logic [5:0]  mst_sole    = 6'h18;              // bit `m`: master `m` accesses one slave only
+  localparam logic [2:0]  slv_multi   = 3'h7;               // bit `s`: slave `s` is accessed by multiple masters
+  localparam logic [17:0] slv_posmask = 18'h031FF;          // bit `s*6+p`: slave `s` has a `p`-th master
+  localparam logic [53:0] slv_mstidx  = 54'h0002800222C688; // bits `(s*6+p)*3`: index of the `p`-th master of slave `s`
+  localparam logic [53:0] mst_slvpos  = 54'h08A04018481200; // bits `(m*3+s)*3`: position of master `m` at slave `s`
+
+
+  // ------------------------------------------------------
+  // Ports:
+  // ------------------------------------------------------
+  always_comb begin: proc_pack
+    ahb_mst_htrans_s[0]    = ahb_mst_cpu_htrans_i;
+    ahb_mst_haddr_s[0]     = ahb_mst_cpu_haddr_i;
+    ahb_mst_hwrite_s[0]    = ahb_mst_cpu_hwrite_i;
+    ahb_mst_hsize_s[0]     = ahb_mst_cpu_hsize_i;
+    ahb_mst_hburst_s[0]    = ahb_mst_cpu_hburst_i;
+    ahb_mst_hprot_s[0]     = ahb_mst_cpu_hprot_i;
+    ahb_mst_hwdata_s[0]    = ahb_mst_cpu_hwdata_i;
+    ahb_mst_htrans_s[1]    = ahb_mst_dsp_htrans_i;
+    ahb_mst_haddr_s[1]     = ahb_mst_dsp_haddr_i;
+    ahb_mst_hwrite_s[1]    = ahb_mst_dsp_hwrite_i;
+    ahb_mst_hsize_s[1]     = ahb_mst_dsp_hsize_i;
+    ahb_mst_hburst_s[1]    = ahb_mst_dsp_hburst_i;
+    ahb_mst_hprot_s[1]     = ahb_mst_dsp_hprot_i;
+    ahb_mst_hwdata_s[1]    = ahb_mst_dsp_hwdata_i;
+    ahb_mst_htrans_s[2]    = ahb_mst_dma_htrans_i;
+    ahb_mst_haddr_s[2]     = ahb_mst_dma_haddr_i;
+    ahb_mst_hwrite_s[2]    = ahb_mst_dma_hwrite_i;
+    ahb_mst_hsize_s[2]     = ahb_mst_dma_hsize_i;
+    ahb_mst_hburst_s[2]    = ahb_mst_dma_hburst_i;
+    ahb_mst_hprot_s[2]     = ahb_mst_dma_hprot_i;
+    ahb_mst_hwdata_s[2]    = ahb_mst_dma_hwdata_i;
+    ahb_mst_htrans_s[3]    = ahb_mst_eth_htrans_i;
+    ahb_mst_haddr_s[3]     = ahb_mst_eth_haddr_i;
+    ahb_mst_hwrite_s[3]    = ahb_mst_eth_hwrite_i;
+    ahb_mst_hsize_s[3]     = ahb_mst_eth_hsize_i;
+    ahb_mst_hburst_s[3]    = ahb_mst_eth_hburst_i;
+    ahb_mst_hprot_s[3]     = ahb_mst_eth_hprot_i;
+    ahb_mst_hwdata_s[3]    = ahb_mst_eth_hwdata_i;
+    ahb_mst_htrans_s[4]    = ahb_mst_usb_htrans_i;
+    ahb_mst_haddr_s[4]     = ahb_mst_usb_haddr_i;
+    ahb_mst_hwrite_s[4]    = ahb_mst_usb_hwrite_i;
+    ahb_mst_hsize_s[4]     = ahb_mst_usb_hsize_i;
+    ahb_mst_hburst_s[4]    = ahb_mst_usb_hburst_i;
+    ahb_mst_hprot_s[4]     = ahb_mst_usb_hprot_i;
+    ahb_mst_hwdata_s[4]    = ahb_mst_usb_hwdata_i;
+    ahb_mst_htrans_s[5]    = ahb_mst_gpu_htrans_i;
+    ahb_mst_haddr_s[5]     = ahb_mst_gpu_haddr_i;
+    ahb_mst_hwrite_s[5]    = ahb_mst_gpu_hwrite_i;
+    ahb_mst_hsize_s[5]     = ahb_mst_gpu_hsize_i;
+    ahb_mst_hburst_s[5]    = ahb_mst_gpu_hburst_i;
+    ahb_mst_hprot_s[5]     = ahb_mst_gpu_hprot_i;
+    ahb_mst_hwdata_s[5]    = ahb_mst_gpu_hwdata_i;
+    ahb_slv_hreadyout_s[0] = ahb_slv_mem_hreadyout_i;
+    ahb_slv_hresp_s[0]     = ahb_slv_mem_hresp_i;
+    ahb_slv_hrdata_s[0]    = ahb_slv_mem_hrdata_i;
+    ahb_slv_hreadyout_s[1] = ahb_slv_io_hreadyout_i;
+    ahb_slv_hresp_s[1]     = ahb_slv_io_hresp_i;
+    ahb_slv_hrdata_s[1]    = ahb_slv_io_hrdata_i;
+    ahb_slv_hreadyout_s[2] = ahb_slv_rom_hreadyout_i;
+    ahb_slv_hresp_s[2]     = ahb_slv_rom_hresp_i;
+    ahb_slv_hrdata_s[2]    = ahb_slv_rom_hrdata_i;
+  end
+
+  always_comb begin: proc_unpack
+    ahb_mst_cpu_hready_o = ahb_mst_hready_s[0];
+    ahb_mst_cpu_hresp_o  = ahb_mst_hresp_s[0];
+    ahb_mst_cpu_hrdata_o = ahb_mst_hrdata_s[0];
+    ahb_mst_dsp_hready_o = ahb_mst_hready_s[1];
+    ahb_mst_dsp_hresp_o  = ahb_mst_hresp_s[1];
+    ahb_mst_dsp_hrdata_o = ahb_mst_hrdata_s[1];
+    ahb_mst_dma_hready_o = ahb_mst_hready_s[2];
+    ahb_mst_dma_hresp_o  = ahb_mst_hresp_s[2];
+    ahb_mst_dma_hrdata_o = ahb_mst_hrdata_s[2];
+    ahb_mst_eth_hready_o = ahb_mst_hready_s[3];
+    ahb_mst_eth_hresp_o  = ahb_mst_hresp_s[3];
+    ahb_mst_eth_hrdata_o = ahb_mst_hrdata_s[3];
+    ahb_mst_usb_hready_o = ahb_mst_hready_s[4];
+    ahb_mst_usb_hresp_o  = ahb_mst_hresp_s[4];
+    ahb_mst_usb_hrdata_o = ahb_mst_hrdata_s[4];
+    ahb_mst_gpu_hready_o = ahb_mst_hready_s[5];
+    ahb_mst_gpu_hresp_o  = ahb_mst_hresp_s[5];
+    ahb_mst_gpu_hrdata_o = ahb_mst_hrdata_s[5];
+    ahb_slv_mem_hsel_o   = ahb_slv_hsel_s[0];
+    ahb_slv_mem_haddr_o  = ahb_slv_haddr_s[0];
+    ahb_slv_mem_hwrite_o = ahb_slv_hwrite_s[0];
+    ahb_slv_mem_htrans_o = ahb_slv_htrans_s[0];
+    ahb_slv_mem_hsize_o  = ahb_slv_hsize_s[0];
+    ahb_slv_mem_hburst_o = ahb_slv_hburst_s[0];
+    ahb_slv_mem_hprot_o  = ahb_slv_hprot_s[0];
+    ahb_slv_mem_hwdata_o = ahb_slv_hwdata_s[0];
+    ahb_slv_mem_hready_o = ahb_slv_hready_s[0];
+    ahb_slv_io_hsel_o    = ahb_slv_hsel_s[1];
+    ahb_slv_io_haddr_o   = ahb_slv_haddr_s[1];
+    ahb_slv_io_hwrite_o  = ahb_slv_hwrite_s[1];
+    ahb_slv_io_htrans_o  = ahb_slv_htrans_s[1];
+    ahb_slv_io_hsize_o   = ahb_slv_hsize_s[1];
+    ahb_slv_io_hburst_o  = ahb_slv_hburst_s[1];
+    ahb_slv_io_hprot_o   = ahb_slv_hprot_s[1];
+    ahb_slv_io_hwdata_o  = ahb_slv_hwdata_s[1];
+    ahb_slv_io_hready_o  = ahb_slv_hready_s[1];
+    ahb_slv_rom_hsel_o   = ahb_slv_hsel_s[2];
+    ahb_slv_rom_haddr_o  = ahb_slv_haddr_s[2];
+    ahb_slv_rom_hwrite_o = ahb_slv_hwrite_s[2];
+    ahb_slv_rom_htrans_o = ahb_slv_htrans_s[2];
+    ahb_slv_rom_hsize_o  = ahb_slv_hsize_s[2];
+    ahb_slv_rom_hburst_o = ahb_slv_hburst_s[2];
+    ahb_slv_rom_hprot_o  = ahb_slv_hprot_s[2];
+    ahb_slv_rom_hwdata_o = ahb_slv_hwdata_s[2];
+    ahb_slv_rom_hready_o = ahb_slv_hready_s[2];
+  end
+
+
+  // ------------------------------------------------------
+  // The Masters:
+  // ------------------------------------------------------
+  // Master 'cpu' Address Decoding
+  always_comb begin: proc_cpu_dec
+    mst_addr_err_s[0] = 1'b0;
+    mst_sel_s[0] = 3'h0;
+
+    casez (ahb_mst_cpu_haddr_i[31:12])
+      20'b00000000000000000000: begin // mem
+        mst_sel_s[0][0] = 1'b1;
+      end
+
+      20'b00000000000000000001: begin // io
+        mst_sel_s[0][1] = 1'b1;
+      end
+
+      20'b00000000000000000010: begin // rom
+        mst_sel_s[0][2] = 1'b1;
+      end
+
+      default: begin
+        mst_addr_err_s[0] = mst_new_xfer_s[0];
+      end
+    endcase
+  end
+
+  // Master 'dsp' Address Decoding
+  always_comb begin: proc_dsp_dec
+    mst_addr_err_s[1] = 1'b0;
+    mst_sel_s[1] = 3'h0;
+
+    casez (ahb_mst_dsp_haddr_i[31:12])
+      20'b00000000000000000000: begin // mem
+        mst_sel_s[1][0] = 1'b1;
+      end
+
+      20'b00000000000000000001: begin // io
+        mst_sel_s[1][1] = 1'b1;
+      end
+
+      default: begin
+        mst_addr_err_s[1] = mst_new_xfer_s[1];
+      end
+    endcase
+  end
+
+  // Master 'dma' Address Decoding
+  always_comb begin: proc_dma_dec
+    mst_addr_err_s[2] = 1'b0;
+    mst_sel_s[2] = 3'h0;
+
+    casez (ahb_mst_dma_haddr_i[31:12])
+      20'b00000000000000000000: begin // mem
+        mst_sel_s[2][0] = 1'b1;
+      end
+
+      20'b00000000000000000001: begin // io
+        mst_sel_s[2][1] = 1'b1;
+      end
+
+      default: begin
+        mst_addr_err_s[2] = mst_new_xfer_s[2];
+      end
+    endcase
+  end
+
+  // Master 'eth' Address Decoding
+  always_comb begin: proc_eth_dec
+    mst_addr_err_s[3] = 1'b0;
+    mst_sel_s[3] = 3'h0;
+
+    casez (ahb_mst_eth_haddr_i[31:12])
+      20'b00000000000000000000: begin // mem
+        mst_sel_s[3][0] = 1'b1;
+      end
+
+      default: begin
+        mst_addr_err_s[3] = mst_new_xfer_s[3];
+      end
+    endcase
+  end
+
+  // Master 'usb' Address Decoding
+  always_comb begin: proc_usb_dec
+    mst_addr_err_s[4] = 1'b0;
+    mst_sel_s[4] = 3'h0;
+
+    casez (ahb_mst_usb_haddr_i[31:12])
+      20'b00000000000000000000: begin // mem
+        mst_sel_s[4][0] = 1'b1;
+      end
+
+      default: begin
+        mst_addr_err_s[4] = mst_new_xfer_s[4];
+      end
+    endcase
+  end
+
+  // Master 'gpu' Address Decoding
+  always_comb begin: proc_gpu_dec
+    mst_addr_err_s[5] = 1'b0;
+    mst_sel_s[5] = 3'h0;
+
+    casez (ahb_mst_gpu_haddr_i[31:12])
+      20'b00000000000000000000: begin // mem
+        mst_sel_s[5][0] = 1'b1;
+      end
+
+      20'b00000000000000000010: begin // rom
+        mst_sel_s[5][2] = 1'b1;
+      end
+
+      default: begin
+        mst_addr_err_s[5] = mst_new_xfer_s[5];
+      end
+    endcase
+  end
+
+  for (genvar m = 0; m < 6; m++) begin: g_mst
+
+    always_comb begin: proc_logic
+      mst_new_xfer_s[m]  = (ahb_mst_htrans_s[m] == ahb_trans_nonseq_e) ? 1'b1 : 1'b0;
+      mst_cont_xfer_s[m] = ((ahb_mst_htrans_s[m] == ahb_trans_busy_e) ||
+                            (ahb_mst_htrans_s[m] == ahb_trans_seq_e)) ? 1'b1 : 1'b0;
+      mst_rqstate_s[m]   = ((fsm_r[m] == fsm_idle_st) ||
+                            (fsm_r[m] == fsm_transfer_st) ||
+                            (fsm_r[m] == fsm_transfer_finish_st) ||
+                            (fsm_r[m] == fsm_error2_st)) ? 1'b1 : 1'b0;
+
+      // another slave is requested with the end of the current data phase only
+      mst_req_s[m]  = (mst_sel_s[m] & {3{mst_new_xfer_s[m] & mst_rqstate_s[m]}} & ({3{mst_hready_s[m]}} | mst_gnt_r[m])) |
+                      mst_req_r[m];
+      mst_keep_s[m] = mst_gnt_r[m] & {3{mst_cont_xfer_s[m]}} & slv_multi;
+    end
+
+    // Grant Combination
+    always_comb begin: proc_gnt
+      integer s;
+      for (s = 0; s < 3; s = s + 1) begin
+        mst_slvgnt_s[m][s] = mst_slvmask[m*3+s] & slv_gnt_s[s][mst_slvpos[(m*3+s)*3 +: 3]];
+      end
+      mst_gnt_s[m] = |mst_slvgnt_s[m];
+    end
+
+    // FSM
+    always_ff @(posedge main_clk_i or negedge main_rst_an_i) begin: proc_fsm
+      if (main_rst_an_i == 1'b0) begin
+        fsm_r[m] <= fsm_idle_st;
+        mst_gnt_r[m] <= 3'h0;
+      end else begin
+        case (fsm_r[m])
+          fsm_idle_st: begin
+            if (mst_new_xfer_s[m] == 1'b1) begin
+              if (mst_addr_err_s[m] == 1'b1) begin
+                fsm_r[m] <= fsm_error1_st;
+              end else if (mst_gnt_s[m] == 1'b1) begin
+                mst_req_r[m] <= 3'h0;
+                fsm_r[m] <= fsm_transfer_st;
+              end else begin
+                mst_req_r[m] <= mst_sel_s[m];
+                fsm_r[m] <= fsm_transfer_wait_st;
+              end
+              mst_gnt_r[m] <= mst_slvgnt_s[m];
+            end
+          end
+
+          fsm_error0_st: begin
+            if (mst_hready_s[m] == 1'b1) begin
+              mst_gnt_r[m] <= 3'h0;
+              fsm_r[m] <= fsm_error1_st;
+            end
+          end
+
+          fsm_error1_st: begin
+            fsm_r[m] <= fsm_error2_st;
+          end
+
+          fsm_error2_st: begin
+            if (mst_new_xfer_s[m] == 1'b1) begin
+              if (mst_addr_err_s[m] == 1'b1) begin
+                fsm_r[m] <= fsm_error1_st;
+              end else if (mst_gnt_s[m] == 1'b1) begin
+                mst_req_r[m] <= 3'h0;
+                fsm_r[m] <= fsm_transfer_st;
+              end else begin
+                mst_req_r[m] <= mst_sel_s[m];
+                fsm_r[m] <= fsm_transfer_wait_st;
+              end
+              mst_gnt_r[m] <= mst_slvgnt_s[m];
+            end else begin
+              fsm_r[m] <= fsm_idle_st;
+            end
+          end
+
+          fsm_transfer_st: begin
+            if ((ahb_mst_htrans_s[m] == ahb_trans_seq_e) ||
+                (ahb_mst_htrans_s[m] == ahb_trans_busy_e)) begin
+              fsm_r[m] <= fsm_transfer_st;
+            end else begin
+              if (ahb_mst_htrans_s[m] == ahb_trans_idle_e) begin
+                if (mst_hready_s[m] == 1'b0) begin
+                  fsm_r[m] <= fsm_transfer_finish_st;
+                end else begin
+                  mst_gnt_r[m] <= 3'h0;
+                  fsm_r[m] <= fsm_idle_st;
+                end
+              end else begin // (ahb_mst_htrans_s[m] == ahb_trans_nonseq_e)
+                if (mst_hready_s[m] == 1'b1) begin // address phase ends with the current data phase
+                  if (mst_addr_err_s[m] == 1'b1) begin
+                    fsm_r[m] <= fsm_error1_st;
+                  end else if (mst_gnt_s[m] == 1'b1) begin
+                    mst_req_r[m] <= 3'h0;
+                    fsm_r[m] <= fsm_transfer_st;
+                  end else begin
+                    mst_req_r[m] <= mst_sel_s[m];
+                    fsm_r[m] <= fsm_transfer_wait_st;
+                  end
+                  mst_gnt_r[m] <= mst_slvgnt_s[m];
+                end else if (mst_addr_err_s[m] == 1'b1) begin // the data phase continues
+                  fsm_r[m] <= fsm_error0_st;
+                end
+              end
+            end
+          end
+
+          fsm_transfer_wait_st: begin
+            if (mst_gnt_s[m] == 1'b1) begin
+              mst_req_r[m] <= 3'h0;
+              mst_gnt_r[m] <= mst_slvgnt_s[m];
+              fsm_r[m] <= fsm_transfer_st;
+            end
+          end
+
+          fsm_transfer_finish_st: begin
+            if (mst_hready_s[m] == 1'b1) begin
+              if (mst_new_xfer_s[m] == 1'b1) begin
+                if (mst_addr_err_s[m] == 1'b1) begin
+                  fsm_r[m] <= fsm_error1_st;
+                end else if (mst_gnt_s[m] == 1'b1) begin
+                  mst_req_r[m] <= 3'h0;
+                  fsm_r[m] <= fsm_transfer_st;
+                end else begin
+                  mst_req_r[m] <= mst_sel_s[m];
+                  fsm_r[m] <= fsm_transfer_wait_st;
+                end
+                mst_gnt_r[m] <= mst_slvgnt_s[m];
+              end else begin
+                mst_gnt_r[m] <= 3'h0;
+                fsm_r[m] <= fsm_idle_st;
+              end
+            end
+          end
+
+          default: begin
+            mst_gnt_r[m] <= 3'h0;
+            mst_req_r[m] <= 3'h0;
+            fsm_r[m] <= fsm_idle_st;
+          end
+        endcase
+      end
+
+      if ((mst_new_xfer_s[m] == 1'b1) && (mst_gnt_s[m] == 1'b0) && (mst_rqstate_s[m] == 1'b1)) begin
+        mst_htrans_r[m] <= ahb_mst_htrans_s[m];
+        mst_haddr_r[m] <= ahb_mst_haddr_s[m];
+        mst_hwrite_r[m] <= ahb_mst_hwrite_s[m];
+        mst_hsize_r[m] <= ahb_mst_hsize_s[m];
+        mst_hburst_r[m] <= ahb_mst_hburst_s[m];
+        mst_hprot_r[m] <= ahb_mst_hprot_s[m];
+      end
+
+      if (mst_hready_s[m] == 1'b1) begin  // the address phase ends with the current data phase
+        mst_hwrite_dph_r[m] <= mst_hwrite_s[m];
+      end
+    end
+
+    // Mux
+    always_comb begin: proc_mux
+      if (fsm_r[m] == fsm_transfer_wait_st) begin
+        mst_htrans_s[m] = mst_htrans_r[m];
+        mst_haddr_s[m] = mst_haddr_r[m];
+        mst_hwrite_s[m] = mst_hwrite_r[m];
+        mst_hsize_s[m] = mst_hsize_r[m];
+        mst_hburst_s[m] = mst_hburst_r[m];
+        mst_hprot_s[m] = mst_hprot_r[m];
+      end else begin
+        mst_htrans_s[m] = ahb_mst_htrans_s[m];
+        mst_haddr_s[m] = ahb_mst_haddr_s[m];
+        mst_hwrite_s[m] = ahb_mst_hwrite_s[m];
+        mst_hsize_s[m] = ahb_mst_hsize_s[m];
+        mst_hburst_s[m] = ahb_mst_hburst_s[m];
+        mst_hprot_s[m] = ahb_mst_hprot_s[m];
+      end
+
+      mst_hready_s[m] = (|(ahb_slv_hreadyout_s & mst_gnt_r[m])) | ~(|mst_gnt_r[m]);
+    end
+
+    // Response
+    always_comb begin: proc_rsp
+      integer s;
+      logic [2:0] rsp_sel_s;
+      logic rsp_vld_s;
+      logic [1:0] rsp_idx_s;
+
+      rsp_sel_s = (mst_sole[m] == 1'b1) ? mst_slvmask[m*3 +: 3] : mst_gnt_r[m];
+      rsp_vld_s = (rsp_sel_s != 3'h0) && ((rsp_sel_s & (rsp_sel_s - 1'b1)) == 3'h0);
+      rsp_idx_s = 2'h0;
+      for (s = 0; s < 3; s = s + 1) begin
+        if (rsp_sel_s[s] == 1'b1) begin
+          rsp_idx_s = s[1:0];
+        end
+      end
+
+      ahb_mst_hrdata_s[m] = 32'h00000000;
+      ahb_mst_hready_s[m] = 1'b1;
+      ahb_mst_hresp_s[m]  = ahb_resp_okay_e;
+      case (fsm_r[m])
+        fsm_transfer_wait_st: begin
+          ahb_mst_hready_s[m] = 1'b0;
+        end
+
+        fsm_error1_st: begin
+          ahb_mst_hready_s[m] = 1'b0;
+          ahb_mst_hresp_s[m]  = ahb_resp_error_e;
+        end
+
+        fsm_error2_st: begin
+          ahb_mst_hresp_s[m]  = ahb_resp_error_e;
+        end
+
+        fsm_error0_st, fsm_transfer_st, fsm_transfer_finish_st: begin
+          if (rsp_vld_s == 1'b1) begin
+            if ((mst_hwrite_dph_r[m] == 1'b0) || (fsm_r[m] == fsm_transfer_finish_st)) begin
+              ahb_mst_hrdata_s[m] = ahb_slv_hrdata_s[rsp_idx_s];
+            end
+            ahb_mst_hready_s[m] = ahb_slv_hreadyout_s[rsp_idx_s];
+            ahb_mst_hresp_s[m]  = ahb_slv_hresp_s[rsp_idx_s];
+          end
+        end
+
+        default: begin
+        end
+      endcase
+    end
+
+  end
+
+
+  // ------------------------------------------------------
+  // The Slaves:
+  // ------------------------------------------------------
+  for (genvar s = 0; s < 3; s++) begin: g_slv
+
+    // Masters in Order of Position
+    always_comb begin: proc_pos
+      integer p;
+      logic [2:0] mst_idx_s;
+      for (p = 0; p < 6; p = p + 1) begin
+        mst_idx_s = slv_mstidx[(s*6+p)*3 +: 3];
+        slv_req_s[s][p]  = slv_posmask[s*6+p] & mst_req_s[mst_idx_s][s];
+        slv_keep_s[s][p] = slv_posmask[s*6+p] & mst_keep_s[mst_idx_s][s];
+        slv_dph_s[s][p]  = slv_posmask[s*6+p] & mst_gnt_r[mst_idx_s][s];
+      end
+    end
+
+    if (slv_multi[s] == 1'b1) begin: g_arb
+
+      // Round-Robin Arbiter
+      always_comb begin: proc_rr_arb
+        integer i;
+        logic found_s;
+        logic [5:0] next_grant_s;
+        logic arb_en_s;
+
+        arb_en_s = ~(|slv_keep_s[s]);
+
+        next_grant_s = {slv_gnt_r[s][0], slv_gnt_r[s][5:1]}; // 1st candidate is old grant rotated 1 right
+        found_s = 1'b0;
+        for (i=0; i<6; i=i+1) begin
+          if (found_s == 1'b0) begin
+            if ((slv_req_s[s] & next_grant_s) != 6'h00) begin
+              found_s = 1'b1;
+            end else begin
+              next_grant_s = {next_grant_s[0], next_grant_s[5:1]}; // rotate 1 right
+            end
+          end
+        end
+
+        slv_gnt_s[s] = slv_req_s[s] & next_grant_s & {6{(ahb_slv_hreadyout_s[s] & arb_en_s)}};
+        slv_asel_s[s] = slv_gnt_s[s] | (slv_keep_s[s] & slv_dph_s[s]);
+        ahb_slv_hsel_s[s] = |slv_asel_s[s];
+      end
+
+      always_ff @(posedge main_clk_i or negedge main_rst_an_i) begin: proc_gnt
+        if (main_rst_an_i == 1'b0) begin
+          slv_gnt_r[s] <= 6'h01;  // initial pseudo-grant
+        end else begin
+          if (slv_gnt_s[s] != 6'h00) begin
+            slv_gnt_r[s] <= slv_gnt_s[s];
+          end
+        end
+      end
+
+    // Address Phase Mux
+    always_comb begin: proc_aph_mux
+      integer p;
+      logic aph_vld_s;
+      logic [2:0] aph_idx_s;
+
+      aph_vld_s = (slv_asel_s[s] != 6'h00) && ((slv_asel_s[s] & (slv_asel_s[s] - 1'b1)) == 6'h00);
+      aph_idx_s = 3'h0;
+      for (p = 0; p < 6; p = p + 1) begin
+        if (slv_asel_s[s][p] == 1'b1) begin
+          aph_idx_s = slv_mstidx[(s*6+p)*3 +: 3];
+        end
+      end
+
+      if (aph_vld_s == 1'b1) begin
+        ahb_slv_htrans_s[s] = mst_htrans_s[aph_idx_s];
+        ahb_slv_haddr_s[s] = mst_haddr_s[aph_idx_s];
+        ahb_slv_hwrite_s[s] = mst_hwrite_s[aph_idx_s];
+        ahb_slv_hsize_s[s] = mst_hsize_s[aph_idx_s];
+        ahb_slv_hburst_s[s] = mst_hburst_s[aph_idx_s];
+        ahb_slv_hprot_s[s] = mst_hprot_s[aph_idx_s];
+        ahb_slv_hready_s[s] = mst_hready_s[aph_idx_s];
+      end else begin
+        ahb_slv_htrans_s[s] = ahb_trans_idle_e;
+        ahb_slv_haddr_s[s] = 32'h00000000;
+        ahb_slv_hwrite_s[s] = ahb_write_read_e;
+        ahb_slv_hsize_s[s] = ahb_size_word_e;
+        ahb_slv_hburst_s[s] = ahb_burst_single_e;
+        ahb_slv_hprot_s[s] = 4'h3;
+        ahb_slv_hready_s[s] = ahb_slv_hreadyout_s[s];
+      end
+    end
+
+    end else begin: g_sole
+      // No Arbitration Necessary
+      always_comb begin: proc_asgn
+        slv_gnt_s[s] = slv_req_s[s];
+        slv_asel_s[s] = 6'h00;
+        slv_asel_s[s][0] = mst_sel_s[slv_mstidx[s*6*3 +: 3]][s];
+        ahb_slv_hsel_s[s] = slv_req_s[s][0] | (slv_dph_s[s][0] & mst_cont_xfer_s[slv_mstidx[s*6*3 +: 3]]);
+      end
+
+    // Address Phase Mux
+    always_comb begin: proc_aph_mux
+      integer p;
+      logic aph_vld_s;
+      logic [2:0] aph_idx_s;
+
+      aph_vld_s = (slv_asel_s[s] != 6'h00) && ((slv_asel_s[s] & (slv_asel_s[s] - 1'b1)) == 6'h00);
+      aph_idx_s = 3'h0;
+      for (p = 0; p < 6; p = p + 1) begin
+        if (slv_asel_s[s][p] == 1'b1) begin
+          aph_idx_s = slv_mstidx[(s*6+p)*3 +: 3];
+        end
+      end
+
+      if (aph_vld_s == 1'b1) begin
+        ahb_slv_htrans_s[s] = ahb_mst_htrans_s[aph_idx_s];
+        ahb_slv_haddr_s[s] = ahb_mst_haddr_s[aph_idx_s];
+        ahb_slv_hwrite_s[s] = ahb_mst_hwrite_s[aph_idx_s];
+        ahb_slv_hsize_s[s] = ahb_mst_hsize_s[aph_idx_s];
+        ahb_slv_hburst_s[s] = ahb_mst_hburst_s[aph_idx_s];
+        ahb_slv_hprot_s[s] = ahb_mst_hprot_s[aph_idx_s];
+        ahb_slv_hready_s[s] = mst_hready_s[aph_idx_s];
+      end else begin
+        ahb_slv_htrans_s[s] = ahb_trans_idle_e;
+        ahb_slv_haddr_s[s] = 32'h00000000;
+        ahb_slv_hwrite_s[s] = ahb_write_read_e;
+        ahb_slv_hsize_s[s] = ahb_size_word_e;
+        ahb_slv_hburst_s[s] = ahb_burst_single_e;
+        ahb_slv_hprot_s[s] = 4'h3;
+        ahb_slv_hready_s[s] = ahb_slv_hreadyout_s[s];
+      end
+    end
+
+    end
+
+    // Data Phase Mux
+    always_comb begin: proc_dph_mux
+      integer p;
+      logic dph_vld_s;
+      logic [2:0] dph_idx_s;
+
+      dph_vld_s = (slv_dph_s[s] != 6'h00) && ((slv_dph_s[s] & (slv_dph_s[s] - 1'b1)) == 6'h00);
+      dph_idx_s = 3'h0;
+      for (p = 0; p < 6; p = p + 1) begin
+        if (slv_dph_s[s][p] == 1'b1) begin
+          dph_idx_s = slv_mstidx[(s*6+p)*3 +: 3];
+        end
+      end
+
+      if (dph_vld_s == 1'b1) begin
+        ahb_slv_hwdata_s[s] = ahb_mst_hwdata_s[dph_idx_s];
+      end else begin
+        ahb_slv_hwdata_s[s] = 32'h00000000;
+      end
+    end
+
+  end
+
+endmodule // ucdp_ahb_ml_rr_example_loop
+
+`default_nettype wire
+`end_keywords
+
+// =============================================================================
+//
+//   @generated @fully-generated
+//
+//   THIS FILE IS GENERATED!!! DO NOT EDIT MANUALLY. CHANGES ARE LOST.
+//
+// =============================================================================
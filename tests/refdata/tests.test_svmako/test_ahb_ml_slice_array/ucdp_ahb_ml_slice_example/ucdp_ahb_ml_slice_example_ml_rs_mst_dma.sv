@@ -0,0 +1,171 @@
+// =============================================================================
+//
+//   @generated @fully-generated
+//
+//   THIS FILE IS GENERATED!!! DO NOT EDIT MANUALLY. CHANGES ARE LOST.
+//
+// =============================================================================
+//
+//  MIT License
+//
+//  Copyright (c) 2024-2025 nbiotcloud
+//
+//  Permission is hereby granted, free of charge, to any person obtaining a copy
+//  of this software and associated documentation files (the "Software"), to deal
+//  in the Software without restriction, including without limitation the rights
+//  to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+//  copies of the Software, and to permit persons to whom the Software is
+//  furnished to do so, subject to the following conditions:
+//
+//  The above copyright notice and this permission notice shall be included in all
+//  copies or substantial portions of the Software.
+//
+//  THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+//  IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+//  FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+//  AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+//  LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+//  OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+//  SOFTWARE.
+//
+// =============================================================================
+//
+// Module:     ucdp_amba.ucdp_ahb_ml_slice_example_ml_rs_mst_dma
+// Data Model: ucdp_amba.ucdp_ahb_slice.UcdpAhbSliceMod
+//
+// =============================================================================
+
+`begin_keywords "1800-2009"
+`default_nettype none  // implicit wires are forbidden
+
+module ucdp_ahb_ml_slice_example_ml_rs_mst_dma ( // ucdp_amba.ucdp_ahb_slice.UcdpAhbSliceMod
+  // main_i: Clock and Reset
+  input  wire         main_clk_i,       // Clock
+  input  wire         main_rst_an_i,    // Async Reset (Low-Active)
+  // ahb_src_i: AHB Source
+  input  wire  [1:0]  ahb_src_htrans_i, // AHB Transfer Type
+  input  wire  [31:0] ahb_src_haddr_i,  // AHB Bus Address
+  input  wire         ahb_src_hwrite_i, // AHB Write Enable
+  input  wire  [2:0]  ahb_src_hsize_i,  // AHB Size
+  input  wire  [2:0]  ahb_src_hburst_i, // AHB Burst Type
+  input  wire  [3:0]  ahb_src_hprot_i,  // AHB Transfer Protection
+  input  wire  [31:0] ahb_src_hwdata_i, // AHB Data
+  output logic        ahb_src_hready_o, // AHB Transfer Done
+  output logic        ahb_src_hresp_o,  // AHB Response Error
+  output logic [31:0] ahb_src_hrdata_o, // AHB Data
+  // ahb_tgt_o: AHB Target
+  output logic [1:0]  ahb_tgt_htrans_o, // AHB Transfer Type
+  output logic [31:0] ahb_tgt_haddr_o,  // AHB Bus Address
+  output logic        ahb_tgt_hwrite_o, // AHB Write Enable
+  output logic [2:0]  ahb_tgt_hsize_o,  // AHB Size
+  output logic [2:0]  ahb_tgt_hburst_o, // AHB Burst Type
+  output logic [3:0]  ahb_tgt_hprot_o,  // AHB Transfer Protection
+  output logic [31:0] ahb_tgt_hwdata_o, // AHB Data
+  input  wire         ahb_tgt_hready_i, // AHB Transfer Done
+  input  wire         ahb_tgt_hresp_i,  // AHB Response Error
+  input  wire  [31:0] ahb_tgt_hrdata_i  // AHB Data
+);
+
+
+
+
+  // ------------------------------------------------------
+  //  Local Parameter
+  // ------------------------------------------------------
+  // ahb_trans
+  localparam integer       ahb_trans_width_p   = 2;    // Width in Bits
+  localparam logic   [1:0] ahb_trans_min_p     = 2'h0; // AHB Transfer Type
+  localparam logic   [1:0] ahb_trans_max_p     = 2'h3; // AHB Transfer Type
+  localparam logic   [1:0] ahb_trans_idle_e    = 2'h0; // No transfer
+  localparam logic   [1:0] ahb_trans_busy_e    = 2'h1; // Idle cycle within transfer
+  localparam logic   [1:0] ahb_trans_nonseq_e  = 2'h2; // Single transfer or first transfer of a burst
+  localparam logic   [1:0] ahb_trans_seq_e     = 2'h3; // Consecutive transfers of a burst
+  localparam logic   [1:0] ahb_trans_default_p = 2'h0; // AHB Transfer Type
+  // ahb_resp
+  localparam integer       ahb_resp_width_p    = 1;    // Width in Bits
+  localparam logic         ahb_resp_min_p      = 1'b0; // AHB Response Error
+  localparam logic         ahb_resp_max_p      = 1'b1; // AHB Response Error
+  localparam logic         ahb_resp_okay_e     = 1'b0; // OK
+  localparam logic         ahb_resp_error_e    = 1'b1; // Error
+  localparam logic         ahb_resp_default_p  = 1'b0; // AHB Response Error
+  // ahb_burst
+  localparam integer       ahb_burst_width_p   = 3;    // Width in Bits
+  localparam logic   [2:0] ahb_burst_min_p     = 3'h0; // AHB Burst Type
+  localparam logic   [2:0] ahb_burst_max_p     = 3'h7; // AHB Burst Type
+  localparam logic   [2:0] ahb_burst_single_e  = 3'h0; // Single transfer
+  localparam logic   [2:0] ahb_burst_incr_e    = 3'h1; // Incrementing burst of unspecified length
+  localparam logic   [2:0] ahb_burst_wrap4_e   = 3'h2; // 4-beat wrapping burst
+  localparam logic   [2:0] ahb_burst_incr4_e   = 3'h3; // 4-beat incrementing burst
+  localparam logic   [2:0] ahb_burst_wrap8_e   = 3'h4; // 8-beat wrapping burst
+  localparam logic   [2:0] ahb_burst_incr8_e   = 3'h5; // 8-beat incrementing burst
+  localparam logic   [2:0] ahb_burst_wrap16_e  = 3'h6; // 16-beat wrapping burst
+  localparam logic   [2:0] ahb_burst_incr16_e  = 3'h7; // 16-beat incrementing burst
+  localparam logic   [2:0] ahb_burst_default_p = 3'h0; // AHB Burst Type
+
+
+  // ------------------------------------------------------
+  //  Signals
+  // ------------------------------------------------------
+  logic        bwd_valid_s;  // transfer accepted
+  logic        bwd_dph_r;    // data phase of the forwarded transfer
+  logic        bwd_hresp_r;  // AHB Response Error
+  logic [31:0] bwd_hrdata_r; // AHB Data
+
+  // === backward register slice ========
+  // the response is registered, the next transfer is held back until the response is forwarded
+  assign bwd_valid_s = ((bwd_dph_r == 1'b0) &&
+                        ((ahb_src_htrans_i == ahb_trans_nonseq_e) || (ahb_src_htrans_i == ahb_trans_seq_e))) ? 1'b1 : 1'b0;
+
+  always_ff @(posedge main_clk_i or negedge main_rst_an_i) begin: proc_bwd
+    if (main_rst_an_i == 1'b0) begin
+      bwd_dph_r <= 1'b0;
+      bwd_hresp_r <= 1'b0;
+      bwd_hrdata_r <= 32'h00000000;
+    end else begin
+      if (bwd_dph_r == 1'b0) begin
+        bwd_dph_r <= bwd_valid_s;
+        bwd_hresp_r <= ahb_resp_okay_e;
+      end else begin
+        bwd_dph_r <= ~ahb_tgt_hready_i;
+        bwd_hresp_r <= ahb_tgt_hresp_i;  // the two-cycle ERROR response is delayed as a whole
+      end
+      if ((bwd_dph_r == 1'b1) && (ahb_tgt_hready_i == 1'b1)) begin
+        bwd_hrdata_r <= ahb_tgt_hrdata_i;
+      end
+    end
+  end
+
+  always_comb begin: proc_bwd_htrans
+    if (bwd_dph_r == 1'b0) begin
+      ahb_tgt_htrans_o = ahb_src_htrans_i;
+    end else if ((ahb_src_htrans_i == ahb_trans_seq_e) || (ahb_src_htrans_i == ahb_trans_busy_e)) begin
+      ahb_tgt_htrans_o = ahb_trans_busy_e;  // the burst continues after the data phase
+    end else begin
+      ahb_tgt_htrans_o = ahb_trans_idle_e;
+    end
+  end
+
+  assign ahb_tgt_haddr_o = ahb_src_haddr_i;
+  assign ahb_tgt_hwrite_o = ahb_src_hwrite_i;
+  assign ahb_tgt_hsize_o = ahb_src_hsize_i;
+  assign ahb_tgt_hburst_o = ahb_src_hburst_i;
+  assign ahb_tgt_hprot_o = ahb_src_hprot_i;
+  assign ahb_tgt_hwdata_o = ahb_src_hwdata_i;
+
+  assign ahb_src_hready_o = ~bwd_dph_r;
+  assign ahb_src_hresp_o = bwd_hresp_r;
+  assign ahb_src_hrdata_o = bwd_hrdata_r;
+
+
+endmodule // ucdp_ahb_ml_slice_example_ml_rs_mst_dma
+
+`default_nettype wire
+`end_keywords
+
+// =============================================================================
+//
+//   @generated @fully-generated
+//
+//   THIS FILE IS GENERATED!!! DO NOT EDIT MANUALLY. CHANGES ARE LOST.
+//
+// =============================================================================
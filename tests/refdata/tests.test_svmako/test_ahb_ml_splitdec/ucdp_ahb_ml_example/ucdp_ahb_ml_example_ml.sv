@@ -0,0 +1,998 @@
+// =============================================================================
+//
+//   @generated @fully-generated
+//
+//   THIS FILE IS GENERATED!!! DO NOT EDIT MANUALLY. CHANGES ARE LOST.
+//
+// =============================================================================
+//
+//  MIT License
+//
+//  Copyright (c) 2024-2025 nbiotcloud
+//
+//  Permission is hereby granted, free of charge, to any person obtaining a copy
+//  of this software and associated documentation files (the "Software"), to deal
+//  in the Software without restriction, including without limitation the rights
+//  to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+//  copies of the Software, and to permit persons to whom the Software is
+//  furnished to do so, subject to the following conditions:
+//
+//  The above copyright notice and this permission notice shall be included in all
+//  copies or substantial portions of the Software.
+//
+//  THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+//  IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+//  FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+//  AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+//  LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+//  OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+//  SOFTWARE.
+//
+// =============================================================================
+//
+// Module:     ucdp_amba.ucdp_ahb_ml_example_ml
+// Data Model: ucdp_amba.ucdp_ahb_ml.UcdpAhbMlMod
+//
+//
+// | Master > Slave | ram | periph | misc |
+// | -------------- | --- | ------ | ---- |
+// | ext            | X   |        | X    |
+// | dsp            | X   | X      |      |
+//
+//
+//
+// * Top:     `None`
+// * Defines: `None`
+// * Size:    `3932320 KB`
+//
+// | Addrspace | Type     | Base         | Size                        | Infos | Attributes |
+// | --------- | -------- | ------------ | --------------------------- | ----- | ---------- |
+// | reserved0 | Reserved | `0x0`        | `536870912x32 (2 GB)`       |       |            |
+// | misc      | Slave    | `0x80000000` | `5888x32 (23 KB)`           |       |            |
+// | reserved1 | Reserved | `0x80005C00` | `469756160x32 (1834985 KB)` |       |            |
+// | ram       | Slave    | `0xF0000000` | `16384x32 (64 KB)`          |       |            |
+// | periph    | Slave    | `0xF0010000` | `16384x32 (64 KB)`          |       |            |
+// | misc      | Slave    | `0xF0020000` | `8192x32 (32 KB)`           |       |            |
+// | reserved2 | Reserved | `0xF0028000` | `67067904x32 (261984 KB)`   |       |            |
+//
+//
+//
+// | Decoder | Slice | Masks | Comparators | Minimized Masks | Minimized Comparators | Regions |
+// | ------- | ----- | ----- | ----------- | --------------- | --------------------- | ------- |
+// | ext     | 35:10 | 6     | 138         | 6               | 138                   | 2       |
+// | dsp     | 35:16 | 2     | 40          | 2               | 40                    | 1       |
+//
+// =============================================================================
+
+`begin_keywords "1800-2009"
+`default_nettype none  // implicit wires are forbidden
+
+module ucdp_ahb_ml_example_ml ( // ucdp_amba.ucdp_ahb_ml.UcdpAhbMlMod
+  // main_i: Clock and Reset
+  input  wire         main_clk_i,                 // Clock
+  input  wire         main_rst_an_i,              // Async Reset (Low-Active)
+  // ahb_mst_ext_i: AHB Input 'ext'
+  input  wire  [1:0]  ahb_mst_ext_htrans_i,       // AHB Transfer Type
+  input  wire  [35:0] ahb_mst_ext_haddr_i,        // AHB Bus Address
+  input  wire  [3:0]  ahb_mst_ext_hauser_i,       // AHB Address User Channel
+  input  wire  [3:0]  ahb_mst_ext_hwuser_i,       // AHB Write Data User Channel
+  input  wire         ahb_mst_ext_hwrite_i,       // AHB Write Enable
+  input  wire  [2:0]  ahb_mst_ext_hsize_i,        // AHB Size
+  input  wire  [2:0]  ahb_mst_ext_hburst_i,       // AHB Burst Type
+  input  wire  [3:0]  ahb_mst_ext_hprot_i,        // AHB Transfer Protection
+  input  wire         ahb_mst_ext_hnonsec_i,      // AHB Secure Transfer
+  input  wire         ahb_mst_ext_hmastlock_i,    // AHB Locked Sequence Enable
+  input  wire  [31:0] ahb_mst_ext_hwdata_i,       // AHB Data
+  input  wire  [3:0]  ahb_mst_ext_hwstrb_i,       // AHB Write Strobe
+  input  wire  [3:0]  ahb_mst_ext_hmaster_i,      // AHB Master ID
+  output logic        ahb_mst_ext_hready_o,       // AHB Transfer Done
+  output logic        ahb_mst_ext_hresp_o,        // AHB Response Error
+  output logic [31:0] ahb_mst_ext_hrdata_o,       // AHB Data
+  output logic [3:0]  ahb_mst_ext_hruser_o,       // AHB Read Data User Channel
+  output logic [3:0]  ahb_mst_ext_hbuser_o,       // AHB Read Response User Channel
+  // ahb_mst_dsp_i: AHB Input 'dsp'
+  input  wire  [1:0]  ahb_mst_dsp_htrans_i,       // AHB Transfer Type
+  input  wire  [35:0] ahb_mst_dsp_haddr_i,        // AHB Bus Address
+  input  wire  [3:0]  ahb_mst_dsp_hauser_i,       // AHB Address User Channel
+  input  wire  [3:0]  ahb_mst_dsp_hwuser_i,       // AHB Write Data User Channel
+  input  wire         ahb_mst_dsp_hwrite_i,       // AHB Write Enable
+  input  wire  [2:0]  ahb_mst_dsp_hsize_i,        // AHB Size
+  input  wire  [2:0]  ahb_mst_dsp_hburst_i,       // AHB Burst Type
+  input  wire  [3:0]  ahb_mst_dsp_hprot_i,        // AHB Transfer Protection
+  input  wire         ahb_mst_dsp_hnonsec_i,      // AHB Secure Transfer
+  input  wire         ahb_mst_dsp_hmastlock_i,    // AHB Locked Sequence Enable
+  input  wire  [31:0] ahb_mst_dsp_hwdata_i,       // AHB Data
+  input  wire  [3:0]  ahb_mst_dsp_hwstrb_i,       // AHB Write Strobe
+  input  wire  [3:0]  ahb_mst_dsp_hmaster_i,      // AHB Master ID
+  output logic        ahb_mst_dsp_hready_o,       // AHB Transfer Done
+  output logic        ahb_mst_dsp_hresp_o,        // AHB Response Error
+  output logic [31:0] ahb_mst_dsp_hrdata_o,       // AHB Data
+  output logic [3:0]  ahb_mst_dsp_hruser_o,       // AHB Read Data User Channel
+  output logic [3:0]  ahb_mst_dsp_hbuser_o,       // AHB Read Response User Channel
+  // ahb_slv_ram_o: AHB Output 'ram'
+  output logic        ahb_slv_ram_hsel_o,         // AHB Slave Select
+  output logic [35:0] ahb_slv_ram_haddr_o,        // AHB Bus Address
+  output logic [3:0]  ahb_slv_ram_hauser_o,       // AHB Address User Channel
+  output logic [3:0]  ahb_slv_ram_hwuser_o,       // AHB Write Data User Channel
+  output logic        ahb_slv_ram_hwrite_o,       // AHB Write Enable
+  output logic [1:0]  ahb_slv_ram_htrans_o,       // AHB Transfer Type
+  output logic [2:0]  ahb_slv_ram_hsize_o,        // AHB Size
+  output logic [2:0]  ahb_slv_ram_hburst_o,       // AHB Burst Type
+  output logic [6:0]  ahb_slv_ram_hprot_o,        // AHB Transfer Protection
+  output logic        ahb_slv_ram_hnonsec_o,      // AHB Secure Transfer
+  output logic        ahb_slv_ram_hmastlock_o,    // AHB Locked Sequence Enable
+  output logic [31:0] ahb_slv_ram_hwdata_o,       // AHB Data
+  output logic [3:0]  ahb_slv_ram_hwstrb_o,       // AHB Write Strobe
+  output logic        ahb_slv_ram_hready_o,       // AHB Transfer Done to Slave
+  output logic        ahb_slv_ram_hexcl_o,        // AHB Exclusive Transfer
+  output logic [5:0]  ahb_slv_ram_hmaster_o,      // AHB Master ID
+  input  wire         ahb_slv_ram_hreadyout_i,    // AHB Transfer Done from Slave
+  input  wire         ahb_slv_ram_hresp_i,        // AHB Response Error
+  input  wire         ahb_slv_ram_hexokay_i,      // AHB Exclusive Response
+  input  wire  [31:0] ahb_slv_ram_hrdata_i,       // AHB Data
+  input  wire  [3:0]  ahb_slv_ram_hruser_i,       // AHB Read Data User Channel
+  input  wire  [3:0]  ahb_slv_ram_hbuser_i,       // AHB Read Response User Channel
+  // ahb_slv_periph_o: AHB Output 'periph'
+  output logic        ahb_slv_periph_hsel_o,      // AHB Slave Select
+  output logic [35:0] ahb_slv_periph_haddr_o,     // AHB Bus Address
+  output logic [3:0]  ahb_slv_periph_hauser_o,    // AHB Address User Channel
+  output logic [3:0]  ahb_slv_periph_hwuser_o,    // AHB Write Data User Channel
+  output logic        ahb_slv_periph_hwrite_o,    // AHB Write Enable
+  output logic [1:0]  ahb_slv_periph_htrans_o,    // AHB Transfer Type
+  output logic [2:0]  ahb_slv_periph_hsize_o,     // AHB Size
+  output logic [2:0]  ahb_slv_periph_hburst_o,    // AHB Burst Type
+  output logic [6:0]  ahb_slv_periph_hprot_o,     // AHB Transfer Protection
+  output logic        ahb_slv_periph_hnonsec_o,   // AHB Secure Transfer
+  output logic        ahb_slv_periph_hmastlock_o, // AHB Locked Sequence Enable
+  output logic [31:0] ahb_slv_periph_hwdata_o,    // AHB Data
+  output logic [3:0]  ahb_slv_periph_hwstrb_o,    // AHB Write Strobe
+  output logic        ahb_slv_periph_hready_o,    // AHB Transfer Done to Slave
+  output logic        ahb_slv_periph_hexcl_o,     // AHB Exclusive Transfer
+  output logic [5:0]  ahb_slv_periph_hmaster_o,   // AHB Master ID
+  input  wire         ahb_slv_periph_hreadyout_i, // AHB Transfer Done from Slave
+  input  wire         ahb_slv_periph_hresp_i,     // AHB Response Error
+  input  wire         ahb_slv_periph_hexokay_i,   // AHB Exclusive Response
+  input  wire  [31:0] ahb_slv_periph_hrdata_i,    // AHB Data
+  input  wire  [3:0]  ahb_slv_periph_hruser_i,    // AHB Read Data User Channel
+  input  wire  [3:0]  ahb_slv_periph_hbuser_i,    // AHB Read Response User Channel
+  // ahb_slv_misc_o: AHB Output 'misc'
+  output logic        ahb_slv_misc_hsel_o,        // AHB Slave Select
+  output logic [35:0] ahb_slv_misc_haddr_o,       // AHB Bus Address
+  output logic [3:0]  ahb_slv_misc_hauser_o,      // AHB Address User Channel
+  output logic [3:0]  ahb_slv_misc_hwuser_o,      // AHB Write Data User Channel
+  output logic        ahb_slv_misc_hwrite_o,      // AHB Write Enable
+  output logic [1:0]  ahb_slv_misc_htrans_o,      // AHB Transfer Type
+  output logic [2:0]  ahb_slv_misc_hsize_o,       // AHB Size
+  output logic [2:0]  ahb_slv_misc_hburst_o,      // AHB Burst Type
+  output logic [6:0]  ahb_slv_misc_hprot_o,       // AHB Transfer Protection
+  output logic        ahb_slv_misc_hnonsec_o,     // AHB Secure Transfer
+  output logic        ahb_slv_misc_hmastlock_o,   // AHB Locked Sequence Enable
+  output logic [31:0] ahb_slv_misc_hwdata_o,      // AHB Data
+  output logic [3:0]  ahb_slv_misc_hwstrb_o,      // AHB Write Strobe
+  output logic        ahb_slv_misc_hready_o,      // AHB Transfer Done to Slave
+  output logic        ahb_slv_misc_hexcl_o,       // AHB Exclusive Transfer
+  output logic [5:0]  ahb_slv_misc_hmaster_o,     // AHB Master ID
+  input  wire         ahb_slv_misc_hreadyout_i,   // AHB Transfer Done from Slave
+  input  wire         ahb_slv_misc_hresp_i,       // AHB Response Error
+  input  wire         ahb_slv_misc_hexokay_i,     // AHB Exclusive Response
+  input  wire  [31:0] ahb_slv_misc_hrdata_i,      // AHB Data
+  input  wire  [3:0]  ahb_slv_misc_hruser_i,      // AHB Read Data User Channel
+  input  wire  [3:0]  ahb_slv_misc_hbuser_i       // AHB Read Response User Channel
+);
+
+
+
+
+  // ------------------------------------------------------
+  //  Local Parameter
+  // ------------------------------------------------------
+  // ahb_trans
+  localparam integer       ahb_trans_width_p      = 2;    // Width in Bits
+  localparam logic   [1:0] ahb_trans_min_p        = 2'h0; // AHB Transfer Type
+  localparam logic   [1:0] ahb_trans_max_p        = 2'h3; // AHB Transfer Type
+  localparam logic   [1:0] ahb_trans_idle_e       = 2'h0; // No transfer
+  localparam logic   [1:0] ahb_trans_busy_e       = 2'h1; // Idle cycle within transfer
+  localparam logic   [1:0] ahb_trans_nonseq_e     = 2'h2; // Single transfer or first transfer of a burst
+  localparam logic   [1:0] ahb_trans_seq_e        = 2'h3; // Consecutive transfers of a burst
+  localparam logic   [1:0] ahb_trans_default_p    = 2'h0; // AHB Transfer Type
+  // ahb_resp
+  localparam integer       ahb_resp_width_p       = 1;    // Width in Bits
+  localparam logic         ahb_resp_min_p         = 1'b0; // AHB Response Error
+  localparam logic         ahb_resp_max_p         = 1'b1; // AHB Response Error
+  localparam logic         ahb_resp_okay_e        = 1'b0; // OK
+  localparam logic         ahb_resp_error_e       = 1'b1; // Error
+  localparam logic         ahb_resp_default_p     = 1'b0; // AHB Response Error
+  // ahb_size
+  localparam integer       ahb_size_width_p       = 3;    // Width in Bits
+  localparam logic   [2:0] ahb_size_min_p         = 3'h0; // AHB Size
+  localparam logic   [2:0] ahb_size_max_p         = 3'h7; // AHB Size
+  localparam logic   [2:0] ahb_size_byte_e        = 3'h0; // Byte
+  localparam logic   [2:0] ahb_size_halfword_e    = 3'h1; // Halfword
+  localparam logic   [2:0] ahb_size_word_e        = 3'h2; // Word
+  localparam logic   [2:0] ahb_size_doubleword_e  = 3'h3; // Doubleword
+  localparam logic   [2:0] ahb_size_fourword_e    = 3'h4; // 4-word
+  localparam logic   [2:0] ahb_size_eightword_e   = 3'h5; // 8-word
+  localparam logic   [2:0] ahb_size_sixteenword_e = 3'h6; // 16-word
+  localparam logic   [2:0] ahb_size_kilobit_e     = 3'h7; // 32-word
+  localparam logic   [2:0] ahb_size_default_p     = 3'h0; // AHB Size
+  // ahb_burst
+  localparam integer       ahb_burst_width_p      = 3;    // Width in Bits
+  localparam logic   [2:0] ahb_burst_min_p        = 3'h0; // AHB Burst Type
+  localparam logic   [2:0] ahb_burst_max_p        = 3'h7; // AHB Burst Type
+  localparam logic   [2:0] ahb_burst_single_e     = 3'h0; // Single transfer
+  localparam logic   [2:0] ahb_burst_incr_e       = 3'h1; // Incrementing burst of unspecified length
+  localparam logic   [2:0] ahb_burst_wrap4_e      = 3'h2; // 4-beat wrapping burst
+  localparam logic   [2:0] ahb_burst_incr4_e      = 3'h3; // 4-beat incrementing burst
+  localparam logic   [2:0] ahb_burst_wrap8_e      = 3'h4; // 8-beat wrapping burst
+  localparam logic   [2:0] ahb_burst_incr8_e      = 3'h5; // 8-beat incrementing burst
+  localparam logic   [2:0] ahb_burst_wrap16_e     = 3'h6; // 16-beat wrapping burst
+  localparam logic   [2:0] ahb_burst_incr16_e     = 3'h7; // 16-beat incrementing burst
+  localparam logic   [2:0] ahb_burst_default_p    = 3'h0; // AHB Burst Type
+  // ahb_write
+  localparam integer       ahb_write_width_p      = 1;    // Width in Bits
+  localparam logic         ahb_write_min_p        = 1'b0; // AHB Write Enable
+  localparam logic         ahb_write_max_p        = 1'b1; // AHB Write Enable
+  localparam logic         ahb_write_read_e       = 1'b0; // Read operation
+  localparam logic         ahb_write_write_e      = 1'b1; // Write operation
+  localparam logic         ahb_write_default_p    = 1'b0; // AHB Write Enable
+  // fsm
+  localparam integer       fsm_width_p            = 3;    // Width in Bits
+  localparam logic   [2:0] fsm_min_p              = 3'h0; // AHB ML FSM Type
+  localparam logic   [2:0] fsm_max_p              = 3'h7; // AHB ML FSM Type
+  localparam logic   [2:0] fsm_idle_st            = 3'h0; // No transfer
+  localparam logic   [2:0] fsm_transfer_st        = 3'h1; // Transfer
+  localparam logic   [2:0] fsm_transfer_finish_st = 3'h2; // Transfer Finish (wait for HREADY)
+  localparam logic   [2:0] fsm_transfer_wait_st   = 3'h3; // Transfer Wait for Grant
+  localparam logic   [2:0] fsm_error0_st          = 3'h4; // Pre-Error (wait for HREADY)
+  localparam logic   [2:0] fsm_error1_st          = 3'h5; // 1st Error Cycle
+  localparam logic   [2:0] fsm_error2_st          = 3'h6; // 2nd Error Cycle
+  localparam logic   [2:0] fsm_default_p          = 3'h0; // AHB ML FSM Type
+  // ahb_hexok
+  localparam integer       ahb_hexok_width_p      = 1;    // Width in Bits
+  localparam logic         ahb_hexok_min_p        = 1'b0; // AHB Exclusive Response
+  localparam logic         ahb_hexok_max_p        = 1'b1; // AHB Exclusive Response
+  localparam logic         ahb_hexok_error_e      = 1'b0; // Error
+  localparam logic         ahb_hexok_okay_e       = 1'b1; // OK
+  localparam logic         ahb_hexok_default_p    = 1'b0; // AHB Exclusive Response
+
+
+  // ------------------------------------------------------
+  //  Signals
+  // ------------------------------------------------------
+  logic [1:0]  ahb_mst_htrans_s     [0:1];
+  logic [35:0] ahb_mst_haddr_s      [0:1];
+  logic        ahb_mst_hwrite_s     [0:1];
+  logic [2:0]  ahb_mst_hsize_s      [0:1];
+  logic [2:0]  ahb_mst_hburst_s     [0:1];
+  logic [6:0]  ahb_mst_hprot_s      [0:1];
+  logic        ahb_mst_hnonsec_s    [0:1];
+  logic        ahb_mst_hmastlock_s  [0:1];
+  logic        ahb_mst_hexcl_s      [0:1];
+  logic [5:0]  ahb_mst_hmaster_s    [0:1];
+  logic [3:0]  ahb_mst_hauser_s     [0:1];
+  logic [31:0] ahb_mst_hwdata_s     [0:1];
+  logic [3:0]  ahb_mst_hwstrb_s     [0:1];
+  logic [3:0]  ahb_mst_hwuser_s     [0:1];
+  logic        ahb_mst_hready_s     [0:1];
+  logic        ahb_mst_hresp_s      [0:1];
+  logic [31:0] ahb_mst_hrdata_s     [0:1];
+  logic [3:0]  ahb_mst_hruser_s     [0:1];
+  logic [3:0]  ahb_mst_hbuser_s     [0:1];
+  logic        ahb_slv_hsel_s       [0:2];
+  logic [1:0]  ahb_slv_htrans_s     [0:2];
+  logic [35:0] ahb_slv_haddr_s      [0:2];
+  logic        ahb_slv_hwrite_s     [0:2];
+  logic [2:0]  ahb_slv_hsize_s      [0:2];
+  logic [2:0]  ahb_slv_hburst_s     [0:2];
+  logic [6:0]  ahb_slv_hprot_s      [0:2];
+  logic        ahb_slv_hnonsec_s    [0:2];
+  logic        ahb_slv_hmastlock_s  [0:2];
+  logic        ahb_slv_hexcl_s      [0:2];
+  logic [5:0]  ahb_slv_hmaster_s    [0:2];
+  logic [3:0]  ahb_slv_hauser_s     [0:2];
+  logic        ahb_slv_hready_s     [0:2];
+  logic [31:0] ahb_slv_hwdata_s     [0:2];
+  logic [3:0]  ahb_slv_hwstrb_s     [0:2];
+  logic [3:0]  ahb_slv_hwuser_s     [0:2];
+  logic [2:0]  ahb_slv_hreadyout_s;        // bit `n` is slave index `n`
+  logic        ahb_slv_hresp_s      [0:2];
+  logic [31:0] ahb_slv_hrdata_s     [0:2];
+  logic [3:0]  ahb_slv_hruser_s     [0:2];
+  logic [3:0]  ahb_slv_hbuser_s     [0:2];
+  logic [2:0]  fsm_r                [0:1]; // Master FSMs
+  logic        mst_new_xfer_s       [0:1];
+  logic        mst_cont_xfer_s      [0:1];
+  logic        mst_hready_s         [0:1];
+  logic        mst_rqstate_s        [0:1];
+  logic        mst_addr_err_s       [0:1];
+  logic        mst_gnt_s            [0:1];
+  logic [2:0]  mst_sel_s            [0:1]; // bit `n` is slave index `n`
+  logic [2:0]  mst_req_s            [0:1]; // bit `n` is slave index `n`
+  logic [2:0]  mst_req_r            [0:1]; // bit `n` is slave index `n`
+  logic [2:0]  mst_keep_s           [0:1]; // bit `n` is slave index `n`
+  logic [2:0]  mst_gnt_r            [0:1]; // bit `n` is slave index `n` in data phase, switches with HREADY only
+  logic [2:0]  mst_slvgnt_s         [0:1]; // bit `n` is slave index `n`
+  logic [1:0]  mst_htrans_s         [0:1];
+  logic [1:0]  mst_htrans_r         [0:1];
+  logic [35:0] mst_haddr_s          [0:1];
+  logic [35:0] mst_haddr_r          [0:1];
+  logic        mst_hwrite_s         [0:1];
+  logic        mst_hwrite_r         [0:1];
+  logic [2:0]  mst_hsize_s          [0:1];
+  logic [2:0]  mst_hsize_r          [0:1];
+  logic [2:0]  mst_hburst_s         [0:1];
+  logic [2:0]  mst_hburst_r         [0:1];
+  logic [6:0]  mst_hprot_s          [0:1];
+  logic [6:0]  mst_hprot_r          [0:1];
+  logic        mst_hnonsec_s        [0:1];
+  logic        mst_hnonsec_r        [0:1];
+  logic        mst_hmastlock_s      [0:1];
+  logic        mst_hmastlock_r      [0:1];
+  logic        mst_hexcl_s          [0:1];
+  logic        mst_hexcl_r          [0:1];
+  logic [5:0]  mst_hmaster_s        [0:1];
+  logic [5:0]  mst_hmaster_r        [0:1];
+  logic [3:0]  mst_hauser_s         [0:1];
+  logic [3:0]  mst_hauser_r         [0:1];
+  logic        mst_hwrite_dph_r     [0:1]; // data-phase write indicator
+  logic [1:0]  slv_req_s            [0:2]; // bit `n` is the `n`-th master of the slave
+  logic [1:0]  slv_keep_s           [0:2]; // bit `n` is the `n`-th master of the slave
+  logic [1:0]  slv_dph_s            [0:2]; // bit `n` is the `n`-th master of the slave
+  logic [1:0]  slv_asel_s           [0:2]; // bit `n` is the `n`-th master of the slave
+  logic [1:0]  slv_gnt_s            [0:2]; // bit `n` is the `n`-th master of the slave
+  logic [1:0]  slv_gnt_r            [0:2]; // bit `n` is the `n`-th master of the slave
+
+
+  // ------------------------------------------------------
+  // Connectivity:
+  //   masters `m` and slaves `s` are indexed in order of creation,
+  //   position `p` is the index of a master within the masters of a slave.
+  // ------------------------------------------------------
+  localparam logic [5:0]  mst_slvmask     = 6'h1D;         // bit `m*3+s`: master `m` accesses slave `s`
+  localparam logic [1:0]  mst_sole        = 2'h0;          // bit `m`: master `m` accesses one slave only
+  localparam logic [2:0]  slv_multi       = 3'h1;          // bit `s`: slave `s` is accessed by multiple masters
+  localparam logic [5:0]  slv_posmask     = 6'h17;         // bit `s*2+p`: slave `s` has a `p`-th master
+  localparam logic [5:0]  slv_mstidx      = 6'h06;         // bits `(s*2+p)*1`: index of the `p`-th master of slave `s`
+  localparam logic [5:0]  mst_slvpos      = 6'h08;         // bits `(m*3+s)*1`: position of master `m` at slave `s`
+  localparam logic [1:0]  mst_hauser_has  = 2'h3;          // bit `m`: master `m` has hauser
+  localparam logic [11:0] slv_hauser_dflt = 12'h222;       // bits `s*4`: hauser default of slave `s`
+  localparam logic [1:0]  mst_hwuser_has  = 2'h3;          // bit `m`: master `m` has hwuser
+  localparam logic [11:0] slv_hwuser_dflt = 12'h555;       // bits `s*4`: hwuser default of slave `s`
+  localparam logic [2:0]  slv_hruser_has  = 3'h7;          // bit `s`: slave `s` has hruser
+  localparam logic [7:0]  mst_hruser_dflt = 8'h00;         // bits `m*4`: hruser default of master `m`
+  localparam logic [2:0]  slv_hbuser_has  = 3'h7;          // bit `s`: slave `s` has hbuser
+  localparam logic [7:0]  mst_hbuser_dflt = 8'h22;         // bits `m*4`: hbuser default of master `m`
+  localparam logic [35:0] slv_hmaster_enh = 36'h000010400; // bits `(s*2+p)*6`: hmaster expansion by the index of the `p`-th master of slave `s`
+
+
+  // ------------------------------------------------------
+  // Ports:
+  // ------------------------------------------------------
+  always_comb begin: proc_pack
+    ahb_mst_htrans_s[0]    = ahb_mst_ext_htrans_i;
+    ahb_mst_haddr_s[0]     = ahb_mst_ext_haddr_i;
+    ahb_mst_hwrite_s[0]    = ahb_mst_ext_hwrite_i;
+    ahb_mst_hsize_s[0]     = ahb_mst_ext_hsize_i;
+    ahb_mst_hburst_s[0]    = ahb_mst_ext_hburst_i;
+    ahb_mst_hprot_s[0]     = {ahb_mst_ext_hprot_i[3], 1'b0, ahb_mst_ext_hprot_i[3], ahb_mst_ext_hprot_i};
+    ahb_mst_hnonsec_s[0]   = ahb_mst_ext_hnonsec_i;
+    ahb_mst_hmastlock_s[0] = ahb_mst_ext_hmastlock_i;
+    ahb_mst_hexcl_s[0]     = 1'b1;
+    ahb_mst_hmaster_s[0]   = {2'h0, ahb_mst_ext_hmaster_i};
+    ahb_mst_hauser_s[0]    = ahb_mst_ext_hauser_i;
+    ahb_mst_hwdata_s[0]    = ahb_mst_ext_hwdata_i;
+    ahb_mst_hwstrb_s[0]    = ahb_mst_ext_hwstrb_i;
+    ahb_mst_hwuser_s[0]    = ahb_mst_ext_hwuser_i;
+    ahb_mst_htrans_s[1]    = ahb_mst_dsp_htrans_i;
+    ahb_mst_haddr_s[1]     = ahb_mst_dsp_haddr_i;
+    ahb_mst_hwrite_s[1]    = ahb_mst_dsp_hwrite_i;
+    ahb_mst_hsize_s[1]     = ahb_mst_dsp_hsize_i;
+    ahb_mst_hburst_s[1]    = ahb_mst_dsp_hburst_i;
+    ahb_mst_hprot_s[1]     = {ahb_mst_dsp_hprot_i[3], 1'b0, ahb_mst_dsp_hprot_i[3], ahb_mst_dsp_hprot_i};
+    ahb_mst_hnonsec_s[1]   = ahb_mst_dsp_hnonsec_i;
+    ahb_mst_hmastlock_s[1] = ahb_mst_dsp_hmastlock_i;
+    ahb_mst_hexcl_s[1]     = 1'b1;
+    ahb_mst_hmaster_s[1]   = {2'h0, ahb_mst_dsp_hmaster_i};
+    ahb_mst_hauser_s[1]    = ahb_mst_dsp_hauser_i;
+    ahb_mst_hwdata_s[1]    = ahb_mst_dsp_hwdata_i;
+    ahb_mst_hwstrb_s[1]    = ahb_mst_dsp_hwstrb_i;
+    ahb_mst_hwuser_s[1]    = ahb_mst_dsp_hwuser_i;
+    ahb_slv_hreadyout_s[0] = ahb_slv_ram_hreadyout_i;
+    ahb_slv_hresp_s[0]     = ahb_slv_ram_hresp_i;
+    ahb_slv_hrdata_s[0]    = ahb_slv_ram_hrdata_i;
+    ahb_slv_hruser_s[0]    = ahb_slv_ram_hruser_i;
+    ahb_slv_hbuser_s[0]    = ahb_slv_ram_hbuser_i;
+    ahb_slv_hreadyout_s[1] = ahb_slv_periph_hreadyout_i;
+    ahb_slv_hresp_s[1]     = ahb_slv_periph_hresp_i;
+    ahb_slv_hrdata_s[1]    = ahb_slv_periph_hrdata_i;
+    ahb_slv_hruser_s[1]    = ahb_slv_periph_hruser_i;
+    ahb_slv_hbuser_s[1]    = ahb_slv_periph_hbuser_i;
+    ahb_slv_hreadyout_s[2] = ahb_slv_misc_hreadyout_i;
+    ahb_slv_hresp_s[2]     = ahb_slv_misc_hresp_i;
+    ahb_slv_hrdata_s[2]    = ahb_slv_misc_hrdata_i;
+    ahb_slv_hruser_s[2]    = ahb_slv_misc_hruser_i;
+    ahb_slv_hbuser_s[2]    = ahb_slv_misc_hbuser_i;
+  end
+
+  always_comb begin: proc_unpack
+    ahb_mst_ext_hready_o       = ahb_mst_hready_s[0];
+    ahb_mst_ext_hresp_o        = ahb_mst_hresp_s[0];
+    ahb_mst_ext_hrdata_o       = ahb_mst_hrdata_s[0];
+    ahb_mst_ext_hruser_o       = ahb_mst_hruser_s[0];
+    ahb_mst_ext_hbuser_o       = ahb_mst_hbuser_s[0];
+    ahb_mst_dsp_hready_o       = ahb_mst_hready_s[1];
+    ahb_mst_dsp_hresp_o        = ahb_mst_hresp_s[1];
+    ahb_mst_dsp_hrdata_o       = ahb_mst_hrdata_s[1];
+    ahb_mst_dsp_hruser_o       = ahb_mst_hruser_s[1];
+    ahb_mst_dsp_hbuser_o       = ahb_mst_hbuser_s[1];
+    ahb_slv_ram_hsel_o         = ahb_slv_hsel_s[0];
+    ahb_slv_ram_haddr_o        = ahb_slv_haddr_s[0];
+    ahb_slv_ram_hauser_o       = ahb_slv_hauser_s[0];
+    ahb_slv_ram_hwuser_o       = ahb_slv_hwuser_s[0];
+    ahb_slv_ram_hwrite_o       = ahb_slv_hwrite_s[0];
+    ahb_slv_ram_htrans_o       = ahb_slv_htrans_s[0];
+    ahb_slv_ram_hsize_o        = ahb_slv_hsize_s[0];
+    ahb_slv_ram_hburst_o       = ahb_slv_hburst_s[0];
+    ahb_slv_ram_hprot_o        = ahb_slv_hprot_s[0];
+    ahb_slv_ram_hnonsec_o      = ahb_slv_hnonsec_s[0];
+    ahb_slv_ram_hmastlock_o    = ahb_slv_hmastlock_s[0];
+    ahb_slv_ram_hwdata_o       = ahb_slv_hwdata_s[0];
+    ahb_slv_ram_hwstrb_o       = ahb_slv_hwstrb_s[0];
+    ahb_slv_ram_hready_o       = ahb_slv_hready_s[0];
+    ahb_slv_ram_hexcl_o        = ahb_slv_hexcl_s[0];
+    ahb_slv_ram_hmaster_o      = ahb_slv_hmaster_s[0];
+    ahb_slv_periph_hsel_o      = ahb_slv_hsel_s[1];
+    ahb_slv_periph_haddr_o     = ahb_slv_haddr_s[1];
+    ahb_slv_periph_hauser_o    = ahb_slv_hauser_s[1];
+    ahb_slv_periph_hwuser_o    = ahb_slv_hwuser_s[1];
+    ahb_slv_periph_hwrite_o    = ahb_slv_hwrite_s[1];
+    ahb_slv_periph_htrans_o    = ahb_slv_htrans_s[1];
+    ahb_slv_periph_hsize_o     = ahb_slv_hsize_s[1];
+    ahb_slv_periph_hburst_o    = ahb_slv_hburst_s[1];
+    ahb_slv_periph_hprot_o     = ahb_slv_hprot_s[1];
+    ahb_slv_periph_hnonsec_o   = ahb_slv_hnonsec_s[1];
+    ahb_slv_periph_hmastlock_o = ahb_slv_hmastlock_s[1];
+    ahb_slv_periph_hwdata_o    = ahb_slv_hwdata_s[1];
+    ahb_slv_periph_hwstrb_o    = ahb_slv_hwstrb_s[1];
+    ahb_slv_periph_hready_o    = ahb_slv_hready_s[1];
+    ahb_slv_periph_hexcl_o     = ahb_slv_hexcl_s[1];
+    ahb_slv_periph_hmaster_o   = ahb_slv_hmaster_s[1];
+    ahb_slv_misc_hsel_o        = ahb_slv_hsel_s[2];
+    ahb_slv_misc_haddr_o       = ahb_slv_haddr_s[2];
+    ahb_slv_misc_hauser_o      = ahb_slv_hauser_s[2];
+    ahb_slv_misc_hwuser_o      = ahb_slv_hwuser_s[2];
+    ahb_slv_misc_hwrite_o      = ahb_slv_hwrite_s[2];
+    ahb_slv_misc_htrans_o      = ahb_slv_htrans_s[2];
+    ahb_slv_misc_hsize_o       = ahb_slv_hsize_s[2];
+    ahb_slv_misc_hburst_o      = ahb_slv_hburst_s[2];
+    ahb_slv_misc_hprot_o       = ahb_slv_hprot_s[2];
+    ahb_slv_misc_hnonsec_o     = ahb_slv_hnonsec_s[2];
+    ahb_slv_misc_hmastlock_o   = ahb_slv_hmastlock_s[2];
+    ahb_slv_misc_hwdata_o      = ahb_slv_hwdata_s[2];
+    ahb_slv_misc_hwstrb_o      = ahb_slv_hwstrb_s[2];
+    ahb_slv_misc_hready_o      = ahb_slv_hready_s[2];
+    ahb_slv_misc_hexcl_o       = ahb_slv_hexcl_s[2];
+    ahb_slv_misc_hmaster_o     = ahb_slv_hmaster_s[2];
+  end
+
+
+  // ------------------------------------------------------
+  // The Masters:
+  // ------------------------------------------------------
+  // Master 'ext' Address Decoding
+  always_comb begin: proc_ext_dec
+    mst_addr_err_s[0] = 1'b0;
+    mst_sel_s[0] = 3'h0;
+
+    casez (ahb_mst_ext_haddr_i[35:30])
+      6'b000010: begin // region 0
+        casez (ahb_mst_ext_haddr_i[29:10])
+          20'b0000000000000000????, 20'b000000000000000100??, 20'b0000000000000001010?, 20'b00000000000000010110: begin // misc
+            mst_sel_s[0][2] = 1'b1;
+          end
+
+          default: begin
+            mst_addr_err_s[0] = mst_new_xfer_s[0];
+          end
+        endcase
+      end
+
+      6'b000011: begin // region 1
+        casez (ahb_mst_ext_haddr_i[29:10])
+          20'b11000000000000??????: begin // ram
+            mst_sel_s[0][0] = 1'b1;
+          end
+
+          20'b110000000000100?????: begin // misc
+            mst_sel_s[0][2] = 1'b1;
+          end
+
+          default: begin
+            mst_addr_err_s[0] = mst_new_xfer_s[0];
+          end
+        endcase
+      end
+
+      default: begin
+        mst_addr_err_s[0] = mst_new_xfer_s[0];
+      end
+    endcase
+  end
+
+  // Master 'dsp' Address Decoding
+  always_comb begin: proc_dsp_dec
+    mst_addr_err_s[1] = 1'b0;
+    mst_sel_s[1] = 3'h0;
+
+    casez (ahb_mst_dsp_haddr_i[35])
+      1'b0: begin // region 0
+        casez (ahb_mst_dsp_haddr_i[34:16])
+          19'b0001111000000000000: begin // ram
+            mst_sel_s[1][0] = 1'b1;
+          end
+
+          19'b0001111000000000001: begin // periph
+            mst_sel_s[1][1] = 1'b1;
+          end
+
+          default: begin
+            mst_addr_err_s[1] = mst_new_xfer_s[1];
+          end
+        endcase
+      end
+
+      default: begin
+        mst_addr_err_s[1] = mst_new_xfer_s[1];
+      end
+    endcase
+  end
+
+  for (genvar m = 0; m < 2; m++) begin: g_mst
+
+    always_comb begin: proc_logic
+      mst_new_xfer_s[m]  = (ahb_mst_htrans_s[m] == ahb_trans_nonseq_e) ? 1'b1 : 1'b0;
+      mst_cont_xfer_s[m] = ((ahb_mst_htrans_s[m] == ahb_trans_busy_e) ||
+                            (ahb_mst_htrans_s[m] == ahb_trans_seq_e)) ? 1'b1 : 1'b0;
+      mst_rqstate_s[m]   = ((fsm_r[m] == fsm_idle_st) ||
+                            (fsm_r[m] == fsm_transfer_st) ||
+                            (fsm_r[m] == fsm_transfer_finish_st) ||
+                            (fsm_r[m] == fsm_error2_st)) ? 1'b1 : 1'b0;
+
+      // another slave is requested with the end of the current data phase only
+      mst_req_s[m]  = (mst_sel_s[m] & {3{mst_new_xfer_s[m] & mst_rqstate_s[m]}} & ({3{mst_hready_s[m]}} | mst_gnt_r[m])) |
+                      mst_req_r[m];
+      mst_keep_s[m] = mst_gnt_r[m] & {3{mst_cont_xfer_s[m]}} & slv_multi;
+    end
+
+    // Grant Combination
+    always_comb begin: proc_gnt
+      integer s;
+      for (s = 0; s < 3; s = s + 1) begin
+        mst_slvgnt_s[m][s] = mst_slvmask[m*3+s] & slv_gnt_s[s][mst_slvpos[(m*3+s)*1 +: 1]];
+      end
+      mst_gnt_s[m] = |mst_slvgnt_s[m];
+    end
+
+    // FSM
+    always_ff @(posedge main_clk_i or negedge main_rst_an_i) begin: proc_fsm
+      if (main_rst_an_i == 1'b0) begin
+        fsm_r[m] <= fsm_idle_st;
+        mst_gnt_r[m] <= 3'h0;
+      end else begin
+        case (fsm_r[m])
+          fsm_idle_st: begin
+            if (mst_new_xfer_s[m] == 1'b1) begin
+              if (mst_addr_err_s[m] == 1'b1) begin
+                fsm_r[m] <= fsm_error1_st;
+              end else if (mst_gnt_s[m] == 1'b1) begin
+                mst_req_r[m] <= 3'h0;
+                fsm_r[m] <= fsm_transfer_st;
+              end else begin
+                mst_req_r[m] <= mst_sel_s[m];
+                fsm_r[m] <= fsm_transfer_wait_st;
+              end
+              mst_gnt_r[m] <= mst_slvgnt_s[m];
+            end
+          end
+
+          fsm_error0_st: begin
+            if (mst_hready_s[m] == 1'b1) begin
+              mst_gnt_r[m] <= 3'h0;
+              fsm_r[m] <= fsm_error1_st;
+            end
+          end
+
+          fsm_error1_st: begin
+            fsm_r[m] <= fsm_error2_st;
+          end
+
+          fsm_error2_st: begin
+            if (mst_new_xfer_s[m] == 1'b1) begin
+              if (mst_addr_err_s[m] == 1'b1) begin
+                fsm_r[m] <= fsm_error1_st;
+              end else if (mst_gnt_s[m] == 1'b1) begin
+                mst_req_r[m] <= 3'h0;
+                fsm_r[m] <= fsm_transfer_st;
+              end else begin
+                mst_req_r[m] <= mst_sel_s[m];
+                fsm_r[m] <= fsm_transfer_wait_st;
+              end
+              mst_gnt_r[m] <= mst_slvgnt_s[m];
+            end else begin
+              fsm_r[m] <= fsm_idle_st;
+            end
+          end
+
+          fsm_transfer_st: begin
+            if ((ahb_mst_htrans_s[m] == ahb_trans_seq_e) ||
+                (ahb_mst_htrans_s[m] == ahb_trans_busy_e)) begin
+              fsm_r[m] <= fsm_transfer_st;
+            end else begin
+              if (ahb_mst_htrans_s[m] == ahb_trans_idle_e) begin
+                if (mst_hready_s[m] == 1'b0) begin
+                  fsm_r[m] <= fsm_transfer_finish_st;
+                end else begin
+                  mst_gnt_r[m] <= 3'h0;
+                  fsm_r[m] <= fsm_idle_st;
+                end
+              end else begin // (ahb_mst_htrans_s[m] == ahb_trans_nonseq_e)
+                if (mst_hready_s[m] == 1'b1) begin // address phase ends with the current data phase
+                  if (mst_addr_err_s[m] == 1'b1) begin
+                    fsm_r[m] <= fsm_error1_st;
+                  end else if (mst_gnt_s[m] == 1'b1) begin
+                    mst_req_r[m] <= 3'h0;
+                    fsm_r[m] <= fsm_transfer_st;
+                  end else begin
+                    mst_req_r[m] <= mst_sel_s[m];
+                    fsm_r[m] <= fsm_transfer_wait_st;
+                  end
+                  mst_gnt_r[m] <= mst_slvgnt_s[m];
+                end else if (mst_addr_err_s[m] == 1'b1) begin // the data phase continues
+                  fsm_r[m] <= fsm_error0_st;
+                end
+              end
+            end
+          end
+
+          fsm_transfer_wait_st: begin
+            if (mst_gnt_s[m] == 1'b1) begin
+              mst_req_r[m] <= 3'h0;
+              mst_gnt_r[m] <= mst_slvgnt_s[m];
+              fsm_r[m] <= fsm_transfer_st;
+            end
+          end
+
+          fsm_transfer_finish_st: begin
+            if (mst_hready_s[m] == 1'b1) begin
+              if (mst_new_xfer_s[m] == 1'b1) begin
+                if (mst_addr_err_s[m] == 1'b1) begin
+                  fsm_r[m] <= fsm_error1_st;
+                end else if (mst_gnt_s[m] == 1'b1) begin
+                  mst_req_r[m] <= 3'h0;
+                  fsm_r[m] <= fsm_transfer_st;
+                end else begin
+                  mst_req_r[m] <= mst_sel_s[m];
+                  fsm_r[m] <= fsm_transfer_wait_st;
+                end
+                mst_gnt_r[m] <= mst_slvgnt_s[m];
+              end else begin
+                mst_gnt_r[m] <= 3'h0;
+                fsm_r[m] <= fsm_idle_st;
+              end
+            end
+          end
+
+          default: begin
+            mst_gnt_r[m] <= 3'h0;
+            mst_req_r[m] <= 3'h0;
+            fsm_r[m] <= fsm_idle_st;
+          end
+        endcase
+      end
+
+      if ((mst_new_xfer_s[m] == 1'b1) && (mst_gnt_s[m] == 1'b0) && (mst_rqstate_s[m] == 1'b1)) begin
+        mst_htrans_r[m] <= ahb_mst_htrans_s[m];
+        mst_haddr_r[m] <= ahb_mst_haddr_s[m];
+        mst_hwrite_r[m] <= ahb_mst_hwrite_s[m];
+        mst_hsize_r[m] <= ahb_mst_hsize_s[m];
+        mst_hburst_r[m] <= ahb_mst_hburst_s[m];
+        mst_hprot_r[m] <= ahb_mst_hprot_s[m];
+        mst_hnonsec_r[m] <= ahb_mst_hnonsec_s[m];
+        mst_hmastlock_r[m] <= ahb_mst_hmastlock_s[m];
+        mst_hexcl_r[m] <= ahb_mst_hexcl_s[m];
+        mst_hmaster_r[m] <= ahb_mst_hmaster_s[m];
+        mst_hauser_r[m] <= ahb_mst_hauser_s[m];
+      end
+
+      if (mst_hready_s[m] == 1'b1) begin  // the address phase ends with the current data phase
+        mst_hwrite_dph_r[m] <= mst_hwrite_s[m];
+      end
+    end
+
+    // Mux
+    always_comb begin: proc_mux
+      if (fsm_r[m] == fsm_transfer_wait_st) begin
+        mst_htrans_s[m] = mst_htrans_r[m];
+        mst_haddr_s[m] = mst_haddr_r[m];
+        mst_hwrite_s[m] = mst_hwrite_r[m];
+        mst_hsize_s[m] = mst_hsize_r[m];
+        mst_hburst_s[m] = mst_hburst_r[m];
+        mst_hprot_s[m] = mst_hprot_r[m];
+        mst_hnonsec_s[m] = mst_hnonsec_r[m];
+        mst_hmastlock_s[m] = mst_hmastlock_r[m];
+        mst_hexcl_s[m] = mst_hexcl_r[m];
+        mst_hmaster_s[m] = mst_hmaster_r[m];
+        mst_hauser_s[m] = mst_hauser_r[m];
+      end else begin
+        mst_htrans_s[m] = ahb_mst_htrans_s[m];
+        mst_haddr_s[m] = ahb_mst_haddr_s[m];
+        mst_hwrite_s[m] = ahb_mst_hwrite_s[m];
+        mst_hsize_s[m] = ahb_mst_hsize_s[m];
+        mst_hburst_s[m] = ahb_mst_hburst_s[m];
+        mst_hprot_s[m] = ahb_mst_hprot_s[m];
+        mst_hnonsec_s[m] = ahb_mst_hnonsec_s[m];
+        mst_hmastlock_s[m] = ahb_mst_hmastlock_s[m];
+        mst_hexcl_s[m] = ahb_mst_hexcl_s[m];
+        mst_hmaster_s[m] = ahb_mst_hmaster_s[m];
+        mst_hauser_s[m] = ahb_mst_hauser_s[m];
+      end
+
+      mst_hready_s[m] = (|(ahb_slv_hreadyout_s & mst_gnt_r[m])) | ~(|mst_gnt_r[m]);
+    end
+
+    // Response
+    always_comb begin: proc_rsp
+      integer s;
+      logic [2:0] rsp_sel_s;
+      logic rsp_vld_s;
+      logic [1:0] rsp_idx_s;
+
+      rsp_sel_s = (mst_sole[m] == 1'b1) ? mst_slvmask[m*3 +: 3] : mst_gnt_r[m];
+      rsp_vld_s = (rsp_sel_s != 3'h0) && ((rsp_sel_s & (rsp_sel_s - 1'b1)) == 3'h0);
+      rsp_idx_s = 2'h0;
+      for (s = 0; s < 3; s = s + 1) begin
+        if (rsp_sel_s[s] == 1'b1) begin
+          rsp_idx_s = s[1:0];
+        end
+      end
+
+      ahb_mst_hrdata_s[m] = 32'h00000000;
+      ahb_mst_hready_s[m] = 1'b1;
+      ahb_mst_hresp_s[m]  = ahb_resp_okay_e;
+      ahb_mst_hruser_s[m] = mst_hruser_dflt[m*4 +: 4];
+      ahb_mst_hbuser_s[m] = mst_hbuser_dflt[m*4 +: 4];
+      case (fsm_r[m])
+        fsm_transfer_wait_st: begin
+          ahb_mst_hready_s[m] = 1'b0;
+        end
+
+        fsm_error1_st: begin
+          ahb_mst_hready_s[m] = 1'b0;
+          ahb_mst_hresp_s[m]  = ahb_resp_error_e;
+        end
+
+        fsm_error2_st: begin
+          ahb_mst_hresp_s[m]  = ahb_resp_error_e;
+        end
+
+        fsm_error0_st, fsm_transfer_st, fsm_transfer_finish_st: begin
+          if (rsp_vld_s == 1'b1) begin
+            if ((mst_hwrite_dph_r[m] == 1'b0) || (fsm_r[m] == fsm_transfer_finish_st)) begin
+              ahb_mst_hrdata_s[m] = ahb_slv_hrdata_s[rsp_idx_s];
+              if (slv_hruser_has[rsp_idx_s] == 1'b1) begin
+                ahb_mst_hruser_s[m] = ahb_slv_hruser_s[rsp_idx_s];
+              end
+              if (slv_hbuser_has[rsp_idx_s] == 1'b1) begin
+                ahb_mst_hbuser_s[m] = ahb_slv_hbuser_s[rsp_idx_s];
+              end
+            end
+            ahb_mst_hready_s[m] = ahb_slv_hreadyout_s[rsp_idx_s];
+            ahb_mst_hresp_s[m]  = ahb_slv_hresp_s[rsp_idx_s];
+          end
+        end
+
+        default: begin
+        end
+      endcase
+    end
+
+  end
+
+
+  // ------------------------------------------------------
+  // The Slaves:
+  // ------------------------------------------------------
+  for (genvar s = 0; s < 3; s++) begin: g_slv
+
+    // Masters in Order of Position
+    always_comb begin: proc_pos
+      integer p;
+      logic [0:0] mst_idx_s;
+      for (p = 0; p < 2; p = p + 1) begin
+        mst_idx_s = slv_mstidx[(s*2+p)*1 +: 1];
+        slv_req_s[s][p]  = slv_posmask[s*2+p] & mst_req_s[mst_idx_s][s];
+        slv_keep_s[s][p] = slv_posmask[s*2+p] & mst_keep_s[mst_idx_s][s];
+        slv_dph_s[s][p]  = slv_posmask[s*2+p] & mst_gnt_r[mst_idx_s][s];
+      end
+    end
+
+    if (slv_multi[s] == 1'b1) begin: g_arb
+
+      // Round-Robin Arbiter
+      always_comb begin: proc_rr_arb
+        integer i;
+        logic found_s;
+        logic [1:0] next_grant_s;
+        logic arb_en_s;
+
+        arb_en_s = ~(|slv_keep_s[s]);
+
+        next_grant_s = {slv_gnt_r[s][0], slv_gnt_r[s][1:1]}; // 1st candidate is old grant rotated 1 right
+        found_s = 1'b0;
+        for (i=0; i<2; i=i+1) begin
+          if (found_s == 1'b0) begin
+            if ((slv_req_s[s] & next_grant_s) != 2'h0) begin
+              found_s = 1'b1;
+            end else begin
+              next_grant_s = {next_grant_s[0], next_grant_s[1:1]}; // rotate 1 right
+            end
+          end
+        end
+
+        slv_gnt_s[s] = slv_req_s[s] & next_grant_s & {2{(ahb_slv_hreadyout_s[s] & arb_en_s)}};
+        slv_asel_s[s] = slv_gnt_s[s] | (slv_keep_s[s] & slv_dph_s[s]);
+        ahb_slv_hsel_s[s] = |slv_asel_s[s];
+      end
+
+      always_ff @(posedge main_clk_i or negedge main_rst_an_i) begin: proc_gnt
+        if (main_rst_an_i == 1'b0) begin
+          slv_gnt_r[s] <= 2'h1;  // initial pseudo-grant
+        end else begin
+          if (slv_gnt_s[s] != 2'h0) begin
+            slv_gnt_r[s] <= slv_gnt_s[s];
+          end
+        end
+      end
+
+    // Address Phase Mux
+    always_comb begin: proc_aph_mux
+      integer p;
+      logic aph_vld_s;
+      logic [0:0] aph_idx_s;
+      logic [5:0] aph_enh_s;
+
+      aph_vld_s = (slv_asel_s[s] != 2'h0) && ((slv_asel_s[s] & (slv_asel_s[s] - 1'b1)) == 2'h0);
+      aph_idx_s = 1'h0;
+      aph_enh_s = 6'h00;
+      for (p = 0; p < 2; p = p + 1) begin
+        if (slv_asel_s[s][p] == 1'b1) begin
+          aph_idx_s = slv_mstidx[(s*2+p)*1 +: 1];
+          aph_enh_s = slv_hmaster_enh[(s*2+p)*6 +: 6];
+        end
+      end
+
+      if (aph_vld_s == 1'b1) begin
+        ahb_slv_htrans_s[s] = mst_htrans_s[aph_idx_s];
+        ahb_slv_haddr_s[s] = mst_haddr_s[aph_idx_s];
+        ahb_slv_hwrite_s[s] = mst_hwrite_s[aph_idx_s];
+        ahb_slv_hsize_s[s] = mst_hsize_s[aph_idx_s];
+        ahb_slv_hburst_s[s] = mst_hburst_s[aph_idx_s];
+        ahb_slv_hprot_s[s] = mst_hprot_s[aph_idx_s];
+        ahb_slv_hnonsec_s[s] = mst_hnonsec_s[aph_idx_s];
+        ahb_slv_hmastlock_s[s] = mst_hmastlock_s[aph_idx_s];
+        ahb_slv_hexcl_s[s] = mst_hexcl_s[aph_idx_s];
+        ahb_slv_hmaster_s[s] = mst_hmaster_s[aph_idx_s] | aph_enh_s;
+        ahb_slv_hauser_s[s] = (mst_hauser_has[aph_idx_s] == 1'b1) ? mst_hauser_s[aph_idx_s] : slv_hauser_dflt[s*4 +: 4];
+        ahb_slv_hready_s[s] = mst_hready_s[aph_idx_s];
+      end else begin
+        ahb_slv_htrans_s[s] = ahb_trans_idle_e;
+        ahb_slv_haddr_s[s] = 36'h000000000;
+        ahb_slv_hwrite_s[s] = ahb_write_read_e;
+        ahb_slv_hsize_s[s] = ahb_size_word_e;
+        ahb_slv_hburst_s[s] = ahb_burst_single_e;
+        ahb_slv_hprot_s[s] = 7'h03;
+        ahb_slv_hnonsec_s[s] = 1'b0;
+        ahb_slv_hmastlock_s[s] = 1'b0;
+        ahb_slv_hexcl_s[s] = 1'b1;
+        ahb_slv_hmaster_s[s] = 6'h00;
+        ahb_slv_hauser_s[s] = slv_hauser_dflt[s*4 +: 4];
+        ahb_slv_hready_s[s] = ahb_slv_hreadyout_s[s];
+      end
+    end
+
+    end else begin: g_sole
+      // No Arbitration Necessary
+      always_comb begin: proc_asgn
+        slv_gnt_s[s] = slv_req_s[s];
+        slv_asel_s[s] = 2'h0;
+        slv_asel_s[s][0] = mst_sel_s[slv_mstidx[s*2*1 +: 1]][s];
+        ahb_slv_hsel_s[s] = slv_req_s[s][0] | (slv_dph_s[s][0] & mst_cont_xfer_s[slv_mstidx[s*2*1 +: 1]]);
+      end
+
+    // Address Phase Mux
+    always_comb begin: proc_aph_mux
+      integer p;
+      logic aph_vld_s;
+      logic [0:0] aph_idx_s;
+      logic [5:0] aph_enh_s;
+
+      aph_vld_s = (slv_asel_s[s] != 2'h0) && ((slv_asel_s[s] & (slv_asel_s[s] - 1'b1)) == 2'h0);
+      aph_idx_s = 1'h0;
+      aph_enh_s = 6'h00;
+      for (p = 0; p < 2; p = p + 1) begin
+        if (slv_asel_s[s][p] == 1'b1) begin
+          aph_idx_s = slv_mstidx[(s*2+p)*1 +: 1];
+          aph_enh_s = slv_hmaster_enh[(s*2+p)*6 +: 6];
+        end
+      end
+
+      if (aph_vld_s == 1'b1) begin
+        ahb_slv_htrans_s[s] = ahb_mst_htrans_s[aph_idx_s];
+        ahb_slv_haddr_s[s] = ahb_mst_haddr_s[aph_idx_s];
+        ahb_slv_hwrite_s[s] = ahb_mst_hwrite_s[aph_idx_s];
+        ahb_slv_hsize_s[s] = ahb_mst_hsize_s[aph_idx_s];
+        ahb_slv_hburst_s[s] = ahb_mst_hburst_s[aph_idx_s];
+        ahb_slv_hprot_s[s] = ahb_mst_hprot_s[aph_idx_s];
+        ahb_slv_hnonsec_s[s] = ahb_mst_hnonsec_s[aph_idx_s];
+        ahb_slv_hmastlock_s[s] = ahb_mst_hmastlock_s[aph_idx_s];
+        ahb_slv_hexcl_s[s] = ahb_mst_hexcl_s[aph_idx_s];
+        ahb_slv_hmaster_s[s] = ahb_mst_hmaster_s[aph_idx_s] | aph_enh_s;
+        ahb_slv_hauser_s[s] = (mst_hauser_has[aph_idx_s] == 1'b1) ? ahb_mst_hauser_s[aph_idx_s] : slv_hauser_dflt[s*4 +: 4];
+        ahb_slv_hready_s[s] = mst_hready_s[aph_idx_s];
+      end else begin
+        ahb_slv_htrans_s[s] = ahb_trans_idle_e;
+        ahb_slv_haddr_s[s] = 36'h000000000;
+        ahb_slv_hwrite_s[s] = ahb_write_read_e;
+        ahb_slv_hsize_s[s] = ahb_size_word_e;
+        ahb_slv_hburst_s[s] = ahb_burst_single_e;
+        ahb_slv_hprot_s[s] = 7'h03;
+        ahb_slv_hnonsec_s[s] = 1'b0;
+        ahb_slv_hmastlock_s[s] = 1'b0;
+        ahb_slv_hexcl_s[s] = 1'b1;
+        ahb_slv_hmaster_s[s] = 6'h00;
+        ahb_slv_hauser_s[s] = slv_hauser_dflt[s*4 +: 4];
+        ahb_slv_hready_s[s] = ahb_slv_hreadyout_s[s];
+      end
+    end
+
+    end
+
+    // Data Phase Mux
+    always_comb begin: proc_dph_mux
+      integer p;
+      logic dph_vld_s;
+      logic [0:0] dph_idx_s;
+
+      dph_vld_s = (slv_dph_s[s] != 2'h0) && ((slv_dph_s[s] & (slv_dph_s[s] - 1'b1)) == 2'h0);
+      dph_idx_s = 1'h0;
+      for (p = 0; p < 2; p = p + 1) begin
+        if (slv_dph_s[s][p] == 1'b1) begin
+          dph_idx_s = slv_mstidx[(s*2+p)*1 +: 1];
+        end
+      end
+
+      if (dph_vld_s == 1'b1) begin
+        ahb_slv_hwdata_s[s] = ahb_mst_hwdata_s[dph_idx_s];
+        ahb_slv_hwstrb_s[s] = ahb_mst_hwstrb_s[dph_idx_s];
+        ahb_slv_hwuser_s[s] = (mst_hwuser_has[dph_idx_s] == 1'b1) ? ahb_mst_hwuser_s[dph_idx_s] : slv_hwuser_dflt[s*4 +: 4];
+      end else begin
+        ahb_slv_hwdata_s[s] = 32'h00000000;
+        ahb_slv_hwstrb_s[s] = 4'h0;
+        ahb_slv_hwuser_s[s] = slv_hwuser_dflt[s*4 +: 4];
+      end
+    end
+
+  end
+
+endmodule // ucdp_ahb_ml_example_ml
+
+`default_nettype wire
+`end_keywords
+
+// =============================================================================
+//
+//   @generated @fully-generated
+//
+//   THIS FILE IS GENERATED!!! DO NOT EDIT MANUALLY. CHANGES ARE LOST.
+//
+// =============================================================================
@@ -0,0 +1,264 @@
+// =============================================================================
+//
+//   @generated @fully-generated
+//
+//   THIS FILE IS GENERATED!!! DO NOT EDIT MANUALLY. CHANGES ARE LOST.
+//
+// =============================================================================
+//
+//  MIT License
+//
+//  Copyright (c) 2024-2025 nbiotcloud
+//
+//  Permission is hereby granted, free of charge, to any person obtaining a copy
+//  of this software and associated documentation files (the "Software"), to deal
+//  in the Software without restriction, including without limitation the rights
+//  to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+//  copies of the Software, and to permit persons to whom the Software is
+//  furnished to do so, subject to the following conditions:
+//
+//  The above copyright notice and this permission notice shall be included in all
+//  copies or substantial portions of the Software.
+//
+//  THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+//  IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+//  FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+//  AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+//  LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+//  OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+//  SOFTWARE.
+//
+// =============================================================================
+//
+// Module:     ucdp_amba.ucdp_ahb_post_example_depth4
+// Data Model: ucdp_amba.ucdp_ahb_post.UcdpAhbPostMod
+//
+// =============================================================================
+
+`begin_keywords "1800-2009"
+`default_nettype none  // implicit wires are forbidden
+
+module ucdp_ahb_post_example_depth4 ( // ucdp_amba.ucdp_ahb_post.UcdpAhbPostMod
+  // main_i: Clock and Reset
+  input  wire         main_clk_i,          // Clock
+  input  wire         main_rst_an_i,       // Async Reset (Low-Active)
+  // -
+  output logic        irq_o,               // Posted Write Error Interrupt
+  // ahb_src_i: AHB Source
+  input  wire         ahb_src_hsel_i,      // AHB Slave Select
+  input  wire  [31:0] ahb_src_haddr_i,     // AHB Bus Address
+  input  wire         ahb_src_hwrite_i,    // AHB Write Enable
+  input  wire  [1:0]  ahb_src_htrans_i,    // AHB Transfer Type
+  input  wire  [2:0]  ahb_src_hsize_i,     // AHB Size
+  input  wire  [2:0]  ahb_src_hburst_i,    // AHB Burst Type
+  input  wire  [3:0]  ahb_src_hprot_i,     // AHB Transfer Protection
+  input  wire  [31:0] ahb_src_hwdata_i,    // AHB Data
+  input  wire         ahb_src_hready_i,    // AHB Transfer Done to Slave
+  output logic        ahb_src_hreadyout_o, // AHB Transfer Done from Slave
+  output logic        ahb_src_hresp_o,     // AHB Response Error
+  output logic [31:0] ahb_src_hrdata_o,    // AHB Data
+  // ahb_tgt_o: AHB Target
+  output logic        ahb_tgt_hsel_o,      // AHB Slave Select
+  output logic [31:0] ahb_tgt_haddr_o,     // AHB Bus Address
+  output logic        ahb_tgt_hwrite_o,    // AHB Write Enable
+  output logic [1:0]  ahb_tgt_htrans_o,    // AHB Transfer Type
+  output logic [2:0]  ahb_tgt_hsize_o,     // AHB Size
+  output logic [2:0]  ahb_tgt_hburst_o,    // AHB Burst Type
+  output logic [3:0]  ahb_tgt_hprot_o,     // AHB Transfer Protection
+  output logic [31:0] ahb_tgt_hwdata_o,    // AHB Data
+  output logic        ahb_tgt_hready_o,    // AHB Transfer Done to Slave
+  input  wire         ahb_tgt_hreadyout_i, // AHB Transfer Done from Slave
+  input  wire         ahb_tgt_hresp_i,     // AHB Response Error
+  input  wire  [31:0] ahb_tgt_hrdata_i     // AHB Data
+);
+
+
+  import ucdp_amba_pkg::*;
+
+
+
+  // ------------------------------------------------------
+  //  Signals
+  // ------------------------------------------------------
+  logic        src_valid_s;         // transfer requested
+  logic        src_post_s;          // posted write requested
+  logic        src_pass_s;          // transfer forwarded to the idle target
+  logic        src_pst_r;           // data phase of a posted write
+  logic        src_npst_r;          // data phase of a non-posted transfer
+  logic        src_hld_r;           // non-posted transfer held back until the buffer is drained
+  logic [31:0] src_haddr_r;         // AHB Bus Address
+  logic        src_hwrite_r;        // AHB Write Enable
+  logic [2:0]  src_hsize_r;         // AHB Size
+  logic [3:0]  src_hprot_r;         // AHB Transfer Protection
+  logic        buf_empty_s;
+  logic        buf_full_s;
+  logic        buf_push_s;          // posted write stored
+  logic        buf_pop_s;           // posted write drained
+  logic [2:0]  buf_cnt_r;           // number of posted writes
+  logic [1:0]  buf_wrptr_r;
+  logic [1:0]  buf_rdptr_r;
+  logic [31:0] buf_haddr_r   [0:3];
+  logic [2:0]  buf_hsize_r   [0:3];
+  logic [3:0]  buf_hprot_r   [0:3];
+  logic [31:0] buf_hwdata_r  [0:3];
+  logic        tgt_valid_s;         // transfer to target
+  logic        tgt_dph_r;           // data phase at target
+  logic        tgt_npst_r;          // data phase of a non-posted transfer at target
+  logic        tgt_fwd_r;           // first data phase cycle of a forwarded posted write
+  logic [31:0] tgt_hwdata_r;        // AHB Data
+  logic        irq_r;               // Level IRQ
+
+  // === source =========================
+  // bufferable writes are posted, all other transfers wait for the drained buffer - transfers to an idle target are forwarded
+  assign src_valid_s = ((ahb_src_hsel_i == 1'b1) && (ahb_src_hready_i == 1'b1) &&
+                        ((ahb_src_htrans_i == ahb_trans_nonseq_e) || (ahb_src_htrans_i == ahb_trans_seq_e))) ? 1'b1 : 1'b0;
+  assign src_post_s = ((src_valid_s == 1'b1) && (ahb_src_hwrite_i == ahb_write_write_e) &&
+                       (ahb_src_hprot_i[2] == 1'b1)) ? 1'b1 : 1'b0;
+  assign src_pass_s = src_valid_s & ~src_pst_r & buf_empty_s;
+
+  always_ff @(posedge main_clk_i or negedge main_rst_an_i) begin: proc_src
+    if (main_rst_an_i == 1'b0) begin
+      src_pst_r <= 1'b0;
+      src_npst_r <= 1'b0;
+      src_hld_r <= 1'b0;
+      src_haddr_r <= 32'h00000000;
+      src_hwrite_r <= 1'b0;
+      src_hsize_r <= 3'h0;
+      src_hprot_r <= 4'h3;
+    end else begin
+      if (ahb_src_hreadyout_o == 1'b1) begin  // the data phase ends
+        src_pst_r <= src_post_s & ~(src_pass_s & ahb_tgt_hready_o);
+        src_npst_r <= src_valid_s & ~src_post_s;
+        src_hld_r <= src_valid_s & ~src_post_s & ~(src_pass_s & ahb_tgt_hready_o);
+      end else if ((src_hld_r == 1'b1) && (buf_empty_s == 1'b1) && (ahb_tgt_hready_o == 1'b1)) begin
+        src_hld_r <= 1'b0;
+      end
+      if (src_valid_s == 1'b1) begin
+        src_haddr_r <= ahb_src_haddr_i;
+        src_hwrite_r <= ahb_src_hwrite_i;
+        src_hsize_r <= ahb_src_hsize_i;
+        src_hprot_r <= ahb_src_hprot_i;
+      end
+    end
+  end
+
+  always_comb begin: proc_src_rsp
+    if (src_pst_r == 1'b1) begin
+      ahb_src_hreadyout_o = ~buf_full_s;
+    end else if (src_npst_r == 1'b1) begin
+      ahb_src_hreadyout_o = tgt_dph_r & tgt_npst_r & ahb_tgt_hreadyout_i;
+    end else begin
+      ahb_src_hreadyout_o = 1'b1;
+    end
+  end
+
+  assign ahb_src_hresp_o = ((tgt_dph_r == 1'b1) && (tgt_npst_r == 1'b1)) ? ahb_tgt_hresp_i : ahb_resp_okay_e;
+  assign ahb_src_hrdata_o = ahb_tgt_hrdata_i;
+
+  // === buffer =========================
+  assign buf_empty_s = (buf_cnt_r == 3'h0) ? 1'b1 : 1'b0;
+  assign buf_full_s = (buf_cnt_r == 3'h4) ? 1'b1 : 1'b0;
+  assign buf_push_s = src_pst_r & ~buf_full_s;
+  assign buf_pop_s = ~buf_empty_s & ahb_tgt_hready_o;
+
+  always_ff @(posedge main_clk_i or negedge main_rst_an_i) begin: proc_buf
+    if (main_rst_an_i == 1'b0) begin
+      buf_cnt_r <= 3'h0;
+      buf_wrptr_r <= 2'h0;
+      buf_rdptr_r <= 2'h0;
+      for (int i = 0; i < 4; i++) begin
+        buf_haddr_r[i] <= 32'h00000000;
+        buf_hsize_r[i] <= 3'h0;
+        buf_hprot_r[i] <= 4'h3;
+        buf_hwdata_r[i] <= 32'h00000000;
+      end
+    end else begin
+      if (buf_push_s == 1'b1) begin
+        buf_haddr_r[buf_wrptr_r] <= src_haddr_r;
+        buf_hsize_r[buf_wrptr_r] <= src_hsize_r;
+        buf_hprot_r[buf_wrptr_r] <= src_hprot_r;
+        buf_hwdata_r[buf_wrptr_r] <= ahb_src_hwdata_i;
+        buf_wrptr_r <= (buf_wrptr_r == 2'h3) ? 2'h0 : buf_wrptr_r + 2'h1;
+      end
+      if (buf_pop_s == 1'b1) begin
+        buf_rdptr_r <= (buf_rdptr_r == 2'h3) ? 2'h0 : buf_rdptr_r + 2'h1;
+      end
+      if ((buf_push_s == 1'b1) && (buf_pop_s == 1'b0)) begin
+        buf_cnt_r <= buf_cnt_r + 3'h1;
+      end else if ((buf_push_s == 1'b0) && (buf_pop_s == 1'b1)) begin
+        buf_cnt_r <= buf_cnt_r - 3'h1;
+      end
+    end
+  end
+
+  // === target =========================
+  // posted writes first, then the held transfer, forwarded transfers otherwise
+  assign tgt_valid_s = ~buf_empty_s | src_hld_r | src_pass_s;
+
+  always_comb begin: proc_tgt_aph
+    if (buf_empty_s == 1'b0) begin
+      ahb_tgt_hsel_o = 1'b1;
+      ahb_tgt_htrans_o = ahb_trans_nonseq_e;
+      ahb_tgt_hwrite_o = ahb_write_write_e;
+      ahb_tgt_haddr_o = buf_haddr_r[buf_rdptr_r];
+      ahb_tgt_hsize_o = buf_hsize_r[buf_rdptr_r];
+      ahb_tgt_hprot_o = buf_hprot_r[buf_rdptr_r];
+    end else if (src_hld_r == 1'b1) begin
+      ahb_tgt_hsel_o = 1'b1;
+      ahb_tgt_htrans_o = ahb_trans_nonseq_e;
+      ahb_tgt_haddr_o = src_haddr_r;
+      ahb_tgt_hwrite_o = src_hwrite_r;
+      ahb_tgt_hsize_o = src_hsize_r;
+      ahb_tgt_hprot_o = src_hprot_r;
+    end else begin
+      ahb_tgt_hsel_o = src_pass_s;
+      ahb_tgt_htrans_o = (src_pass_s == 1'b1) ? ahb_trans_nonseq_e : ahb_trans_idle_e;
+      ahb_tgt_haddr_o = ahb_src_haddr_i;
+      ahb_tgt_hwrite_o = ahb_src_hwrite_i;
+      ahb_tgt_hsize_o = ahb_src_hsize_i;
+      ahb_tgt_hprot_o = ahb_src_hprot_i;
+    end
+  end
+
+  assign ahb_tgt_hburst_o = ahb_burst_single_e;
+  assign ahb_tgt_hready_o = (tgt_dph_r == 1'b1) ? ahb_tgt_hreadyout_i : 1'b1;
+  assign ahb_tgt_hwdata_o = ((tgt_npst_r == 1'b1) || (tgt_fwd_r == 1'b1)) ? ahb_src_hwdata_i : tgt_hwdata_r;
+
+  always_ff @(posedge main_clk_i or negedge main_rst_an_i) begin: proc_tgt
+    if (main_rst_an_i == 1'b0) begin
+      tgt_dph_r <= 1'b0;
+      tgt_npst_r <= 1'b0;
+      tgt_fwd_r <= 1'b0;
+      tgt_hwdata_r <= 32'h00000000;
+      irq_r <= 1'b0;
+    end else begin
+      if (ahb_tgt_hready_o == 1'b1) begin
+        tgt_dph_r <= tgt_valid_s;
+        tgt_npst_r <= buf_empty_s & ~src_post_s;
+      end
+      tgt_fwd_r <= src_pass_s & src_post_s & ahb_tgt_hready_o;
+      if (tgt_fwd_r == 1'b1) begin  // the source data phase of the forwarded posted write ends
+        tgt_hwdata_r <= ahb_src_hwdata_i;
+      end else if (buf_pop_s == 1'b1) begin
+        tgt_hwdata_r <= buf_hwdata_r[buf_rdptr_r];
+      end
+      // the posted write failed
+      irq_r <= tgt_dph_r & ~tgt_npst_r & ahb_tgt_hreadyout_i & (ahb_tgt_hresp_i == ahb_resp_error_e);
+    end
+  end
+
+  assign irq_o = irq_r;
+
+
+endmodule // ucdp_ahb_post_example_depth4
+
+`default_nettype wire
+`end_keywords
+
+// =============================================================================
+//
+//   @generated @fully-generated
+//
+//   THIS FILE IS GENERATED!!! DO NOT EDIT MANUALLY. CHANGES ARE LOST.
+//
+// =============================================================================
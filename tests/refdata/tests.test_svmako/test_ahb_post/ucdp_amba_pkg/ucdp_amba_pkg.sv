@@ -0,0 +1,146 @@
+// =============================================================================
+//
+//   @generated @fully-generated
+//
+//   THIS FILE IS GENERATED!!! DO NOT EDIT MANUALLY. CHANGES ARE LOST.
+//
+// =============================================================================
+//
+//  MIT License
+//
+//  Copyright (c) 2025 nbiotcloud
+//
+//  Permission is hereby granted, free of charge, to any person obtaining a copy
+//  of this software and associated documentation files (the "Software"), to deal
+//  in the Software without restriction, including without limitation the rights
+//  to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+//  copies of the Software, and to permit persons to whom the Software is
+//  furnished to do so, subject to the following conditions:
+//
+//  The above copyright notice and this permission notice shall be included in all
+//  copies or substantial portions of the Software.
+//
+//  THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+//  IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+//  FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+//  AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+//  LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+//  OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+//  SOFTWARE.
+//
+// =============================================================================
+//
+// Module:     ucdp_amba.ucdp_amba_pkg
+// Data Model: ucdp_amba.ucdp_amba_pkg.UcdpAmbaPkgMod
+//
+// =============================================================================
+
+`begin_keywords "1800-2009"
+`default_nettype none  // implicit wires are forbidden
+
+package ucdp_amba_pkg;
+
+  // ahb_trans
+  localparam integer       ahb_trans_width_p             = 2;    // Width in Bits
+  localparam logic   [1:0] ahb_trans_min_p               = 2'h0; // AHB Transfer Type
+  localparam logic   [1:0] ahb_trans_max_p               = 2'h3; // AHB Transfer Type
+  localparam logic   [1:0] ahb_trans_idle_e              = 2'h0; // No transfer
+  localparam logic   [1:0] ahb_trans_busy_e              = 2'h1; // Idle cycle within transfer
+  localparam logic   [1:0] ahb_trans_nonseq_e            = 2'h2; // Single transfer or first transfer of a burst
+  localparam logic   [1:0] ahb_trans_seq_e               = 2'h3; // Consecutive transfers of a burst
+  localparam logic   [1:0] ahb_trans_default_p           = 2'h0; // AHB Transfer Type
+  // ahb_resp
+  localparam integer       ahb_resp_width_p              = 1;    // Width in Bits
+  localparam logic         ahb_resp_min_p                = 1'b0; // AHB Response Error
+  localparam logic         ahb_resp_max_p                = 1'b1; // AHB Response Error
+  localparam logic         ahb_resp_okay_e               = 1'b0; // OK
+  localparam logic         ahb_resp_error_e              = 1'b1; // Error
+  localparam logic         ahb_resp_default_p            = 1'b0; // AHB Response Error
+  // ahb_size
+  localparam integer       ahb_size_width_p              = 3;    // Width in Bits
+  localparam logic   [2:0] ahb_size_min_p                = 3'h0; // AHB Size
+  localparam logic   [2:0] ahb_size_max_p                = 3'h7; // AHB Size
+  localparam logic   [2:0] ahb_size_byte_e               = 3'h0; // Byte
+  localparam logic   [2:0] ahb_size_halfword_e           = 3'h1; // Halfword
+  localparam logic   [2:0] ahb_size_word_e               = 3'h2; // Word
+  localparam logic   [2:0] ahb_size_doubleword_e         = 3'h3; // Doubleword
+  localparam logic   [2:0] ahb_size_fourword_e           = 3'h4; // 4-word
+  localparam logic   [2:0] ahb_size_eightword_e          = 3'h5; // 8-word
+  localparam logic   [2:0] ahb_size_sixteenword_e        = 3'h6; // 16-word
+  localparam logic   [2:0] ahb_size_kilobit_e            = 3'h7; // 32-word
+  localparam logic   [2:0] ahb_size_default_p            = 3'h0; // AHB Size
+  // ahb_burst
+  localparam integer       ahb_burst_width_p             = 3;    // Width in Bits
+  localparam logic   [2:0] ahb_burst_min_p               = 3'h0; // AHB Burst Type
+  localparam logic   [2:0] ahb_burst_max_p               = 3'h7; // AHB Burst Type
+  localparam logic   [2:0] ahb_burst_single_e            = 3'h0; // Single transfer
+  localparam logic   [2:0] ahb_burst_incr_e              = 3'h1; // Incrementing burst of unspecified length
+  localparam logic   [2:0] ahb_burst_wrap4_e             = 3'h2; // 4-beat wrapping burst
+  localparam logic   [2:0] ahb_burst_incr4_e             = 3'h3; // 4-beat incrementing burst
+  localparam logic   [2:0] ahb_burst_wrap8_e             = 3'h4; // 8-beat wrapping burst
+  localparam logic   [2:0] ahb_burst_incr8_e             = 3'h5; // 8-beat incrementing burst
+  localparam logic   [2:0] ahb_burst_wrap16_e            = 3'h6; // 16-beat wrapping burst
+  localparam logic   [2:0] ahb_burst_incr16_e            = 3'h7; // 16-beat incrementing burst
+  localparam logic   [2:0] ahb_burst_default_p           = 3'h0; // AHB Burst Type
+  // ahb_write
+  localparam integer       ahb_write_width_p             = 1;    // Width in Bits
+  localparam logic         ahb_write_min_p               = 1'b0; // AHB Write Enable
+  localparam logic         ahb_write_max_p               = 1'b1; // AHB Write Enable
+  localparam logic         ahb_write_read_e              = 1'b0; // Read operation
+  localparam logic         ahb_write_write_e             = 1'b1; // Write operation
+  localparam logic         ahb_write_default_p           = 1'b0; // AHB Write Enable
+  // ahb_hexok
+  localparam integer       ahb_hexok_width_p             = 1;    // Width in Bits
+  localparam logic         ahb_hexok_min_p               = 1'b0; // AHB Exclusive Response
+  localparam logic         ahb_hexok_max_p               = 1'b1; // AHB Exclusive Response
+  localparam logic         ahb_hexok_error_e             = 1'b0; // Error
+  localparam logic         ahb_hexok_okay_e              = 1'b1; // OK
+  localparam logic         ahb_hexok_default_p           = 1'b0; // AHB Exclusive Response
+  // apb_ready
+  localparam integer       apb_ready_width_p             = 1;    // Width in Bits
+  localparam logic         apb_ready_min_p               = 1'b0; // APB Transfer Done
+  localparam logic         apb_ready_max_p               = 1'b1; // APB Transfer Done
+  localparam logic         apb_ready_busy_e              = 1'b0; // Ongoing
+  localparam logic         apb_ready_done_e              = 1'b1; // Done
+  localparam logic         apb_ready_default_p           = 1'b1; // APB Transfer Done
+  // apb_resp
+  localparam integer       apb_resp_width_p              = 1;    // Width in Bits
+  localparam logic         apb_resp_min_p                = 1'b0; // APB Response Error
+  localparam logic         apb_resp_max_p                = 1'b1; // APB Response Error
+  localparam logic         apb_resp_okay_e               = 1'b0; // OK
+  localparam logic         apb_resp_error_e              = 1'b1; // Error
+  localparam logic         apb_resp_default_p            = 1'b0; // APB Response Error
+  // ahb_ml_fsm
+  localparam integer       ahb_ml_fsm_width_p            = 3;    // Width in Bits
+  localparam logic   [2:0] ahb_ml_fsm_min_p              = 3'h0; // AHB ML FSM Type
+  localparam logic   [2:0] ahb_ml_fsm_max_p              = 3'h7; // AHB ML FSM Type
+  localparam logic   [2:0] ahb_ml_fsm_idle_st            = 3'h0; // No transfer
+  localparam logic   [2:0] ahb_ml_fsm_transfer_st        = 3'h1; // Transfer
+  localparam logic   [2:0] ahb_ml_fsm_transfer_finish_st = 3'h2; // Transfer Finish (wait for HREADY)
+  localparam logic   [2:0] ahb_ml_fsm_transfer_wait_st   = 3'h3; // Transfer Wait for Grant
+  localparam logic   [2:0] ahb_ml_fsm_error0_st          = 3'h4; // Pre-Error (wait for HREADY)
+  localparam logic   [2:0] ahb_ml_fsm_error1_st          = 3'h5; // 1st Error Cycle
+  localparam logic   [2:0] ahb_ml_fsm_error2_st          = 3'h6; // 2nd Error Cycle
+  localparam logic   [2:0] ahb_ml_fsm_default_p          = 3'h0; // AHB ML FSM Type
+  // ahb2apb_fsm
+  localparam integer       ahb2apb_fsm_width_p           = 2;    // Width in Bits
+  localparam logic   [1:0] ahb2apb_fsm_min_p             = 2'h0; // AHB to APB FSM Type
+  localparam logic   [1:0] ahb2apb_fsm_max_p             = 2'h3; // AHB to APB FSM Type
+  localparam logic   [1:0] ahb2apb_fsm_idle_st           = 2'h0; // No transfer
+  localparam logic   [1:0] ahb2apb_fsm_apb_ctrl_st       = 2'h1; // Control Phase
+  localparam logic   [1:0] ahb2apb_fsm_apb_data_st       = 2'h2; // Data Phase
+  localparam logic   [1:0] ahb2apb_fsm_ahb_err_st        = 2'h3; // Error Phase
+  localparam logic   [1:0] ahb2apb_fsm_default_p         = 2'h0; // AHB to APB FSM Type
+
+endpackage // ucdp_amba_pkg
+
+`default_nettype wire
+`end_keywords
+
+// =============================================================================
+//
+//   @generated @fully-generated
+//
+//   THIS FILE IS GENERATED!!! DO NOT EDIT MANUALLY. CHANGES ARE LOST.
+//
+// =============================================================================
@@ -0,0 +1,278 @@
+// =============================================================================
+//
+//   @generated @fully-generated
+//
+//   THIS FILE IS GENERATED!!! DO NOT EDIT MANUALLY. CHANGES ARE LOST.
+//
+// =============================================================================
+//
+//  MIT License
+//
+//  Copyright (c) 2024-2025 nbiotcloud
+//
+//  Permission is hereby granted, free of charge, to any person obtaining a copy
+//  of this software and associated documentation files (the "Software"), to deal
+//  in the Software without restriction, including without limitation the rights
+//  to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+//  copies of the Software, and to permit persons to whom the Software is
+//  furnished to do so, subject to the following conditions:
+//
+//  The above copyright notice and this permission notice shall be included in all
+//  copies or substantial portions of the Software.
+//
+//  THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+//  IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+//  FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+//  AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+//  LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+//  OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+//  SOFTWARE.
+//
+// =============================================================================
+//
+// Module:     ucdp_amba.ucdp_amba_pkg_example_ahb2apb
+// Data Model: ucdp_amba.ucdp_ahb2apb.UcdpAhb2apbMod
+//
+//
+// * Top:     `None`
+// * Defines: `None`
+// * Size:    `8 KB`
+//
+// | Addrspace | Type  | Base      | Size             | Infos | Attributes |
+// | --------- | ----- | --------- | ---------------- | ----- | ---------- |
+// | uart      | Slave | `+0x0`    | `1024x32 (4 KB)` | Sub   |            |
+// | spi       | Slave | `+0x1000` | `1024x32 (4 KB)` | Sub   |            |
+//
+// =============================================================================
+
+`begin_keywords "1800-2009"
+`default_nettype none  // implicit wires are forbidden
+
+module ucdp_amba_pkg_example_ahb2apb ( // ucdp_amba.ucdp_ahb2apb.UcdpAhb2apbMod
+  // main_i: Clock and Reset
+  input  wire         main_clk_i,             // Clock
+  input  wire         main_rst_an_i,          // Async Reset (Low-Active)
+  // ahb_slv_i: AHB Slave
+  input  wire         ahb_slv_hsel_i,         // AHB Slave Select
+  input  wire  [31:0] ahb_slv_haddr_i,        // AHB Bus Address
+  input  wire         ahb_slv_hwrite_i,       // AHB Write Enable
+  input  wire  [1:0]  ahb_slv_htrans_i,       // AHB Transfer Type
+  input  wire  [2:0]  ahb_slv_hsize_i,        // AHB Size
+  input  wire  [2:0]  ahb_slv_hburst_i,       // AHB Burst Type
+  input  wire  [3:0]  ahb_slv_hprot_i,        // AHB Transfer Protection
+  input  wire  [31:0] ahb_slv_hwdata_i,       // AHB Data
+  input  wire         ahb_slv_hready_i,       // AHB Transfer Done to Slave
+  output logic        ahb_slv_hreadyout_o,    // AHB Transfer Done from Slave
+  output logic        ahb_slv_hresp_o,        // AHB Response Error
+  output logic [31:0] ahb_slv_hrdata_o,       // AHB Data
+  // apb_slv_uart_o: APB Slave 'uart'
+  output logic [11:0] apb_slv_uart_paddr_o,   // APB Bus Address
+  output logic        apb_slv_uart_pwrite_o,  // APB Write Enable
+  output logic [31:0] apb_slv_uart_pwdata_o,  // APB Data
+  output logic        apb_slv_uart_penable_o, // APB Transfer Enable
+  output logic        apb_slv_uart_psel_o,    // APB Slave Select
+  input  wire  [31:0] apb_slv_uart_prdata_i,  // APB Data
+  input  wire         apb_slv_uart_pslverr_i, // APB Response Error
+  input  wire         apb_slv_uart_pready_i,  // APB Transfer Done
+  // apb_slv_spi_o: APB Slave 'spi'
+  output logic [11:0] apb_slv_spi_paddr_o,    // APB Bus Address
+  output logic        apb_slv_spi_pwrite_o,   // APB Write Enable
+  output logic [31:0] apb_slv_spi_pwdata_o,   // APB Data
+  output logic        apb_slv_spi_penable_o,  // APB Transfer Enable
+  output logic        apb_slv_spi_psel_o,     // APB Slave Select
+  input  wire  [31:0] apb_slv_spi_prdata_i,   // APB Data
+  input  wire         apb_slv_spi_pslverr_i,  // APB Response Error
+  input  wire         apb_slv_spi_pready_i    // APB Transfer Done
+);
+
+
+
+  import ucdp_amba_pkg::*;
+
+
+  // ------------------------------------------------------
+  //  Signals
+  // ------------------------------------------------------
+  logic        new_xfer_s;
+  logic        valid_addr_s;
+  logic        ahb_slv_sel_s;
+  logic [1:0]  fsm_r;          // AHB to APB FSM Type
+  logic        hready_r;       // AHB Transfer Done
+  logic        hresp_r;        // APB Response Error
+  logic [11:0] paddr_r;        // APB Bus Address
+  logic        pwrite_r;       // APB Write Enable
+  logic [31:0] pwdata_s;       // APB Data
+  logic [31:0] pwdata_r;       // APB Data
+  logic [31:0] prdata_s;       // APB Data
+  logic [31:0] prdata_r;       // APB Data
+  logic        penable_r;      // APB Transfer Enable
+  logic        pready_s;       // APB Transfer Done
+  logic        pslverr_s;      // APB Response Error
+  logic        apb_uart_sel_s; // APB Slave Select
+  logic        apb_uart_sel_r; // APB Slave Select
+  logic        apb_spi_sel_s;  // APB Slave Select
+  logic        apb_spi_sel_r;  // APB Slave Select
+
+  // ------------------------------------------------------
+  // transfer decoding
+  // ------------------------------------------------------
+  always_comb begin: proc_xfer_dec_proc
+    ahb_slv_sel_s = ahb_slv_hsel_i & ahb_slv_hready_i;
+    if ((ahb_slv_sel_s == 1'b1) &&
+        ((ahb_slv_htrans_i == ahb_trans_nonseq_e) || (ahb_slv_htrans_i == ahb_trans_seq_e))) begin
+      new_xfer_s = 1'b1;
+    end else begin
+      new_xfer_s = 1'b0;
+    end
+    valid_addr_s = 1'b0;
+    apb_uart_sel_s = 1'b0;
+    apb_spi_sel_s = 1'b0;
+
+    casez(ahb_slv_haddr_i[31:12])
+      20'b00000000000000000000: begin // uart
+        valid_addr_s = 1'b1;
+        apb_uart_sel_s = 1'b1;
+      end
+
+      20'b00000000000000000001: begin // spi
+        valid_addr_s = 1'b1;
+        apb_spi_sel_s = 1'b1;
+      end
+
+      default: begin
+        valid_addr_s = 1'b0;
+      end
+    endcase
+  end
+
+
+  // ------------------------------------------------------
+  // slave input multiplexing
+  // ------------------------------------------------------
+  always_comb begin: proc_slave_mux
+    pready_s = (apb_slv_uart_pready_i & apb_uart_sel_r) |
+               (apb_slv_spi_pready_i & apb_spi_sel_r);
+    pslverr_s = (apb_slv_uart_pslverr_i & apb_uart_sel_r) |
+                (apb_slv_spi_pslverr_i & apb_spi_sel_r);
+    prdata_s = (apb_slv_uart_prdata_i & {32{(~pwrite_r & penable_r & apb_uart_sel_r)}}) |
+               (apb_slv_spi_prdata_i & {32{(~pwrite_r & penable_r & apb_spi_sel_r)}});
+  end
+
+  // ------------------------------------------------------
+  // FSM
+  // ------------------------------------------------------
+  always_ff @ (posedge main_clk_i or negedge main_rst_an_i) begin: proc_fsm
+    if (main_rst_an_i == 1'b0) begin
+      fsm_r <= ahb2apb_fsm_idle_st;
+      hready_r <= 1'b1;
+      hresp_r <= apb_resp_okay_e;
+      paddr_r <= 12'h000;
+      pwrite_r <= 1'b0;
+      pwdata_r <= 32'h00000000;
+      prdata_r <= 32'h00000000;
+      penable_r <= 1'b0;
+      apb_uart_sel_r <= 1'b0;
+      apb_spi_sel_r <= 1'b0;
+    end else begin
+      case (fsm_r)
+        ahb2apb_fsm_idle_st: begin
+          if (new_xfer_s == 1'b1) begin
+            if (valid_addr_s == 1'b1) begin
+              hready_r <= 1'b0;
+              hresp_r <= apb_resp_okay_e;
+              paddr_r <= ahb_slv_haddr_i[11:0];
+              pwrite_r <= ahb_slv_hwrite_i;
+              apb_uart_sel_r <= apb_uart_sel_s;
+              apb_spi_sel_r <= apb_spi_sel_s;
+              fsm_r <= ahb2apb_fsm_apb_ctrl_st;
+            end else begin
+              hresp_r <= apb_resp_error_e;
+              fsm_r <= ahb2apb_fsm_ahb_err_st;
+            end
+          end else begin
+            hresp_r <= apb_resp_okay_e;
+          end
+        end
+
+        ahb2apb_fsm_apb_ctrl_st: begin
+          if (pwrite_r == 1'b1) begin
+            pwdata_r <= ahb_slv_hwdata_i;
+          end
+          penable_r <= 1'b1;
+          fsm_r <= ahb2apb_fsm_apb_data_st;
+        end
+
+        ahb2apb_fsm_apb_data_st: begin
+          if (pready_s == 1'b1) begin
+            penable_r <= 1'b0;
+            prdata_r <= prdata_s;
+            apb_uart_sel_r <= 1'b0;
+            apb_spi_sel_r <= 1'b0;
+            pwrite_r <= 1'b0;
+            if (pslverr_s == 1'b0) begin
+              hready_r <= 1'b1;
+              hresp_r <= apb_resp_okay_e;
+              fsm_r <= ahb2apb_fsm_idle_st;
+            end else begin
+              hresp_r <= apb_resp_error_e;
+              fsm_r <= ahb2apb_fsm_ahb_err_st;
+            end
+          end
+        end
+
+        ahb2apb_fsm_ahb_err_st: begin
+          hready_r <= 1'b1;
+          fsm_r <= ahb2apb_fsm_idle_st;
+        end
+
+        default: begin
+          hready_r <= 1'b1;
+          hresp_r <= apb_resp_okay_e;
+          pwrite_r <= 1'b0;
+          pwdata_r <= 32'h00000000;
+          penable_r <= 1'b0;
+          paddr_r <= 12'h000;
+          apb_uart_sel_r <= 1'b0;
+          apb_spi_sel_r <= 1'b0;
+          fsm_r <= ahb2apb_fsm_idle_st;
+        end
+      endcase
+    end
+  end
+
+
+  // ------------------------------------------------------
+  // output Assignments
+  // ------------------------------------------------------
+  assign ahb_slv_hreadyout_o = hready_r;
+  assign ahb_slv_hrdata_o = prdata_r;
+  assign ahb_slv_hresp_o = hresp_r;
+
+  assign pwdata_s = (penable_r == 1'b1) ? pwdata_r : ahb_slv_hwdata_i;
+
+  // Slave 'uart':
+  assign apb_slv_uart_paddr_o   = (apb_uart_sel_r  == 1'b1) ? paddr_r[11:0] : 12'h000;
+  assign apb_slv_uart_pwrite_o  = pwrite_r & apb_uart_sel_r;
+  assign apb_slv_uart_pwdata_o  = ((pwrite_r & apb_uart_sel_r)  == 1'b1) ? pwdata_s : 32'h00000000;
+  assign apb_slv_uart_penable_o = penable_r & apb_uart_sel_r;
+  assign apb_slv_uart_psel_o    = apb_uart_sel_r;
+  // Slave 'spi':
+  assign apb_slv_spi_paddr_o    = (apb_spi_sel_r  == 1'b1) ? paddr_r[11:0] : 12'h000;
+  assign apb_slv_spi_pwrite_o   = pwrite_r & apb_spi_sel_r;
+  assign apb_slv_spi_pwdata_o   = ((pwrite_r & apb_spi_sel_r)  == 1'b1) ? pwdata_s : 32'h00000000;
+  assign apb_slv_spi_penable_o  = penable_r & apb_spi_sel_r;
+  assign apb_slv_spi_psel_o     = apb_spi_sel_r;
+
+
+endmodule // ucdp_amba_pkg_example_ahb2apb
+
+`default_nettype wire
+`end_keywords
+
+// =============================================================================
+//
+//   @generated @fully-generated
+//
+//   THIS FILE IS GENERATED!!! DO NOT EDIT MANUALLY. CHANGES ARE LOST.
+//
+// =============================================================================
@@ -0,0 +1,842 @@
+// =============================================================================
+//
+//   @generated @fully-generated
+//
+//   THIS FILE IS GENERATED!!! DO NOT EDIT MANUALLY. CHANGES ARE LOST.
+//
+// =============================================================================
+//
+//  MIT License
+//
+//  Copyright (c) 2024-2025 nbiotcloud
+//
+//  Permission is hereby granted, free of charge, to any person obtaining a copy
+//  of this software and associated documentation files (the "Software"), to deal
+//  in the Software without restriction, including without limitation the rights
+//  to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+//  copies of the Software, and to permit persons to whom the Software is
+//  furnished to do so, subject to the following conditions:
+//
+//  The above copyright notice and this permission notice shall be included in all
+//  copies or substantial portions of the Software.
+//
+//  THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+//  IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+//  FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+//  AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+//  LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+//  OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+//  SOFTWARE.
+//
+// =============================================================================
+//
+// Module:     ucdp_amba.ucdp_amba_pkg_example_ml
+// Data Model: ucdp_amba.ucdp_ahb_ml.UcdpAhbMlMod
+//
+//
+// | Master > Slave | ram | periph |
+// | -------------- | --- | ------ |
+// | cpu            | X   | X      |
+// | dma            | X   |        |
+//
+//
+//
+// * Top:     `None`
+// * Defines: `None`
+// * Size:    `3932288 KB`
+//
+// | Addrspace | Type     | Base         | Size                      | Infos | Attributes |
+// | --------- | -------- | ------------ | ------------------------- | ----- | ---------- |
+// | reserved0 | Reserved | `0x0`        | `1006632960x32 (3.75 GB)` |       |            |
+// | ram       | Slave    | `0xF0000000` | `16384x32 (64 KB)`        |       |            |
+// | periph    | Slave    | `0xF0010000` | `16384x32 (64 KB)`        |       |            |
+// | reserved1 | Reserved | `0xF0020000` | `67076096x32 (262016 KB)` |       |            |
+//
+// =============================================================================
+
+`begin_keywords "1800-2009"
+`default_nettype none  // implicit wires are forbidden
+
+module ucdp_amba_pkg_example_ml ( // ucdp_amba.ucdp_ahb_ml.UcdpAhbMlMod
+  // main_i: Clock and Reset
+  input  wire         main_clk_i,                 // Clock
+  input  wire         main_rst_an_i,              // Async Reset (Low-Active)
+  // ahb_mst_cpu_i: AHB Input 'cpu'
+  input  wire  [1:0]  ahb_mst_cpu_htrans_i,       // AHB Transfer Type
+  input  wire  [31:0] ahb_mst_cpu_haddr_i,        // AHB Bus Address
+  input  wire         ahb_mst_cpu_hwrite_i,       // AHB Write Enable
+  input  wire  [2:0]  ahb_mst_cpu_hsize_i,        // AHB Size
+  input  wire  [2:0]  ahb_mst_cpu_hburst_i,       // AHB Burst Type
+  input  wire  [3:0]  ahb_mst_cpu_hprot_i,        // AHB Transfer Protection
+  input  wire  [31:0] ahb_mst_cpu_hwdata_i,       // AHB Data
+  output logic        ahb_mst_cpu_hready_o,       // AHB Transfer Done
+  output logic        ahb_mst_cpu_hresp_o,        // AHB Response Error
+  output logic [31:0] ahb_mst_cpu_hrdata_o,       // AHB Data
+  // ahb_mst_dma_i: AHB Input 'dma'
+  input  wire  [1:0]  ahb_mst_dma_htrans_i,       // AHB Transfer Type
+  input  wire  [31:0] ahb_mst_dma_haddr_i,        // AHB Bus Address
+  input  wire         ahb_mst_dma_hwrite_i,       // AHB Write Enable
+  input  wire  [2:0]  ahb_mst_dma_hsize_i,        // AHB Size
+  input  wire  [2:0]  ahb_mst_dma_hburst_i,       // AHB Burst Type
+  input  wire  [3:0]  ahb_mst_dma_hprot_i,        // AHB Transfer Protection
+  input  wire  [31:0] ahb_mst_dma_hwdata_i,       // AHB Data
+  output logic        ahb_mst_dma_hready_o,       // AHB Transfer Done
+  output logic        ahb_mst_dma_hresp_o,        // AHB Response Error
+  output logic [31:0] ahb_mst_dma_hrdata_o,       // AHB Data
+  // ahb_slv_ram_o: AHB Output 'ram'
+  output logic        ahb_slv_ram_hsel_o,         // AHB Slave Select
+  output logic [31:0] ahb_slv_ram_haddr_o,        // AHB Bus Address
+  output logic        ahb_slv_ram_hwrite_o,       // AHB Write Enable
+  output logic [1:0]  ahb_slv_ram_htrans_o,       // AHB Transfer Type
+  output logic [2:0]  ahb_slv_ram_hsize_o,        // AHB Size
+  output logic [2:0]  ahb_slv_ram_hburst_o,       // AHB Burst Type
+  output logic [3:0]  ahb_slv_ram_hprot_o,        // AHB Transfer Protection
+  output logic [31:0] ahb_slv_ram_hwdata_o,       // AHB Data
+  output logic        ahb_slv_ram_hready_o,       // AHB Transfer Done to Slave
+  input  wire         ahb_slv_ram_hreadyout_i,    // AHB Transfer Done from Slave
+  input  wire         ahb_slv_ram_hresp_i,        // AHB Response Error
+  input  wire  [31:0] ahb_slv_ram_hrdata_i,       // AHB Data
+  // ahb_slv_periph_o: AHB Output 'periph'
+  output logic        ahb_slv_periph_hsel_o,      // AHB Slave Select
+  output logic [31:0] ahb_slv_periph_haddr_o,     // AHB Bus Address
+  output logic        ahb_slv_periph_hwrite_o,    // AHB Write Enable
+  output logic [1:0]  ahb_slv_periph_htrans_o,    // AHB Transfer Type
+  output logic [2:0]  ahb_slv_periph_hsize_o,     // AHB Size
+  output logic [2:0]  ahb_slv_periph_hburst_o,    // AHB Burst Type
+  output logic [3:0]  ahb_slv_periph_hprot_o,     // AHB Transfer Protection
+  output logic [31:0] ahb_slv_periph_hwdata_o,    // AHB Data
+  output logic        ahb_slv_periph_hready_o,    // AHB Transfer Done to Slave
+  input  wire         ahb_slv_periph_hreadyout_i, // AHB Transfer Done from Slave
+  input  wire         ahb_slv_periph_hresp_i,     // AHB Response Error
+  input  wire  [31:0] ahb_slv_periph_hrdata_i     // AHB Data
+);
+
+
+  import ucdp_amba_pkg::*;
+
+
+
+  // ------------------------------------------------------
+  //  Signals
+  // ------------------------------------------------------
+  logic [2:0]  fsm_cpu_r;            // Master 'cpu' FSM
+  logic        mst_cpu_new_xfer_s;
+  logic        mst_cpu_cont_xfer_s;
+  logic        mst_cpu_hready_s;
+  logic        mst_cpu_rqstate_s;
+  logic        mst_cpu_addr_err_s;
+  logic        mst_cpu_ram_sel_s;
+  logic        mst_cpu_ram_req_r;
+  logic        mst_cpu_ram_gnt_r;    // data phase, switches with HREADY only
+  logic        mst_cpu_periph_sel_s;
+  logic        mst_cpu_periph_req_r;
+  logic        mst_cpu_periph_gnt_r; // data phase, switches with HREADY only
+  logic        mst_cpu_gnt_s;
+  logic [1:0]  mst_cpu_htrans_s;     // AHB Transfer Type
+  logic [1:0]  mst_cpu_htrans_r;     // AHB Transfer Type
+  logic [31:0] mst_cpu_haddr_s;      // AHB Bus Address
+  logic [31:0] mst_cpu_haddr_r;      // AHB Bus Address
+  logic        mst_cpu_hwrite_s;     // AHB Write Enable
+  logic        mst_cpu_hwrite_r;     // AHB Write Enable
+  logic [2:0]  mst_cpu_hsize_s;      // AHB Size
+  logic [2:0]  mst_cpu_hsize_r;      // AHB Size
+  logic [2:0]  mst_cpu_hburst_s;     // AHB Burst Type
+  logic [2:0]  mst_cpu_hburst_r;     // AHB Burst Type
+  logic [3:0]  mst_cpu_hprot_s;      // AHB Transfer Protection
+  logic [3:0]  mst_cpu_hprot_r;      // AHB Transfer Protection
+  logic        mst_cpu_hwrite_dph_r; // data-phase write indicator
+  logic [2:0]  fsm_dma_r;            // Master 'dma' FSM
+  logic        mst_dma_new_xfer_s;
+  logic        mst_dma_cont_xfer_s;
+  logic        mst_dma_hready_s;
+  logic        mst_dma_rqstate_s;
+  logic        mst_dma_addr_err_s;
+  logic        mst_dma_ram_sel_s;
+  logic        mst_dma_ram_req_r;
+  logic        mst_dma_ram_gnt_r;    // data phase, switches with HREADY only
+  logic        mst_dma_gnt_s;
+  logic [1:0]  mst_dma_htrans_s;     // AHB Transfer Type
+  logic [1:0]  mst_dma_htrans_r;     // AHB Transfer Type
+  logic [31:0] mst_dma_haddr_s;      // AHB Bus Address
+  logic [31:0] mst_dma_haddr_r;      // AHB Bus Address
+  logic        mst_dma_hwrite_s;     // AHB Write Enable
+  logic        mst_dma_hwrite_r;     // AHB Write Enable
+  logic [2:0]  mst_dma_hsize_s;      // AHB Size
+  logic [2:0]  mst_dma_hsize_r;      // AHB Size
+  logic [2:0]  mst_dma_hburst_s;     // AHB Burst Type
+  logic [2:0]  mst_dma_hburst_r;     // AHB Burst Type
+  logic [3:0]  mst_dma_hprot_s;      // AHB Transfer Protection
+  logic [3:0]  mst_dma_hprot_r;      // AHB Transfer Protection
+  logic        mst_dma_hwrite_dph_r; // data-phase write indicator
+  logic        mst_cpu_ram_req_s;
+  logic        mst_cpu_ram_keep_s;
+  logic        slv_ram_cpu_gnt_r;
+  logic        slv_ram_cpu_sel_s;
+  logic        slv_ram_cpu_gnt_s;
+  logic        mst_dma_ram_req_s;
+  logic        mst_dma_ram_keep_s;
+  logic        slv_ram_dma_gnt_r;
+  logic        slv_ram_dma_sel_s;
+  logic        slv_ram_dma_gnt_s;
+  logic        mst_cpu_periph_req_s;
+  logic        slv_periph_cpu_gnt_s;
+
+
+  // ------------------------------------------------------
+  // The Masters:
+  // ------------------------------------------------------
+  // Master 'cpu' Logic
+  always_comb begin: proc_cpu_logic
+    mst_cpu_new_xfer_s  = (ahb_mst_cpu_htrans_i == ahb_trans_nonseq_e) ? 1'b1 : 1'b0;
+    mst_cpu_cont_xfer_s = ((ahb_mst_cpu_htrans_i == ahb_trans_busy_e) ||
+                           (ahb_mst_cpu_htrans_i == ahb_trans_seq_e)) ? 1'b1 : 1'b0;
+    mst_cpu_rqstate_s   = ((fsm_cpu_r == ahb_ml_fsm_idle_st) ||
+                           (fsm_cpu_r == ahb_ml_fsm_transfer_st) ||
+                           (fsm_cpu_r == ahb_ml_fsm_transfer_finish_st) ||
+                           (fsm_cpu_r == ahb_ml_fsm_error2_st)) ? 1'b1 : 1'b0;
+
+    // Address Decoding
+    mst_cpu_addr_err_s = 1'b0;
+    mst_cpu_ram_sel_s = 1'b0;
+    mst_cpu_periph_sel_s = 1'b0;
+
+    casez (ahb_mst_cpu_haddr_i[31:16])
+      16'b1111000000000000: begin // ram
+        mst_cpu_ram_sel_s = 1'b1;
+      end
+
+      16'b1111000000000001: begin // periph
+        mst_cpu_periph_sel_s = 1'b1;
+      end
+
+      default: begin
+        mst_cpu_addr_err_s = mst_cpu_new_xfer_s;
+      end
+    endcase
+
+    mst_cpu_ram_req_s    = (mst_cpu_ram_sel_s & mst_cpu_new_xfer_s & mst_cpu_rqstate_s &
+                            (mst_cpu_hready_s | mst_cpu_ram_gnt_r)) | mst_cpu_ram_req_r;
+    mst_cpu_ram_keep_s   = mst_cpu_ram_gnt_r & mst_cpu_cont_xfer_s;
+    mst_cpu_periph_req_s = (mst_cpu_periph_sel_s & mst_cpu_new_xfer_s & mst_cpu_rqstate_s &
+                            (mst_cpu_hready_s | mst_cpu_periph_gnt_r)) | mst_cpu_periph_req_r;
+
+    // Grant Combination
+    mst_cpu_gnt_s = slv_ram_cpu_gnt_s |
+                    slv_periph_cpu_gnt_s;
+  end
+
+  // FSM for Master 'cpu'
+  always_ff @(posedge main_clk_i or negedge main_rst_an_i) begin: proc_cpu_fsm
+    if (main_rst_an_i == 1'b0) begin
+      fsm_cpu_r <= ahb_ml_fsm_idle_st;
+      mst_cpu_ram_gnt_r <= 1'b0;
+      mst_cpu_periph_gnt_r <= 1'b0;
+    end else begin
+      case (fsm_cpu_r)
+        ahb_ml_fsm_idle_st: begin
+          if (mst_cpu_new_xfer_s == 1'b1) begin
+            if (mst_cpu_addr_err_s == 1'b1) begin
+              fsm_cpu_r <= ahb_ml_fsm_error1_st;
+            end else if (mst_cpu_gnt_s == 1'b1) begin
+              mst_cpu_ram_req_r <= 1'b0;
+              mst_cpu_periph_req_r <= 1'b0;
+              fsm_cpu_r <= ahb_ml_fsm_transfer_st;
+            end else begin
+              mst_cpu_ram_req_r <= mst_cpu_ram_sel_s;
+              mst_cpu_periph_req_r <= mst_cpu_periph_sel_s;
+              fsm_cpu_r <= ahb_ml_fsm_transfer_wait_st;
+            end
+            mst_cpu_ram_gnt_r <= slv_ram_cpu_gnt_s;
+            mst_cpu_periph_gnt_r <= slv_periph_cpu_gnt_s;
+          end
+        end
+
+        ahb_ml_fsm_error0_st: begin
+          if (mst_cpu_hready_s == 1'b1) begin
+            mst_cpu_ram_gnt_r <= 1'b0;
+            mst_cpu_periph_gnt_r <= 1'b0;
+            fsm_cpu_r <= ahb_ml_fsm_error1_st;
+          end
+        end
+
+        ahb_ml_fsm_error1_st: begin
+          fsm_cpu_r <= ahb_ml_fsm_error2_st;
+        end
+
+        ahb_ml_fsm_error2_st: begin
+          if (mst_cpu_new_xfer_s == 1'b1) begin
+            if (mst_cpu_addr_err_s == 1'b1) begin
+              fsm_cpu_r <= ahb_ml_fsm_error1_st;
+            end else if (mst_cpu_gnt_s == 1'b1) begin
+              mst_cpu_ram_req_r <= 1'b0;
+              mst_cpu_periph_req_r <= 1'b0;
+              fsm_cpu_r <= ahb_ml_fsm_transfer_st;
+            end else begin
+              mst_cpu_ram_req_r <= mst_cpu_ram_sel_s;
+              mst_cpu_periph_req_r <= mst_cpu_periph_sel_s;
+              fsm_cpu_r <= ahb_ml_fsm_transfer_wait_st;
+            end
+            mst_cpu_ram_gnt_r <= slv_ram_cpu_gnt_s;
+            mst_cpu_periph_gnt_r <= slv_periph_cpu_gnt_s;
+          end else begin
+            fsm_cpu_r <= ahb_ml_fsm_idle_st;
+          end
+        end
+
+        ahb_ml_fsm_transfer_st: begin
+          if ((ahb_mst_cpu_htrans_i == ahb_trans_seq_e) ||
+              (ahb_mst_cpu_htrans_i == ahb_trans_busy_e)) begin
+            fsm_cpu_r <= ahb_ml_fsm_transfer_st;
+          end else begin
+            if (ahb_mst_cpu_htrans_i == ahb_trans_idle_e) begin
+              if (mst_cpu_hready_s == 1'b0) begin
+                fsm_cpu_r <= ahb_ml_fsm_transfer_finish_st;
+              end else begin
+                mst_cpu_ram_gnt_r <= 1'b0;
+                mst_cpu_periph_gnt_r <= 1'b0;
+                fsm_cpu_r <= ahb_ml_fsm_idle_st;
+              end
+            end else begin // ((ahb_mst_cpu_htrans_i == ahb_trans_nonseq_e)
+              if (mst_cpu_hready_s == 1'b1) begin // address phase ends with the current data phase
+                if (mst_cpu_addr_err_s == 1'b1) begin
+                  fsm_cpu_r <= ahb_ml_fsm_error1_st;
+                end else if (mst_cpu_gnt_s == 1'b1) begin
+                  mst_cpu_ram_req_r <= 1'b0;
+                  mst_cpu_periph_req_r <= 1'b0;
+                  fsm_cpu_r <= ahb_ml_fsm_transfer_st;
+                end else begin
+                  mst_cpu_ram_req_r <= mst_cpu_ram_sel_s;
+                  mst_cpu_periph_req_r <= mst_cpu_periph_sel_s;
+                  fsm_cpu_r <= ahb_ml_fsm_transfer_wait_st;
+                end
+                mst_cpu_ram_gnt_r <= slv_ram_cpu_gnt_s;
+                mst_cpu_periph_gnt_r <= slv_periph_cpu_gnt_s;
+              end else if (mst_cpu_addr_err_s == 1'b1) begin // the data phase continues
+                fsm_cpu_r <= ahb_ml_fsm_error0_st;
+              end
+            end
+          end
+        end
+
+        ahb_ml_fsm_transfer_wait_st: begin
+          if (mst_cpu_gnt_s == 1'b1) begin
+            mst_cpu_ram_req_r <= 1'b0;
+            mst_cpu_periph_req_r <= 1'b0;
+            mst_cpu_ram_gnt_r <= slv_ram_cpu_gnt_s;
+            mst_cpu_periph_gnt_r <= slv_periph_cpu_gnt_s;
+            fsm_cpu_r <= ahb_ml_fsm_transfer_st;
+          end
+        end
+
+        ahb_ml_fsm_transfer_finish_st: begin
+          if (mst_cpu_hready_s == 1'b1) begin
+            if (mst_cpu_new_xfer_s == 1'b1) begin
+              if (mst_cpu_addr_err_s == 1'b1) begin
+                fsm_cpu_r <= ahb_ml_fsm_error1_st;
+              end else if (mst_cpu_gnt_s == 1'b1) begin
+                mst_cpu_ram_req_r <= 1'b0;
+                mst_cpu_periph_req_r <= 1'b0;
+                fsm_cpu_r <= ahb_ml_fsm_transfer_st;
+              end else begin
+                mst_cpu_ram_req_r <= mst_cpu_ram_sel_s;
+                mst_cpu_periph_req_r <= mst_cpu_periph_sel_s;
+                fsm_cpu_r <= ahb_ml_fsm_transfer_wait_st;
+              end
+              mst_cpu_ram_gnt_r <= slv_ram_cpu_gnt_s;
+              mst_cpu_periph_gnt_r <= slv_periph_cpu_gnt_s;
+            end else begin
+              mst_cpu_ram_gnt_r <= 1'b0;
+              mst_cpu_periph_gnt_r <= 1'b0;
+              fsm_cpu_r <= ahb_ml_fsm_idle_st;
+            end
+          end
+        end
+
+        default: begin
+          mst_cpu_ram_gnt_r <= 1'b0;
+          mst_cpu_ram_req_r <= 1'b0;
+          mst_cpu_periph_gnt_r <= 1'b0;
+          mst_cpu_periph_req_r <= 1'b0;
+          fsm_cpu_r <= ahb_ml_fsm_idle_st;
+        end
+      endcase
+    end
+
+    if ((mst_cpu_new_xfer_s == 1'b1) && (mst_cpu_gnt_s == 1'b0) && (mst_cpu_rqstate_s == 1'b1)) begin
+      mst_cpu_haddr_r  <= ahb_mst_cpu_haddr_i;
+      mst_cpu_htrans_r <= ahb_mst_cpu_htrans_i;
+      mst_cpu_hburst_r <= ahb_mst_cpu_hburst_i;
+      mst_cpu_hsize_r  <= ahb_mst_cpu_hsize_i;
+      mst_cpu_hwrite_r <= ahb_mst_cpu_hwrite_i;
+      mst_cpu_hprot_r  <= ahb_mst_cpu_hprot_i;
+    end
+
+    if (mst_cpu_hready_s == 1'b1) begin  // the address phase ends with the current data phase
+      mst_cpu_hwrite_dph_r <= mst_cpu_hwrite_s;
+    end
+  end
+
+  // Master 'cpu' Mux
+  always_comb begin: proc_cpu_mux
+    if (fsm_cpu_r == ahb_ml_fsm_transfer_wait_st) begin
+      mst_cpu_haddr_s  = mst_cpu_haddr_r;
+      mst_cpu_hwrite_s = mst_cpu_hwrite_r;
+      mst_cpu_hburst_s = mst_cpu_hburst_r;
+      mst_cpu_hsize_s  = mst_cpu_hsize_r;
+      mst_cpu_htrans_s = mst_cpu_htrans_r;
+      mst_cpu_hprot_s  = mst_cpu_hprot_r;
+    end else begin
+      mst_cpu_haddr_s  = ahb_mst_cpu_haddr_i;
+      mst_cpu_hwrite_s = ahb_mst_cpu_hwrite_i;
+      mst_cpu_hburst_s = ahb_mst_cpu_hburst_i;
+      mst_cpu_hsize_s  = ahb_mst_cpu_hsize_i;
+      mst_cpu_htrans_s = ahb_mst_cpu_htrans_i;
+      mst_cpu_hprot_s  = ahb_mst_cpu_hprot_i;
+    end
+
+    mst_cpu_hready_s = (ahb_slv_ram_hreadyout_i & mst_cpu_ram_gnt_r) |
+                       (ahb_slv_periph_hreadyout_i & mst_cpu_periph_gnt_r) |
+                       ~(|{mst_cpu_ram_gnt_r, mst_cpu_periph_gnt_r});
+
+    case (fsm_cpu_r)
+      ahb_ml_fsm_transfer_wait_st: begin
+        ahb_mst_cpu_hrdata_o = 32'h00000000;
+        ahb_mst_cpu_hready_o = 1'b0;
+        ahb_mst_cpu_hresp_o  = ahb_resp_okay_e;
+      end
+
+      ahb_ml_fsm_error1_st: begin
+        ahb_mst_cpu_hrdata_o = 32'h00000000;
+        ahb_mst_cpu_hready_o = 1'b0;
+        ahb_mst_cpu_hresp_o  = ahb_resp_error_e;
+      end
+
+      ahb_ml_fsm_error2_st: begin
+        ahb_mst_cpu_hrdata_o = 32'h00000000;
+        ahb_mst_cpu_hready_o = 1'b1;
+        ahb_mst_cpu_hresp_o  = ahb_resp_error_e;
+      end
+
+      ahb_ml_fsm_error0_st, ahb_ml_fsm_transfer_st: begin
+        case ({mst_cpu_ram_gnt_r, mst_cpu_periph_gnt_r})
+          2'b01: begin
+            ahb_mst_cpu_hrdata_o = (mst_cpu_hwrite_dph_r == 1'b0) ? ahb_slv_periph_hrdata_i : 32'h00000000;
+            ahb_mst_cpu_hready_o = ahb_slv_periph_hreadyout_i;
+            ahb_mst_cpu_hresp_o = ahb_slv_periph_hresp_i;
+          end
+
+          2'b10: begin
+            ahb_mst_cpu_hrdata_o = (mst_cpu_hwrite_dph_r == 1'b0) ? ahb_slv_ram_hrdata_i : 32'h00000000;
+            ahb_mst_cpu_hready_o = ahb_slv_ram_hreadyout_i;
+            ahb_mst_cpu_hresp_o = ahb_slv_ram_hresp_i;
+          end
+
+          default: begin
+            ahb_mst_cpu_hrdata_o = 32'h00000000;
+            ahb_mst_cpu_hready_o = 1'b1;
+            ahb_mst_cpu_hresp_o  = ahb_resp_okay_e;
+          end
+        endcase
+      end
+
+      ahb_ml_fsm_transfer_finish_st: begin
+        case ({mst_cpu_ram_gnt_r, mst_cpu_periph_gnt_r})
+          2'b01: begin
+            ahb_mst_cpu_hrdata_o = ahb_slv_periph_hrdata_i;
+            ahb_mst_cpu_hready_o = ahb_slv_periph_hreadyout_i;
+            ahb_mst_cpu_hresp_o = ahb_slv_periph_hresp_i;
+          end
+
+          2'b10: begin
+            ahb_mst_cpu_hrdata_o = ahb_slv_ram_hrdata_i;
+            ahb_mst_cpu_hready_o = ahb_slv_ram_hreadyout_i;
+            ahb_mst_cpu_hresp_o = ahb_slv_ram_hresp_i;
+          end
+
+          default: begin
+            ahb_mst_cpu_hrdata_o = 32'h00000000;
+            ahb_mst_cpu_hready_o = 1'b1;
+            ahb_mst_cpu_hresp_o  = ahb_resp_okay_e;
+          end
+        endcase
+      end
+
+      default: begin
+        ahb_mst_cpu_hrdata_o = 32'h00000000;
+        ahb_mst_cpu_hready_o = 1'b1;
+        ahb_mst_cpu_hresp_o  = ahb_resp_okay_e;
+      end
+    endcase
+  end
+
+  // Master 'dma' Logic
+  always_comb begin: proc_dma_logic
+    mst_dma_new_xfer_s  = (ahb_mst_dma_htrans_i == ahb_trans_nonseq_e) ? 1'b1 : 1'b0;
+    mst_dma_cont_xfer_s = ((ahb_mst_dma_htrans_i == ahb_trans_busy_e) ||
+                           (ahb_mst_dma_htrans_i == ahb_trans_seq_e)) ? 1'b1 : 1'b0;
+    mst_dma_rqstate_s   = ((fsm_dma_r == ahb_ml_fsm_idle_st) ||
+                           (fsm_dma_r == ahb_ml_fsm_transfer_st) ||
+                           (fsm_dma_r == ahb_ml_fsm_transfer_finish_st) ||
+                           (fsm_dma_r == ahb_ml_fsm_error2_st)) ? 1'b1 : 1'b0;
+
+    // Address Decoding
+    mst_dma_addr_err_s = 1'b0;
+    mst_dma_ram_sel_s = 1'b0;
+
+    casez (ahb_mst_dma_haddr_i[31:16])
+      16'b1111000000000000: begin // ram
+        mst_dma_ram_sel_s = 1'b1;
+      end
+
+      default: begin
+        mst_dma_addr_err_s = mst_dma_new_xfer_s;
+      end
+    endcase
+
+    mst_dma_ram_req_s  = (mst_dma_ram_sel_s & mst_dma_new_xfer_s & mst_dma_rqstate_s &
+                          (mst_dma_hready_s | mst_dma_ram_gnt_r)) | mst_dma_ram_req_r;
+    mst_dma_ram_keep_s = mst_dma_ram_gnt_r & mst_dma_cont_xfer_s;
+
+    // Grant Combination
+    mst_dma_gnt_s = slv_ram_dma_gnt_s;
+  end
+
+  // FSM for Master 'dma'
+  always_ff @(posedge main_clk_i or negedge main_rst_an_i) begin: proc_dma_fsm
+    if (main_rst_an_i == 1'b0) begin
+      fsm_dma_r <= ahb_ml_fsm_idle_st;
+      mst_dma_ram_gnt_r <= 1'b0;
+    end else begin
+      case (fsm_dma_r)
+        ahb_ml_fsm_idle_st: begin
+          if (mst_dma_new_xfer_s == 1'b1) begin
+            if (mst_dma_addr_err_s == 1'b1) begin
+              fsm_dma_r <= ahb_ml_fsm_error1_st;
+            end else if (mst_dma_gnt_s == 1'b1) begin
+              mst_dma_ram_req_r <= 1'b0;
+              fsm_dma_r <= ahb_ml_fsm_transfer_st;
+            end else begin
+              mst_dma_ram_req_r <= mst_dma_ram_sel_s;
+              fsm_dma_r <= ahb_ml_fsm_transfer_wait_st;
+            end
+            mst_dma_ram_gnt_r <= slv_ram_dma_gnt_s;
+          end
+        end
+
+        ahb_ml_fsm_error0_st: begin
+          if (mst_dma_hready_s == 1'b1) begin
+            mst_dma_ram_gnt_r <= 1'b0;
+            fsm_dma_r <= ahb_ml_fsm_error1_st;
+          end
+        end
+
+        ahb_ml_fsm_error1_st: begin
+          fsm_dma_r <= ahb_ml_fsm_error2_st;
+        end
+
+        ahb_ml_fsm_error2_st: begin
+          if (mst_dma_new_xfer_s == 1'b1) begin
+            if (mst_dma_addr_err_s == 1'b1) begin
+              fsm_dma_r <= ahb_ml_fsm_error1_st;
+            end else if (mst_dma_gnt_s == 1'b1) begin
+              mst_dma_ram_req_r <= 1'b0;
+              fsm_dma_r <= ahb_ml_fsm_transfer_st;
+            end else begin
+              mst_dma_ram_req_r <= mst_dma_ram_sel_s;
+              fsm_dma_r <= ahb_ml_fsm_transfer_wait_st;
+            end
+            mst_dma_ram_gnt_r <= slv_ram_dma_gnt_s;
+          end else begin
+            fsm_dma_r <= ahb_ml_fsm_idle_st;
+          end
+        end
+
+        ahb_ml_fsm_transfer_st: begin
+          if ((ahb_mst_dma_htrans_i == ahb_trans_seq_e) ||
+              (ahb_mst_dma_htrans_i == ahb_trans_busy_e)) begin
+            fsm_dma_r <= ahb_ml_fsm_transfer_st;
+          end else begin
+            if (ahb_mst_dma_htrans_i == ahb_trans_idle_e) begin
+              if (mst_dma_hready_s == 1'b0) begin
+                fsm_dma_r <= ahb_ml_fsm_transfer_finish_st;
+              end else begin
+                mst_dma_ram_gnt_r <= 1'b0;
+                fsm_dma_r <= ahb_ml_fsm_idle_st;
+              end
+            end else begin // ((ahb_mst_dma_htrans_i == ahb_trans_nonseq_e)
+              if (mst_dma_hready_s == 1'b1) begin // address phase ends with the current data phase
+                if (mst_dma_addr_err_s == 1'b1) begin
+                  fsm_dma_r <= ahb_ml_fsm_error1_st;
+                end else if (mst_dma_gnt_s == 1'b1) begin
+                  mst_dma_ram_req_r <= 1'b0;
+                  fsm_dma_r <= ahb_ml_fsm_transfer_st;
+                end else begin
+                  mst_dma_ram_req_r <= mst_dma_ram_sel_s;
+                  fsm_dma_r <= ahb_ml_fsm_transfer_wait_st;
+                end
+                mst_dma_ram_gnt_r <= slv_ram_dma_gnt_s;
+              end else if (mst_dma_addr_err_s == 1'b1) begin // the data phase continues
+                fsm_dma_r <= ahb_ml_fsm_error0_st;
+              end
+            end
+          end
+        end
+
+        ahb_ml_fsm_transfer_wait_st: begin
+          if (mst_dma_gnt_s == 1'b1) begin
+            mst_dma_ram_req_r <= 1'b0;
+            mst_dma_ram_gnt_r <= slv_ram_dma_gnt_s;
+            fsm_dma_r <= ahb_ml_fsm_transfer_st;
+          end
+        end
+
+        ahb_ml_fsm_transfer_finish_st: begin
+          if (mst_dma_hready_s == 1'b1) begin
+            if (mst_dma_new_xfer_s == 1'b1) begin
+              if (mst_dma_addr_err_s == 1'b1) begin
+                fsm_dma_r <= ahb_ml_fsm_error1_st;
+              end else if (mst_dma_gnt_s == 1'b1) begin
+                mst_dma_ram_req_r <= 1'b0;
+                fsm_dma_r <= ahb_ml_fsm_transfer_st;
+              end else begin
+                mst_dma_ram_req_r <= mst_dma_ram_sel_s;
+                fsm_dma_r <= ahb_ml_fsm_transfer_wait_st;
+              end
+              mst_dma_ram_gnt_r <= slv_ram_dma_gnt_s;
+            end else begin
+              mst_dma_ram_gnt_r <= 1'b0;
+              fsm_dma_r <= ahb_ml_fsm_idle_st;
+            end
+          end
+        end
+
+        default: begin
+          mst_dma_ram_gnt_r <= 1'b0;
+          mst_dma_ram_req_r <= 1'b0;
+          fsm_dma_r <= ahb_ml_fsm_idle_st;
+        end
+      endcase
+    end
+
+    if ((mst_dma_new_xfer_s == 1'b1) && (mst_dma_gnt_s == 1'b0) && (mst_dma_rqstate_s == 1'b1)) begin
+      mst_dma_haddr_r  <= ahb_mst_dma_haddr_i;
+      mst_dma_htrans_r <= ahb_mst_dma_htrans_i;
+      mst_dma_hburst_r <= ahb_mst_dma_hburst_i;
+      mst_dma_hsize_r  <= ahb_mst_dma_hsize_i;
+      mst_dma_hwrite_r <= ahb_mst_dma_hwrite_i;
+      mst_dma_hprot_r  <= ahb_mst_dma_hprot_i;
+    end
+
+    if (mst_dma_hready_s == 1'b1) begin  // the address phase ends with the current data phase
+      mst_dma_hwrite_dph_r <= mst_dma_hwrite_s;
+    end
+  end
+
+  // Master 'dma' Mux
+  always_comb begin: proc_dma_mux
+    if (fsm_dma_r == ahb_ml_fsm_transfer_wait_st) begin
+      mst_dma_haddr_s  = mst_dma_haddr_r;
+      mst_dma_hwrite_s = mst_dma_hwrite_r;
+      mst_dma_hburst_s = mst_dma_hburst_r;
+      mst_dma_hsize_s  = mst_dma_hsize_r;
+      mst_dma_htrans_s = mst_dma_htrans_r;
+      mst_dma_hprot_s  = mst_dma_hprot_r;
+    end else begin
+      mst_dma_haddr_s  = ahb_mst_dma_haddr_i;
+      mst_dma_hwrite_s = ahb_mst_dma_hwrite_i;
+      mst_dma_hburst_s = ahb_mst_dma_hburst_i;
+      mst_dma_hsize_s  = ahb_mst_dma_hsize_i;
+      mst_dma_htrans_s = ahb_mst_dma_htrans_i;
+      mst_dma_hprot_s  = ahb_mst_dma_hprot_i;
+    end
+
+    mst_dma_hready_s = (ahb_slv_ram_hreadyout_i & mst_dma_ram_gnt_r) |
+                       ~mst_dma_ram_gnt_r;
+
+    case (fsm_dma_r)
+      ahb_ml_fsm_transfer_wait_st: begin
+        ahb_mst_dma_hrdata_o = 32'h00000000;
+        ahb_mst_dma_hready_o = 1'b0;
+        ahb_mst_dma_hresp_o  = ahb_resp_okay_e;
+      end
+
+      ahb_ml_fsm_error1_st: begin
+        ahb_mst_dma_hrdata_o = 32'h00000000;
+        ahb_mst_dma_hready_o = 1'b0;
+        ahb_mst_dma_hresp_o  = ahb_resp_error_e;
+      end
+
+      ahb_ml_fsm_error2_st: begin
+        ahb_mst_dma_hrdata_o = 32'h00000000;
+        ahb_mst_dma_hready_o = 1'b1;
+        ahb_mst_dma_hresp_o  = ahb_resp_error_e;
+      end
+
+      ahb_ml_fsm_error0_st, ahb_ml_fsm_transfer_st: begin
+        ahb_mst_dma_hrdata_o = (mst_dma_hwrite_dph_r == 1'b0) ? ahb_slv_ram_hrdata_i : 32'h00000000;
+        ahb_mst_dma_hready_o = ahb_slv_ram_hreadyout_i;
+        ahb_mst_dma_hresp_o = ahb_slv_ram_hresp_i;
+      end
+
+      ahb_ml_fsm_transfer_finish_st: begin
+        ahb_mst_dma_hrdata_o = ahb_slv_ram_hrdata_i;
+        ahb_mst_dma_hready_o = ahb_slv_ram_hreadyout_i;
+        ahb_mst_dma_hresp_o = ahb_slv_ram_hresp_i;
+      end
+
+      default: begin
+        ahb_mst_dma_hrdata_o = 32'h00000000;
+        ahb_mst_dma_hready_o = 1'b1;
+        ahb_mst_dma_hresp_o  = ahb_resp_okay_e;
+      end
+    endcase
+  end
+
+
+
+  // ------------------------------------------------------
+  // The Slaves:
+  // ------------------------------------------------------
+  // // Slave 'ram' round-robin arbiter
+  always_comb begin: proc_ram_rr_arb
+    integer i;
+    logic found_s;
+    logic [1:0] slv_req_s;
+    logic [1:0] prev_grant_s;
+    logic [1:0] next_grant_s;
+    logic arb_en_s;
+
+    slv_req_s = {mst_cpu_ram_req_s, mst_dma_ram_req_s};
+    prev_grant_s = {slv_ram_cpu_gnt_r, slv_ram_dma_gnt_r};
+    arb_en_s = ~(mst_cpu_ram_keep_s | mst_dma_ram_keep_s);
+
+    next_grant_s = {prev_grant_s[0:0], prev_grant_s[1]}; // 1st candidate is old grant rotated 1 left
+    found_s = 1'b0;
+    for (i=0; i<2; i=i+1) begin
+      if (found_s == 1'b0) begin
+        if ((slv_req_s & next_grant_s) != 2'd0) begin
+          found_s = 1'b1;
+        end else begin
+          next_grant_s = {next_grant_s[0:0], next_grant_s[1]}; // rotate 1 left
+        end
+      end
+    end
+
+    {slv_ram_cpu_gnt_s, slv_ram_dma_gnt_s} = slv_req_s & next_grant_s & {2{(ahb_slv_ram_hreadyout_i & arb_en_s)}};
+  end
+
+
+  always_ff @(posedge main_clk_i or negedge main_rst_an_i) begin: proc_ram_gnt
+    if (main_rst_an_i == 1'b0) begin
+      slv_ram_cpu_gnt_r <= 1'b1;  // initial pseudo-grant
+      slv_ram_dma_gnt_r <= 1'b0;
+    end else begin
+      if ({slv_ram_cpu_gnt_s, slv_ram_dma_gnt_s} != 2'd0) begin
+        slv_ram_cpu_gnt_r <= slv_ram_cpu_gnt_s;
+        slv_ram_dma_gnt_r <= slv_ram_dma_gnt_s;
+      end
+    end
+  end
+
+
+  // Slave 'ram' multiplexer
+  always_comb begin: proc_ram_mux
+      slv_ram_cpu_sel_s = slv_ram_cpu_gnt_s |
+                          (mst_cpu_ram_keep_s & mst_cpu_ram_gnt_r);
+      slv_ram_dma_sel_s = slv_ram_dma_gnt_s |
+                          (mst_dma_ram_keep_s & mst_dma_ram_gnt_r);
+
+    ahb_slv_ram_hsel_o = |{slv_ram_cpu_sel_s, slv_ram_dma_sel_s};
+
+    case ({slv_ram_cpu_sel_s, slv_ram_dma_sel_s})  // address phase signals
+      2'b01: begin
+        ahb_slv_ram_haddr_o     = mst_dma_haddr_s;
+        ahb_slv_ram_hwrite_o    = mst_dma_hwrite_s;
+        ahb_slv_ram_hburst_o    = mst_dma_hburst_s;
+        ahb_slv_ram_hsize_o     = mst_dma_hsize_s;
+        ahb_slv_ram_htrans_o    = mst_dma_htrans_s;
+        ahb_slv_ram_hprot_o     = mst_dma_hprot_s;
+        ahb_slv_ram_hready_o    = mst_dma_hready_s;
+      end
+
+      2'b10: begin
+        ahb_slv_ram_haddr_o     = mst_cpu_haddr_s;
+        ahb_slv_ram_hwrite_o    = mst_cpu_hwrite_s;
+        ahb_slv_ram_hburst_o    = mst_cpu_hburst_s;
+        ahb_slv_ram_hsize_o     = mst_cpu_hsize_s;
+        ahb_slv_ram_htrans_o    = mst_cpu_htrans_s;
+        ahb_slv_ram_hprot_o     = mst_cpu_hprot_s;
+        ahb_slv_ram_hready_o    = mst_cpu_hready_s;
+      end
+
+      default: begin
+        ahb_slv_ram_haddr_o     = 32'h00000000;
+        ahb_slv_ram_hwrite_o    = ahb_write_read_e;
+        ahb_slv_ram_hburst_o    = ahb_burst_single_e;
+        ahb_slv_ram_hsize_o     = ahb_size_word_e;
+        ahb_slv_ram_htrans_o    = ahb_trans_idle_e;
+        ahb_slv_ram_hprot_o     = 4'h3;
+        ahb_slv_ram_hready_o    = ahb_slv_ram_hreadyout_i;
+      end
+    endcase
+
+
+    case ({mst_cpu_ram_gnt_r, mst_dma_ram_gnt_r})  // data phase signals
+      2'b01: begin
+        ahb_slv_ram_hwdata_o = ahb_mst_dma_hwdata_i;
+      end
+
+      2'b10: begin
+        ahb_slv_ram_hwdata_o = ahb_mst_cpu_hwdata_i;
+      end
+
+      default: begin
+        ahb_slv_ram_hwdata_o = 32'h00000000;
+      end
+    endcase
+  end
+
+  // Slave 'periph': no arbitration necessary
+  always_comb begin: proc_periph_asgn
+    slv_periph_cpu_gnt_s = mst_cpu_periph_req_s;
+
+    ahb_slv_periph_hsel_o        = mst_cpu_periph_req_s | (mst_cpu_periph_gnt_r & mst_cpu_cont_xfer_s);  // address phase signals
+    if (mst_cpu_periph_sel_s == 1'b1) begin
+      ahb_slv_periph_haddr_o     = ahb_mst_cpu_haddr_i;
+      ahb_slv_periph_hwrite_o    = ahb_mst_cpu_hwrite_i;
+      ahb_slv_periph_hburst_o    = ahb_mst_cpu_hburst_i;
+      ahb_slv_periph_hsize_o     = ahb_mst_cpu_hsize_i;
+      ahb_slv_periph_htrans_o    = ahb_mst_cpu_htrans_i;
+      ahb_slv_periph_hprot_o     = ahb_mst_cpu_hprot_i;
+      ahb_slv_periph_hready_o    = mst_cpu_hready_s;
+    end else begin
+      ahb_slv_periph_haddr_o     = 32'h00000000;
+      ahb_slv_periph_hwrite_o    = ahb_write_read_e;
+      ahb_slv_periph_hburst_o    = ahb_burst_single_e;
+      ahb_slv_periph_hsize_o     = ahb_size_word_e;
+      ahb_slv_periph_htrans_o    = ahb_trans_idle_e;
+      ahb_slv_periph_hprot_o     = 4'h3;
+      ahb_slv_periph_hready_o    = ahb_slv_periph_hreadyout_i;
+    end
+
+
+    if (mst_cpu_periph_gnt_r == 1'b1) begin  // data phase signals
+      ahb_slv_periph_hwdata_o = ahb_mst_cpu_hwdata_i;
+    end else begin
+      ahb_slv_periph_hwdata_o = 32'h00000000;
+    end
+  end
+
+
+endmodule // ucdp_amba_pkg_example_ml
+
+`default_nettype wire
+`end_keywords
+
+// =============================================================================
+//
+//   @generated @fully-generated
+//
+//   THIS FILE IS GENERATED!!! DO NOT EDIT MANUALLY. CHANGES ARE LOST.
+//
+// =============================================================================
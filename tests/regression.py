@@ -24,6 +24,7 @@
 """Simulate generated System Verilog using CocoTB."""
 
 import os
+import re
 import subprocess
 from pathlib import Path
 
@@ -49,6 +50,50 @@ ml_fl = [
     f"{prjroot}/tests/refdata/tests.test_svmako/test_ahb_ml/ucdp_ahb_ml_example/ucdp_ahb_ml_example_ml.sv",
 ]
 
+ml_arb_fl = [
+    f"{prjroot}/tests/refdata/tests.test_svmako/test_ahb_ml_arb/ucdp_ahb_ml_arb_example/ucdp_ahb_ml_arb_example_ml.sv",
+]
+
+ml_qos_fl = [
+    f"{prjroot}/tests/refdata/tests.test_svmako/test_ahb_ml_qos/ucdp_ahb_ml_qos_example/ucdp_ahb_ml_qos_example_ml.sv",
+]
+
+ml_hold_fl = [
+    f"{prjroot}/tests/refdata/tests.test_svmako/test_ahb_ml_hold/ucdp_ahb_ml_hold_example/ucdp_ahb_ml_hold_example_ml.sv",
+]
+
+ml_park_fl = [
+    f"{prjroot}/tests/refdata/tests.test_svmako/test_ahb_ml_park/ucdp_ahb_ml_park_example/ucdp_ahb_ml_park_example_ml.sv",
+]
+
+ml_slice_fl = [
+    f"{prjroot}/tests/refdata/tests.test_svmako/test_ahb_ml_slice/ucdp_ahb_ml_slice_example/{mname}.sv"
+    for mname in (
+        "ucdp_ahb_ml_slice_example_ml_rs_mst_dsp",
+        "ucdp_ahb_ml_slice_example_ml_rs_mst_dma",
+        "ucdp_ahb_ml_slice_example_ml_rs_mst_ext",
+        "ucdp_ahb_ml_slice_example_ml_rs_slv_rom",
+        "ucdp_ahb_ml_slice_example_ml_rs_slv_io",
+        "ucdp_ahb_ml_slice_example_ml_rs_slv_sram",
+        "ucdp_ahb_ml_slice_example_ml",
+    )
+]
+
+ml_rr_fl = [
+    f"{prjroot}/tests/refdata/tests.test_svmako/test_ahb_ml_rr/ucdp_ahb_ml_rr_example/ucdp_ahb_ml_rr_example_loop.sv",
+    f"{prjroot}/tests/refdata/tests.test_svmako/test_ahb_ml_rr/ucdp_ahb_ml_rr_example/ucdp_ahb_ml_rr_example_prefix.sv",
+]
+
+ml_post_fl = [
+    f"{prjroot}/tests/refdata/tests.test_svmako/test_ahb_ml_post/ucdp_ahb_ml_post_example/{mname}.sv"
+    for mname in (
+        "ucdp_ahb_ml_post_example_ml_pw_slv_flash",
+        "ucdp_ahb_ml_post_example_ml_rs_slv_apb",
+        "ucdp_ahb_ml_post_example_ml_pw_slv_apb",
+        "ucdp_ahb_ml_post_example_ml",
+    )
+]
+
 apb2mem_fl = [
     f"{prjroot}/tests/refdata/tests.test_svmako/test_apb2mem/ucdp_apb2mem_example/ucdp_apb2mem_example_a2m.sv",
 ]
@@ -72,8 +117,27 @@ for srctt in ["mst", "slv"]:
                         f"{prjroot}/tests/refdata/tests.test_svmako/test_ahb2ahb/ucdp_ahb2ahb_example/{mname}"
                     )
 
+
+def get_array_fl(filelist: list[str]) -> list[str]:
+    """Filelist of the `array` RTL Style Build of `filelist`."""
+    return [re.sub(r"/tests\.test_svmako/(test_\w+)/", r"/tests.test_svmako/\1_array/", path) for path in filelist]
+
+
+def get_build_name(test) -> str:
+    """Unique Name of the Build of `test`: the reference data directory and the toplevel."""
+    return f"{Path(test[2][0]).parent.parent.name}_{test[1]}"
+
+
+ml_array_fl = get_array_fl(ml_fl)
+ml_onehot_fl = [path.replace("/test_ahb_ml/", "/test_ahb_ml_onehot/") for path in ml_fl]
+ml_onehot_array_fl = get_array_fl(ml_onehot_fl)
+ml_fsm_onehot_array_fl = [path.replace("/test_ahb_ml/", "/test_ahb_ml_fsm_onehot_array/") for path in ml_fl]
+
 tests = [
     ("compile_test", "ucdp_ahb_ml_example_ml", ml_fl),
+    ("compile_test", "ucdp_ahb_ml_example_ml", ml_array_fl),
+    ("compile_test", "ucdp_ahb_ml_example_ml", ml_onehot_array_fl),
+    ("compile_test", "ucdp_ahb_ml_example_ml", ml_fsm_onehot_array_fl),
     ("compile_test", "ucdp_apb2mem_example_a2m", apb2mem_fl),
     ("compile_test", "ucdp_ahb2apb_example_ahb2apb_amba3_errirqfalse", ahb2apb_fl),
     ("compile_test", "ucdp_ahb2apb_example_ahb2apb_amba3_errirqtrue", ahb2apb_fl),
@@ -81,18 +145,49 @@ tests = [
     ("compile_test", "ucdp_ahb2apb_example_odd", ahb2apb_fl),
     ("compile_test", "ucdp_ahb2ahb_example_mst2mst_lrgp_lrgp_n", ahb2ahb_fl),
     ("ahb_ml_test", "ucdp_ahb_ml_example_ml", ml_fl),
+    ("ahb_ml_dph_test", "ucdp_ahb_ml_example_ml", ml_fl),
+    ("ahb_ml_pipe_test", "ucdp_ahb_ml_example_ml", ml_fl),
+    ("ahb_ml_arb_test", "ucdp_ahb_ml_arb_example_ml", ml_arb_fl),
+    ("ahb_ml_qos_test", "ucdp_ahb_ml_qos_example_ml", ml_qos_fl),
+    ("ahb_ml_hold_test", "ucdp_ahb_ml_hold_example_ml", ml_hold_fl),
+    ("ahb_ml_park_test", "ucdp_ahb_ml_park_example_ml", ml_park_fl),
+    ("ahb_ml_pipe_test", "ucdp_ahb_ml_park_example_ml", ml_park_fl),
+    # 128-bit data - `ahb_ml_test` expects 32-bit data
+    ("ahb_ml_dph_test", "ucdp_ahb_ml_example_ml", ml_onehot_fl),
+    ("ahb_ml_pipe_test", "ucdp_ahb_ml_example_ml", ml_onehot_fl),
+    ("ahb_ml_slice_test", "ucdp_ahb_ml_slice_example_ml", ml_slice_fl),
+    ("ahb_ml_rr_test", "ucdp_ahb_ml_rr_example_loop", ml_rr_fl),
+    ("ahb_ml_rr_test", "ucdp_ahb_ml_rr_example_prefix", ml_rr_fl),
+    ("ahb_ml_post_test", "ucdp_ahb_ml_post_example_ml", ml_post_fl),
+    # `array` RTL style
+    ("ahb_ml_test", "ucdp_ahb_ml_example_ml", ml_array_fl),
+    ("ahb_ml_dph_test", "ucdp_ahb_ml_example_ml", ml_array_fl),
+    ("ahb_ml_pipe_test", "ucdp_ahb_ml_example_ml", ml_array_fl),
+    # 128-bit data - `ahb_ml_test` expects 32-bit data
+    ("ahb_ml_dph_test", "ucdp_ahb_ml_example_ml", ml_onehot_array_fl),
+    ("ahb_ml_pipe_test", "ucdp_ahb_ml_example_ml", ml_onehot_array_fl),
+    ("ahb_ml_test", "ucdp_ahb_ml_example_ml", ml_fsm_onehot_array_fl),
+    ("ahb_ml_arb_test", "ucdp_ahb_ml_arb_example_ml", get_array_fl(ml_arb_fl)),
+    ("ahb_ml_qos_test", "ucdp_ahb_ml_qos_example_ml", get_array_fl(ml_qos_fl)),
+    ("ahb_ml_hold_test", "ucdp_ahb_ml_hold_example_ml", get_array_fl(ml_hold_fl)),
+    ("ahb_ml_park_test", "ucdp_ahb_ml_park_example_ml", get_array_fl(ml_park_fl)),
+    ("ahb_ml_pipe_test", "ucdp_ahb_ml_park_example_ml", get_array_fl(ml_park_fl)),
+    ("ahb_ml_slice_test", "ucdp_ahb_ml_slice_example_ml", get_array_fl(ml_slice_fl)),
+    ("ahb_ml_rr_test", "ucdp_ahb_ml_rr_example_loop", get_array_fl(ml_rr_fl)),
+    ("ahb_ml_rr_test", "ucdp_ahb_ml_rr_example_prefix", get_array_fl(ml_rr_fl)),
+    ("ahb_ml_post_test", "ucdp_ahb_ml_post_example_ml", get_array_fl(ml_post_fl)),
     ("ahb2apb_test", "ucdp_ahb2apb_example_odd", ahb2apb_fl),
     # ("ahb2ahb_test", "ucdp_ahb2ahb_example_mst2mst_lrgp_lrgp_n", ahb2ahb_fl),
 ]
 
 
-@pytest.mark.parametrize("test", tests, ids=[f"{t[1]}:{t[0]}" for t in tests])
+@pytest.mark.parametrize("test", tests, ids=[f"{get_build_name(t)}:{t[0]}" for t in tests])
 def test_generic(test):
     """Generic, parametrized test runner."""
     # print(os.getcwd())
     # print(os.environ)
     top = test[1]
-    sim_build = f"sim_build_{top}"
+    sim_build = f"sim_build_{get_build_name(test)}"
     run(
         verilog_sources=test[2],
         toplevel=top,
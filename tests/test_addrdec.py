@@ -0,0 +1,130 @@
+#
+# MIT License
+#
+# Copyright (c) 2024-2025 nbiotcloud
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+#
+"""Test Address Decoder Compiler."""
+
+import random
+
+import pytest
+import ucdp as u
+from ucdp_addr.addrspace import Addrspace
+
+from ucdp_amba.addrdec import compile_decoder, is_intersecting, split_decoder
+
+ADDRWIDTH = 12
+"""Address Width, small enough for exhaustive checks."""
+
+
+def _random_addrspaces(rnd: random.Random) -> dict[str, list[Addrspace]]:
+    """Random non-overlapping Address Spaces on 64 byte granularity, up to 3 per Target."""
+    free = list(range(2 ** (ADDRWIDTH - 6)))
+    addrspaces: dict[str, list[Addrspace]] = {}
+    for idx in range(rnd.randint(1, 5)):
+        for _ in range(rnd.randint(1, 3)):
+            if not free:
+                break
+            start = rnd.choice(free)
+            end = start
+            while end + 1 in free and end - start < 4 and rnd.random() < 0.7:
+                end += 1
+            for blk in range(start, end + 1):
+                free.remove(blk)
+            addrspace = Addrspace(baseaddr=start * 64, size=(end - start + 1) * 64)
+            addrspaces.setdefault(f"t{idx}", []).append(addrspace)
+    return addrspaces
+
+
+def _decode(masks: dict[str, tuple[str, ...]], value: str) -> list[str]:
+    return [name for name, tmasks in masks.items() if any(is_intersecting(mask, value) for mask in tmasks)]
+
+
+@pytest.mark.parametrize("seed", range(20))
+def test_minimize(seed):
+    """Minimized Decoders select the same Target for every mapped Address."""
+    rnd = random.Random(seed)
+    addrspaces = _random_addrspaces(rnd)
+    decslice = u.Slice(left=ADDRWIDTH - 1, right=6)
+    plain = compile_decoder(decslice, addrspaces)
+    exact = compile_decoder(decslice, addrspaces, optimize=True)
+    dontcare = compile_decoder(decslice, addrspaces, optimize=True, dontcare=True)
+    assert exact.plain_comparators == plain.comparators
+    assert dontcare.comparators <= exact.comparators <= plain.comparators
+    for addr in range(2**decslice.width):
+        value = f"{addr:0{decslice.width}b}"
+        targets = _decode(plain.masks, value)
+        assert len(targets) <= 1
+        assert _decode(exact.masks, value) == targets
+        if targets:
+            assert _decode(dontcare.masks, value) == targets
+
+
+@pytest.mark.parametrize("seed", range(20))
+@pytest.mark.parametrize("optimize", (False, True))
+@pytest.mark.parametrize("dontcare", (False, True))
+def test_minbits(seed, optimize, dontcare):
+    """A Minimal Set of Address Bits selects the same Target and keeps Decode Errors without `dontcare`."""
+    rnd = random.Random(seed)
+    addrspaces = _random_addrspaces(rnd)
+    decslice = u.Slice(left=ADDRWIDTH - 1, right=6)
+    plain = compile_decoder(decslice, addrspaces)
+    decoder = compile_decoder(decslice, addrspaces, optimize=optimize, dontcare=dontcare, minbits=True)
+    assert 0 < len(decoder.bits) <= decslice.width
+    positions = [decslice.left - bit for bit in decoder.bits]
+    for addr in range(2**decslice.width):
+        value = f"{addr:0{decslice.width}b}"
+        targets = _decode(plain.masks, value)
+        decoded = _decode(decoder.masks, "".join(value[pos] for pos in positions))
+        if targets or not dontcare:
+            assert decoded == targets
+
+
+@pytest.mark.parametrize("seed", range(20))
+@pytest.mark.parametrize("minbits", (False, True))
+def test_split(seed, minbits):
+    """Two-Level Decoders select the same Target as their Single-Level Decoder."""
+    rnd = random.Random(seed)
+    addrspaces = _random_addrspaces(rnd)
+    decslice = u.Slice(left=ADDRWIDTH - 1, right=6)
+    flat = compile_decoder(decslice, addrspaces, optimize=True, minbits=minbits)
+    decoder = split_decoder(flat)
+    assert 0 < decoder.coarse <= len(decoder.positions)
+    coarse = decoder.coarse
+    width = len(decoder.positions)
+    for addr in range(2**width):
+        value = f"{addr:0{width}b}"
+        regions = [region for region in decoder.regions if region.value == value[:coarse]]
+        decoded = _decode(regions[0].masks, value[coarse:]) if regions else []
+        assert decoded == _decode(flat.masks, value)
+
+
+def test_dontcare():
+    """Unmapped Address Space is used to reduce Comparators."""
+    addrspaces = {
+        "ram": [Addrspace(baseaddr=0x0, size=0x40)],
+        "misc": [Addrspace(baseaddr=0x100, size=0xC0), Addrspace(baseaddr=0x300, size=0x40)],
+    }
+    decslice = u.Slice(left=9, right=6)
+    exact = compile_decoder(decslice, addrspaces, optimize=True)
+    assert exact.masks == {"ram": ("0000",), "misc": ("010?", "0110", "1100")}
+    dontcare = compile_decoder(decslice, addrspaces, optimize=True, dontcare=True)
+    assert dontcare.masks == {"ram": ("?0??",), "misc": ("?1??",)}
@@ -0,0 +1,88 @@
+#
+# MIT License
+#
+# Copyright (c) 2024-2025 nbiotcloud
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+#
+"""Test AHB Multilayer Scaling Benchmark."""
+
+import json
+from pathlib import Path
+
+from .benchmark_ahb_ml import PHASES, AhbMlBenchMod, Scenario, get_scenarios, main, run, run_scenario
+
+REFERENCE = Path(__file__).parent / "testdata" / "benchmark_ahb_ml.json"
+
+
+def test_run_scenario():
+    """Smallest Scenarios."""
+    sparse = run_scenario(Scenario(4, 8, "sparse"))
+    dense = run_scenario(Scenario(4, 8, "dense"))
+    assert sparse["routes"] == 16
+    assert dense["routes"] == 32
+    assert sparse["signals"] < dense["signals"]
+    for result in (sparse, dense):
+        for phase in PHASES:
+            assert result[f"{phase}_s"] > 0
+            assert result[f"{phase}_peak_kib"] >= 0
+        assert result["build_dep_peak_kib"] > 0
+        assert result["generate_peak_kib"] > 0
+        assert result["hdl_bytes"] > 0
+
+
+def test_main(tmp_path):
+    """Command Line Interface."""
+    filepath = tmp_path / "bench.json"
+    main(["--output", str(filepath), "--max-pairs", "4", "--no-tracemalloc"])
+    results = json.loads(filepath.read_text())
+    assert [result["name"] for result in results["results"]] == ["2x2-sparse", "2x2-dense"]
+    assert "build_peak_kib" not in results["results"][0]
+
+
+def test_reference():
+    """Routes, Signals and HDL Size match the checked-in Reference - Peak Memory is left to the Benchmark."""
+    results = run(get_scenarios(max_pairs=32), use_tracemalloc=False)
+    refs = {ref["name"]: ref for ref in json.loads(REFERENCE.read_text())["results"]}
+    for result in results["results"]:
+        ref = refs[result["name"]]
+        for key in ("routes", "signals", "hdl_bytes"):
+            assert result[key] == ref[key], f"{result['name']}: {key}={result[key]}, reference {ref[key]}"
+
+
+def test_signals_scale_with_routes():
+    """Signals are created per Route, not per Master/Slave Pair."""
+    small = AhbMlBenchMod(scenario=Scenario(8, 16, "sparse")).get_inst("u_ml")
+    large = AhbMlBenchMod(scenario=Scenario(8, 64, "sparse")).get_inst("u_ml")
+    assert (small.routing.num_routes, large.routing.num_routes) == (32, 128)
+    small_signals = len(small.portssignals) - len(small.ports)
+    large_signals = len(large.portssignals) - len(large.ports)
+    # 3 master-side and 5 arbitration signals per route
+    assert large_signals - small_signals == 8 * (128 - 32)
+
+
+def test_array_style():
+    """The `array` RTL Style emits less HDL with the same Ports."""
+    unrolled = run_scenario(Scenario(4, 8, "dense"), use_tracemalloc=False)
+    array = run_scenario(Scenario(4, 8, "dense"), use_tracemalloc=False, rtl_style="array")
+    assert array["rtl_style"] == "array"
+    assert array["hdl_bytes"] < unrolled["hdl_bytes"]
+    unrolled_ml = AhbMlBenchMod(scenario=Scenario(4, 8, "dense")).get_inst("u_ml")
+    array_ml = AhbMlBenchMod(scenario=Scenario(4, 8, "dense"), rtl_style="array").get_inst("u_ml")
+    assert [port.name for port in array_ml.ports] == [port.name for port in unrolled_ml.ports]
@@ -0,0 +1,89 @@
+#
+# MIT License
+#
+# Copyright (c) 2024-2025 nbiotcloud
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+#
+"""Import Time Benchmark."""
+
+import subprocess
+import sys
+
+import pytest
+
+TYPES_ONLY = ("ucdp_amba.ucdp_", "ucdp_addr", "ucdp_glbl")
+"""Modules, which must not be imported when just using `ucdp_amba.types`."""
+
+IMPORT_BUDGET_US = 500_000
+"""Cold-Start Budget of `ucdp_amba` itself, without `ucdp`, in Microseconds."""
+
+
+def get_importtimes(stmt: str) -> dict[str, tuple[int, int]]:
+    """Run `stmt` in a fresh interpreter and return `{module: (self_us, cumulative_us)}`."""
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", stmt], capture_output=True, text=True, check=True
+    )
+    importtimes = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        selftime, cumulative, name = line.removeprefix("import time:").split("|")
+        importtimes[name.strip()] = (int(selftime), int(cumulative))
+    return importtimes
+
+
+def get_own_importtime(importtimes: dict[str, tuple[int, int]]) -> int:
+    """Sum of Self Import Times of `ucdp_amba` Modules."""
+    return sum(selftime for name, (selftime, _) in importtimes.items() if name.startswith("ucdp_amba"))
+
+
+def test_package():
+    """Importing the package does not import any submodule."""
+    importtimes = get_importtimes("import ucdp_amba")
+    assert [name for name in importtimes if name.startswith("ucdp_amba")] == ["ucdp_amba"]
+    assert "ucdp" not in importtimes
+
+
+def test_types():
+    """Types do not depend on any bridge module or helper."""
+    importtimes = get_importtimes("import ucdp_amba.types")
+    assert "ucdp_amba.types" in importtimes
+    assert [name for name in importtimes if name.startswith(TYPES_ONLY)] == []
+    assert get_own_importtime(importtimes) < IMPORT_BUDGET_US
+
+
+def test_lazy_attribute():
+    """Submodules are loaded on first Attribute Access."""
+    stmt = "import sys, ucdp_amba; ucdp_amba.types.AhbMstType; print(*sorted(sys.modules))"
+    result = subprocess.run([sys.executable, "-c", stmt], capture_output=True, text=True, check=True)
+    modnames = result.stdout.split()
+    assert "ucdp_amba.types" in modnames
+    assert [name for name in modnames if name.startswith(TYPES_ONLY)] == []
+
+
+@pytest.mark.parametrize(
+    "modname",
+    ["ucdp_ahb_ml", "ucdp_ahb_post", "ucdp_ahb_slice", "ucdp_ahb2apb", "ucdp_ahb2ahb", "ucdp_apb2mem", "ucdp_amba_pkg"],
+)
+def test_submodule(modname):
+    """Each Submodule stays within the Cold-Start Budget."""
+    importtimes = get_importtimes(f"import ucdp_amba.{modname}")
+    assert f"ucdp_amba.{modname}" in importtimes
+    assert get_own_importtime(importtimes) < IMPORT_BUDGET_US
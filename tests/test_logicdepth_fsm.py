@@ -0,0 +1,59 @@
+#
+# MIT License
+#
+# Copyright (c) 2024-2025 nbiotcloud
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+#
+"""Test FSM Encoding Logic Depth Comparison."""
+
+import json
+import shutil
+
+import pytest
+
+from .logicdepth_fsm import ENCODINGS, INSTS, FsmDepthMod, main
+
+YOSYS = shutil.which("yosys") or shutil.which("yowasp-yosys")
+
+
+def test_fsm_depth_mod():
+    """All Encodings have the same Ports, just the FSM Width differs."""
+    binary = FsmDepthMod()
+    for fsm_encoding in ENCODINGS:
+        top = FsmDepthMod(fsm_encoding=fsm_encoding)
+        for instname in INSTS:
+            inst = top.get_inst(instname)
+            assert inst.fsm_encoding == fsm_encoding
+            assert [port.name for port in inst.ports] == [port.name for port in binary.get_inst(instname).ports]
+    ml = FsmDepthMod(fsm_encoding="onehot").get_inst("u_ml")
+    assert ml.portssignals["fsm_cpu_r"].type_.keytype.width == len(ml.fsmtype.states)
+
+
+@pytest.mark.skipif(YOSYS is None, reason="yosys is not available")
+def test_main(tmp_path):
+    """Command Line Interface."""
+    filepath = tmp_path / "depth.json"
+    main(["--yosys", YOSYS, "--output", str(filepath)])
+    results = {(result["inst"], result["fsm_encoding"]): result for result in json.loads(filepath.read_text())}
+    assert sorted(results) == sorted((inst, fsm_encoding) for inst in INSTS for fsm_encoding in ENCODINGS)
+    for inst in INSTS:
+        binary, onehot = results[inst, "binary"], results[inst, "onehot"]
+        assert onehot["ffs"] > binary["ffs"]
+        assert onehot["fsm_decode"] < binary["fsm_decode"]
@@ -29,6 +29,17 @@ from unittest import mock
 import ucdp as u
 from test2ref import assert_refdata
 
+from ucdp_amba.ucdp_ahb_ml import (
+    UcdpAhbMlArbExampleMod,
+    UcdpAhbMlExampleMod,
+    UcdpAhbMlHoldExampleMod,
+    UcdpAhbMlParkExampleMod,
+    UcdpAhbMlPostExampleMod,
+    UcdpAhbMlQosExampleMod,
+    UcdpAhbMlRrExampleMod,
+    UcdpAhbMlSliceExampleMod,
+)
+
 
 def test_ahb2apb(tmp_path):
     """AHB2APB Module."""
@@ -46,6 +57,214 @@ def test_ahb_ml(tmp_path):
     assert_refdata(test_ahb_ml, tmp_path)
 
 
+def test_ahb_ml_array(tmp_path):
+    """AHB Multilayer Module in `array` RTL Style."""
+    mod = UcdpAhbMlExampleMod(rtl_style="array")
+    with mock.patch.dict(os.environ, {"PRJROOT": str(tmp_path)}):
+        u.generate(mod, "hdl")
+    assert_refdata(test_ahb_ml_array, tmp_path)
+
+
+def test_ahb_ml_optdec(tmp_path):
+    """AHB Multilayer Module with Logic-Minimized Address Decoding."""
+    mod = UcdpAhbMlExampleMod(optdec=True, is_sub=True)
+    with mock.patch.dict(os.environ, {"PRJROOT": str(tmp_path)}):
+        u.generate(mod, "hdl")
+    assert_refdata(test_ahb_ml_optdec, tmp_path)
+
+
+def test_ahb_ml_mindecbits(tmp_path):
+    """AHB Multilayer Module in `array` RTL Style, Decoding a Minimal Set of Address Bits."""
+    mod = UcdpAhbMlExampleMod(mindecbits=True, is_sub=True, rtl_style="array")
+    with mock.patch.dict(os.environ, {"PRJROOT": str(tmp_path)}):
+        u.generate(mod, "hdl")
+    assert_refdata(test_ahb_ml_mindecbits, tmp_path)
+
+
+def test_ahb_ml_splitdec(tmp_path):
+    """AHB Multilayer Module in `array` RTL Style with Two-Level Address Decoding."""
+    mod = UcdpAhbMlExampleMod(splitdec=True, rtl_style="array")
+    with mock.patch.dict(os.environ, {"PRJROOT": str(tmp_path)}):
+        u.generate(mod, "hdl")
+    assert_refdata(test_ahb_ml_splitdec, tmp_path)
+
+
+def test_ahb_ml_regdec(tmp_path):
+    """AHB Multilayer Module with Registered Coarse Address Decoding."""
+    mod = UcdpAhbMlExampleMod(regdec=True)
+    with mock.patch.dict(os.environ, {"PRJROOT": str(tmp_path)}):
+        u.generate(mod, "hdl")
+    assert_refdata(test_ahb_ml_regdec, tmp_path)
+
+
+def test_ahb_ml_onehot(tmp_path):
+    """AHB Multilayer Module with 128-bit Data and One-Hot AND-OR Multiplexers."""
+    mod = UcdpAhbMlExampleMod(onehot_mux=True, datawidth=128)
+    with mock.patch.dict(os.environ, {"PRJROOT": str(tmp_path)}):
+        u.generate(mod, "hdl")
+    assert_refdata(test_ahb_ml_onehot, tmp_path)
+
+
+def test_ahb_ml_onehot_array(tmp_path):
+    """AHB Multilayer Module in `array` RTL Style with 128-bit Data and One-Hot AND-OR Multiplexers."""
+    mod = UcdpAhbMlExampleMod(onehot_mux=True, datawidth=128, rtl_style="array")
+    with mock.patch.dict(os.environ, {"PRJROOT": str(tmp_path)}):
+        u.generate(mod, "hdl")
+    assert_refdata(test_ahb_ml_onehot_array, tmp_path)
+
+
+def test_ahb_ml_fsm_onehot(tmp_path):
+    """AHB Multilayer Module with One-Hot Encoded Master FSMs."""
+    mod = UcdpAhbMlExampleMod(fsm_encoding="onehot")
+    with mock.patch.dict(os.environ, {"PRJROOT": str(tmp_path)}):
+        u.generate(mod, "hdl")
+    assert_refdata(test_ahb_ml_fsm_onehot, tmp_path)
+
+
+def test_ahb_ml_fsm_onehot_array(tmp_path):
+    """AHB Multilayer Module in `array` RTL Style with One-Hot Encoded Master FSMs."""
+    mod = UcdpAhbMlExampleMod(fsm_encoding="onehot", rtl_style="array")
+    with mock.patch.dict(os.environ, {"PRJROOT": str(tmp_path)}):
+        u.generate(mod, "hdl")
+    assert_refdata(test_ahb_ml_fsm_onehot_array, tmp_path)
+
+
+def test_ahb_ml_fsm_gray(tmp_path):
+    """AHB Multilayer Module with Gray Encoded Master FSMs."""
+    mod = UcdpAhbMlExampleMod(fsm_encoding="gray")
+    with mock.patch.dict(os.environ, {"PRJROOT": str(tmp_path)}):
+        u.generate(mod, "hdl")
+    assert_refdata(test_ahb_ml_fsm_gray, tmp_path)
+
+
+def test_ahb_ml_arb(tmp_path):
+    """AHB Multilayer Module with all Arbitration Policies."""
+    mod = UcdpAhbMlArbExampleMod()
+    with mock.patch.dict(os.environ, {"PRJROOT": str(tmp_path)}):
+        u.generate(mod, "hdl")
+    assert_refdata(test_ahb_ml_arb, tmp_path)
+
+
+def test_ahb_ml_arb_array(tmp_path):
+    """AHB Multilayer Module in `array` RTL Style with all Arbitration Policies."""
+    mod = UcdpAhbMlArbExampleMod(rtl_style="array")
+    with mock.patch.dict(os.environ, {"PRJROOT": str(tmp_path)}):
+        u.generate(mod, "hdl")
+    assert_refdata(test_ahb_ml_arb_array, tmp_path)
+
+
+def test_ahb_ml_qos(tmp_path):
+    """AHB Multilayer Module with QoS Arbitration and Aging."""
+    mod = UcdpAhbMlQosExampleMod()
+    with mock.patch.dict(os.environ, {"PRJROOT": str(tmp_path)}):
+        u.generate(mod, "hdl")
+    assert_refdata(test_ahb_ml_qos, tmp_path)
+
+
+def test_ahb_ml_qos_array(tmp_path):
+    """AHB Multilayer Module in `array` RTL Style with QoS Arbitration and Aging."""
+    mod = UcdpAhbMlQosExampleMod(rtl_style="array")
+    with mock.patch.dict(os.environ, {"PRJROOT": str(tmp_path)}):
+        u.generate(mod, "hdl")
+    assert_refdata(test_ahb_ml_qos_array, tmp_path)
+
+
+def test_ahb_ml_hold(tmp_path):
+    """AHB Multilayer Module with bounded Grant Hold."""
+    mod = UcdpAhbMlHoldExampleMod()
+    with mock.patch.dict(os.environ, {"PRJROOT": str(tmp_path)}):
+        u.generate(mod, "hdl")
+    assert_refdata(test_ahb_ml_hold, tmp_path)
+
+
+def test_ahb_ml_hold_array(tmp_path):
+    """AHB Multilayer Module in `array` RTL Style with bounded Grant Hold."""
+    mod = UcdpAhbMlHoldExampleMod(rtl_style="array")
+    with mock.patch.dict(os.environ, {"PRJROOT": str(tmp_path)}):
+        u.generate(mod, "hdl")
+    assert_refdata(test_ahb_ml_hold_array, tmp_path)
+
+
+def test_ahb_ml_park(tmp_path):
+    """AHB Multilayer Module with Bus Parking."""
+    mod = UcdpAhbMlParkExampleMod()
+    with mock.patch.dict(os.environ, {"PRJROOT": str(tmp_path)}):
+        u.generate(mod, "hdl")
+    assert_refdata(test_ahb_ml_park, tmp_path)
+
+
+def test_ahb_ml_park_array(tmp_path):
+    """AHB Multilayer Module in `array` RTL Style with Bus Parking."""
+    mod = UcdpAhbMlParkExampleMod(rtl_style="array")
+    with mock.patch.dict(os.environ, {"PRJROOT": str(tmp_path)}):
+        u.generate(mod, "hdl")
+    assert_refdata(test_ahb_ml_park_array, tmp_path)
+
+
+def test_ahb_ml_rr(tmp_path):
+    """AHB Multilayer Module with both Round-Robin Arbiter Implementations."""
+    mod = UcdpAhbMlRrExampleMod()
+    with mock.patch.dict(os.environ, {"PRJROOT": str(tmp_path)}):
+        u.generate(mod, "hdl")
+    assert_refdata(test_ahb_ml_rr, tmp_path)
+
+
+def test_ahb_ml_rr_array(tmp_path):
+    """AHB Multilayer Module in `array` RTL Style with both Round-Robin Arbiter Implementations."""
+    mod = UcdpAhbMlRrExampleMod(rtl_style="array")
+    with mock.patch.dict(os.environ, {"PRJROOT": str(tmp_path)}):
+        u.generate(mod, "hdl")
+    assert_refdata(test_ahb_ml_rr_array, tmp_path)
+
+
+def test_ahb_ml_slice(tmp_path):
+    """AHB Multilayer Module with Register Slices."""
+    mod = UcdpAhbMlSliceExampleMod()
+    with mock.patch.dict(os.environ, {"PRJROOT": str(tmp_path)}):
+        u.generate(mod, "hdl")
+    assert_refdata(test_ahb_ml_slice, tmp_path)
+
+
+def test_ahb_ml_slice_array(tmp_path):
+    """AHB Multilayer Module in `array` RTL Style with Register Slices."""
+    mod = UcdpAhbMlSliceExampleMod(rtl_style="array")
+    with mock.patch.dict(os.environ, {"PRJROOT": str(tmp_path)}):
+        u.generate(mod, "hdl")
+    assert_refdata(test_ahb_ml_slice_array, tmp_path)
+
+
+def test_ahb_ml_post(tmp_path):
+    """AHB Multilayer Module with Posted-Write Buffers."""
+    mod = UcdpAhbMlPostExampleMod()
+    with mock.patch.dict(os.environ, {"PRJROOT": str(tmp_path)}):
+        u.generate(mod, "hdl")
+    assert_refdata(test_ahb_ml_post, tmp_path)
+
+
+def test_ahb_ml_post_array(tmp_path):
+    """AHB Multilayer Module in `array` RTL Style with Posted-Write Buffers."""
+    mod = UcdpAhbMlPostExampleMod(rtl_style="array")
+    with mock.patch.dict(os.environ, {"PRJROOT": str(tmp_path)}):
+        u.generate(mod, "hdl")
+    assert_refdata(test_ahb_ml_post_array, tmp_path)
+
+
+def test_ahb_post(tmp_path):
+    """AHB Posted-Write Buffer Module."""
+    top = u.load("ucdp_amba.ucdp_ahb_post")
+    with mock.patch.dict(os.environ, {"PRJROOT": str(tmp_path)}):
+        u.generate(top.mod, "hdl")
+    assert_refdata(test_ahb_post, tmp_path)
+
+
+def test_ahb_slice(tmp_path):
+    """AHB Register Slice Module."""
+    top = u.load("ucdp_amba.ucdp_ahb_slice")
+    with mock.patch.dict(os.environ, {"PRJROOT": str(tmp_path)}):
+        u.generate(top.mod, "hdl")
+    assert_refdata(test_ahb_slice, tmp_path)
+
+
 def test_apb2mem(tmp_path):
     """APB2MEM Module."""
     top = u.load("ucdp_amba.ucdp_apb2mem")
@@ -60,3 +279,11 @@ def test_ahb2ahb(tmp_path):
     with mock.patch.dict(os.environ, {"PRJROOT": str(tmp_path)}):
         u.generate(top.mod, "hdl")
     assert_refdata(test_ahb2ahb, tmp_path)
+
+
+def test_amba_pkg(tmp_path):
+    """Shared AMBA Package."""
+    top = u.load("ucdp_amba.ucdp_amba_pkg.UcdpAmbaPkgExampleMod")
+    with mock.patch.dict(os.environ, {"PRJROOT": str(tmp_path)}):
+        u.generate(top.mod, "hdl")
+    assert_refdata(test_amba_pkg, tmp_path)
@@ -0,0 +1,66 @@
+#
+# MIT License
+#
+# Copyright (c) 2024-2025 nbiotcloud
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+#
+"""Test Lazy Struct Types."""
+
+import pytest
+import ucdp as u
+from pydantic import ValidationError
+
+from ucdp_amba.types import AhbMstType, AhbSlvType, ALazyStructType, AmbaProto, ApbSlvType
+
+
+class DuplicateType(ALazyStructType):
+    """Struct Type with a Failing Build."""
+
+    def _build(self):
+        self._add("data", u.BitType())
+        self._add("data", u.BitType())
+
+
+@pytest.mark.parametrize(
+    "create",
+    [
+        lambda: AhbMstType(addrwidth=5),
+        lambda: AhbMstType(datawidth=57),
+        lambda: AhbSlvType(addrwidth=65),
+        lambda: AhbSlvType(proto=AmbaProto(hprotwidth=5)),
+        lambda: ApbSlvType(addrwidth=40),
+        lambda: ApbSlvType(datawidth=64),
+    ],
+)
+def test_invalid_width(create):
+    """Invalid widths fail on construction - every time, as the failed instance is not cached."""
+    for _ in range(2):
+        with pytest.raises(ValidationError, match="Illegal value"):
+            create()
+
+
+def test_failed_build():
+    """A failed build raises on every access and does not leave partial items."""
+    type_ = DuplicateType()
+    for _ in range(2):
+        with pytest.raises(ValueError, match="name 'data' already exists"):
+            type_.values()
+        assert not type_.is_built
+        assert not type_._items